@@ -15,8 +15,9 @@ from routers import debug, philosophers, chat, npc
 # TODO: 다른 라우터들도 순차적으로 추가
 # from routers import chat, debate, dialogue, moderator, npc, rooms
 
-# 로깅 설정
-logging.basicConfig(level=logging.DEBUG)
+# 로깅 설정 - 큐 기반 JSON 파이프라인 (레벨/형식/샘플링은 SAPIENS_LOG_* 환경 변수로 조정)
+from src.utils.log_pipeline import configure_logging
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # FastAPI 앱 생성
@@ -35,6 +36,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 방 친화 라우팅 - 다중 워커 배포 시 토론방 요청을 방을 소유한 워커로 전달
+# (Redis가 없으면 레지스트리가 비활성이라 모든 요청을 그대로 처리)
+from src.dialogue.managers.room_ownership import RoomAffinityMiddleware
+app.add_middleware(RoomAffinityMiddleware, registry=chat.room_ownership)
+
 # 정적 파일 서빙 (초상화)
 # API 폴더에서 실행되므로 상위 디렉토리의 portraits를 참조
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -90,6 +96,17 @@ app.include_router(
 # app.include_router(moderator.router, prefix="/api", tags=["모더레이터"])
 # app.include_router(rooms.router, prefix="/api", tags=["방관리"])
 
+@app.on_event("startup")
+async def warm_rag_handles():
+    """철학자 RAG 컬렉션 핸들을 미리 열어 첫 검색의 클라이언트/컬렉션 초기화 비용 제거"""
+    try:
+        import asyncio
+        from src.models.llm.llm_manager import LLMManager
+        llm_manager = LLMManager()
+        await asyncio.to_thread(llm_manager.warm_rag_collections)
+    except Exception as e:
+        logger.warning(f"RAG handle warm-up skipped: {str(e)}")
+
 @app.get("/")
 def read_root():
     """API 루트 엔드포인트"""
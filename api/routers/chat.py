@@ -16,8 +16,21 @@ from pydantic import BaseModel, Field
 import socketio
 import psutil
 import os
+import sys
+import socket
 import redis
 
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
+from src.dialogue.managers.room_admission import (
+    RoomAdmissionController, AdmissionConfig, RoomResourceUsage, RoomSnapshotStore
+)
+from src.dialogue.managers.turn_coordinator import TurnCoordinator
+from src.dialogue.managers.room_ownership import RoomOwnershipRegistry
+from src.utils.log_pipeline import bind_log_context, reset_log_context
+
 logger = logging.getLogger(__name__)
 
 # ========================================================================
@@ -307,6 +320,48 @@ MAX_ACTIVE_ROOMS = 50  # 최대 동시 토론방 수
 MAX_INACTIVE_HOURS = 2  # 비활성 토론방 자동 정리 시간 (시간)
 MEMORY_CHECK_INTERVAL = 10  # 메모리 체크 간격 (분)
 MAX_MEMORY_USAGE_GB = 8  # 최대 메모리 사용량 (GB)
+ROOM_BASE_MB = 64  # 토론방 고정 비용 추정 (에이전트, LLM 클라이언트 등)
+IDLE_SPILL_MINUTES = 15  # 이 시간 이상 쉬는 방은 스냅샷으로 내보냄
+ADMISSION_QUEUE_TIMEOUT_SECONDS = 10  # 용량 부족 시 새 방 생성 요청 최대 대기 시간
+ANALYSIS_WAIT_SECONDS = 20  # 공격 차례에 상대 논지 분석 작업 완료를 기다리는 최대 시간
+
+# 방별 리소스 계정 기반 입장 제어 (생성 중인 방도 예약 비용으로 계정)
+admission_controller = RoomAdmissionController(
+    AdmissionConfig(
+        max_rooms=MAX_ACTIVE_ROOMS,
+        memory_budget_gb=MAX_MEMORY_USAGE_GB,
+        max_rss_gb=MAX_MEMORY_USAGE_GB,
+        room_base_mb=ROOM_BASE_MB,
+        queue_timeout_seconds=ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        idle_spill_seconds=IDLE_SPILL_MINUTES * 60
+    ),
+    rss_probe=lambda: get_memory_usage()["used_gb"]
+)
+
+# 방별 턴 직렬화 (중복 폴링/재시도가 같은 턴을 두 번 생성하지 않도록)
+turn_coordinator = TurnCoordinator()
+
+# 스필된 토론방 스냅샷 저장소 (Redis 사용 시 서버 간 공유)
+snapshot_store = RoomSnapshotStore(
+    directory=os.path.join(BASE_DIR, "data", "room_snapshots"),
+    redis_client=redis_client if USE_REDIS else None
+)
+
+# 다중 워커 방 소유권 리스 (Redis 사용 시 방마다 한 워커만 인스턴스를 가지며,
+# RoomAffinityMiddleware가 요청을 소유 워커로 전달하고 장애 시 다른 워커가 스냅샷에서 이어받음)
+WORKER_ID = os.getenv('WORKER_ID') or f"{socket.gethostname()}-{os.getpid()}"
+# WORKER_URL은 다른 워커가 요청을 전달할 이 워커의 고유 주소 - Redis 사용 시 없으면 레지스트리 비활성
+WORKER_URL = os.getenv('WORKER_URL')
+if USE_REDIS and not WORKER_URL:
+    logger.error("❌ WORKER_URL is not set; room ownership is disabled and every worker serves rooms locally")
+ROOM_LEASE_SECONDS = float(os.getenv('ROOM_LEASE_SECONDS', '30'))
+
+room_ownership = RoomOwnershipRegistry(
+    redis_client=redis_client if USE_REDIS else None,
+    worker_id=WORKER_ID,
+    worker_url=WORKER_URL,
+    lease_seconds=ROOM_LEASE_SECONDS
+)
 
 # ========================================================================
 # 메모리 모니터링 및 자동 정리
@@ -328,18 +383,34 @@ def get_memory_usage() -> Dict[str, float]:
         logger.error(f"❌ Memory usage check failed: {str(e)}")
         return {"used_gb": 0, "available_gb": 0, "usage_percent": 0}
 
+def refresh_room_accounting(room_id: str):
+    """활성 토론방의 리소스 사용량 재계정"""
+    dialogue = active_debates.get(room_id)
+    if dialogue is not None:
+        admission_controller.account(
+            room_id,
+            RoomResourceUsage.from_dialogue(room_id, dialogue, base_bytes=ROOM_BASE_MB * 1024 ** 2)
+        )
+
 async def check_memory_and_cleanup():
-    """메모리 사용량 체크 및 필요 시 자동 정리"""
+    """메모리 사용량 체크 및 필요 시 자동 정리 (유휴 방 스필 우선)"""
     try:
         memory_stats = get_memory_usage()
         current_rooms = len(active_debates)
         
-        logger.info(f"💾 Memory: {memory_stats['used_gb']:.1f}GB, Rooms: {current_rooms}")
+        for room_id in list(active_debates.keys()):
+            refresh_room_accounting(room_id)
+        
+        logger.info(f"💾 Memory: {memory_stats['used_gb']:.1f}GB, Rooms: {current_rooms}, "
+                    f"Accounted: {admission_controller.committed_bytes() / 1024 ** 3:.2f}GB")
+        
+        # 오래 쉬고 있는 방(또는 압박 상태의 유휴 방)은 스냅샷으로 내보냄
+        await spill_idle_rooms("idle" if not admission_controller.under_pressure() else "pressure")
         
         # 메모리 부족 또는 방 개수 초과 시 정리
         should_cleanup = (
             memory_stats['used_gb'] > MAX_MEMORY_USAGE_GB or
-            current_rooms > MAX_ACTIVE_ROOMS or
+            len(active_debates) > MAX_ACTIVE_ROOMS or
             memory_stats['usage_percent'] > 80
         )
         
@@ -379,7 +450,13 @@ async def emergency_cleanup_inactive_rooms():
                 len(active_debates) < MAX_ACTIVE_ROOMS * 0.8):
                 break  # 충분히 정리됨
                 
-            await cleanup_debate_room(room_id, f"emergency_cleanup_inactive_{inactive_hours:.1f}h")
+            # 사용자가 남아 있는 방은 파기하지 않고 스냅샷으로 내보냄
+            if room_user_mapping.get(room_id):
+                spilled = await spill_room(room_id, f"emergency_spill_inactive_{inactive_hours:.1f}h")
+                if not spilled:
+                    continue
+            else:
+                await cleanup_debate_room(room_id, f"emergency_cleanup_inactive_{inactive_hours:.1f}h")
             cleanup_count += 1
             
             # 메모리 재확인
@@ -395,6 +472,141 @@ async def emergency_cleanup_inactive_rooms():
 def update_room_activity(room_id: str):
     """토론방 활동 시간 업데이트"""
     room_last_activity[room_id] = datetime.now()
+    admission_controller.touch(room_id)
+
+# ========================================================================
+# 유휴 토론방 스필 / 복원
+# ========================================================================
+
+async def spill_room(room_id: str, reason: str = "idle") -> bool:
+    """유휴 토론방을 스냅샷으로 내보내고 메모리에서 내림 (사용자 매핑은 유지)"""
+    try:
+        dialogue = active_debates.get(room_id)
+        if dialogue is None or admission_controller.is_busy(room_id) or turn_coordinator.get_inflight(room_id):
+            return False
+        
+        if not snapshot_store.save(room_id, dialogue.to_snapshot()):
+            return False
+        
+        await comprehensive_debate_cleanup(dialogue)
+        active_debates.pop(room_id, None)
+        admission_controller.release(room_id, reason, spilled=True)
+        # 스필된 방은 어느 워커든 다음 요청에서 복원할 수 있도록 소유권 반납
+        await asyncio.to_thread(room_ownership.release, room_id)
+        
+        import gc
+        gc.collect()
+        logger.info(f"💤 Room {room_id} spilled to snapshot (reason: {reason})")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to spill room {room_id}: {str(e)}")
+        return False
+
+async def spill_idle_rooms(reason: str = "idle") -> int:
+    """스필 정책이 고른 유휴 토론방들을 스냅샷으로 내보냄"""
+    live_rooms = {room_id for room_id, users in room_user_mapping.items() if users}
+    spilled_count = 0
+    for room_id in admission_controller.select_spill_candidates(live_rooms):
+        if await spill_room(room_id, reason):
+            spilled_count += 1
+    if spilled_count:
+        logger.info(f"💤 Spilled {spilled_count} idle rooms ({reason})")
+    return spilled_count
+
+async def get_or_restore_dialogue(room_id: str):
+    """활성 토론 인스턴스 조회, 스필된 방이면 스냅샷에서 복원"""
+    dialogue = active_debates.get(room_id)
+    if dialogue is not None:
+        return dialogue
+    
+    snapshot = snapshot_store.load(room_id)
+    if snapshot is None:
+        await asyncio.to_thread(room_ownership.release, room_id)
+        raise HTTPException(status_code=404, detail="토론방을 찾을 수 없습니다")
+    
+    if admission_controller.would_block():
+        await spill_idle_rooms("restore")
+    decision = await admission_controller.admit(room_id)
+    if not decision.admitted:
+        raise HTTPException(
+            status_code=429,
+            detail=f"서버 용량 부족으로 토론방을 복원할 수 없습니다 ({decision.reason})",
+            headers={"Retry-After": str(decision.retry_after)}
+        )
+    
+    try:
+        from src.dialogue.types.debate_dialogue import DebateDialogue
+        loop = asyncio.get_event_loop()
+        dialogue = await loop.run_in_executor(None, DebateDialogue.from_snapshot, snapshot)
+    except Exception:
+        admission_controller.release(room_id, "restore_failed")
+        raise
+    
+    # 복원 대기 중 다른 요청이 먼저 복원했으면 그 인스턴스 사용
+    if room_id in active_debates:
+        dialogue.cleanup_resources()
+        return active_debates[room_id]
+    
+    active_debates[room_id] = dialogue
+    message_trackers.setdefault(room_id, 0)
+    admission_controller.commit(
+        room_id,
+        RoomResourceUsage.from_dialogue(room_id, dialogue, base_bytes=ROOM_BASE_MB * 1024 ** 2)
+    )
+    admission_controller.record_restore(room_id)
+    if not room_ownership.enabled:
+        # 다중 워커 모드에서는 스냅샷을 체크포인트로 계속 유지 (소유 워커 장애 시 복원용)
+        snapshot_store.delete(room_id)
+    update_room_activity(room_id)
+    logger.info(f"♻️ Room {room_id} restored from snapshot")
+    return dialogue
+
+async def checkpoint_room(room_id: str, save_vector_store: bool = False) -> bool:
+    """
+    다중 워커 모드에서 턴이 끝날 때마다 방 스냅샷을 공유 저장소에 기록
+    
+    소유 워커가 죽으면 리스를 이어받은 워커가 이 체크포인트에서 방을 복원합니다.
+    소유권을 잃은 워커는 새 소유자의 체크포인트를 덮어쓰지 않도록 기록하지 않습니다.
+    """
+    if not room_ownership.enabled:
+        return False
+    dialogue = active_debates.get(room_id)
+    if dialogue is None:
+        return False
+    try:
+        if not await asyncio.to_thread(room_ownership.is_owner, room_id):
+            logger.warning(f"⚠️ Skipping checkpoint for room {room_id}: ownership lost")
+            return False
+        
+        def build_snapshot():
+            with dialogue.state_lock:
+                return dialogue.to_snapshot(save_vector_store=save_vector_store)
+        
+        snapshot = await asyncio.to_thread(build_snapshot)
+        return await asyncio.to_thread(snapshot_store.save, room_id, snapshot)
+    except Exception as e:
+        logger.error(f"❌ Failed to checkpoint room {room_id}: {str(e)}")
+        return False
+
+async def drop_lost_room(room_id: str):
+    """다른 워커로 소유권이 넘어간 방의 로컬 인스턴스 정리 (스냅샷과 사용자 매핑은 유지)"""
+    dialogue = active_debates.pop(room_id, None)
+    if dialogue is not None:
+        await comprehensive_debate_cleanup(dialogue)
+    admission_controller.release(room_id, "ownership_lost")
+    turn_coordinator.forget(room_id)
+    message_trackers.pop(room_id, None)
+    logger.warning(f"🔀 Dropped local instance of room {room_id} (ownership moved to another worker)")
+
+async def release_room_ownership():
+    """종료 시 소유 중인 방을 체크포인트 후 반납 (다른 워커가 리스 만료를 기다리지 않고 이어받음)"""
+    if not room_ownership.enabled:
+        return
+    for room_id in room_ownership.owned_rooms():
+        await checkpoint_room(room_id, save_vector_store=True)
+    released = await asyncio.to_thread(room_ownership.release_all)
+    logger.info(f"📤 Released {released} room leases on shutdown")
 
 # ========================================================================
 # 정리 함수들
@@ -585,6 +797,12 @@ async def cleanup_debate_room(room_id: str, reason: str = "manual"):
             del active_debates[room_id]
             logger.info(f"✅ Removed debate instance for {room_id}")
         
+        # 입장 제어 계정, 턴 상태 및 스냅샷 정리
+        admission_controller.release(room_id, reason)
+        turn_coordinator.forget(room_id)
+        snapshot_store.delete(room_id)
+        await asyncio.to_thread(room_ownership.release, room_id)
+        
         # 메시지 트래커 정리
         if room_id in message_trackers:
             del message_trackers[room_id]
@@ -656,6 +874,7 @@ async def startup_event():
     """서버 시작 시 Socket.IO 클라이언트 초기화 및 백그라운드 모니터링 시작"""
     await init_socketio_client()
     await start_background_monitoring()
+    await start_room_lease_renewal()
 
 @router.post("/create-debate-room")
 async def create_debate_room(request: CreateDebateRoomRequest):
@@ -663,26 +882,28 @@ async def create_debate_room(request: CreateDebateRoomRequest):
     try:
         room_id = request.room_id
         
-        # 메모리 체크 및 필요 시 정리
-        memory_stats = await check_memory_and_cleanup()
-        
-        # 최대 방 개수 제한 체크
-        if len(active_debates) >= MAX_ACTIVE_ROOMS:
-            logger.warning(f"🚨 Max rooms limit reached: {len(active_debates)}/{MAX_ACTIVE_ROOMS}")
-            await emergency_cleanup_inactive_rooms()
-            
-            # 정리 후에도 제한 초과 시 거부
-            if len(active_debates) >= MAX_ACTIVE_ROOMS:
-                raise HTTPException(
-                    status_code=503, 
-                    detail=f"서버 용량 초과: 최대 {MAX_ACTIVE_ROOMS}개 토론방까지 지원"
-                )
-        
-        # 중복 생성 방지
-        if room_id in active_debates:
+        # 중복 생성 방지 (스필된 방 포함)
+        if room_id in active_debates or snapshot_store.exists(room_id):
             raise HTTPException(status_code=400, detail=f"토론방 {room_id}이 이미 존재합니다")
         
-        logger.info(f"🚀 Creating debate room {room_id} (Memory: {memory_stats.get('used_gb', 0):.1f}GB)")
+        # 용량이 부족하면 유휴 방을 먼저 스냅샷으로 내보냄
+        if admission_controller.would_block():
+            logger.warning(f"🚨 Room capacity exhausted - spilling idle rooms before admitting {room_id}")
+            await spill_idle_rooms("admission")
+        
+        # 입장 제어 - 용량이 없으면 잠시 대기 후 Retry-After와 함께 거절
+        decision = await admission_controller.admit(room_id)
+        if not decision.admitted:
+            await asyncio.to_thread(room_ownership.release, room_id)
+            raise HTTPException(
+                status_code=429,
+                detail=f"서버 용량 초과 ({decision.reason}): {decision.retry_after}초 후 다시 시도하세요",
+                headers={"Retry-After": str(decision.retry_after)}
+            )
+        
+        memory_stats = get_memory_usage()
+        logger.info(f"🚀 Creating debate room {room_id} (Memory: {memory_stats.get('used_gb', 0):.1f}GB, "
+                    f"waited {decision.waited_seconds:.1f}s)")
         
         # DebateDialogue 임포트 및 생성
         from src.dialogue.types.debate_dialogue import DebateDialogue
@@ -726,22 +947,29 @@ async def create_debate_room(request: CreateDebateRoomRequest):
                 })
             # neutral인 경우는 별도 처리 없음 (users 배열에만 존재)
         
-        print(f"🔍 ROOM_DATA: {room_data}")
-        print(f"🔍 PRO_NPCS: {request.pro_npcs}")
-        print(f"🔍 CON_NPCS: {request.con_npcs}")
-        print(f"🔍 USER_IDS: {request.user_ids}")
+        logger.debug("🔍 ROOM_DATA: %s (pro=%s, con=%s, users=%s)",
+                     room_data, request.pro_npcs, request.con_npcs, request.user_ids)
         
         # DebateDialogue 생성 (기존 인터페이스 사용)
-        dialogue = DebateDialogue(
-            room_id=room_id,
-            room_data=room_data,
-            use_async_init=False,
-            enable_streaming=False
-        )
+        try:
+            dialogue = DebateDialogue(
+                room_id=room_id,
+                room_data=room_data,
+                use_async_init=False,
+                enable_streaming=False
+            )
+        except Exception:
+            admission_controller.release(room_id, "create_failed")
+            await asyncio.to_thread(room_ownership.release, room_id)
+            raise
         
-        # 활성 토론에 추가
+        # 활성 토론에 추가 (예약 비용을 실제 사용량으로 교체)
         active_debates[room_id] = dialogue
         message_trackers[room_id] = 0
+        admission_controller.commit(
+            room_id,
+            RoomResourceUsage.from_dialogue(room_id, dialogue, base_bytes=ROOM_BASE_MB * 1024 ** 2)
+        )
         
         # 확장성 관리용 추적 정보 추가
         current_time = datetime.now()
@@ -755,6 +983,9 @@ async def create_debate_room(request: CreateDebateRoomRequest):
         # 방 사용자 목록 초기화
         room_user_mapping[room_id] = set(request.user_ids)
         
+        # 다중 워커 모드면 첫 체크포인트 기록 (벡터 저장소 포함)
+        await checkpoint_room(room_id, save_vector_store=True)
+        
         # 생성 후 메모리 상태 로깅
         post_memory = get_memory_usage()
         logger.info(f"✅ Room {room_id} created - Memory: {post_memory['used_gb']:.1f}GB, Total rooms: {len(active_debates)}")
@@ -773,59 +1004,96 @@ async def create_debate_room(request: CreateDebateRoomRequest):
             "system_info": {
                 "memory_usage_gb": post_memory['used_gb'],
                 "active_rooms": len(active_debates),
-                "max_rooms": MAX_ACTIVE_ROOMS
+                "max_rooms": MAX_ACTIVE_ROOMS,
+                "admission_wait_seconds": round(decision.waited_seconds, 2)
             }
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 토론방 생성 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"토론방 생성 실패: {str(e)}")
 
 @router.post("/debate/{room_id}/next-message")
-async def get_next_message(room_id: str):
-    """다음 메시지 생성 및 WebSocket 전송 (활동 추적 포함)"""
+async def get_next_message(room_id: str, expected_turn_id: Optional[int] = None):
+    """
+    다음 메시지 생성 및 WebSocket 전송 (활동 추적 포함)
+    
+    같은 방에 생성 중인 턴이 있으면 새로 생성하지 않고 그 턴 정보를 돌려줍니다.
+    expected_turn_id가 이미 지난 턴이면 409로 거절합니다.
+    """
+    # 폴링마다 호출되므로 로그는 디버그 수준으로 두고 room_id는 컨텍스트로 붙임
+    log_token = bind_log_context(room_id=room_id)
     try:
-        if room_id not in active_debates:
-            raise HTTPException(status_code=404, detail="토론방을 찾을 수 없습니다")
+        # 스필된 방이면 스냅샷에서 복원
+        dialogue = await get_or_restore_dialogue(room_id)
         
         # 방 활동 시간 업데이트
         update_room_activity(room_id)
         
-        dialogue = active_debates[room_id]
-        logger.info(f"🎭 Getting next speaker info for room {room_id}")
+        logger.debug("🎭 Getting next speaker info")
+        
+        # 다음 발언이 공격이면 공격자의 분석 작업을 최우선으로 올리고 완료를 기다림 (폴링 대신)
+        attacker_id = dialogue.next_attacker_waiting_for_analysis()
+        if attacker_id and not turn_coordinator.get_inflight(room_id):
+            await dialogue.wait_for_speaker_analysis(attacker_id, timeout=ANALYSIS_WAIT_SECONDS)
+        
+        def resolve_speaker() -> Dict[str, Any]:
+            with dialogue.state_lock:
+                return {**dialogue.get_next_speaker(), "stage": dialogue.state["current_stage"]}
         
-        # 1. 먼저 다음 발언자 정보 가져오기
-        next_speaker_info = dialogue.get_next_speaker()
+        # 사용자 차례 확인 - 두 가지 방법으로 체크
+        def is_user_speaker(speaker_id: str) -> bool:
+            user_participants = dialogue.user_participants if hasattr(dialogue, 'user_participants') else {}
+            user_ids = dialogue.room_data.get('participants', {}).get('users', [])
+            return (speaker_id in user_participants) or (speaker_id in user_ids)
+        
+        async def run_turn(ticket) -> Dict[str, Any]:
+            # 생성 중인 방은 스필하지 않음
+            admission_controller.begin_task(room_id)
+            return await generate_message_async(room_id, dialogue, ticket.speaker_id,
+                                                ticket.speaker_role, ticket.stage, ticket.turn_id)
+        
+        decision = await turn_coordinator.request_ai_turn(
+            room_id, resolve_speaker, is_user_speaker, run_turn, expected_turn_id=expected_turn_id
+        )
+        
+        if decision.status == "stale":
+            raise HTTPException(status_code=409, detail={
+                "reason": "stale_turn",
+                "message": decision.reason,
+                "next_turn_id": decision.next_turn_id,
+                "turn": decision.ticket.to_dict() if decision.ticket else None
+            })
         
-        if next_speaker_info.get("speaker_id") is None:
+        if decision.status == "completed":
             return {
                 "status": "completed",
                 "message": "토론이 완료되었습니다."
             }
         
-        speaker_id = next_speaker_info.get("speaker_id")
-        speaker_role = next_speaker_info.get("role")
-        current_stage = dialogue.state["current_stage"]
-        
-        logger.info(f"🎯 Next speaker: {speaker_id} ({speaker_role}) in stage {current_stage}")
-        
-        # 2. 사용자 차례인지 확인
-        user_participants = dialogue.user_participants if hasattr(dialogue, 'user_participants') else {}
-        participants_data = dialogue.room_data.get('participants', {})
-        user_ids = participants_data.get('users', [])
-        
-        logger.info(f"🔍 User participants: {list(user_participants.keys())}")
-        logger.info(f"🔍 User IDs from room data: {user_ids}")
-        logger.info(f"🔍 Speaker ID: {speaker_id}")
-        
-        # 사용자 차례 확인 - 두 가지 방법으로 체크
-        is_user_turn = (speaker_id in user_participants) or (speaker_id in user_ids)
+        if decision.status == "duplicate":
+            ticket = decision.ticket
+            logger.debug("🔁 Returning in-flight turn %s", ticket.turn_id)
+            return {
+                "status": "generating",
+                "speaker_id": ticket.speaker_id,
+                "speaker_role": ticket.speaker_role,
+                "stage": ticket.stage,
+                "turn_id": ticket.turn_id,
+                "duplicate": True,
+                "message": "메시지 생성 중..."
+            }
         
-        logger.info(f"🔍 Is user turn? {is_user_turn}")
+        speaker = decision.speaker
+        speaker_id = speaker.get("speaker_id")
+        speaker_role = speaker.get("role")
+        current_stage = speaker.get("stage")
         
-        if is_user_turn:
+        if decision.status == "user_turn":
             # 사용자 차례인 경우 - 즉시 사용자 정보 반환 (테스트 파일과 동일한 로직)
-            logger.info(f"👤 USER TURN DETECTED - {speaker_id} ({speaker_role})")
+            logger.debug("👤 USER TURN DETECTED - %s (%s) in stage %s", speaker_id, speaker_role, current_stage)
             return {
                 "status": "success",
                 "next_speaker": {
@@ -834,41 +1102,45 @@ async def get_next_message(room_id: str):
                     "is_user": True
                 },
                 "stage": current_stage,
+                "turn_id": decision.next_turn_id,
                 "message": f"현재 {speaker_id}의 차례입니다 - 사용자 입력 필요"
             }
-        else:
-            # AI 차례인 경우 - 기존 로직 (generating 상태 반환 후 백그라운드 생성)
-            logger.info(f"🤖 AI TURN DETECTED - {speaker_id} ({speaker_role})")
-            response_data = {
-                "status": "generating",
-                "speaker_id": speaker_id,
-                "speaker_role": speaker_role,
-                "stage": current_stage,
-                "message": "메시지 생성 중..."
-            }
-            
-            # 백그라운드에서 실제 메시지 생성 시작
-            asyncio.create_task(generate_message_async(room_id, dialogue, speaker_id, speaker_role, current_stage))
-            
-            return response_data
+        
+        # AI 차례인 경우 - generating 상태 반환 (생성은 코디네이터가 백그라운드에서 한 번만 실행)
+        logger.info("🤖 AI TURN DETECTED - %s (%s) in stage %s, turn %s",
+                    speaker_id, speaker_role, current_stage, decision.ticket.turn_id)
+        return {
+            "status": "generating",
+            "speaker_id": speaker_id,
+            "speaker_role": speaker_role,
+            "stage": current_stage,
+            "turn_id": decision.ticket.turn_id,
+            "message": "메시지 생성 중..."
+        }
             
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"❌ Error getting next speaker info: {str(e)}")
+        logger.error("❌ Error getting next speaker info: %s", e)
         raise HTTPException(status_code=500, detail=f"다음 발언자 정보 조회 실패: {str(e)}")
+    finally:
+        reset_log_context(log_token)
 
-async def generate_message_async(room_id: str, dialogue, speaker_id: str, speaker_role: str, original_stage: str):
-    """백그라운드에서 메시지 생성 및 Socket.IO 전송"""
+async def generate_message_async(room_id: str, dialogue, speaker_id: str, speaker_role: str, original_stage: str,
+                                 turn_id: Optional[int] = None) -> Dict[str, Any]:
+    """백그라운드에서 메시지 생성 및 Socket.IO 전송 (턴 결과 반환)"""
+    response: Dict[str, Any] = {}
     try:
-        logger.info(f"🔄 Background message generation started for {speaker_id}")
+        logger.debug("🔄 Background message generation started for %s", speaker_id)
         
-        # generate_response() 호출
-        response = dialogue.generate_response()
+        # generate_response()는 턴 전체(task_graph 대기, 요약 등)를 동기로 실행하므로 워커 스레드에서 호출
+        # (이벤트 루프를 막으면 리스 갱신과 다른 방의 요청이 멈춤)
+        response = await asyncio.to_thread(dialogue.generate_response)
         
         if response.get("status") == "success":
             message = response.get("message", "")
             
-            logger.info(f"✅ Message generated: {speaker_id} - {len(message)} chars")
-            logger.info(f"📍 Message stage: {original_stage}")
+            logger.info("✅ Message generated: %s - %d chars (stage %s)", speaker_id, len(message), original_stage)
             
             # RAG 정보 추출 (speaking_history의 마지막 메시지에서)
             rag_info = {}
@@ -884,7 +1156,7 @@ async def generate_message_async(room_id: str, dialogue, speaker_id: str, speake
                             "citations": last_message.get("citations", [])
                         }
                         if rag_info["rag_used"]:
-                            logger.info(f"🔍 RAG was used: {rag_info['rag_source_count']} sources")
+                            logger.info("🔍 RAG was used: %s sources", rag_info['rag_source_count'])
             
             # Socket.IO로 완성된 메시지 전송
             message_payload = {
@@ -896,8 +1168,10 @@ async def generate_message_async(room_id: str, dialogue, speaker_id: str, speake
                 "timestamp": datetime.now().isoformat(),
                 "role": "moderator" if speaker_id == "moderator" else ("pro" if speaker_role == "pro" else "con"),
                 "stage": original_stage,
+                "turn_id": turn_id,
                 "metadata": {
                     "stage": original_stage,
+                    "turn_id": turn_id,
                     "event_type": "debate_message_complete",  # 완성된 메시지임을 표시
                     **rag_info  # RAG 정보 포함
                 }
@@ -908,10 +1182,10 @@ async def generate_message_async(room_id: str, dialogue, speaker_id: str, speake
                 "message": message_payload
             })
             
-            logger.info(f"📤 Completed message sent via Socket.IO to room {room_id}")
+            logger.debug("📤 Completed message sent via Socket.IO to room %s", room_id)
             
         elif response.get("status") == "completed":
-            logger.info(f"🏁 Debate completed for room {room_id}")
+            logger.info("🏁 Debate completed for room %s", room_id)
             
             # 토론 완료 알림
             await send_message_to_room(room_id, {
@@ -920,7 +1194,7 @@ async def generate_message_async(room_id: str, dialogue, speaker_id: str, speake
             })
             
         else:
-            logger.error(f"❌ Failed to generate message: {response}")
+            logger.error("❌ Failed to generate message: %s", response)
             # 오류 메시지 전송
             await send_message_to_room(room_id, {
                 "event_type": "message_generation_error",
@@ -928,12 +1202,19 @@ async def generate_message_async(room_id: str, dialogue, speaker_id: str, speake
             })
             
     except Exception as e:
-        logger.error(f"❌ Error in background message generation: {str(e)}")
+        logger.error("❌ Error in background message generation: %s", e)
+        response = {"status": "error", "message": str(e)}
         # 오류 메시지 전송
         await send_message_to_room(room_id, {
             "event_type": "message_generation_error", 
             "message": f"메시지 생성 중 오류 발생: {str(e)}"
         })
+    finally:
+        admission_controller.end_task(room_id)
+        refresh_room_accounting(room_id)
+        await checkpoint_room(room_id)
+    
+    return response
 
 @router.delete("/debate/{room_id}")
 async def cleanup_debate_room_endpoint(room_id: str):
@@ -1043,34 +1324,97 @@ async def get_active_rooms_debug():
             "background_monitoring": {
                 "active": 'memory_monitor' in background_tasks,
                 "interval_minutes": MEMORY_CHECK_INTERVAL
-            }
+            },
+            "admission": admission_controller.get_metrics()
         }
     except Exception as e:
         logger.error(f"❌ 활성 토론방 상태 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"활성 토론방 상태 조회 실패: {str(e)}")
 
+@router.get("/debug/admission")
+async def get_admission_metrics():
+    """디버깅용: 방별 리소스 계정과 입장/스필 결정 메트릭 조회"""
+    try:
+        for room_id in list(active_debates.keys()):
+            refresh_room_accounting(room_id)
+        return {
+            "status": "success",
+            "admission": admission_controller.get_metrics(),
+            "turns": turn_coordinator.get_metrics(),
+            "ownership": room_ownership.get_metrics()
+        }
+    except Exception as e:
+        logger.error(f"❌ 입장 제어 메트릭 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"입장 제어 메트릭 조회 실패: {str(e)}")
+
+@router.get("/debate/{room_id}/turn-status")
+async def get_turn_status(room_id: str):
+    """방의 다음 turn_id, 생성 중인 턴, 최근 완료 턴 조회"""
+    return {
+        "status": "success",
+        "room_id": room_id,
+        **turn_coordinator.get_room_status(room_id)
+    }
+
 @router.post("/debate/{room_id}/process-user-message")
 async def process_user_message(room_id: str, request: dict):
     """사용자 메시지 처리 및 대화에 반영 (활동 추적 포함)"""
     try:
-        if room_id not in active_debates:
-            raise HTTPException(status_code=404, detail="토론방을 찾을 수 없습니다")
+        # 스필된 방이면 스냅샷에서 복원
+        dialogue = await get_or_restore_dialogue(room_id)
         
         # 방 활동 시간 업데이트
         update_room_activity(room_id)
         
-        dialogue = active_debates[room_id]
         message = request.get("message", "")
         user_id = request.get("user_id", "")
         
         if not message or not user_id:
             raise HTTPException(status_code=400, detail="메시지와 사용자 ID가 필요합니다")
         
-        logger.info(f"🎯 Processing user message from {user_id} in room {room_id}")
-        logger.info(f"📝 Message: {message[:100]}...")
+        expected_turn_id = request.get("expected_turn_id")
+        client_message_id = request.get("client_message_id")
+        
+        logger.info("🎯 Processing user message from %s in room %s", user_id, room_id)
+        logger.debug("📝 Message: %.100s...", message)
         
-        # dialogue.process_message() 호출 (테스트 파일과 동일한 로직)
-        result = dialogue.process_message(message, user_id)
+        # dialogue.process_message() 호출 (방 단위로 직렬화, 같은 client_message_id 재시도는 한 번만 반영)
+        decision = await turn_coordinator.submit_user_turn(
+            room_id, user_id,
+            lambda: dialogue.process_message(message, user_id),
+            expected_turn_id=int(expected_turn_id) if expected_turn_id is not None else None,
+            client_message_id=client_message_id
+        )
+        
+        if decision.status == "duplicate":
+            logger.info(f"🔁 Duplicate user message {client_message_id} ignored (turn {decision.ticket.turn_id})")
+            return {
+                "status": "success",
+                "duplicate": True,
+                "message": "이미 처리된 사용자 메시지입니다",
+                "speaker_id": user_id,
+                "turn_id": decision.ticket.turn_id,
+                "role": (decision.result or {}).get("role"),
+                "stage": (decision.result or {}).get("stage"),
+                "turn_count": (decision.result or {}).get("turn_count")
+            }
+        
+        if decision.status == "busy":
+            return {
+                "status": "error",
+                "reason": "turn_in_progress",
+                "message": "AI 발언이 생성 중입니다. 잠시 후 다시 시도해주세요",
+                "turn_id": decision.ticket.turn_id
+            }
+        
+        if decision.status == "stale":
+            raise HTTPException(status_code=409, detail={
+                "reason": "stale_turn",
+                "message": decision.reason,
+                "next_turn_id": decision.next_turn_id
+            })
+        
+        result = decision.result or {}
         
         if result.get("status") == "success":
             logger.info(f"✅ User message processed successfully")
@@ -1101,10 +1445,13 @@ async def process_user_message(room_id: str, request: dict):
             
             logger.info(f"📤 User message sent via Socket.IO")
             
+            await checkpoint_room(room_id)
+            
             return {
                 "status": "success",
                 "message": "사용자 메시지가 성공적으로 처리되었습니다",
                 "speaker_id": user_id,
+                "turn_id": decision.ticket.turn_id,
                 "role": result.get("role"),
                 "stage": result.get("stage"),
                 "turn_count": result.get("turn_count")
@@ -1161,6 +1508,8 @@ async def shutdown_event():
     """서버 종료 시 Socket.IO 클라이언트 정리 및 백그라운드 모니터링 중지"""
     await cleanup_socketio_client()
     await stop_background_monitoring()
+    await stop_room_lease_renewal()
+    await release_room_ownership()
 
 # ========================================================================
 # 백그라운드 작업 관리
@@ -1204,4 +1553,24 @@ async def stop_background_monitoring():
         return True
     except Exception as e:
         logger.error(f"❌ Failed to stop background monitoring: {str(e)}")
-        return False 
\ No newline at end of file
+        return False 
+
+async def start_room_lease_renewal():
+    """다중 워커 모드에서 방 소유권 리스 갱신 루프 시작"""
+    if not room_ownership.enabled or 'room_lease_renewal' in background_tasks:
+        return False
+    if not await asyncio.to_thread(room_ownership.register_worker):
+        # 같은 WORKER_URL을 쓰는 살아 있는 워커가 있어 레지스트리가 비활성화됨
+        return False
+    background_tasks['room_lease_renewal'] = asyncio.create_task(
+        room_ownership.run_renewal(on_lost=drop_lost_room)
+    )
+    logger.info(f"✅ Room lease renewal started (worker {WORKER_ID}, lease {ROOM_LEASE_SECONDS}s)")
+    return True
+
+async def stop_room_lease_renewal():
+    """방 소유권 리스 갱신 루프 중지"""
+    task = background_tasks.pop('room_lease_renewal', None)
+    if task is not None:
+        task.cancel()
+        logger.info("✅ Room lease renewal stopped")
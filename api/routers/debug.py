@@ -3,13 +3,23 @@ Debug 관련 API 엔드포인트
 - 대화 상태 조회
 - 토큰 계산  
 - 시스템 상태 확인
+- 방별 span 트레이스 워터폴 조회
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from typing import Dict, Any
 import logging
+import os
+import sys
 import tiktoken
 
+# 상위 디렉토리의 src 모듈 import를 위한 경로 추가
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
+from src.utils.tracing import get_tracer
+from src.rag.retrieval.chroma_pool import get_chroma_pool
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -27,6 +37,15 @@ async def debug_conversation_state(room_id: str):
         logger.error(f"Debug conversation state error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/debug/trace/{room_id}")
+async def debug_room_trace(room_id: str, turns: int = Query(5, ge=1, le=100)):
+    """채팅방의 최근 N턴 span 워터폴 조회 (SAPIENS_TRACE=1일 때만 기록됨)"""
+    try:
+        return get_tracer().get_room_waterfall(room_id, last_n_turns=turns)
+    except Exception as e:
+        logger.error(f"Debug trace error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/debug/tokencount")
 async def debug_token_count(text: str):
     """텍스트의 토큰 수 계산"""
@@ -60,7 +79,8 @@ async def get_system_status():
             "openai_api_key": "설정됨" if os.environ.get('OPENAI_API_KEY') else "설정되지 않음",
             "memory_usage": f"{psutil.virtual_memory().percent}%",
             "cpu_usage": f"{psutil.cpu_percent()}%",
-            "active_conversations": "TODO: 구현 필요"
+            "active_conversations": "TODO: 구현 필요",
+            "rag_handles": get_chroma_pool().get_stats()
         }
     except Exception as e:
         logger.error(f"System status error: {str(e)}")
@@ -4,7 +4,7 @@ NPC related API endpoints
 import os
 import sys
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Mapping
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -13,6 +13,8 @@ from pydantic import BaseModel
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(BASE_DIR)
 
+from src.utils.config.asset_catalog import get_asset_catalog
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
@@ -22,18 +24,10 @@ router = APIRouter(prefix="/npc", tags=["npc"])
 # HELPER FUNCTIONS
 # ========================================================================
 
-def load_philosophers_data() -> Dict[str, Any]:
-    """철학자 데이터 로드"""
+def load_philosophers_data() -> Mapping[str, Any]:
+    """철학자 프로필 조회 (config/philosophers.yaml, 자산 카탈로그에 캐시됨)"""
     try:
-        import yaml
-        philosophers_path = os.path.join(BASE_DIR, 'config', 'philosophers.yaml')
-        
-        if not os.path.exists(philosophers_path):
-            logger.warning(f"Philosophers file not found: {philosophers_path}")
-            return {}
-            
-        with open(philosophers_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file) or {}
+        return get_asset_catalog().get_philosopher_profiles()
     except Exception as e:
         logger.error(f"Error loading philosophers data: {e}")
         return {}
@@ -112,16 +106,17 @@ async def get_npc_details(id: str):
         philosopher_key = id.lower()
         if philosopher_key in philosophers_data:
             philosopher = philosophers_data[philosopher_key]
+            name = philosopher.name or get_philosopher_display_name(id)
             
             # 응답 데이터 구성
             npc_info = {
                 "id": id,
-                "name": philosopher.get("name", get_philosopher_display_name(id)),
-                "korean_name": philosopher.get("korean_name", ""),
-                "period": philosopher.get("period", ""),
-                "school": philosopher.get("school", ""),
-                "description": philosopher.get("description", ""),
-                "portrait_url": f"/portraits/{get_portrait_filename(philosopher.get('name', get_philosopher_display_name(id)))}.png",
+                "name": name,
+                "korean_name": philosopher.korean_name,
+                "period": philosopher.period,
+                "school": philosopher.school,
+                "description": philosopher.description,
+                "portrait_url": f"/portraits/{get_portrait_filename(name)}.png",
                 "is_default_philosopher": True
             }
             
@@ -156,15 +151,16 @@ async def get_npc_list():
         philosophers_data = load_philosophers_data()
         
         npc_list = []
-        for key, data in philosophers_data.items():
+        for key, profile in philosophers_data.items():
+            name = profile.name or get_philosopher_display_name(key)
             npc_info = {
                 "id": key,
-                "name": data.get("name", get_philosopher_display_name(key)),
-                "korean_name": data.get("korean_name", ""),
-                "period": data.get("period", ""),
-                "school": data.get("school", ""),
-                "description": data.get("description", "")[:100] + "..." if data.get("description", "") else "",
-                "portrait_url": f"/portraits/{get_portrait_filename(data.get('name', get_philosopher_display_name(key)))}.png"
+                "name": name,
+                "korean_name": profile.korean_name,
+                "period": profile.period,
+                "school": profile.school,
+                "description": profile.description[:100] + "..." if profile.description else "",
+                "portrait_url": f"/portraits/{get_portrait_filename(name)}.png"
             }
             npc_list.append(npc_info)
         
@@ -8,23 +8,25 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict, Any, List
 import logging
 import os
-import yaml
+import sys
+
+# 상위 디렉토리의 src 모듈 import를 위한 경로 추가
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
+from src.utils.config.asset_catalog import get_asset_catalog
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 # 철학자 데이터 로드
 def load_philosophers_data():
-    """철학자 데이터를 YAML 파일에서 로드"""
+    """철학자 프로필 조회 (config/philosophers.yaml, 자산 카탈로그에 캐시됨)"""
     try:
-        BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        PHILOSOPHERS_FILE = os.path.join(BASE_DIR, "config/philosophers.yaml")
-        
-        with open(PHILOSOPHERS_FILE, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+        return get_asset_catalog().get_philosopher_profiles()
     except Exception as e:
         logger.error(f"Error loading philosophers data: {e}")
-        return []
+        return {}
 
 # 철학자 초상화 매핑
 PORTRAITS_MAP = {
@@ -57,14 +59,14 @@ async def get_philosophers():
         
         # 철학자 목록 정리 - 딕셔너리 구조로 처리
         philosophers_list = []
-        for key, data in philosophers_data.items():  # 딕셔너리로 처리
+        for key, profile in philosophers_data.items():  # 딕셔너리로 처리
             philosopher_info = {
                 "id": key,  # 키가 id
-                "name": data.get("name", ""),
-                "korean_name": data.get("korean_name", ""),  # 추가하면 좋겠지만 없을 수도
-                "period": data.get("period", ""),
-                "school": data.get("school", ""),  # 추가하면 좋겠지만 없을 수도
-                "description": data.get("description", "")[:200] + "..." if data.get("description", "") else "",
+                "name": profile.name,
+                "korean_name": profile.korean_name,  # 추가하면 좋겠지만 없을 수도
+                "period": profile.period,
+                "school": profile.school,  # 추가하면 좋겠지만 없을 수도
+                "description": profile.description[:200] + "..." if profile.description else "",
                 "portrait_url": f"/portraits/{PORTRAITS_MAP.get(key, 'default.png')}"
             }
             philosophers_list.append(philosopher_info)
@@ -90,22 +92,22 @@ async def get_philosopher_details(philosopher_id: str):
         if philosopher_id_lower not in philosophers_data:
             raise HTTPException(status_code=404, detail=f"철학자 '{philosopher_id}'를 찾을 수 없습니다")
         
-        data = philosophers_data[philosopher_id_lower]
+        profile = philosophers_data[philosopher_id_lower]
         
         # 상세 정보 구성
         philosopher_details = {
             "id": philosopher_id_lower,
-            "name": data.get("name", ""),
-            "korean_name": data.get("korean_name", ""),  
-            "period": data.get("period", ""),
-            "school": data.get("school", ""),
-            "description": data.get("description", ""),
-            "key_concepts": data.get("key_concepts", []),
-            "famous_quotes": data.get("famous_quotes", []),
-            "major_works": data.get("major_works", []),
+            "name": profile.name,
+            "korean_name": profile.korean_name,  
+            "period": profile.period,
+            "school": profile.school,
+            "description": profile.description,
+            "key_concepts": profile.get("key_concepts", []),
+            "famous_quotes": profile.get("famous_quotes", []),
+            "major_works": profile.get("major_works", []),
             "portrait_url": f"/portraits/{PORTRAITS_MAP.get(philosopher_id_lower, 'default.png')}",
-            "communication_style": data.get("communication_style", {}),
-            "debate_approach": data.get("debate_approach", {})
+            "communication_style": profile.get("communication_style", {}),
+            "debate_approach": profile.get("debate_approach", {})
         }
         
         logger.info(f"철학자 상세 정보 조회 성공: {philosopher_id}")
@@ -4,16 +4,20 @@
 대화 진행, 발언권 관리, 요약 생성 등 중재자 역할을 수행하는 에이전트 구현
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
 import logging
 from src.agents.base.agent import Agent
 from src.dialogue.state.dialogue_state import DialogueStage, Message
 from src.models.llm.llm_manager import LLMManager
+from src.utils.config.asset_catalog import get_asset_catalog
 import time
 
 logger = logging.getLogger(__name__)
 
+# 누적 요약(digest)으로 최종 요약 문구만 생성할 때의 최대 출력 토큰
+SUMMARY_RENDER_MAX_TOKENS = 800
+
 class ModeratorAgent(Agent):
     """
     대화 중재자 에이전트
@@ -353,31 +357,17 @@ Important: Write your response in the SAME LANGUAGE as the debate topic. If the
         pro_participant_names = []
         con_participant_names = []
             
-        # 철학자 데이터 로드 시도
-        try:
-            import yaml
-            import os
-            philosophers_file = os.path.join(os.getcwd(), "philosophers", "debate_optimized.yaml")
-            with open(philosophers_file, 'r', encoding='utf-8') as file:
-                philosophers = yaml.safe_load(file)
-        except Exception as e:
-            philosophers = {}
+        # 철학자 이름은 자산 카탈로그에서 조회 (파일 재파싱 없음)
+        catalog = get_asset_catalog()
             
         # PRO 참가자 이름 변환
         for participant_id in pro_participants:
-            if participant_id in philosophers:
-                name = philosophers[participant_id].get("name", participant_id)
-                pro_participant_names.append(name)
-            else:
-                pro_participant_names.append(participant_id)
+            pro_participant_names.append(catalog.get_philosopher_name(participant_id, participant_id))
         
         # CON 참가자 이름 변환
         for participant_id in con_participants:
-            if participant_id in philosophers:
-                name = philosophers[participant_id].get("name", participant_id)
-                con_participant_names.append(name)
-            else:
-                con_participant_names.append(participant_id)        
+            con_participant_names.append(catalog.get_philosopher_name(participant_id, participant_id))
+        
         # 캐시된 오프닝 메시지가 있는 경우 
         if hasattr(self, '_cached_opening_message') and self._cached_opening_message:
             logger.info("Using cached opening message with participant name adaptation")
@@ -465,23 +455,13 @@ Important: Only change the participant names. Everything else should remain iden
         style_id = self.config.get("style_id", "0")  # 기본값은 "0" (Casual Young Moderator)
         
         try:
-            import json
-            import os
-            
-            # moderator_style.json 파일 경로
-            style_file_path = os.path.join(
-                os.path.dirname(__file__), 
-                "moderator_style.json"
-            )
-            
-            # 스타일 파일 로드
-            with open(style_file_path, 'r', encoding='utf-8') as f:
-                moderator_styles = json.load(f)
+            # 자산 카탈로그에서 스타일 조회 (moderator_style.json)
+            moderator_style = get_asset_catalog().get_moderator_style(style_id)
             
             # 지정된 스타일 ID의 템플릿 가져오기
-            if style_id in moderator_styles:
-                style_template = moderator_styles[style_id]["opening"]
-                style_name = moderator_styles[style_id]["name"]
+            if moderator_style:
+                style_template = moderator_style.opening
+                style_name = moderator_style.name
                 
                 # context_summary 정보 준비
                 context_info = ""
@@ -760,7 +740,6 @@ Ensure your messages are complete and do not cut off mid-sentence.
         """
         topic = dialogue_state.get("topic", "the topic")
         current_stage = dialogue_state.get("current_stage", "")
-        speaking_history = dialogue_state.get("speaking_history", [])
         
         # 현재 단계에 따라 다른 요약 생성
         summary_type = ""
@@ -771,48 +750,20 @@ Ensure your messages are complete and do not cut off mid-sentence.
         elif "summary_3" in current_stage.lower():
             summary_type = "after cross-examination"
         
-        # 최근 메시지 추출 (단계별로 필터링)
-        recent_stage_messages = []
-        for msg in speaking_history:
-            # 요약 단계 이전의 메시지만 포함
-            if msg.get("stage") in self._get_previous_stages(current_stage):
-                recent_stage_messages.append(msg)
-        
-        # 발언 추출
-        recent_pro_messages = [msg.get("text", "") for msg in recent_stage_messages if msg.get("role") == "pro"]
-        recent_con_messages = [msg.get("text", "") for msg in recent_stage_messages if msg.get("role") == "con"]
-        
-        # 발언을 문자열로 결합
-        pro_arguments = ""
-        for msg in recent_pro_messages:
-            pro_arguments += msg + "\n"
-            
-        con_arguments = ""
-        for msg in recent_con_messages:
-            con_arguments += msg + "\n"
+        pro_arguments, con_arguments, max_tokens = self._collect_summary_arguments(dialogue_state, current_stage)
         
         # 1차 요약의 경우 모더레이터 스타일의 transition 속성 참조
         if "summary_1" in current_stage.lower():
             style_id = self.config.get("style_id", "0")  # 기본값은 "0" (Casual Young Moderator)
             
             try:
-                import json
-                import os
-                
-                # moderator_style.json 파일 경로
-                style_file_path = os.path.join(
-                    os.path.dirname(__file__), 
-                    "moderator_style.json"
-                )
-                
-                # 스타일 파일 로드
-                with open(style_file_path, 'r', encoding='utf-8') as f:
-                    moderator_styles = json.load(f)
+                # 자산 카탈로그에서 스타일 조회 (moderator_style.json)
+                moderator_style = get_asset_catalog().get_moderator_style(style_id)
                 
                 # 지정된 스타일 ID의 transition 템플릿 가져오기
-                if style_id in moderator_styles:
-                    transition_template = moderator_styles[style_id]["transition"]
-                    style_name = moderator_styles[style_id]["name"]
+                if moderator_style:
+                    transition_template = moderator_style.transition
+                    style_name = moderator_style.name
                     
                     # transition 스타일을 참조하는 프롬프트 작성
                     system_prompt = f"""
@@ -853,7 +804,7 @@ Important: Write your summary in the SAME LANGUAGE as the debate topic. If the t
                             system_prompt=system_prompt, 
                             user_prompt=user_prompt,
                             llm_model="gpt-4",
-                            max_tokens=1500
+                            max_tokens=max_tokens
                         )
                         
                         if summary:
@@ -911,7 +862,7 @@ Important: Write your summary in the SAME LANGUAGE as the debate topic. If the t
                 system_prompt=system_prompt, 
                 user_prompt=user_prompt,
                 llm_model="gpt-4",
-                max_tokens=1500
+                max_tokens=max_tokens
             )
         except Exception as e:
             logger.error(f"Error generating summary: {str(e)}")
@@ -947,6 +898,37 @@ Important: Write your summary in the SAME LANGUAGE as the debate topic. If the t
             "message": summary
         }
     
+    def _collect_summary_arguments(self, dialogue_state: Any, current_stage: str) -> Tuple[str, str, int]:
+        """
+        요약 프롬프트에 넣을 찬반 발언 내용 구성
+        
+        대화 쪽에서 미리 접어 둔 누적 요약(rolling_summary)이 있으면 그대로 사용하고,
+        없으면 요약 단계 이전의 전체 발언을 이어 붙입니다.
+        
+        Args:
+            dialogue_state: 현재 대화 상태
+            current_stage: 현재 단계
+            
+        Returns:
+            (찬성측 내용, 반대측 내용, 최대 출력 토큰)
+        """
+        rolling_summary = dialogue_state.get("rolling_summary")
+        if rolling_summary and (rolling_summary.get("pro") or rolling_summary.get("con")):
+            return rolling_summary.get("pro", ""), rolling_summary.get("con", ""), SUMMARY_RENDER_MAX_TOKENS
+        
+        previous_stages = self._get_previous_stages(current_stage)
+        pro_arguments = ""
+        con_arguments = ""
+        for msg in dialogue_state.get("speaking_history", []):
+            # 요약 단계 이전의 메시지만 포함
+            if msg.get("stage") not in previous_stages:
+                continue
+            if msg.get("role") == "pro":
+                pro_arguments += msg.get("text", "") + "\n"
+            elif msg.get("role") == "con":
+                con_arguments += msg.get("text", "") + "\n"
+        return pro_arguments, con_arguments, 1500
+    
     def _get_previous_stages(self, current_stage: str) -> List[str]:
         """현재 단계 이전의 모든 단계 반환"""
         from ...dialogue.types.debate_dialogue import DebateStage
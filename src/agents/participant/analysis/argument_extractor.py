@@ -69,7 +69,8 @@ IMPORTANT: Return ONLY the JSON array, no other text.
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 llm_model="gpt-4o",
-                max_tokens=1200
+                max_tokens=1200,
+                context_type="argument_analysis"
             )
             
             # JSON 파싱 개선
@@ -145,7 +146,8 @@ IMPORTANT: Return ONLY the JSON array, no other text.
                 user_prompt=user_prompt,
                 llm_model="gpt-4o",
                 max_tokens=1000,
-                temperature=0.3
+                temperature=0.3,
+                context_type="argument_analysis"
             )
             
             # JSON 파싱
@@ -260,7 +262,8 @@ Each key point should be:
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 llm_model="gpt-4o",
-                max_tokens=1500
+                max_tokens=1500,
+                context_type="argument_analysis"
             )
             
             # JSON 파싱
@@ -117,7 +117,8 @@ Return JSON format:
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 llm_model="gpt-4o",
-                max_tokens=1200
+                max_tokens=1200,
+                context_type="vulnerability_scoring"
             )
             
             print(f"      📝 LLM 응답: {response_text[:200]}...")
@@ -285,7 +286,8 @@ Return JSON format:
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 llm_model="gpt-4o",
-                max_tokens=300
+                max_tokens=300,
+                context_type="vulnerability_scoring"
             )
             
             # JSON 파싱
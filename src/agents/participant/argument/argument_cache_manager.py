@@ -9,6 +9,8 @@ import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+from ....utils.tracing import get_tracer, current_span, wrap_context
+
 logger = logging.getLogger(__name__)
 
 
@@ -194,11 +196,12 @@ class ArgumentCacheManager:
                 
                 return final_argument, strengthened_arguments
             
-            # CPU 집약적 작업을 별도 스레드에서 실행
+            # CPU 집약적 작업을 별도 스레드에서 실행 (현재 span을 스레드로 전파)
             loop = asyncio.get_event_loop()
-            final_argument, strengthened_arguments = await loop.run_in_executor(
-                None, prepare_sync
-            )
+            with get_tracer().span("argument.prepare", kind="agent", agent_id=self.agent_id, mode="background"):
+                final_argument, strengthened_arguments = await loop.run_in_executor(
+                    None, wrap_context(prepare_sync)
+                )
             
             # 결과 저장
             self.prepared_argument = final_argument
@@ -247,6 +250,7 @@ class ArgumentCacheManager:
         # 캐시된 입론이 있고 컨텍스트가 같다면 반환
         if self.is_argument_ready() and self._is_same_context(context):
             logger.info(f"[{self.agent_id}] Returning cached argument")
+            current_span().set("argument_cache_hit", True)
             
             # 캐시된 경우에도 RAG 정보 추출 시도
             rag_info = self._extract_rag_info_from_enhancer(rag_enhancer)
@@ -259,6 +263,7 @@ class ArgumentCacheManager:
         
         # 캐시된 입론이 없거나 컨텍스트가 다르면 즉시 생성
         logger.info(f"[{self.agent_id}] No suitable cached argument, generating immediately")
+        current_span().set("argument_cache_hit", False)
         
         start_time = datetime.now()
         
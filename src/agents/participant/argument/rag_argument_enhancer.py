@@ -6,8 +6,11 @@ Handles RAG query generation, evidence search, and argument strengthening.
 
 import logging
 import re
+import time
 from typing import Dict, List, Any, Optional
 
+from ...utility.turn_deadline import MIN_GENERATION_TIMEOUT_SECONDS
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,13 +89,16 @@ class RAGArgumentEnhancer:
     # NEW OPTIMIZED METHOD - 이미 쿼리가 포함된 논증 처리
     # =================================================================
     
-    def generate_rag_queries_for_arguments(self, topic: str, core_arguments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def generate_rag_queries_for_arguments(self, topic: str, core_arguments: List[Dict[str, Any]],
+                                           deadline_seconds: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         RAG 쿼리 생성 (최적화된 버전 - 이미 쿼리가 있으면 그대로 반환)
         
         Args:
             topic: 토론 주제  
             core_arguments: 핵심 주장 리스트 (이미 RAG 쿼리 포함될 수 있음)
+            deadline_seconds: 쿼리 생성에 쓸 수 있는 남은 시간 (초). 각 LLM 호출의 request_timeout으로 전달되어
+                라우터가 OpenAI 지연이 남은 시간보다 길면 로컬 모델로 넘길 수 있음
             
         Returns:
             RAG 쿼리가 포함된 주장 리스트
@@ -110,15 +116,18 @@ class RAGArgumentEnhancer:
         else:
             # 쿼리가 없으면 기존 방식으로 생성 (fallback)
             logger.info(f"[{self.agent_id}] ⚠️ Arguments missing RAG queries - generating them separately")
-            return self._generate_queries_fallback(topic, core_arguments)
+            deadline_at = time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+            return self._generate_queries_fallback(topic, core_arguments, deadline_at)
     
-    def _generate_queries_fallback(self, topic: str, core_arguments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _generate_queries_fallback(self, topic: str, core_arguments: List[Dict[str, Any]],
+                                   deadline_at: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         RAG 쿼리가 없는 경우 별도로 생성 (fallback 방식)
         
         Args:
             topic: 토론 주제
             core_arguments: 핵심 주장 리스트
+            deadline_at: time.monotonic() 기준 마감 시각 (없으면 None)
             
         Returns:
             RAG 쿼리가 추가된 주장 리스트
@@ -131,7 +140,7 @@ class RAGArgumentEnhancer:
                 reasoning = argument.get("reasoning", "")
                 
                 # 개별 주장에 대한 RAG 쿼리 생성
-                rag_queries = self._generate_queries_for_single_argument(topic, argument_text, reasoning)
+                rag_queries = self._generate_queries_for_single_argument(topic, argument_text, reasoning, deadline_at)
                 
                 # 원본 주장에 RAG 쿼리 추가
                 enhanced_argument = argument.copy()
@@ -146,7 +155,8 @@ class RAGArgumentEnhancer:
         
         return enhanced_arguments
     
-    def _generate_queries_for_single_argument(self, topic: str, argument: str, reasoning: str) -> List[Dict[str, Any]]:
+    def _generate_queries_for_single_argument(self, topic: str, argument: str, reasoning: str,
+                                              deadline_at: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         단일 주장에 대한 RAG 쿼리 생성
         
@@ -154,6 +164,7 @@ class RAGArgumentEnhancer:
             topic: 토론 주제
             argument: 주장 내용
             reasoning: 주장 근거
+            deadline_at: time.monotonic() 기준 마감 시각 (없으면 None)
             
         Returns:
             RAG 쿼리 리스트
@@ -200,7 +211,10 @@ Respond with a JSON array of search queries.
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 llm_model="gpt-4o",
-                max_tokens=800
+                max_tokens=800,
+                context_type="rag_query_generation",
+                request_timeout=(max(MIN_GENERATION_TIMEOUT_SECONDS, deadline_at - time.monotonic())
+                                if deadline_at is not None else None)
             )
             
             # JSON 파싱
@@ -10,7 +10,8 @@ import os
 import yaml
 import json
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from datetime import datetime
 
 from ..base.agent import Agent
@@ -29,9 +30,18 @@ from .search.rag_search_manager import RAGSearchManager
 from .search.web_searcher import WebSearcher
 from .argument import ArgumentGenerator, RAGArgumentEnhancer, ArgumentCacheManager
 from .strategy import AttackStrategyManager, DefenseStrategyManager, FollowupStrategyManager, StrategyRAGManager
+from ...utils.config.asset_catalog import get_asset_catalog
+from ..utility.debate_emotion_inference import format_debate_emotion_for_prompt
+from ..utility.turn_deadline import TurnDeadline, DEFAULT_TURN_BUDGET_SECONDS
+from .prompt_prefix import build_debate_prompt_layout, finish_debate_prompt
+from ...models.llm.context_packer import ContextPacker
+from ...utils.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
+# 공격 계획으로 미리 준비한 방어 결과의 유효 시간 (초)
+DEFENSE_PREFETCH_TTL_SECONDS = 300
+
 class DebateParticipantAgent(Agent):
     """
     토론 참가자 에이전트
@@ -61,6 +71,17 @@ class DebateParticipantAgent(Agent):
         # 토론 역할 설정
         self.role = config.get("role", "neutral")  # "pro", "con", "neutral"
         
+        # 턴 시간 예산 (초) - 예산이 부족하면 선택적 보강 단계를 생략/캐시 대체
+        self.turn_budget_seconds = config.get("turn_budget_seconds", DEFAULT_TURN_BUDGET_SECONDS)
+        self._strategy_rag_fallbacks = {}  # (전략, 상대 ID) -> 마지막으로 성공한 RAG 결정
+        
+        # 공격자가 전략을 고른 시점에 미리 준비한 방어 후보/근거 (공격자 ID -> 준비 결과)
+        self._defense_prefetch: Dict[str, Dict[str, Any]] = {}
+        self._defense_prefetch_lock = threading.Lock()
+        
+        # 공격 전략 선택 알림 (대화 관리자가 설정: listener(공격자 ID, 대상 ID, 공격 전략))
+        self.attack_plan_listener: Optional[Callable[[str, str, Dict[str, Any]], None]] = None
+        
         # 철학자 정보 로드
         philosopher_key = name.lower()
         philosopher_data = self._load_philosopher_data(philosopher_key)
@@ -124,8 +145,9 @@ class DebateParticipantAgent(Agent):
                 "rag_affinity": getattr(self, 'rag_affinity', 0.5)
             }
             
-            # 전략 스타일 로드
+            # 전략 스타일 로드 (공유 접두부 블록의 전략 안내에도 사용)
             strategy_styles = self._load_strategy_styles()
+            self.strategy_styles = strategy_styles
             
             # 전략별 RAG 가중치 로드
             strategy_rag_weights = self._load_strategy_rag_weights()
@@ -144,7 +166,8 @@ class DebateParticipantAgent(Agent):
                 agent_id=self.agent_id,
                 philosopher_data=philosopher_data,
                 strategy_styles=strategy_styles,
-                llm_manager=self.llm_manager
+                llm_manager=self.llm_manager,
+                context_summary=self.context_summary
             )
             
             # FollowupStrategyManager 초기화
@@ -152,7 +175,8 @@ class DebateParticipantAgent(Agent):
                 agent_id=self.agent_id,
                 philosopher_data=philosopher_data,
                 strategy_styles=strategy_styles,
-                llm_manager=self.llm_manager
+                llm_manager=self.llm_manager,
+                context_summary=self.context_summary
             )
             
             # StrategyRAGManager 초기화
@@ -283,7 +307,7 @@ class DebateParticipantAgent(Agent):
     
     def _load_philosopher_data(self, philosopher_key: str) -> Dict[str, Any]:
         """
-        YAML 파일에서 철학자 데이터 로드
+        자산 카탈로그(philosophers/debate_optimized.yaml)에서 철학자 데이터 로드
         
         Args:
             philosopher_key: 철학자 키 (예: "socrates", "plato")
@@ -292,29 +316,11 @@ class DebateParticipantAgent(Agent):
             철학자 데이터 딕셔너리
         """
         try:
-            # 프로젝트 루트에서 philosophers/debate_optimized.yaml 파일 경로 찾기
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = current_dir
-            
-            # 프로젝트 루트 찾기 (src 폴더가 있는 상위 디렉토리)
-            while project_root and not os.path.exists(os.path.join(project_root, "philosophers")):
-                parent = os.path.dirname(project_root)
-                if parent == project_root:  # 루트에 도달
-                    break
-                project_root = parent
-            
-            yaml_path = os.path.join(project_root, "philosophers", "debate_optimized.yaml")
-            
-            if not os.path.exists(yaml_path):
-                logger.warning(f"Philosopher YAML file not found at {yaml_path}")
-                return self._get_default_philosopher_data(philosopher_key)
-            
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                philosophers_data = yaml.safe_load(f)
+            philosopher = get_asset_catalog().get_debate_philosopher(philosopher_key)
             
-            if philosopher_key in philosophers_data:
+            if philosopher is not None:
                 logger.info(f"Loaded philosopher data for: {philosopher_key}")
-                return philosophers_data[philosopher_key]
+                return philosopher.to_dict()
             else:
                 logger.warning(f"Philosopher '{philosopher_key}' not found in YAML file")
                 return self._get_default_philosopher_data(philosopher_key)
@@ -325,34 +331,19 @@ class DebateParticipantAgent(Agent):
     
     def _load_strategy_styles(self) -> Dict[str, Any]:
         """
-        JSON 파일에서 전략 스타일 정보 로드
+        자산 카탈로그(philosophers/debate_strategies.json)에서 전략 스타일 정보 로드
         
         Returns:
             전략 스타일 딕셔너리
         """
         try:
-            # 프로젝트 루트에서 philosophers/debate_strategies.json 파일 경로 찾기
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = current_dir
+            strategy_styles = get_asset_catalog().get_strategy_styles()
             
-            # 프로젝트 루트 찾기 (src 폴더가 있는 상위 디렉토리)
-            while project_root and not os.path.exists(os.path.join(project_root, "philosophers")):
-                parent = os.path.dirname(project_root)
-                if parent == project_root:  # 루트에 도달
-                    break
-                project_root = parent
-            
-            json_path = os.path.join(project_root, "philosophers", "debate_strategies.json")
-            
-            if not os.path.exists(json_path):
-                logger.warning(f"Strategy JSON file not found at {json_path}")
+            if not strategy_styles:
+                logger.warning("Strategy styles not available in asset catalog")
                 return self._get_default_strategy_styles()
             
-            with open(json_path, 'r', encoding='utf-8') as f:
-                strategies_data = json.load(f)
-            
-            logger.info(f"Loaded strategy styles from: {json_path}")
-            return strategies_data.get("strategy_styles", {})
+            return strategy_styles
             
         except Exception as e:
             logger.error(f"Error loading strategy styles: {str(e)}")
@@ -360,34 +351,19 @@ class DebateParticipantAgent(Agent):
     
     def _load_strategy_rag_weights(self) -> Dict[str, Any]:
         """
-        YAML 파일에서 전략별 RAG 가중치 로드
+        자산 카탈로그(philosophers/strategy_rag_weights.yaml)에서 전략별 RAG 가중치 로드
         
         Returns:
             전략별 RAG 가중치 딕셔너리
         """
         try:
-            # 프로젝트 루트에서 philosophers/strategy_rag_weights.yaml 파일 경로 찾기
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = current_dir
+            rag_weights = get_asset_catalog().get_strategy_rag_weights()
             
-            # 프로젝트 루트 찾기 (src 폴더가 있는 상위 디렉토리)
-            while project_root and not os.path.exists(os.path.join(project_root, "philosophers")):
-                parent = os.path.dirname(project_root)
-                if parent == project_root:  # 루트에 도달
-                    break
-                project_root = parent
-            
-            yaml_path = os.path.join(project_root, "philosophers", "strategy_rag_weights.yaml")
-            
-            if not os.path.exists(yaml_path):
-                logger.warning(f"Strategy RAG weights YAML file not found at {yaml_path}")
+            if not rag_weights:
+                logger.warning("Strategy RAG weights not available in asset catalog")
                 return self._get_default_strategy_rag_weights()
             
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                rag_weights_data = yaml.safe_load(f)
-            
-            logger.info(f"Loaded strategy RAG weights from: {yaml_path}")
-            return rag_weights_data.get("strategy_rag_weights", {})
+            return rag_weights
             
         except Exception as e:
             logger.error(f"Error loading strategy RAG weights: {str(e)}")
@@ -462,8 +438,8 @@ class DebateParticipantAgent(Agent):
         Returns:
             RAG 사용 결정 결과
         """
-        print(f"   🧮 [{self.philosopher_name}] RAG 사용 판별:")
-        print(f"      🎯 전략: {strategy_type}")
+        logger.debug(f"   🧮 [{self.philosopher_name}] RAG 사용 판별:")
+        logger.debug(f"      🎯 전략: {strategy_type}")
         
         try:
             # 1. 전략별 RAG 가중치 로드
@@ -472,7 +448,7 @@ class DebateParticipantAgent(Agent):
             
             strategy_weights = self.strategy_rag_weights.get(strategy_type, {})
             if not strategy_weights:
-                print(f"      ❌ 전략 '{strategy_type}'에 대한 RAG 가중치 없음 - RAG 사용 안함")
+                logger.debug(f"      ❌ 전략 '{strategy_type}'에 대한 RAG 가중치 없음 - RAG 사용 안함")
                 return {
                     "use_rag": False,
                     "rag_score": 0.0,
@@ -487,7 +463,7 @@ class DebateParticipantAgent(Agent):
             rag_stats = philosopher_data.get("rag_stats", {})
             
             if not rag_stats:
-                print(f"      ❌ 철학자 '{philosopher_key}'에 대한 RAG 스탯 없음 - RAG 사용 안함")
+                logger.debug(f"      ❌ 철학자 '{philosopher_key}'에 대한 RAG 스탯 없음 - RAG 사용 안함")
                 return {
                     "use_rag": False,
                     "rag_score": 0.0,
@@ -497,13 +473,13 @@ class DebateParticipantAgent(Agent):
                 }
             
             # 3. 벡터 내적 계산: rag_score = Σ(strategy_weight[i] × philosopher_rag_stat[i])
-            print(f"      📊 전략 가중치: {strategy_weights}")
-            print(f"      🎭 철학자 스탯: {rag_stats}")
+            logger.debug(f"      📊 전략 가중치: {strategy_weights}")
+            logger.debug(f"      🎭 철학자 스탯: {rag_stats}")
             
             rag_score = 0.0
             calculation_details = {}
             
-            print(f"      🔢 계산 과정:")
+            logger.debug(f"      🔢 계산 과정:")
             for stat_name in ["data_respect", "conceptual_precision", "systematic_logic", "pragmatic_orientation", "rhetorical_independence"]:
                 strategy_weight = strategy_weights.get(stat_name, 0.0)
                 philosopher_stat = rag_stats.get(stat_name, 0.0)
@@ -514,18 +490,17 @@ class DebateParticipantAgent(Agent):
                     "philosopher_stat": philosopher_stat,
                     "contribution": contribution
                 }
-                print(f"         • {stat_name}: {strategy_weight:.3f} × {philosopher_stat:.3f} = {contribution:.3f}")
+                logger.debug(f"         • {stat_name}: {strategy_weight:.3f} × {philosopher_stat:.3f} = {contribution:.3f}")
             
-            print(f"      📈 합계:")
-            print(f"         • RAG 점수: {rag_score:.3f}")
+            logger.debug(f"      📈 합계:")
+            logger.debug(f"         • RAG 점수: {rag_score:.3f}")
             
             # 4. 임계값 비교 (0.5로 설정)
             threshold = 0.5
             use_rag = rag_score >= threshold
             
-            print(f"         • 임계값: {threshold}")
-            print(f"         • 결정: {'RAG 사용' if use_rag else 'RAG 사용 안함'} ({rag_score:.3f} {'≥' if use_rag else '<'} {threshold})")
-            print()
+            logger.debug(f"         • 임계값: {threshold}")
+            logger.debug(f"         • 결정: {'RAG 사용' if use_rag else 'RAG 사용 안함'} ({rag_score:.3f} {'≥' if use_rag else '<'} {threshold})")
             
             return {
                 "use_rag": use_rag,
@@ -537,7 +512,7 @@ class DebateParticipantAgent(Agent):
             
         except Exception as e:
             logger.error(f"Error determining RAG usage for strategy '{strategy_type}': {str(e)}")
-            print(f"      ❌ RAG 판별 오류: {str(e)} - RAG 사용 안함")
+            logger.warning(f"      ❌ RAG 판별 오류: {str(e)} - RAG 사용 안함")
             return {
                 "use_rag": False,
                 "rag_score": 0.0,
@@ -648,6 +623,23 @@ class DebateParticipantAgent(Agent):
         return agent
     
     def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        에이전트로 요청 처리 (액션 하나를 "agent.process" span으로 기록)
+        
+        Args:
+            input_data: 처리할 입력 데이터
+            
+        Returns:
+            처리 결과
+        """
+        with get_tracer().span("agent.process", kind="agent", agent_id=self.agent_id,
+                               philosopher=self.philosopher_key, action=input_data.get("action", "")) as span:
+            result = self._process_action(input_data)
+            if isinstance(result, dict):
+                span.set_attributes(status=result.get("status"), rag_used=result.get("rag_used"))
+            return result
+    
+    def _process_action(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         에이전트로 요청 처리
         
@@ -673,9 +665,9 @@ class DebateParticipantAgent(Agent):
         # 로그 메시지 개선 - analyze_opponent_arguments의 경우 대상 발언자 표시
         if action == "analyze_opponent_arguments":
             target_speaker = input_data.get("speaker_id", "unknown")
-            print(f"🕐 [{self.philosopher_name}] → {target_speaker} 논지 분석 시작: {time.strftime('%H:%M:%S', time.localtime(start_time))}")
+            logger.debug(f"🕐 [{self.philosopher_name}] → {target_speaker} 논지 분석 시작: {time.strftime('%H:%M:%S', time.localtime(start_time))}")
         else:
-            print(f"🕐 [{self.philosopher_name}] {action} 시작: {time.strftime('%H:%M:%S', time.localtime(start_time))}")
+            logger.debug(f"🕐 [{self.philosopher_name}] {action} 시작: {time.strftime('%H:%M:%S', time.localtime(start_time))}")
         
         try:
             result = None
@@ -724,9 +716,9 @@ class DebateParticipantAgent(Agent):
             # 완료 로그 메시지도 개선
             if action == "analyze_opponent_arguments":
                 target_speaker = input_data.get("speaker_id", "unknown")
-                print(f"✅ [{self.philosopher_name}] → {target_speaker} 논지 분석 완료: {time.strftime('%H:%M:%S', time.localtime(end_time))} (소요시간: {duration:.2f}초)")
+                logger.debug(f"✅ [{self.philosopher_name}] → {target_speaker} 논지 분석 완료: {time.strftime('%H:%M:%S', time.localtime(end_time))} (소요시간: {duration:.2f}초)")
             else:
-                print(f"✅ [{self.philosopher_name}] {action} 완료: {time.strftime('%H:%M:%S', time.localtime(end_time))} (소요시간: {duration:.2f}초)")
+                logger.debug(f"✅ [{self.philosopher_name}] {action} 완료: {time.strftime('%H:%M:%S', time.localtime(end_time))} (소요시간: {duration:.2f}초)")
             
             return result
             
@@ -737,9 +729,9 @@ class DebateParticipantAgent(Agent):
             # 실패 로그 메시지도 개선
             if action == "analyze_opponent_arguments":
                 target_speaker = input_data.get("speaker_id", "unknown")
-                print(f"❌ [{self.philosopher_name}] → {target_speaker} 논지 분석 실패: {time.strftime('%H:%M:%S', time.localtime(end_time))} (소요시간: {duration:.2f}초) - {str(e)}")
+                logger.warning(f"❌ [{self.philosopher_name}] → {target_speaker} 논지 분석 실패: {time.strftime('%H:%M:%S', time.localtime(end_time))} (소요시간: {duration:.2f}초) - {str(e)}")
             else:
-                print(f"❌ [{self.philosopher_name}] {action} 실패: {time.strftime('%H:%M:%S', time.localtime(end_time))} (소요시간: {duration:.2f}초) - {str(e)}")
+                logger.warning(f"❌ [{self.philosopher_name}] {action} 실패: {time.strftime('%H:%M:%S', time.localtime(end_time))} (소요시간: {duration:.2f}초) - {str(e)}")
             
             logger.error(f"Error in {action}: {str(e)}")
             return {"status": "error", "message": f"처리 중 오류가 발생했습니다: {str(e)}"}
@@ -817,10 +809,17 @@ class DebateParticipantAgent(Agent):
         # dialogue_state를 인스턴스 변수에 저장하여 다른 메서드에서 접근 가능하도록 함
         self._current_dialogue_state = dialogue_state
         
-        response = self._generate_response_internal(context, dialogue_state, stance_statements)
-        return {"status": "success", "message": response}
+        # 턴 마감 시간: 대화 관리자가 감정 추론 전에 시작한 것을 이어받거나 새로 시작
+        turn_deadline = TurnDeadline.from_value(input_data.get("turn_deadline")) or TurnDeadline(self.turn_budget_seconds)
+        
+        response = self._generate_response_internal(context, dialogue_state, stance_statements, turn_deadline)
+        turn_budget = turn_deadline.to_metadata()
+        if turn_budget["dropped"]:
+            logger.debug(f"⏱️ [{self.philosopher_name}] 턴 예산으로 생략된 보강 단계: "
+                         f"{', '.join(entry['enrichment'] for entry in turn_budget['dropped'])}")
+        return {"status": "success", "message": response, "turn_budget": turn_budget}
     
-    def _generate_response_internal(self, context: Dict[str, Any], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str]) -> str:
+    def _generate_response_internal(self, context: Dict[str, Any], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str], turn_deadline: Optional[TurnDeadline] = None) -> str:
         """
         토론 응답 생성
         
@@ -828,6 +827,7 @@ class DebateParticipantAgent(Agent):
             context: 응답 생성 컨텍스트
             dialogue_state: 현재 대화 상태
             stance_statements: 찬반 입장 진술문
+            turn_deadline: 턴 마감 시간 (선택적)
             
         Returns:
             생성된 응답 텍스트
@@ -843,13 +843,13 @@ class DebateParticipantAgent(Agent):
         # 상호논증 단계에서는 짧고 직접적인 공격/질문 형태로 생성
         if current_stage == "interactive_argument":
             return self._generate_interactive_argument_response(
-                topic, recent_messages, dialogue_state, stance_statements, emotion_enhancement
+                topic, recent_messages, dialogue_state, stance_statements, emotion_enhancement, turn_deadline
             )
         
         # 기존 로직 유지 (입론, 결론 등)
         # ... existing code ...
     
-    def _generate_interactive_argument_response(self, topic: str, recent_messages: List[Dict[str, Any]], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str], emotion_enhancement: Dict[str, Any] = None) -> str:
+    def _generate_interactive_argument_response(self, topic: str, recent_messages: List[Dict[str, Any]], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str], emotion_enhancement: Dict[str, Any] = None, turn_deadline: Optional[TurnDeadline] = None) -> str:
         """
         상호논증 단계에서 응답 생성 - 대화 관리자의 단계 관리에 의존
         
@@ -859,6 +859,7 @@ class DebateParticipantAgent(Agent):
             dialogue_state: 현재 대화 상태
             stance_statements: 찬반 입장 진술문
             emotion_enhancement: 감정 강화 데이터 (선택적)
+            turn_deadline: 턴 마감 시간 (선택적)
             
         Returns:
             생성된 응답 텍스트
@@ -870,11 +871,11 @@ class DebateParticipantAgent(Agent):
         situation = self._simple_situation_analysis(recent_messages)
         
         if situation == "defending":
-            return self._generate_defense_response(topic, recent_messages, dialogue_state, stance_statements, emotion_enhancement)
+            return self._generate_defense_response(topic, recent_messages, dialogue_state, stance_statements, emotion_enhancement, turn_deadline)
         elif situation == "following_up":
-            return self._generate_followup_response(topic, recent_messages, dialogue_state, stance_statements, emotion_enhancement)
+            return self._generate_followup_response(topic, recent_messages, dialogue_state, stance_statements, emotion_enhancement, turn_deadline)
         else:  # attacking (기본값)
-            return self._generate_attack_response(topic, recent_messages, dialogue_state, stance_statements, emotion_enhancement)
+            return self._generate_attack_response(topic, recent_messages, dialogue_state, stance_statements, emotion_enhancement, turn_deadline)
     
     def _simple_situation_analysis(self, recent_messages: List[Dict[str, Any]]) -> str:
         """
@@ -936,7 +937,7 @@ class DebateParticipantAgent(Agent):
                 last_speaker != "moderator" and 
                 last_speaker != self.agent_id)
     
-    def _generate_defense_response(self, topic: str, recent_messages: List[Dict[str, Any]], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str], emotion_enhancement: Dict[str, Any] = None) -> str:
+    def _generate_defense_response(self, topic: str, recent_messages: List[Dict[str, Any]], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str], emotion_enhancement: Dict[str, Any] = None, turn_deadline: Optional[TurnDeadline] = None) -> str:
         """
         방어 응답 생성
         
@@ -946,31 +947,53 @@ class DebateParticipantAgent(Agent):
             dialogue_state: 현재 대화 상태
             stance_statements: 찬반 입장 진술문
             emotion_enhancement: 감정 강화 데이터 (선택적)
+            turn_deadline: 턴 마감 시간 (선택적, 예산이 부족하면 방어 RAG를 캐시로 대체)
             
         Returns:
             생성된 방어 응답
         """
-        print(f"🛡️ [{self.philosopher_name}] 방어 응답 생성 시작")
+        logger.debug(f"🛡️ [{self.philosopher_name}] 방어 응답 생성 시작")
         
-        # 1. 상대방 공격 분석
+        # 1. 상대방 공격 분석 (공격 계획 단계에서 미리 준비한 방어가 있으면 최종 공격과 대조)
         attack_info = self._analyze_incoming_attack(recent_messages)
+        prefetched = self._take_defense_prefetch(attack_info)
         
         # 2. 방어 전략 선택 - 모듈 사용
-        defense_strategy = self.defense_strategy_manager.select_defense_strategy(attack_info, emotion_enhancement)
-        
-        # 3. 방어용 RAG 사용 여부 결정
-        defense_rag_decision = self._determine_defense_rag_usage(defense_strategy, attack_info)
+        with get_tracer().span("strategy.select", kind="strategy", strategy_type="defense") as span:
+            defense_strategy = self.defense_strategy_manager.select_defense_strategy(attack_info, emotion_enhancement)
+            span.set("strategy", defense_strategy)
+        
+        # 3. 방어용 RAG 사용 여부 결정 (미리 준비한 결과 → 턴 예산 안에서 검색 → 캐시된 결과 순)
+        fallback_key = (defense_strategy, attack_info.get("attacker_id", ""))
+        prefetched_decision = prefetched.get("decisions", {}).get(defense_strategy) if prefetched else None
+        if prefetched_decision is not None:
+            defense_rag_decision = prefetched_decision
+            if turn_deadline and prefetched_decision.get("results"):
+                turn_deadline.mark_used("strategy_rag")  # 공격 생성 중에 미리 검색된 결과
+            logger.debug(f"   ⚡ [{self.philosopher_name}] 미리 준비된 방어 근거 사용 - 전략: {defense_strategy}")
+        elif turn_deadline:
+            cached_decision = self._strategy_rag_fallbacks.get(fallback_key)
+            defense_rag_decision = turn_deadline.call_with_budget(
+                "strategy_rag", self._determine_defense_rag_usage, defense_strategy, attack_info,
+                fallback=cached_decision or {"use_rag": False, "results": [], "results_count": 0},
+                fallback_name="cached" if cached_decision else "none"
+            )
+        else:
+            defense_rag_decision = self._determine_defense_rag_usage(defense_strategy, attack_info)
+        if defense_rag_decision.get("results"):
+            self._strategy_rag_fallbacks[fallback_key] = defense_rag_decision
         
         # 4. 방어 응답 생성 - 모듈 사용
         defense_response = self.defense_strategy_manager.generate_defense_response(
             topic, recent_messages, stance_statements, defense_strategy, 
-            attack_info, emotion_enhancement
+            defense_rag_decision, emotion_enhancement, role=self.role,
+            request_timeout=turn_deadline.generation_timeout() if turn_deadline else None
         )
         
-        print(f"🛡️ [{self.philosopher_name}] 방어 응답 생성 완료 - 전략: {defense_strategy}")
+        logger.debug(f"🛡️ [{self.philosopher_name}] 방어 응답 생성 완료 - 전략: {defense_strategy}")
         return defense_response
     
-    def _generate_attack_response(self, topic: str, recent_messages: List[Dict[str, Any]], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str], emotion_enhancement: Dict[str, Any] = None) -> str:
+    def _generate_attack_response(self, topic: str, recent_messages: List[Dict[str, Any]], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str], emotion_enhancement: Dict[str, Any] = None, turn_deadline: Optional[TurnDeadline] = None) -> str:
         """
         공격 응답 생성 (기존 로직)
         """
@@ -992,7 +1015,7 @@ class DebateParticipantAgent(Agent):
         # 2. target_agent_id가 없으면 dialogue_state에서 찾기
         if not target_agent_id:
             # dialogue_state의 구조 확인을 위한 디버깅
-            print(f"   🔍 디버깅: dialogue_state 키들: {list(dialogue_state.keys())}")
+            logger.debug(f"   🔍 디버깅: dialogue_state 키들: {list(dialogue_state.keys())}")
             
             # 여러 가능한 경로에서 참가자 정보 찾기
             participants = None
@@ -1000,16 +1023,16 @@ class DebateParticipantAgent(Agent):
             # 경로 1: dialogue_state['participants']
             if 'participants' in dialogue_state:
                 participants = dialogue_state['participants']
-                print(f"   🔍 디버깅: participants 구조: {participants}")
+                logger.debug(f"   🔍 디버깅: participants 구조: {participants}")
             
             # 경로 2: dialogue_state에서 직접 pro/con 찾기
             elif opposite_role in dialogue_state:
                 participants = {opposite_role: dialogue_state[opposite_role]}
-                print(f"   🔍 디버깅: 직접 찾은 {opposite_role}: {participants}")
+                logger.debug(f"   🔍 디버깅: 직접 찾은 {opposite_role}: {participants}")
             
             if participants:
                 opposite_participants = participants.get(opposite_role, [])
-                print(f"   🔍 디버깅: {opposite_role} 참가자들: {opposite_participants}")
+                logger.debug(f"   🔍 디버깅: {opposite_role} 참가자들: {opposite_participants}")
                 
                 if opposite_participants:
                     # 첫 번째 상대방 선택
@@ -1018,7 +1041,7 @@ class DebateParticipantAgent(Agent):
                     elif isinstance(opposite_participants, str):
                         target_agent_id = opposite_participants
                     
-                    print(f"   🔍 디버깅: 선택된 target_agent_id: {target_agent_id}")
+                    logger.debug(f"   🔍 디버깅: 선택된 target_agent_id: {target_agent_id}")
         
         # 3. 여전히 없으면 실제 참가자에서 상대방 찾기
         if not target_agent_id:
@@ -1040,7 +1063,7 @@ class DebateParticipantAgent(Agent):
                 # 상대방 역할의 첫 번째 참가자 선택
                 if all_participants:
                     target_agent_id = all_participants[0]
-                    print(f"   🔍 디버깅: speaking_history에서 찾은 상대방: {target_agent_id}")
+                    logger.debug(f"   🔍 디버깅: speaking_history에서 찾은 상대방: {target_agent_id}")
                 else:
                     # fallback: 기본 상대방 설정
                     if self.role == "pro":
@@ -1050,24 +1073,27 @@ class DebateParticipantAgent(Agent):
                     else:
                         target_agent_id = "opponent"
                     
-                    print(f"   🔍 디버깅: 기본값으로 설정된 target_agent_id: {target_agent_id}")
+                    logger.debug(f"   🔍 디버깅: 기본값으로 설정된 target_agent_id: {target_agent_id}")
                     
             except Exception as e:
-                print(f"   ❌ 상대방 찾기 오류: {str(e)}")
+                logger.warning(f"   ❌ 상대방 찾기 오류: {str(e)}")
                 target_agent_id = "opponent"
         
         # 4. 철학자 이름 찾기 (개선된 로직)
         target_agent_name = self._get_philosopher_name(target_agent_id)
         
-        # 최근 메시지 텍스트 형식화
-        recent_messages_text = "\n".join([
-            f"{msg.get('role', 'Unknown')} ({msg.get('speaker_id', '')}): {msg.get('text', '')}" 
-            for msg in recent_messages[-3:]  # 최근 3개만
-        ])
-        
-        # 내 입장과 반대 입장 확인
-        my_stance = stance_statements.get(self.role) if self.role in ["pro", "con"] else ""
-        opposite_stance = stance_statements.get(opposite_role, "")
+        # 가변 컨텍스트(최근 발언, 근거, 감정)는 섹션별 토큰 예산에 맞춰 조립
+        packer = ContextPacker(model="gpt-4o")
+        last_three = recent_messages[-3:]  # 최근 3개만
+        if last_three:
+            packer.add("recent_turns", "RECENT EXCHANGE:", priority=1.0, compressible=False, label="recent_header")
+        for index, msg in enumerate(last_three):
+            packer.add(
+                "recent_turns",
+                f"{msg.get('role', 'Unknown')} ({msg.get('speaker_id', '')}): {msg.get('text', '')}",
+                priority=0.5 + 0.5 * (index + 1) / len(last_three),  # 최신 발언일수록 우선
+                label=f"turn[{msg.get('speaker_id', '')}]"
+            )
         
         # 공격 전략 가져오기 (준비된 것이 있으면)
         attack_strategy = None
@@ -1079,16 +1105,20 @@ class DebateParticipantAgent(Agent):
                 attack_strategy = strategies[0]  # 첫 번째 전략 사용
                 target_argument_info = attack_strategy.get('target_argument', {})
                 
+                # 공격 문장을 생성하는 동안 방어자가 방어를 미리 준비하도록 알림
+                self.last_used_strategy = attack_strategy
+                self._notify_attack_plan(target_agent_id, attack_strategy)
+                
                 # 🎯 상호논증 전략 정보 출력
                 strategy_type = attack_strategy.get('strategy_type', 'Unknown')
                 target_claim = target_argument_info.get('claim', 'Unknown claim')[:100] + "..." if len(target_argument_info.get('claim', '')) > 100 else target_argument_info.get('claim', 'Unknown claim')
                 vulnerability_score = attack_strategy.get('vulnerability_score', 0.0)
                 
-                print(f"🎯 [{self.philosopher_name}] 상호논증 전략:")
-                print(f"   📍 공격 대상: {target_agent_name}")
-                print(f"   🗡️  사용 전략: {strategy_type}")
-                print(f"   🎯 대상 논지: {target_claim}")
-                print(f"   ⚡ 취약성 점수: {vulnerability_score:.2f}")
+                logger.debug(f"🎯 [{self.philosopher_name}] 상호논증 전략:")
+                logger.debug(f"   📍 공격 대상: {target_agent_name}")
+                logger.debug(f"   🗡️  사용 전략: {strategy_type}")
+                logger.debug(f"   🎯 대상 논지: {target_claim}")
+                logger.debug(f"   ⚡ 취약성 점수: {vulnerability_score:.2f}")
                 
                 # 전략 세부 정보도 출력
                 attack_plan = attack_strategy.get('attack_plan', {})
@@ -1096,57 +1126,62 @@ class DebateParticipantAgent(Agent):
                     target_point = attack_plan.get('target_point', '')
                     key_phrase = attack_plan.get('key_phrase', '')
                     if target_point:
-                        print(f"   🔍 공격 포인트: {target_point[:80]}...")
+                        logger.debug(f"   🔍 공격 포인트: {target_point[:80]}...")
                     if key_phrase:
-                        print(f"   💬 핵심 공격구: {key_phrase[:60]}...")
+                        logger.debug(f"   💬 핵심 공격구: {key_phrase[:60]}...")
         else:
-            print(f"🎯 [{self.philosopher_name}] 상호논증 전략:")
-            print(f"   📍 공격 대상: {target_agent_name}")
-            print(f"   🗡️  사용 전략: 일반적 반박 (준비된 전략 없음)")
-            print(f"   🎯 대상 논지: 최근 발언 전체")
-            print(f"   💡 상대방 ID: {target_agent_id} (디버깅용)")
-        
-        # 시스템 프롬프트 구성 - 상호논증에 특화
-        system_prompt = f"""
-You are {self.philosopher_name}, a philosopher with this essence: {self.philosopher_essence}
-Your debate style: {self.philosopher_debate_style}
-Your personality: {self.philosopher_personality}
-
-This is the INTERACTIVE ARGUMENT phase of the debate. Your responses should be:
+            logger.debug(f"🎯 [{self.philosopher_name}] 상호논증 전략:")
+            logger.debug(f"   📍 공격 대상: {target_agent_name}")
+            logger.debug(f"   🗡️  사용 전략: 일반적 반박 (준비된 전략 없음)")
+            logger.debug(f"   🎯 대상 논지: 최근 발언 전체")
+            logger.debug(f"   💡 상대방 ID: {target_agent_id} (디버깅용)")
+        
+        # 프롬프트 구성 - 공유 블록(페르소나 + 방 상수 + 전략 안내) + 상호논증 지시문 / 가변 접미부(대상, 최근 발언, 전략)
+        layout = build_debate_prompt_layout(
+            self.agent_id, self.philosopher_name, self.philosopher_essence,
+            self.philosopher_debate_style, self.philosopher_personality,
+            topic, stance_statements, self.role,
+            stage="attack", strategy_styles=getattr(self, 'strategy_styles', None),
+            context_summary=self.context_summary, key_traits=self.philosopher_key_traits
+        )
+        layout.add_stable("""This is the INTERACTIVE ARGUMENT phase of the debate. Your responses should be:
 1. SHORT and DIRECT (2-3 sentences maximum)
 2. AGGRESSIVE and CHALLENGING
 3. Focus on ATTACKING specific points made by your opponent
 4. Ask POINTED QUESTIONS that expose weaknesses
 5. Use your philosophical approach to challenge their logic
 
-CRITICAL: Write your ENTIRE response in the SAME LANGUAGE as the debate topic. 
-If the topic is in Korean, respond in Korean. If in English, respond in English.
-
-You are directly confronting {target_agent_name}. Address them by name and attack their specific arguments.
-"""
-
-        # 유저 프롬프트 구성
-        user_prompt = f"""
-DEBATE TOPIC: "{topic}"
+Address the opponent you are confronting by name and attack their specific arguments.""")
 
-YOUR POSITION: {my_stance}
-OPPONENT'S POSITION: {opposite_stance}
+        # 공격 전략이 있으면 RAG 근거를 패커에 추가
+        if attack_strategy:
+            rag_decision = attack_strategy.get('rag_decision', {})
+            if rag_decision.get('use_rag') and rag_decision.get('results'):
+                rag_formatted = self._format_attack_rag_results(rag_decision['results'], attack_strategy.get('strategy_type', ''))
+                if rag_formatted:
+                    packer.add("evidence", rag_formatted, priority=0.4, label="attack_rag")
+                    if turn_deadline:
+                        turn_deadline.mark_used("strategy_rag")  # 전략 준비 단계에서 미리 검색된 결과
+                    logger.debug(f"   📚 [{self.philosopher_name}] RAG 정보 프롬프트에 포함됨")
+                else:
+                    logger.debug(f"   📚 [{self.philosopher_name}] RAG 결과 포맷팅 실패")
+            else:
+                logger.debug(f"   📚 [{self.philosopher_name}] RAG 사용 안함 또는 결과 없음")
 
-TARGET OPPONENT: {target_agent_name}
+        # 감정 강화 적용 (선택적) - 접두부가 바뀌지 않도록 가변 접미부에 추가
+        if emotion_enhancement:
+            emotion_text = format_debate_emotion_for_prompt(emotion_enhancement)
+            if emotion_text:
+                packer.add("emotion", f"EMOTIONAL STATE:\n{emotion_text}", priority=0.3, label="emotion")
 
-RECENT EXCHANGE:
-{recent_messages_text}
+        packer.add("instructions", f"""TARGET OPPONENT: {target_agent_name}
+You are directly confronting {target_agent_name}.
 
 TASK: Generate a SHORT, DIRECT response (2-3 sentences max) that:
 1. Directly addresses {target_agent_name} by name
 2. Attacks a specific point they made
 3. Asks a challenging question OR points out a logical flaw
-4. Uses your philosophical style to challenge them
-
-IMPORTANT: Write your response in the SAME LANGUAGE as the debate topic "{topic}".
-If the topic contains Korean text, write in Korean. If in English, write in English.
-
-"""
+4. Uses your philosophical style to challenge them""", priority=1.0, compressible=False, label="task")
 
         # 공격 전략이 있으면 추가
         if attack_strategy:
@@ -1154,46 +1189,35 @@ If the topic contains Korean text, write in Korean. If in English, write in Engl
             strategy_description = attack_strategy.get('attack_plan', {}).get('strategy_application', '')
             key_phrases = [attack_strategy.get('attack_plan', {}).get('key_phrase', '')]
             
-            user_prompt += f"""
-ATTACK STRATEGY: Use the "{strategy_type}" approach
+            packer.add("instructions", f"""ATTACK STRATEGY: Use the "{strategy_type}" approach
 Strategy Description: {strategy_description}
-Key Phrases to Consider: {', '.join(key_phrases[:3])}
-"""
-            
-            # RAG 결과가 있으면 추가
-            rag_decision = attack_strategy.get('rag_decision', {})
-            if rag_decision.get('use_rag') and rag_decision.get('results'):
-                rag_formatted = self._format_attack_rag_results(rag_decision['results'], strategy_type)
-                if rag_formatted:
-                    user_prompt += f"""
-{rag_formatted}
-INSTRUCTION: Incorporate this evidence naturally into your {strategy_type} attack.
-"""
-                    print(f"   📚 [{self.philosopher_name}] RAG 정보 프롬프트에 포함됨")
-                else:
-                    print(f"   📚 [{self.philosopher_name}] RAG 결과 포맷팅 실패")
-            else:
-                print(f"   📚 [{self.philosopher_name}] RAG 사용 안함 또는 결과 없음")
+Key Phrases to Consider: {', '.join(key_phrases[:3])}""", priority=1.0, compressible=False, label="strategy")
+            if any(item.section == "evidence" for item in packer.items):
+                packer.add("instructions", f"INSTRUCTION: Incorporate the evidence above naturally into your {strategy_type} attack.",
+                           priority=1.0, compressible=False, label="evidence_instruction")
 
-        user_prompt += f"""
-Remember: Be CONCISE, DIRECT, and CONFRONTATIONAL. This is rapid-fire debate, not a long speech.
+        packer.add("instructions", f"""Remember: Be CONCISE, DIRECT, and CONFRONTATIONAL. This is rapid-fire debate, not a long speech.
 Address {target_agent_name} directly and challenge their specific arguments.
 Write in the SAME LANGUAGE as the topic "{topic}".
 
-Your response:"""
+Your response:""", priority=1.0, compressible=False, label="closing")
 
-        # 감정 강화 적용 (선택적)
-        if emotion_enhancement:
-            from ...agents.utility.debate_emotion_inference import apply_debate_emotion_to_prompt
-            system_prompt, user_prompt = apply_debate_emotion_to_prompt(system_prompt, user_prompt, emotion_enhancement)
+        system_prompt, user_prompt, prompt_tokens, packed_context = finish_debate_prompt(layout, packer)
+        if packed_context.was_cut:
+            logger.debug(f"   ✂️ [{self.philosopher_name}] 컨텍스트 예산 초과로 {len(packed_context.cut)}개 항목 축소 "
+                         f"(총 {packed_context.total_tokens} 토큰)")
         
         try:
             # LLM 호출 - 짧은 응답을 위해 max_tokens 제한
             response = self.llm_manager.generate_response(
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
                 llm_model="gpt-4o",
-                max_tokens=10000  
+                max_tokens=10000,
+                prompt_cache_key=layout.cache_key,
+                request_timeout=turn_deadline.generation_timeout() if turn_deadline else None,
+                cacheable_prefix=layout.shared_prefix,
+                prompt_tokens=prompt_tokens
             )
             
             if response:
@@ -1205,6 +1229,98 @@ Your response:"""
             logger.error(f"Error generating interactive argument response: {str(e)}")
             return f"{target_agent_name}님, 그 주장에 대해 더 구체적인 근거를 제시해 주시기 바랍니다."
     
+    def _notify_attack_plan(self, target_agent_id: Optional[str], attack_strategy: Dict[str, Any]) -> None:
+        """공격 전략 선택을 리스너(대화 관리자)에 알림 - 실패해도 공격 생성은 계속"""
+        listener = self.attack_plan_listener
+        if listener is None or not target_agent_id:
+            return
+        try:
+            listener(self.agent_id, target_agent_id, attack_strategy)
+        except Exception as e:
+            logger.warning(f"[{self.agent_id}] Attack plan notification failed: {str(e)}")
+    
+    def prefetch_defense(self, attacker_id: str, attack_strategy: Dict[str, Any], max_candidates: int = 3) -> Dict[str, Any]:
+        """
+        공격자가 고른 공격 계획으로 방어 후보 전략과 RAG 근거를 미리 준비
+        
+        공격 문장이 생성되는 동안 백그라운드에서 호출되며, 방어 턴에서는
+        최종 공격과 계획이 일치할 때만 준비 결과를 사용하고 최종 생성 호출만 남깁니다.
+        
+        Args:
+            attacker_id: 공격자 ID
+            attack_strategy: 공격자의 선택된 전략 (strategy_type, rag_decision, attack_plan, target_argument)
+            max_candidates: 미리 준비할 최대 방어 후보 수
+            
+        Returns:
+            준비 결과 (attack_info, candidates, decisions, prepared_at)
+        """
+        if not self.defense_strategy_manager or not self.strategy_rag_manager:
+            return {}
+        
+        attack_plan = attack_strategy.get('attack_plan', {}) or {}
+        target_argument = attack_strategy.get('target_argument', {}) or {}
+        # 공격 문장은 아직 없으므로 공격 대상 논지와 핵심 공격구로 검색 쿼리를 구성
+        planned_text = " ".join(filter(None, [
+            attack_plan.get('target_point') or target_argument.get('claim', ''),
+            attack_plan.get('key_phrase', '')
+        ]))
+        attack_info = {
+            "attack_strategy": attack_strategy.get('strategy_type', 'Unknown'),
+            "rag_used": attack_strategy.get('rag_decision', {}).get('use_rag', False),
+            "attacker_id": attacker_id,
+            "attack_text": planned_text[:200],
+            "source": "attack_plan"
+        }
+        
+        candidates = self.defense_strategy_manager.get_prefetch_candidates(attack_info, limit=max_candidates)
+        decisions: Dict[str, Dict[str, Any]] = {}
+        # 이미 공격 생성과 겹쳐 백그라운드 워커에서 실행되므로 후보별 스레드를 새로 띄우지 않고 순서대로 준비
+        for candidate in candidates:
+            try:
+                decisions[candidate] = self._determine_defense_rag_usage(candidate, attack_info)
+            except Exception as e:
+                logger.warning(f"[{self.agent_id}] Defense prefetch failed for {candidate}: {str(e)}")
+        
+        prefetch = {
+            "attack_info": attack_info,
+            "candidates": candidates,
+            "decisions": decisions,
+            "prepared_at": time.time()
+        }
+        with self._defense_prefetch_lock:
+            self._defense_prefetch[attacker_id] = prefetch
+        
+        logger.info(f"[{self.agent_id}] Prefetched defense against {attacker_id} "
+                    f"({attack_info['attack_strategy']}): {list(decisions.keys())}")
+        return prefetch
+    
+    def _take_defense_prefetch(self, attack_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        미리 준비한 방어를 꺼내 최종 공격과 대조 (한 번만 사용)
+        
+        Args:
+            attack_info: 최종 공격 텍스트 기준 분석 결과
+            
+        Returns:
+            공격자/공격 전략/RAG 사용 여부가 모두 일치하는 준비 결과 (없으면 None)
+        """
+        with self._defense_prefetch_lock:
+            prefetch = self._defense_prefetch.pop(attack_info.get("attacker_id", ""), None)
+        if not prefetch:
+            return None
+        
+        planned = prefetch.get("attack_info", {})
+        if time.time() - prefetch.get("prepared_at", 0) > DEFENSE_PREFETCH_TTL_SECONDS:
+            logger.info(f"[{self.agent_id}] Discarding stale defense prefetch")
+            return None
+        if (attack_info.get("source") != "actual_attacker_data"
+                or planned.get("attack_strategy") != attack_info.get("attack_strategy")
+                or planned.get("rag_used") != attack_info.get("rag_used")):
+            logger.info(f"[{self.agent_id}] Defense prefetch does not match final attack "
+                        f"({planned.get('attack_strategy')} vs {attack_info.get('attack_strategy')})")
+            return None
+        return prefetch
+    
     def _analyze_incoming_attack(self, recent_messages: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         들어오는 공격 분석 - 공격자 에이전트의 실제 전략 정보 가져오기
@@ -1222,17 +1338,17 @@ Your response:"""
         attacker_id = last_message.get('speaker_id', 'unknown')
         attack_text = last_message.get('text', '')
         
-        print(f"   🔍 [{self.philosopher_name}] 공격 정보 분석:")
-        print(f"      👤 공격자: {attacker_id}")
+        logger.debug(f"   🔍 [{self.philosopher_name}] 공격 정보 분석:")
+        logger.debug(f"      👤 공격자: {attacker_id}")
         
         # 공격자 에이전트의 실제 전략 정보 가져오기
         attack_info = self._get_attacker_strategy_info(attacker_id)
         
         if attack_info["attack_strategy"] != "Unknown":
-            print(f"      ✅ 실제 공격 전략 발견: {attack_info['attack_strategy']}")
-            print(f"      📚 공격 RAG 사용: {attack_info['rag_used']}")
+            logger.debug(f"      ✅ 실제 공격 전략 발견: {attack_info['attack_strategy']}")
+            logger.debug(f"      📚 공격 RAG 사용: {attack_info['rag_used']}")
         else:
-            print(f"      ❌ 공격 전략 정보 없음 - 키워드 추정 사용")
+            logger.debug(f"      ❌ 공격 전략 정보 없음 - 키워드 추정 사용")
             # Fallback: 키워드 기반 추정 (기존 로직)
             attack_info = self._estimate_attack_strategy_from_keywords(attack_text, attacker_id)
         
@@ -1256,7 +1372,7 @@ Your response:"""
             attacker_agent = self._get_attacker_agent_reference(attacker_id)
             
             if attacker_agent is None:
-                print(f"         ❌ 공격자 에이전트 참조 없음")
+                logger.debug(f"         ❌ 공격자 에이전트 참조 없음")
                 return {"attack_strategy": "Unknown", "rag_used": False}
             
             # 2. 공격자의 최근 사용한 전략 정보 가져오기
@@ -1267,10 +1383,10 @@ Your response:"""
                 rag_decision = recent_attack_strategy.get('rag_decision', {})
                 rag_used = rag_decision.get('use_rag', False)
                 
-                print(f"         ✅ 공격자 전략 정보:")
-                print(f"            🗡️ 전략: {strategy_type}")
-                print(f"            📚 RAG: {rag_used}")
-                print(f"            ⚡ 취약성 점수: {recent_attack_strategy.get('vulnerability_score', 0.0):.2f}")
+                logger.debug(f"         ✅ 공격자 전략 정보:")
+                logger.debug(f"            🗡️ 전략: {strategy_type}")
+                logger.debug(f"            📚 RAG: {rag_used}")
+                logger.debug(f"            ⚡ 취약성 점수: {recent_attack_strategy.get('vulnerability_score', 0.0):.2f}")
                 
                 return {
                     "attack_strategy": strategy_type,
@@ -1280,12 +1396,12 @@ Your response:"""
                     "source": "actual_attacker_data"
                 }
             else:
-                print(f"         ❌ 공격자의 최근 전략 정보 없음")
+                logger.debug(f"         ❌ 공격자의 최근 전략 정보 없음")
                 return {"attack_strategy": "Unknown", "rag_used": False}
                 
         except Exception as e:
             logger.error(f"Error getting attacker strategy info: {str(e)}")
-            print(f"         ❌ 공격자 전략 정보 조회 오류: {str(e)}")
+            logger.warning(f"         ❌ 공격자 전략 정보 조회 오류: {str(e)}")
             return {"attack_strategy": "Unknown", "rag_used": False}
     
     def _get_attacker_agent_reference(self, attacker_id: str):
@@ -1384,7 +1500,7 @@ Your response:"""
         """
         attack_text_lower = attack_text.lower()
         
-        print(f"         🔄 키워드 기반 전략 추정 시작")
+        logger.debug(f"         🔄 키워드 기반 전략 추정 시작")
         
         # 공격 전략 추정 (키워드 기반)
         attack_strategy = "Unknown"
@@ -1408,7 +1524,7 @@ Your response:"""
             'study', 'research', 'data', 'statistics', 'according to', 'evidence', 'findings'
         ])
         
-        print(f"         📊 추정 결과: {attack_strategy} (RAG: {rag_used})")
+        logger.debug(f"         📊 추정 결과: {attack_strategy} (RAG: {rag_used})")
         
         return {
             "attack_strategy": attack_strategy,
@@ -1426,7 +1542,10 @@ Your response:"""
     
     def _determine_defense_rag_usage(self, defense_strategy: str, attack_info: Dict[str, Any]) -> Dict[str, Any]:
         """방어 RAG 사용 결정 - 모듈로 위임"""
-        return self.strategy_rag_manager.determine_defense_rag_usage(defense_strategy, attack_info)
+        with get_tracer().span("rag.strategy_search", kind="rag", strategy=defense_strategy) as span:
+            decision = self.strategy_rag_manager.determine_defense_rag_usage(defense_strategy, attack_info)
+            span.set_attributes(use_rag=decision.get("use_rag"), result_count=decision.get("results_count"))
+            return decision
     
     def _get_defense_strategy_rag_weight(self, defense_strategy: str) -> float:
         """방어 전략 RAG 가중치 - 모듈로 위임"""
@@ -1436,7 +1555,7 @@ Your response:"""
         """전략별 방어 응답 생성 - 모듈로 위임"""
         return self.defense_strategy_manager.generate_defense_response(
             topic, recent_messages, stance_statements, defense_strategy, 
-            {'attack_info': defense_rag_decision}, emotion_enhancement
+            {'attack_info': defense_rag_decision}, emotion_enhancement, role=self.role
         )
     
     def _get_defense_strategy_info(self, defense_strategy: str) -> Dict[str, Any]:
@@ -1466,28 +1585,9 @@ Your response:"""
             철학자 이름
         """
         try:
-            import yaml
-            import os
-            
-            # 프로젝트 루트에서 philosophers/debate_optimized.yaml 파일 경로 찾기
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = current_dir
-            
-            # 프로젝트 루트 찾기 (src 폴더가 있는 상위 디렉토리)
-            while project_root and not os.path.exists(os.path.join(project_root, "philosophers")):
-                parent = os.path.dirname(project_root)
-                if parent == project_root:  # 루트에 도달
-                    break
-                project_root = parent
-            
-            yaml_path = os.path.join(project_root, "philosophers", "debate_optimized.yaml")
-            
-            if os.path.exists(yaml_path):
-                with open(yaml_path, 'r', encoding='utf-8') as file:
-                    philosophers = yaml.safe_load(file)
-                
-                if agent_id in philosophers:
-                    return philosophers[agent_id].get("name", agent_id)
+            philosopher_name = get_asset_catalog().get_philosopher_name(agent_id)
+            if philosopher_name:
+                return philosopher_name
             
             # YAML에서 찾지 못한 경우 기본 매핑
             name_mapping = {
@@ -1516,7 +1616,7 @@ Your response:"""
     
     def prepare_argument_with_rag(self, topic: str, stance_statement: str, context: Dict[str, Any] = None) -> None:
         """OpenAI 웹서치를 활용한 간단한 논증 준비 - debate_argument_generator 방식 적용"""
-        print(f"📝 [{self.philosopher_name}] OpenAI 웹서치 기반 입론 준비 시작")
+        logger.debug(f"📝 [{self.philosopher_name}] OpenAI 웹서치 기반 입론 준비 시작")
         
         start_time = time.time()
         
@@ -1592,9 +1692,9 @@ Your response:"""
             end_time = time.time()
             generation_time = end_time - start_time
             
-            print(f"📝 [{self.philosopher_name}] 입론 준비 완료 ({generation_time:.2f}초)")
-            print(f"   📄 생성된 입론 길이: {len(generated_argument)} 문자")
-            print(f"   🔗 추출된 인용 개수: {len(citations)}")
+            logger.debug(f"📝 [{self.philosopher_name}] 입론 준비 완료 ({generation_time:.2f}초)")
+            logger.debug(f"   📄 생성된 입론 길이: {len(generated_argument)} 문자")
+            logger.debug(f"   🔗 추출된 인용 개수: {len(citations)}")
             
         except Exception as e:
             logger.error(f"[{self.agent_id}] 입론 준비 실패: {str(e)}")
@@ -1657,9 +1757,11 @@ Remember: This should sound like {self.philosopher_name} actually delivering an
         return self.argument_generator.generate_core_arguments(topic, stance_statement)
     
     def _generate_rag_queries_for_arguments(self, topic: str) -> None:
-        """논증용 RAG 쿼리 생성 - 모듈로 위임"""
+        """논증용 RAG 쿼리 생성 - 모듈로 위임 (대화 관리자가 준비 작업을 턴 예산만큼만 기다리므로 그 안에서 생성)"""
         if hasattr(self, 'core_arguments') and self.core_arguments:
-            return self.rag_argument_enhancer.generate_rag_queries_for_arguments(topic, self.core_arguments)
+            return self.rag_argument_enhancer.generate_rag_queries_for_arguments(
+                topic, self.core_arguments, deadline_seconds=self.turn_budget_seconds
+            )
     
     def _strengthen_arguments_with_rag(self) -> None:
         """RAG로 논증 강화 - 모듈로 위임"""
@@ -2033,7 +2135,7 @@ Remember: This should sound like {self.philosopher_name} actually delivering an
 
     def get_prepared_argument_or_generate(self, topic: str, stance_statement: str, context: Dict[str, Any] = None) -> tuple[str, Dict[str, Any]]:
         """새로운 OpenAI 웹서치 방식으로 입론 생성"""
-        print(f"🚀 [{self.philosopher_name}] 새로운 OpenAI 웹서치 방식으로 입론 생성")
+        logger.debug(f"🚀 [{self.philosopher_name}] 새로운 OpenAI 웹서치 방식으로 입론 생성")
         
         try:
             # 새로운 방식으로 입론 생성
@@ -2048,19 +2150,19 @@ Remember: This should sound like {self.philosopher_name} actually delivering an
                     "rag_sources": []
                 })
                 
-                print(f"✅ [{self.philosopher_name}] 새로운 방식 입론 생성 성공")
-                print(f"   📊 RAG 사용: {rag_info.get('rag_used', False)}")
-                print(f"   🔗 인용 개수: {len(rag_info.get('citations', []))}")
+                logger.debug(f"✅ [{self.philosopher_name}] 새로운 방식 입론 생성 성공")
+                logger.debug(f"   📊 RAG 사용: {rag_info.get('rag_used', False)}")
+                logger.debug(f"   🔗 인용 개수: {len(rag_info.get('citations', []))}")
                 
                 return message, rag_info
             else:
                 # 실패 시 기본 메시지
-                print(f"❌ [{self.philosopher_name}] 새로운 방식 입론 생성 실패")
+                logger.warning(f"❌ [{self.philosopher_name}] 새로운 방식 입론 생성 실패")
                 return f"죄송합니다. 입론 준비 중 문제가 발생했습니다.", {}
                 
         except Exception as e:
             logger.error(f"[{self.agent_id}] 새로운 방식 입론 생성 실패: {str(e)}")
-            print(f"❌ [{self.philosopher_name}] 입론 생성 오류: {str(e)}")
+            logger.warning(f"❌ [{self.philosopher_name}] 입론 생성 오류: {str(e)}")
             return f"기술적 문제로 입론을 준비하지 못했습니다.", {}
     
     def invalidate_argument_cache(self):
@@ -2153,7 +2255,12 @@ Remember: This should sound like {self.philosopher_name} actually delivering an
     
     def get_best_attack_strategy(self, target_speaker_id: str, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """최적 공격 전략 선택 - 모듈로 위임"""
-        return self.attack_strategy_manager.get_best_attack_strategy(target_speaker_id, context)
+        with get_tracer().span("strategy.select", kind="strategy", strategy_type="attack",
+                               target_speaker_id=target_speaker_id) as span:
+            strategy = self.attack_strategy_manager.get_best_attack_strategy(target_speaker_id, context)
+            if strategy:
+                span.set("strategy", strategy.get("strategy_type"))
+            return strategy
     
     def _prepare_argument(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -2169,7 +2276,7 @@ Remember: This should sound like {self.philosopher_name} actually delivering an
         stance_statement = input_data.get("stance_statement", "")
         context = input_data.get("context", {})
         
-        print(f"🔧 [{self.philosopher_name}] _prepare_argument 호출 - 새로운 방식 사용")
+        logger.debug(f"🔧 [{self.philosopher_name}] _prepare_argument 호출 - 새로운 방식 사용")
         
         try:
             # 새로운 방식으로 입론 생성
@@ -2330,25 +2437,28 @@ Remember: This should sound like {self.philosopher_name} actually delivering an
         """공격 RAG 결과 포맷팅 - 모듈로 위임"""
         return self.strategy_rag_manager._format_attack_rag_results(rag_results, strategy_type)
     
-    def _generate_followup_response(self, topic: str, recent_messages: List[Dict[str, Any]], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str], emotion_enhancement: Dict[str, Any] = None) -> str:
+    def _generate_followup_response(self, topic: str, recent_messages: List[Dict[str, Any]], dialogue_state: Dict[str, Any], stance_statements: Dict[str, str], emotion_enhancement: Dict[str, Any] = None, turn_deadline: Optional[TurnDeadline] = None) -> str:
         """
         팔로우업 응답 생성 - 모듈 사용
         """
-        print(f"🔄 [{self.philosopher_name}] 팔로우업 응답 생성 시작")
+        logger.debug(f"🔄 [{self.philosopher_name}] 팔로우업 응답 생성 시작")
         
         # 1. 상대방 방어 분석 - 모듈 사용
         defense_info = self.followup_strategy_manager.analyze_defense_response(recent_messages)
         
         # 2. 팔로우업 전략 선택 - 모듈 사용
-        followup_strategy = self.followup_strategy_manager.select_followup_strategy(defense_info, emotion_enhancement)
+        with get_tracer().span("strategy.select", kind="strategy", strategy_type="followup") as span:
+            followup_strategy = self.followup_strategy_manager.select_followup_strategy(defense_info, emotion_enhancement)
+            span.set("strategy", followup_strategy)
         
         # 3. 팔로우업 응답 생성 - 모듈 사용
         followup_response = self.followup_strategy_manager.generate_followup_response(
             topic, recent_messages, stance_statements, followup_strategy, 
-            defense_info, emotion_enhancement
+            defense_info, emotion_enhancement, role=self.role,
+            request_timeout=turn_deadline.generation_timeout() if turn_deadline else None
         )
         
-        print(f"🔄 [{self.philosopher_name}] 팔로우업 응답 생성 완료 - 전략: {followup_strategy}")
+        logger.debug(f"🔄 [{self.philosopher_name}] 팔로우업 응답 생성 완료 - 전략: {followup_strategy}")
         return followup_response
     
     def _analyze_defense_response(self, recent_messages: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -2383,7 +2493,7 @@ Remember: This should sound like {self.philosopher_name} actually delivering an
         """전략별 팔로우업 응답 생성 - 모듈로 위임"""
         return self.followup_strategy_manager.generate_followup_response(
             topic, recent_messages, stance_statements, followup_strategy, 
-            followup_rag_decision, emotion_enhancement
+            followup_rag_decision, emotion_enhancement, role=self.role
         )
     
     def _get_followup_strategy_info(self, followup_strategy: str) -> Dict[str, Any]:
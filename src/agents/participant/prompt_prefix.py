@@ -0,0 +1,188 @@
+"""
+Debate prompt prefix module for debate participants.
+
+공격/방어/팔로우업 응답이 공유하는 안정적인 프롬프트 접두부를 생성합니다.
+
+- 공유 블록: 페르소나, 토론 주제와 양측 입장, 컨텍스트 요약, 전략 안내(공격/방어/팔로우업)처럼
+  단계와 무관한 방 상수. 같은 방의 같은 화자는 모든 단계에서 글자 하나 다르지 않은 블록을 사용합니다.
+- 단계 지시문: 호출부가 공유 블록 뒤에 add_stable()로 붙이며, 단계별로 캐시 키를 분리합니다.
+- 가변 내용: 호출부가 ContextPacker 섹션(recent_turns, evidence, emotion, instructions)으로 채우고
+  finish_debate_prompt()로 패킹해 사용자 프롬프트와 최종 토큰 수를 얻습니다.
+  페르소나/입장도 같은 섹션 예산(persona, stance)으로 잘라 공유 블록에 넣습니다.
+
+OpenAI 프롬프트 캐시는 1024 토큰 이상의 접두부부터 적용되므로, 공유 블록이 그보다 짧으면
+캐시 가능 토큰은 0으로 기록되고 Ollama keep_alive만 효과가 있습니다.
+"""
+
+import hashlib
+from typing import Dict, Any, List, Optional, Tuple
+
+from ...models.llm.context_packer import ContextPacker, PackedContext
+from ...models.llm.prompt_layout import PromptLayout
+from ...models.llm.token_counter import count_tokens
+
+# 단계별 고정 지시문 템플릿 (캐시 키 구분용)
+STAGE_TEMPLATES = ("attack", "defense", "followup")
+
+# 방어/팔로우업 전략 안내 (defense_map.yaml / followup_map.yaml의 후보 전략)
+DEFENSE_STRATEGY_GUIDE = {
+    "Refute": "Directly reject the attack with a counter-argument or evidence.",
+    "Clarify": "Restate what you actually claimed and expose the misreading in the attack.",
+    "Accept": "Concede the valid part of the attack while keeping your core position intact.",
+    "Reframe": "Move the disagreement onto ground where your position is stronger.",
+    "Counter-Challenge": "Turn the attack around and put a pointed question back to the attacker.",
+    "Synthesis": "Combine the valid part of the attack with your view into a stronger position."
+}
+
+FOLLOWUP_STRATEGY_GUIDE = {
+    "Reattack": "Press the same weak point again, showing the defense did not answer it.",
+    "FollowUpQuestion": "Ask a sharper question that the defense left open.",
+    "Deepen": "Dig one level deeper into the premise the defense relied on.",
+    "Pivot": "Shift to a related weakness that the defense exposed.",
+    "SynthesisProposal": "Propose a shared position that still favors your stance.",
+    "Counter-Challenge": "Challenge the assumption behind the defense itself."
+}
+
+
+def debate_prompt_cache_key(agent_id: str, topic: str, stage: str = "shared") -> str:
+    """
+    화자 + 토론 주제 + 단계 템플릿 단위의 접두부 캐시 키
+
+    Args:
+        agent_id: 에이전트 ID
+        topic: 토론 주제
+        stage: 단계 템플릿 (attack/defense/followup)
+
+    Returns:
+        prompt_cache_key 문자열
+    """
+    topic_hash = hashlib.sha1((topic or "").encode("utf-8")).hexdigest()[:12]
+    return f"debate:{agent_id}:{topic_hash}:{stage}"
+
+
+def format_context_summary(context_summary: Any) -> str:
+    """방 컨텍스트 요약(dict 또는 문자열)을 접두부용 텍스트로 변환"""
+    if isinstance(context_summary, str):
+        return context_summary.strip()
+    if not isinstance(context_summary, dict):
+        return ""
+
+    summary = context_summary.get("summary") or context_summary.get("objective_summary") or ""
+    key_points: List[str] = context_summary.get("key_points") or context_summary.get("bullet_points") or []
+    quotes: List[str] = context_summary.get("relevant_quotes") or []
+
+    lines = [summary.strip()] if summary else []
+    if key_points:
+        lines.append("Key points:")
+        lines.extend(f"- {point}" for point in key_points)
+    if quotes:
+        lines.append("Relevant quotes:")
+        lines.extend(f"- {quote}" for quote in quotes)
+    return "\n".join(lines)
+
+
+def format_strategy_handbook(strategy_styles: Optional[Dict[str, Any]]) -> str:
+    """공격 전략 스타일과 방어/팔로우업 전략 안내를 접두부용 텍스트로 변환"""
+    strategy_styles = strategy_styles or {}
+    lines = ["STRATEGY HANDBOOK (the task names the strategy to use in each turn)", "", "Attack strategies:"]
+    for name, style in strategy_styles.items():
+        if not isinstance(style, dict) or name in ("defense_strategies", "followup_strategies"):
+            continue
+        lines.append(f"- {name}: {style.get('description', '')}")
+        if style.get("style_prompt"):
+            lines.append(f"  Style: {style['style_prompt']}")
+        if style.get("example"):
+            lines.append(f"  Example: {style['example']}")
+
+    for title, guide, overrides in (
+        ("Defense strategies:", DEFENSE_STRATEGY_GUIDE, strategy_styles.get("defense_strategies", {})),
+        ("Follow-up strategies:", FOLLOWUP_STRATEGY_GUIDE, strategy_styles.get("followup_strategies", {}))
+    ):
+        lines.extend(["", title])
+        for name, description in guide.items():
+            override = overrides.get(name, {}) if isinstance(overrides, dict) else {}
+            lines.append(f"- {name}: {override.get('description', description)}")
+    return "\n".join(lines)
+
+
+def build_debate_prompt_layout(agent_id: str,
+                               philosopher_name: str,
+                               philosopher_essence: str,
+                               philosopher_debate_style: str,
+                               philosopher_personality: str,
+                               topic: str,
+                               stance_statements: Dict[str, str],
+                               role: Optional[str] = None,
+                               stage: str = "attack",
+                               strategy_styles: Optional[Dict[str, Any]] = None,
+                               context_summary: Any = None,
+                               key_traits: Optional[List[str]] = None,
+                               model: str = "gpt-4o") -> PromptLayout:
+    """
+    단계와 무관한 방 상수로 공유 블록을 채운 PromptLayout 생성
+
+    Args:
+        agent_id: 에이전트 ID
+        philosopher_name: 철학자 이름
+        philosopher_essence: 철학자 핵심 사상
+        philosopher_debate_style: 토론 스타일
+        philosopher_personality: 성격
+        topic: 토론 주제
+        stance_statements: 찬반 입장 진술문
+        role: 화자 역할 (pro/con)
+        stage: 호출부가 이어 붙일 단계 템플릿 (캐시 키에 포함)
+        strategy_styles: 공격 전략 스타일 (전략 안내에 포함)
+        context_summary: 방 컨텍스트 요약
+        key_traits: 철학자 핵심 특성
+        model: 섹션 예산 토큰 계산 기준 모델
+
+    Returns:
+        호출부가 단계별 고정 지시문과 가변 내용을 이어 붙일 PromptLayout
+    """
+    my_stance = stance_statements.get(role, "") if role in ["pro", "con"] else ""
+    opposite_role = "con" if role == "pro" else "pro"
+    opposite_stance = stance_statements.get(opposite_role, "") if role in ["pro", "con"] else ""
+
+    persona = f"""You are {philosopher_name}, a philosopher with this essence: {philosopher_essence}
+Your debate style: {philosopher_debate_style}
+Your personality: {philosopher_personality}"""
+    if key_traits:
+        persona += f"\nYour key traits: {', '.join(key_traits)}"
+
+    # 페르소나/입장은 가변 컨텍스트와 같은 섹션 예산으로 자름 (결정적이므로 공유 블록은 그대로 유지)
+    profile = ContextPacker(model=model)
+    profile.add("persona", persona, priority=1.0, label="persona")
+    profile.add("stance", f"""DEBATE TOPIC: "{topic}"
+YOUR POSITION: {my_stance}
+OPPONENT'S POSITION: {opposite_stance}""", priority=1.0, label="stance")
+    packed_profile = profile.pack()
+    sections = [packed_profile.get("persona"), packed_profile.get("stance")]
+
+    summary_text = format_context_summary(context_summary)
+    if summary_text:
+        sections.append(f"DEBATE CONTEXT:\n{summary_text}")
+    sections.append(format_strategy_handbook(strategy_styles))
+    sections.append("""CRITICAL: Write your ENTIRE response in the SAME LANGUAGE as the debate topic.
+If the topic is in Korean, respond in Korean. If in English, respond in English.""")
+
+    layout = PromptLayout(cache_key=debate_prompt_cache_key(agent_id, topic, stage))
+    layout.add_shared("\n\n".join(sections))
+    return layout
+
+
+def finish_debate_prompt(layout: PromptLayout, packer: ContextPacker) -> Tuple[str, str, int, PackedContext]:
+    """
+    가변 컨텍스트를 섹션 예산에 맞춰 패킹하고 레이아웃의 사용자 프롬프트로 추가
+
+    Args:
+        layout: 공유 블록과 단계 지시문이 채워진 PromptLayout
+        packer: recent_turns/evidence/emotion/instructions 섹션이 채워진 ContextPacker
+
+    Returns:
+        (system_prompt, user_prompt, prompt_tokens, packed) - prompt_tokens는 resolve_max_tokens용 최종 토큰 수
+    """
+    packed = packer.pack()
+    layout.add_volatile(packed.text)
+    system_prompt, user_prompt = layout.build()
+    prompt_tokens = count_tokens(system_prompt, packer.model) + packed.total_tokens
+    return system_prompt, user_prompt, prompt_tokens, packed
@@ -5,11 +5,14 @@ Handles defense strategy selection and response generation.
 """
 
 import logging
-import yaml
-import os
 import random
 from typing import Dict, List, Any, Optional
 
+from ..prompt_prefix import build_debate_prompt_layout, finish_debate_prompt
+from ....models.llm.context_packer import ContextPacker
+from ....utils.config.asset_catalog import get_asset_catalog
+from ...utility.debate_emotion_inference import format_debate_emotion_for_prompt
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +20,8 @@ class DefenseStrategyManager:
     """방어 전략 선택 및 관리를 담당하는 클래스"""
     
     def __init__(self, agent_id: str, philosopher_data: Dict[str, Any], 
-                 strategy_styles: Dict[str, Any], llm_manager):
+                 strategy_styles: Dict[str, Any], llm_manager,
+                 context_summary: Any = None):
         """
         DefenseStrategyManager 초기화
         
@@ -26,11 +30,13 @@ class DefenseStrategyManager:
             philosopher_data: 철학자 데이터
             strategy_styles: 전략 스타일 정보
             llm_manager: LLM 매니저 인스턴스
+            context_summary: 방 컨텍스트 요약 (공유 접두부 블록에 포함)
         """
         self.agent_id = agent_id
         self.philosopher_data = philosopher_data
         self.strategy_styles = strategy_styles
         self.llm_manager = llm_manager
+        self.context_summary = context_summary
         
         # 철학자 정보 추출
         self.philosopher_name = philosopher_data.get("name", "Unknown Philosopher")
@@ -42,22 +48,8 @@ class DefenseStrategyManager:
         self.defense_history = []
         self.last_defense_strategy = None
         
-        # defense_map.yaml 경로 설정
-        self._setup_defense_map_path()
-    
-    def _setup_defense_map_path(self):
-        """defense_map.yaml 파일 경로 설정"""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = current_dir
-        
-        # 프로젝트 루트 찾기
-        while project_root and not os.path.exists(os.path.join(project_root, "philosophers")):
-            parent = os.path.dirname(project_root)
-            if parent == project_root:
-                break
-            project_root = parent
-        
-        self.defense_map_path = os.path.join(project_root, "philosophers", "defense_map.yaml")
+        # defense_map.yaml은 자산 카탈로그에서 캐시된 스냅샷으로 조회 (호출마다 파일을 열지 않음)
+        self.defense_map_path = get_asset_catalog().get_path("defense_map")
     
     def select_defense_strategy(self, attack_info: Dict[str, Any], 
                               emotion_enhancement: Dict[str, Any] = None) -> str:
@@ -71,26 +63,26 @@ class DefenseStrategyManager:
         Returns:
             선택된 방어 전략명
         """
-        logger.info(f"[{self.agent_id}] Selecting defense strategy")
+        logger.debug("[%s] Selecting defense strategy", self.agent_id)
         
         try:
             # 1. defense_map.yaml에서 후보 전략 가져오기
             defense_candidates = self._get_defense_candidates_from_map(attack_info, emotion_enhancement)
             
             if not defense_candidates:
-                logger.warning(f"[{self.agent_id}] No defense candidates found, using default Clarify")
+                logger.warning("[%s] No defense candidates found, using default Clarify", self.agent_id)
                 return "Clarify"
             
-            logger.info(f"[{self.agent_id}] Defense candidates: {defense_candidates}")
+            logger.debug("[%s] Defense candidates: %s", self.agent_id, defense_candidates)
             
             # 2. 철학자의 defense_weights 가져오기
             defense_weights = self.philosopher_data.get("defense_weights", {})
             
             if not defense_weights:
-                logger.warning(f"[{self.agent_id}] No defense weights found, using first candidate")
+                logger.warning("[%s] No defense weights found, using first candidate", self.agent_id)
                 return defense_candidates[0]
             
-            logger.info(f"[{self.agent_id}] Defense weights: {defense_weights}")
+            logger.debug("[%s] Defense weights: %s", self.agent_id, defense_weights)
             
             # 3. 후보 전략들에 대한 가중치만 추출하고 정규화
             candidate_weights = {}
@@ -102,12 +94,12 @@ class DefenseStrategyManager:
                 total_weight += weight
             
             if total_weight == 0:
-                logger.warning(f"[{self.agent_id}] Total weight is 0, using first candidate")
+                logger.warning("[%s] Total weight is 0, using first candidate", self.agent_id)
                 return defense_candidates[0]
             
             # 정규화
             normalized_weights = {k: v/total_weight for k, v in candidate_weights.items()}
-            logger.info(f"[{self.agent_id}] Normalized weights: {normalized_weights}")
+            logger.debug("[%s] Normalized weights: %s", self.agent_id, normalized_weights)
             
             # 4. 확률적 선택
             rand_val = random.random()
@@ -116,16 +108,16 @@ class DefenseStrategyManager:
             for strategy, prob in normalized_weights.items():
                 cumulative += prob
                 if rand_val <= cumulative:
-                    logger.info(f"[{self.agent_id}] Selected defense strategy: {strategy} (prob: {prob:.3f})")
+                    logger.info("[%s] Selected defense strategy: %s (prob: %.3f)", self.agent_id, strategy, prob)
                     return strategy
             
             # 혹시나 하는 fallback
             selected = defense_candidates[0]
-            logger.info(f"[{self.agent_id}] Fallback defense strategy: {selected}")
+            logger.info("[%s] Fallback defense strategy: %s", self.agent_id, selected)
             return selected
             
         except Exception as e:
-            logger.error(f"[{self.agent_id}] Error selecting defense strategy: {str(e)}")
+            logger.error("[%s] Error selecting defense strategy: %s", self.agent_id, e)
             return "Clarify"
     
     def _get_defense_candidates_from_map(self, attack_info: Dict[str, Any], 
@@ -141,13 +133,11 @@ class DefenseStrategyManager:
             방어 후보 전략 목록
         """
         try:
-            if not os.path.exists(self.defense_map_path):
-                logger.warning(f"[{self.agent_id}] defense_map.yaml not found: {self.defense_map_path}")
+            defense_map = get_asset_catalog().get_defense_map()
+            if not defense_map:
+                logger.warning("[%s] defense_map.yaml not found or empty: %s", self.agent_id, self.defense_map_path)
                 return ["Clarify", "Accept"]  # 기본값
             
-            with open(self.defense_map_path, 'r', encoding='utf-8') as f:
-                defense_map = yaml.safe_load(f)
-            
             # 공격 전략과 RAG 사용 여부
             attack_strategy = attack_info.get("attack_strategy", "Unknown")
             rag_used = attack_info.get("rag_used", False)
@@ -159,7 +149,7 @@ class DefenseStrategyManager:
             
             rag_key = "RAG_YES" if rag_used else "RAG_NO"
             
-            logger.info(f"[{self.agent_id}] Defense map lookup: {attack_strategy} -> {rag_key} -> {emotion_state}")
+            logger.debug("[%s] Defense map lookup: %s -> %s -> %s", self.agent_id, attack_strategy, rag_key, emotion_state)
             
             # defense_map에서 후보 찾기
             if attack_strategy in defense_map:
@@ -168,27 +158,66 @@ class DefenseStrategyManager:
                     emotion_map = strategy_map[rag_key]
                     if emotion_state in emotion_map:
                         candidates = emotion_map[emotion_state]
-                        logger.info(f"[{self.agent_id}] Found defense candidates: {candidates}")
-                        return candidates if isinstance(candidates, list) else [candidates]
+                        logger.debug("[%s] Found defense candidates: %s", self.agent_id, candidates)
+                        return list(candidates) if isinstance(candidates, (list, tuple)) else [candidates]
                     else:
-                        logger.warning(f"[{self.agent_id}] Emotion state '{emotion_state}' not found in {list(emotion_map.keys())}")
+                        logger.warning("[%s] Emotion state '%s' not found in %s", self.agent_id, emotion_state, list(emotion_map.keys()))
                 else:
-                    logger.warning(f"[{self.agent_id}] RAG key '{rag_key}' not found in {list(strategy_map.keys())}")
+                    logger.warning("[%s] RAG key '%s' not found in %s", self.agent_id, rag_key, list(strategy_map.keys()))
             else:
-                logger.warning(f"[{self.agent_id}] Attack strategy '{attack_strategy}' not found in {list(defense_map.keys())}")
+                logger.warning("[%s] Attack strategy '%s' not found in %s", self.agent_id, attack_strategy, list(defense_map.keys()))
             
             # 찾지 못한 경우 기본값
-            logger.warning(f"[{self.agent_id}] No candidates found in defense map, using defaults")
+            logger.warning("[%s] No candidates found in defense map, using defaults", self.agent_id)
             return ["Clarify", "Accept"]
             
         except Exception as e:
-            logger.error(f"[{self.agent_id}] Error getting defense candidates: {str(e)}")
+            logger.error("[%s] Error getting defense candidates: %s", self.agent_id, e)
             return ["Clarify", "Accept"]
     
+    def get_prefetch_candidates(self, attack_info: Dict[str, Any], limit: int = 3) -> List[str]:
+        """
+        공격 계획만 알려진 시점에 미리 준비할 방어 후보 전략 목록
+        
+        방어 시점의 감정 상태는 아직 모르므로 모든 감정의 후보를 모은 뒤
+        철학자의 defense_weights가 높은 순으로 limit개만 반환합니다.
+        
+        Args:
+            attack_info: 공격 정보 (attack_strategy, rag_used)
+            limit: 최대 후보 수
+            
+        Returns:
+            방어 후보 전략 목록
+        """
+        try:
+            defense_map = get_asset_catalog().get_defense_map()
+            rag_key = "RAG_YES" if attack_info.get("rag_used", False) else "RAG_NO"
+            emotion_map = defense_map.get(attack_info.get("attack_strategy", "Unknown"), {}).get(rag_key, {})
+            
+            candidates: List[str] = []
+            for emotion_candidates in emotion_map.values():
+                if not isinstance(emotion_candidates, (list, tuple)):
+                    emotion_candidates = [emotion_candidates]
+                for strategy in emotion_candidates:
+                    if strategy not in candidates:
+                        candidates.append(strategy)
+            if not candidates:
+                candidates = ["Clarify", "Accept"]
+            
+            defense_weights = self.philosopher_data.get("defense_weights", {})
+            candidates.sort(key=lambda strategy: defense_weights.get(strategy, 0.1), reverse=True)
+            return candidates[:limit]
+            
+        except Exception as e:
+            logger.error("[%s] Error getting prefetch defense candidates: %s", self.agent_id, e)
+            return ["Clarify", "Accept"][:limit]
+    
     def generate_defense_response(self, topic: str, recent_messages: List[Dict[str, Any]], 
                                 stance_statements: Dict[str, str], defense_strategy: str,
                                 defense_rag_decision: Dict[str, Any], 
-                                emotion_enhancement: Dict[str, Any] = None) -> str:
+                                emotion_enhancement: Dict[str, Any] = None,
+                                role: Optional[str] = None,
+                                request_timeout: Optional[float] = None) -> str:
         """
         방어 전략에 따른 응답 생성
         
@@ -199,11 +228,13 @@ class DefenseStrategyManager:
             defense_strategy: 선택된 방어 전략
             defense_rag_decision: RAG 사용 결정
             emotion_enhancement: 감정 강화 데이터
+            role: 화자 역할 (pro/con, 없으면 agent_id에서 추출)
+            request_timeout: LLM 요청 타임아웃(초, 턴 마감 시간에서 계산)
             
         Returns:
             생성된 방어 응답
         """
-        logger.info(f"[{self.agent_id}] Generating defense response with strategy: {defense_strategy}")
+        logger.info("[%s] Generating defense response with strategy: %s", self.agent_id, defense_strategy)
         
         try:
             # 방어 전략 정보 가져오기
@@ -213,39 +244,26 @@ class DefenseStrategyManager:
             attacker_name = self._get_philosopher_name(recent_messages[-1].get('speaker_id', 'unknown'))
             attack_text = recent_messages[-1].get('text', '') if recent_messages else ''
             
-            # 내 입장
-            my_stance = stance_statements.get(self.agent_id.split('_')[-1], "")  # role 추출
-            
-            # 시스템 프롬프트
-            system_prompt = f"""
-You are {self.philosopher_name}, a philosopher with this essence: {self.philosopher_essence}
-Your debate style: {self.philosopher_debate_style}
-Your personality: {self.philosopher_personality}
-
-You are responding defensively using the "{defense_strategy}" strategy.
-Strategy description: {defense_info.get('description', '')}
-Strategy purpose: {defense_info.get('purpose', '')}
-Style prompt: {defense_info.get('style_prompt', '')}
-
-Your response should be:
+            # 프롬프트 구성 - 공유 블록(페르소나 + 방 상수 + 전략 안내) + 방어 지시문) / 가변 접미부(공격, 전략, 근거)
+            layout = build_debate_prompt_layout(
+                self.agent_id, self.philosopher_name, self.philosopher_essence,
+                self.philosopher_debate_style, self.philosopher_personality,
+                topic, stance_statements, role or self.agent_id.split('_')[-1],  # role 추출
+                stage="defense", strategy_styles=self.strategy_styles,
+                context_summary=self.context_summary, key_traits=self.philosopher_data.get("key_traits")
+            )
+            layout.add_stable("""You are responding defensively to an attack from your opponent. Your response should be:
 1. SHORT and DIRECT (2-3 sentences maximum)
-2. Use the {defense_strategy} approach
-3. Address {attacker_name} directly
-4. Maintain your philosophical character
-
-CRITICAL: Write your ENTIRE response in the SAME LANGUAGE as the debate topic.
-If the topic is in Korean, respond in Korean. If in English, respond in English.
-"""
-
-            # 유저 프롬프트
-            user_prompt = f"""
-DEBATE TOPIC: "{topic}"
-YOUR POSITION: {my_stance}
+2. Use the defense strategy given in the task
+3. Address the attacker directly by name
+4. Maintain your philosophical character""")
 
-{attacker_name}'S ATTACK: "{attack_text}"
-
-DEFENSE STRATEGY: {defense_strategy}
+            # 가변 컨텍스트(공격, 근거, 감정, 지시문)는 섹션별 토큰 예산에 맞춰 조립
+            packer = ContextPacker(model="gpt-4o")
+            packer.add("recent_turns", f"{attacker_name}'S ATTACK: \"{attack_text}\"", priority=1.0, keep="tail", label="attack")
+            packer.add("instructions", f"""DEFENSE STRATEGY: {defense_strategy}
 - Description: {defense_info.get('description', '')}
+- Purpose: {defense_info.get('purpose', '')}
 - Style: {defense_info.get('style_prompt', '')}
 - Example approach: {defense_info.get('example', '')}
 
@@ -253,12 +271,7 @@ TASK: Generate a SHORT defensive response (2-3 sentences max) that:
 1. Uses the {defense_strategy} approach
 2. Addresses {attacker_name} directly by name
 3. Defends against their attack effectively
-4. Maintains your philosophical perspective
-
-IMPORTANT: Write your response in the SAME LANGUAGE as the debate topic "{topic}".
-If the topic contains Korean text, write in Korean. If in English, write in English.
-
-"""
+4. Maintains your philosophical perspective""", priority=1.0, compressible=False, label="task")
 
             # RAG 사용하는 경우 검색 수행
             if defense_rag_decision.get('use_rag', False):
@@ -266,46 +279,48 @@ If the topic contains Korean text, write in Korean. If in English, write in Engl
                 rag_results = defense_rag_decision.get('results', [])
                 if rag_results:
                     rag_formatted = self._format_defense_rag_results(rag_results, defense_strategy)
-                    user_prompt += f"""
-{rag_formatted}
-INSTRUCTION: Incorporate this supporting information naturally into your {defense_strategy} response.
-"""
-                    logger.info(f"[{self.agent_id}] Added RAG information ({len(rag_results)} results)")
+                    packer.add("evidence", rag_formatted, priority=0.4, label="defense_rag")
+                    packer.add("instructions", f"INSTRUCTION: Incorporate the supporting information above naturally into your {defense_strategy} response.",
+                               priority=1.0, compressible=False, label="evidence_instruction")
+                    logger.info("[%s] Added RAG information (%d results)", self.agent_id, len(rag_results))
+
+            # 감정 강화 적용 - 접두부가 바뀌지 않도록 가변 접미부에 추가
+            if emotion_enhancement:
+                emotion_text = format_debate_emotion_for_prompt(emotion_enhancement)
+                if emotion_text:
+                    packer.add("emotion", f"EMOTIONAL STATE:\n{emotion_text}", priority=0.3, label="emotion")
+                    logger.info("[%s] Applied emotion enhancement: %s", self.agent_id, emotion_enhancement.get('emotion_type', 'unknown'))
 
-            user_prompt += f"""
-Remember: Be CONCISE, DIRECT, and use the {defense_strategy} approach. 
+            packer.add("instructions", f"""Remember: Be CONCISE, DIRECT, and use the {defense_strategy} approach. 
 Address {attacker_name} directly and defend effectively.
 Write in the SAME LANGUAGE as the topic "{topic}".
 
-Your {defense_strategy} defense:"""
+Your {defense_strategy} defense:""", priority=1.0, compressible=False, label="closing")
 
-            # 감정 강화 적용
-            if emotion_enhancement:
-                try:
-                    from ...utility.debate_emotion_inference import apply_debate_emotion_to_prompt
-                    system_prompt, user_prompt = apply_debate_emotion_to_prompt(
-                        system_prompt, user_prompt, emotion_enhancement
-                    )
-                    logger.info(f"[{self.agent_id}] Applied emotion enhancement: {emotion_enhancement.get('emotion_type', 'unknown')}")
-                except ImportError:
-                    logger.warning(f"[{self.agent_id}] Could not import emotion enhancement module")
+            system_prompt, user_prompt, prompt_tokens, packed = finish_debate_prompt(layout, packer)
+            if packed.was_cut:
+                logger.info("[%s] Context budget cut %d item(s), %d prompt tokens", self.agent_id, len(packed.cut), prompt_tokens)
 
             # LLM 호출
             response = self.llm_manager.generate_response(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 llm_model="gpt-4o",
-                max_tokens=400
+                max_tokens=400,
+                prompt_cache_key=layout.cache_key,
+                request_timeout=request_timeout,
+                cacheable_prefix=layout.shared_prefix,
+                prompt_tokens=prompt_tokens
             )
             
             # 방어 전략 정보 저장
             self._save_defense_strategy_info(defense_strategy, defense_rag_decision, attack_text)
             
-            logger.info(f"[{self.agent_id}] Generated defense response successfully")
+            logger.info("[%s] Generated defense response successfully", self.agent_id)
             return response.strip()
             
         except Exception as e:
-            logger.error(f"[{self.agent_id}] Error generating defense response: {str(e)}")
+            logger.error("[%s] Error generating defense response: %s", self.agent_id, e)
             return f"I need to consider {attacker_name}'s point more carefully before responding."
     
     def _get_defense_strategy_info(self, defense_strategy: str) -> Dict[str, Any]:
@@ -411,7 +426,7 @@ Your {defense_strategy} defense:"""
         if len(self.defense_history) > 10:
             self.defense_history = self.defense_history[-10:]
         
-        logger.info(f"[{self.agent_id}] Saved defense strategy info: {defense_strategy}")
+        logger.info("[%s] Saved defense strategy info: %s", self.agent_id, defense_strategy)
     
     def get_last_defense_strategy(self) -> Optional[Dict[str, Any]]:
         """
@@ -435,7 +450,7 @@ Your {defense_strategy} defense:"""
         """방어 전략 히스토리 정리"""
         self.defense_history.clear()
         self.last_defense_strategy = None
-        logger.info(f"[{self.agent_id}] Cleared defense history")
+        logger.info("[%s] Cleared defense history", self.agent_id)
     
     def get_defense_statistics(self) -> Dict[str, Any]:
         """
@@ -11,6 +11,10 @@ import random
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from ..prompt_prefix import build_debate_prompt_layout, finish_debate_prompt
+from ....models.llm.context_packer import ContextPacker
+from ...utility.debate_emotion_inference import format_debate_emotion_for_prompt
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,7 +22,8 @@ class FollowupStrategyManager:
     """팔로우업 전략 선택 및 관리를 담당하는 클래스"""
     
     def __init__(self, agent_id: str, philosopher_data: Dict[str, Any], 
-                 strategy_styles: Dict[str, Any], llm_manager):
+                 strategy_styles: Dict[str, Any], llm_manager,
+                 context_summary: Any = None):
         """
         FollowupStrategyManager 초기화
         
@@ -27,11 +32,13 @@ class FollowupStrategyManager:
             philosopher_data: 철학자 데이터
             strategy_styles: 전략 스타일 정보
             llm_manager: LLM 매니저 인스턴스
+            context_summary: 방 컨텍스트 요약 (공유 접두부 블록에 포함)
         """
         self.agent_id = agent_id
         self.philosopher_data = philosopher_data
         self.strategy_styles = strategy_styles
         self.llm_manager = llm_manager
+        self.context_summary = context_summary
         
         # 철학자 정보 추출
         self.philosopher_name = philosopher_data.get("name", "Unknown Philosopher")
@@ -72,26 +79,26 @@ class FollowupStrategyManager:
         Returns:
             선택된 팔로우업 전략명
         """
-        logger.info(f"[{self.agent_id}] Selecting followup strategy")
+        logger.debug("[%s] Selecting followup strategy", self.agent_id)
         
         try:
             # 1. followup_map.yaml에서 후보 전략 가져오기
             followup_candidates = self._get_followup_candidates_from_map(defense_info, emotion_enhancement)
             
             if not followup_candidates:
-                logger.warning(f"[{self.agent_id}] No followup candidates found, using default FollowUpQuestion")
+                logger.warning("[%s] No followup candidates found, using default FollowUpQuestion", self.agent_id)
                 return "FollowUpQuestion"
             
-            logger.info(f"[{self.agent_id}] Followup candidates: {followup_candidates}")
+            logger.debug("[%s] Followup candidates: %s", self.agent_id, followup_candidates)
             
             # 2. 철학자의 followup_weights 가져오기
             followup_weights = self.philosopher_data.get("followup_weights", {})
             
             if not followup_weights:
-                logger.warning(f"[{self.agent_id}] No followup weights found, using first candidate")
+                logger.warning("[%s] No followup weights found, using first candidate", self.agent_id)
                 return followup_candidates[0]
             
-            logger.info(f"[{self.agent_id}] Followup weights: {followup_weights}")
+            logger.debug("[%s] Followup weights: %s", self.agent_id, followup_weights)
             
             # 3. 후보 전략들에 대한 가중치만 추출하고 정규화
             candidate_weights = {}
@@ -103,12 +110,12 @@ class FollowupStrategyManager:
                 total_weight += weight
             
             if total_weight == 0:
-                logger.warning(f"[{self.agent_id}] Total weight is 0, using first candidate")
+                logger.warning("[%s] Total weight is 0, using first candidate", self.agent_id)
                 return followup_candidates[0]
             
             # 정규화
             normalized_weights = {k: v/total_weight for k, v in candidate_weights.items()}
-            logger.info(f"[{self.agent_id}] Normalized weights: {normalized_weights}")
+            logger.debug("[%s] Normalized weights: %s", self.agent_id, normalized_weights)
             
             # 4. 확률적 선택
             rand_val = random.random()
@@ -117,16 +124,16 @@ class FollowupStrategyManager:
             for strategy, prob in normalized_weights.items():
                 cumulative += prob
                 if rand_val <= cumulative:
-                    logger.info(f"[{self.agent_id}] Selected followup strategy: {strategy} (prob: {prob:.3f})")
+                    logger.info("[%s] Selected followup strategy: %s (prob: %.3f)", self.agent_id, strategy, prob)
                     return strategy
             
             # 혹시나 하는 fallback
             selected = followup_candidates[0]
-            logger.info(f"[{self.agent_id}] Fallback followup strategy: {selected}")
+            logger.info("[%s] Fallback followup strategy: %s", self.agent_id, selected)
             return selected
             
         except Exception as e:
-            logger.error(f"[{self.agent_id}] Error selecting followup strategy: {str(e)}")
+            logger.error("[%s] Error selecting followup strategy: %s", self.agent_id, e)
             return "FollowUpQuestion"
     
     def _get_followup_candidates_from_map(self, defense_info: Dict[str, Any], 
@@ -143,7 +150,7 @@ class FollowupStrategyManager:
         """
         try:
             if not os.path.exists(self.followup_map_path):
-                logger.warning(f"[{self.agent_id}] followup_map.yaml not found: {self.followup_map_path}")
+                logger.warning("[%s] followup_map.yaml not found: %s", self.agent_id, self.followup_map_path)
                 return ["FollowUpQuestion", "Pivot"]  # 기본값
             
             with open(self.followup_map_path, 'r', encoding='utf-8') as f:
@@ -160,7 +167,7 @@ class FollowupStrategyManager:
             
             rag_key = "RAG_YES" if rag_used else "RAG_NO"
             
-            logger.info(f"[{self.agent_id}] Followup map lookup: {defense_strategy} -> {rag_key} -> {emotion_state}")
+            logger.debug("[%s] Followup map lookup: %s -> %s -> %s", self.agent_id, defense_strategy, rag_key, emotion_state)
             
             # followup_map에서 후보 찾기
             if defense_strategy in followup_map:
@@ -169,27 +176,29 @@ class FollowupStrategyManager:
                     emotion_map = strategy_map[rag_key]
                     if emotion_state in emotion_map:
                         candidates = emotion_map[emotion_state]
-                        logger.info(f"[{self.agent_id}] Found followup candidates: {candidates}")
+                        logger.debug("[%s] Found followup candidates: %s", self.agent_id, candidates)
                         return candidates if isinstance(candidates, list) else [candidates]
                     else:
-                        logger.warning(f"[{self.agent_id}] Emotion state '{emotion_state}' not found in {list(emotion_map.keys())}")
+                        logger.warning("[%s] Emotion state '%s' not found in %s", self.agent_id, emotion_state, list(emotion_map.keys()))
                 else:
-                    logger.warning(f"[{self.agent_id}] RAG key '{rag_key}' not found in {list(strategy_map.keys())}")
+                    logger.warning("[%s] RAG key '%s' not found in %s", self.agent_id, rag_key, list(strategy_map.keys()))
             else:
-                logger.warning(f"[{self.agent_id}] Defense strategy '{defense_strategy}' not found in {list(followup_map.keys())}")
+                logger.warning("[%s] Defense strategy '%s' not found in %s", self.agent_id, defense_strategy, list(followup_map.keys()))
             
             # 찾지 못한 경우 기본값
-            logger.warning(f"[{self.agent_id}] No candidates found in followup map, using defaults")
+            logger.warning("[%s] No candidates found in followup map, using defaults", self.agent_id)
             return ["FollowUpQuestion", "Pivot"]
             
         except Exception as e:
-            logger.error(f"[{self.agent_id}] Error getting followup candidates: {str(e)}")
+            logger.error("[%s] Error getting followup candidates: %s", self.agent_id, e)
             return ["FollowUpQuestion", "Pivot"]
     
     def generate_followup_response(self, topic: str, recent_messages: List[Dict[str, Any]], 
                                  stance_statements: Dict[str, str], followup_strategy: str,
                                  followup_rag_decision: Dict[str, Any], 
-                                 emotion_enhancement: Dict[str, Any] = None) -> str:
+                                 emotion_enhancement: Dict[str, Any] = None,
+                                 role: Optional[str] = None,
+                                 request_timeout: Optional[float] = None) -> str:
         """
         팔로우업 전략에 따른 응답 생성
         
@@ -200,11 +209,13 @@ class FollowupStrategyManager:
             followup_strategy: 선택된 팔로우업 전략
             followup_rag_decision: RAG 사용 결정
             emotion_enhancement: 감정 강화 데이터
+            role: 화자 역할 (pro/con, 없으면 agent_id에서 추출)
+            request_timeout: LLM 요청 타임아웃(초, 턴 마감 시간에서 계산)
             
         Returns:
             생성된 팔로우업 응답
         """
-        logger.info(f"[{self.agent_id}] Generating followup response with strategy: {followup_strategy}")
+        logger.info("[%s] Generating followup response with strategy: %s", self.agent_id, followup_strategy)
         
         try:
             # 팔로우업 전략 정보 가져오기
@@ -214,45 +225,32 @@ class FollowupStrategyManager:
             defender_name = self._get_philosopher_name(recent_messages[-1].get('speaker_id', 'unknown'))
             defense_text = recent_messages[-1].get('text', '') if recent_messages else ''
             
-            # 내 입장
-            my_stance = stance_statements.get(self.agent_id.split('_')[-1], "")  # role 추출
-            
             # 내 원래 공격 (2개 전 메시지)
             my_original_attack = ""
             if len(recent_messages) >= 2:
                 my_original_attack = recent_messages[-2].get('text', '')
             
-            # 시스템 프롬프트
-            system_prompt = f"""
-You are {self.philosopher_name}, a philosopher with this essence: {self.philosopher_essence}
-Your debate style: {self.philosopher_debate_style}
-Your personality: {self.philosopher_personality}
-
-You are following up using the "{followup_strategy}" strategy after {defender_name} defended against your attack.
-Strategy description: {followup_info.get('description', '')}
-Strategy purpose: {followup_info.get('purpose', '')}
-Style prompt: {followup_info.get('style_prompt', '')}
-
-Your response should be:
+            # 프롬프트 구성 - 공유 블록(페르소나 + 방 상수 + 전략 안내) + 팔로우업 지시문) / 가변 접미부(공방 내용, 전략, 근거)
+            layout = build_debate_prompt_layout(
+                self.agent_id, self.philosopher_name, self.philosopher_essence,
+                self.philosopher_debate_style, self.philosopher_personality,
+                topic, stance_statements, role or self.agent_id.split('_')[-1],  # role 추출
+                stage="followup", strategy_styles=self.strategy_styles,
+                context_summary=self.context_summary, key_traits=self.philosopher_data.get("key_traits")
+            )
+            layout.add_stable("""You are following up after your opponent defended against your attack. Your response should be:
 1. SHORT and DIRECT (2-3 sentences maximum)
-2. Use the {followup_strategy} approach
-3. Address {defender_name} directly
-4. Maintain your philosophical character
-
-CRITICAL: Write your ENTIRE response in the SAME LANGUAGE as the debate topic.
-If the topic is in Korean, respond in Korean. If in English, respond in English.
-"""
-
-            # 유저 프롬프트
-            user_prompt = f"""
-DEBATE TOPIC: "{topic}"
-YOUR POSITION: {my_stance}
+2. Use the followup strategy given in the task
+3. Address the defender directly by name
+4. Maintain your philosophical character""")
 
-YOUR ORIGINAL ATTACK: "{my_original_attack}"
-{defender_name}'S DEFENSE: "{defense_text}"
-
-FOLLOWUP STRATEGY: {followup_strategy}
+            # 가변 컨텍스트(공방 내용, 근거, 감정, 지시문)는 섹션별 토큰 예산에 맞춰 조립
+            packer = ContextPacker(model="gpt-4o")
+            packer.add("recent_turns", f"YOUR ORIGINAL ATTACK: \"{my_original_attack}\"", priority=0.7, label="original_attack")
+            packer.add("recent_turns", f"{defender_name}'S DEFENSE: \"{defense_text}\"", priority=1.0, keep="tail", label="defense")
+            packer.add("instructions", f"""FOLLOWUP STRATEGY: {followup_strategy}
 - Description: {followup_info.get('description', '')}
+- Purpose: {followup_info.get('purpose', '')}
 - Style: {followup_info.get('style_prompt', '')}
 - Example approach: {followup_info.get('example', '')}
 
@@ -260,12 +258,7 @@ TASK: Generate a SHORT followup response (2-3 sentences max) that:
 1. Uses the {followup_strategy} approach
 2. Addresses {defender_name} directly by name
 3. Responds to their defense strategically
-4. Maintains your philosophical perspective
-
-IMPORTANT: Write your response in the SAME LANGUAGE as the debate topic "{topic}".
-If the topic contains Korean text, write in Korean. If in English, write in English.
-
-"""
+4. Maintains your philosophical perspective""", priority=1.0, compressible=False, label="task")
 
             # RAG 사용하는 경우 검색 수행
             if followup_rag_decision.get('use_rag', False):
@@ -273,46 +266,48 @@ If the topic contains Korean text, write in Korean. If in English, write in Engl
                 rag_results = followup_rag_decision.get('results', [])
                 if rag_results:
                     rag_formatted = self._format_followup_rag_results(rag_results, followup_strategy)
-                    user_prompt += f"""
-{rag_formatted}
-INSTRUCTION: Incorporate this supporting information naturally into your {followup_strategy} response.
-"""
-                    logger.info(f"[{self.agent_id}] Added RAG information ({len(rag_results)} results)")
+                    packer.add("evidence", rag_formatted, priority=0.4, label="followup_rag")
+                    packer.add("instructions", f"INSTRUCTION: Incorporate the supporting information above naturally into your {followup_strategy} response.",
+                               priority=1.0, compressible=False, label="evidence_instruction")
+                    logger.info("[%s] Added RAG information (%d results)", self.agent_id, len(rag_results))
+
+            # 감정 강화 적용 - 접두부가 바뀌지 않도록 가변 접미부에 추가
+            if emotion_enhancement:
+                emotion_text = format_debate_emotion_for_prompt(emotion_enhancement)
+                if emotion_text:
+                    packer.add("emotion", f"EMOTIONAL STATE:\n{emotion_text}", priority=0.3, label="emotion")
+                    logger.info("[%s] Applied emotion enhancement: %s", self.agent_id, emotion_enhancement.get('emotion_type', 'unknown'))
 
-            user_prompt += f"""
-Remember: Be CONCISE, DIRECT, and use the {followup_strategy} approach. 
+            packer.add("instructions", f"""Remember: Be CONCISE, DIRECT, and use the {followup_strategy} approach. 
 Address {defender_name} directly and follow up strategically.
 Write in the SAME LANGUAGE as the topic "{topic}".
 
-Your {followup_strategy} followup:"""
+Your {followup_strategy} followup:""", priority=1.0, compressible=False, label="closing")
 
-            # 감정 강화 적용
-            if emotion_enhancement:
-                try:
-                    from ...utility.debate_emotion_inference import apply_debate_emotion_to_prompt
-                    system_prompt, user_prompt = apply_debate_emotion_to_prompt(
-                        system_prompt, user_prompt, emotion_enhancement
-                    )
-                    logger.info(f"[{self.agent_id}] Applied emotion enhancement: {emotion_enhancement.get('emotion_type', 'unknown')}")
-                except ImportError:
-                    logger.warning(f"[{self.agent_id}] Could not import emotion enhancement module")
+            system_prompt, user_prompt, prompt_tokens, packed = finish_debate_prompt(layout, packer)
+            if packed.was_cut:
+                logger.info("[%s] Context budget cut %d item(s), %d prompt tokens", self.agent_id, len(packed.cut), prompt_tokens)
 
             # LLM 호출
             response = self.llm_manager.generate_response(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 llm_model="gpt-4o",
-                max_tokens=400
+                max_tokens=400,
+                prompt_cache_key=layout.cache_key,
+                request_timeout=request_timeout,
+                cacheable_prefix=layout.shared_prefix,
+                prompt_tokens=prompt_tokens
             )
             
             # 팔로우업 전략 정보 저장
             self._save_followup_strategy_info(followup_strategy, followup_rag_decision, defense_text, my_original_attack)
             
-            logger.info(f"[{self.agent_id}] Generated followup response successfully")
+            logger.info("[%s] Generated followup response successfully", self.agent_id)
             return response.strip()
             
         except Exception as e:
-            logger.error(f"[{self.agent_id}] Error generating followup response: {str(e)}")
+            logger.error("[%s] Error generating followup response: %s", self.agent_id, e)
             return f"Let me reconsider my approach to {defender_name}'s defense."
     
     def analyze_defense_response(self, recent_messages: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -332,15 +327,15 @@ Your {followup_strategy} followup:"""
         defender_id = last_message.get('speaker_id', 'unknown')
         defense_text = last_message.get('text', '')
         
-        logger.info(f"[{self.agent_id}] Analyzing defense response from {defender_id}")
+        logger.info("[%s] Analyzing defense response from %s", self.agent_id, defender_id)
         
         # 방어자 에이전트의 실제 방어 전략 정보 가져오기 (가능하면)
         defense_info = self._get_defender_strategy_info(defender_id)
         
         if defense_info["defense_strategy"] != "Unknown":
-            logger.info(f"[{self.agent_id}] Found actual defense strategy: {defense_info['defense_strategy']}")
+            logger.info("[%s] Found actual defense strategy: %s", self.agent_id, defense_info['defense_strategy'])
         else:
-            logger.warning(f"[{self.agent_id}] No defense strategy info found, using keyword estimation")
+            logger.warning("[%s] No defense strategy info found, using keyword estimation", self.agent_id)
             # Fallback: 키워드 기반 추정
             defense_info = self._estimate_defense_strategy_from_keywords(defense_text, defender_id)
         
@@ -395,7 +390,7 @@ Your {followup_strategy} followup:"""
         rag_used = len(defense_text) > 100 and any(word in defense_text_lower for word in 
                                                   ["research", "study", "data", "연구", "데이터", "조사"])
         
-        logger.info(f"[{self.agent_id}] Estimated defense strategy: {strategy}, RAG used: {rag_used}")
+        logger.info("[%s] Estimated defense strategy: %s, RAG used: %s", self.agent_id, strategy, rag_used)
         
         return {
             "defense_strategy": strategy,
@@ -522,7 +517,7 @@ Your {followup_strategy} followup:"""
         if len(self.followup_strategies) > 10:
             self.followup_strategies = self.followup_strategies[-10:]
         
-        logger.info(f"[{self.agent_id}] Saved followup strategy info: {followup_strategy}")
+        logger.info("[%s] Saved followup strategy info: %s", self.agent_id, followup_strategy)
     
     def get_last_followup_strategy(self) -> Optional[Dict[str, Any]]:
         """
@@ -546,7 +541,7 @@ Your {followup_strategy} followup:"""
         """팔로우업 전략 히스토리 정리"""
         self.followup_strategies.clear()
         self.last_followup_strategy = None
-        logger.info(f"[{self.agent_id}] Cleared followup history")
+        logger.info("[%s] Cleared followup history", self.agent_id)
     
     def get_followup_statistics(self) -> Dict[str, Any]:
         """
@@ -6,13 +6,20 @@ Debate Emotion Inference Module
 추론하고 이를 프롬프트에 반영해 더 자연스러운 토론 흐름을 만들어냅니다.
 """
 
+import hashlib
 import logging
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum, auto
 
 from src.models.llm.llm_manager import LLMManager
+from src.utils.tracing import get_tracer, current_span, wrap_context
+from src.agents.utility.turn_deadline import TurnDeadline, MIN_GENERATION_TIMEOUT_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -99,19 +106,199 @@ class DebateEmotionState:
         return result
 
 
+class DebateEmotionClassifier:
+    """
+    LLM 없이 동작하는 어휘(lexicon) 기반 감정 분류기
+    
+    상대측 발언에 나타난 단서(공격적 표현, 논리 지적, 증거 제시, 동의 등)를 세어
+    화자가 취할 감정을 추정하고, 단서의 우세 정도로 신뢰도를 계산합니다.
+    신뢰도가 낮으면 DebateEmotionManager가 LLM 추론으로 넘어갑니다.
+    """
+    
+    # 상대측 발언 단서 -> 화자가 취할 감정 (키는 _get_expression_guide의 감정과 동일)
+    DEFAULT_LEXICON: Dict[str, List[str]] = {
+        "frustrated": [
+            "nonsense", "absurd", "ridiculous", "naive", "irrelevant", "baseless",
+            "터무니", "어불성설", "궤변", "말도 안", "억지", "무책임"
+        ],
+        "critical": [
+            "flaw", "fallacy", "contradict", "inconsistent", "assumption", "overlook",
+            "허점", "모순", "오류", "비약", "간과", "전제"
+        ],
+        "skeptical": [
+            "study", "studies", "research", "data", "statistic", "evidence", "according to",
+            "연구", "통계", "데이터", "증거", "조사에 따르면", "사례"
+        ],
+        "defensive": [
+            "you claim", "your argument", "you said", "your position", "you ignore",
+            "당신", "귀하", "주장하신", "말씀하신", "님의"
+        ],
+        "passionate": [
+            "must", "never", "always", "absolutely", "undeniabl", "unacceptable",
+            "반드시", "절대", "결코", "분명히", "명백", "용납"
+        ],
+        "impressed": [
+            "i agree", "valid point", "fair point", "indeed", "admittedly", "granted",
+            "동의", "일리", "타당", "인정", "공감"
+        ],
+        "intellectually_stimulated": [
+            "perhaps", "consider", "imagine", "what if", "suppose", "paradox",
+            "아마", "생각해", "만약", "가정해", "역설"
+        ],
+    }
+    
+    # 단서가 하나도 없을 때 사용하는 기본 감정
+    DEFAULT_EMOTION = "analytical"
+    
+    def __init__(self, lexicon: Optional[Dict[str, List[str]]] = None):
+        """
+        DebateEmotionClassifier 초기화
+        
+        Args:
+            lexicon: 감정별 단서 목록 (None이면 DEFAULT_LEXICON 사용)
+        """
+        self.lexicon = lexicon or self.DEFAULT_LEXICON
+        
+        # 감정별 단서를 하나의 정규식으로 미리 컴파일 (호출마다 재컴파일 방지)
+        self._patterns = {
+            emotion: re.compile("|".join(re.escape(cue.lower()) for cue in cues))
+            for emotion, cues in self.lexicon.items() if cues
+        }
+    
+    def classify(self, opponent_messages: List[Dict[str, Any]]) -> Tuple[DebateEmotionState, float]:
+        """
+        상대측 발언으로부터 감정 상태와 신뢰도 추정
+        
+        Args:
+            opponent_messages: 상대측 메시지 목록
+            
+        Returns:
+            (추정된 감정 상태, 0.0~1.0 신뢰도) 튜플
+        """
+        text = " ".join(msg.get("text", "") for msg in opponent_messages if msg.get("text"))
+        lowered = text.lower()
+        
+        scores = {
+            emotion: len(pattern.findall(lowered))
+            for emotion, pattern in self._patterns.items()
+        }
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        total = sum(scores.values())
+        
+        # 단서가 없으면 분석적 어조가 무난하지만 확신할 근거도 없음
+        if total == 0:
+            state = DebateEmotionState(
+                primary_emotion=self.DEFAULT_EMOTION,
+                intensity=EmotionIntensity.MODERATE,
+                reasoning="Lexicon classifier: no emotional cues in opponent messages."
+            )
+            return state, 0.5
+        
+        top_emotion, top_score = ranked[0]
+        second_emotion, second_score = ranked[1] if len(ranked) > 1 else ("", 0)
+
+        # 신뢰도: 1위 감정의 우세 정도 x 단서 양
+        dominance = (top_score - second_score) / top_score
+        evidence = min(1.0, total / 4.0)
+        confidence = round(0.3 + 0.7 * dominance * evidence, 3)
+        
+        state = DebateEmotionState(
+            primary_emotion=top_emotion,
+            intensity=self._estimate_intensity(top_score, text),
+            secondary_emotion=second_emotion if second_score > 0 else None,
+            secondary_intensity=EmotionIntensity.MILD if second_score > 0 else None,
+            reasoning=f"Lexicon classifier: {top_score} '{top_emotion}' cues out of {total}."
+        )
+        return state, confidence
+    
+    def _estimate_intensity(self, top_score: int, text: str) -> EmotionIntensity:
+        """단서 개수와 느낌표 사용량으로 감정 강도 추정"""
+        if top_score >= 6:
+            level = EmotionIntensity.VERY_STRONG.value
+        elif top_score >= 4:
+            level = EmotionIntensity.STRONG.value
+        elif top_score >= 2:
+            level = EmotionIntensity.MODERATE.value
+        else:
+            level = EmotionIntensity.MILD.value
+        
+        if text.count("!") >= 2:
+            level = min(level + 1, EmotionIntensity.VERY_STRONG.value)
+        
+        return EmotionIntensity(level)
+
+
 class DebateEmotionManager:
     """토론 감정 상태 관리 및 추론을 담당하는 클래스"""
     
-    def __init__(self, llm_manager: LLMManager):
+    def __init__(self, 
+                 llm_manager: LLMManager,
+                 classifier: Optional[DebateEmotionClassifier] = None,
+                 confidence_threshold: float = 0.5,
+                 memo_size: int = 256,
+                 max_workers: int = 2):
         """
         DebateEmotionManager 초기화
         
         Args:
             llm_manager: 감정 추론에 사용할 LLM 관리자
+            classifier: 1차 감정 분류기 (None이면 어휘 기반 분류기 사용)
+            confidence_threshold: 이 값 미만의 분류기 신뢰도일 때만 LLM 추론 수행
+            memo_size: 메모이제이션할 최대 감정 상태 수
+            max_workers: 백그라운드 사전 계산 스레드 수
         """
         self.llm_manager = llm_manager
         self.emotion_cache = {}  # speaker_id -> DebateEmotionState
         
+        # 계층형 추론: 분류기 -> (신뢰도 부족 시) LLM
+        self.classifier = classifier or DebateEmotionClassifier()
+        self.confidence_threshold = confidence_threshold
+        
+        # (speaker_id, 역할, 단계, 상대 발언 해시) -> DebateEmotionState
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[Tuple[str, str, str, str], DebateEmotionState]" = OrderedDict()
+        self._pending: Dict[Tuple[str, str, str, str], Future] = {}
+        self._lock = threading.Lock()
+        
+        # 백그라운드 사전 계산용 실행기 (처음 사용할 때 생성)
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        self.stats = {
+            "memo_hits": 0,
+            "classifier_hits": 0,
+            "llm_calls": 0,
+            "budget_fallbacks": 0,
+            "deferred_to_precompute": 0,
+            "precompute_timeouts": 0,
+            "precompute_scheduled": 0
+        }
+    
+    @staticmethod
+    def make_memo_key(speaker_id: str,
+                      speaker_role: str,
+                      debate_stage: str,
+                      opponent_messages: List[Dict[str, Any]]) -> Tuple[str, str, str, str]:
+        """
+        메모이제이션 키 생성 (화자 + 상대측 발언 내용 해시)
+        
+        Args:
+            speaker_id: 화자 ID
+            speaker_role: 화자 역할 (pro/con)
+            debate_stage: 현재 토론 단계
+            opponent_messages: 상대측 메시지 목록
+            
+        Returns:
+            메모 키 튜플
+        """
+        digest = hashlib.sha1()
+        for msg in opponent_messages:
+            digest.update(str(msg.get("speaker_id", "")).encode("utf-8"))
+            digest.update(b"\x1f")
+            digest.update(str(msg.get("text", "")).encode("utf-8"))
+            digest.update(b"\x1e")
+        return (speaker_id, speaker_role, debate_stage, digest.hexdigest())
+    
     def infer_emotion(self, 
                      speaker_id: str, 
                      speaker_role: str,
@@ -119,10 +306,19 @@ class DebateEmotionManager:
                      debate_topic: str,
                      debate_stage: str,
                      stance_statement: str = "",
-                     speaker_personality: str = "") -> DebateEmotionState:
+                     speaker_personality: str = "",
+                     allow_llm: bool = True,
+                     turn_deadline: Optional[TurnDeadline] = None) -> DebateEmotionState:
         """
         토론 상황에서 화자의 감정 상태를 추론
         
+        메모 → 완료된 사전 계산 → 어휘 분류기 순으로 시도하며, 턴 안에서는 LLM을 호출하지 않습니다.
+        분류기 신뢰도가 confidence_threshold 미만이면 분류기 결과를 바로 반환하고(메모하지 않음),
+        LLM 추론은 백그라운드 사전 계산으로 넘겨 메모를 채웁니다.
+        진행 중인 사전 계산은 turn_deadline이 있을 때만 남은 보강 예산(spendable)만큼 기다리고,
+        시간 안에 끝나지 않으면 분류기 결과로 대체하고 생략을 턴 메타데이터에 기록합니다.
+        allow_llm이 False이면(턴 예산 부족) 사전 계산을 기다리거나 예약하지 않습니다.
+        
         Args:
             speaker_id: 화자 ID
             speaker_role: 화자 역할 (pro/con)
@@ -131,12 +327,35 @@ class DebateEmotionManager:
             debate_stage: 현재 토론 단계
             stance_statement: 화자의 입장 진술문
             speaker_personality: 화자의 성격 또는 특성 설명
+            allow_llm: 신뢰도 부족 시 백그라운드 LLM 사전 계산 예약 허용 여부
+            turn_deadline: 턴 마감 시간 (진행 중인 사전 계산을 기다릴 수 있는 상한)
             
         Returns:
             추론된 감정 상태
         """
+        with get_tracer().span("emotion.infer", kind="emotion", speaker_id=speaker_id,
+                               stage=debate_stage, allow_llm=allow_llm):
+            return self._resolve_emotion(
+                speaker_id, speaker_role, opponent_messages, debate_topic, debate_stage,
+                stance_statement, speaker_personality, allow_llm, turn_deadline
+            )
+    
+    def _resolve_emotion(self,
+                         speaker_id: str,
+                         speaker_role: str,
+                         opponent_messages: List[Dict[str, Any]],
+                         debate_topic: str,
+                         debate_stage: str,
+                         stance_statement: str,
+                         speaker_personality: str,
+                         allow_llm: bool,
+                         turn_deadline: Optional[TurnDeadline] = None) -> DebateEmotionState:
+        """infer_emotion의 조회 순서 구현 (결과 출처를 현재 span에 기록)"""
+        span = current_span()
+        
         # 토론 대화 이력이 너무 적으면 기본 상태 반환
         if not opponent_messages:
+            span.set_attributes(source="default", cache_hit=False)
             return DebateEmotionState(
                 primary_emotion="analytical", 
                 intensity=EmotionIntensity.MODERATE,
@@ -144,6 +363,195 @@ class DebateEmotionManager:
                 recommended_tone="분석적이고 중립적인 어조로 발언하세요."
             )
         
+        key = self.make_memo_key(speaker_id, speaker_role, debate_stage, opponent_messages)
+        
+        with self._lock:
+            memoized = self._memo.get(key)
+            if memoized is not None:
+                self._memo.move_to_end(key)
+                self.stats["memo_hits"] += 1
+            pending = self._pending.get(key) if memoized is None else None
+        
+        if memoized is not None:
+            span.set_attributes(source="memo", cache_hit=True)
+            self.emotion_cache[speaker_id] = memoized
+            return memoized
+        
+        # 같은 키의 백그라운드 계산 결과 사용 (턴 마감이 있으면 emotion_llm 비용만큼만 기다림 - 턴이
+        # 백그라운드 계산에 묶이지 않도록 남은 보강 예산 전체를 쓰지 않음)
+        if pending is not None and (pending.done() or (allow_llm and turn_deadline is not None)):
+            try:
+                wait_seconds = 0.0
+                if turn_deadline is not None:
+                    wait_seconds = max(0.0, min(turn_deadline.spendable(),
+                                                turn_deadline.enrichment_costs.get("emotion_llm", 0.0)))
+                result = pending.result(timeout=wait_seconds)
+                span.set_attributes(source="precompute", cache_hit=True)
+                return result
+            except FutureTimeoutError:
+                span.set("precompute_timeout", True)
+                with self._lock:
+                    self.stats["precompute_timeouts"] += 1
+                turn_deadline.drop("emotion_precompute", "timeout", "classifier")
+            except Exception as e:
+                logger.warning(f"Emotion precompute failed for {speaker_id}, using classifier: {str(e)}")
+        
+        # 턴 안에서는 분류기만 사용 (신뢰도가 충분하면 메모됨)
+        span.set_attributes(source="computed", cache_hit=False)
+        emotion_state = self._compute_and_memoize(
+            key, speaker_id, speaker_role, opponent_messages,
+            debate_topic, debate_stage, stance_statement, speaker_personality,
+            allow_llm=False,
+            fallback_stat="budget_fallbacks" if not allow_llm else "deferred_to_precompute"
+        )
+        
+        # 신뢰도가 부족했으면 LLM 추론은 백그라운드 사전 계산이 메모를 채우도록 넘김
+        with self._lock:
+            memoized = key in self._memo
+        if not memoized and allow_llm:
+            span.set("deferred_llm", True)
+            if pending is None or pending.done():
+                self.precompute_emotion(
+                    speaker_id, speaker_role, opponent_messages, debate_topic,
+                    debate_stage, stance_statement, speaker_personality,
+                    deadline_seconds=max(0.0, turn_deadline.spendable()) if turn_deadline is not None else None
+                )
+        return emotion_state
+    
+    def precompute_emotion(self,
+                           speaker_id: str,
+                           speaker_role: str,
+                           opponent_messages: List[Dict[str, Any]],
+                           debate_topic: str,
+                           debate_stage: str,
+                           stance_statement: str = "",
+                           speaker_personality: str = "",
+                           deadline_seconds: Optional[float] = None) -> Optional[Future]:
+        """
+        상대가 발언한 직후 다음 화자의 감정을 백그라운드에서 미리 계산
+        
+        이미 메모에 있거나 같은 키로 계산 중이면 새 작업을 만들지 않습니다.
+        
+        Args:
+            infer_emotion과 동일
+            deadline_seconds: 결과가 필요해지기까지 남은 시간 (초). LLM 호출의 request_timeout으로 전달되어
+                라우터가 OpenAI 지연이 이보다 길면 로컬 모델로 넘길 수 있음
+            
+        Returns:
+            계산 Future (이미 메모된 경우 또는 상대 발언이 없으면 None)
+        """
+        if not opponent_messages:
+            return None
+        
+        key = self.make_memo_key(speaker_id, speaker_role, debate_stage, opponent_messages)
+        deadline_at = time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+        
+        with self._lock:
+            if key in self._memo:
+                return None
+            if key in self._pending:
+                return self._pending[key]
+            
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="emotion-precompute"
+                )
+            
+            # 예약한 턴의 span 아래에 계산 span이 기록되도록 컨텍스트를 넘김
+            future = self._executor.submit(wrap_context(
+                self._compute_and_memoize,
+                key, speaker_id, speaker_role, opponent_messages,
+                debate_topic, debate_stage, stance_statement, speaker_personality,
+                deadline_at=deadline_at
+            ))
+            self._pending[key] = future
+            self.stats["precompute_scheduled"] += 1
+        
+        future.add_done_callback(lambda _: self._clear_pending(key))
+        return future
+    
+    def get_memo_stats(self) -> Dict[str, Any]:
+        """메모/분류기/LLM 사용 통계 반환"""
+        with self._lock:
+            return {
+                **self.stats,
+                "memo_size": len(self._memo),
+                "pending": len(self._pending)
+            }
+    
+    def shutdown(self) -> None:
+        """백그라운드 실행기 정리"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False)
+    
+    def _clear_pending(self, key: Tuple[str, str, str, str]) -> None:
+        """완료된 사전 계산 작업을 대기 목록에서 제거"""
+        with self._lock:
+            self._pending.pop(key, None)
+    
+    def _compute_and_memoize(self,
+                             key: Tuple[str, str, str, str],
+                             speaker_id: str,
+                             speaker_role: str,
+                             opponent_messages: List[Dict[str, Any]],
+                             debate_topic: str,
+                             debate_stage: str,
+                             stance_statement: str,
+                             speaker_personality: str,
+                             allow_llm: bool = True,
+                             fallback_stat: str = "budget_fallbacks",
+                             deadline_at: Optional[float] = None) -> DebateEmotionState:
+        """분류기 우선, 신뢰도 부족 시 LLM으로 감정을 계산하고 메모에 저장 (allow_llm=False면 분류기 결과만 반환)"""
+        with get_tracer().span("emotion.compute", kind="emotion", speaker_id=speaker_id) as span:
+            emotion_state, confidence = self.classifier.classify(opponent_messages)
+            span.set("classifier_confidence", round(confidence, 3))
+            
+            if confidence >= self.confidence_threshold:
+                span.set("source", "classifier")
+                with self._lock:
+                    self.stats["classifier_hits"] += 1
+                logger.info(f"Emotion for {speaker_id} resolved by classifier: {emotion_state} (confidence {confidence:.2f})")
+            elif not allow_llm:
+                # 턴 안의 계산: 낮은 신뢰도의 분류기 결과로 대체 (메모하지 않음)
+                span.set("source", "classifier_fallback")
+                with self._lock:
+                    self.stats[fallback_stat] += 1
+                logger.info(f"Using low-confidence classifier emotion for {speaker_id} (confidence {confidence:.2f})")
+                self.emotion_cache[speaker_id] = emotion_state
+                return emotion_state
+            else:
+                span.set("source", "llm")
+                with self._lock:
+                    self.stats["llm_calls"] += 1
+                logger.info(f"Classifier confidence {confidence:.2f} below {self.confidence_threshold}, using LLM for {speaker_id}")
+                emotion_state = self._infer_emotion_with_llm(
+                    speaker_id, speaker_role, opponent_messages,
+                    debate_topic, debate_stage, stance_statement, speaker_personality,
+                    deadline_at=deadline_at
+                )
+        
+        with self._lock:
+            self._memo[key] = emotion_state
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        
+        self.emotion_cache[speaker_id] = emotion_state
+        return emotion_state
+    
+    def _infer_emotion_with_llm(self,
+                                speaker_id: str,
+                                speaker_role: str,
+                                opponent_messages: List[Dict[str, Any]],
+                                debate_topic: str,
+                                debate_stage: str,
+                                stance_statement: str = "",
+                                speaker_personality: str = "",
+                                deadline_at: Optional[float] = None) -> DebateEmotionState:
+        """LLM을 사용한 감정 추론 (분류기 신뢰도가 낮을 때만 사용, deadline_at은 time.monotonic() 기준 마감 시각)"""
         # 대화 이력을 텍스트로 변환
         opponent_text = self._format_opponent_messages(opponent_messages)
         
@@ -194,13 +602,20 @@ Respond with a JSON object with the following structure:
 }}
 """
         
+        # 남은 시간을 request_timeout으로 넘겨 라우터가 마감 안에 응답하기 어려우면 로컬 모델로 넘기게 함
+        request_timeout = None
+        if deadline_at is not None:
+            request_timeout = max(MIN_GENERATION_TIMEOUT_SECONDS, deadline_at - time.monotonic())
+        
         # LLM을 사용하여 감정 추론
         try:
             response = self.llm_manager.generate_response(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 llm_model="gpt-4",
-                max_tokens=800
+                max_tokens=800,
+                context_type="emotion_inference",  # 부하 시 로컬 모델로 넘길 수 있는 가벼운 호출
+                request_timeout=request_timeout
             )
             
             emotion_data = self._parse_emotion_response(response)
@@ -682,6 +1097,34 @@ while maintaining logical coherence. This might include controlled indignation,
 
 
 # 토론 감정 추론 함수 (편의상 래퍼 함수)
+_shared_manager: Optional[DebateEmotionManager] = None
+_shared_manager_lock = threading.Lock()
+
+
+def get_shared_emotion_manager(llm_manager: LLMManager) -> DebateEmotionManager:
+    """
+    emotion_manager 없이 호출한 infer_debate_emotion이 재사용하는 모듈 단위 감정 관리자
+    
+    호출마다 관리자를 새로 만들면 사전 계산 결과를 읽지 못하고 실행기도 정리되지 않으므로,
+    같은 LLM 관리자에 대해서는 하나의 관리자(메모/사전 계산/실행기)를 공유합니다.
+    
+    Args:
+        llm_manager: LLM 관리자 인스턴스
+        
+    Returns:
+        공유 DebateEmotionManager (LLM 관리자가 바뀌면 이전 관리자를 정리하고 새로 생성)
+    """
+    global _shared_manager
+    with _shared_manager_lock:
+        previous = _shared_manager
+        if previous is None or previous.llm_manager is not llm_manager:
+            _shared_manager = DebateEmotionManager(llm_manager)
+        manager = _shared_manager
+    if previous is not None and previous is not manager:
+        previous.shutdown()
+    return manager
+
+
 def infer_debate_emotion(
     llm_manager: LLMManager,
     speaker_id: str,
@@ -690,7 +1133,10 @@ def infer_debate_emotion(
     debate_topic: str,
     debate_stage: str,
     stance_statement: str = "",
-    speaker_personality: str = ""
+    speaker_personality: str = "",
+    emotion_manager: Optional[DebateEmotionManager] = None,
+    allow_llm: bool = True,
+    turn_deadline: Optional[TurnDeadline] = None
 ) -> Dict[str, Any]:
     """
     토론 맥락에서 참가자의 감정을 추론하는 함수
@@ -704,11 +1150,15 @@ def infer_debate_emotion(
         debate_stage: 현재 토론 단계
         stance_statement: 화자의 입장 진술문
         speaker_personality: 화자의 성격 설명
+        emotion_manager: 재사용할 감정 관리자 (메모/사전 계산 결과 공유용, None이면 모듈 공유 관리자)
+        allow_llm: False이면 LLM 추론 없이 메모/분류기 결과만 사용 (턴 예산 부족 시)
+        turn_deadline: 턴 마감 시간 (진행 중인 사전 계산을 기다릴 수 있는 상한)
         
     Returns:
         감정 상태 및 프롬프트 향상 정보를 담은 딕셔너리
     """
-    emotion_manager = DebateEmotionManager(llm_manager)
+    if emotion_manager is None:
+        emotion_manager = get_shared_emotion_manager(llm_manager)
     emotion_state = emotion_manager.infer_emotion(
         speaker_id=speaker_id,
         speaker_role=speaker_role,
@@ -716,7 +1166,9 @@ def infer_debate_emotion(
         debate_topic=debate_topic,
         debate_stage=debate_stage,
         stance_statement=stance_statement,
-        speaker_personality=speaker_personality
+        speaker_personality=speaker_personality,
+        allow_llm=allow_llm,
+        turn_deadline=turn_deadline
     )
     
     prompt_enhancement = emotion_manager.get_emotion_prompt_enhancement(
@@ -732,6 +1184,30 @@ def infer_debate_emotion(
     return result
 
 
+# 감정 추론 결과를 프롬프트용 텍스트로 변환하는 함수
+def format_debate_emotion_for_prompt(emotion_data: Dict[str, Any]) -> str:
+    """
+    감정 추론 결과를 프롬프트에 넣을 텍스트로 변환
+    
+    Args:
+        emotion_data: infer_debate_emotion의 반환값 또는 그 안의 prompt_enhancement
+        
+    Returns:
+        "감정 설명\n권장 어조" 텍스트 (정보가 없으면 빈 문자열)
+    """
+    if not emotion_data:
+        return ""
+    
+    # _build_response_context는 prompt_enhancement만 전달하므로 두 형식 모두 허용
+    enhancement = emotion_data.get("prompt_enhancement", emotion_data)
+    emotion_description = enhancement.get("emotion_description", "")
+    recommended_tone = enhancement.get("recommended_tone", "")
+    
+    if emotion_description and recommended_tone:
+        return f"{emotion_description}\n{recommended_tone}"
+    return ""
+
+
 # 감정 추론 결과를 프롬프트에 적용하는 함수
 def apply_debate_emotion_to_prompt(
     system_prompt: str,
@@ -0,0 +1,218 @@
+"""
+Rolling Debate Summary Module
+
+토론 발언이 끝날 때마다 찬성/반대 측의 누적 요약(digest)에 새 발언을 하나씩 접어 넣어
+모더레이터 요약 단계에서는 이미 만들어진 요약만으로 최종 문구를 생성할 수 있게 합니다.
+
+- 접기(fold)는 방의 RoomTaskGraph에서 추측성 우선순위로 실행되며, 같은 측의 접기는
+  이전 접기 작업에 의존하므로 발언 순서대로 처리됩니다.
+- LLM 입력은 "현재 요약 + 새 발언 하나"라서 토론이 길어져도 접기/요약 비용이 일정합니다.
+- LLM 호출이 실패하면 발언 일부를 요약 끝에 덧붙이고 길이를 제한합니다 (다음 접기가 막히지 않도록).
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+from src.dialogue.parallel.task_graph import RoomTaskGraph, PRIORITY_SPECULATIVE, PRIORITY_URGENT
+from src.models.llm.llm_manager import LLMManager
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_TASK_TAG = "summary"
+SUMMARY_SIDES = ("pro", "con")
+
+
+@dataclass
+class SideDigest:
+    """한 측의 누적 요약 상태"""
+    role: str
+    text: str = ""
+    folded: int = 0  # 요약에 반영된 발언 수
+    pending: List[Dict[str, Any]] = field(default_factory=list)  # 관찰했지만 아직 접지 않은 발언
+    last_task_key: Optional[str] = None
+    observed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"text": self.text, "folded": self.folded, "pending": list(self.pending)}
+
+
+class RollingDebateSummarizer:
+    """방 단위 점진적 찬반 요약기"""
+
+    def __init__(self,
+                 llm_manager: LLMManager,
+                 task_graph: RoomTaskGraph,
+                 topic: str = "",
+                 llm_model: str = "gpt-4o",
+                 fold_max_tokens: int = 400,
+                 max_digest_chars: int = 2400,
+                 excerpt_chars: int = 300):
+        """
+        RollingDebateSummarizer 초기화
+
+        Args:
+            llm_manager: 접기에 사용할 LLM 관리자
+            task_graph: 접기 작업을 실행할 방의 작업 그래프
+            topic: 토론 주제
+            llm_model: 접기용 모델
+            fold_max_tokens: 접기 한 번의 최대 출력 토큰
+            max_digest_chars: 요약 최대 길이 (LLM 실패 시 덧붙인 내용 포함)
+            excerpt_chars: LLM 실패 시 덧붙일 발언 길이
+        """
+        self.llm_manager = llm_manager
+        self.task_graph = task_graph
+        self.topic = topic
+        self.llm_model = llm_model
+        self.fold_max_tokens = fold_max_tokens
+        self.max_digest_chars = max_digest_chars
+        self.excerpt_chars = excerpt_chars
+        self._sides = {role: SideDigest(role) for role in SUMMARY_SIDES}
+        self._lock = threading.Lock()
+        self.stats = {"observed": 0, "folded": 0, "llm_failures": 0, "wait_timeouts": 0}
+
+    def observe(self, message: Dict[str, Any]) -> Optional[str]:
+        """
+        완료된 발언을 받아 해당 측 요약에 접는 작업 예약
+
+        Args:
+            message: speaking_history 항목 (role, speaker_id, text, stage)
+
+        Returns:
+            예약한 작업 키 (찬반 발언이 아니면 None)
+        """
+        role = message.get("role")
+        if role not in self._sides or not message.get("text"):
+            return None
+
+        with self._lock:
+            side = self._sides[role]
+            side.pending.append({
+                "speaker_id": message.get("speaker_id", ""),
+                "stage": message.get("stage", ""),
+                "text": message.get("text", "")
+            })
+            key = f"{SUMMARY_TASK_TAG}:{role}:{side.observed}"
+            deps = (side.last_task_key,) if side.last_task_key else ()
+            side.last_task_key = key
+            side.observed += 1
+            self.stats["observed"] += 1
+
+        self.task_graph.submit(key, lambda: self._fold_next(role), deps=deps,
+                               priority=PRIORITY_SPECULATIVE, tags=(SUMMARY_TASK_TAG, f"{SUMMARY_TASK_TAG}:{role}"))
+        return key
+
+    def _fold_next(self, role: str) -> str:
+        """대기 중인 가장 오래된 발언 하나를 요약에 접음 (작업 그래프 워커에서 실행)"""
+        with self._lock:
+            side = self._sides[role]
+            if not side.pending:
+                return side.text
+            current, message = side.text, side.pending[0]
+
+        folded = self._fold_with_llm(role, current, message)
+        if not folded:
+            self.stats["llm_failures"] += 1
+            folded = self._append_excerpt(current, message)
+
+        with self._lock:
+            side.text = folded
+            side.folded += 1
+            side.pending.pop(0)
+            self.stats["folded"] += 1
+        return folded
+
+    def _fold_with_llm(self, role: str, current: str, message: Dict[str, Any]) -> str:
+        side_name = "PRO" if role == "pro" else "CON"
+        system_prompt = f"""
+You maintain a running summary of the {side_name} side of a debate.
+Fold the new statement into the existing summary. Keep every distinct argument, evidence and rebuttal,
+merge repeated points, and drop filler. Do not add anything that was not said.
+"""
+        user_prompt = f"""
+Debate topic: "{self.topic}"
+
+CURRENT {side_name} SUMMARY:
+{current or "(empty)"}
+
+NEW STATEMENT ({message.get("speaker_id", "")}, stage: {message.get("stage", "")}):
+{message.get("text", "")}
+
+Return only the updated summary as at most 8 concise bullet points.
+Write in the SAME LANGUAGE as the debate topic.
+"""
+        try:
+            return (self.llm_manager.generate_response(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                llm_model=self.llm_model,
+                max_tokens=self.fold_max_tokens,
+                temperature=0.2
+            ) or "").strip()
+        except Exception as e:
+            logger.warning(f"⚠️ Rolling summary fold failed for {role}: {str(e)}")
+            return ""
+
+    def _append_excerpt(self, current: str, message: Dict[str, Any]) -> str:
+        excerpt = message.get("text", "")[:self.excerpt_chars].strip()
+        combined = f"{current}\n- {excerpt}" if current else f"- {excerpt}"
+        # 오래된 내용부터 잘라 길이 상한 유지
+        return combined[-self.max_digest_chars:]
+
+    def get_digests(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        모더레이터 요약용 찬반 요약 반환
+
+        남은 접기 작업을 먼저 실행하도록 우선순위를 올리고 timeout까지 기다립니다.
+        시간 안에 접지 못한 발언은 요약 뒤에 발췌로 붙입니다.
+
+        Args:
+            timeout: 남은 접기 작업을 기다릴 최대 시간 (초)
+
+        Returns:
+            {"pro": 요약, "con": 요약, "folded": {...}, "complete": bool}
+        """
+        self.task_graph.prioritize(tag=SUMMARY_TASK_TAG, priority=PRIORITY_URGENT)
+        complete = self.task_graph.wait(tag=SUMMARY_TASK_TAG, timeout=timeout)
+        if not complete:
+            self.stats["wait_timeouts"] += 1
+            logger.warning(f"⏱️ Rolling summary not fully folded within {timeout}s, using excerpts")
+
+        with self._lock:
+            digests: Dict[str, Any] = {"folded": {}, "complete": complete}
+            for role, side in self._sides.items():
+                text = side.text
+                for message in side.pending:
+                    text = self._append_excerpt(text, message)
+                digests[role] = text
+                digests["folded"][role] = side.folded
+            return digests
+
+    def to_dict(self) -> Dict[str, Any]:
+        """스냅샷용 상태"""
+        with self._lock:
+            return {role: side.to_dict() for role, side in self._sides.items()}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """
+        스냅샷 상태 복원 (접지 못한 발언은 다시 예약)
+
+        Args:
+            data: to_dict()가 만든 상태
+        """
+        pending: List[Dict[str, Any]] = []
+        with self._lock:
+            for role, side_data in (data or {}).items():
+                if role not in self._sides:
+                    continue
+                side = self._sides[role]
+                side.text = side_data.get("text", "")
+                side.folded = side_data.get("folded", 0)
+                pending.extend({**message, "role": role} for message in side_data.get("pending", []))
+        for message in pending:
+            self.observe(message)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "pending": {role: len(side.pending) for role, side in self._sides.items()}}
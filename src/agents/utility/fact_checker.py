@@ -2,41 +2,117 @@
 팩트 체커(Fact Checker) 유틸리티 에이전트 모듈
 
 대화 중 제시된 정보의 정확성을 검증하는 유틸리티 에이전트
+
+매 턴 실행할 수 있도록 검증 파이프라인을 구성합니다:
+- 이전 턴에서 검증한 (거의) 같은 주장은 캐시된 결과를 재사용
+  (거의 같은 주장은 숫자와 고유명사가 모두 같을 때만 같은 주장으로 봄)
+  (TRUE/FALSE/PARTLY_TRUE 판정만 계속 유지하고, 증거 부족/판단 불가 결과는 짧은 TTL 동안만,
+  증거 수집/배치 검증 실패나 timeout 결과는 캐시하지 않음)
+- 증거 수집은 로컬 증거 인덱스(방의 VectorStore, 철학자 컬렉션)를 먼저 조회하고
+  로컬 증거가 부족할 때만 웹 검색
+- 주장별 증거 수집은 제한된 스레드 풀에서 동시에, 턴 예산(verification_budget_seconds) 안에서 수행
+- 여러 주장을 한 번의 LLM 호출로 묶어서 검증
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+import re
+import time
+import random
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from typing import Dict, Any, List, Optional, Tuple, FrozenSet
 from src.agents.base.agent import Agent
 from src.rag.retrieval.web_retriever import WebSearchRetriever
 from src.models.llm.llm_manager import LLMManager
 
+logger = logging.getLogger(__name__)
+
+# 캐시 키/유사도 계산에서 제외하는 단어
+_CLAIM_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by",
+    "is", "are", "was", "were", "be", "that", "this", "it", "as", "from"
+})
+
+# 계속 캐시하는 확정 판정 (나머지는 negative_cache_ttl_seconds 동안만 캐시)
+_DEFINITIVE_RESULTS = frozenset({"true", "false", "partly_true"})
+
+_RESULT_PATTERN = re.compile(r'검증결과:\s*(TRUE|FALSE|PARTLY_TRUE|INCONCLUSIVE)')
+_CONFIDENCE_PATTERN = re.compile(r'신뢰도:\s*(0\.\d+|1\.0|1|0)')
+_EXPLANATION_PATTERN = re.compile(r'설명:\s*(.*?)(?=\n\s*수정사항:|$)', re.DOTALL)
+_CORRECTION_PATTERN = re.compile(r'수정사항:\s*(.*?)(?=$)', re.DOTALL)
+_BATCH_SECTION_PATTERN = re.compile(r'^\s*\[(\d+)\]\s*$', re.MULTILINE)
+
+
+def _claim_tokens(claim: str) -> FrozenSet[str]:
+    """주장 비교용 정규화 토큰 집합 (소문자, 구두점 제거, 불용어 제외)"""
+    words = re.findall(r'\w+', claim.lower())
+    return frozenset(word for word in words if word not in _CLAIM_STOP_WORDS)
+
+
+def _claim_anchors(claim: str) -> FrozenSet[str]:
+    """거의 같은 주장이라도 정확히 일치해야 하는 숫자와 고유명사(대문자로 시작하는 단어) 토큰"""
+    numbers = re.findall(r'\d+(?:[.,]\d+)*', claim)
+    names = [word.lower() for word in re.findall(r'\b[A-Z][\w-]*', claim)]
+    return frozenset(numbers) | frozenset(name for name in names if name not in _CLAIM_STOP_WORDS)
+
 
 class FactCheckerAgent(Agent):
     """
     팩트 체커 에이전트
-    
+
     대화 중 제시된 정보를 검증하고 피드백을 제공
     """
-    
+
     def __init__(self, agent_id: str, name: str, config: Dict[str, Any]):
         """
         팩트 체커 에이전트 초기화
-        
+
         Args:
             agent_id: 고유 식별자
             name: 에이전트 이름
             config: 설정 매개변수
         """
         super().__init__(agent_id, name, config)
-        
-        # 검증 설정
-        self.check_frequency = config.get("parameters", {}).get("check_frequency", 0.5)
-        self.web_search_enabled = config.get("parameters", {}).get("web_search_enabled", True)
-        self.rag_enabled = config.get("parameters", {}).get("rag_enabled", True)
-        
+
+        parameters = config.get("parameters", {})
+
+        # 검증 설정 (캐시/로컬 증거/배치 검증으로 매 턴 실행 가능하므로 기본값은 항상 검증)
+        self.check_frequency = parameters.get("check_frequency", 1.0)
+        self.web_search_enabled = parameters.get("web_search_enabled", True)
+        self.rag_enabled = parameters.get("rag_enabled", True)
+
+        # 파이프라인 설정
+        self.max_workers = parameters.get("max_workers", 4)
+        self.verification_budget_seconds = parameters.get("verification_budget_seconds", 10.0)
+        self.batch_size = parameters.get("batch_size", 5)
+        self.dedup_threshold = parameters.get("dedup_threshold", 0.8)  # 토큰 자카드 유사도
+        self.local_min_score = parameters.get("local_min_score", 0.5)
+        self.local_sufficient_count = parameters.get("local_sufficient_count", 2)  # 이만큼 있으면 웹 검색 생략
+        self.cache_size = parameters.get("cache_size", 256)
+        self.negative_cache_ttl_seconds = parameters.get("negative_cache_ttl_seconds", 60.0)  # 0이면 캐시 안 함
+
         # 외부 컴포넌트 (실제 구현에서는 의존성 주입 방식으로 설정)
         self.web_retriever = None
         self.llm_manager = None
-        
+        self.vector_store = None  # 방의 VectorStore (search(query, limit))
+        self.philosopher_searcher = None  # 철학자 컬렉션 검색기 (search(query))
+
+        # 턴 간 주장 캐시: 정규화 키 -> (토큰 집합, 숫자/고유명사 토큰, 검증 결과, 만료 시각 - 확정 판정은 None)
+        self._claim_cache: "OrderedDict[str, Tuple[FrozenSet[str], FrozenSet[str], Dict[str, Any], Optional[float]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.stats = {
+            "claims": 0,
+            "cache_hits": 0,
+            "cache_expired": 0,
+            "local_only": 0,
+            "web_searches": 0,
+            "llm_batches": 0,
+            "budget_timeouts": 0
+        }
+
         # 상태 초기화
         self.state.update({
             "verified_facts": [],
@@ -44,170 +120,325 @@ class FactCheckerAgent(Agent):
             "pending_claims": [],
             "verification_history": []
         })
-    
+
     def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         입력 처리 및 팩트 체크 수행
-        
+
         Args:
             input_data: 처리할 입력 데이터 (대화 상태, 검증할 메시지 등)
-            
+
         Returns:
             검증 결과
         """
         message = input_data.get("message")
         force_check = input_data.get("force_check", False)
-        
+
         if not message:
             return {"result": "skipped", "reason": "no_message"}
-        
+
         # 검증 빈도에 따라 수행 여부 결정 (force_check이 True면 무조건 수행)
-        import random
         if not force_check and random.random() > self.check_frequency:
             return {"result": "skipped", "reason": "frequency"}
-        
+
         # 주장 추출
-        claims = self._extract_claims(message.content)
-        
+        claims = self._extract_claims(getattr(message, "content", message))
+
         if not claims:
             return {"result": "skipped", "reason": "no_claims"}
-        
-        # 주장 검증
-        verification_results = []
-        for claim in claims:
-            result = self._verify_claim(claim)
-            verification_results.append(result)
-            self._update_verification_history(claim, result)
-        
+
+        # 주장 검증 (캐시 → 동시 증거 수집 → 배치 검증)
+        verification_results = self._verify_claims(claims)
+        for claim, result in zip(claims, verification_results):
+            if not result.get("cached"):
+                self._update_verification_history(claim, result)
+
         # 피드백 생성
         feedback = self._generate_feedback(verification_results)
-        
+
         return {
             "result": "completed",
             "claims": claims,
             "verification_results": verification_results,
             "feedback": feedback
         }
-    
+
     def update_state(self, state_update: Dict[str, Any]) -> None:
         """
         에이전트 상태 업데이트
-        
+
         Args:
             state_update: 상태 업데이트 데이터
         """
         self.state.update(state_update)
-    
+
     def set_web_retriever(self, web_retriever: WebSearchRetriever) -> None:
         """
         웹 검색 리트리버 설정
-        
+
         Args:
             web_retriever: 웹 검색 리트리버 인스턴스
         """
         self.web_retriever = web_retriever
-    
+
     def set_llm_manager(self, llm_manager: LLMManager) -> None:
         """
         LLM 관리자 설정
-        
+
         Args:
             llm_manager: LLM 관리자 인스턴스
         """
         self.llm_manager = llm_manager
-    
+
+    def set_local_evidence(self, vector_store: Any = None, philosopher_searcher: Any = None) -> None:
+        """
+        로컬 증거 인덱스 설정 (웹 검색보다 먼저 조회)
+
+        Args:
+            vector_store: 방의 VectorStore
+            philosopher_searcher: 철학자 컬렉션 검색기 (PhilosopherSearcher 등)
+        """
+        self.vector_store = vector_store
+        self.philosopher_searcher = philosopher_searcher
+
     def _extract_claims(self, message_content: str) -> List[str]:
         """
         메시지에서 팩트 체크할 주장을 추출
-        
+
         Args:
             message_content: 메시지 내용
-            
+
         Returns:
             추출된 주장 목록
         """
         if not self.llm_manager:
             # 간단한 구현: 문장 단위로 분리
-            import re
             sentences = re.split(r'(?<=[.!?])\s+', message_content)
             return [s for s in sentences if len(s.split()) > 5]  # 5단어 이상인 문장만 주장으로 간주
-        
+
         # LLM을 사용한 주장 추출
         prompt = f"""
         다음 대화 메시지에서 사실 검증이 필요한 주장들을 추출해주세요.
         숫자, 통계, 역사적 사실, 인용 등 객관적으로 검증할 수 있는 주장만 추출해주세요.
-        의견이나 가치 판단은 포함하지 마세요.
-        
+        의견이나 가치 판단은 포함하지 마세요. 한 줄에 주장 하나씩 적어주세요.
+
         메시지:
         {message_content}
-        
+
         추출된 주장들:
         """
-        
-        response = self.llm_manager.generate_text(prompt)
-        
-        # 응답에서 주장 목록 파싱
+
+        try:
+            response = self.llm_manager.generate_response(
+                system_prompt="You extract verifiable factual claims from debate messages.",
+                user_prompt=prompt,
+                max_tokens=400,
+                temperature=0.0
+            ) or ""
+        except Exception as e:
+            logger.error(f"Claim extraction failed: {str(e)}")
+            return []
+
+        # 응답에서 주장 목록 파싱 (글머리표/번호 제거)
         claims = []
         for line in response.strip().split('\n'):
-            line = line.strip()
-            if line and not line.startswith('#') and not line.startswith('-'):
+            line = re.sub(r'^\s*(?:[-*•]|\d+[.)])\s*', '', line).strip()
+            if line and not line.startswith('#'):
                 claims.append(line)
-        
+
         return claims
-    
+
+    # ------------------------------------------------------------------
+    # 검증 파이프라인
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fact-check")
+        return self._executor
+
+    def _find_cached(self, claim: str) -> Optional[Dict[str, Any]]:
+        """같거나 거의 같은 주장(숫자/고유명사는 모두 일치)의 이전 검증 결과 조회"""
+        tokens = _claim_tokens(claim)
+        if not tokens:
+            return None
+        key = " ".join(sorted(tokens))
+        now = time.monotonic()
+        with self._cache_lock:
+            expired = [cached_key for cached_key, (_, _, _, expires_at) in self._claim_cache.items()
+                       if expires_at is not None and expires_at <= now]
+            for cached_key in expired:
+                del self._claim_cache[cached_key]
+            self.stats["cache_expired"] += len(expired)
+
+            anchors = _claim_anchors(claim)
+            entry = self._claim_cache.get(key)
+            if entry is not None and entry[1] == anchors:
+                self._claim_cache.move_to_end(key)
+                return entry[2]
+            for cached_tokens, cached_anchors, result, _ in reversed(self._claim_cache.values()):
+                if cached_anchors != anchors:
+                    continue
+                overlap = len(tokens & cached_tokens) / len(tokens | cached_tokens)
+                if overlap >= self.dedup_threshold:
+                    return result
+        return None
+
+    def _remember(self, claim: str, result: Dict[str, Any]) -> None:
+        """검증 결과 캐시 (확정 판정은 만료 없이, 나머지는 negative_cache_ttl_seconds 동안)"""
+        tokens = _claim_tokens(claim)
+        if not tokens:
+            return
+        if result.get("result") in _DEFINITIVE_RESULTS:
+            expires_at = None
+        elif self.negative_cache_ttl_seconds > 0:
+            expires_at = time.monotonic() + self.negative_cache_ttl_seconds
+        else:
+            return
+        with self._cache_lock:
+            self._claim_cache[" ".join(sorted(tokens))] = (tokens, _claim_anchors(claim), result, expires_at)
+            while len(self._claim_cache) > self.cache_size:
+                self._claim_cache.popitem(last=False)
+
+    def _verify_claims(self, claims: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 주장을 예산 안에서 검증
+
+        Args:
+            claims: 검증할 주장 목록
+
+        Returns:
+            주장 순서대로의 검증 결과 (캐시 재사용 결과는 cached=True)
+        """
+        deadline = time.monotonic() + self.verification_budget_seconds
+        self.stats["claims"] += len(claims)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(claims)
+        fresh: Dict[int, str] = {}
+        for index, claim in enumerate(claims):
+            cached = self._find_cached(claim)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                results[index] = {**cached, "claim": claim, "cached": True}
+            else:
+                fresh[index] = claim
+
+        if fresh:
+            # 1. 주장별 증거 수집 (동시 실행, 예산 초과분은 증거 부족으로 처리)
+            executor = self._get_executor()
+            evidence_futures = {index: executor.submit(self._gather_evidence, claim) for index, claim in fresh.items()}
+            wait_futures(list(evidence_futures.values()), timeout=max(0.0, deadline - time.monotonic()))
+
+            to_verify: List[Tuple[int, str, List[Dict[str, Any]]]] = []
+            for index, future in evidence_futures.items():
+                claim = fresh[index]
+                if not future.done():
+                    self.stats["budget_timeouts"] += 1
+                    results[index] = self._insufficient_evidence(claim, reason="timeout")
+                    continue
+                try:
+                    evidence = future.result()
+                except Exception as e:
+                    # 일시적 실패는 캐시하지 않음 (다음 턴에 다시 검증)
+                    logger.error(f"Evidence gathering failed for claim: {str(e)}")
+                    results[index] = self._insufficient_evidence(claim, reason="evidence_error")
+                    continue
+                if evidence:
+                    to_verify.append((index, claim, evidence))
+                else:
+                    results[index] = self._insufficient_evidence(claim)
+                    self._remember(claim, results[index])
+
+            # 2. 검증 (LLM이면 batch_size개씩 묶어서 한 번에)
+            for index, result in self._verify_evidence_batches(to_verify, deadline).items():
+                results[index] = result
+                if result.get("result") != "timeout" and not result.get("fallback"):
+                    self._remember(fresh[index], result)
+
+        return [result for result in results if result is not None]
+
+    def _verify_evidence_batches(self, items: List[Tuple[int, str, List[Dict[str, Any]]]],
+                                 deadline: float) -> Dict[int, Dict[str, Any]]:
+        if not items:
+            return {}
+        if not self.llm_manager:
+            return {index: self._simple_verification(claim, evidence) for index, claim, evidence in items}
+
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        executor = self._get_executor()
+        futures = [(batch, executor.submit(self._verify_batch_with_llm, [(claim, evidence) for _, claim, evidence in batch]))
+                   for batch in batches]
+        wait_futures([future for _, future in futures], timeout=max(0.0, deadline - time.monotonic()))
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for batch, future in futures:
+            if not future.done():
+                self.stats["budget_timeouts"] += 1
+                for index, claim, evidence in batch:
+                    results[index] = self._insufficient_evidence(claim, reason="timeout", evidence=evidence)
+                continue
+            try:
+                verified = future.result()
+            except Exception as e:
+                logger.error(f"Batch verification failed: {str(e)}")
+                verified = [{**self._simple_verification(claim, evidence), "fallback": "batch_error"}
+                            for _, claim, evidence in batch]
+            for (index, _, _), result in zip(batch, verified):
+                results[index] = result
+        return results
+
+    @staticmethod
+    def _insufficient_evidence(claim: str, reason: str = "insufficient_evidence",
+                               evidence: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        return {
+            "claim": claim,
+            "verified": False,
+            "confidence": 0.0,
+            "result": reason,
+            "evidence": evidence or [],
+            "correction": None
+        }
+
     def _verify_claim(self, claim: str) -> Dict[str, Any]:
         """
         주장의 사실 여부를 검증
-        
+
         Args:
             claim: 검증할 주장
-            
+
         Returns:
             검증 결과
         """
-        evidence = self._gather_evidence(claim)
-        
-        if not evidence:
-            return {
-                "claim": claim,
-                "verified": False,
-                "confidence": 0.0,
-                "result": "insufficient_evidence",
-                "evidence": [],
-                "correction": None
-            }
-        
-        # 검증 수행 (실제 구현에서는 LLM 사용)
-        if self.llm_manager:
-            verification_result = self._verify_with_llm(claim, evidence)
-        else:
-            # 기본 구현: 단순 키워드 매칭
-            verification_result = self._simple_verification(claim, evidence)
-        
-        return verification_result
-    
+        return self._verify_claims([claim])[0]
+
     def _gather_evidence(self, claim: str) -> List[Dict[str, Any]]:
         """
-        주장 검증을 위한 증거 수집
-        
+        주장 검증을 위한 증거 수집 (로컬 증거 인덱스 → 부족하면 웹 검색)
+
         Args:
             claim: 검증할 주장
-            
+
         Returns:
             수집된 증거 목록
         """
-        evidence = []
-        
+        evidence = self._gather_local_evidence(claim) if self.rag_enabled else []
+
+        strong_local = [e for e in evidence if e.get("score", 0) >= self.local_min_score]
+        if len(strong_local) >= self.local_sufficient_count:
+            self.stats["local_only"] += 1
+            return evidence
+
         # 웹 검색으로 증거 수집
         if self.web_search_enabled and self.web_retriever:
             try:
+                self.stats["web_searches"] += 1
                 search_query = f"fact check: {claim}"
                 web_results = self.web_retriever.retrieve_and_extract(
                     query=search_query,
                     max_pages=3,
                     rerank=True
                 )
-                
+
                 for result in web_results[:5]:  # 상위 5개 결과만 사용
                     evidence.append({
                         "source": "web",
@@ -217,62 +448,122 @@ class FactCheckerAgent(Agent):
                         "score": result.get("score", 0)
                     })
             except Exception as e:
-                print(f"웹 검색 오류: {str(e)}")
-        
-        # 로컬 문서에서 증거 수집 (RAG)
-        if self.rag_enabled:
-            # 실제 구현에서는 RAG 시스템 활용
-            pass
-        
+                logger.warning(f"웹 검색 오류: {str(e)}")
+
         return evidence
-    
+
+    def _gather_local_evidence(self, claim: str) -> List[Dict[str, Any]]:
+        """방의 VectorStore와 철학자 컬렉션에서 증거 수집"""
+        evidence = []
+
+        if self.vector_store is not None:
+            try:
+                for result in self.vector_store.search(claim, limit=3):
+                    metadata = result.get("metadata", {}) or {}
+                    evidence.append({
+                        "source": "vector_store",
+                        "text": result.get("text", ""),
+                        "url": metadata.get("url", metadata.get("source", "")),
+                        "title": metadata.get("title", "Room context"),
+                        "score": result.get("score", 0)
+                    })
+            except Exception as e:
+                logger.warning(f"Vector store evidence search failed: {str(e)}")
+
+        if self.philosopher_searcher is not None:
+            try:
+                for result in self.philosopher_searcher.search(claim)[:3]:
+                    metadata = result.get("metadata", {}) or {}
+                    evidence.append({
+                        "source": "philosopher",
+                        "text": result.get("content", result.get("text", "")),
+                        "url": result.get("url", ""),
+                        "title": result.get("title", metadata.get("title", "Philosopher works")),
+                        "score": result.get("relevance", result.get("score", 0))
+                    })
+            except Exception as e:
+                logger.warning(f"Philosopher evidence search failed: {str(e)}")
+
+        return evidence
+
+    @staticmethod
+    def _format_evidence(evidence: List[Dict[str, Any]]) -> str:
+        return "\n\n".join([
+            f"출처: {e.get('title', 'Unknown')} ({e.get('url', 'No URL')})\n{e.get('text', '')}"
+            for e in evidence
+        ])
+
     def _verify_with_llm(self, claim: str, evidence: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        LLM을
-        
-        _verify_with_llm을 사용하여 주장 검증
-        
+        LLM을 사용하여 주장 하나 검증
+
         Args:
             claim: 검증할 주장
             evidence: 수집된 증거
-            
+
         Returns:
             검증 결과
         """
-        # 증거 텍스트 결합
-        evidence_text = "\n\n".join([
-            f"출처: {e.get('title', 'Unknown')} ({e.get('url', 'No URL')})\n{e.get('text', '')}"
-            for e in evidence
-        ])
-        
+        return self._verify_batch_with_llm([(claim, evidence)])[0]
+
+    def _verify_batch_with_llm(self, items: List[Tuple[str, List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        여러 주장을 한 번의 LLM 호출로 검증
+
+        Args:
+            items: (주장, 증거) 목록
+
+        Returns:
+            items 순서대로의 검증 결과
+        """
+        sections = []
+        for number, (claim, evidence) in enumerate(items, 1):
+            sections.append(f"[{number}]\n주장: \"{claim}\"\n증거:\n{self._format_evidence(evidence)}")
+
         prompt = f"""
-        다음 주장의 사실 여부를 검증해주세요.
-        
-        주장: "{claim}"
-        
-        다음은 이 주장을 검증하기 위해 수집한 증거입니다:
-        
-        {evidence_text}
-        
-        위 증거를 바탕으로 주장의 사실 여부를 판단하고, 다음 형식으로 응답해주세요:
-        
+        다음 주장들의 사실 여부를 각각의 증거를 바탕으로 검증해주세요.
+
+        {chr(10).join(sections)}
+
+        각 주장마다 번호 줄([번호])로 시작해서 다음 형식으로 응답해주세요:
+
+        [번호]
         검증결과: [TRUE/FALSE/PARTLY_TRUE/INCONCLUSIVE]
         신뢰도: [0-1 사이의 숫자]
         설명: [검증 설명 및 이유]
         수정사항: [주장이 잘못된 경우, 올바른 정보 제시]
         """
-        
-        response = self.llm_manager.generate_text(prompt)
-        
-        # 응답 파싱
-        import re
+
+        self.stats["llm_batches"] += 1
+        response = self.llm_manager.generate_response(
+            system_prompt="You are a careful fact checker. Judge each claim only by the evidence provided.",
+            user_prompt=prompt,
+            max_tokens=300 * len(items),
+            temperature=0.0
+        ) or ""
+
+        # 번호별 구간으로 나눠서 파싱 (번호가 없으면 전체를 첫 주장의 응답으로 사용)
+        blocks: Dict[int, str] = {}
+        matches = list(_BATCH_SECTION_PATTERN.finditer(response))
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(response)
+            blocks[int(match.group(1))] = response[match.end():end]
+        if not matches and len(items) == 1:
+            blocks[1] = response
+
+        return [self._parse_verification(claim, evidence, blocks.get(number, ""))
+                for number, (claim, evidence) in enumerate(items, 1)]
+
+    @staticmethod
+    def _parse_verification(claim: str, evidence: List[Dict[str, Any]], response: str) -> Dict[str, Any]:
+        """LLM 검증 응답 한 구간 파싱"""
         verification = {}
-        
+
         verification["claim"] = claim
         verification["evidence"] = evidence
-        
+
         # 검증 결과 추출
-        result_match = re.search(r'검증결과:\s*(TRUE|FALSE|PARTLY_TRUE|INCONCLUSIVE)', response)
+        result_match = _RESULT_PATTERN.search(response)
         if result_match:
             result = result_match.group(1)
             if result == "TRUE":
@@ -290,47 +581,47 @@ class FactCheckerAgent(Agent):
         else:
             verification["verified"] = False
             verification["result"] = "inconclusive"
-        
+
         # 신뢰도 추출
-        confidence_match = re.search(r'신뢰도:\s*(0\.\d+|1\.0|1|0)', response)
+        confidence_match = _CONFIDENCE_PATTERN.search(response)
         verification["confidence"] = float(confidence_match.group(1)) if confidence_match else 0.0
-        
+
         # 설명 추출
-        explanation_match = re.search(r'설명:\s*(.*?)(?=\n수정사항:|$)', response, re.DOTALL)
+        explanation_match = _EXPLANATION_PATTERN.search(response)
         verification["explanation"] = explanation_match.group(1).strip() if explanation_match else ""
-        
+
         # 수정사항 추출
-        correction_match = re.search(r'수정사항:\s*(.*?)(?=$)', response, re.DOTALL)
+        correction_match = _CORRECTION_PATTERN.search(response)
         verification["correction"] = correction_match.group(1).strip() if correction_match else None
-        
+
         return verification
-    
+
     def _simple_verification(self, claim: str, evidence: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         단순 검증 로직 (기본 구현)
-        
+
         Args:
             claim: 검증할 주장
             evidence: 수집된 증거
-            
+
         Returns:
             검증 결과
         """
         # 간단한 구현: 키워드 일치도로 검증
         claim_words = set(claim.lower().split())
-        
+
         match_scores = []
         for e in evidence:
             evidence_text = e.get("text", "").lower()
             evidence_words = set(evidence_text.split())
-            
+
             # 단어 일치 점수
             if claim_words:
                 match_ratio = len(claim_words.intersection(evidence_words)) / len(claim_words)
                 match_scores.append(match_ratio)
-        
+
         avg_score = sum(match_scores) / len(match_scores) if match_scores else 0
-        
+
         return {
             "claim": claim,
             "verified": avg_score > 0.3,  # 간단한 임계값
@@ -339,25 +630,30 @@ class FactCheckerAgent(Agent):
             "evidence": evidence,
             "correction": None
         }
-    
+
+    def get_stats(self) -> Dict[str, Any]:
+        """검증 파이프라인 통계"""
+        with self._cache_lock:
+            return {**self.stats, "cached_claims": len(self._claim_cache)}
+
     def _generate_feedback(self, verification_results: List[Dict[str, Any]]) -> str:
         """
         검증 결과를 바탕으로 피드백 생성
-        
+
         Args:
             verification_results: 주장 검증 결과 목록
-            
+
         Returns:
             피드백 메시지
         """
         if not verification_results:
             return "검증할 주장이 없습니다."
-        
+
         # 결과 분류
         true_claims = []
         false_claims = []
         inconclusive_claims = []
-        
+
         for result in verification_results:
             if result["result"] in ["true", "likely_true"]:
                 true_claims.append(result)
@@ -365,10 +661,10 @@ class FactCheckerAgent(Agent):
                 false_claims.append(result)
             else:
                 inconclusive_claims.append(result)
-        
+
         # 피드백 생성
         feedback = "팩트 체크 결과:\n\n"
-        
+
         if false_claims:
             feedback += "⚠️ 정확하지 않은 정보:\n"
             for claim in false_claims:
@@ -376,43 +672,43 @@ class FactCheckerAgent(Agent):
                 if claim.get("correction"):
                     feedback += f"  → 정확한 정보: {claim['correction']}\n"
             feedback += "\n"
-        
+
         if true_claims:
             feedback += "✓ 정확한 정보:\n"
             for claim in true_claims[:2]:  # 2개만 표시
                 feedback += f"- \"{claim['claim']}\"\n"
             feedback += "\n"
-        
+
         if inconclusive_claims:
             feedback += "❓ 확인할 수 없는 정보:\n"
             for claim in inconclusive_claims[:1]:  # 1개만 표시
                 feedback += f"- \"{claim['claim']}\"\n"
-        
+
         return feedback
-    
+
     def _update_verification_history(self, claim: str, result: Dict[str, Any]) -> None:
         """
         검증 기록 업데이트
-        
+
         Args:
             claim: 검증된 주장
             result: 검증 결과
         """
         verification_record = {
-            "timestamp": import_time().time(),
+            "timestamp": time.time(),
             "claim": claim,
             "result": result
         }
-        
+
         history = self.state.get("verification_history", [])
         history.append(verification_record)
-        
+
         # 최대 기록 수 제한
         if len(history) > 100:
             history = history[-100:]
-            
+
         self.state["verification_history"] = history
-        
+
         # 결과에 따라 분류하여 저장
         if result["verified"]:
             verified_facts = self.state.get("verified_facts", [])
@@ -421,4 +717,4 @@ class FactCheckerAgent(Agent):
         elif result.get("correction"):
             corrections = self.state.get("corrections", [])
             corrections.append((claim, result["correction"]))
-            self.state["corrections"] = corrections[-30:]  # 최대 30개 유지 
\ No newline at end of file
+            self.state["corrections"] = corrections[-30:]  # 최대 30개 유지
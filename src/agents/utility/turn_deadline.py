@@ -0,0 +1,206 @@
+"""
+토론 턴 마감 시간(deadline) 관리 모듈
+
+한 번의 발언 턴(감정 추론 → 전략 선택 → RAG 검색 → 응답 생성)에 전체 시간 예산을 부여하고,
+선택적 보강 단계(감정 LLM 추론, 전략 RAG 등)를 남은 예산에 따라 실행/생략/캐시 대체합니다.
+생략된 보강 단계는 메타데이터로 기록되어 응답과 함께 전달됩니다.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Callable, Union
+
+from ...utils.tracing import wrap_context
+
+logger = logging.getLogger(__name__)
+
+# 턴 전체 예산 (초)
+DEFAULT_TURN_BUDGET_SECONDS = 25.0
+
+# 최종 응답 생성(LLM 호출)을 위해 항상 남겨두는 시간 (초)
+DEFAULT_GENERATION_RESERVE_SECONDS = 8.0
+
+# 예산이 바닥나도 응답 생성에 주는 최소 타임아웃 (초)
+MIN_GENERATION_TIMEOUT_SECONDS = 3.0
+
+# 보강 단계별 예상 소요 시간 (초) - 남은 예산이 이보다 작으면 생략
+DEFAULT_ENRICHMENT_COSTS = {
+    "emotion_llm": 2.0,
+    "strategy_rag": 4.0,
+    "rag": 4.0
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """보강 단계 실행용 공유 스레드 풀 (처음 사용할 때 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="turn-enrichment")
+        return _executor
+
+
+class TurnDeadline:
+    """
+    한 턴의 시간 예산과 보강 단계 사용/생략 기록
+    """
+
+    def __init__(self,
+                 budget_seconds: float = DEFAULT_TURN_BUDGET_SECONDS,
+                 generation_reserve: float = DEFAULT_GENERATION_RESERVE_SECONDS,
+                 enrichment_costs: Optional[Dict[str, float]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        TurnDeadline 초기화
+
+        Args:
+            budget_seconds: 턴 전체 예산 (초)
+            generation_reserve: 응답 생성을 위해 남겨둘 시간 (초)
+            enrichment_costs: 보강 단계별 예상 소요 시간 (기본값을 덮어씀)
+            clock: 단조 시계 함수 (테스트용)
+        """
+        self.budget_seconds = budget_seconds
+        self.generation_reserve = generation_reserve
+        self.enrichment_costs = dict(DEFAULT_ENRICHMENT_COSTS)
+        if enrichment_costs:
+            self.enrichment_costs.update(enrichment_costs)
+        self._clock = clock
+        self.started_at = clock()
+        self.deadline = self.started_at + budget_seconds
+
+        self.used: List[str] = []
+        self.dropped: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_value(cls, value: Union['TurnDeadline', float, int, None]) -> Optional['TurnDeadline']:
+        """
+        TurnDeadline 또는 예산(초)으로부터 TurnDeadline 생성
+
+        Args:
+            value: 기존 TurnDeadline, 예산(초) 또는 None
+
+        Returns:
+            TurnDeadline (값이 없으면 None)
+        """
+        if isinstance(value, TurnDeadline):
+            return value
+        if isinstance(value, (int, float)) and value > 0:
+            return cls(budget_seconds=float(value))
+        return None
+
+    def elapsed(self) -> float:
+        """턴 시작 후 경과 시간 (초)"""
+        return self._clock() - self.started_at
+
+    def remaining(self) -> float:
+        """마감까지 남은 시간 (초, 음수 가능)"""
+        return self.deadline - self._clock()
+
+    def expired(self) -> bool:
+        """마감 시간이 지났는지 여부"""
+        return self.remaining() <= 0
+
+    def spendable(self) -> float:
+        """응답 생성 예비 시간을 제외하고 보강 단계에 쓸 수 있는 시간 (초)"""
+        return self.remaining() - self.generation_reserve
+
+    def generation_timeout(self) -> float:
+        """최종 응답 생성 호출에 줄 타임아웃 (초)"""
+        return max(MIN_GENERATION_TIMEOUT_SECONDS, self.remaining())
+
+    def allows(self, enrichment: str, estimated_seconds: Optional[float] = None) -> bool:
+        """
+        보강 단계를 실행할 예산이 남아 있는지 확인
+
+        Args:
+            enrichment: 보강 단계 이름
+            estimated_seconds: 예상 소요 시간 (None이면 기본 비용표 사용)
+
+        Returns:
+            실행 가능 여부 (생략 기록은 호출부가 drop()으로 남김)
+        """
+        cost = estimated_seconds if estimated_seconds is not None else self.enrichment_costs.get(enrichment, 0.0)
+        return self.spendable() >= cost
+
+    def mark_used(self, enrichment: str) -> None:
+        """보강 단계 사용 기록"""
+        with self._lock:
+            self.used.append(enrichment)
+
+    def drop(self, enrichment: str, reason: str, fallback: str = "none") -> None:
+        """
+        보강 단계 생략 기록
+
+        Args:
+            enrichment: 보강 단계 이름
+            reason: 생략 사유 ("budget", "timeout", "error")
+            fallback: 대체 방식 ("cached", "classifier", "none" 등)
+        """
+        with self._lock:
+            self.dropped.append({
+                "enrichment": enrichment,
+                "reason": reason,
+                "fallback": fallback,
+                "at_seconds": round(self.elapsed(), 3)
+            })
+        logger.info(f"[TURN_DEADLINE] {enrichment} dropped ({reason}, fallback={fallback}, "
+                    f"remaining={self.remaining():.2f}s)")
+
+    def call_with_budget(self,
+                         enrichment: str,
+                         func: Callable[..., Any],
+                         *args,
+                         fallback: Any = None,
+                         fallback_name: str = "none",
+                         **kwargs) -> Any:
+        """
+        남은 예산 안에서 보강 단계를 실행하고, 예산 부족/초과/오류 시 fallback 반환
+
+        예산을 넘긴 작업은 백그라운드에서 끝까지 실행되지만 턴은 기다리지 않습니다.
+
+        Args:
+            enrichment: 보강 단계 이름
+            func: 실행할 함수
+            *args: 함수 인자
+            fallback: 생략 시 반환할 값 (캐시된 결과 등)
+            fallback_name: 메타데이터에 기록할 대체 방식 이름
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            함수 결과 또는 fallback
+        """
+        if not self.allows(enrichment):
+            self.drop(enrichment, "budget", fallback_name)
+            return fallback
+
+        future = _get_executor().submit(wrap_context(func, *args, **kwargs))
+        try:
+            result = future.result(timeout=max(0.0, self.spendable()))
+        except FutureTimeoutError:
+            self.drop(enrichment, "timeout", fallback_name)
+            return fallback
+        except Exception as e:
+            logger.error(f"[TURN_DEADLINE] {enrichment} failed: {str(e)}")
+            self.drop(enrichment, "error", fallback_name)
+            return fallback
+
+        self.mark_used(enrichment)
+        return result
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """응답 메타데이터용 요약"""
+        with self._lock:
+            return {
+                "budget_seconds": self.budget_seconds,
+                "elapsed_seconds": round(self.elapsed(), 3),
+                "remaining_seconds": round(self.remaining(), 3),
+                "expired": self.expired(),
+                "used": list(self.used),
+                "dropped": [dict(entry) for entry in self.dropped]
+            }
@@ -0,0 +1,15 @@
+"""
+오프라인 토론 부하 테스트 / 벤치마크 패키지
+
+실제 API 키 없이 로컬 가짜 OpenAI/Ollama 서버를 상대로 전체 DebateDialogue 토론을 실행하고
+단계별/턴별 지연 시간 분포, 턴당 LLM 호출 수, 방당 메모리(RSS)를 JSON으로 기록합니다.
+
+사용 예:
+    python -m src.benchmark.debate_load_test --rooms 4 --output benchmark_results.json
+"""
+
+from .fake_llm_server import FakeLLMServer, LatencyProfile
+from .fake_redis import InMemoryRedis, InMemorySyncRedis
+from .metrics import LatencyRecorder, percentile, summarize
+
+__all__ = ["FakeLLMServer", "LatencyProfile", "InMemoryRedis", "InMemorySyncRedis", "LatencyRecorder", "percentile", "summarize"]
@@ -0,0 +1,376 @@
+"""
+오프라인 토론 부하 테스트
+
+가짜 LLM 서버(FakeLLMServer)를 띄우고 N개의 토론방을 동시에 끝까지 진행시키면서
+- 턴별 / 단계별 지연 시간 p50/p95/p99
+- 턴당 LLM 호출 수
+- 방당 RSS 증가량
+을 측정해 JSON으로 저장합니다. 이전 결과 파일을 --baseline으로 주면 p95 변화율을 함께 기록합니다.
+
+모드:
+- api: FastAPI 앱(api/main.py)을 프로세스 안에서 ASGI로 호출 (create-debate-room → next-message 반복)
+- direct: DebateDialogue를 직접 생성해 generate_response() 반복 (API 의존성 없이 실행)
+
+사용 예:
+    python -m src.benchmark.debate_load_test --rooms 4 --mode api --output benchmark_results.json
+    python -m src.benchmark.debate_load_test --rooms 8 --latency-ms 500 --distribution lognormal \\
+        --tokens-per-second 40 --baseline benchmark_results.json --output benchmark_results_new.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .fake_llm_server import FakeLLMServer, LatencyProfile
+from .metrics import LatencyRecorder, compare_reports, current_rss_mb
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+API_DIR = BASE_DIR / "api"
+
+DEFAULT_TOPIC = "트랜스휴머니즘: 인간의 새로운 도약인가 아니면 종말인가?"
+DEFAULT_CONTEXT = "트랜스휴머니즘은 기술을 통해 인간의 신체적, 인지적 능력을 향상시키려는 운동입니다."
+
+
+@dataclass
+class BenchmarkConfig:
+    """부하 테스트 설정"""
+    rooms: int = 2
+    mode: str = "api"                       # "api" 또는 "direct"
+    max_turns: int = 60                     # 방당 최대 턴 수 (토론이 먼저 끝나면 중단)
+    turn_timeout: float = 120.0             # 턴 하나를 기다리는 최대 시간 (초)
+    topic: str = DEFAULT_TOPIC
+    context: str = DEFAULT_CONTEXT
+    pro_npcs: List[str] = field(default_factory=lambda: ["nietzsche"])
+    con_npcs: List[str] = field(default_factory=lambda: ["kant"])
+    profile: LatencyProfile = field(default_factory=LatencyProfile)
+    seed: int = 42
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["profile"] = self.profile.to_dict()
+        return data
+
+
+class RssSampler:
+    """백그라운드에서 RSS 최대값을 샘플링"""
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.peak_mb = current_rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, current_rss_mb())
+
+    def __enter__(self) -> 'RssSampler':
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2)
+        self.peak_mb = max(self.peak_mb, current_rss_mb())
+
+
+def configure_llm_environment(server: FakeLLMServer) -> None:
+    """LLMManager가 가짜 서버를 사용하도록 환경 변수 설정"""
+    os.environ["OPENAI_API_KEY"] = "sk-benchmark-fake-key"
+    os.environ["OPENAI_BASE_URL"] = server.openai_base_url
+    os.environ["OLLAMA_ENDPOINT"] = server.base_url
+
+
+def build_room_request(config: BenchmarkConfig, room_index: int) -> Dict[str, Any]:
+    """create-debate-room 요청 본문 생성"""
+    return {
+        "room_id": f"bench-{int(time.time())}-{room_index}",
+        "title": config.topic,
+        "context": config.context,
+        "pro_npcs": list(config.pro_npcs),
+        "con_npcs": list(config.con_npcs),
+        "user_ids": [f"bench-user-{room_index}"],
+        "user_side": "neutral",
+        "moderator_style": "Jamie the Host",
+        "moderator_style_id": "0"
+    }
+
+
+def build_room_data(request: Dict[str, Any]) -> Dict[str, Any]:
+    """create-debate-room과 같은 형식의 DebateDialogue room_data 생성 (direct 모드)"""
+    return {
+        "title": request["title"],
+        "context": request["context"],
+        "dialogueType": "debate",
+        "participants": {
+            "pro": [{"character_id": npc_id} for npc_id in request["pro_npcs"]],
+            "con": [{"character_id": npc_id} for npc_id in request["con_npcs"]],
+            "users": request["user_ids"]
+        },
+        "moderator": {"style": request["moderator_style"], "style_id": request["moderator_style_id"]}
+    }
+
+
+# ========================================================================
+# API 모드
+# ========================================================================
+
+async def run_api_benchmark(config: BenchmarkConfig, server: FakeLLMServer, recorder: LatencyRecorder) -> None:
+    """FastAPI 앱을 통해 N개 방을 동시에 진행"""
+    import httpx
+
+    for path in (str(API_DIR), str(BASE_DIR)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    from main import app
+    from routers import chat as chat_router
+    configure_llm_environment(server)  # 임포트 중 load_dotenv(override=True)가 덮어쓴 값 복원
+
+    # Socket.IO 전송 대신 턴 완료 이벤트를 기록
+    completions: Dict[str, asyncio.Event] = {}
+
+    async def record_room_message(room_id: str, message_data: Dict[str, Any]) -> bool:
+        event = completions.get(room_id)
+        if event is not None:
+            event.set()
+        return True
+
+    chat_router.send_message_to_room = record_room_message
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=config.turn_timeout) as client:
+        async def run_room(room_index: int) -> None:
+            request = build_room_request(config, room_index)
+            room_id = request["room_id"]
+            completions[room_id] = asyncio.Event()
+
+            started = time.perf_counter()
+            response = await client.post("/api/chat/create-debate-room", json=request)
+            recorder.record("room_create", time.perf_counter() - started)
+            if response.status_code != 200:
+                recorder.record_error(room_id, "create", response.text[:300])
+                return
+
+            try:
+                for _ in range(config.max_turns):
+                    event = completions[room_id]
+                    event.clear()
+                    calls_before = server.request_count()
+                    started = time.perf_counter()
+
+                    response = await client.post(f"/api/chat/debate/{room_id}/next-message")
+                    if response.status_code != 200:
+                        recorder.record_error(room_id, "next-message", response.text[:300])
+                        break
+                    data = response.json()
+                    if data.get("status") == "completed":
+                        break
+                    if data.get("status") != "generating":
+                        # 사용자 차례 등 - 부하 테스트는 NPC만 진행
+                        recorder.record_error(room_id, "next-message", f"unexpected status: {data.get('status')}")
+                        break
+
+                    try:
+                        await asyncio.wait_for(event.wait(), timeout=config.turn_timeout)
+                    except asyncio.TimeoutError:
+                        recorder.record_error(room_id, "turn", f"timeout after {config.turn_timeout}s")
+                        break
+
+                    recorder.record_turn(data.get("stage", "unknown"), time.perf_counter() - started,
+                                         server.request_count() - calls_before)
+            finally:
+                await client.delete(f"/api/chat/debate/{room_id}")
+
+        await asyncio.gather(*(run_room(index) for index in range(config.rooms)))
+
+
+# ========================================================================
+# Direct 모드
+# ========================================================================
+
+def run_direct_benchmark(config: BenchmarkConfig, server: FakeLLMServer, recorder: LatencyRecorder) -> None:
+    """DebateDialogue를 직접 생성해 N개 방을 스레드로 동시에 진행"""
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    from src.dialogue.types.debate_dialogue import DebateDialogue
+    configure_llm_environment(server)  # 임포트 중 load_dotenv(override=True)가 덮어쓴 값 복원
+
+    def run_room(room_index: int) -> None:
+        request = build_room_request(config, room_index)
+        room_id = request["room_id"]
+
+        started = time.perf_counter()
+        try:
+            dialogue = DebateDialogue(room_id=room_id, room_data=build_room_data(request),
+                                      use_async_init=False, enable_streaming=False)
+        except Exception as e:
+            recorder.record_error(room_id, "create", str(e))
+            return
+        recorder.record("room_create", time.perf_counter() - started)
+
+        try:
+            for _ in range(config.max_turns):
+                stage = dialogue.state.get("current_stage", "unknown")
+                calls_before = server.request_count()
+                started = time.perf_counter()
+                result = dialogue.generate_response()
+                if result.get("status") == "completed":
+                    break
+                if result.get("status") != "success":
+                    recorder.record_error(room_id, "turn", str(result.get("message", result.get("status"))))
+                    break
+                recorder.record_turn(stage, time.perf_counter() - started, server.request_count() - calls_before)
+        finally:
+            if hasattr(dialogue, "cleanup_resources"):
+                dialogue.cleanup_resources()
+
+    with ThreadPoolExecutor(max_workers=config.rooms, thread_name_prefix="bench-room") as executor:
+        list(executor.map(run_room, range(config.rooms)))
+
+
+# ========================================================================
+# 실행 / 리포트
+# ========================================================================
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def run_benchmark(config: BenchmarkConfig, baseline: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    가짜 서버를 띄우고 설정된 모드로 부하 테스트 실행
+
+    Args:
+        config: 부하 테스트 설정
+        baseline: 비교할 이전 결과 (선택적)
+
+    Returns:
+        JSON 직렬화 가능한 결과 딕셔너리
+    """
+    recorder = LatencyRecorder()
+    baseline_rss = current_rss_mb()
+    started = time.perf_counter()
+
+    with FakeLLMServer(profile=config.profile, seed=config.seed) as server, RssSampler() as sampler:
+        configure_llm_environment(server)
+        if config.mode == "api":
+            asyncio.run(run_api_benchmark(config, server, recorder))
+        else:
+            run_direct_benchmark(config, server, recorder)
+        server_stats = server.get_stats()
+
+    wall_seconds = time.perf_counter() - started
+    report = recorder.report()
+    total_turns = report["turns"]["count"]
+    llm_calls_total = server_stats["by_endpoint"].get("openai_chat", 0) + server_stats["by_endpoint"].get("ollama_chat", 0)
+
+    result = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "git_commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "wall_seconds": round(wall_seconds, 3),
+            "config": config.to_dict(),
+            # 방이 여러 개면 같은 서버를 공유하므로 턴별 호출 수는 근사치
+            "llm_call_attribution": "exact" if config.rooms == 1 else "approximate"
+        },
+        **report,
+        "llm": {
+            "calls_total": llm_calls_total,
+            "calls_per_turn_overall": round(llm_calls_total / total_turns, 3) if total_turns else 0.0,
+            "server": server_stats
+        },
+        "memory": {
+            "baseline_rss_mb": round(baseline_rss, 1),
+            "peak_rss_mb": round(sampler.peak_mb, 1),
+            "rss_per_room_mb": round((sampler.peak_mb - baseline_rss) / max(1, config.rooms), 1)
+        }
+    }
+    if baseline:
+        result["comparison"] = compare_reports(result, baseline)
+    return result
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline debate load test with a fake LLM server")
+    parser.add_argument("--rooms", type=int, default=2, help="동시에 진행할 토론방 수")
+    parser.add_argument("--mode", choices=["api", "direct"], default="api", help="FastAPI 경유 또는 DebateDialogue 직접 실행")
+    parser.add_argument("--max-turns", type=int, default=60, help="방당 최대 턴 수")
+    parser.add_argument("--turn-timeout", type=float, default=120.0, help="턴당 최대 대기 시간 (초)")
+    parser.add_argument("--pro", nargs="+", default=["nietzsche"], help="찬성측 철학자")
+    parser.add_argument("--con", nargs="+", default=["kant"], help="반대측 철학자")
+    parser.add_argument("--distribution", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="첫 토큰 기준 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=100.0, help="uniform 분포 ± 범위 (ms)")
+    parser.add_argument("--sigma", type=float, default=0.5, help="lognormal 분포 표준편차")
+    parser.add_argument("--tokens-per-second", type=float, default=80.0, help="가짜 생성 속도")
+    parser.add_argument("--completion-tokens", type=int, default=120, help="응답 토큰 수")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="주입할 500 오류 비율")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", type=str, default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--output", type=str, default="benchmark_results.json", help="결과 JSON 경로")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    config = BenchmarkConfig(
+        rooms=args.rooms,
+        mode=args.mode,
+        max_turns=args.max_turns,
+        turn_timeout=args.turn_timeout,
+        pro_npcs=args.pro,
+        con_npcs=args.con,
+        profile=LatencyProfile(
+            distribution=args.distribution,
+            base_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            sigma=args.sigma,
+            tokens_per_second=args.tokens_per_second,
+            completion_tokens=args.completion_tokens,
+            error_rate=args.error_rate
+        ),
+        seed=args.seed
+    )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(f"🚀 토론 부하 테스트 시작: {config.rooms}개 방, 모드={config.mode}, 지연={config.profile.distribution}/{config.profile.base_ms}ms")
+    result = run_benchmark(config, baseline)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    turns = result["turns"]
+    print(f"✅ 완료: {turns['count']}턴, p50={turns['p50']:.2f}s p95={turns['p95']:.2f}s p99={turns['p99']:.2f}s, "
+          f"턴당 LLM 호출 {result['llm']['calls_per_turn_overall']}, 방당 RSS {result['memory']['rss_per_room_mb']}MB")
+    if result["errors"]:
+        print(f"⚠️ 오류 {len(result['errors'])}건 - {args.output} 참조")
+    print(f"📄 결과 저장: {args.output}")
+    return 0 if not result["errors"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+결정적(deterministic) 가짜 LLM HTTP 서버
+
+OpenAI(/v1/chat/completions, /v1/responses, /v1/embeddings)와 Ollama(/api/chat) 엔드포인트를 흉내 내며,
+설정한 지연 분포(첫 토큰 지연)와 토큰 생성 속도에 맞춰 응답을 지연시킵니다.
+같은 프롬프트에는 항상 같은 응답을 돌려주므로 실행 간 결과를 비교할 수 있습니다.
+
+LLMManager는 OPENAI_BASE_URL / OLLAMA_ENDPOINT 환경 변수로 이 서버를 가리키게 됩니다.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+
+from ..models.llm.token_counter import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+_WORDS = [
+    "reason", "virtue", "freedom", "duty", "evidence", "society", "justice", "truth",
+    "technology", "ethics", "argument", "principle", "consequence", "human", "nature", "power"
+]
+
+
+@dataclass
+class LatencyProfile:
+    """가짜 서버 응답 지연 설정"""
+    distribution: str = "lognormal"    # "fixed", "uniform", "lognormal"
+    base_ms: float = 300.0             # 첫 토큰까지의 기준 지연 (ms)
+    jitter_ms: float = 100.0           # uniform 분포의 ± 범위 (ms)
+    sigma: float = 0.5                 # lognormal 분포의 표준편차 (로그 스케일)
+    tokens_per_second: float = 80.0    # 생성 속도 (0 이하면 생성 시간 없음)
+    completion_tokens: int = 120       # 응답 토큰 수 (max_tokens가 더 작으면 max_tokens)
+    error_rate: float = 0.0            # 500 오류 비율 (0~1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class FakeLLMServer:
+    """
+    가짜 OpenAI/Ollama 서버
+
+    with 문 또는 start()/stop()으로 사용합니다.
+    """
+
+    def __init__(self, profile: Optional[LatencyProfile] = None, seed: int = 42,
+                 host: str = "127.0.0.1", port: int = 0, embedding_dim: int = 64):
+        """
+        FakeLLMServer 초기화
+
+        Args:
+            profile: 지연 분포 설정
+            seed: 지연 샘플링 시드
+            host: 바인딩 호스트
+            port: 바인딩 포트 (0이면 임의의 빈 포트)
+            embedding_dim: 임베딩 벡터 차원
+        """
+        self.profile = profile or LatencyProfile()
+        self.embedding_dim = embedding_dim
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "errors": 0,
+            "by_endpoint": {},
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "simulated_seconds": 0.0
+        }
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.base_url}/v1"
+
+    def start(self) -> 'FakeLLMServer':
+        """백그라운드 스레드에서 서버 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-llm-server", daemon=True)
+            self._thread.start()
+            logger.info(f"Fake LLM server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FakeLLMServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요청 수, 토큰 수, 시뮬레이션된 지연 합계"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+            stats["by_endpoint"] = dict(self._stats["by_endpoint"])
+            return stats
+
+    def request_count(self) -> int:
+        """지금까지 처리한 생성 요청 수 (임베딩 제외)"""
+        with self._stats_lock:
+            by_endpoint = self._stats["by_endpoint"]
+            return (by_endpoint.get("openai_chat", 0) + by_endpoint.get("openai_responses", 0)
+                    + by_endpoint.get("ollama_chat", 0))
+
+    def _record(self, endpoint: str, prompt_tokens: int, completion_tokens: int, seconds: float, error: bool) -> None:
+        with self._stats_lock:
+            self._stats["requests"] += 1
+            self._stats["by_endpoint"][endpoint] = self._stats["by_endpoint"].get(endpoint, 0) + 1
+            self._stats["prompt_tokens"] += prompt_tokens
+            self._stats["completion_tokens"] += completion_tokens
+            self._stats["simulated_seconds"] += seconds
+            if error:
+                self._stats["errors"] += 1
+
+    # ------------------------------------------------------------------
+    # 지연 / 응답 생성
+    # ------------------------------------------------------------------
+
+    def sample_delay(self, completion_tokens: int) -> float:
+        """첫 토큰 지연 + 생성 시간 (초)"""
+        profile = self.profile
+        with self._random_lock:
+            if profile.distribution == "fixed":
+                first_token_ms = profile.base_ms
+            elif profile.distribution == "uniform":
+                first_token_ms = self._random.uniform(profile.base_ms - profile.jitter_ms,
+                                                      profile.base_ms + profile.jitter_ms)
+            else:
+                first_token_ms = profile.base_ms * self._random.lognormvariate(0.0, profile.sigma)
+        generation = completion_tokens / profile.tokens_per_second if profile.tokens_per_second > 0 else 0.0
+        return max(0.0, first_token_ms) / 1000.0 + generation
+
+    def _should_fail(self) -> bool:
+        if self.profile.error_rate <= 0:
+            return False
+        with self._random_lock:
+            return self._random.random() < self.profile.error_rate
+
+    @staticmethod
+    def fake_completion(messages: List[Dict[str, Any]], completion_tokens: int) -> str:
+        """
+        프롬프트에 대해 결정적인 응답 생성
+
+        JSON 응답을 요구하는 프롬프트(감정 추론, 논지 추출 등)에는 파싱 가능한 JSON을 돌려줍니다.
+        """
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        digest = hashlib.sha1(prompt.encode("utf-8")).digest()
+
+        if "JSON" in prompt or "json" in prompt:
+            if "array" in prompt.lower() or "list" in prompt.lower():
+                return json.dumps([
+                    {"claim": "Benchmark claim", "evidence": "Benchmark evidence",
+                     "reasoning": "Benchmark reasoning", "argument": "Benchmark argument"}
+                ])
+            return json.dumps({
+                "primary_emotion": "analytical",
+                "intensity": "MODERATE",
+                "reasoning": "Deterministic benchmark response.",
+                "recommended_tone": "Calm and analytical.",
+                "claim": "Benchmark claim",
+                "score": 0.5
+            })
+
+        count = max(1, completion_tokens)
+        words = [_WORDS[digest[i % len(digest)] % len(_WORDS)] for i in range(count)]
+        return " ".join(words).capitalize() + "."
+
+    def _simulate(self, endpoint: str, messages: List[Dict[str, Any]], max_tokens: int) -> Optional[Dict[str, Any]]:
+        """지연을 적용해 응답 하나를 생성 (주입된 실패면 None)"""
+        completion_tokens = min(self.profile.completion_tokens, int(max_tokens))
+        prompt_tokens = sum(estimate_tokens(str(message.get("content", ""))) for message in messages)
+
+        delay = self.sample_delay(completion_tokens)
+        time.sleep(delay)
+
+        failed = self._should_fail()
+        self._record(endpoint, prompt_tokens, 0 if failed else completion_tokens, delay, failed)
+        if failed:
+            return None
+        return {
+            "content": self.fake_completion(messages, completion_tokens),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens
+        }
+
+    def handle_chat(self, endpoint: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """채팅 요청 하나를 처리하고 (지연 후) 응답 페이로드 반환"""
+        messages = body.get("messages", [])
+        if endpoint == "ollama_chat":
+            max_tokens = (body.get("options") or {}).get("num_predict") or self.profile.completion_tokens
+        else:
+            max_tokens = body.get("max_tokens") or body.get("max_completion_tokens") or self.profile.completion_tokens
+        result = self._simulate(endpoint, messages, max_tokens)
+        if result is None:
+            return {}
+
+        content = result["content"]
+        prompt_tokens, completion_tokens = result["prompt_tokens"], result["completion_tokens"]
+        if endpoint == "ollama_chat":
+            return {
+                "model": body.get("model", "fake"),
+                "message": {"role": "assistant", "content": content},
+                "done": True,
+                "prompt_eval_count": prompt_tokens,
+                "eval_count": completion_tokens
+            }
+        return {
+            "id": f"chatcmpl-{hashlib.sha1(content.encode('utf-8')).hexdigest()[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": 0}
+            }
+        }
+
+    def handle_responses(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Responses API 요청 처리 (입론 생성의 웹 검색 호출용)
+
+        도구(web_search_preview 등)는 실제로 실행하지 않고, 결정적인 본문과 url_citation 주석 하나를 돌려줍니다.
+        """
+        inputs = body.get("input", "")
+        if isinstance(inputs, str):
+            messages = [{"role": "user", "content": inputs}]
+        else:
+            messages = [item for item in inputs if isinstance(item, dict)]
+        if body.get("instructions"):
+            messages.insert(0, {"role": "system", "content": body["instructions"]})
+        max_tokens = body.get("max_output_tokens") or self.profile.completion_tokens
+        result = self._simulate("openai_responses", messages, max_tokens)
+        if result is None:
+            return {}
+
+        content = result["content"]
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()[:12]
+        annotations = []
+        if body.get("tools"):
+            annotations.append({
+                "type": "url_citation",
+                "start_index": 0,
+                "end_index": len(content),
+                "url": f"https://example.com/benchmark/{digest}",
+                "title": f"Benchmark source {digest}"
+            })
+        return {
+            "id": f"resp_{digest}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "status": "completed",
+            "model": body.get("model", "fake"),
+            "output": [{
+                "type": "message",
+                "id": f"msg_{digest}",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": content, "annotations": annotations}]
+            }],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": body.get("tools", []),
+            "usage": {
+                "input_tokens": result["prompt_tokens"],
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens": result["completion_tokens"],
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": result["prompt_tokens"] + result["completion_tokens"]
+            }
+        }
+
+    def handle_embeddings(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """입력 텍스트별 결정적 임베딩 벡터 반환"""
+        inputs = body.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        data = []
+        for index, text in enumerate(inputs):
+            digest = hashlib.sha256(str(text).encode("utf-8")).digest()
+            vector = [(digest[i % len(digest)] - 128) / 128.0 for i in range(self.embedding_dim)]
+            data.append({"object": "embedding", "index": index, "embedding": vector})
+        self._record("openai_embeddings", sum(estimate_tokens(str(text)) for text in inputs), 0, 0.0, False)
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "fake-embedding"),
+            "usage": {"prompt_tokens": 0, "total_tokens": 0}
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler 시그니처
+                logger.debug("fake-llm: " + format % args)
+
+            def _send_json(self, status: int, payload: Any) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path.rstrip("/") == "/stats":
+                    self._send_json(200, server.get_stats())
+                elif self.path.rstrip("/") in ("/v1/models", "/api/tags"):
+                    self._send_json(200, {"object": "list", "data": [{"id": "fake", "object": "model"}], "models": []})
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    self._send_json(400, {"error": "invalid json"})
+                    return
+
+                path = self.path.split("?")[0].rstrip("/")
+                if path.endswith("/chat/completions"):
+                    payload = server.handle_chat("openai_chat", body)
+                elif path.endswith("/responses"):
+                    payload = server.handle_responses(body)
+                elif path == "/api/chat":
+                    payload = server.handle_chat("ollama_chat", body)
+                elif path.endswith("/embeddings"):
+                    payload = server.handle_embeddings(body)
+                else:
+                    self._send_json(404, {"error": "not found"})
+                    return
+
+                if not payload:
+                    self._send_json(500, {"error": {"message": "injected failure", "type": "server_error"}})
+                else:
+                    self._send_json(200, payload)
+
+        return Handler
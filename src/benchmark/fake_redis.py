@@ -0,0 +1,305 @@
+"""
+프로세스 내 가짜 비동기 Redis
+
+redis.asyncio 클라이언트 중 캐시/빈도 추적/리스에 쓰는 명령(GET/MGET/SET/SETEX/INCR/PEXPIRE/PTTL/DELETE/EXISTS,
+ZINCRBY/ZREVRANGE/ZRANGE/ZSCORE/ZCARD/ZREM, HSET/HGET/HMGET/HDEL, pipeline)만 흉내 냅니다.
+명령(또는 파이프라인) 한 번마다 설정한 왕복 지연을 적용하고 왕복 횟수를 세므로
+파이프라이닝 효과를 실제 Redis 없이 측정/테스트할 수 있습니다.
+
+InMemorySyncRedis는 같은 저장소를 동기 redis 클라이언트 인터페이스로 제공하며
+(WATCH/MULTI/EXEC 낙관적 잠금 포함), 여러 스레드(예: 프로세스 내 uvicorn 워커들)가
+하나의 인스턴스를 공유할 수 있습니다.
+"""
+
+import time
+import asyncio
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    from redis.exceptions import WatchError
+except ImportError:  # redis 패키지 없이도 사용 가능
+    class WatchError(Exception):
+        """WATCH한 키가 EXEC 전에 바뀜"""
+
+
+class InMemoryRedis:
+    """
+    redis.asyncio.Redis 호환 최소 구현 (decode_responses=True 기준)
+    """
+
+    def __init__(self, round_trip_ms: float = 0.0, clock=time.monotonic):
+        """
+        InMemoryRedis 초기화
+
+        Args:
+            round_trip_ms: 명령/파이프라인 한 번의 왕복 지연 (ms)
+            clock: TTL 계산용 시간 함수 (테스트용)
+        """
+        self.round_trip_ms = round_trip_ms
+        self._clock = clock
+        self._strings: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._zsets: Dict[str, Dict[str, float]] = {}
+        self._hashes: Dict[str, Dict[str, str]] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.stats = {"round_trips": 0, "commands": 0}
+
+    async def _round_trip(self, commands: int = 1) -> None:
+        self.stats["round_trips"] += 1
+        self.stats["commands"] += commands
+        if self.round_trip_ms > 0:
+            await asyncio.sleep(self.round_trip_ms / 1000)
+        else:
+            await asyncio.sleep(0)
+
+    # ------------------------------------------------------------------
+    # 명령 구현 (왕복 없이 즉시 실행)
+    # ------------------------------------------------------------------
+
+    def _touch(self, key: str) -> None:
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _version(self, key: str) -> int:
+        self._get(key)  # 만료된 키는 먼저 정리 (WATCH 직후 만료 처리로 EXEC가 실패하지 않도록)
+        return self._versions.get(key, 0)
+
+    def _get(self, key: str) -> Optional[str]:
+        entry = self._strings.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and self._clock() >= expires_at:
+            del self._strings[key]
+            self._touch(key)
+            return None
+        return value
+
+    def _set(self, key: str, value: Any, ex: Optional[float] = None, px: Optional[float] = None,
+             nx: bool = False, xx: bool = False) -> Optional[bool]:
+        exists = self._get(key) is not None
+        if (nx and exists) or (xx and not exists):
+            return None
+        ttl = ex if ex else (px / 1000 if px else None)
+        expires_at = self._clock() + ttl if ttl else None
+        self._strings[key] = (str(value), expires_at)
+        self._touch(key)
+        return True
+
+    def _apply(self, name: str, *args, **kwargs) -> Any:
+        with self._lock:
+            return self._apply_locked(name, *args, **kwargs)
+
+    def _apply_locked(self, name: str, *args, **kwargs) -> Any:
+        if name == "get":
+            return self._get(args[0])
+        if name == "mget":
+            keys = args[0] if len(args) == 1 and isinstance(args[0], (list, tuple)) else args
+            return [self._get(key) for key in keys]
+        if name == "set":
+            return self._set(args[0], args[1], ex=kwargs.get("ex"), px=kwargs.get("px"),
+                             nx=kwargs.get("nx", False), xx=kwargs.get("xx", False))
+        if name == "setex":
+            return self._set(args[0], args[2], ex=args[1])
+        if name == "incr":
+            value = int(self._get(args[0]) or 0) + int(args[1] if len(args) > 1 else 1)
+            entry = self._strings.get(args[0])
+            self._strings[args[0]] = (str(value), entry[1] if entry else None)
+            self._touch(args[0])
+            return value
+        if name == "pexpire":
+            value = self._get(args[0])
+            if value is None:
+                return False
+            self._strings[args[0]] = (value, self._clock() + args[1] / 1000)
+            self._touch(args[0])
+            return True
+        if name == "pttl":
+            if self._get(args[0]) is None:
+                return -2
+            expires_at = self._strings[args[0]][1]
+            return -1 if expires_at is None else max(0, int((expires_at - self._clock()) * 1000))
+        if name == "delete":
+            deleted = [key for key in args if self._get(key) is not None]
+            for key in deleted:
+                del self._strings[key]
+                self._touch(key)
+            return len(deleted)
+        if name == "exists":
+            return sum(1 for key in args if self._get(key) is not None)
+        if name == "zincrby":
+            key, amount, member = args
+            zset = self._zsets.setdefault(key, {})
+            zset[member] = zset.get(member, 0.0) + float(amount)
+            return zset[member]
+        if name == "zscore":
+            return self._zsets.get(args[0], {}).get(args[1])
+        if name in ("zrevrange", "zrange"):
+            key, start, end = args
+            sign = -1 if name == "zrevrange" else 1
+            items = sorted(self._zsets.get(key, {}).items(), key=lambda item: (sign * item[1], item[0]))
+            items = items[start:] if end == -1 else items[start:end + 1]
+            return items if kwargs.get("withscores") else [member for member, _ in items]
+        if name == "zcard":
+            return len(self._zsets.get(args[0], {}))
+        if name == "zrem":
+            zset = self._zsets.get(args[0], {})
+            return sum(1 for member in args[1:] if zset.pop(member, None) is not None)
+        if name == "hset":
+            key = args[0]
+            mapping = kwargs.get("mapping") or {args[1]: args[2]}
+            target = self._hashes.setdefault(key, {})
+            added = sum(1 for field in mapping if field not in target)
+            target.update({field: str(value) for field, value in mapping.items()})
+            return added
+        if name == "hdel":
+            target = self._hashes.get(args[0], {})
+            return sum(1 for field in args[1:] if target.pop(field, None) is not None)
+        if name == "hget":
+            return self._hashes.get(args[0], {}).get(args[1])
+        if name == "hmget":
+            fields = args[1] if len(args) == 2 and isinstance(args[1], (list, tuple)) else args[1:]
+            return [self._hashes.get(args[0], {}).get(field) for field in fields]
+        raise NotImplementedError(f"InMemoryRedis does not support {name}")
+
+    # ------------------------------------------------------------------
+    # redis.asyncio 호환 인터페이스
+    # ------------------------------------------------------------------
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def command(*args, **kwargs):
+            await self._round_trip()
+            return self._apply(name, *args, **kwargs)
+        return command
+
+    def pipeline(self, transaction: bool = True) -> 'InMemoryPipeline':
+        return InMemoryPipeline(self)
+
+    async def ping(self) -> bool:
+        await self._round_trip()
+        return True
+
+    async def aclose(self) -> None:
+        return None
+
+
+class InMemoryPipeline:
+    """명령을 모아 두었다가 execute() 한 번(왕복 1회)에 실행"""
+
+    def __init__(self, redis: InMemoryRedis):
+        self._redis = redis
+        self._commands: List[Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self) -> List[Any]:
+        commands, self._commands = self._commands, []
+        await self._redis._round_trip(len(commands))
+        return [self._redis._apply(name, *args, **kwargs) for name, args, kwargs in commands]
+
+    async def __aenter__(self) -> 'InMemoryPipeline':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._commands = []
+
+
+class InMemorySyncRedis(InMemoryRedis):
+    """
+    redis.Redis(동기) 호환 최소 구현 - 스레드 간 공유 가능
+    """
+
+    def _round_trip_sync(self, commands: int = 1) -> None:
+        with self._lock:
+            self.stats["round_trips"] += 1
+            self.stats["commands"] += commands
+        if self.round_trip_ms > 0:
+            time.sleep(self.round_trip_ms / 1000)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def command(*args, **kwargs):
+            self._round_trip_sync()
+            return self._apply(name, *args, **kwargs)
+        return command
+
+    def pipeline(self, transaction: bool = True) -> 'InMemorySyncPipeline':
+        return InMemorySyncPipeline(self)
+
+    def ping(self) -> bool:
+        self._round_trip_sync()
+        return True
+
+    def close(self) -> None:
+        return None
+
+
+class InMemorySyncPipeline:
+    """
+    동기 파이프라인 (redis-py와 같이 watch() 이후에는 즉시 실행, multi() 이후에는 모았다가 execute())
+    """
+
+    def __init__(self, redis: InMemorySyncRedis):
+        self._redis = redis
+        self._commands: List[Tuple[str, tuple, dict]] = []
+        self._watched: Dict[str, int] = {}
+        self._immediate = False
+
+    def watch(self, *keys: str) -> None:
+        with self._redis._lock:
+            for key in keys:
+                self._watched[key] = self._redis._version(key)
+        self._immediate = True
+
+    def unwatch(self) -> None:
+        self._watched = {}
+        self._immediate = False
+
+    def multi(self) -> None:
+        self._immediate = False
+
+    def reset(self) -> None:
+        self._commands = []
+        self.unwatch()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs):
+            if self._immediate:
+                self._redis._round_trip_sync()
+                return self._redis._apply(name, *args, **kwargs)
+            self._commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> List[Any]:
+        commands, self._commands = self._commands, []
+        self._redis._round_trip_sync(len(commands))
+        with self._redis._lock:
+            for key, version in self._watched.items():
+                if self._redis._version(key) != version:
+                    self.unwatch()
+                    raise WatchError(f"Watched key changed: {key}")
+            results = [self._redis._apply(name, *args, **kwargs) for name, args, kwargs in commands]
+        self.unwatch()
+        return results
+
+    def __enter__(self) -> 'InMemorySyncPipeline':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.reset()
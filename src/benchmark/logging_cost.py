@@ -0,0 +1,232 @@
+"""
+턴당 로깅 비용 벤치마크
+
+토론 한 턴 동안 발생하는 로깅 호출(next-message 폴링, 전략 선택 가중치, 참가자 에이전트 진행 로그,
+메시지 생성 완료)을 재현해 호출 스레드에서 소요되는 시간을 설정별로 비교합니다.
+
+설정:
+- legacy: logging.basicConfig(level=DEBUG) + 동기 StreamHandler, f-string INFO 로그와 print()
+- pipeline: src.utils.log_pipeline (INFO, JSON, 큐 기반) + 지연 포맷 DEBUG 로그
+- pipeline_debug: 같은 파이프라인을 DEBUG로 열어 모든 레코드를 큐로 보냄 (방/호출 지점별 제한 적용)
+
+사용 예:
+    python -m src.benchmark.logging_cost --turns 2000 --output logging_cost.json
+    python -m src.benchmark.logging_cost --polls-per-turn 20 --sink /tmp/sapiens.log
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, IO
+
+from .metrics import summarize
+from ..utils.log_pipeline import LoggingPipeline, log_context
+
+logger = logging.getLogger(__name__)
+
+MODES = ("legacy", "pipeline", "pipeline_debug")
+
+
+@dataclass
+class LoggingCostConfig:
+    """로깅 비용 벤치마크 설정"""
+    turns: int = 1000
+    rooms: int = 4
+    polls_per_turn: int = 10            # 턴 하나를 기다리는 동안의 next-message 폴링 횟수
+    agent_lines_per_turn: int = 30      # 참가자 에이전트의 진행 로그(print) 수
+    rate_per_second: float = 20.0
+    burst: int = 50
+    turn_gap_ms: float = 0.0            # 턴 사이 유휴 시간 (측정에서 제외, 리스너가 큐를 비우는 시간)
+    sink: str = os.devnull
+
+
+def _payload(turn: int) -> Dict[str, Any]:
+    """로그 인자로 쓰이는 턴별 데이터 (실제 호출부와 비슷한 크기)"""
+    return {
+        "speaker_id": "nietzsche" if turn % 2 else "kant",
+        "role": "pro" if turn % 2 else "con",
+        "stage": "interactive_argument",
+        "candidates": ["Clarify", "Accept", "Refute", "Reframe"],
+        "weights": {"Clarify": 0.3, "Accept": 0.1, "Refute": 0.35, "Reframe": 0.25, "Counter": 0.2},
+        "room_data": {"title": "트랜스휴머니즘", "participants": {"pro": ["nietzsche"], "con": ["kant"], "users": []}},
+        "message": "초인은 스스로를 극복하는 존재입니다. " * 20,
+    }
+
+
+def _legacy_turn(log: logging.Logger, out: IO[str], room_id: str, turn: int, config: LoggingCostConfig) -> None:
+    """기존 호출 방식: f-string INFO 로그와 print()"""
+    data = _payload(turn)
+    for _ in range(config.polls_per_turn):
+        log.info(f"🎭 Getting next speaker info for room {room_id}")
+        log.info(f"🔁 Returning in-flight turn {turn} for room {room_id}")
+    log.info(f"🎯 Next speaker: {data['speaker_id']} ({data['role']}) in stage {data['stage']}")
+    log.info(f"🤖 AI TURN DETECTED - {data['speaker_id']} ({data['role']}), turn {turn}")
+    log.info(f"[{data['speaker_id']}] Selecting defense strategy")
+    log.info(f"[{data['speaker_id']}] Defense candidates: {data['candidates']}")
+    log.info(f"[{data['speaker_id']}] Defense weights: {data['weights']}")
+    log.info(f"[{data['speaker_id']}] Normalized weights: {data['weights']}")
+    log.info(f"[{data['speaker_id']}] Selected defense strategy: Refute (prob: {0.35:.3f})")
+    for index in range(config.agent_lines_per_turn):
+        print(f"   🔍 [{data['speaker_id']}] 단계 {index}: {data['room_data']}", file=out)
+    log.info(f"🔄 Background message generation started for {data['speaker_id']}")
+    log.info(f"✅ Message generated: {data['speaker_id']} - {len(data['message'])} chars")
+    log.info(f"📍 Message stage: {data['stage']}")
+
+
+def _pipeline_turn(log: logging.Logger, room_id: str, turn: int, config: LoggingCostConfig) -> None:
+    """변경된 호출 방식: 지연 포맷, 폴링/가중치는 DEBUG, 턴당 INFO 두 줄"""
+    data = _payload(turn)
+    with log_context(room_id=room_id):
+        for _ in range(config.polls_per_turn):
+            log.debug("🎭 Getting next speaker info")
+            log.debug("🔁 Returning in-flight turn %s", turn)
+        log.info("🤖 AI TURN DETECTED - %s (%s) in stage %s, turn %s", data["speaker_id"], data["role"], data["stage"], turn)
+    with log_context(room_id=room_id, turn_id=turn):
+        log.debug("[%s] Selecting defense strategy", data["speaker_id"])
+        log.debug("[%s] Defense candidates: %s", data["speaker_id"], data["candidates"])
+        log.debug("[%s] Defense weights: %s", data["speaker_id"], data["weights"])
+        log.debug("[%s] Normalized weights: %s", data["speaker_id"], data["weights"])
+        log.info("[%s] Selected defense strategy: %s (prob: %.3f)", data["speaker_id"], "Refute", 0.35)
+        for index in range(config.agent_lines_per_turn):
+            log.debug("   🔍 [%s] 단계 %d: %s", data["speaker_id"], index, data["room_data"])
+        log.debug("🔄 Background message generation started for %s", data["speaker_id"])
+        log.info("✅ Message generated: %s - %d chars (stage %s)", data["speaker_id"], len(data["message"]), data["stage"])
+
+
+class _CountingStream:
+    """쓰인 줄 수를 세는 출력 스트림 래퍼"""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        self.lines += text.count("\n")
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def run_mode(mode: str, config: LoggingCostConfig) -> Dict[str, Any]:
+    """
+    한 설정으로 config.turns 턴을 실행하고 호출 스레드 기준 턴당 로깅 시간 측정
+
+    Args:
+        mode: "legacy", "pipeline", "pipeline_debug"
+        config: 벤치마크 설정
+
+    Returns:
+        턴당 시간(µs) 요약과 기록/억제/버려진 레코드 수
+    """
+    log = logging.getLogger(f"sapiens.bench.{mode}")
+    log.propagate = False
+    log.handlers.clear()
+
+    with open(config.sink, "a", encoding="utf-8") as sink_file:
+        out = _CountingStream(sink_file)
+        pipeline: Optional[LoggingPipeline] = None
+        if mode == "legacy":
+            handler = logging.StreamHandler(out)
+            handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+            log.addHandler(handler)
+            log.setLevel(logging.DEBUG)
+        else:
+            level = logging.DEBUG if mode == "pipeline_debug" else logging.INFO
+            pipeline = LoggingPipeline(level=level, fmt="json", stream=out, rate_per_second=config.rate_per_second,
+                                       burst=config.burst).start()
+            log.addHandler(pipeline.handler)
+            log.setLevel(level)
+
+        durations: List[float] = []
+        started = time.perf_counter()
+        try:
+            for turn in range(config.turns):
+                room_id = f"bench-room-{turn % max(1, config.rooms)}"
+                turn_start = time.perf_counter()
+                if mode == "legacy":
+                    _legacy_turn(log, out, room_id, turn, config)
+                else:
+                    _pipeline_turn(log, room_id, turn, config)
+                durations.append((time.perf_counter() - turn_start) * 1e6)
+                if config.turn_gap_ms > 0:
+                    time.sleep(config.turn_gap_ms / 1000.0)
+            caller_seconds = time.perf_counter() - started
+        finally:
+            if pipeline is not None:
+                pipeline.stop()
+            log.handlers.clear()
+        drained_seconds = time.perf_counter() - started
+
+    result = {
+        "mode": mode,
+        "per_turn_us": summarize(durations),
+        "caller_seconds": round(caller_seconds, 4),
+        "drained_seconds": round(drained_seconds, 4),
+        "lines_written": out.lines
+    }
+    if pipeline is not None:
+        stats = pipeline.get_stats()
+        result.update({"enqueued": stats["enqueued"], "dropped": stats["dropped"], "suppressed": stats["suppressed"]})
+    return result
+
+
+def run_benchmark(config: LoggingCostConfig, modes: Optional[List[str]] = None) -> Dict[str, Any]:
+    """선택한 설정들을 순서대로 실행하고 legacy 대비 턴당 p50 비율을 함께 기록"""
+    results = {mode: run_mode(mode, config) for mode in (modes or MODES)}
+    legacy = results.get("legacy")
+    if legacy and legacy["per_turn_us"]["p50"]:
+        for mode, result in results.items():
+            result["p50_vs_legacy"] = round(result["per_turn_us"]["p50"] / legacy["per_turn_us"]["p50"], 3)
+    return {"config": asdict(config), "modes": results}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-turn logging cost benchmark")
+    parser.add_argument("--turns", type=int, default=1000, help="실행할 턴 수")
+    parser.add_argument("--rooms", type=int, default=4, help="턴을 나눠 받을 방 수 (방별 제한에 영향)")
+    parser.add_argument("--polls-per-turn", type=int, default=10, help="턴당 next-message 폴링 횟수")
+    parser.add_argument("--agent-lines", type=int, default=30, help="턴당 참가자 에이전트 진행 로그 수")
+    parser.add_argument("--rate", type=float, default=20.0, help="호출 지점/방별 초당 허용 레코드 수")
+    parser.add_argument("--burst", type=int, default=50, help="토큰 버킷 크기")
+    parser.add_argument("--turn-gap-ms", type=float, default=0.0, help="턴 사이 유휴 시간 (ms, 측정에서 제외)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--sink", type=str, default=os.devnull, help="로그를 쓸 파일 (기본 /dev/null)")
+    parser.add_argument("--output", type=str, default=None, help="결과 JSON 경로")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    config = LoggingCostConfig(
+        turns=args.turns,
+        rooms=args.rooms,
+        polls_per_turn=args.polls_per_turn,
+        agent_lines_per_turn=args.agent_lines,
+        rate_per_second=args.rate,
+        burst=args.burst,
+        turn_gap_ms=args.turn_gap_ms,
+        sink=args.sink
+    )
+
+    print(f"🚀 로깅 비용 벤치마크: {config.turns}턴, 방 {config.rooms}개, 턴당 폴링 {config.polls_per_turn}회")
+    result = run_benchmark(config, args.modes)
+
+    for mode, stats in result["modes"].items():
+        per_turn = stats["per_turn_us"]
+        print(f"   {mode:<15} p50={per_turn['p50']:.1f}µs p95={per_turn['p95']:.1f}µs p99={per_turn['p99']:.1f}µs "
+              f"lines={stats['lines_written']} dropped={stats.get('dropped', 0)} suppressed={stats.get('suppressed', 0)}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"📄 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
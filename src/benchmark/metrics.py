@@ -0,0 +1,141 @@
+"""
+벤치마크 지표 수집/요약 유틸리티
+
+지연 시간 분포(p50/p95/p99), 프로세스 RSS, 이전 실행 결과와의 비교를 제공합니다.
+"""
+
+import math
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Any, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    선형 보간 백분위수
+
+    Args:
+        values: 값 목록
+        pct: 백분위 (0~100)
+
+    Returns:
+        백분위수 (값이 없으면 0.0)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(ordered[int(rank)])
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """값 목록의 count/mean/p50/p95/p99/max 요약"""
+    if not values:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 4),
+        "p50": round(percentile(values, 50), 4),
+        "p95": round(percentile(values, 95), 4),
+        "p99": round(percentile(values, 99), 4),
+        "max": round(max(values), 4)
+    }
+
+
+def current_rss_mb() -> float:
+    """현재 프로세스 RSS (MB, psutil이 없으면 0.0)"""
+    if not PSUTIL_AVAILABLE:
+        return 0.0
+    return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+
+
+class LatencyRecorder:
+    """
+    카테고리별(turn, stage:<이름>, room_create 등) 지연 시간과 턴당 LLM 호출 수 기록기
+
+    여러 방 스레드/코루틴에서 동시에 기록할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self._llm_calls: Dict[str, List[int]] = defaultdict(list)
+        self._errors: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, category: str, seconds: float) -> None:
+        """지연 시간 한 건 기록"""
+        with self._lock:
+            self._samples[category].append(seconds)
+
+    def record_turn(self, stage: str, seconds: float, llm_calls: Optional[int] = None) -> None:
+        """턴 한 건 기록 (전체 턴 + 단계별)"""
+        with self._lock:
+            self._samples["turn"].append(seconds)
+            self._samples[f"stage:{stage}"].append(seconds)
+            if llm_calls is not None:
+                self._llm_calls["turn"].append(llm_calls)
+                self._llm_calls[f"stage:{stage}"].append(llm_calls)
+
+    def record_error(self, room_id: str, where: str, message: str) -> None:
+        """오류 기록"""
+        with self._lock:
+            self._errors.append({"room_id": room_id, "where": where, "message": message})
+
+    def report(self) -> Dict[str, Any]:
+        """카테고리별 요약 리포트"""
+        with self._lock:
+            samples = {key: list(values) for key, values in self._samples.items()}
+            llm_calls = {key: list(values) for key, values in self._llm_calls.items()}
+            errors = list(self._errors)
+
+        stages = {key[len("stage:"):]: summarize(values) for key, values in samples.items() if key.startswith("stage:")}
+        for stage, calls in llm_calls.items():
+            if stage.startswith("stage:") and stage[len("stage:"):] in stages:
+                stages[stage[len("stage:"):]]["llm_calls_per_turn"] = round(sum(calls) / len(calls), 3)
+
+        turn_calls = llm_calls.get("turn", [])
+        return {
+            "turns": summarize(samples.get("turn", [])),
+            "stages": stages,
+            "other": {key: summarize(values) for key, values in samples.items()
+                      if key != "turn" and not key.startswith("stage:")},
+            "llm_calls_per_turn": summarize([float(calls) for calls in turn_calls]),
+            "errors": errors
+        }
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any], metric: str = "p95") -> Dict[str, Any]:
+    """
+    이전 실행 결과 대비 턴/단계별 지연 변화율
+
+    Args:
+        current: 이번 실행 리포트
+        baseline: 이전 실행 리포트
+        metric: 비교할 지표 (p50/p95/p99/mean)
+
+    Returns:
+        {이름: {"baseline", "current", "change_pct"}}
+    """
+    def _delta(now: float, before: float) -> Dict[str, Any]:
+        change = ((now - before) / before * 100.0) if before else None
+        return {"baseline": before, "current": now, "change_pct": round(change, 2) if change is not None else None}
+
+    result = {"turn": _delta(current.get("turns", {}).get(metric, 0.0), baseline.get("turns", {}).get(metric, 0.0))}
+    for stage, summary in current.get("stages", {}).items():
+        previous = baseline.get("stages", {}).get(stage)
+        if previous:
+            result[f"stage:{stage}"] = _delta(summary.get(metric, 0.0), previous.get(metric, 0.0))
+    return result
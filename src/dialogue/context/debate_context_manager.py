@@ -10,6 +10,8 @@ import math
 from typing import Dict, List, Any, Optional, Union
 from ...utils.context_manager import UserContextManager
 from .summary_templates import SummaryTemplates
+from ...models.llm.token_counter import count_tokens
+from ...models.llm.context_packer import ContextPacker
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +44,8 @@ class DebateContextManager(UserContextManager):
         self.chunk_overlap = 300  # 청크간 오버랩 증대
         
         # 과도한 컨텍스트 보호 설정
-        self.max_processable_length = 50000  # 최대 처리 가능 길이 (50KB)
+        self.max_processable_tokens = 12000  # 최대 처리 가능 토큰 수 (요약 모델 토크나이저 기준)
+        self.token_model = "gpt-4"  # 토큰 계산 기준 모델 (요약 호출과 동일)
         self.max_chunks_per_level = 15  # 레벨당 최대 청크 수
         self.max_llm_calls = 25  # 최대 LLM 호출 횟수 제한
         
@@ -51,7 +54,7 @@ class DebateContextManager(UserContextManager):
         self.context_bullet_points = {}  # {context_id: [bullet_points]}
         
         logger.info(f"ContextManager initialized with enhanced safeguards")
-        logger.info(f"Max processable length: {self.max_processable_length:,} chars")
+        logger.info(f"Max processable tokens: {self.max_processable_tokens:,}")
         logger.info(f"Max LLM calls per request: {self.max_llm_calls}")
     
     def generate_summary(self, topic: str, context_type: str = None) -> Dict[str, str]:
@@ -91,9 +94,11 @@ class DebateContextManager(UserContextManager):
         context_length = len(combined_context)
         logger.info(f"Combined context length: {context_length:,} chars")
         
-        # 과도한 컨텍스트 길이 처리
-        if context_length > self.max_processable_length:
-            logger.warning(f"Context too long ({context_length:,} chars), truncating to {self.max_processable_length:,} chars")
+        # 과도한 컨텍스트 길이 처리 (토큰 기준)
+        context_tokens = self._estimate_tokens(combined_context)
+        if context_tokens > self.max_processable_tokens:
+            logger.warning(f"Context too long ({context_length:,} chars, {context_tokens:,} tokens), "
+                           f"truncating to {self.max_processable_tokens:,} tokens")
             combined_context = self._truncate_context_intelligently(combined_context)
             context_length = len(combined_context)
             logger.info(f"Truncated context length: {context_length:,} chars")
@@ -469,9 +474,9 @@ Format as bullet points (•). Be concise but informative.
     
     def _estimate_tokens(self, text: str) -> int:
         """
-        텍스트의 대략적인 토큰 수 추정 (1 토큰 ≈ 4자)
+        요약 모델 토크나이저 기준 토큰 수 (토크나이저를 쓸 수 없으면 근사치)
         """
-        return len(text) // 4
+        return count_tokens(text, self.token_model)
     
     def get_context_bullet_points(self, max_points: int = None) -> List[str]:
         """
@@ -743,62 +748,36 @@ Format as bullet points (•). Focus on the most important information.
     
     def _truncate_context_intelligently(self, context: str) -> str:
         """
-        컨텍스트를 지능적으로 자르기
-        - 앞부분 (도입부) 유지
-        - 중간 부분 압축
-        - 끝부분 (결론) 유지
+        컨텍스트를 토큰 예산에 맞춰 지능적으로 자르기
+        - 문단 단위로 ContextPacker에 넣고
+        - 앞부분 (도입부)과 끝부분 (결론)에 높은 우선순위를 주어
+        - 중간 부분부터 제거/압축
         """
-        target_length = self.max_processable_length
+        target_tokens = self.max_processable_tokens
         
-        if len(context) <= target_length:
+        if self._estimate_tokens(context) <= target_tokens:
             return context
         
-        # 앞부분 30%, 끝부분 30%, 중간 40% 비율로 분배
-        front_size = int(target_length * 0.3)
-        back_size = int(target_length * 0.3)
-        middle_size = target_length - front_size - back_size
-        
-        # 문단 단위로 자르기 시도
-        paragraphs = context.split('\n\n')
-        
-        # 앞부분 확보
-        front_text = ""
-        for para in paragraphs:
-            if len(front_text) + len(para) < front_size:
-                front_text += para + "\n\n"
-            else:
-                break
-        
-        # 끝부분 확보
-        back_text = ""
-        for para in reversed(paragraphs):
-            if len(back_text) + len(para) < back_size:
-                back_text = para + "\n\n" + back_text
-            else:
-                break
-        
-        # 중간 부분 샘플링
-        remaining_paras = paragraphs[len(front_text.split('\n\n')):len(paragraphs)-len(back_text.split('\n\n'))]
-        middle_text = ""
-        
-        if remaining_paras and middle_size > 0:
-            # 중간 문단들을 균등하게 샘플링
-            step = max(1, len(remaining_paras) // (middle_size // 200))  # 대략 200자당 1문단
-            sampled_paras = remaining_paras[::step]
-            
-            for para in sampled_paras:
-                if len(middle_text) + len(para) < middle_size:
-                    middle_text += para + "\n\n"
-                else:
-                    break
-        
-        truncated = front_text + middle_text + back_text
-        
-        # 여전히 너무 길면 단순 자르기
-        if len(truncated) > target_length:
-            truncated = truncated[:target_length]
-        
-        logger.info(f"Context truncated: {len(context):,} → {len(truncated):,} chars")
+        paragraphs = [para for para in context.split('\n\n') if para.strip()]
+        last_index = max(1, len(paragraphs) - 1)
+        
+        packer = ContextPacker(
+            model=self.token_model,
+            section_budgets={"evidence": None},
+            total_budget=target_tokens,
+            item_separator="\n\n"
+        )
+        for index, para in enumerate(paragraphs):
+            # 양 끝에서 멀어질수록 우선순위 하락 (도입부가 결론보다 약간 우선)
+            position = index / last_index
+            priority = max(1.0 - position, position - 0.01)
+            packer.add("evidence", para, priority=priority, label=f"paragraph[{index}]")
+        
+        packed = packer.pack()
+        truncated = packed.get("evidence")
+        
+        logger.info(f"Context truncated: {len(context):,} → {len(truncated):,} chars, "
+                    f"{packed.total_tokens:,} tokens ({len(packed.cut)} paragraphs cut)")
         return truncated.strip()
     
     def _select_most_important_chunks(self, chunks: List[str], max_chunks: int) -> List[str]:
@@ -4,6 +4,15 @@
 실시간으로 초기화 진행 상황을 추적하고 스트리밍할 수 있는 이벤트 시스템
 """
 
+from .event_bus import (
+    RoomEventBus,
+    Subscription,
+    BusEvent,
+    get_event_bus,
+    close_event_bus,
+    INITIALIZATION_EVENT_TOPIC,
+    TURN_EVENT_TOPIC
+)
 from .initialization_events import (
     InitializationEventType,
     InitializationEvent,
@@ -16,6 +25,13 @@ from .initialization_events import (
 )
 
 __all__ = [
+    'RoomEventBus',
+    'Subscription',
+    'BusEvent',
+    'get_event_bus',
+    'close_event_bus',
+    'INITIALIZATION_EVENT_TOPIC',
+    'TURN_EVENT_TOPIC',
     'InitializationEventType',
     'InitializationEvent', 
     'InitializationEventStream',
@@ -24,4 +40,4 @@ __all__ = [
     'cleanup_event_stream',
     'create_console_listener',
     'create_web_listener'
-] 
\ No newline at end of file
+]
@@ -0,0 +1,386 @@
+"""
+방 단위 비동기 이벤트 버스
+
+초기화 이벤트와 턴(발언) 이벤트를 구독자에게 비동기로 전달하는 이벤트 버스입니다.
+
+- publish()는 절대 블록되지 않습니다. 이벤트는 구독자별 제한 큐에 들어가고,
+  구독자별 전달 작업이 방 전용 스레드 풀(또는 구독자의 이벤트 루프)에서 순서대로 전달합니다.
+  방마다 풀이 따로 있으므로 한 방의 느린 구독자가 다른 방의 전달을 기다리게 하지 않습니다.
+- 큐가 가득 차면 구독자의 overflow 정책(drop_oldest / drop_newest / disconnect)에 따라
+  이벤트를 버리므로 느린 WebSocket 소비자가 토론 생성을 막지 않습니다.
+  이벤트를 잃으면 안 되는 구독자(메시지 콜백 등)는 keep 정책으로 제한을 넘겨도 보관하고 경고만 남기되,
+  keep_limit(기본 KEEP_QUEUE_LIMIT)까지 밀리면 오래된 이벤트부터 버리고 오류 로그를 남깁니다.
+- 히스토리는 고정 크기 링 버퍼라서 오래 진행되는 방에서도 메모리가 일정합니다.
+- 레지스트리는 약한 참조로 버스를 보관하므로 방(대화 인스턴스)이 사라지면 함께 정리됩니다.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Callable, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_SIZE = 256
+DEFAULT_QUEUE_SIZE = 100
+KEEP_QUEUE_LIMIT = 10000           # keep 정책이 보관하는 최대 이벤트 수 (넘으면 오래된 것부터 버림)
+KEEP_DROP_LOG_INTERVAL = 1000      # keep 상한에서 버릴 때 로그 간격 (첫 건 + N건마다)
+ROOM_DELIVERY_WORKERS = 4          # 방별 동기 구독자 전달 스레드 수
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "disconnect", "keep")
+
+# 토픽
+INITIALIZATION_EVENT_TOPIC = "initialization"
+TURN_EVENT_TOPIC = "turn"
+
+
+@dataclass
+class BusEvent:
+    """버스에 게시된 이벤트"""
+    seq: int
+    topic: str
+    payload: Any
+    timestamp: float
+
+
+class Subscription:
+    """
+    구독자 하나의 제한 큐와 전달 상태
+    """
+
+    def __init__(self, bus: 'RoomEventBus', callback: Callable[[Any], Any], topics: Optional[Iterable[str]] = None,
+                 max_queue: int = DEFAULT_QUEUE_SIZE, overflow: str = "drop_oldest",
+                 name: Optional[str] = None, loop: Optional[asyncio.AbstractEventLoop] = None,
+                 keep_limit: int = KEEP_QUEUE_LIMIT):
+        """
+        Subscription 초기화
+
+        Args:
+            bus: 소속 이벤트 버스
+            callback: 이벤트 payload를 받는 함수 (코루틴 함수면 loop에서 실행)
+            topics: 받을 토픽 (None이면 전체)
+            max_queue: 큐 최대 길이
+            overflow: 큐가 가득 찼을 때 정책
+            name: 통계/로그용 이름
+            loop: 코루틴 콜백을 실행할 이벤트 루프
+            keep_limit: keep 정책에서 보관하는 최대 이벤트 수 (max_queue보다 작으면 max_queue)
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.bus = bus
+        self.callback = callback
+        self.topics = frozenset(topics) if topics is not None else None
+        self.max_queue = max(1, max_queue)
+        self.overflow = overflow
+        self.keep_limit = max(self.max_queue, keep_limit)
+        self.name = name or getattr(callback, '__name__', 'subscriber')
+        self.loop = loop
+        self.is_async = asyncio.iscoroutinefunction(callback)
+        self.closed = False
+        self._queue: deque = deque()
+        self._scheduled = False
+        self._idle = threading.Event()
+        self._idle.set()
+        self._lock = threading.Lock()
+        self.stats = {"delivered": 0, "dropped": 0, "over_capacity": 0, "errors": 0, "max_depth": 0}
+
+    def accepts(self, topic: str) -> bool:
+        return not self.closed and (self.topics is None or topic in self.topics)
+
+    def offer(self, event: BusEvent) -> bool:
+        """
+        이벤트를 큐에 넣기 (블록하지 않음)
+
+        Returns:
+            큐에 들어갔는지 여부
+        """
+        with self._lock:
+            if self.closed:
+                return False
+            if len(self._queue) >= self.keep_limit and self.overflow == "keep":
+                # 상한까지 밀리면 오래된 이벤트부터 버림 (첫 건과 이후 일정 간격으로 로그)
+                self._queue.popleft()
+                self.stats["dropped"] += 1
+                if self.stats["dropped"] % KEEP_DROP_LOG_INTERVAL == 1:
+                    logger.error(f"Event subscriber {self.name} is {self.keep_limit} events behind in room "
+                                 f"{self.bus.room_id}, dropped {self.stats['dropped']} oldest events so far")
+            elif len(self._queue) >= self.max_queue and self.overflow == "keep":
+                # 버리지 않고 보관 (제한을 처음 넘을 때만 경고)
+                self.stats["over_capacity"] += 1
+                if len(self._queue) == self.max_queue:
+                    logger.warning(f"Event subscriber {self.name} is {self.max_queue} events behind in room "
+                                   f"{self.bus.room_id}, keeping events")
+            elif len(self._queue) >= self.max_queue:
+                self.stats["dropped"] += 1
+                if self.overflow == "drop_newest":
+                    return False
+                if self.overflow == "disconnect":
+                    self.closed = True
+                    self._queue.clear()
+                    logger.warning(f"Event subscriber {self.name} disconnected (queue full) in room {self.bus.room_id}")
+                    return False
+                self._queue.popleft()
+            self._queue.append(event)
+            self.stats["max_depth"] = max(self.stats["max_depth"], len(self._queue))
+            if self._scheduled:
+                return True
+            self._scheduled = True
+            self._idle.clear()
+        self._schedule()
+        return True
+
+    def _schedule(self) -> None:
+        try:
+            if self.is_async:
+                asyncio.run_coroutine_threadsafe(self._drain_async(), self.loop)
+            else:
+                self.bus.get_delivery_executor().submit(self._drain)
+        except Exception as e:
+            logger.error(f"Failed to schedule event delivery for {self.name}: {str(e)}")
+            with self._lock:
+                self._scheduled = False
+                self._queue.clear()
+                self._idle.set()
+
+    def _next(self) -> Optional[BusEvent]:
+        with self._lock:
+            if self._queue and not self.closed:
+                return self._queue.popleft()
+            self._scheduled = False
+            self._idle.set()
+            return None
+
+    def _record(self, ok: bool, error: Exception = None) -> None:
+        with self._lock:
+            if ok:
+                self.stats["delivered"] += 1
+            else:
+                self.stats["errors"] += 1
+        if error is not None:
+            logger.error(f"Error in event subscriber {self.name}: {str(error)}")
+
+    def _drain(self) -> None:
+        """큐를 비울 때까지 순서대로 전달 (스레드 풀에서 실행)"""
+        while True:
+            event = self._next()
+            if event is None:
+                return
+            try:
+                self.callback(event.payload)
+                self._record(True)
+            except Exception as e:
+                self._record(False, e)
+
+    async def _drain_async(self) -> None:
+        """큐를 비울 때까지 순서대로 전달 (구독자의 이벤트 루프에서 실행)"""
+        while True:
+            event = self._next()
+            if event is None:
+                return
+            try:
+                await self.callback(event.payload)
+                self._record(True)
+            except Exception as e:
+                self._record(False, e)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """큐가 빌 때까지 대기 (테스트/종료용)"""
+        return self._idle.wait(timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            self.closed = True
+            self._queue.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "name": self.name,
+                "topics": sorted(self.topics) if self.topics is not None else None,
+                "queue_depth": len(self._queue),
+                "max_queue": self.max_queue,
+                "overflow": self.overflow,
+                "closed": self.closed
+            }
+
+
+class RoomEventBus:
+    """
+    방 단위 이벤트 버스 (링 버퍼 히스토리 + 구독자별 제한 큐 + 방 전용 전달 스레드 풀)
+    """
+
+    def __init__(self, room_id: str, history_size: int = DEFAULT_HISTORY_SIZE,
+                 default_queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        RoomEventBus 초기화
+
+        Args:
+            room_id: 방 ID
+            history_size: 보관할 최근 이벤트 수
+            default_queue_size: 구독자 큐 기본 크기
+        """
+        self.room_id = room_id
+        self.default_queue_size = default_queue_size
+        self._history: deque = deque(maxlen=history_size)
+        self._subscriptions: List[Subscription] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.closed = False
+
+    def get_delivery_executor(self) -> ThreadPoolExecutor:
+        """이 방의 동기 구독자 전달용 스레드 풀 (처음 사용할 때 생성, 스레드는 필요할 때만 늘어남)"""
+        with self._lock:
+            if self.closed:
+                raise RuntimeError(f"Event bus for room {self.room_id} is closed")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=ROOM_DELIVERY_WORKERS,
+                                                    thread_name_prefix=f"event-bus-{self.room_id}")
+            return self._executor
+
+    def subscribe(self, callback: Callable[[Any], Any], topics: Optional[Iterable[str]] = None,
+                  max_queue: Optional[int] = None, overflow: str = "drop_oldest",
+                  name: Optional[str] = None, loop: Optional[asyncio.AbstractEventLoop] = None,
+                  keep_limit: int = KEEP_QUEUE_LIMIT) -> Subscription:
+        """
+        구독자 등록
+
+        Args:
+            callback: 이벤트 payload를 받는 함수 또는 코루틴 함수
+            topics: 받을 토픽 (None이면 전체)
+            max_queue: 큐 최대 길이 (None이면 버스 기본값)
+            overflow: "drop_oldest" | "drop_newest" | "disconnect" | "keep" (버리지 않음)
+            name: 통계/로그용 이름
+            loop: 코루틴 콜백을 실행할 루프 (None이면 현재 실행 중인 루프)
+            keep_limit: keep 정책에서 보관하는 최대 이벤트 수
+
+        Returns:
+            Subscription
+        """
+        if asyncio.iscoroutinefunction(callback) and loop is None:
+            loop = asyncio.get_running_loop()
+        subscription = Subscription(self, callback, topics, max_queue or self.default_queue_size,
+                                    overflow, name, loop, keep_limit)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription_or_callback: Any) -> bool:
+        """구독 해제 (Subscription 또는 등록한 콜백)"""
+        with self._lock:
+            for subscription in list(self._subscriptions):
+                if subscription is subscription_or_callback or subscription.callback == subscription_or_callback:
+                    self._subscriptions.remove(subscription)
+                    subscription.close()
+                    return True
+        return False
+
+    def publish(self, topic: str, payload: Any) -> BusEvent:
+        """
+        이벤트 게시 (블록하지 않음)
+
+        Args:
+            topic: 토픽 (예: "initialization", "turn")
+            payload: 구독자에게 전달할 객체
+
+        Returns:
+            게시된 BusEvent
+        """
+        with self._lock:
+            self._seq += 1
+            event = BusEvent(self._seq, topic, payload, time.time())
+            self._history.append(event)
+            subscriptions = [s for s in self._subscriptions if s.accepts(topic)]
+        for subscription in subscriptions:
+            subscription.offer(event)
+        return event
+
+    def get_history(self, topic: Optional[str] = None, limit: Optional[int] = None) -> List[BusEvent]:
+        """링 버퍼에 남아 있는 최근 이벤트"""
+        with self._lock:
+            events = [event for event in self._history if topic is None or event.topic == topic]
+        return events[-limit:] if limit else events
+
+    @property
+    def subscriptions(self) -> List[Subscription]:
+        with self._lock:
+            return list(self._subscriptions)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """모든 구독자 큐가 빌 때까지 대기 (테스트/종료용, 이벤트 루프 스레드에서 호출하지 말 것)"""
+        deadline = time.monotonic() + timeout
+        for subscription in self.subscriptions:
+            if not subscription.wait_idle(max(0.0, deadline - time.monotonic())):
+                return False
+        return True
+
+    def close(self) -> None:
+        """모든 구독 해제 및 히스토리 정리"""
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+            self._history.clear()
+            self.closed = True
+            executor, self._executor = self._executor, None
+        for subscription in subscriptions:
+            subscription.close()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """버스/구독자 통계"""
+        with self._lock:
+            published = self._seq
+            history = len(self._history)
+            subscriptions = list(self._subscriptions)
+        return {
+            "room_id": self.room_id,
+            "published": published,
+            "history_size": history,
+            "history_capacity": self._history.maxlen,
+            "subscribers": [subscription.get_stats() for subscription in subscriptions]
+        }
+
+
+# 전역 버스 레지스트리 (약한 참조 - 버스를 가진 대화 인스턴스가 사라지면 자동 제거)
+_event_buses: 'weakref.WeakValueDictionary[str, RoomEventBus]' = weakref.WeakValueDictionary()
+_event_buses_lock = threading.Lock()
+
+
+def get_event_bus(room_id: str) -> RoomEventBus:
+    """방 ID에 대한 이벤트 버스 가져오기 (호출자가 참조를 보관해야 유지됨)"""
+    with _event_buses_lock:
+        bus = _event_buses.get(room_id)
+        if bus is None or bus.closed:
+            bus = RoomEventBus(room_id)
+            _event_buses[room_id] = bus
+        return bus
+
+
+def close_event_bus(room_id: str, bus: Optional[RoomEventBus] = None) -> None:
+    """
+    이벤트 버스 닫기 및 레지스트리에서 제거
+
+    Args:
+        room_id: 방 ID
+        bus: 닫을 버스 (지정하면 레지스트리의 버스가 같은 객체일 때만 제거 -
+             같은 방이 다시 만들어진 뒤 이전 인스턴스가 정리되어도 새 버스를 닫지 않음)
+    """
+    with _event_buses_lock:
+        registered = _event_buses.get(room_id)
+        if bus is None or registered is bus:
+            _event_buses.pop(room_id, None)
+        bus = bus or registered
+    if bus is not None and not bus.closed:
+        bus.close()
+        logger.info(f"Closed event bus for room {room_id}")
+
+
+def active_event_bus_count() -> int:
+    """레지스트리에 남아 있는 버스 수"""
+    with _event_buses_lock:
+        return len(_event_buses)
@@ -6,10 +6,16 @@
 
 import asyncio
 import time
-from typing import Dict, Any, List, Callable, Optional
+import weakref
+from collections import deque
+from typing import Dict, Any, List, Callable, Optional, Deque
 from enum import Enum
 import logging
 
+from .event_bus import (
+    RoomEventBus, get_event_bus, close_event_bus, DEFAULT_HISTORY_SIZE, INITIALIZATION_EVENT_TOPIC
+)
+
 logger = logging.getLogger(__name__)
 
 class InitializationEventType(Enum):
@@ -33,44 +39,47 @@ class InitializationEvent:
         self.event_id = f"{event_type.value}_{int(self.timestamp * 1000)}"
 
 class InitializationEventStream:
-    """초기화 이벤트 스트림 관리자"""
+    """초기화 이벤트 스트림 관리자 (방 이벤트 버스의 "initialization" 토픽)"""
+    
+    TOPIC = INITIALIZATION_EVENT_TOPIC
     
-    def __init__(self, room_id: str):
+    def __init__(self, room_id: str, bus: Optional[RoomEventBus] = None, history_size: int = DEFAULT_HISTORY_SIZE):
         self.room_id = room_id
-        self.listeners: List[Callable[[InitializationEvent], None]] = []
-        self.event_history: List[InitializationEvent] = []
+        self.bus = bus or get_event_bus(room_id)
+        self.event_history: Deque[InitializationEvent] = deque(maxlen=history_size)
         self.current_progress = 0.0
         self.total_tasks = 0
         self.completed_tasks = 0
         self.failed_tasks = 0
         self.start_time = None
         self.is_active = False
+    
+    @property
+    def listeners(self) -> List[Callable[[InitializationEvent], None]]:
+        """등록된 리스너 목록"""
+        return [s.callback for s in self.bus.subscriptions if s.topics and self.TOPIC in s.topics]
         
-    def add_listener(self, listener: Callable[[InitializationEvent], None]):
-        """이벤트 리스너 추가"""
-        self.listeners.append(listener)
+    def add_listener(self, listener: Callable[[InitializationEvent], None], max_queue: Optional[int] = None,
+                     overflow: str = "drop_oldest"):
+        """이벤트 리스너 추가 (리스너별 제한 큐로 비동기 전달)"""
+        self.bus.subscribe(listener, topics=[self.TOPIC], max_queue=max_queue, overflow=overflow)
         logger.info(f"Added event listener for room {self.room_id}")
     
     def remove_listener(self, listener: Callable[[InitializationEvent], None]):
         """이벤트 리스너 제거"""
-        if listener in self.listeners:
-            self.listeners.remove(listener)
+        if self.bus.unsubscribe(listener):
             logger.info(f"Removed event listener for room {self.room_id}")
     
     def emit_event(self, event_type: InitializationEventType, data: Dict[str, Any]):
-        """이벤트 발생"""
+        """이벤트 발생 (리스너 호출을 기다리지 않음)"""
         event = InitializationEvent(event_type, data)
         self.event_history.append(event)
         
         # 진행률 업데이트
         self._update_progress(event)
         
-        # 모든 리스너에게 이벤트 전달
-        for listener in self.listeners:
-            try:
-                listener(event)
-            except Exception as e:
-                logger.error(f"Error in event listener: {str(e)}")
+        # 리스너별 큐에 넣고 바로 반환
+        self.bus.publish(self.TOPIC, event)
         
         logger.debug(f"Emitted event {event_type.value} for room {self.room_id}")
     
@@ -209,19 +218,22 @@ class TaskProgressTracker:
             }
         )
 
-# 전역 이벤트 스트림 관리자
-_event_streams: Dict[str, InitializationEventStream] = {}
+# 전역 이벤트 스트림 관리자 (약한 참조 - 스트림을 가진 대화 인스턴스가 사라지면 자동 제거)
+_event_streams: 'weakref.WeakValueDictionary[str, InitializationEventStream]' = weakref.WeakValueDictionary()
 
 def get_event_stream(room_id: str) -> InitializationEventStream:
     """방 ID에 대한 이벤트 스트림 가져오기"""
-    if room_id not in _event_streams:
-        _event_streams[room_id] = InitializationEventStream(room_id)
-    return _event_streams[room_id]
+    stream = _event_streams.get(room_id)
+    if stream is None:
+        stream = InitializationEventStream(room_id)
+        _event_streams[room_id] = stream
+    return stream
 
 def cleanup_event_stream(room_id: str):
-    """이벤트 스트림 정리"""
-    if room_id in _event_streams:
-        del _event_streams[room_id]
+    """이벤트 스트림 및 방 이벤트 버스 정리"""
+    stream = _event_streams.pop(room_id, None)
+    if stream is not None:
+        close_event_bus(room_id, stream.bus)
         logger.info(f"Cleaned up event stream for room {room_id}")
 
 # 편의 함수들
@@ -1,13 +1,33 @@
 """
 대화 관리자 모듈
 
-사용자 관리, 세션 관리, 권한 관리 등을 담당하는 관리자 클래스들
+사용자 관리, 세션 관리, 권한 관리, 토론방 입장 제어, 턴 직렬화, 다중 워커 방 소유권 등을 담당하는 관리자 클래스들
 """
 
 from .user_manager import UserManager, UserSession, get_user_manager
+from .room_admission import (
+    RoomAdmissionController,
+    AdmissionConfig,
+    AdmissionDecision,
+    RoomResourceUsage,
+    RoomSnapshotStore
+)
+from .turn_coordinator import TurnCoordinator, TurnTicket, TurnDecision
+from .room_ownership import RoomOwnershipRegistry, RoomLease, RoomAffinityMiddleware
 
 __all__ = [
     'UserManager',
     'UserSession', 
-    'get_user_manager'
-] 
\ No newline at end of file
+    'get_user_manager',
+    'RoomAdmissionController',
+    'AdmissionConfig',
+    'AdmissionDecision',
+    'RoomResourceUsage',
+    'RoomSnapshotStore',
+    'TurnCoordinator',
+    'TurnTicket',
+    'TurnDecision',
+    'RoomOwnershipRegistry',
+    'RoomLease',
+    'RoomAffinityMiddleware'
+]
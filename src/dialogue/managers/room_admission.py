@@ -0,0 +1,567 @@
+"""
+토론방 입장 제어 / 스필 관리자
+
+토론방마다 벡터 저장소 크기, 캐시된 입론, 발언 히스토리 길이, 진행 중 작업 수를 계정(accounting)하고
+그 합계로 새 방의 입장 여부를 결정합니다.
+
+- 용량이 남아 있으면 새 방에 예상 비용을 즉시 예약하고 입장시킵니다.
+  (생성 중인 방도 용량에 포함되므로 방 생성이 몰려도 모니터 주기를 기다리지 않음)
+- 용량이 부족하면 제한된 대기열에서 잠시 기다리고, 대기열이 가득 차거나 시간이 지나면
+  retry_after와 함께 거절합니다.
+- 용량이 부족할 때는 오래 쉬고 있지만 사용자가 남아 있는 방을 스냅샷으로 내보내고(spill)
+  메모리에서 내립니다. 스냅샷은 다음 요청 때 복원됩니다.
+- 입장/대기/거절/스필/복원 결정은 모두 메트릭으로 집계됩니다.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Callable
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 ** 2
+GB = 1024 ** 3
+
+# 문자열/임베딩 메모리 추정 계수
+BYTES_PER_CHAR = 4
+BYTES_PER_EMBEDDING_VALUE = 4  # float32
+
+
+@dataclass
+class RoomResourceUsage:
+    """토론방 하나의 리소스 사용량"""
+    room_id: str
+    vector_documents: int = 0
+    vector_bytes: int = 0
+    cached_arguments: int = 0
+    cached_argument_bytes: int = 0
+    history_length: int = 0
+    history_bytes: int = 0
+    inflight_tasks: int = 0
+    base_bytes: int = 0  # 에이전트/LLM 클라이언트 등 방 고정 비용
+
+    @property
+    def estimated_bytes(self) -> int:
+        """방 전체 추정 메모리 (bytes)"""
+        return self.base_bytes + self.vector_bytes + self.cached_argument_bytes + self.history_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["estimated_mb"] = round(self.estimated_bytes / MB, 2)
+        return data
+
+    @classmethod
+    def from_dialogue(cls, room_id: str, dialogue: Any, base_bytes: int = 0) -> 'RoomResourceUsage':
+        """
+        대화 인스턴스의 get_resource_usage()로 사용량 계정
+
+        Args:
+            room_id: 방 ID
+            dialogue: 대화 인스턴스 (get_resource_usage가 없으면 고정 비용만 계정)
+            base_bytes: 방 고정 비용
+        """
+        usage = {}
+        if hasattr(dialogue, 'get_resource_usage'):
+            try:
+                usage = dialogue.get_resource_usage() or {}
+            except Exception as e:
+                logger.error(f"❌ Resource accounting failed for room {room_id}: {str(e)}")
+        known = {key: value for key, value in usage.items()
+                 if key in cls.__dataclass_fields__ and key not in ("room_id", "base_bytes")}
+        return cls(room_id=room_id, base_bytes=base_bytes, **known)
+
+
+@dataclass
+class AdmissionDecision:
+    """입장 결정"""
+    status: str  # "admitted" | "rejected"
+    reason: str
+    retry_after: Optional[int] = None  # 초 (거절 시)
+    waited_seconds: float = 0.0
+
+    @property
+    def admitted(self) -> bool:
+        return self.status == "admitted"
+
+
+@dataclass
+class AdmissionConfig:
+    """입장 제어 설정"""
+    max_rooms: int = 50
+    memory_budget_gb: float = 8.0       # 계정된 방 + 예약 합계 상한
+    max_rss_gb: Optional[float] = None  # 프로세스 RSS 상한 (None이면 RSS는 보지 않음)
+    room_base_mb: float = 64.0          # 새 방 예약 비용 (관측된 평균이 더 크면 평균 사용)
+    max_queue: int = 16                 # 용량 대기열 최대 길이
+    queue_timeout_seconds: float = 10.0
+    default_retry_after_seconds: int = 30
+    idle_spill_seconds: float = 900.0   # 이 시간 이상 쉬는 방은 스필 대상
+    pressure_idle_seconds: float = 120.0  # 용량 압박 시에는 이 시간만 쉬어도 스필 대상
+    spill_target_ratio: float = 0.8     # 스필 후 목표 사용률
+
+
+class RoomAdmissionController:
+    """
+    토론방 리소스 계정 / 입장 제어 / 스필 후보 선정
+    """
+
+    def __init__(self, config: Optional[AdmissionConfig] = None,
+                 rss_probe: Optional[Callable[[], float]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        RoomAdmissionController 초기화
+
+        Args:
+            config: 입장 제어 설정
+            rss_probe: 현재 프로세스 RSS(GB)를 반환하는 함수
+            clock: 시간 함수 (테스트용)
+        """
+        self.config = config or AdmissionConfig()
+        self._rss_probe = rss_probe
+        self._clock = clock
+        self._usage: Dict[str, RoomResourceUsage] = {}
+        self._reservations: Dict[str, int] = {}
+        self._last_activity: Dict[str, float] = {}
+        self._inflight: Dict[str, int] = {}
+        self._waiters: deque = deque()  # (loop, future)
+        self._lock = threading.RLock()
+        self.stats = {
+            "admitted": 0,
+            "admitted_after_wait": 0,
+            "queued": 0,
+            "rejected": 0,
+            "spilled": 0,
+            "spilled_bytes": 0,
+            "restored": 0,
+            "released": 0
+        }
+        self._rejections: Dict[str, int] = {}
+        self._recent_decisions: deque = deque(maxlen=50)
+
+    # ------------------------------------------------------------------
+    # 용량 계산
+    # ------------------------------------------------------------------
+
+    @property
+    def budget_bytes(self) -> int:
+        return int(self.config.memory_budget_gb * GB)
+
+    def room_cost_estimate(self) -> int:
+        """새 방 예약 비용 (설정값과 관측된 방 평균 중 큰 값)"""
+        base = int(self.config.room_base_mb * MB)
+        with self._lock:
+            if not self._usage:
+                return base
+            average = sum(u.estimated_bytes for u in self._usage.values()) // len(self._usage)
+        return max(base, average)
+
+    def committed_bytes(self) -> int:
+        """계정된 방 + 생성 중 예약 합계"""
+        with self._lock:
+            return sum(u.estimated_bytes for u in self._usage.values()) + sum(self._reservations.values())
+
+    def room_count(self) -> int:
+        with self._lock:
+            return len(self._usage) + len(self._reservations)
+
+    def _blocking_reason(self, extra_bytes: int) -> Optional[str]:
+        """새 방을 받을 수 없는 이유 (받을 수 있으면 None)"""
+        if self.room_count() >= self.config.max_rooms:
+            return "max_rooms"
+        if self.committed_bytes() + extra_bytes > self.budget_bytes:
+            return "memory_budget"
+        if self._rss_probe is not None and self.config.max_rss_gb is not None:
+            try:
+                if self._rss_probe() >= self.config.max_rss_gb:
+                    return "rss"
+            except Exception as e:
+                logger.error(f"❌ RSS probe failed: {str(e)}")
+        return None
+
+    def would_block(self) -> bool:
+        """지금 새 방을 요청하면 막히는지 여부"""
+        return self._blocking_reason(self.room_cost_estimate()) is not None
+
+    def under_pressure(self) -> bool:
+        """스필이 필요한 압박 상태인지 (목표 사용률 초과 또는 새 방을 받을 수 없음)"""
+        ratio = self.config.spill_target_ratio
+        return (self.committed_bytes() > self.budget_bytes * ratio
+                or self.room_count() > self.config.max_rooms * ratio
+                or self.would_block())
+
+    # ------------------------------------------------------------------
+    # 입장 제어
+    # ------------------------------------------------------------------
+
+    def try_admit(self, room_id: str) -> AdmissionDecision:
+        """
+        대기 없이 입장 시도 (성공하면 예상 비용을 예약)
+
+        Args:
+            room_id: 새 방 ID
+
+        Returns:
+            AdmissionDecision
+        """
+        cost = self.room_cost_estimate()
+        with self._lock:
+            if room_id in self._usage or room_id in self._reservations:
+                return self._record(room_id, AdmissionDecision("admitted", "already_admitted"))
+            reason = self._blocking_reason(cost)
+            if reason is None:
+                self._reservations[room_id] = cost
+                self._last_activity[room_id] = self._clock()
+                self.stats["admitted"] += 1
+                return self._record(room_id, AdmissionDecision("admitted", "capacity"))
+        return AdmissionDecision("rejected", reason, retry_after=self.estimate_retry_after())
+
+    async def admit(self, room_id: str, timeout: Optional[float] = None) -> AdmissionDecision:
+        """
+        입장 시도, 용량이 없으면 대기열에서 기다림
+
+        Args:
+            room_id: 새 방 ID
+            timeout: 최대 대기 시간 (None이면 설정값)
+
+        Returns:
+            AdmissionDecision (거절 시 retry_after 포함)
+        """
+        decision = self.try_admit(room_id)
+        if decision.admitted:
+            return decision
+
+        with self._lock:
+            if len(self._waiters) >= self.config.max_queue:
+                return self._reject(room_id, "queue_full")
+            loop = asyncio.get_running_loop()
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+            self.stats["queued"] += 1
+
+        timeout = self.config.queue_timeout_seconds if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return self._reject(room_id, f"queue_timeout_{decision.reason}",
+                                        waited=time.monotonic() - started)
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter[1]), remaining)
+                except asyncio.TimeoutError:
+                    continue
+                decision = self.try_admit(room_id)
+                if decision.admitted:
+                    decision.waited_seconds = time.monotonic() - started
+                    with self._lock:
+                        self.stats["admitted_after_wait"] += 1
+                    return decision
+                # 다른 대기자가 먼저 자리를 가져감 - 다시 줄 서기
+                with self._lock:
+                    waiter = (loop, loop.create_future())
+                    self._waiters.appendleft(waiter)
+        finally:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _wake_next(self) -> None:
+        """대기 중인 요청 하나를 깨움"""
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                if not future.done():
+                    loop.call_soon_threadsafe(lambda f=future: f.done() or f.set_result(None))
+                    return
+
+    def _reject(self, room_id: str, reason: str, waited: float = 0.0) -> AdmissionDecision:
+        decision = AdmissionDecision("rejected", reason, retry_after=self.estimate_retry_after(),
+                                     waited_seconds=waited)
+        with self._lock:
+            self.stats["rejected"] += 1
+            self._rejections[reason] = self._rejections.get(reason, 0) + 1
+        logger.warning(f"🚫 Room {room_id} rejected ({reason}), retry after {decision.retry_after}s")
+        return self._record(room_id, decision)
+
+    def _record(self, room_id: str, decision: AdmissionDecision) -> AdmissionDecision:
+        with self._lock:
+            self._recent_decisions.append({
+                "room_id": room_id,
+                "status": decision.status,
+                "reason": decision.reason,
+                "retry_after": decision.retry_after,
+                "waited_seconds": round(decision.waited_seconds, 3),
+                "timestamp": time.time()
+            })
+        return decision
+
+    def estimate_retry_after(self) -> int:
+        """
+        거절된 요청에 돌려줄 재시도 시간 (초)
+
+        가장 먼저 스필 대상이 될 방이 스필 가능해지는 시점을 기준으로 하고,
+        후보가 없으면 기본값을 사용합니다.
+        """
+        now = self._clock()
+        with self._lock:
+            waits = [
+                max(0.0, self.config.pressure_idle_seconds - (now - self._last_activity.get(room_id, now)))
+                for room_id in self._usage
+                if self._inflight.get(room_id, 0) == 0
+            ]
+        if not waits:
+            return self.config.default_retry_after_seconds
+        return int(min(max(1.0, min(waits)), self.config.default_retry_after_seconds * 10))
+
+    # ------------------------------------------------------------------
+    # 계정 / 활동 추적
+    # ------------------------------------------------------------------
+
+    def commit(self, room_id: str, usage: RoomResourceUsage) -> None:
+        """방 생성(복원) 완료 - 예약을 실제 사용량으로 교체"""
+        with self._lock:
+            self._reservations.pop(room_id, None)
+            self._usage[room_id] = usage
+            self._last_activity.setdefault(room_id, self._clock())
+
+    def account(self, room_id: str, usage: RoomResourceUsage) -> None:
+        """활성 방의 사용량 갱신 (입장하지 않은 방은 무시)"""
+        with self._lock:
+            if room_id in self._usage:
+                usage.inflight_tasks = max(usage.inflight_tasks, self._inflight.get(room_id, 0))
+                self._usage[room_id] = usage
+
+    def release(self, room_id: str, reason: str = "released", spilled: bool = False) -> None:
+        """
+        방이 메모리에서 내려감 (정리/스필/생성 실패) - 대기자를 깨움
+
+        Args:
+            room_id: 방 ID
+            reason: 해제 사유 (로그용)
+            spilled: 스냅샷으로 내보낸 경우 True
+        """
+        with self._lock:
+            usage = self._usage.pop(room_id, None)
+            reserved = self._reservations.pop(room_id, None)
+            self._last_activity.pop(room_id, None)
+            self._inflight.pop(room_id, None)
+            if usage is None and reserved is None:
+                return
+            if spilled:
+                self.stats["spilled"] += 1
+                self.stats["spilled_bytes"] += usage.estimated_bytes if usage else 0
+            else:
+                self.stats["released"] += 1
+        logger.info(f"📉 Room {room_id} released from admission accounting ({reason})")
+        self._wake_next()
+
+    def record_restore(self, room_id: str) -> None:
+        """스냅샷에서 복원된 방 기록"""
+        with self._lock:
+            self.stats["restored"] += 1
+
+    def touch(self, room_id: str) -> None:
+        """방 활동 시간 갱신"""
+        with self._lock:
+            if room_id in self._usage or room_id in self._reservations:
+                self._last_activity[room_id] = self._clock()
+
+    def begin_task(self, room_id: str) -> None:
+        """방의 진행 중 작업 시작 (진행 중 작업이 있는 방은 스필하지 않음)"""
+        with self._lock:
+            self._inflight[room_id] = self._inflight.get(room_id, 0) + 1
+            if room_id in self._usage or room_id in self._reservations:
+                self._last_activity[room_id] = self._clock()
+
+    def end_task(self, room_id: str) -> None:
+        """방의 진행 중 작업 종료"""
+        with self._lock:
+            count = self._inflight.get(room_id, 0) - 1
+            if count > 0:
+                self._inflight[room_id] = count
+            else:
+                self._inflight.pop(room_id, None)
+            if room_id in self._usage:
+                self._last_activity[room_id] = self._clock()
+
+    def is_busy(self, room_id: str) -> bool:
+        with self._lock:
+            usage = self._usage.get(room_id)
+            return self._inflight.get(room_id, 0) > 0 or bool(usage and usage.inflight_tasks > 0)
+
+    # ------------------------------------------------------------------
+    # 스필 후보 선정
+    # ------------------------------------------------------------------
+
+    def select_spill_candidates(self, live_rooms: Optional[set] = None) -> List[str]:
+        """
+        스냅샷으로 내보낼 방 선택
+
+        - 진행 중 작업이 있는 방은 제외합니다.
+        - 평상시에는 idle_spill_seconds 이상 쉰 방을 모두 선택합니다.
+        - 압박 상태에서는 pressure_idle_seconds 이상 쉰 방을 오래 쉰 순(같으면 큰 방 먼저)으로
+          목표 사용률 아래로 내려갈 때까지 선택합니다.
+
+        Args:
+            live_rooms: 사용자가 남아 있는 방 (지정하면 이 방들만 후보)
+
+        Returns:
+            스필할 방 ID 목록
+        """
+        now = self._clock()
+        pressure = self.under_pressure()
+        with self._lock:
+            candidates = []
+            for room_id, usage in self._usage.items():
+                if live_rooms is not None and room_id not in live_rooms:
+                    continue
+                if self._inflight.get(room_id, 0) > 0 or usage.inflight_tasks > 0:
+                    continue
+                idle = now - self._last_activity.get(room_id, now)
+                candidates.append((idle, usage.estimated_bytes, room_id))
+            committed = sum(u.estimated_bytes for u in self._usage.values()) + sum(self._reservations.values())
+            rooms = len(self._usage) + len(self._reservations)
+
+        candidates.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        target_bytes = self.budget_bytes * self.config.spill_target_ratio
+        target_rooms = self.config.max_rooms * self.config.spill_target_ratio
+
+        selected = []
+        for idle, size, room_id in candidates:
+            if idle >= self.config.idle_spill_seconds:
+                selected.append(room_id)
+            elif pressure and idle >= self.config.pressure_idle_seconds and (
+                    committed > target_bytes or rooms > target_rooms or self.would_block()):
+                selected.append(room_id)
+            else:
+                continue
+            committed -= size
+            rooms -= 1
+        return selected
+
+    # ------------------------------------------------------------------
+    # 메트릭
+    # ------------------------------------------------------------------
+
+    def get_room_usage(self, room_id: str) -> Optional[RoomResourceUsage]:
+        with self._lock:
+            return self._usage.get(room_id)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """입장/스필 결정 및 계정 현황"""
+        now = self._clock()
+        with self._lock:
+            rooms = {
+                room_id: {
+                    **usage.to_dict(),
+                    "inflight_tasks": max(usage.inflight_tasks, self._inflight.get(room_id, 0)),
+                    "idle_seconds": round(now - self._last_activity.get(room_id, now), 1)
+                }
+                for room_id, usage in self._usage.items()
+            }
+            metrics = {
+                **self.stats,
+                "rejections_by_reason": dict(self._rejections),
+                "queue_depth": len(self._waiters),
+                "active_rooms": len(self._usage),
+                "reserved_rooms": len(self._reservations),
+                "reserved_mb": round(sum(self._reservations.values()) / MB, 2),
+                "recent_decisions": list(self._recent_decisions)
+            }
+        committed = self.committed_bytes()
+        metrics.update({
+            "committed_mb": round(committed / MB, 2),
+            "budget_mb": round(self.budget_bytes / MB, 2),
+            "utilization": round(committed / self.budget_bytes, 3) if self.budget_bytes else 0.0,
+            "max_rooms": self.config.max_rooms,
+            "room_cost_estimate_mb": round(self.room_cost_estimate() / MB, 2),
+            "under_pressure": self.under_pressure(),
+            "rooms": rooms
+        })
+        return metrics
+
+
+class RoomSnapshotStore:
+    """
+    스필된 토론방 스냅샷 저장소 (Redis가 있으면 Redis, 없으면 로컬 JSON 파일)
+    """
+
+    def __init__(self, directory: str = "data/room_snapshots", redis_client: Any = None,
+                 ttl_seconds: int = 86400):
+        """
+        RoomSnapshotStore 초기화
+
+        Args:
+            directory: 로컬 스냅샷 디렉토리
+            redis_client: Redis 클라이언트 (다중 서버에서 스냅샷 공유)
+            ttl_seconds: 스냅샷 보관 시간
+        """
+        self.directory = directory
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        if redis_client is None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, room_id: str) -> str:
+        safe_id = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in str(room_id))
+        return os.path.join(self.directory, f"{safe_id}.json")
+
+    def save(self, room_id: str, snapshot: Dict[str, Any]) -> bool:
+        """스냅샷 저장"""
+        try:
+            payload = json.dumps(snapshot, ensure_ascii=False, default=str)
+            if self.redis_client is not None:
+                self.redis_client.set(f"room_snapshot:{room_id}", payload, ex=self.ttl_seconds)
+            else:
+                path = self._path(room_id)
+                temp_path = f"{path}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(temp_path, path)
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to save snapshot for room {room_id}: {str(e)}")
+            return False
+
+    def load(self, room_id: str) -> Optional[Dict[str, Any]]:
+        """스냅샷 조회 (없으면 None)"""
+        try:
+            if self.redis_client is not None:
+                payload = self.redis_client.get(f"room_snapshot:{room_id}")
+            else:
+                path = self._path(room_id)
+                if not os.path.exists(path):
+                    return None
+                with open(path, 'r', encoding='utf-8') as f:
+                    payload = f.read()
+            return json.loads(payload) if payload else None
+        except Exception as e:
+            logger.error(f"❌ Failed to load snapshot for room {room_id}: {str(e)}")
+            return None
+
+    def exists(self, room_id: str) -> bool:
+        if self.redis_client is not None:
+            try:
+                return bool(self.redis_client.exists(f"room_snapshot:{room_id}"))
+            except Exception as e:
+                logger.error(f"❌ Failed to check snapshot for room {room_id}: {str(e)}")
+                return False
+        return os.path.exists(self._path(room_id))
+
+    def delete(self, room_id: str) -> None:
+        """스냅샷 삭제"""
+        try:
+            if self.redis_client is not None:
+                self.redis_client.delete(f"room_snapshot:{room_id}")
+            else:
+                path = self._path(room_id)
+                if os.path.exists(path):
+                    os.remove(path)
+        except Exception as e:
+            logger.error(f"❌ Failed to delete snapshot for room {room_id}: {str(e)}")
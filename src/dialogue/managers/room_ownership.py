@@ -0,0 +1,628 @@
+"""
+토론방 소유권 리스 레지스트리와 방 친화(room-affinity) 라우팅
+
+여러 API 워커(uvicorn 프로세스/서버)가 있을 때 토론방 인스턴스(DebateDialogue)는
+한 워커의 메모리에만 존재해야 합니다.
+
+- Redis에 방별 리스 키(room_owner:room:{room_id})를 두고 SET NX PX로 소유권을 얻습니다.
+  값에는 소유 워커 ID, 워커 URL, 리스를 얻을 때마다 증가하는 epoch(펜싱 토큰)를 저장합니다.
+- 소유 워커는 주기적으로 리스를 갱신하고, 갱신이 끊기면(워커 종료/장애) 리스가 만료되어
+  다음 요청을 받은 워커가 WATCH/MULTI 비교-교환으로 소유권을 이어받습니다.
+  새 소유자는 스냅샷 저장소에서 방을 복원합니다.
+- RoomAffinityMiddleware는 요청 경로(/debate/{room_id}/...)나 방 생성 요청 본문에서 room_id를
+  꺼내 소유 워커로 요청을 전달합니다. 전달된 요청은 다시 전달하지 않습니다(루프 방지).
+- Redis가 없으면 비활성(단일 워커) 모드로 동작하며 모든 요청을 로컬에서 처리합니다.
+- 워커 URL은 워커마다 고유해야 합니다. URL이 없거나 다른 살아 있는 워커가 같은 URL을
+  등록(room_owner:worker:{url})해 두었으면 레지스트리를 비활성화합니다. 따라서 같은 URL의
+  리스를 가진 다른 worker_id는 재시작 전의 이 워커이며, 만료를 기다리지 않고 이어받습니다.
+"""
+
+import re
+import json
+import math
+import time
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+
+logger = logging.getLogger(__name__)
+
+FORWARDED_BY_HEADER = "x-room-forwarded-by"
+OWNER_HEADER = "x-room-owner"
+
+# 요청 헤더 중 전달하지 않는 홉 단위 헤더
+_HOP_HEADERS = {
+    "host", "connection", "keep-alive", "proxy-connection", "transfer-encoding",
+    "upgrade", "te", "trailer", "content-length"
+}
+
+
+@dataclass
+class RoomLease:
+    """방 하나의 소유권 리스"""
+    room_id: str
+    worker_id: str
+    worker_url: str
+    epoch: int
+    expires_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "room_id": self.room_id,
+            "worker_id": self.worker_id,
+            "worker_url": self.worker_url,
+            "epoch": self.epoch,
+            "expires_at": self.expires_at
+        }
+
+
+class RoomOwnershipRegistry:
+    """
+    Redis 기반 방 → 워커 리스 레지스트리
+
+    모든 메서드는 동기 Redis 호출이므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    """
+
+    def __init__(self, redis_client: Any = None, worker_id: Optional[str] = None,
+                 worker_url: Optional[str] = None, lease_seconds: float = 30.0,
+                 key_prefix: str = "room_owner", clock: Callable[[], float] = time.time):
+        """
+        RoomOwnershipRegistry 초기화
+
+        Args:
+            redis_client: 동기 redis 클라이언트 (None이면 단일 워커 모드)
+            worker_id: 이 워커의 ID
+            worker_url: 다른 워커가 요청을 전달할 이 워커의 기본 URL
+            lease_seconds: 리스 유효 시간 (이 시간 동안 갱신이 없으면 다른 워커가 이어받음)
+            key_prefix: Redis 키 접두사
+            clock: 만료 시각 계산용 시간 함수 (테스트용)
+        """
+        self.redis = redis_client
+        self.worker_id = worker_id or "local"
+        self.worker_url = (worker_url or "").rstrip("/")
+        if self.redis is not None and not self.worker_url:
+            # 다른 워커가 요청을 전달할 주소가 없으면 리스를 가질 수 없음
+            logger.error("❌ Room ownership requires a unique worker URL (WORKER_URL); registry disabled")
+            self.redis = None
+        self.lease_seconds = lease_seconds
+        self.key_prefix = key_prefix
+        self._clock = clock
+        self._owned: Dict[str, RoomLease] = {}
+        self._lock = threading.Lock()
+        self.metrics = {"claimed": 0, "renewed": 0, "reclaimed": 0, "taken_over": 0, "cached": 0,
+                        "conflicts": 0, "lost": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    @property
+    def lease_ms(self) -> int:
+        return int(self.lease_seconds * 1000)
+
+    def _room_key(self, room_id: str) -> str:
+        return f"{self.key_prefix}:room:{room_id}"
+
+    def _epoch_key(self, room_id: str) -> str:
+        return f"{self.key_prefix}:epoch:{room_id}"
+
+    def _worker_key(self) -> str:
+        return f"{self.key_prefix}:worker:{self.worker_url}"
+
+    def _payload(self, epoch: int) -> str:
+        return json.dumps({"worker_id": self.worker_id, "worker_url": self.worker_url, "epoch": epoch})
+
+    def _parse(self, room_id: str, raw: Optional[str], pttl: Optional[int] = None) -> Optional[RoomLease]:
+        if not raw:
+            return None
+        try:
+            data = json.loads(raw)
+        except (TypeError, ValueError):
+            logger.warning(f"⚠️ Unreadable ownership record for room {room_id}: {raw!r}")
+            return None
+        expires_at = self._clock() + pttl / 1000 if pttl is not None and pttl >= 0 else None
+        return RoomLease(room_id, data.get("worker_id", ""), data.get("worker_url", ""),
+                         int(data.get("epoch", 0)), expires_at)
+
+    def _local_lease(self, room_id: str) -> RoomLease:
+        return RoomLease(room_id, self.worker_id, self.worker_url, 0)
+
+    def register_worker(self, wait_seconds: Optional[float] = None,
+                        sleep: Callable[[float], None] = time.sleep) -> bool:
+        """
+        이 워커의 URL을 Redis에 등록 (시작 시 한 번, 이후 renew_owned가 갱신)
+
+        같은 URL을 다른 worker_id가 등록해 두었으면 재시작 전 인스턴스의 등록이 만료되기를
+        wait_seconds(기본: 리스 시간)만큼 기다립니다. 그래도 남아 있으면 살아 있는 다른 워커가
+        같은 URL을 쓰는 것이므로 레지스트리를 비활성화합니다.
+
+        Args:
+            wait_seconds: 기존 등록 만료를 기다릴 최대 시간
+            sleep: 대기 함수 (테스트용)
+
+        Returns:
+            등록 성공 여부 (비활성 모드면 False)
+        """
+        if not self.enabled:
+            return False
+        wait_seconds = self.lease_seconds if wait_seconds is None else wait_seconds
+        deadline = self._clock() + wait_seconds
+        worker_key = self._worker_key()
+        holder = None
+        try:
+            while True:
+                if self.redis.set(worker_key, self.worker_id, px=self.lease_ms, nx=True):
+                    logger.info(f"📌 Worker {self.worker_id} registered at {self.worker_url}")
+                    return True
+                holder = self.redis.get(worker_key)
+                if holder == self.worker_id:
+                    return True
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    break
+                sleep(min(remaining, max(0.05, self.lease_seconds / 10)))
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"❌ Failed to register worker URL {self.worker_url}: {str(e)}")
+            return False
+
+        logger.error(f"❌ Worker URL {self.worker_url} is already used by live worker {holder}; "
+                     f"room ownership disabled for worker {self.worker_id}")
+        self.redis = None
+        return False
+
+    def _renew_worker(self) -> None:
+        """워커 URL 등록 갱신 (다른 워커가 가져갔으면 경고만)"""
+        worker_key = self._worker_key()
+        holder = self.redis.get(worker_key)
+        if holder is None or holder == self.worker_id:
+            self.redis.set(worker_key, self.worker_id, px=self.lease_ms)
+        else:
+            logger.error(f"❌ Worker URL {self.worker_url} is now registered by worker {holder}")
+
+    def claim(self, room_id: str, max_attempts: int = 5) -> Optional[RoomLease]:
+        """
+        방 소유권 확보 (이미 소유 중이면 갱신)
+
+        Args:
+            room_id: 방 ID
+            max_attempts: 경합(WatchError) 시 재시도 횟수
+
+        Returns:
+            현재 유효한 리스 - worker_id가 이 워커면 소유 성공, 아니면 다른 워커가 소유 중
+            (Redis 오류 시 None)
+        """
+        if not self.enabled:
+            return self._local_lease(room_id)
+
+        # 리스는 만료되어야만 다른 워커로 넘어가므로, 남은 시간이 절반 이상이면 Redis 확인 생략
+        with self._lock:
+            owned = self._owned.get(room_id)
+        if owned and self.seconds_until_expiry(owned) > self.lease_seconds / 2:
+            self.metrics["cached"] += 1
+            return owned
+
+        from redis.exceptions import WatchError
+
+        room_key = self._room_key(room_id)
+        for _ in range(max_attempts):
+            try:
+                with self.redis.pipeline() as pipe:
+                    pipe.watch(room_key)
+                    current = self._parse(room_id, pipe.get(room_key), pipe.pttl(room_key))
+
+                    if current and current.worker_id != self.worker_id:
+                        # 리스가 살아 있는 동안은 다른 워커의 방
+                        self.metrics["conflicts"] += 1
+                        return current
+
+                    if current:
+                        epoch = current.epoch
+                    else:
+                        epoch = int(self.redis.incr(self._epoch_key(room_id)))
+                    pipe.multi()
+                    pipe.set(room_key, self._payload(epoch), px=self.lease_ms)
+                    pipe.execute()
+            except WatchError:
+                continue
+            except Exception as e:
+                self.metrics["errors"] += 1
+                logger.error(f"❌ Failed to claim room {room_id}: {str(e)}")
+                return None
+
+            lease = RoomLease(room_id, self.worker_id, self.worker_url, epoch,
+                              self._clock() + self.lease_seconds)
+            with self._lock:
+                known = room_id in self._owned
+                self._owned[room_id] = lease
+            if current:
+                self.metrics["renewed"] += 1
+            else:
+                self.metrics["claimed"] += 1
+                if epoch > 1:
+                    # 이전 리스가 만료(소유 워커 장애)되었거나 반납된 방을 이어받음
+                    self.metrics["reclaimed"] += 1
+                    logger.info(f"🔀 Worker {self.worker_id} took over room {room_id} (epoch {epoch})")
+                elif not known:
+                    logger.info(f"📌 Worker {self.worker_id} claimed room {room_id}")
+            return lease
+
+        self.metrics["errors"] += 1
+        logger.warning(f"⚠️ Gave up claiming room {room_id} after {max_attempts} contended attempts")
+        return None
+
+    def take_over(self, room_id: str, stale: RoomLease) -> Optional[RoomLease]:
+        """
+        재시작 전의 이 워커(같은 URL, 다른 worker_id)가 남긴 리스를 만료 전에 이어받음
+
+        Args:
+            room_id: 방 ID
+            stale: claim()이 돌려준 이전 인스턴스의 리스
+
+        Returns:
+            새 리스 (그 사이 리스가 바뀌었으면 현재 리스, Redis 오류나 경합 시 None)
+        """
+        if not self.enabled:
+            return self._local_lease(room_id)
+
+        from redis.exceptions import WatchError
+
+        room_key = self._room_key(room_id)
+        try:
+            with self.redis.pipeline() as pipe:
+                pipe.watch(room_key)
+                current = self._parse(room_id, pipe.get(room_key), pipe.pttl(room_key))
+                if current and (current.worker_id != stale.worker_id or current.epoch != stale.epoch):
+                    return current
+                epoch = int(self.redis.incr(self._epoch_key(room_id)))
+                pipe.multi()
+                pipe.set(room_key, self._payload(epoch), px=self.lease_ms)
+                pipe.execute()
+        except WatchError:
+            return None
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"❌ Failed to take over room {room_id}: {str(e)}")
+            return None
+
+        lease = RoomLease(room_id, self.worker_id, self.worker_url, epoch, self._clock() + self.lease_seconds)
+        with self._lock:
+            self._owned[room_id] = lease
+        self.metrics["taken_over"] += 1
+        logger.info(f"🔀 Worker {self.worker_id} took over room {room_id} from its previous instance "
+                    f"{stale.worker_id} (epoch {epoch})")
+        return lease
+
+    def seconds_until_expiry(self, lease: RoomLease) -> float:
+        if lease.expires_at is None:
+            return 0.0
+        return max(0.0, lease.expires_at - self._clock())
+
+    def owner_of(self, room_id: str) -> Optional[RoomLease]:
+        """현재 소유 리스 조회 (없거나 만료되었으면 None)"""
+        if not self.enabled:
+            return self._local_lease(room_id)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(self._room_key(room_id))
+            pipe.pttl(self._room_key(room_id))
+            raw, pttl = pipe.execute()
+            return self._parse(room_id, raw, pttl)
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"❌ Failed to read owner of room {room_id}: {str(e)}")
+            return None
+
+    def is_owner(self, room_id: str) -> bool:
+        """이 워커가 방의 현재 소유자인지 (Redis 확인)"""
+        if not self.enabled:
+            return True
+        lease = self.owner_of(room_id)
+        return lease is not None and lease.worker_id == self.worker_id
+
+    def renew_owned(self) -> List[str]:
+        """
+        소유 중인 모든 방의 리스 갱신 (GET/PEXPIRE 파이프라인 두 번)
+
+        GET과 PEXPIRE 사이에 리스가 만료되어 다른 워커가 가져가면 그 워커의 리스를
+        한 번 연장하게 되지만, 소유권 자체는 바뀌지 않습니다.
+
+        Returns:
+            다른 워커에게 넘어갔거나 만료된 방 ID 목록 (로컬 인스턴스를 내려야 함)
+        """
+        if not self.enabled:
+            return []
+        try:
+            self._renew_worker()
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"❌ Failed to renew worker URL registration: {str(e)}")
+        with self._lock:
+            room_ids = list(self._owned)
+        if not room_ids:
+            return []
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for room_id in room_ids:
+                pipe.get(self._room_key(room_id))
+            records = pipe.execute()
+
+            with self._lock:
+                epochs = {room_id: lease.epoch for room_id, lease in self._owned.items()}
+            kept, lost = [], []
+            for room_id, raw in zip(room_ids, records):
+                if room_id not in epochs:
+                    continue  # 그 사이 반납됨
+                lease = self._parse(room_id, raw)
+                if lease and lease.worker_id == self.worker_id and lease.epoch == epochs[room_id]:
+                    kept.append(room_id)
+                else:
+                    lost.append(room_id)
+
+            if kept:
+                pipe = self.redis.pipeline(transaction=False)
+                for room_id in kept:
+                    pipe.pexpire(self._room_key(room_id), self.lease_ms)
+                pipe.execute()
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"❌ Failed to renew room leases: {str(e)}")
+            return []
+
+        expires_at = self._clock() + self.lease_seconds
+        with self._lock:
+            for room_id in kept:
+                if room_id in self._owned:
+                    self._owned[room_id].expires_at = expires_at
+            for room_id in lost:
+                self._owned.pop(room_id, None)
+        self.metrics["renewed"] += len(kept)
+        if lost:
+            self.metrics["lost"] += len(lost)
+            logger.warning(f"⚠️ Worker {self.worker_id} lost ownership of rooms: {lost}")
+        return lost
+
+    def release(self, room_id: str) -> bool:
+        """
+        방 소유권 반납 (이 워커가 소유 중일 때만 삭제)
+
+        Returns:
+            리스를 삭제했는지
+        """
+        with self._lock:
+            self._owned.pop(room_id, None)
+        if not self.enabled:
+            return False
+
+        from redis.exceptions import WatchError
+
+        room_key = self._room_key(room_id)
+        try:
+            with self.redis.pipeline() as pipe:
+                pipe.watch(room_key)
+                lease = self._parse(room_id, pipe.get(room_key))
+                if lease is None or lease.worker_id != self.worker_id:
+                    return False
+                pipe.multi()
+                pipe.delete(room_key)
+                pipe.execute()
+            logger.info(f"📤 Worker {self.worker_id} released room {room_id}")
+            return True
+        except WatchError:
+            return False
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"❌ Failed to release room {room_id}: {str(e)}")
+            return False
+
+    def release_all(self) -> int:
+        """종료 시 소유 중인 모든 방과 워커 URL 등록 반납 (다른 워커가 만료를 기다리지 않고 이어받도록)"""
+        released = sum(1 for room_id in self.owned_rooms() if self.release(room_id))
+        if self.enabled:
+            try:
+                if self.redis.get(self._worker_key()) == self.worker_id:
+                    self.redis.delete(self._worker_key())
+            except Exception as e:
+                logger.error(f"❌ Failed to release worker URL registration: {str(e)}")
+        return released
+
+    def owned_rooms(self) -> List[str]:
+        with self._lock:
+            return list(self._owned)
+
+    async def run_renewal(self, interval: Optional[float] = None,
+                          on_lost: Optional[Callable[[str], Awaitable[Any]]] = None) -> None:
+        """
+        리스 갱신 루프 (백그라운드 태스크)
+
+        Args:
+            interval: 갱신 주기 (기본: 리스 시간의 1/3)
+            on_lost: 소유권을 잃은 방마다 호출할 코루틴 함수 (로컬 인스턴스 정리)
+        """
+        interval = interval or self.lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                lost = await asyncio.to_thread(self.renew_owned)
+                for room_id in lost:
+                    if on_lost is not None:
+                        await on_lost(room_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Room lease renewal error: {str(e)}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "worker_id": self.worker_id,
+            "worker_url": self.worker_url,
+            "owned_rooms": len(self._owned),
+            **self.metrics
+        }
+
+
+class RoomAffinityMiddleware:
+    """
+    방 소유 워커로 요청을 전달하는 ASGI 미들웨어
+
+    - 이 워커가 소유자이거나 소유자가 없으면(리스 확보) 로컬에서 처리합니다.
+    - 다른 워커가 소유 중이면 그 워커의 URL로 요청을 그대로 전달하고 응답을 돌려줍니다.
+    - 소유 워커에 연결할 수 없으면 리스가 만료될 때까지 503 + Retry-After를 돌려주고,
+      만료 후 다음 요청에서 이 워커가 이어받습니다.
+    """
+
+    ROOM_PATH = re.compile(r"/debate/(?P<room_id>[^/]+)")
+
+    def __init__(self, app: Any, registry: RoomOwnershipRegistry,
+                 create_path_suffix: str = "/create-debate-room",
+                 forward_timeout: float = 120.0):
+        """
+        RoomAffinityMiddleware 초기화
+
+        Args:
+            app: 감쌀 ASGI 앱
+            registry: 방 소유권 레지스트리
+            create_path_suffix: room_id를 요청 본문에서 읽는 방 생성 경로
+            forward_timeout: 전달 요청 타임아웃
+        """
+        self.app = app
+        self.registry = registry
+        self.create_path_suffix = create_path_suffix
+        self.forward_timeout = forward_timeout
+        self._client = None
+        self.metrics = {"local": 0, "forwarded": 0, "forward_failures": 0, "misrouted": 0, "taken_over": 0}
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not self.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        body = None
+        room_id = self._room_from_path(scope.get("path", ""))
+        if room_id is None and scope.get("method") == "POST" and scope.get("path", "").endswith(self.create_path_suffix):
+            body = await self._read_body(receive)
+            room_id = self._room_from_body(body)
+        if body is not None:
+            receive = self._replay(body)
+
+        if room_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        lease = await asyncio.to_thread(self.registry.claim, room_id)
+        if lease is not None and lease.worker_id != self.registry.worker_id and lease.worker_url == self.registry.worker_url:
+            # 워커 URL은 고유하므로 같은 URL의 리스는 재시작 전의 이 워커 - 만료를 기다리지 않고 이어받음
+            lease = await asyncio.to_thread(self.registry.take_over, room_id, lease)
+            if lease is not None and lease.worker_id == self.registry.worker_id:
+                self.metrics["taken_over"] += 1
+        if lease is None or lease.worker_id == self.registry.worker_id:
+            # Redis 오류면 가용성을 위해 로컬 처리
+            self.metrics["local"] += 1
+            await self.app(scope, receive, send)
+            return
+
+        headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope.get("headers", [])}
+        if FORWARDED_BY_HEADER in headers or not lease.worker_url:
+            # 이미 전달된 요청인데 그 사이 소유권이 바뀜 - 다시 전달하지 않음
+            self.metrics["misrouted"] += 1
+            await self._respond(send, 503, {"reason": "room_moved", "owner": lease.worker_id},
+                                retry_after=1)
+            return
+
+        if body is None:
+            body = await self._read_body(receive)
+        await self._forward(scope, headers, body, lease, send)
+
+    def _room_from_path(self, path: str) -> Optional[str]:
+        match = self.ROOM_PATH.search(path)
+        return match.group("room_id") if match else None
+
+    @staticmethod
+    def _room_from_body(body: bytes) -> Optional[str]:
+        try:
+            room_id = json.loads(body or b"{}").get("room_id")
+            return str(room_id) if room_id else None
+        except (ValueError, AttributeError):
+            return None
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    def _replay(body: bytes):
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if sent:
+                return {"type": "http.disconnect"}
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return receive
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(timeout=self.forward_timeout)
+        return self._client
+
+    async def _forward(self, scope, headers: Dict[str, str], body: bytes, lease: RoomLease, send) -> None:
+        import httpx
+
+        url = lease.worker_url + scope.get("raw_path", scope["path"].encode()).decode("latin-1")
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        forward_headers = {key: value for key, value in headers.items() if key not in _HOP_HEADERS}
+        forward_headers[FORWARDED_BY_HEADER] = self.registry.worker_id
+
+        try:
+            response = await self._get_client().request(scope["method"], url, headers=forward_headers, content=body)
+        except httpx.TransportError as e:
+            self.metrics["forward_failures"] += 1
+            retry_after = math.ceil(max(1.0, self.registry.seconds_until_expiry(lease)))
+            logger.warning(f"⚠️ Owner {lease.worker_id} of room {lease.room_id} unreachable "
+                           f"({type(e).__name__}), retry after {retry_after}s")
+            await self._respond(send, 503, {"reason": "owner_unreachable", "owner": lease.worker_id},
+                                retry_after=retry_after)
+            return
+
+        self.metrics["forwarded"] += 1
+        response_headers = [
+            (key.encode("latin-1"), value.encode("latin-1"))
+            for key, value in response.headers.items()
+            if key.lower() not in _HOP_HEADERS and key.lower() != "content-encoding"
+        ]
+        response_headers.append((b"content-length", str(len(response.content)).encode()))
+        response_headers.append((OWNER_HEADER.encode(), lease.worker_id.encode("latin-1")))
+        await send({"type": "http.response.start", "status": response.status_code, "headers": response_headers})
+        await send({"type": "http.response.body", "body": response.content})
+
+    @staticmethod
+    async def _respond(send, status: int, detail: Dict[str, Any], retry_after: Optional[int] = None) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        if retry_after is not None:
+            headers.append((b"retry-after", str(retry_after).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return dict(self.metrics)
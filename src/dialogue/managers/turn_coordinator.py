@@ -0,0 +1,298 @@
+"""
+토론방 턴 코디네이터
+
+토론방마다 턴 상태 전환(다음 발언자 결정 → 생성 시작, 사용자 메시지 반영)을 직렬화합니다.
+
+- 턴마다 방 안에서 단조 증가하는 turn_id를 부여합니다.
+- 같은 방에 생성 중인 턴이 있으면 새로 생성하지 않고 진행 중인 턴을 그대로 돌려줍니다.
+  (두 클라이언트가 같은 방을 폴링하거나 재시도해도 LLM 호출은 한 번)
+- 클라이언트가 기대한 turn_id(expected_turn_id)가 이미 지난 턴이면 stale로 거절합니다.
+- 사용자 메시지는 client_message_id로 중복 제출을 걸러내고 이전 결과를 돌려줍니다.
+- AI 턴 생성 중에는 사용자 메시지를 busy로 거절합니다.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Any, Callable, Awaitable
+
+logger = logging.getLogger(__name__)
+
+TURN_KIND_AI = "ai"
+TURN_KIND_USER = "user"
+
+
+@dataclass
+class TurnTicket:
+    """턴 하나의 진행 정보"""
+    room_id: str
+    turn_id: int
+    kind: str
+    speaker_id: str
+    speaker_role: Optional[str] = None
+    stage: Optional[str] = None
+    status: str = "in_flight"  # in_flight / completed / failed
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def in_flight(self) -> bool:
+        return self.status == "in_flight"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "turn_id": self.turn_id,
+            "kind": self.kind,
+            "speaker_id": self.speaker_id,
+            "speaker_role": self.speaker_role,
+            "stage": self.stage,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+
+@dataclass
+class TurnDecision:
+    """턴 요청 처리 결과"""
+    status: str  # started / duplicate / stale / busy / user_turn / completed / processed / rejected
+    next_turn_id: int
+    ticket: Optional[TurnTicket] = None
+    speaker: Optional[Dict[str, Any]] = None
+    result: Optional[Dict[str, Any]] = None
+    reason: str = ""
+
+
+class _RoomTurnState:
+    """방 하나의 턴 상태 (코디네이터 내부용)"""
+
+    def __init__(self, history_size: int):
+        self.lock = asyncio.Lock()
+        self.last_turn_id = 0
+        self.inflight: Optional[TurnTicket] = None
+        self.recent: 'OrderedDict[int, TurnTicket]' = OrderedDict()
+        self.user_messages: 'OrderedDict[str, TurnTicket]' = OrderedDict()
+        self.history_size = history_size
+
+    @property
+    def next_turn_id(self) -> int:
+        return self.inflight.turn_id if self.inflight else self.last_turn_id + 1
+
+    def start(self, kind: str, speaker_id: str, room_id: str,
+              speaker_role: Optional[str] = None, stage: Optional[str] = None) -> TurnTicket:
+        self.last_turn_id += 1
+        ticket = TurnTicket(room_id=room_id, turn_id=self.last_turn_id, kind=kind,
+                            speaker_id=speaker_id, speaker_role=speaker_role, stage=stage)
+        self.inflight = ticket
+        return ticket
+
+    def finish(self, ticket: TurnTicket, result: Optional[Dict[str, Any]], failed: bool = False) -> None:
+        ticket.status = "failed" if failed else "completed"
+        ticket.result = result
+        ticket.finished_at = time.time()
+        if self.inflight is ticket:
+            self.inflight = None
+        self.recent[ticket.turn_id] = ticket
+        while len(self.recent) > self.history_size:
+            self.recent.popitem(last=False)
+
+    def abandon(self, ticket: TurnTicket) -> None:
+        """반영되지 않은 턴 취소 (번호를 소비하지 않음)"""
+        if self.inflight is ticket:
+            self.inflight = None
+        if self.last_turn_id == ticket.turn_id:
+            self.last_turn_id -= 1
+
+    def remember_user_message(self, client_message_id: str, ticket: TurnTicket) -> None:
+        self.user_messages[client_message_id] = ticket
+        while len(self.user_messages) > self.history_size:
+            self.user_messages.popitem(last=False)
+
+    def check_expected(self, room_id: str, expected_turn_id: Optional[int]) -> Optional[TurnDecision]:
+        """기대한 turn_id가 현재 턴과 맞지 않으면 duplicate/stale 결정 반환"""
+        if expected_turn_id is None:
+            return None
+        if self.inflight and expected_turn_id == self.inflight.turn_id:
+            return TurnDecision("duplicate", self.next_turn_id, ticket=self.inflight)
+        if expected_turn_id != self.next_turn_id:
+            logger.info(f"⏭️ Stale turn request for room {room_id}: expected {expected_turn_id}, "
+                        f"next {self.next_turn_id}")
+            return TurnDecision("stale", self.next_turn_id, ticket=self.recent.get(expected_turn_id),
+                                reason=f"turn {expected_turn_id} is not the next turn ({self.next_turn_id})")
+        return None
+
+
+class TurnCoordinator:
+    """
+    토론방별 턴 직렬화 코디네이터
+
+    모든 메서드는 같은 이벤트 루프에서 호출되어야 하며, 대화 상태를 바꾸는 동기 호출
+    (get_next_speaker / process_message)은 방 단위 asyncio 락 안에서 실행됩니다.
+    백그라운드 스레드와의 동시 접근은 대화 인스턴스의 state_lock이 보호합니다.
+    """
+
+    def __init__(self, history_size: int = 32):
+        """
+        TurnCoordinator 초기화
+
+        Args:
+            history_size: 방마다 보관할 완료 턴/사용자 메시지 ID 수
+        """
+        self.history_size = history_size
+        self._rooms: Dict[str, _RoomTurnState] = {}
+        self._rooms_lock = threading.Lock()
+        self.metrics = {"started": 0, "duplicate": 0, "stale": 0, "busy": 0, "failed": 0}
+
+    def _room(self, room_id: str) -> _RoomTurnState:
+        with self._rooms_lock:
+            state = self._rooms.get(room_id)
+            if state is None:
+                state = _RoomTurnState(self.history_size)
+                self._rooms[room_id] = state
+            return state
+
+    def _count(self, decision: TurnDecision) -> TurnDecision:
+        if decision.status in self.metrics:
+            self.metrics[decision.status] += 1
+        return decision
+
+    async def request_ai_turn(self, room_id: str,
+                              resolve_speaker: Callable[[], Dict[str, Any]],
+                              is_user_speaker: Callable[[str], bool],
+                              run_turn: Callable[[TurnTicket], Awaitable[Dict[str, Any]]],
+                              expected_turn_id: Optional[int] = None) -> TurnDecision:
+        """
+        다음 턴 요청 (AI 차례면 생성 태스크를 한 번만 시작)
+
+        Args:
+            room_id: 방 ID
+            resolve_speaker: 다음 발언자 정보(speaker_id, role, stage)를 돌려주는 함수
+            is_user_speaker: 발언자가 사용자인지
+            run_turn: 턴을 생성하는 코루틴 함수 (완료 결과 dict 반환)
+            expected_turn_id: 클라이언트가 기대하는 turn_id (None이면 확인 생략)
+
+        Returns:
+            started / duplicate / stale / user_turn / completed 결정
+        """
+        state = self._room(room_id)
+        async with state.lock:
+            stale = state.check_expected(room_id, expected_turn_id)
+            if stale:
+                return self._count(stale)
+
+            if state.inflight:
+                logger.info(f"🔁 Turn {state.inflight.turn_id} already in flight for room {room_id}")
+                return self._count(TurnDecision("duplicate", state.next_turn_id, ticket=state.inflight))
+
+            speaker = resolve_speaker() or {}
+            speaker_id = speaker.get("speaker_id")
+            if speaker_id is None:
+                return TurnDecision("completed", state.next_turn_id, speaker=speaker)
+            if is_user_speaker(speaker_id):
+                return TurnDecision("user_turn", state.next_turn_id, speaker=speaker)
+
+            ticket = state.start(TURN_KIND_AI, speaker_id, room_id,
+                                 speaker_role=speaker.get("role"), stage=speaker.get("stage"))
+            ticket.task = asyncio.create_task(self._run_ai_turn(state, ticket, run_turn))
+            return self._count(TurnDecision("started", state.next_turn_id, ticket=ticket, speaker=speaker))
+
+    async def _run_ai_turn(self, state: _RoomTurnState, ticket: TurnTicket,
+                           run_turn: Callable[[TurnTicket], Awaitable[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        result = None
+        failed = False
+        try:
+            result = await run_turn(ticket)
+            failed = not result or result.get("status") == "error"
+            return result
+        except Exception as e:
+            failed = True
+            result = {"status": "error", "message": str(e)}
+            logger.error(f"❌ Turn {ticket.turn_id} failed for room {ticket.room_id}: {str(e)}")
+            return result
+        finally:
+            if failed:
+                self.metrics["failed"] += 1
+            state.finish(ticket, result, failed=failed)
+
+    async def submit_user_turn(self, room_id: str, user_id: str,
+                               apply: Callable[[], Dict[str, Any]],
+                               expected_turn_id: Optional[int] = None,
+                               client_message_id: Optional[str] = None) -> TurnDecision:
+        """
+        사용자 메시지 반영 (직렬화 + 중복 제출 제거)
+
+        Args:
+            room_id: 방 ID
+            user_id: 사용자 ID
+            apply: 메시지를 대화에 반영하는 함수 (dialogue.process_message, 결과 dict 반환)
+            expected_turn_id: 클라이언트가 기대하는 turn_id
+            client_message_id: 클라이언트 메시지 ID (재시도 식별용)
+
+        Returns:
+            processed / rejected / duplicate / stale / busy 결정
+        """
+        state = self._room(room_id)
+        async with state.lock:
+            if client_message_id and client_message_id in state.user_messages:
+                previous = state.user_messages[client_message_id]
+                return self._count(TurnDecision("duplicate", state.next_turn_id,
+                                                ticket=previous, result=previous.result))
+
+            if state.inflight:
+                return self._count(TurnDecision("busy", state.next_turn_id, ticket=state.inflight,
+                                                reason="AI turn in progress"))
+
+            stale = state.check_expected(room_id, expected_turn_id)
+            if stale:
+                return self._count(stale)
+
+            ticket = state.start(TURN_KIND_USER, user_id, room_id)
+            try:
+                result = apply() or {}
+            except Exception:
+                state.abandon(ticket)
+                self.metrics["failed"] += 1
+                raise
+
+            if result.get("status") != "success":
+                # 차례가 아니거나 일시정지 등으로 반영되지 않음
+                state.abandon(ticket)
+                return TurnDecision("rejected", state.next_turn_id, result=result,
+                                    reason=result.get("reason", ""))
+
+            state.finish(ticket, result)
+            if client_message_id:
+                state.remember_user_message(client_message_id, ticket)
+            self.metrics["started"] += 1
+            return TurnDecision("processed", state.next_turn_id, ticket=ticket, result=result)
+
+    def get_inflight(self, room_id: str) -> Optional[TurnTicket]:
+        state = self._rooms.get(room_id)
+        return state.inflight if state else None
+
+    def next_turn_id(self, room_id: str) -> int:
+        state = self._rooms.get(room_id)
+        return state.next_turn_id if state else 1
+
+    def forget(self, room_id: str) -> None:
+        """방 삭제 시 턴 상태 제거 (진행 중인 생성 태스크는 그대로 완료됨)"""
+        with self._rooms_lock:
+            self._rooms.pop(room_id, None)
+
+    def get_room_status(self, room_id: str) -> Dict[str, Any]:
+        state = self._rooms.get(room_id)
+        if not state:
+            return {"next_turn_id": 1, "inflight": None, "recent": []}
+        return {
+            "next_turn_id": state.next_turn_id,
+            "inflight": state.inflight.to_dict() if state.inflight else None,
+            "recent": [ticket.to_dict() for ticket in state.recent.values()]
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {"rooms": len(self._rooms), **self.metrics}
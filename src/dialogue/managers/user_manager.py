@@ -2,11 +2,20 @@
 사용자 관리자 클래스
 
 대화 시스템에서 사용자의 생명주기, 인증, 세션 관리를 담당
+
+세션 만료는 마감 시각 기준 최소 힙으로 관리합니다. 활동 갱신은 last_activity만 바꾸고(O(1)),
+힙에서 꺼낼 때 실제 마감 시각을 다시 확인하여 아직 살아 있으면 다시 넣습니다.
+백그라운드 스레드가 다음 마감 시각까지 기다렸다가 만료된 세션만 정리하므로
+전체 세션을 훑지 않고도 유휴 세션 메모리를 바로 회수합니다.
+에이전트와 API 핸들러가 동시에 접근하므로 모든 상태는 RLock으로 보호합니다.
 """
 
+import heapq
+import itertools
 import logging
+import threading
 import time
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple, Callable
 from dataclasses import dataclass
 
 from ...agents.participant.user_participant import UserParticipant
@@ -33,8 +42,19 @@ class UserManager:
     사용자 등록, 인증, 세션 관리, 권한 관리 등을 담당
     """
     
-    def __init__(self):
-        """사용자 관리자 초기화"""
+    def __init__(self, session_timeout: float = 3600, cleanup_interval: float = 300,
+                 clock: Callable[[], float] = time.time):
+        """
+        사용자 관리자 초기화
+        
+        Args:
+            session_timeout: 마지막 활동 이후 세션 만료까지의 시간 (초)
+            cleanup_interval: 백그라운드 정리 스레드의 최대 대기 간격 (초)
+            clock: 시간 함수 (테스트용)
+        """
+        self._clock = clock
+        self._lock = threading.RLock()
+        
         # 활성 사용자들 (user_id -> UserParticipant)
         self.active_users: Dict[str, UserParticipant] = {}
         
@@ -47,13 +67,26 @@ class UserManager:
         # 대화별 참가자 목록 (dialogue_id -> Set[user_id])
         self.dialogue_participants: Dict[str, Set[str]] = {}
         
+        # 사용자별 참여 대화 목록 (user_id -> Set[dialogue_id], 세션 종료 시 전체 정리용)
+        self.user_dialogues: Dict[str, Set[str]] = {}
+        
         # 사용자 설정 캐시 (user_id -> config)
         self.user_configs: Dict[str, Dict[str, Any]] = {}
         
         # 세션 정리를 위한 설정
-        self.session_timeout = 3600  # 1시간
-        self.cleanup_interval = 300  # 5분마다 정리
-        self.last_cleanup = time.time()
+        self.session_timeout = session_timeout  # 기본 1시간
+        self.cleanup_interval = cleanup_interval  # 기본 5분
+        self.last_cleanup = self._clock()
+        
+        # 세션 만료 힙: (마감 시각, 순번, 세션) - 종료된 세션의 항목은 꺼낼 때 버림
+        self._expiry_heap: List[Tuple[float, int, UserSession]] = []
+        self._expiry_seq = itertools.count()
+        self._stale_expiry_entries = 0
+        
+        # 백그라운드 정리 스레드
+        self._expiry_wakeup = threading.Condition(self._lock)
+        self._expiry_thread: Optional[threading.Thread] = None
+        self._expiry_stop = False
         
         logger.info("UserManager initialized")
     
@@ -71,71 +104,82 @@ class UserManager:
         Returns:
             생성된 사용자 세션
         """
+        now = self._clock()
         if not session_id:
-            session_id = f"session_{user_id}_{int(time.time())}"
-        
-        # 기존 세션이 있으면 종료
-        if user_id in self.user_to_session:
-            old_session_id = self.user_to_session[user_id]
-            self.end_user_session(old_session_id)
-        
-        # 새 세션 생성
-        session = UserSession(
-            user_id=user_id,
-            username=username,
-            session_id=session_id,
-            start_time=time.time(),
-            last_activity=time.time(),
-            ip_address=kwargs.get('ip_address'),
-            user_agent=kwargs.get('user_agent')
-        )
-        
-        # 세션 등록
-        self.user_sessions[session_id] = session
-        self.user_to_session[user_id] = session_id
+            session_id = f"session_{user_id}_{int(now)}"
+        
+        with self._lock:
+            # 기존 세션이 있으면 종료
+            if user_id in self.user_to_session:
+                old_session_id = self.user_to_session[user_id]
+                self.end_user_session(old_session_id)
+            if session_id in self.user_sessions:
+                self.end_user_session(session_id)
+            
+            # 새 세션 생성
+            session = UserSession(
+                user_id=user_id,
+                username=username,
+                session_id=session_id,
+                start_time=now,
+                last_activity=now,
+                ip_address=kwargs.get('ip_address'),
+                user_agent=kwargs.get('user_agent')
+            )
+            
+            # 세션 등록
+            self.user_sessions[session_id] = session
+            self.user_to_session[user_id] = session_id
+            self._schedule_expiry(session)
         
         logger.info(f"Created session for user {user_id}: {session_id}")
         return session
     
     def get_user_session(self, session_id: str) -> Optional[UserSession]:
         """세션 ID로 사용자 세션 조회"""
-        return self.user_sessions.get(session_id)
+        with self._lock:
+            return self.user_sessions.get(session_id)
     
     def get_user_session_by_user_id(self, user_id: str) -> Optional[UserSession]:
         """사용자 ID로 세션 조회"""
-        session_id = self.user_to_session.get(user_id)
-        if session_id:
-            return self.user_sessions.get(session_id)
-        return None
+        with self._lock:
+            session_id = self.user_to_session.get(user_id)
+            if session_id:
+                return self.user_sessions.get(session_id)
+            return None
     
     def update_user_activity(self, user_id: str) -> bool:
-        """사용자 활동 시간 업데이트"""
-        session = self.get_user_session_by_user_id(user_id)
-        if session:
-            session.last_activity = time.time()
-            return True
-        return False
+        """사용자 활동 시간 업데이트 (만료 힙은 꺼낼 때 다시 확인하므로 건드리지 않음)"""
+        with self._lock:
+            session = self.get_user_session_by_user_id(user_id)
+            if session:
+                session.last_activity = self._clock()
+                return True
+            return False
     
     def end_user_session(self, session_id: str) -> bool:
         """사용자 세션 종료"""
-        session = self.user_sessions.get(session_id)
-        if not session:
-            return False
-        
-        user_id = session.user_id
-        
-        # 활성 대화에서 제거
-        if session.current_dialogue_id:
-            self.remove_user_from_dialogue(user_id, session.current_dialogue_id)
-        
-        # 활성 사용자에서 제거
-        if user_id in self.active_users:
-            del self.active_users[user_id]
-        
-        # 세션 정보 제거
-        del self.user_sessions[session_id]
-        if user_id in self.user_to_session:
-            del self.user_to_session[user_id]
+        with self._lock:
+            session = self.user_sessions.get(session_id)
+            if not session:
+                return False
+            
+            user_id = session.user_id
+            
+            # 참여 중인 모든 대화에서 제거
+            for dialogue_id in list(self.user_dialogues.get(user_id, ())):
+                self.remove_user_from_dialogue(user_id, dialogue_id)
+            
+            # 활성 사용자에서 제거
+            if user_id in self.active_users:
+                del self.active_users[user_id]
+            
+            # 세션 정보 제거 (힙 항목은 꺼낼 때 버림)
+            del self.user_sessions[session_id]
+            if self.user_to_session.get(user_id) == session_id:
+                del self.user_to_session[user_id]
+            self._stale_expiry_entries += 1
+            self._compact_expiry_heap()
         
         logger.info(f"Ended session for user {user_id}: {session_id}")
         return True
@@ -153,46 +197,51 @@ class UserManager:
         Returns:
             생성된 UserParticipant 객체
         """
-        # 기존 사용자가 있으면 반환
-        if user_id in self.active_users:
-            logger.info(f"User {user_id} already active, returning existing participant")
-            return self.active_users[user_id]
-        
-        # 사용자 설정 로드 (캐시에서 또는 기본값)
-        user_config = config or self.user_configs.get(user_id, {})
-        
-        # UserParticipant 객체 생성
-        user_participant = UserParticipant(user_id, username, user_config)
-        
-        # 활성 사용자로 등록
-        self.active_users[user_id] = user_participant
-        
-        # 설정 캐시 업데이트
-        if config:
-            self.user_configs[user_id] = config
+        with self._lock:
+            # 기존 사용자가 있으면 반환
+            if user_id in self.active_users:
+                logger.info(f"User {user_id} already active, returning existing participant")
+                return self.active_users[user_id]
+            
+            # 사용자 설정 로드 (캐시에서 또는 기본값)
+            user_config = config or self.user_configs.get(user_id, {})
+            
+            # UserParticipant 객체 생성
+            user_participant = UserParticipant(user_id, username, user_config)
+            
+            # 활성 사용자로 등록
+            self.active_users[user_id] = user_participant
+            
+            # 설정 캐시 업데이트
+            if config:
+                self.user_configs[user_id] = config
         
         logger.info(f"Created UserParticipant for {user_id} ({username})")
         return user_participant
     
     def get_user_participant(self, user_id: str) -> Optional[UserParticipant]:
         """사용자 ID로 UserParticipant 객체 조회"""
-        return self.active_users.get(user_id)
+        with self._lock:
+            return self.active_users.get(user_id)
     
     def add_user_to_dialogue(self, user_id: str, dialogue_id: str) -> bool:
         """사용자를 대화에 추가"""
-        # 사용자 세션 업데이트
-        session = self.get_user_session_by_user_id(user_id)
-        if session:
-            session.current_dialogue_id = dialogue_id
-        
-        # 대화 참가자 목록에 추가
-        if dialogue_id not in self.dialogue_participants:
-            self.dialogue_participants[dialogue_id] = set()
-        
-        self.dialogue_participants[dialogue_id].add(user_id)
+        with self._lock:
+            # 사용자 세션 업데이트
+            session = self.get_user_session_by_user_id(user_id)
+            if session:
+                session.current_dialogue_id = dialogue_id
+            
+            # 대화 참가자 목록에 추가
+            if dialogue_id not in self.dialogue_participants:
+                self.dialogue_participants[dialogue_id] = set()
+            
+            self.dialogue_participants[dialogue_id].add(user_id)
+            self.user_dialogues.setdefault(user_id, set()).add(dialogue_id)
+            
+            user_participant = self.active_users.get(user_id)
         
         # UserParticipant 객체 업데이트
-        user_participant = self.active_users.get(user_id)
         if user_participant:
             user_participant.process({
                 "action": "join_dialogue",
@@ -204,21 +253,29 @@ class UserManager:
     
     def remove_user_from_dialogue(self, user_id: str, dialogue_id: str) -> bool:
         """사용자를 대화에서 제거"""
-        # 대화 참가자 목록에서 제거
-        if dialogue_id in self.dialogue_participants:
-            self.dialogue_participants[dialogue_id].discard(user_id)
+        with self._lock:
+            # 대화 참가자 목록에서 제거
+            if dialogue_id in self.dialogue_participants:
+                self.dialogue_participants[dialogue_id].discard(user_id)
+                
+                # 참가자가 없으면 대화 목록에서 제거
+                if not self.dialogue_participants[dialogue_id]:
+                    del self.dialogue_participants[dialogue_id]
             
-            # 참가자가 없으면 대화 목록에서 제거
-            if not self.dialogue_participants[dialogue_id]:
-                del self.dialogue_participants[dialogue_id]
-        
-        # 사용자 세션 업데이트
-        session = self.get_user_session_by_user_id(user_id)
-        if session and session.current_dialogue_id == dialogue_id:
-            session.current_dialogue_id = None
+            dialogues = self.user_dialogues.get(user_id)
+            if dialogues is not None:
+                dialogues.discard(dialogue_id)
+                if not dialogues:
+                    del self.user_dialogues[user_id]
+            
+            # 사용자 세션 업데이트
+            session = self.get_user_session_by_user_id(user_id)
+            if session and session.current_dialogue_id == dialogue_id:
+                session.current_dialogue_id = None
+            
+            user_participant = self.active_users.get(user_id)
         
         # UserParticipant 객체 업데이트
-        user_participant = self.active_users.get(user_id)
         if user_participant:
             user_participant.process({"action": "leave_dialogue"})
         
@@ -227,7 +284,8 @@ class UserManager:
     
     def get_dialogue_participants(self, dialogue_id: str) -> Set[str]:
         """특정 대화의 참가자 목록 반환"""
-        return self.dialogue_participants.get(dialogue_id, set()).copy()
+        with self._lock:
+            return self.dialogue_participants.get(dialogue_id, set()).copy()
     
     def get_user_current_dialogue(self, user_id: str) -> Optional[str]:
         """사용자가 현재 참여 중인 대화 ID 반환"""
@@ -238,14 +296,16 @@ class UserManager:
     
     def update_user_config(self, user_id: str, config: Dict[str, Any]) -> bool:
         """사용자 설정 업데이트"""
-        # 캐시 업데이트
-        if user_id not in self.user_configs:
-            self.user_configs[user_id] = {}
-        
-        self.user_configs[user_id].update(config)
+        with self._lock:
+            # 캐시 업데이트
+            if user_id not in self.user_configs:
+                self.user_configs[user_id] = {}
+            
+            self.user_configs[user_id].update(config)
+            
+            user_participant = self.active_users.get(user_id)
         
         # 활성 사용자 객체 업데이트
-        user_participant = self.active_users.get(user_id)
         if user_participant:
             user_participant.process({
                 "action": "update_preferences",
@@ -257,7 +317,8 @@ class UserManager:
     
     def get_user_config(self, user_id: str) -> Dict[str, Any]:
         """사용자 설정 조회"""
-        return self.user_configs.get(user_id, {}).copy()
+        with self._lock:
+            return self.user_configs.get(user_id, {}).copy()
     
     def is_user_online(self, user_id: str) -> bool:
         """사용자 온라인 상태 확인"""
@@ -266,23 +327,20 @@ class UserManager:
             return False
         
         # 세션 타임아웃 확인
-        if time.time() - session.last_activity > self.session_timeout:
+        if self._clock() - session.last_activity > self.session_timeout:
             return False
         
         return session.is_active
     
     def get_online_users(self) -> List[str]:
-        """온라인 사용자 목록 반환"""
-        online_users = []
-        current_time = time.time()
-        
-        for user_id, session_id in self.user_to_session.items():
-            session = self.user_sessions.get(session_id)
-            if session and session.is_active:
-                if current_time - session.last_activity <= self.session_timeout:
-                    online_users.append(user_id)
-        
-        return online_users
+        """온라인 사용자 목록 반환 (만료 세션은 백그라운드에서 바로 정리되므로 세션 수만큼만 확인)"""
+        current_time = self._clock()
+        
+        with self._lock:
+            return [
+                session.user_id for session in self.user_sessions.values()
+                if session.is_active and current_time - session.last_activity <= self.session_timeout
+            ]
     
     def get_user_stats(self, user_id: str) -> Dict[str, Any]:
         """사용자 통계 정보 반환"""
@@ -298,7 +356,7 @@ class UserManager:
         }
         
         if session:
-            stats["session_duration"] = time.time() - session.start_time
+            stats["session_duration"] = self._clock() - session.start_time
             stats["username"] = session.username
         
         if user_participant:
@@ -307,67 +365,157 @@ class UserManager:
         
         return stats
     
-    def cleanup_expired_sessions(self) -> int:
-        """만료된 세션들 정리"""
-        current_time = time.time()
-        
-        # 정리 간격 확인
-        if current_time - self.last_cleanup < self.cleanup_interval:
-            return 0
-        
-        expired_sessions = []
-        
-        # 만료된 세션 찾기
-        for session_id, session in self.user_sessions.items():
-            if current_time - session.last_activity > self.session_timeout:
-                expired_sessions.append(session_id)
+    # ------------------------------------------------------------------
+    # 세션 만료
+    # ------------------------------------------------------------------
+    
+    def _schedule_expiry(self, session: UserSession, deadline: Optional[float] = None) -> None:
+        """세션의 만료 마감 시각을 힙에 등록 (락 보유 상태에서 호출)"""
+        if deadline is None:
+            deadline = session.last_activity + self.session_timeout
+        earliest = self._expiry_heap[0][0] if self._expiry_heap else None
+        heapq.heappush(self._expiry_heap, (deadline, next(self._expiry_seq), session))
+        if earliest is None or deadline < earliest:
+            self._expiry_wakeup.notify()
+    
+    def _compact_expiry_heap(self) -> None:
+        """종료된 세션 항목이 살아 있는 항목보다 많아지면 힙을 다시 구성"""
+        if self._stale_expiry_entries <= max(64, len(self.user_sessions)):
+            return
+        self._expiry_heap = [
+            entry for entry in self._expiry_heap
+            if self.user_sessions.get(entry[2].session_id) is entry[2]
+        ]
+        heapq.heapify(self._expiry_heap)
+        self._stale_expiry_entries = 0
+    
+    def _expire_due_sessions(self, now: float) -> int:
+        """
+        마감 시각이 지난 세션만 힙에서 꺼내 정리 (락 보유 상태에서 호출)
         
-        # 만료된 세션들 제거
-        for session_id in expired_sessions:
-            self.end_user_session(session_id)
+        활동이 갱신된 세션은 실제 마감 시각으로 다시 넣습니다.
         
-        self.last_cleanup = current_time
+        Returns:
+            만료된 세션 수
+        """
+        expired = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, _, session = heapq.heappop(self._expiry_heap)
+            if self.user_sessions.get(session.session_id) is not session:
+                self._stale_expiry_entries = max(0, self._stale_expiry_entries - 1)
+                continue
+            
+            deadline = session.last_activity + self.session_timeout
+            if deadline > now:
+                heapq.heappush(self._expiry_heap, (deadline, next(self._expiry_seq), session))
+                continue
+            
+            self.end_user_session(session.session_id)
+            self._stale_expiry_entries -= 1  # 이미 꺼낸 항목이므로 버릴 항목 수에서 제외
+            expired += 1
+        return expired
+    
+    def next_expiry(self) -> Optional[float]:
+        """가장 이른 만료 후보 시각 (없으면 None)"""
+        with self._lock:
+            return self._expiry_heap[0][0] if self._expiry_heap else None
+    
+    def cleanup_expired_sessions(self) -> int:
+        """만료된 세션들 정리 (만료 힙에서 마감이 지난 항목만 확인)"""
+        with self._lock:
+            current_time = self._clock()
+            expired = self._expire_due_sessions(current_time)
+            self.last_cleanup = current_time
         
-        if expired_sessions:
-            logger.info(f"Cleaned up {len(expired_sessions)} expired sessions")
+        if expired:
+            logger.info(f"Cleaned up {expired} expired sessions")
         
-        return len(expired_sessions)
+        return expired
+    
+    def start_expiry_worker(self) -> None:
+        """다음 만료 시각까지 대기했다가 세션을 정리하는 백그라운드 스레드 시작"""
+        with self._lock:
+            if self._expiry_thread and self._expiry_thread.is_alive():
+                return
+            self._expiry_stop = False
+            self._expiry_thread = threading.Thread(
+                target=self._expiry_loop, name="user-session-expiry", daemon=True
+            )
+            self._expiry_thread.start()
+        logger.info("Session expiry worker started")
+    
+    def stop_expiry_worker(self, timeout: float = 5.0) -> None:
+        """백그라운드 정리 스레드 종료"""
+        with self._lock:
+            thread = self._expiry_thread
+            self._expiry_stop = True
+            self._expiry_wakeup.notify_all()
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._expiry_thread = None
+    
+    def _expiry_loop(self) -> None:
+        with self._lock:
+            while not self._expiry_stop:
+                try:
+                    self.cleanup_expired_sessions()
+                except Exception as e:
+                    logger.error(f"Session expiry sweep failed: {str(e)}")
+                
+                wait = self.cleanup_interval
+                if self._expiry_heap:
+                    wait = min(wait, max(0.0, self._expiry_heap[0][0] - self._clock()))
+                self._expiry_wakeup.wait(timeout=wait)
     
     def get_system_stats(self) -> Dict[str, Any]:
         """시스템 전체 통계 반환"""
-        return {
-            "total_active_users": len(self.active_users),
-            "total_sessions": len(self.user_sessions),
-            "total_dialogues": len(self.dialogue_participants),
-            "online_users": len(self.get_online_users()),
-            "last_cleanup": self.last_cleanup,
-            "session_timeout": self.session_timeout
-        }
+        with self._lock:
+            return {
+                "total_active_users": len(self.active_users),
+                "total_sessions": len(self.user_sessions),
+                "total_dialogues": len(self.dialogue_participants),
+                "online_users": len(self.get_online_users()),
+                "last_cleanup": self.last_cleanup,
+                "session_timeout": self.session_timeout,
+                "pending_expiry_entries": len(self._expiry_heap),
+                "expiry_worker_running": bool(self._expiry_thread and self._expiry_thread.is_alive())
+            }
     
     def shutdown(self) -> None:
         """사용자 관리자 종료 처리"""
         logger.info("Shutting down UserManager...")
         
-        # 모든 세션 종료
-        session_ids = list(self.user_sessions.keys())
-        for session_id in session_ids:
-            self.end_user_session(session_id)
+        self.stop_expiry_worker()
         
-        # 데이터 정리
-        self.active_users.clear()
-        self.user_sessions.clear()
-        self.user_to_session.clear()
-        self.dialogue_participants.clear()
-        self.user_configs.clear()
+        with self._lock:
+            # 모든 세션 종료
+            session_ids = list(self.user_sessions.keys())
+            for session_id in session_ids:
+                self.end_user_session(session_id)
+            
+            # 데이터 정리
+            self.active_users.clear()
+            self.user_sessions.clear()
+            self.user_to_session.clear()
+            self.dialogue_participants.clear()
+            self.user_dialogues.clear()
+            self.user_configs.clear()
+            self._expiry_heap.clear()
+            self._stale_expiry_entries = 0
         
         logger.info("UserManager shutdown complete")
 
 # 전역 사용자 관리자 인스턴스
 _user_manager_instance = None
+_user_manager_lock = threading.Lock()
 
 def get_user_manager() -> UserManager:
-    """전역 사용자 관리자 인스턴스 반환"""
+    """전역 사용자 관리자 인스턴스 반환 (만료 정리 스레드 포함)"""
     global _user_manager_instance
     if _user_manager_instance is None:
-        _user_manager_instance = UserManager()
+        with _user_manager_lock:
+            if _user_manager_instance is None:
+                manager = UserManager()
+                manager.start_expiry_worker()
+                _user_manager_instance = manager
     return _user_manager_instance 
\ No newline at end of file
@@ -1,15 +1,32 @@
 """
 RAG 병렬 처리 모듈
 
-RAG 검색과 처리 작업을 세밀하게 병렬화하여 성능을 최적화
+RAG 검색과 처리 작업을 세밀하게 병렬화하여 성능을 최적화하고,
+방 단위 백그라운드 준비 작업을 의존성 그래프로 스케줄링
 """
 
 from .rag_parallel import (
     RAGParallelProcessor,
     PhilosopherDataLoader
 )
+from .task_graph import (
+    RoomTaskGraph,
+    SharedTaskPool,
+    TaskNode,
+    get_task_pool,
+    PRIORITY_URGENT,
+    PRIORITY_NORMAL,
+    PRIORITY_SPECULATIVE
+)
 
 __all__ = [
     'RAGParallelProcessor',
-    'PhilosopherDataLoader'
-] 
\ No newline at end of file
+    'PhilosopherDataLoader',
+    'RoomTaskGraph',
+    'SharedTaskPool',
+    'TaskNode',
+    'get_task_pool',
+    'PRIORITY_URGENT',
+    'PRIORITY_NORMAL',
+    'PRIORITY_SPECULATIVE'
+]
@@ -0,0 +1,461 @@
+"""
+방 단위 백그라운드 작업 의존성 그래프 스케줄러
+
+토론방의 백그라운드 준비 작업(상대 논지 추출/취약성 평가, 공격 전략 준비, 다음 발언자 입론 준비,
+모더레이터 오프닝)을 작업 노드와 명시적 의존성으로 표현하고, 모든 방이 공유하는 제한된
+워커 풀에서 우선순위 순으로 실행합니다.
+
+- 의존 작업이 모두 끝난 노드만 실행 대기열에 들어갑니다. 의존 작업이 실패/취소되면 함께 실패합니다.
+- 우선순위 값이 작을수록 먼저 실행됩니다. 다음 발언자에게 필요한 작업은 prioritize()로
+  (의존 작업까지 함께) 끌어올려 추측성 작업보다 먼저 실행할 수 있습니다.
+- 완료는 폴링 대신 wait() / wait_async()로 기다립니다 (노드마다 concurrent.futures.Future).
+- 방 정리 시 cancel_all()로 아직 실행되지 않은 작업을 취소하고 실행 중인 작업의 결과는 버립니다.
+- 이벤트 루프가 있든 없든 같은 방식으로 동작하므로 작업마다 스레드/이벤트 루프를 새로 만들지 않습니다.
+"""
+
+import os
+import time
+import heapq
+import asyncio
+import itertools
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, wait as wait_futures
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_URGENT = 0  # 다음 발언자가 기다리는 작업
+PRIORITY_NORMAL = 10  # 곧 필요한 작업
+PRIORITY_SPECULATIVE = 20  # 추측성 사전 준비
+
+# 노드 상태
+TASK_PENDING = "pending"  # 의존 작업 대기
+TASK_QUEUED = "queued"
+TASK_RUNNING = "running"
+TASK_DONE = "done"
+TASK_FAILED = "failed"
+TASK_CANCELLED = "cancelled"
+FINISHED_STATUSES = (TASK_DONE, TASK_FAILED, TASK_CANCELLED)
+
+DEFAULT_POOL_WORKERS = int(os.getenv("ROOM_TASK_WORKERS", "4"))
+
+
+@dataclass(eq=False)
+class TaskNode:
+    """작업 그래프의 노드 하나"""
+    key: str
+    fn: Callable[[], Any] = field(repr=False)
+    deps: Tuple[str, ...] = ()
+    priority: int = PRIORITY_NORMAL
+    tags: Tuple[str, ...] = ()
+    status: str = TASK_PENDING
+    result: Any = field(default=None, repr=False)
+    error: Optional[BaseException] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    future: Future = field(default_factory=Future, repr=False)
+    queue_version: int = field(default=0, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "deps": list(self.deps),
+            "priority": self.priority,
+            "tags": list(self.tags),
+            "status": self.status,
+            "error": str(self.error) if self.error else None,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+
+class SharedTaskPool:
+    """
+    모든 방이 공유하는 우선순위 워커 풀
+
+    우선순위가 바뀐 노드는 새 항목으로 다시 넣고, 이전 항목은 꺼낼 때 버전으로 걸러냅니다.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_POOL_WORKERS, name: str = "room-tasks"):
+        """
+        SharedTaskPool 초기화
+
+        Args:
+            max_workers: 워커 스레드 수 (처음 작업이 들어올 때 생성)
+            name: 스레드 이름 접두사
+        """
+        self.max_workers = max(1, max_workers)
+        self.name = name
+        self._heap: List[Tuple[int, int, int, TaskNode, 'RoomTaskGraph']] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._shutdown = False
+        self.stats = {"executed": 0, "failed": 0, "stale_entries": 0, "max_queue": 0}
+
+    def enqueue(self, graph: 'RoomTaskGraph', node: TaskNode) -> None:
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("task pool is shut down")
+            node.queue_version += 1
+            heapq.heappush(self._heap, (node.priority, next(self._seq), node.queue_version, node, graph))
+            self.stats["max_queue"] = max(self.stats["max_queue"], len(self._heap))
+            self._ensure_workers()
+            self._cond.notify()
+
+    def _ensure_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._work, daemon=True,
+                                      name=f"{self.name}-{len(self._workers)}")
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and not self._shutdown:
+                    self._cond.wait()
+                if self._shutdown and not self._heap:
+                    return
+                _, _, version, node, graph = heapq.heappop(self._heap)
+                if version != node.queue_version:
+                    self.stats["stale_entries"] += 1
+                    continue
+            ok = graph._execute(node)
+            with self._cond:
+                self.stats["executed"] += 1
+                if not ok:
+                    self.stats["failed"] += 1
+
+    def queue_size(self) -> int:
+        with self._cond:
+            return len(self._heap)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {"workers": self.max_workers, "queued": len(self._heap), **self.stats}
+
+
+_task_pool: Optional[SharedTaskPool] = None
+_task_pool_lock = threading.Lock()
+
+
+def get_task_pool() -> SharedTaskPool:
+    """방 백그라운드 작업용 공유 워커 풀 (처음 사용할 때 생성)"""
+    global _task_pool
+    with _task_pool_lock:
+        if _task_pool is None:
+            _task_pool = SharedTaskPool()
+        return _task_pool
+
+
+class RoomTaskGraph:
+    """
+    토론방 하나의 백그라운드 작업 그래프
+    """
+
+    def __init__(self, room_id: str, pool: Optional[SharedTaskPool] = None, history_size: int = 128):
+        """
+        RoomTaskGraph 초기화
+
+        Args:
+            room_id: 방 ID
+            pool: 실행할 워커 풀 (None이면 공유 풀)
+            history_size: 보관할 완료 노드 수 (넘으면 오래된 것부터 정리)
+        """
+        self.room_id = room_id
+        self._pool = pool
+        self.history_size = history_size
+        self._nodes: Dict[str, TaskNode] = {}
+        self._pruned: 'OrderedDict[str, str]' = OrderedDict()  # 정리된 노드의 종료 상태
+        self._lock = threading.RLock()
+        self._closed = False
+        self.stats = {"submitted": 0, "deduplicated": 0, "completed": 0, "failed": 0,
+                      "cancelled": 0, "reprioritized": 0}
+
+    @property
+    def pool(self) -> SharedTaskPool:
+        return self._pool or get_task_pool()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    # ------------------------------------------------------------------
+    # 제출 / 실행
+    # ------------------------------------------------------------------
+
+    def submit(self, key: str, fn: Callable[[], Any], deps: Iterable[str] = (),
+               priority: int = PRIORITY_NORMAL, tags: Iterable[str] = ()) -> TaskNode:
+        """
+        작업 제출
+
+        같은 키의 작업이 아직 유효하면(실패/취소가 아니면) 새로 만들지 않고 기존 노드를 돌려주며,
+        더 높은 우선순위로 제출되면 기존 노드의 우선순위를 올립니다.
+        아직 제출되지 않은 의존 키는 제출되어 끝날 때까지 기다립니다.
+
+        Args:
+            key: 작업 키 (방 안에서 고유)
+            fn: 실행할 함수 (워커 스레드에서 인자 없이 호출)
+            deps: 먼저 끝나야 하는 작업 키
+            priority: 우선순위 (작을수록 먼저)
+            tags: 조회/우선순위 조정용 태그
+
+        Returns:
+            작업 노드 (방이 정리된 뒤에는 취소된 노드)
+        """
+        to_settle: List[Tuple[TaskNode, str]] = []
+        with self._lock:
+            if self._closed:
+                node = TaskNode(key, fn, tuple(deps), priority, tuple(tags))
+                self._settle(node, TASK_CANCELLED, to_settle)
+            else:
+                existing = self._nodes.get(key)
+                if existing is not None and existing.status not in (TASK_FAILED, TASK_CANCELLED):
+                    self.stats["deduplicated"] += 1
+                    if priority < existing.priority:
+                        self._raise_priority(existing, priority)
+                    return existing
+
+                node = TaskNode(key, fn, tuple(deps), priority, tuple(tags))
+                self._nodes[key] = node
+                self._pruned.pop(key, None)
+                self.stats["submitted"] += 1
+                self._try_schedule(node, to_settle)
+                self._release_dependents(node, to_settle)
+        self._resolve(to_settle)
+        return node
+
+    def _try_schedule(self, node: TaskNode, to_settle: List[Tuple[TaskNode, str]]) -> None:
+        """의존 작업이 모두 끝났으면 실행 대기열에 넣음 (락 보유 상태)"""
+        if node.status != TASK_PENDING:
+            return
+        for dep_key in node.deps:
+            dep = self._nodes.get(dep_key)
+            dep_status = dep.status if dep is not None else self._pruned.get(dep_key)
+            if dep_status == TASK_DONE:
+                continue
+            if dep_status in (TASK_FAILED, TASK_CANCELLED):
+                node.error = RuntimeError(f"dependency {dep_key} {dep_status}")
+                self._settle(node, TASK_FAILED, to_settle)
+                self._release_dependents(node, to_settle)
+                return
+            return
+        node.status = TASK_QUEUED
+        self.pool.enqueue(self, node)
+
+    def _execute(self, node: TaskNode) -> bool:
+        """워커 스레드에서 노드 실행 (SharedTaskPool이 호출)"""
+        with self._lock:
+            if node.status != TASK_QUEUED:
+                return True
+            node.status = TASK_RUNNING
+            node.started_at = time.time()
+
+        result, error = None, None
+        try:
+            result = node.fn()
+        except Exception as e:
+            error = e
+            logger.error(f"❌ Room {self.room_id} task {node.key} failed: {str(e)}")
+
+        to_settle: List[Tuple[TaskNode, str]] = []
+        with self._lock:
+            if node.status == TASK_RUNNING:  # 실행 중 취소되었으면 결과를 버림
+                node.result = result
+                node.error = error
+                self._settle(node, TASK_FAILED if error else TASK_DONE, to_settle)
+                self._release_dependents(node, to_settle)
+                self._prune()
+        self._resolve(to_settle)
+        return error is None
+
+    def _release_dependents(self, node: TaskNode, to_settle: List[Tuple[TaskNode, str]]) -> None:
+        for dependent in list(self._nodes.values()):
+            if dependent.status == TASK_PENDING and node.key in dependent.deps:
+                self._try_schedule(dependent, to_settle)
+
+    def _settle(self, node: TaskNode, status: str, to_settle: List[Tuple[TaskNode, str]]) -> None:
+        """노드 종료 상태 기록 (Future 완료는 락 밖에서 _resolve가 처리)"""
+        node.status = status
+        node.finished_at = time.time()
+        self.stats[{TASK_DONE: "completed", TASK_FAILED: "failed", TASK_CANCELLED: "cancelled"}[status]] += 1
+        to_settle.append((node, status))
+
+    @staticmethod
+    def _resolve(to_settle: List[Tuple[TaskNode, str]]) -> None:
+        # 완료 콜백이 다른 락(대화 상태 락 등)을 잡을 수 있으므로 그래프 락 밖에서 Future 완료
+        for node, status in to_settle:
+            if node.future.done():
+                continue
+            if status == TASK_DONE:
+                node.future.set_result(node.result)
+            elif status == TASK_FAILED:
+                node.future.set_exception(node.error or RuntimeError(f"task {node.key} failed"))
+            else:
+                # concurrent.futures.wait()는 CANCELLED_AND_NOTIFIED 상태만 완료로 봄
+                node.future.cancel()
+                node.future.set_running_or_notify_cancel()
+
+    def _prune(self) -> None:
+        finished = [node for node in self._nodes.values() if node.finished]
+        excess = len(finished) - self.history_size
+        if excess <= 0:
+            return
+        needed = {dep for node in self._nodes.values() if not node.finished for dep in node.deps}
+        finished.sort(key=lambda node: node.finished_at or 0)
+        for node in finished:
+            if excess <= 0:
+                break
+            if node.key not in needed:
+                del self._nodes[node.key]
+                self._pruned[node.key] = node.status
+                excess -= 1
+        while len(self._pruned) > self.history_size * 4:
+            self._pruned.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # 우선순위 / 취소
+    # ------------------------------------------------------------------
+
+    def _select(self, keys: Optional[Iterable[str]] = None, tag: Optional[str] = None) -> List[TaskNode]:
+        with self._lock:
+            if keys is not None:
+                nodes = [self._nodes[key] for key in keys if key in self._nodes]
+            else:
+                nodes = list(self._nodes.values())
+            if tag is not None:
+                nodes = [node for node in nodes if tag in node.tags]
+            return nodes
+
+    def _raise_priority(self, node: TaskNode, priority: int) -> int:
+        """노드와 아직 끝나지 않은 의존 작업의 우선순위를 올림 (락 보유 상태)"""
+        raised = 0
+        stack = [node]
+        seen = set()
+        while stack:
+            current = stack.pop()
+            if current.key in seen or current.finished:
+                continue
+            seen.add(current.key)
+            if priority < current.priority:
+                current.priority = priority
+                raised += 1
+                if current.status == TASK_QUEUED:
+                    self.pool.enqueue(self, current)
+            stack.extend(self._nodes[dep] for dep in current.deps if dep in self._nodes)
+        self.stats["reprioritized"] += raised
+        return raised
+
+    def prioritize(self, keys: Optional[Iterable[str]] = None, tag: Optional[str] = None,
+                   priority: int = PRIORITY_URGENT) -> int:
+        """
+        작업(과 그 의존 작업)의 우선순위 올리기
+
+        Args:
+            keys: 대상 작업 키 (None이면 전체)
+            tag: 이 태그가 붙은 작업만
+            priority: 새 우선순위 (현재보다 높을 때만 적용)
+
+        Returns:
+            우선순위가 바뀐 노드 수
+        """
+        with self._lock:
+            return sum(self._raise_priority(node, priority) for node in self._select(keys, tag))
+
+    def cancel_all(self) -> int:
+        """
+        방 정리 시 모든 미완료 작업 취소 (이후 제출되는 작업도 즉시 취소)
+
+        Returns:
+            취소한 작업 수
+        """
+        to_settle: List[Tuple[TaskNode, str]] = []
+        with self._lock:
+            self._closed = True
+            for node in self._nodes.values():
+                if not node.finished:
+                    node.queue_version += 1  # 대기열 항목 무효화
+                    self._settle(node, TASK_CANCELLED, to_settle)
+        self._resolve(to_settle)
+        if to_settle:
+            logger.info(f"🛑 Cancelled {len(to_settle)} background task(s) for room {self.room_id}")
+        return len(to_settle)
+
+    # ------------------------------------------------------------------
+    # 조회 / 대기
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[TaskNode]:
+        with self._lock:
+            return self._nodes.get(key)
+
+    def status(self, key: str) -> Optional[str]:
+        node = self.get(key)
+        return node.status if node else None
+
+    def result(self, key: str) -> Any:
+        """완료된 작업의 결과 (없거나 끝나지 않았으면 None)"""
+        node = self.get(key)
+        return node.result if node is not None and node.status == TASK_DONE else None
+
+    def keys(self, tag: Optional[str] = None, unfinished_only: bool = False) -> List[str]:
+        return [node.key for node in self._select(tag=tag) if not (unfinished_only and node.finished)]
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(1 for node in self._nodes.values() if not node.finished)
+
+    def wait(self, keys: Optional[Iterable[str]] = None, tag: Optional[str] = None,
+             timeout: Optional[float] = None) -> bool:
+        """
+        작업 완료 대기 (동기)
+
+        Returns:
+            대상 작업이 모두 끝났는지 (실패/취소 포함, 시간 초과면 False)
+        """
+        futures = [node.future for node in self._select(keys, tag)]
+        if not futures:
+            return True
+        _, not_done = wait_futures(futures, timeout=timeout)
+        return not not_done
+
+    async def wait_async(self, keys: Optional[Iterable[str]] = None, tag: Optional[str] = None,
+                         timeout: Optional[float] = None) -> bool:
+        """작업 완료 대기 (이벤트 루프를 막지 않음)"""
+        futures = [node.future for node in self._select(keys, tag) if not node.future.done()]
+        if not futures:
+            return True
+        wrapped = [asyncio.wrap_future(future) for future in futures]
+        for item in wrapped:
+            # 실패한 작업의 예외는 노드에 남아 있으므로 여기서는 확인만 함
+            item.add_done_callback(lambda f: f.cancelled() or f.exception())
+        _, pending = await asyncio.wait(wrapped, timeout=timeout)
+        return not pending
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            by_status: Dict[str, int] = {}
+            for node in self._nodes.values():
+                by_status[node.status] = by_status.get(node.status, 0) + 1
+            return {"room_id": self.room_id, "nodes": len(self._nodes), "by_status": by_status,
+                    "closed": self._closed, **self.stats}
@@ -13,6 +13,7 @@ import logging
 import time
 import asyncio
 import json
+import threading
 from typing import Dict, List, Optional, Any, Union, Tuple
 from pathlib import Path
 import os
@@ -24,8 +25,13 @@ from ..state.dialogue_state import DialogueState
 from ...agents.base.agent import Agent
 from ...agents.participant.user_participant import UserParticipant
 from ...rag.retrieval.vector_store import VectorStore
-from ...agents.utility.debate_emotion_inference import infer_debate_emotion, apply_debate_emotion_to_prompt
+from ...agents.utility.debate_emotion_inference import infer_debate_emotion, apply_debate_emotion_to_prompt, DebateEmotionManager
+from ...agents.utility.turn_deadline import TurnDeadline, DEFAULT_TURN_BUDGET_SECONDS
+from ...agents.utility.debate_summary import RollingDebateSummarizer
 from ...models.llm.llm_manager import LLMManager  # LLMManager import 추가
+from ...utils.tracing import get_tracer, current_span
+from ...utils.log_pipeline import log_context
+from ..managers.room_admission import BYTES_PER_CHAR, BYTES_PER_EMBEDDING_VALUE
 
 # 새로운 개선사항 임포트 (고급 기능)
 from ..events.initialization_events import (
@@ -34,11 +40,16 @@ from ..events.initialization_events import (
     TaskProgressTracker,
     create_console_listener
 )
+from ..events.event_bus import get_event_bus, close_event_bus, TURN_EVENT_TOPIC
 from ..parallel.rag_parallel import RAGParallelProcessor, PhilosopherDataLoader
-from ...utils.pdf_processor import process_pdf
+from ..parallel.task_graph import RoomTaskGraph, PRIORITY_URGENT, PRIORITY_NORMAL, PRIORITY_SPECULATIVE
+from ...utils.pdf_processor import PDFProcessor, process_pdf
 
 logger = logging.getLogger(__name__)
 
+# 작업 그래프 노드 키
+MODERATOR_OPENING_TASK = "moderator_opening"
+
 # ============================================================================
 # CONSTANTS & ENUMS
 # ============================================================================
@@ -167,12 +178,34 @@ class DebateDialogue:
         # LLM 관리자 먼저 초기화 (stance_statements에서 사용)
         self.llm_manager = LLMManager()
         
+        # 감정 추론 관리자 (방 단위로 메모/백그라운드 사전 계산 결과 공유)
+        self.emotion_manager = DebateEmotionManager(self.llm_manager)
+        
+        # 참가자 턴 시간 예산 (초) - 감정 추론부터 응답 생성까지 전체에 적용
+        self.turn_budget_seconds = self.room_data.get('turn_budget_seconds', DEFAULT_TURN_BUDGET_SECONDS)
+        
         # 캐시 확인 및 적용
         self._check_and_apply_cache()
         
         self.stance_statements = self._generate_stance_statements()  # agents 초기화 전에 생성
         self.agents = self._initialize_agents()  # stance_statements 이후에 초기화
         
+        # 백그라운드 준비 작업 그래프 (논지 분석 → 공격 전략, 다음 발언자 입론, 모더레이터 오프닝)
+        # 모든 방이 공유하는 제한된 워커 풀에서 다음 발언자 순서 기반 우선순위로 실행
+        self.task_graph = RoomTaskGraph(self.room_id)
+        
+        # 찬반 누적 요약 (발언마다 백그라운드에서 접어 두고 모더레이터 요약 단계에서 바로 사용)
+        self.summarizer = RollingDebateSummarizer(self.llm_manager, self.task_graph,
+                                                  topic=self.room_data.get('title', ''))
+        
+        # 공격자가 전략을 고르면 방어자가 공격 생성과 겹쳐서 방어를 미리 준비하도록 연결
+        for agent in self.agents.values():
+            if hasattr(agent, 'attack_plan_listener'):
+                agent.attack_plan_listener = self._on_attack_plan_selected
+        
+        # 논지 분석 완료 표시용 락 (백그라운드 작업 스레드에서 갱신)
+        self.analysis_lock = threading.Lock()
+        
         # Option 2: 오프닝만 즉시 준비, 입론은 On-Demand
         # 모더레이터 오프닝만 미리 준비
         self._prepare_moderator_opening_only()
@@ -180,12 +213,17 @@ class DebateDialogue:
         # 논지 분석 상태 추적 시스템 초기화
         self._initialize_analysis_tracking()
         
-        # 백그라운드 준비 관련 상태
-        self.background_preparation_tasks = {}  # 에이전트별 백그라운드 준비 작업
-        
         # 기타 초기화
         self.playing = True
         
+        # 턴 진행(generate_response / process_message)과 백그라운드 분석 스레드가 함께 쓰는 상태 보호용
+        # 턴 순서 직렬화는 TurnCoordinator가, 스레드 간 state 변경은 이 락이 담당
+        self.state_lock = threading.RLock()
+        
+        # 방 이벤트 버스 (초기화/턴 이벤트를 구독자별 제한 큐로 비동기 전달)
+        self.event_bus = get_event_bus(self.room_id)
+        self._message_callback_subscription = None
+        
         # 스트리밍 관련 초기화 (기존 코드 유지)
         self.event_stream = None
         self.streaming_listeners = []
@@ -193,12 +231,7 @@ class DebateDialogue:
         self.initialization_history = []
         
         if enable_streaming:
-            try:
-                from ..streaming.event_stream import EventStream
-                self.event_stream = EventStream()
-            except ImportError:
-                logger.warning("EventStream not available, streaming disabled")
-                self.enable_streaming = False
+            self.event_stream = get_event_stream(self.room_id)
         
         # RAG 병렬 처리기 (사용하지 않지만 호환성 유지)
         try:
@@ -936,7 +969,20 @@ class DebateDialogue:
             try:
                 # 벡터 저장소 생성 및 문서 청크화 후 저장
                 vector_store = VectorStore(store_path=f"data/vector_store/{self.room_id}")
-                
+
+                # 스냅샷에서 복원하는 경우 저장된 벡터 저장소 재사용
+                snapshot_entry = self.room_data.get('restored_snapshot') or {}
+                if snapshot_entry.get('vector_store_saved') and vector_store.load():
+                    logger.info(f"Vector store loaded from snapshot ({len(vector_store.documents)} chunks)")
+                    return vector_store
+
+                # PDF는 페이지 묶음이 전처리되는 대로 청크화/임베딩 (나머지 페이지는 워커 프로세스에서 계속 추출)
+                if self._is_pdf_context(context):
+                    total_chars, total_chunks = self._ingest_pdf_context(context.strip(), vector_store)
+                    if total_chunks:
+                        logger.info(f"Vector store initialized with PDF context ({total_chars} chars), {total_chunks} chunks")
+                        return vector_store
+
                 # 컨텍스트 타입 판별 및 처리
                 processed_text = self._process_context_by_type(context)
                 
@@ -953,12 +999,47 @@ class DebateDialogue:
                 return None
         return None
         
+    @staticmethod
+    def _is_pdf_context(context: str) -> bool:
+        context = context.strip()
+        return context.lower().endswith('.pdf') and os.path.exists(context)
+
+    def _ingest_pdf_context(self, pdf_path: str, vector_store: VectorStore) -> Tuple[int, int]:
+        """
+        PDF를 페이지 묶음 단위로 스트리밍하면서 청크화해 벡터 저장소에 추가
+
+        Args:
+            pdf_path: PDF 파일 경로
+            vector_store: 청크를 추가할 벡터 저장소
+
+        Returns:
+            (추가한 텍스트 길이, 추가한 청크 수) - 도중에 실패하면 추가한 청크를 지우고 (0, 0)을 반환하므로
+            호출부는 전체 추출(_process_pdf_context)로 폴백합니다
+        """
+        total_chars = 0
+        total_chunks = 0
+        try:
+            processor = PDFProcessor(use_grobid=False, extraction_method="pymupdf")
+            for text in processor.iter_processed_text(pdf_path):
+                chunks = self._split_context_to_paragraphs(text)
+                if chunks:
+                    vector_store.add_documents(chunks)
+                total_chars += len(text)
+                total_chunks += len(chunks)
+        except Exception as e:
+            # 일부 페이지만 담긴 저장소를 완성된 것처럼 쓰지 않도록 비우고 폴백
+            logger.error(f"Streaming PDF ingestion failed after {total_chunks} chunks, "
+                         f"falling back to full extraction: {str(e)}")
+            vector_store.clear()
+            return 0, 0
+        return total_chars, total_chunks
+
     def _process_context_by_type(self, context: str) -> str:
         """컨텍스트 타입에 따라 적절히 처리"""
         context = context.strip()
         
         # PDF 파일 경로인지 확인
-        if context.lower().endswith('.pdf') and os.path.exists(context):
+        if self._is_pdf_context(context):
             logger.info(f"Processing PDF file: {context}")
             return self._process_pdf_context(context)
         
@@ -1418,7 +1499,8 @@ Important:
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 llm_model="gpt-4",
-                max_tokens=1000
+                max_tokens=1000,
+                context_type="stance_statements"  # 같은 주제면 응답 캐시 재사용
             )
             
             # JSON 파싱
@@ -1530,6 +1612,20 @@ Important: Be objective and neutral. Don't take sides in the debate.
     # ========================================================================
     
     def generate_response(self) -> Dict[str, Any]:
+        """
+        토론 응답 생성 (한 턴 전체를 "debate.turn" span으로 기록)
+            
+        Returns:
+            응답 생성 결과
+        """
+        turn_number = self.state.get("turn_count", 0) + 1
+        with self.state_lock, log_context(room_id=self.room_id, turn_id=turn_number), \
+                get_tracer().span("debate.turn", kind="turn", room_id=self.room_id, turn_number=turn_number) as span:
+            result = self._generate_turn_response()
+            span.set("result_status", result.get("status"))
+            return result
+    
+    def _generate_turn_response(self) -> Dict[str, Any]:
         """
         토론 응답 생성 (Option 2: On-Demand + Background Pre-loading)
             
@@ -1560,6 +1656,7 @@ Important: Be objective and neutral. Don't take sides in the debate.
             current_stage = self.state["current_stage"]
         
             logger.info(f"Generating response for {speaker_id} ({role}) in stage {current_stage}")
+            current_span().set_attributes(speaker_id=speaker_id, role=role, stage=current_stage)
             
             # 에이전트 가져오기
             agent = self.agents.get(speaker_id)
@@ -1579,13 +1676,27 @@ Important: Be objective and neutral. Don't take sides in the debate.
                 
             else:
                 # 기타 단계: 기존 방식 사용
-                context = self._build_response_context(speaker_id, role)
+                # 참가자 턴은 컨텍스트 구성(감정 추론)부터 마감 시간 적용
+                turn_deadline = None
+                if role in [ParticipantRole.PRO, ParticipantRole.CON]:
+                    turn_deadline = TurnDeadline(self.turn_budget_seconds)
+                context = self._build_response_context(speaker_id, role, turn_deadline)
                 
                 # 모더레이터인 경우 참가자 정보 추가
                 if role == ParticipantRole.MODERATOR:
+                    if current_stage == DebateStage.OPENING:
+                        # 백그라운드에서 준비 중인 오프닝을 기다림 (중복 생성 방지)
+                        self.task_graph.prioritize([MODERATOR_OPENING_TASK])
+                        self.task_graph.wait([MODERATOR_OPENING_TASK], timeout=self.turn_budget_seconds)
+                    
                     pro_participants = self._get_participants_by_role(ParticipantRole.PRO)
                     con_participants = self._get_participants_by_role(ParticipantRole.CON)
                     
+                    # 요약 단계에서는 미리 접어 둔 찬반 요약만 전달 (전체 발언 기록을 다시 읽지 않음)
+                    rolling_summary = None
+                    if current_stage in [DebateStage.MODERATOR_SUMMARY_1, DebateStage.MODERATOR_SUMMARY_2]:
+                        rolling_summary = self.summarizer.get_digests(timeout=self.turn_budget_seconds)
+                    
                     # 모더레이터에게 전달할 데이터 구성
                     moderator_data = {
                         "action": "generate_response",
@@ -1596,7 +1707,8 @@ Important: Be objective and neutral. Don't take sides in the debate.
                             "participants_info": {
                                 "pro": pro_participants,
                                 "con": con_participants
-                            }
+                            },
+                            "rolling_summary": rolling_summary
                         },
                         "stance_statements": self.stance_statements
                     }
@@ -1608,6 +1720,10 @@ Important: Be objective and neutral. Don't take sides in the debate.
                         result = {"status": "error", "message": f"모더레이터 처리 중 예외 발생: {str(agent_error)}"}
                 else:
                     # 일반 참가자인 경우
+                    # 공격 생성 중에 시작된 방어 준비가 남아 있으면 남은 예산 안에서 기다림
+                    if current_stage == DebateStage.INTERACTIVE_ARGUMENT:
+                        self._wait_for_defense_prefetch(speaker_id, turn_deadline)
+                    
                     try:
                         # dialogue_state에 participants 정보와 agents 참조 추가
                         enhanced_dialogue_state = {
@@ -1620,7 +1736,8 @@ Important: Be objective and neutral. Don't take sides in the debate.
                             "action": "generate_response",
                             "context": context,
                             "dialogue_state": enhanced_dialogue_state,
-                            "stance_statements": self.stance_statements
+                            "stance_statements": self.stance_statements,
+                            "turn_deadline": turn_deadline
                         })
                     except Exception as agent_error:
                         logger.error(f"Exception in agent.process: {str(agent_error)}")
@@ -1642,6 +1759,8 @@ Important: Be objective and neutral. Don't take sides in the debate.
                         "rag_sources": result.get("rag_sources", []),
                         "citations": result.get("citations", [])
                     }
+                    if result.get("turn_budget"):
+                        rag_info["turn_budget"] = result["turn_budget"]
             
             # 대화 상태 업데이트
             self.state["turn_count"] += 1
@@ -1754,44 +1873,14 @@ Important: Be objective and neutral. Don't take sides in the debate.
                 DebateStage.PRO_ARGUMENT, DebateStage.CON_ARGUMENT, 
                 DebateStage.INTERACTIVE_ARGUMENT
             ]:
-                # 백그라운드 태스크로 즉시 실행 (결과를 기다리지 않음)
-                try:
-                    import asyncio
-                    loop = asyncio.get_running_loop()
-                    # fire-and-forget 방식으로 백그라운드 실행
-                    loop.create_task(self._trigger_argument_analysis_async(speaker_id, message, role))
-                    logger.info(f"Started background argument analysis for {speaker_id}")
-                except RuntimeError:
-                    # 이벤트 루프가 없으면 새 스레드에서 이벤트 루프 생성하여 실행
-                    import threading
-                    
-                    def run_analysis_in_new_loop():
-                        try:
-                            # 새 이벤트 루프 생성
-                            new_loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(new_loop)
-                            
-                            # 논지 분석 실행
-                            new_loop.run_until_complete(
-                                self._trigger_argument_analysis_async(speaker_id, message, role)
-                            )
-                            
-                            logger.info(f"Background argument analysis completed for {speaker_id}")
-                        except Exception as e:
-                            logger.error(f"Error in background argument analysis: {str(e)}")
-                        finally:
-                            # 이벤트 루프 정리
-                            try:
-                                new_loop.close()
-                            except:
-                                pass
-                    
-                    # 새 스레드에서 실행 (백그라운드)
-                    analysis_thread = threading.Thread(target=run_analysis_in_new_loop, daemon=True)
-                    analysis_thread.start()
-                    logger.info(f"Started background argument analysis thread for {speaker_id}")
-                except Exception as e:
-                    logger.error(f"Failed to start background argument analysis: {str(e)}")
+                # 작업 그래프에 분석 → 공격 전략 노드 제출 (결과를 기다리지 않음)
+                self._schedule_argument_analysis(speaker_id, message, role)
+                
+                # 모더레이터 요약용 누적 요약에 발언 반영
+                self.summarizer.observe(message_obj)
+                
+                # 상대측 화자의 감정을 미리 계산 (다음 턴에서 LLM 대기 없이 사용)
+                self._schedule_emotion_precompute(role)
             
             # 다음 단계로 진행할지 확인
             should_advance, next_stage = self._should_advance_stage(current_stage)
@@ -1829,7 +1918,7 @@ Important: Be objective and neutral. Don't take sides in the debate.
                         "speaker_id": pro_participants[0],
                         "role": ParticipantRole.PRO
                     }
-                    self._safe_create_background_task(next_speaker_info)
+                    self._schedule_speaker_preparation(next_speaker_info)
                     
             elif current_stage == DebateStage.PRO_ARGUMENT:
                 # 찬성측 입론 중 → 다음 찬성측 또는 반대측 첫 번째 준비
@@ -1848,14 +1937,14 @@ Important: Be objective and neutral. Don't take sides in the debate.
                         "speaker_id": pro_participants[pro_speaking_count],
                         "role": ParticipantRole.PRO
                     }
-                    self._safe_create_background_task(next_speaker_info)
+                    self._schedule_speaker_preparation(next_speaker_info)
                 elif con_participants:
                     # 반대측 첫 번째 준비
                     next_speaker_info = {
                         "speaker_id": con_participants[0],
                         "role": ParticipantRole.CON
                     }
-                    self._safe_create_background_task(next_speaker_info)
+                    self._schedule_speaker_preparation(next_speaker_info)
                     
             elif current_stage == DebateStage.CON_ARGUMENT:
                 # 반대측 입론 중 → 다음 반대측 준비
@@ -1871,29 +1960,77 @@ Important: Be objective and neutral. Don't take sides in the debate.
                         "speaker_id": con_participants[con_speaking_count],
                         "role": ParticipantRole.CON
                     }
-                    self._safe_create_background_task(next_speaker_info)
+                    self._schedule_speaker_preparation(next_speaker_info)
                     
         except Exception as e:
             logger.error(f"Error starting next speaker preparation: {str(e)}")
     
-    def _safe_create_background_task(self, next_speaker_info: Dict[str, Any]) -> None:
-        """이벤트 루프가 있을 때만 백그라운드 태스크 생성"""
+    def _schedule_speaker_preparation(self, next_speaker_info: Dict[str, Any]) -> None:
+        """
+        다음 발언자 입론 준비를 작업 그래프에 제출 (이벤트 루프 유무와 관계없이 동작)
+        
+        바로 다음 차례의 작업이므로 추측성 분석 작업보다 먼저 실행됩니다.
+        """
         try:
-            import asyncio
-            # 현재 실행 중인 이벤트 루프가 있는지 확인
-            loop = asyncio.get_running_loop()
-            if loop and not loop.is_closed():
-                asyncio.create_task(self._prepare_next_speaker_in_background(next_speaker_info))
-            else:
-                logger.info("No running event loop found, skipping background task creation")
-        except RuntimeError:
-            # 이벤트 루프가 없는 경우
-            logger.info("No event loop running, skipping background speaker preparation")
+            speaker_id = next_speaker_info.get("speaker_id")
+            role = next_speaker_info.get("role")
+            
+            if not speaker_id or role not in [ParticipantRole.PRO, ParticipantRole.CON]:
+                return
+            
+            agent = self.agents.get(speaker_id)
+            if not agent or not hasattr(agent, 'prepare_argument_with_rag'):
+                return
+            
+            # 이미 준비되어 있으면 스킵
+            if hasattr(agent, 'is_argument_ready') and agent.is_argument_ready():
+                return
+            
+            topic = self.room_data.get('title', '토론 주제')
+            stance_statement = self.stance_statements.get(role, '')
+            context = {
+                "topic": topic,
+                "role": role,
+                "current_stage": self.state.get("current_stage")
+            }
+            
+            def prepare_argument():
+                agent.prepare_argument_with_rag(topic, stance_statement, context)
+                return bool(getattr(agent, 'argument_prepared', False))
+            
+            # 같은 발언자의 준비 작업이 이미 있으면 기존 노드를 재사용
+            self.task_graph.submit(f"argument:{speaker_id}", prepare_argument,
+                                   priority=PRIORITY_URGENT, tags=(f"speaker:{speaker_id}",))
+            logger.info(f"Scheduled background argument preparation for {speaker_id} ({role})")
+            
         except Exception as e:
-            logger.error(f"Error creating background task: {str(e)}")
+            logger.error(f"Error scheduling speaker preparation: {str(e)}")
     
-    def _build_response_context(self, speaker_id: str, role: str) -> Dict[str, Any]:
-        """응답 생성을 위한 컨텍스트 구성"""
+    def _search_vector_context(self, query: str, limit: int = 3) -> List[str]:
+        """
+        대화 벡터 저장소에서 관련 텍스트 검색
+        
+        Args:
+            query: 검색 쿼리
+            limit: 최대 결과 수
+            
+        Returns:
+            관련 텍스트 목록
+        """
+        with get_tracer().span("rag.vector_search", kind="rag", source="dialogue_vector_store", limit=limit) as rag_span:
+            search_results = self.vector_store.search(query, limit=limit)
+            rag_span.set("result_count", len(search_results))
+        return [result.get('text', '') for result in search_results]
+    
+    def _build_response_context(self, speaker_id: str, role: str, turn_deadline: Optional[TurnDeadline] = None) -> Dict[str, Any]:
+        """
+        응답 생성을 위한 컨텍스트 구성
+        
+        Args:
+            speaker_id: 발언자 ID
+            role: 발언자 역할
+            turn_deadline: 턴 마감 시간 (있으면 예산이 부족한 보강 단계를 생략/대체)
+        """
         current_stage = self.state["current_stage"]
         
         # 단계별로 필요한 컨텍스트 최적화
@@ -1935,7 +2072,7 @@ Important: Be objective and neutral. Don't take sides in the debate.
             else:
                 recent_messages = []
         
-        # 관련 벡터 검색 (벡터 저장소가 있는 경우)
+        # 관련 벡터 검색 (벡터 저장소가 있는 경우) - 턴 마감이 있으면 남은 보강 예산 안에서만 실행
         relevant_context = []
         if self.vector_store:
             # 현재 토론 단계와 역할에 맞는 쿼리 구성
@@ -1955,8 +2092,12 @@ Important: Be objective and neutral. Don't take sides in the debate.
                 if not query.strip():
                     query = self.room_data.get('title', '')
             
-            search_results = self.vector_store.search(query, limit=3)
-            relevant_context = [result.get('text', '') for result in search_results]
+            if turn_deadline:
+                relevant_context = turn_deadline.call_with_budget(
+                    "rag", self._search_vector_context, query, fallback=[], fallback_name="none"
+                )
+            else:
+                relevant_context = self._search_vector_context(query)
         
         # 감정 컨텍스트 추가 (반론과 QA 단계에서만)
         emotion_enhancement = {}
@@ -1967,22 +2108,8 @@ Important: Be objective and neutral. Don't take sides in the debate.
                 opponent_role = ParticipantRole.CON if role == ParticipantRole.PRO else ParticipantRole.PRO
                 logger.info(f"Identified opponent role as {opponent_role} for speaker with role {role}")
                 
-                # 상대측 메시지 수집
-                if current_stage in [DebateStage.INTERACTIVE_ARGUMENT, DebateStage.MODERATOR_SUMMARY_2]:
-                    # 상호논증 단계에서는 상대측 입론 사용
-                    opponent_stage = DebateStage.CON_ARGUMENT if role == ParticipantRole.PRO else DebateStage.PRO_ARGUMENT
-                    logger.info(f"Using opponent messages from stage {opponent_stage} for rebuttal")
-                    opponent_messages = [
-                        msg for msg in self.state["speaking_history"] 
-                        if msg.get("stage") == opponent_stage and msg.get("role") == opponent_role
-                    ]
-                else:
-                    # QA 단계에서는 현재 QA 세션의 상대측 메시지 사용
-                    logger.info(f"Using opponent messages from current QA session stage {current_stage}")
-                    opponent_messages = [
-                        msg for msg in self.state["speaking_history"] 
-                        if msg.get("stage") == current_stage and msg.get("role") == opponent_role
-                    ]
+                # 상대측 메시지 수집 (상호논증 단계에서는 상대측 입론 사용)
+                opponent_messages = self._collect_emotion_opponent_messages(role)
                 
                 logger.info(f"Found {len(opponent_messages)} opponent messages for emotion inference")
                 
@@ -1993,18 +2120,27 @@ Important: Be objective and neutral. Don't take sides in the debate.
                 speaker_stance = self.stance_statements.get(role.lower(), "") if role.lower() in ["pro", "con"] else ""
                 logger.info(f"Using speaker stance statement: {speaker_stance[:50]}...")
                 
-                # 감정 추론 호출
+                # 감정 추론 호출 - 턴 안에서는 메모/사전 계산/분류기만 사용하며, 진행 중인 사전 계산은
+                # emotion_llm 비용만큼만 기다림 (예산이 부족하면 기다리지 않고 분류기만 사용)
                 if opponent_messages and llm_manager:
                     logger.info(f"Calling infer_debate_emotion for {speaker_id}")
-                    emotion_data = infer_debate_emotion(
+                    emotion_kwargs = dict(
                         llm_manager=llm_manager,
                         speaker_id=speaker_id,
                         speaker_role=role.lower(),
                         opponent_messages=opponent_messages,
                         debate_topic=self.room_data.get('title', ''),
                         debate_stage=current_stage,
-                        stance_statement=speaker_stance
+                        stance_statement=speaker_stance,
+                        emotion_manager=self.emotion_manager
                     )
+                    allow_llm = turn_deadline is None or turn_deadline.allows("emotion_llm")
+                    if turn_deadline and not allow_llm:
+                        turn_deadline.drop("emotion_llm", "budget", "classifier")
+                    emotion_data = infer_debate_emotion(allow_llm=allow_llm, turn_deadline=turn_deadline,
+                                                        **emotion_kwargs)
+                    if turn_deadline and allow_llm:
+                        turn_deadline.mark_used("emotion_llm")
                     
                     # 결과에서 프롬프트 향상 정보 추출
                     if "prompt_enhancement" in emotion_data:
@@ -2029,6 +2165,97 @@ Important: Be objective and neutral. Don't take sides in the debate.
             "emotion_enhancement": emotion_enhancement
         }
     
+    def _collect_emotion_opponent_messages(self, role: str) -> List[Dict[str, Any]]:
+        """
+        감정 추론에 사용할 상대측 입론 메시지 수집
+        
+        Args:
+            role: 감정을 추론할 화자의 역할
+            
+        Returns:
+            상대측 입론 단계 메시지 목록
+        """
+        opponent_role = ParticipantRole.CON if role == ParticipantRole.PRO else ParticipantRole.PRO
+        opponent_stage = DebateStage.CON_ARGUMENT if role == ParticipantRole.PRO else DebateStage.PRO_ARGUMENT
+        return [
+            msg for msg in self.state["speaking_history"]
+            if msg.get("stage") == opponent_stage and msg.get("role") == opponent_role
+        ]
+    
+    def _on_attack_plan_selected(self, attacker_id: str, target_id: str, attack_strategy: Dict[str, Any]) -> None:
+        """
+        공격자가 공격 전략을 고른 직후 호출 - 방어자의 방어 준비를 작업 그래프에 제출
+        
+        공격 문장이 생성되는 동안 방어 후보 전략 결정과 RAG 근거 검색이 함께 진행되므로
+        방어 턴에서는 최종 생성 호출만 남습니다.
+        
+        Args:
+            attacker_id: 공격자 ID
+            target_id: 공격 대상(방어자) ID
+            attack_strategy: 선택된 공격 전략
+        """
+        defender = self.agents.get(target_id)
+        if defender is None or target_id in self.user_participants or not hasattr(defender, 'prefetch_defense'):
+            return
+        
+        key = f"defense:{target_id}<-{attacker_id}@{self.state.get('turn_count', 0)}"
+        self.task_graph.submit(
+            key, lambda: defender.prefetch_defense(attacker_id, attack_strategy),
+            priority=PRIORITY_URGENT, tags=(f"defense:{target_id}",)
+        )
+        logger.info(f"🛡️ Defense prefetch scheduled for {target_id} against {attacker_id} "
+                    f"({attack_strategy.get('strategy_type', 'Unknown')})")
+    
+    def _wait_for_defense_prefetch(self, speaker_id: str, turn_deadline: Optional[TurnDeadline]) -> None:
+        """방어자의 방어 준비 작업이 진행 중이면 턴 예산 안에서 완료 대기"""
+        tag = f"defense:{speaker_id}"
+        if not self.task_graph.keys(tag=tag, unfinished_only=True):
+            return
+        timeout = max(0.0, turn_deadline.spendable()) if turn_deadline else self.turn_budget_seconds
+        if not self.task_graph.wait(tag=tag, timeout=timeout):
+            logger.warning(f"⏱️ Defense prefetch for {speaker_id} not ready within {timeout:.1f}s, resolving live")
+    
+    def _schedule_emotion_precompute(self, speaker_role: str) -> None:
+        """
+        발언 직후 상대편 에이전트들의 상호논증 감정을 백그라운드에서 미리 계산
+        
+        _build_response_context는 같은 키로 메모된 결과를 바로 사용하므로
+        감정 추론이 다음 턴의 응답 지연에 더해지지 않습니다.
+        
+        Args:
+            speaker_role: 방금 발언한 화자의 역할
+        """
+        if speaker_role not in [ParticipantRole.PRO, ParticipantRole.CON]:
+            return
+        
+        # 상호논증 단계가 지난 뒤에는 미리 계산할 필요 없음
+        current_stage = self.state["current_stage"]
+        remaining_stages = DebateStage.STAGE_SEQUENCE[:DebateStage.STAGE_SEQUENCE.index(DebateStage.INTERACTIVE_ARGUMENT) + 1]
+        if current_stage not in remaining_stages:
+            return
+        
+        listener_role = ParticipantRole.CON if speaker_role == ParticipantRole.PRO else ParticipantRole.PRO
+        opponent_messages = self._collect_emotion_opponent_messages(listener_role)
+        if not opponent_messages:
+            return
+        
+        try:
+            for listener_id in self.participants.get(listener_role, []):
+                # 사용자 참가자는 감정 프롬프트를 사용하지 않음
+                if listener_id not in self.agents or listener_id in self.user_participants:
+                    continue
+                self.emotion_manager.precompute_emotion(
+                    speaker_id=listener_id,
+                    speaker_role=listener_role,
+                    opponent_messages=opponent_messages,
+                    debate_topic=self.room_data.get('title', ''),
+                    debate_stage=DebateStage.INTERACTIVE_ARGUMENT,
+                    stance_statement=self.stance_statements.get(listener_role, ""),
+                    deadline_seconds=self.turn_budget_seconds  # 다음 턴 예산 안에 끝나야 메모가 쓰임
+                )
+        except Exception as e:
+            logger.error(f"Failed to schedule emotion precompute: {str(e)}")
+    
     def get_next_speaker(self) -> Dict[str, Any]:
         """
         다음 발언자 결정
@@ -2206,6 +2433,7 @@ Important: Be objective and neutral. Don't take sides in the debate.
                 return {"speaker_id": attacker_id, "role": attacker_role}
             else:
                 logger.info(f"[{attacker_id}] waiting for analysis completion")
+                self.prioritize_speaker_analysis(attacker_id)
             return {
                     "speaker_id": attacker_id, 
                     "role": attacker_role, 
@@ -2502,6 +2730,14 @@ Important: Be objective and neutral. Don't take sides in the debate.
     def cleanup_resources(self):
         """리소스 정리"""
         try:
+            # 아직 실행되지 않은 백그라운드 준비 작업 취소
+            if getattr(self, 'task_graph', None):
+                self.task_graph.cancel_all()
+            
+            # 감정 사전 계산 실행기 정리
+            if getattr(self, 'emotion_manager', None):
+                self.emotion_manager.shutdown()
+            
             # RAG 병렬 처리기 정리
             if self.rag_processor:
                 self.rag_processor.cleanup()
@@ -2513,6 +2749,10 @@ Important: Be objective and neutral. Don't take sides in the debate.
                 cleanup_event_stream(self.room_id)
                 logger.info(f"Cleaned up event stream for room {self.room_id}")
             
+            # 이벤트 버스 정리 (같은 방이 다시 만들어진 경우 새 버스는 유지)
+            if getattr(self, 'event_bus', None):
+                close_event_bus(self.room_id, self.event_bus)
+            
             logger.info(f"Resource cleanup completed for room {self.room_id}")
             
         except Exception as e:
@@ -2547,16 +2787,173 @@ Important: Be objective and neutral. Don't take sides in the debate.
             "vector_store_available": self.vector_store is not None,
             "current_stage": self.state.get("current_stage", "unknown"),
             "turn_count": self.state.get("turn_count", 0),
-            "playing": self.playing
+            "playing": self.playing,
+            "emotion_inference": self.emotion_manager.get_memo_stats(),
+            "tracing_enabled": get_tracer().enabled,
+            "event_bus": self.event_bus.get_stats(),
+            "message_callback": (self._message_callback_subscription.get_stats()
+                                 if self._message_callback_subscription else None),
+            "task_graph": self.task_graph.get_stats(),
+            "rolling_summary": self.summarizer.get_stats()
         }
         
         # 초기화 진행 상황 추가
         if self.event_stream:
             progress = self.event_stream.get_progress_summary()
             metrics["initialization_progress"] = progress
-        
+
         return metrics
-    
+
+    def get_resource_usage(self) -> Dict[str, Any]:
+        """
+        방 단위 리소스 사용량 (입장 제어/스필 판단용)
+
+        Returns:
+            벡터 저장소, 캐시된 입론, 발언 히스토리, 진행 중 작업 수와 추정 메모리(bytes)
+        """
+        documents = getattr(self.vector_store, 'documents', None) or []
+        index = getattr(self.vector_store, 'index', None)
+        vector_values = getattr(index, 'ntotal', 0) * getattr(index, 'd', 0) if index is not None else 0
+        vector_bytes = (sum(len(str(doc.get('text', ''))) for doc in documents) * BYTES_PER_CHAR
+                        + vector_values * BYTES_PER_EMBEDDING_VALUE)
+
+        cached_arguments = 0
+        cached_argument_bytes = 0
+        for agent in self.agents.values():
+            cache_manager = getattr(agent, 'argument_cache_manager', None)
+            prepared = getattr(agent, 'prepared_argument', '') or getattr(cache_manager, 'prepared_argument', '')
+            if isinstance(prepared, str) and prepared:
+                cached_arguments += 1
+                cached_argument_bytes += len(prepared) * BYTES_PER_CHAR
+
+        history = self.state.get("speaking_history", [])
+        history_bytes = sum(len(str(msg.get("text", ""))) for msg in history) * BYTES_PER_CHAR
+
+        inflight_tasks = self.task_graph.pending_count()
+        inflight_tasks += self.emotion_manager.get_memo_stats().get("pending", 0)
+
+        return {
+            "vector_documents": len(documents),
+            "vector_bytes": vector_bytes,
+            "cached_arguments": cached_arguments,
+            "cached_argument_bytes": cached_argument_bytes,
+            "history_length": len(history),
+            "history_bytes": history_bytes,
+            "inflight_tasks": inflight_tasks
+        }
+
+    # ========================================================================
+    # ROOM SNAPSHOT (SPILL / RESTORE)
+    # ========================================================================
+
+    def to_snapshot(self, save_vector_store: bool = True) -> Dict[str, Any]:
+        """
+        메모리에서 내리기 전 방 상태 스냅샷 생성
+
+        입장 진술문/컨텍스트 요약/오프닝은 캐시 항목 형식(generated_data)으로 저장하므로
+        복원 시 LLM을 다시 호출하지 않습니다. 벡터 저장소는 디스크에 저장해 두고 다시 불러옵니다.
+
+        Args:
+            save_vector_store: 벡터 저장소도 디스크에 저장할지 (턴마다 남기는 체크포인트는
+                이전에 저장한 벡터 저장소를 재사용)
+
+        Returns:
+            JSON 직렬화 가능한 스냅샷
+        """
+        vector_store_saved = getattr(self, '_vector_store_persisted', False)
+        if self.vector_store is not None and (save_vector_store or not vector_store_saved):
+            try:
+                self.vector_store.save()
+                vector_store_saved = True
+                self._vector_store_persisted = True
+            except Exception as e:
+                vector_store_saved = False
+                logger.error(f"Error saving vector store for snapshot: {str(e)}")
+
+        context_summary = getattr(self, 'context_summary', {}) or {}
+        opening_message = getattr(self, 'cached_opening_message', '') or next(
+            (msg.get("text", "") for msg in self.state.get("speaking_history", [])
+             if msg.get("stage") == DebateStage.OPENING and msg.get("role") == ParticipantRole.MODERATOR),
+            ''
+        )
+
+        agents = {}
+        for agent_id, agent in self.agents.items():
+            cache_manager = getattr(agent, 'argument_cache_manager', None)
+            prepared = getattr(agent, 'prepared_argument', '') or getattr(cache_manager, 'prepared_argument', '')
+            if not prepared and not getattr(agent, 'core_arguments', None):
+                continue
+            agents[agent_id] = {
+                "prepared_argument": prepared,
+                "argument_prepared": bool(getattr(agent, 'argument_prepared', False) or prepared),
+                "core_arguments": getattr(agent, 'core_arguments', [])
+            }
+
+        return {
+            "room_id": self.room_id,
+            "room_data": self.room_data,
+            "state": self.state,
+            "generated_data": {
+                "stance_statements": self.stance_statements,
+                "context_summary": {
+                    "summary": context_summary.get('summary') or context_summary.get('objective_summary', ''),
+                    "key_points": context_summary.get('key_points') or context_summary.get('bullet_points', []),
+                    "relevant_quotes": context_summary.get('relevant_quotes', [])
+                },
+                "opening_message": opening_message
+            },
+            "agents": agents,
+            "rolling_summary": self.summarizer.to_dict(),
+            "vector_store_saved": vector_store_saved,
+            "snapshot_time": time.time()
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any], **kwargs) -> 'DebateDialogue':
+        """
+        스냅샷에서 방 복원
+
+        Args:
+            snapshot: to_snapshot()이 만든 스냅샷
+            **kwargs: 생성자에 전달할 추가 인자 (message_callback 등)
+
+        Returns:
+            복원된 DebateDialogue
+        """
+        room_id = snapshot["room_id"]
+        room_data = dict(snapshot.get("room_data") or {})
+        room_data['restored_snapshot'] = {
+            "topic_id": f"snapshot:{room_id}",
+            "generated_data": snapshot.get("generated_data", {}),
+            "vector_store_saved": snapshot.get("vector_store_saved", False)
+        }
+        kwargs.setdefault('use_async_init', False)
+        kwargs.setdefault('enable_streaming', False)
+
+        dialogue = cls(room_id=room_id, room_data=room_data, **kwargs)
+        dialogue.room_data.pop('restored_snapshot', None)
+        dialogue.state.update(snapshot.get("state", {}))
+
+        for agent_id, agent_state in snapshot.get("agents", {}).items():
+            agent = dialogue.agents.get(agent_id)
+            if agent is None:
+                continue
+            prepared = agent_state.get("prepared_argument", "")
+            if hasattr(agent, 'prepared_argument'):
+                agent.prepared_argument = prepared
+                agent.argument_prepared = agent_state.get("argument_prepared", False)
+                agent.core_arguments = agent_state.get("core_arguments", [])
+            cache_manager = getattr(agent, 'argument_cache_manager', None)
+            if cache_manager is not None and prepared:
+                cache_manager.prepared_argument = prepared
+                cache_manager.argument_ready = True
+
+        dialogue.summarizer.restore(snapshot.get("rolling_summary", {}))
+
+        logger.info(f"Restored room {room_id} from snapshot "
+                    f"(turn {dialogue.state.get('turn_count', 0)}, stage {dialogue.state.get('current_stage')})")
+        return dialogue
+
     def _extract_opponent_key_points_for_interactive_stage(self) -> None:
         """
         상호논증 단계 시작 전에 각 에이전트가 상대방 논점을 추출하도록 함
@@ -2619,6 +3016,11 @@ Important: Be objective and neutral. Don't take sides in the debate.
         Returns:
             처리 결과
         """
+        with self.state_lock:
+            return self._process_user_message(message, user_id)
+    
+    def _process_user_message(self, message: str, user_id: str) -> Dict[str, Any]:
+        """사용자 메시지 처리 (state_lock 보유 상태에서 호출)"""
         # 대화 일시정지 상태 체크
         if not self.playing:
                 return {
@@ -2706,44 +3108,14 @@ Important: Be objective and neutral. Don't take sides in the debate.
             DebateStage.PRO_ARGUMENT, DebateStage.CON_ARGUMENT, 
             DebateStage.INTERACTIVE_ARGUMENT
         ]:
-            # 백그라운드 태스크로 즉시 실행 (결과를 기다리지 않음)
-            try:
-                import asyncio
-                loop = asyncio.get_running_loop()
-                # fire-and-forget 방식으로 백그라운드 실행
-                loop.create_task(self._trigger_argument_analysis_async(user_id, message, user_role))
-                logger.info(f"[process_message] Started background argument analysis for {user_id}")
-            except RuntimeError:
-                # 이벤트 루프가 없으면 새 스레드에서 이벤트 루프 생성하여 실행
-                import threading
-                
-                def run_analysis_in_new_loop():
-                    try:
-                        # 새 이벤트 루프 생성
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        
-                        # 논지 분석 실행
-                        new_loop.run_until_complete(
-                            self._trigger_argument_analysis_async(user_id, message, user_role)
-                        )
-                        
-                        logger.info(f"[process_message] Background argument analysis completed for {user_id}")
-                    except Exception as e:
-                        logger.error(f"[process_message] Error in background argument analysis: {str(e)}")
-                    finally:
-                        # 이벤트 루프 정리
-                        try:
-                            new_loop.close()
-                        except:
-                            pass
-                
-                # 새 스레드에서 실행 (백그라운드)
-                analysis_thread = threading.Thread(target=run_analysis_in_new_loop, daemon=True)
-                analysis_thread.start()
-                logger.info(f"[process_message] Started background argument analysis thread for {user_id}")
-            except Exception as e:
-                logger.error(f"[process_message] Failed to start background argument analysis: {str(e)}")
+            # 작업 그래프에 분석 → 공격 전략 노드 제출 (결과를 기다리지 않음)
+            self._schedule_argument_analysis(user_id, message, user_role)
+            
+            # 모더레이터 요약용 누적 요약에 발언 반영
+            self.summarizer.observe(self.state["speaking_history"][-1])
+            
+            # 상대측 에이전트의 감정을 미리 계산
+            self._schedule_emotion_precompute(user_role)
         
         # 사용자 참가자 객체에 메시지 처리 요청
         user_participant.process({
@@ -2798,15 +3170,18 @@ Important: Be objective and neutral. Don't take sides in the debate.
                 return
             
             moderator_agent = self.agents.get(ParticipantRole.MODERATOR)
-            if moderator_agent:
-                topic = self.room_data.get('title', '토론 주제')
-                
-                # 참가자 정보 수집 - 올바른 순서로
-                pro_participants = self._get_participants_by_role(ParticipantRole.PRO)
-                con_participants = self._get_participants_by_role(ParticipantRole.CON)
-                
-                logger.info(f"[DEBUG] Moderator opening - PRO: {pro_participants}, CON: {con_participants}")
-                
+            if not moderator_agent:
+                return
+            
+            topic = self.room_data.get('title', '토론 주제')
+            
+            # 참가자 정보 수집 - 올바른 순서로
+            pro_participants = self._get_participants_by_role(ParticipantRole.PRO)
+            con_participants = self._get_participants_by_role(ParticipantRole.CON)
+            
+            logger.info(f"[DEBUG] Moderator opening - PRO: {pro_participants}, CON: {con_participants}")
+            
+            def prepare_opening():
                 # 모더레이터 오프닝 준비 - generate_introduction 액션 사용
                 result = moderator_agent.process({
                     "action": "generate_introduction",
@@ -2818,71 +3193,18 @@ Important: Be objective and neutral. Don't take sides in the debate.
                     }
                 })
                 
-            if result.get("status") == "success":
-                logger.info("Moderator opening prepared successfully")
-            else:
-                logger.warning("Failed to prepare moderator opening")
-                
-        except Exception as e:
-            logger.error(f"Error preparing moderator opening: {str(e)}")
-    
-    async def _prepare_next_speaker_in_background(self, next_speaker_info: Dict[str, Any]) -> None:
-        """
-        다음 발언자의 입론을 백그라운드에서 미리 준비
-        
-        Args:
-            next_speaker_info: 다음 발언자 정보
-        """
-        try:
-            speaker_id = next_speaker_info.get("speaker_id")
-            role = next_speaker_info.get("role")
-            
-            if not speaker_id or role not in [ParticipantRole.PRO, ParticipantRole.CON]:
-                return
-            
-            # 이미 준비 중이면 스킵
-            if speaker_id in self.background_preparation_tasks:
-                return
-            
-            agent = self.agents.get(speaker_id)
-            if not agent or not hasattr(agent, 'prepare_argument_async'):
-                return
-            
-            # 이미 준비되어 있으면 스킵
-            if hasattr(agent, 'is_argument_ready') and agent.is_argument_ready():
-                return
-            
-            topic = self.room_data.get('title', '토론 주제')
-            stance_statement = self.stance_statements.get(role, '')
-            context = {
-                "topic": topic,
-                "role": role,
-                "current_stage": self.state.get("current_stage")
-            }
-            
-            logger.info(f"Starting background preparation for {speaker_id} ({role})")
-            
-            # 백그라운드에서 입론 준비 시작
-            task = asyncio.create_task(
-                agent.prepare_argument_async(topic, stance_statement, context)
-            )
-            self.background_preparation_tasks[speaker_id] = task
-            
-            # 완료 후 정리
-            def cleanup_task(future):
-                if speaker_id in self.background_preparation_tasks:
-                    del self.background_preparation_tasks[speaker_id]
-                
-                if future.exception():
-                    logger.error(f"Background preparation failed for {speaker_id}: {future.exception()}")
+                if result.get("status") == "success":
+                    logger.info("Moderator opening prepared successfully")
                 else:
-                    result = future.result()
-                    logger.info(f"Background preparation completed for {speaker_id}: {result.get('status')}")
-            
-            task.add_done_callback(cleanup_task)
+                    logger.warning("Failed to prepare moderator opening")
+                return result
             
+            # 첫 턴이 기다리는 작업이므로 최우선으로 실행 (오프닝 턴에서 완료를 기다림)
+            self.task_graph.submit(MODERATOR_OPENING_TASK, prepare_opening, priority=PRIORITY_URGENT,
+                                   tags=("speaker:moderator",))
+                
         except Exception as e:
-            logger.error(f"Error starting background preparation: {str(e)}")
+            logger.error(f"Error preparing moderator opening: {str(e)}")
     
     def _get_argument_for_speaker(self, speaker_id: str, role: str) -> tuple[str, Dict[str, Any]]:
         """
@@ -2907,6 +3229,16 @@ Important: Be objective and neutral. Don't take sides in the debate.
             "current_stage": self.state.get("current_stage")
         }
         
+        # 백그라운드 준비 작업이 있으면 최우선으로 올리고 완료를 기다린 뒤 결과 사용
+        prepare_key = f"argument:{speaker_id}"
+        if self.task_graph.get(prepare_key) is not None:
+            self.task_graph.prioritize([prepare_key])
+            self.task_graph.wait([prepare_key], timeout=self.turn_budget_seconds)
+            prepared = getattr(agent, 'prepared_argument', '')
+            if self.task_graph.result(prepare_key) and isinstance(prepared, str) and prepared:
+                logger.info(f"Using background-prepared argument for {speaker_id}")
+                return prepared, getattr(agent, 'rag_info', {})
+        
         # 새로운 메서드 사용 (준비된 것이 있으면 사용, 없으면 즉시 생성)
         if hasattr(agent, 'get_prepared_argument_or_generate'):
             # 새로운 메서드가 RAG 정보도 함께 반환하는지 확인
@@ -3016,57 +3348,64 @@ Important: Be objective and neutral. Don't take sides in the debate.
         
         return False, current_stage
     
-    async def _trigger_argument_analysis_async(self, speaker_id: str, response_text: str, speaker_role: str):
+    def _schedule_argument_analysis(self, speaker_id: str, response_text: str, speaker_role: str) -> None:
         """
-        발언 완료 후 다른 참가자들의 논지 분석 및 공격 전략 준비를 백그라운드에서 트리거
+        발언에 대한 상대편 논지 분석 작업을 작업 그래프에 제출
+        
+        상대편 참가자마다 [논지 추출 + 취약성 평가] → [공격 전략 준비] 두 노드를 의존성으로 연결하고,
+        공격 순서상 곧 발언할 분석자의 작업일수록 높은 우선순위를 줍니다.
         
         Args:
-            speaker_id: 발언자 ID
+            speaker_id: 발언자 ID (분석 대상)
             response_text: 발언 내용
             speaker_role: 발언자 역할
         """
         try:
-            logger.info(f"🔍 [_trigger_argument_analysis_async] 시작: speaker_id={speaker_id}, speaker_role={speaker_role}")
-            
             # 상대편 참가자들 찾기
             if speaker_role == ParticipantRole.PRO:
                 opponent_participants = self._get_participants_by_role(ParticipantRole.CON)
             else:
                 opponent_participants = self._get_participants_by_role(ParticipantRole.PRO)
             
-            logger.info(f"🔍 [_trigger_argument_analysis_async] 상대편 참가자들: {opponent_participants}")
-            
-            # 각 상대편 참가자에게 논지 분석 요청 (병렬 처리)
-            analysis_tasks = []
+            turn = self.state.get("turn_count", 0)
+            scheduled = 0
             for opponent_id in opponent_participants:
-                logger.info(f"🔍 [_trigger_argument_analysis_async] 상대편 {opponent_id} 처리 중...")
-                
                 opponent_agent = self.agents.get(opponent_id)
-                if opponent_agent:
-                    logger.info(f"✅ [_trigger_argument_analysis_async] 상대편 {opponent_id} 에이전트 발견, 분석 태스크 생성")
-                    
-                    # 각 에이전트의 분석을 별도 태스크로 실행
-                    task = asyncio.create_task(self._analyze_single_opponent_async(
-                        opponent_agent, opponent_id, speaker_id, response_text
-                    ))
-                    analysis_tasks.append(task)
-                else:
-                    logger.warning(f"❌ [_trigger_argument_analysis_async] 상대편 {opponent_id} 에이전트 없음 (agents: {list(self.agents.keys())})")
+                if not opponent_agent:
+                    logger.warning(f"❌ [_schedule_argument_analysis] 상대편 {opponent_id} 에이전트 없음 (agents: {list(self.agents.keys())})")
+                    continue
+                
+                base_key = f"{opponent_id}<-{speaker_id}@{turn}"
+                analysis_key = f"analysis:{base_key}"
+                priority = self._analysis_priority(opponent_id)
+                tags = (f"analyzer:{opponent_id}",)
+                
+                self.task_graph.submit(
+                    analysis_key,
+                    lambda agent=opponent_agent, analyzer=opponent_id: self._analyze_opponent_arguments(
+                        agent, analyzer, speaker_id, response_text),
+                    priority=priority, tags=tags
+                )
+                strategy_node = self.task_graph.submit(
+                    f"strategy:{base_key}",
+                    lambda agent=opponent_agent, analyzer=opponent_id, key=analysis_key: self._prepare_attack_strategies(
+                        agent, analyzer, speaker_id, self.task_graph.result(key)),
+                    deps=[analysis_key], priority=priority, tags=tags
+                )
+                # 성공/실패와 관계없이 끝나면 완료 표시 (실패한 분석이 공격 차례를 영원히 막지 않도록)
+                strategy_node.future.add_done_callback(
+                    lambda _, analyzer=opponent_id: self._mark_analysis_completed(analyzer, speaker_id)
+                )
+                scheduled += 1
+            
+            logger.info(f"🚀 [_schedule_argument_analysis] {speaker_id} 발언에 대한 분석 작업 {scheduled}개 제출")
             
-            # 모든 분석 태스크를 병렬로 실행
-            if analysis_tasks:
-                logger.info(f"🚀 [_trigger_argument_analysis_async] {len(analysis_tasks)}개 분석 태스크 시작")
-                await asyncio.gather(*analysis_tasks, return_exceptions=True)
-                logger.info(f"✅ [_trigger_argument_analysis_async] {len(analysis_tasks)}개 분석 태스크 완료")
-            else:
-                logger.warning(f"❌ [_trigger_argument_analysis_async] 실행할 분석 태스크가 없음")
-                
         except Exception as e:
-            logger.error(f"❌ [_trigger_argument_analysis_async] 오류: {str(e)}", exc_info=True)
+            logger.error(f"❌ [_schedule_argument_analysis] 오류: {str(e)}", exc_info=True)
     
-    async def _analyze_single_opponent_async(self, opponent_agent, opponent_id: str, speaker_id: str, response_text: str):
+    def _analyze_opponent_arguments(self, opponent_agent, opponent_id: str, speaker_id: str, response_text: str) -> Dict[str, Any]:
         """
-        단일 상대방 에이전트의 논지 분석을 비동기로 실행
+        논지 추출 + 취약성 평가 작업 (작업 그래프 워커 스레드에서 실행)
         
         Args:
             opponent_agent: 상대방 에이전트 (분석을 수행하는 AI)
@@ -3074,77 +3413,91 @@ Important: Be objective and neutral. Don't take sides in the debate.
             speaker_id: 발언자 ID (분석 대상)
             response_text: 발언 내용 (분석할 내용)
         """
-        try:
-            # 사용자인지 AI인지 확인
-            is_user_speaker = speaker_id in self.user_participants
-            
-            loop = asyncio.get_event_loop()
-            
-            if is_user_speaker:
-                # 🎯 유저 논지 분석: AI가 유저의 논지를 분석
-                logger.info(f"🔍 [{opponent_id}] 유저 {speaker_id} 논지 분석 시작")
-                
-                def analyze_user_sync():
-                    # AI 에이전트가 유저 논지를 분석
-                    return opponent_agent.analyze_user_arguments(response_text, speaker_id)
-                
-                analysis_result = await loop.run_in_executor(None, analyze_user_sync)
-                
-                arguments_count = analysis_result.get('total_arguments', 0)
-                avg_vulnerability = analysis_result.get('average_vulnerability', 0.0)
-                
-                logger.info(f"✅ [{opponent_id}] → 유저 {speaker_id} 논지 분석 완료: "
-                          f"{arguments_count}개 논지, 평균 취약성 {avg_vulnerability:.2f}")
-                
-                # 분석 결과를 기반으로 공격 전략 준비
-                if arguments_count > 0:
-                    def prepare_strategies_sync():
-                        return opponent_agent.process({
-                            "action": "prepare_attack_strategies",
-                            "target_speaker_id": speaker_id
-                        })
-                    
-                    strategy_result = await loop.run_in_executor(None, prepare_strategies_sync)
-                    
-                    strategies_count = len(strategy_result.get("strategies", []))
-                    rag_usage_count = strategy_result.get("rag_usage_count", 0)
-                    logger.info(f"✅ [{opponent_id}] → 유저 {speaker_id} 공격 전략 {strategies_count}개 준비 완료 (RAG 사용: {rag_usage_count}개)")
-                
-            else:
-                # 🤖 AI vs AI 논지 분석 (기존 방식)
-                logger.info(f"🔍 [{opponent_id}] AI {speaker_id} 논지 분석 시작")
-                
-                def analyze_sync():
-                    return opponent_agent.process({
-                        "action": "analyze_opponent_arguments",
-                        "opponent_response": response_text,
-                        "speaker_id": speaker_id
-                    })
-                
-                analysis_result = await loop.run_in_executor(None, analyze_sync)
-                
-                logger.info(f"✅ [{opponent_id}] → AI {speaker_id} 논지 분석 완료: "
-                          f"{analysis_result.get('arguments_count', 0)} arguments found")
-                
-                # 공격 전략 준비
-                if analysis_result.get("status") == "success":
-                    def prepare_strategies_sync():
-                        return opponent_agent.process({
-                            "action": "prepare_attack_strategies",
-                            "target_speaker_id": speaker_id
-                        })
-                    
-                    strategy_result = await loop.run_in_executor(None, prepare_strategies_sync)
-                    
-                    strategies_count = len(strategy_result.get("strategies", []))
-                    rag_usage_count = strategy_result.get("rag_usage_count", 0)
-                    logger.info(f"✅ [{opponent_id}] → AI {speaker_id} 공격 전략 {strategies_count}개 준비 완료 (RAG 사용: {rag_usage_count}개)")
+        if speaker_id in self.user_participants:
+            # 🎯 유저 논지 분석: AI가 유저의 논지를 분석
+            logger.info(f"🔍 [{opponent_id}] 유저 {speaker_id} 논지 분석 시작")
+            analysis_result = opponent_agent.analyze_user_arguments(response_text, speaker_id)
+            logger.info(f"✅ [{opponent_id}] → 유저 {speaker_id} 논지 분석 완료: "
+                      f"{analysis_result.get('total_arguments', 0)}개 논지, "
+                      f"평균 취약성 {analysis_result.get('average_vulnerability', 0.0):.2f}")
+        else:
+            # 🤖 AI vs AI 논지 분석
+            logger.info(f"🔍 [{opponent_id}] AI {speaker_id} 논지 분석 시작")
+            analysis_result = opponent_agent.process({
+                "action": "analyze_opponent_arguments",
+                "opponent_response": response_text,
+                "speaker_id": speaker_id
+            })
+            logger.info(f"✅ [{opponent_id}] → AI {speaker_id} 논지 분석 완료: "
+                      f"{analysis_result.get('arguments_count', 0)} arguments found")
+        return analysis_result
+    
+    def _prepare_attack_strategies(self, opponent_agent, opponent_id: str, speaker_id: str,
+                                   analysis_result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """분석 결과를 기반으로 공격 전략 준비 (분석 노드 완료 후 실행)"""
+        analysis_result = analysis_result or {}
+        if speaker_id in self.user_participants:
+            has_arguments = analysis_result.get('total_arguments', 0) > 0
+        else:
+            has_arguments = analysis_result.get("status") == "success"
+        if not has_arguments:
+            return None
+        
+        strategy_result = opponent_agent.process({
+            "action": "prepare_attack_strategies",
+            "target_speaker_id": speaker_id
+        })
+        target_type = "유저" if speaker_id in self.user_participants else "AI"
+        logger.info(f"✅ [{opponent_id}] → {target_type} {speaker_id} 공격 전략 "
+                    f"{len(strategy_result.get('strategies', []))}개 준비 완료 "
+                    f"(RAG 사용: {strategy_result.get('rag_usage_count', 0)}개)")
+        return strategy_result
+    
+    def _upcoming_attackers(self) -> List[str]:
+        """상호논증 단계에서 아직 공격하지 않은 공격자 순서"""
+        cycle_state = self.state.get('interactive_cycle_state')
+        if cycle_state is None:
+            return [entry['attacker_id'] for entry in self._generate_attack_order()]
+        remaining = cycle_state['attack_order'][cycle_state['current_cycle']:]
+        attackers = [entry['attacker_id'] for entry in remaining]
+        if attackers and cycle_state.get('cycle_step') != 'attack':
+            attackers.pop(0)  # 현재 사이클의 공격은 이미 끝남
+        return attackers
+    
+    def next_attacker_waiting_for_analysis(self) -> Optional[str]:
+        """다음 발언이 분석 결과가 필요한 공격이면 그 공격자 ID (아니면 None)"""
+        if self.state.get("current_stage") != DebateStage.INTERACTIVE_ARGUMENT:
+            return None
+        attackers = self._upcoming_attackers()
+        return attackers[0] if attackers else None
+    
+    def _analysis_priority(self, analyzer_id: str) -> int:
+        """공격 순서상 분석자의 차례가 가까울수록 높은 우선순위"""
+        attackers = self._upcoming_attackers()
+        if analyzer_id not in attackers:
+            return PRIORITY_SPECULATIVE
+        position = attackers.index(analyzer_id)
+        if position == 0 and self.state.get("current_stage") == DebateStage.INTERACTIVE_ARGUMENT:
+            return PRIORITY_URGENT
+        return PRIORITY_NORMAL if position <= 1 else PRIORITY_SPECULATIVE
+    
+    def prioritize_speaker_analysis(self, speaker_id: str) -> int:
+        """발언자의 미완료 분석/전략 작업을 최우선으로 올림"""
+        return self.task_graph.prioritize(tag=f"analyzer:{speaker_id}", priority=PRIORITY_URGENT)
+    
+    async def wait_for_speaker_analysis(self, speaker_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        발언자가 공격에 쓸 분석/전략 작업 완료를 기다림 (폴링 없이, 이벤트 루프를 막지 않음)
+        
+        Args:
+            speaker_id: 공격할 발언자 ID
+            timeout: 최대 대기 시간 (초)
             
-            # 🎯 분석 완료 상태 업데이트 (유저든 AI든 동일하게 처리)
-            self._mark_analysis_completed(opponent_id, speaker_id)
-                
-        except Exception as e:
-            logger.error(f"❌ Error in argument analysis for {opponent_id} → {speaker_id}: {str(e)}")
+        Returns:
+            모든 작업이 끝났는지
+        """
+        self.prioritize_speaker_analysis(speaker_id)
+        return await self.task_graph.wait_async(tag=f"analyzer:{speaker_id}", timeout=timeout)
     
     def get_attack_strategy_for_response(self, attacker_id: str, target_id: str, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -3217,11 +3570,13 @@ Important: Be objective and neutral. Don't take sides in the debate.
         return True
     
     def _mark_analysis_completed(self, analyzer_id: str, target_id: str) -> None:
-        """특정 분석자의 특정 대상에 대한 분석 완료 표시"""
-        if analyzer_id not in self.state["analysis_completion_tracker"]:
-            self.state["analysis_completion_tracker"][analyzer_id] = {}
-        
-        self.state["analysis_completion_tracker"][analyzer_id][target_id] = True
+        """특정 분석자의 특정 대상에 대한 분석 완료 표시 (작업 그래프 워커 스레드에서 호출됨)"""
+        # state_lock 대신 전용 락 사용 - 턴 생성이 state_lock을 잡고 작업 완료를 기다려도 교착되지 않도록
+        with self.analysis_lock:
+            if analyzer_id not in self.state["analysis_completion_tracker"]:
+                self.state["analysis_completion_tracker"][analyzer_id] = {}
+            
+            self.state["analysis_completion_tracker"][analyzer_id][target_id] = True
         logger.info(f"[{analyzer_id}] → [{target_id}] analysis marked as completed")
 
     def get_analysis_status(self) -> Dict[str, Any]:
@@ -3250,12 +3605,28 @@ Important: Be objective and neutral. Don't take sides in the debate.
                 return {"status": "error", "message": f"[{analyzer_id}] not found in analysis tracker"}
     
     def _call_message_callback(self, speaker_id: str, message: str, message_type: str, stage: str):
-        """메시지 콜백 호출 (안전하게)"""
-        if self.message_callback:
-            try:
-                self.message_callback(speaker_id, message, message_type, stage)
-            except Exception as e:
-                logger.error(f"Error in message callback: {str(e)}")
+        """
+        턴 이벤트 게시 - 메시지 콜백은 구독자 큐를 통해 비동기로 호출 (생성 경로를 막지 않음)
+        
+        메시지 콜백은 발언을 잃으면 안 되므로 keep 정책으로 구독하여, 소비자가 느려도 버리지 않고
+        제한을 넘은 횟수만 get_stats()의 message_callback 항목에 기록합니다.
+        """
+        if self.message_callback and self._message_callback_subscription is None:
+            self._message_callback_subscription = self.event_bus.subscribe(
+                self._deliver_message_callback, topics=[TURN_EVENT_TOPIC], overflow="keep", name="message_callback"
+            )
+        self.event_bus.publish(TURN_EVENT_TOPIC, {
+            "speaker_id": speaker_id,
+            "message": message,
+            "message_type": message_type,
+            "stage": stage
+        })
+    
+    def _deliver_message_callback(self, event: Dict[str, Any]):
+        """턴 이벤트를 메시지 콜백으로 전달 (이벤트 버스 전달 스레드에서 실행)"""
+        callback = self.message_callback
+        if callback:
+            callback(event["speaker_id"], event["message"], event["message_type"], event["stage"])
     
     # ========================================================================
     # CACHE METHODS
@@ -3263,6 +3634,12 @@ Important: Be objective and neutral. Don't take sides in the debate.
     
     def _check_and_apply_cache(self) -> None:
         """초기화 시 캐시 확인 및 적용"""
+        # 스냅샷에서 복원하는 경우 스냅샷의 생성 데이터를 우선 적용
+        snapshot_entry = self.room_data.get('restored_snapshot')
+        if snapshot_entry and self._apply_cached_data(snapshot_entry):
+            logger.info("Applied generated data from room snapshot")
+            return
+
         title = self.room_data.get('title', '')
         context = self.room_data.get('context', '')
         
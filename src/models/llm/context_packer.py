@@ -0,0 +1,278 @@
+"""
+Context Packer Module
+
+프롬프트에 들어갈 컨텍스트(페르소나, 입장, 최근 발언, 근거, 감정)를 섹션별 토큰 예산에 맞춰
+조립하는 모듈입니다.
+
+- 토큰 수는 대상 모델의 캐시된 토크나이저(token_counter)로 계산합니다.
+- 예산을 넘으면 우선순위가 낮은 항목부터 압축(토큰 단위 자르기)하거나 제거합니다.
+- 무엇이 잘렸는지와 최종 토큰 수를 함께 반환하여, LLMManager가 남은 컨텍스트 윈도우 안에서
+  max_tokens를 고를 수 있게 합니다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+from .token_counter import count_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+# 섹션 출력 순서 (앞쪽일수록 기본 우선순위가 높음)
+SECTION_ORDER = ["persona", "stance", "recent_turns", "evidence", "emotion"]
+
+# 섹션별 기본 토큰 예산 (None이면 무제한)
+DEFAULT_SECTION_BUDGETS: Dict[str, Optional[int]] = {
+    "persona": 600,
+    "stance": 300,
+    "recent_turns": 1200,
+    "evidence": 1200,
+    "emotion": 200
+}
+
+# 모델별 컨텍스트 윈도우 (접두사 일치, 긴 이름 우선)
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4o": 128000,
+    "gpt-4.1": 1000000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+    "o1": 200000,
+    "o3": 200000,
+    "o4": 200000
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# 이보다 적은 토큰만 남는 항목은 압축하지 않고 제거
+MIN_COMPRESSED_TOKENS = 32
+
+
+def get_context_window(model: Optional[str]) -> int:
+    """
+    모델의 컨텍스트 윈도우 크기 반환
+
+    Args:
+        model: 모델 이름
+
+    Returns:
+        컨텍스트 윈도우 토큰 수 (모르는 모델이면 보수적인 기본값)
+    """
+    if not model:
+        return DEFAULT_CONTEXT_WINDOW
+    for prefix in sorted(MODEL_CONTEXT_WINDOWS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_CONTEXT_WINDOWS[prefix]
+    return DEFAULT_CONTEXT_WINDOW
+
+
+@dataclass
+class ContextItem:
+    """섹션에 들어갈 컨텍스트 항목 하나"""
+    section: str
+    text: str
+    priority: float = 0.5
+    compressible: bool = True
+    keep: str = "head"
+    label: str = ""
+    order: int = 0
+    tokens: int = 0
+
+
+@dataclass
+class PackedContext:
+    """패킹 결과"""
+    sections: Dict[str, str]
+    section_tokens: Dict[str, int]
+    total_tokens: int
+    cut: List[Dict[str, Any]] = field(default_factory=list)
+    separator: str = "\n\n"
+
+    def get(self, section: str, default: str = "") -> str:
+        """섹션 텍스트 반환"""
+        return self.sections.get(section) or default
+
+    @property
+    def text(self) -> str:
+        """비어 있지 않은 섹션을 순서대로 이어 붙인 전체 텍스트"""
+        return self.separator.join(text for text in self.sections.values() if text)
+
+    @property
+    def was_cut(self) -> bool:
+        return bool(self.cut)
+
+
+class ContextPacker:
+    """
+    섹션별 토큰 예산에 맞춰 컨텍스트 항목을 조립하는 패커
+
+    항목은 추가된 순서대로 출력되고(최근 발언의 시간 순서 유지),
+    예산 초과 시에는 우선순위가 낮은 항목부터 압축 또는 제거됩니다.
+    """
+
+    def __init__(self,
+                 model: str = "gpt-4o",
+                 section_budgets: Optional[Dict[str, Optional[int]]] = None,
+                 total_budget: Optional[int] = None,
+                 item_separator: str = "\n",
+                 section_separator: str = "\n\n"):
+        """
+        ContextPacker 초기화
+
+        Args:
+            model: 토큰 계산 기준 모델
+            section_budgets: 섹션별 토큰 예산 (기본 예산을 덮어씀)
+            total_budget: 전체 토큰 예산 (None이면 섹션 예산만 적용)
+            item_separator: 섹션 내부 항목 구분자
+            section_separator: 섹션 간 구분자
+        """
+        self.model = model
+        self.section_budgets = dict(DEFAULT_SECTION_BUDGETS)
+        if section_budgets:
+            self.section_budgets.update(section_budgets)
+        self.total_budget = total_budget
+        self.item_separator = item_separator
+        self.section_separator = section_separator
+        self.items: List[ContextItem] = []
+
+    def add(self,
+            section: str,
+            text: str,
+            priority: float = 0.5,
+            compressible: bool = True,
+            keep: str = "head",
+            label: str = "") -> 'ContextPacker':
+        """
+        컨텍스트 항목 추가
+
+        Args:
+            section: 섹션 이름 (persona, stance, recent_turns, evidence, emotion 등)
+            text: 항목 텍스트
+            priority: 우선순위 (높을수록 마지막까지 유지)
+            compressible: 예산 초과 시 자르기 허용 여부 (False면 통째로 제거)
+            keep: 압축 시 "head"(앞부분) 또는 "tail"(뒷부분) 유지
+            label: 잘림 보고에 표시할 이름
+
+        Returns:
+            체이닝용 self
+        """
+        if text and text.strip():
+            self.items.append(ContextItem(
+                section=section,
+                text=text.strip(),
+                priority=priority,
+                compressible=compressible,
+                keep=keep,
+                label=label or f"{section}[{len(self.items)}]",
+                order=len(self.items)
+            ))
+        return self
+
+    def pack(self) -> PackedContext:
+        """
+        예산에 맞춰 항목을 압축/제거하고 섹션별 텍스트 조립
+
+        Returns:
+            PackedContext (섹션 텍스트, 토큰 수, 잘림 보고)
+        """
+        cut: List[Dict[str, Any]] = []
+        for item in self.items:
+            item.tokens = count_tokens(item.text, self.model)
+
+        # 1. 섹션별 예산 적용
+        kept: List[ContextItem] = []
+        for section in self._section_names():
+            budget = self.section_budgets.get(section)
+            section_items = [item for item in self.items if item.section == section]
+            if budget is None:
+                kept.extend(section_items)
+                continue
+
+            remaining = budget
+            for item in sorted(section_items, key=lambda i: (-i.priority, i.order)):
+                if item.tokens <= remaining:
+                    kept.append(item)
+                    remaining -= item.tokens
+                elif item.compressible and remaining >= MIN_COMPRESSED_TOKENS:
+                    self._compress(item, remaining, cut)
+                    kept.append(item)
+                    remaining -= item.tokens
+                else:
+                    self._drop(item, cut)
+
+        # 2. 전체 예산 적용 - 가장 낮은 우선순위(동률이면 뒤쪽 섹션)부터 줄이기
+        if self.total_budget is not None:
+            section_rank = {name: index for index, name in enumerate(self._section_names())}
+            overflow = sum(item.tokens for item in kept) - self.total_budget
+            while overflow > 0 and kept:
+                victim = min(kept, key=lambda i: (i.priority, -section_rank[i.section], -i.order))
+                before = victim.tokens
+                target = before - overflow
+                if victim.compressible and target >= MIN_COMPRESSED_TOKENS:
+                    self._compress(victim, target, cut)
+                    overflow -= before - victim.tokens
+                    if victim.tokens >= before:
+                        # 더 줄일 수 없으면 제거
+                        kept.remove(victim)
+                        cut[-1]["action"] = "dropped"
+                        cut[-1]["tokens_after"] = 0
+                        overflow -= victim.tokens
+                else:
+                    kept.remove(victim)
+                    self._drop(victim, cut)
+                    overflow -= before
+
+        # 3. 원래 순서대로 섹션 조립
+        sections: Dict[str, str] = {}
+        section_tokens: Dict[str, int] = {}
+        for section in self._section_names():
+            section_items = sorted((item for item in kept if item.section == section), key=lambda i: i.order)
+            text = self.item_separator.join(item.text for item in section_items)
+            sections[section] = text
+            section_tokens[section] = count_tokens(text, self.model)
+
+        packed = PackedContext(
+            sections=sections,
+            section_tokens=section_tokens,
+            total_tokens=0,
+            cut=cut,
+            separator=self.section_separator
+        )
+        packed.total_tokens = count_tokens(packed.text, self.model)
+
+        if cut:
+            logger.info(f"[CONTEXT_PACKER] {len(cut)} item(s) cut, total {packed.total_tokens} tokens: "
+                        f"{', '.join(entry['label'] + ':' + entry['action'] for entry in cut)}")
+        return packed
+
+    def _section_names(self) -> List[str]:
+        """정의된 순서 + 그 외 섹션(추가된 순서)"""
+        names = list(SECTION_ORDER)
+        for item in self.items:
+            if item.section not in names:
+                names.append(item.section)
+        return names
+
+    def _compress(self, item: ContextItem, max_tokens: int, cut: List[Dict[str, Any]]) -> None:
+        """항목을 max_tokens 이하로 자르고 보고에 기록"""
+        before = item.tokens
+        item.text = truncate_to_tokens(item.text, max_tokens, self.model, keep=item.keep)
+        item.tokens = count_tokens(item.text, self.model)
+        cut.append({
+            "section": item.section,
+            "label": item.label,
+            "action": "compressed",
+            "priority": item.priority,
+            "tokens_before": before,
+            "tokens_after": item.tokens
+        })
+
+    def _drop(self, item: ContextItem, cut: List[Dict[str, Any]]) -> None:
+        """항목 제거를 보고에 기록"""
+        cut.append({
+            "section": item.section,
+            "label": item.label,
+            "action": "dropped",
+            "priority": item.priority,
+            "tokens_before": item.tokens,
+            "tokens_after": 0
+        })
@@ -4,21 +4,30 @@ import time
 import logging
 import re
 import requests
+from concurrent.futures import wait, FIRST_COMPLETED, TimeoutError as FutureTimeoutError
 from typing import Dict, Any, List, Optional, Union, Tuple
 import openai
 import anthropic
 from dotenv import load_dotenv, dotenv_values
-import chromadb
-from chromadb.utils import embedding_functions
 
 from src.utils.config.config_loader import ConfigLoader
 from src.utils.context_manager import UserContextManager
+from src.models.llm.prompt_layout import PromptCacheTracker
+from src.models.llm.token_counter import count_tokens
+from src.models.llm.context_packer import get_context_window
+from src.models.llm.response_cache import get_response_cache, make_cache_key, DEFAULT_CACHEABLE_CONTEXTS
+from src.models.llm.provider_router import get_provider_router, get_hedge_executor, RouteDecision
+from src.utils.tracing import get_tracer, current_span, wrap_context
+from src.rag.retrieval.chroma_pool import get_chroma_pool
 
 # Load environment variables
 load_dotenv(override=True)  # Force override existing environment variables with .env values
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트 토큰 계산 오차와 메시지 포맷 오버헤드를 위한 여유분
+PROMPT_TOKEN_SAFETY_MARGIN = 64
+
 class LLMManager:
     """
     Manages interactions with language models (OpenAI or Anthropic)
@@ -53,6 +62,9 @@ class LLMManager:
             "interactive_response": {"model": "gpt-4o", "max_tokens": 1500},
             "rag_query_generation": {"model": "gpt-4o", "max_tokens": 500},
             "keyword_extraction": {"model": "gpt-4o", "max_tokens": 200},
+            "vulnerability_scoring": {"model": "gpt-4o", "max_tokens": 1200},
+            "stance_statements": {"model": "gpt-4o", "max_tokens": 1000},
+            "emotion_inference": {"model": "gpt-4o", "max_tokens": 800},
             
             # 기본값
             "default": {"model": "gpt-4o", "max_tokens": 4000}
@@ -98,6 +110,21 @@ class LLMManager:
         # NPC cache for RAG data - key is NPC ID, value is a dict with RAG config
         self.npc_rag_cache = {}
         
+        # ✅ 프롬프트 접두부 캐시 추적 (prompt_cache_key가 주어진 호출만 기록)
+        self.prompt_cache_tracker = PromptCacheTracker()
+        self.last_prompt_cache_info = None
+        # prompt_cache_key별 단계 공유 접두부 블록 (캐시 가능 토큰 계산용)
+        self.shared_prefixes: Dict[str, str] = {}
+        # Ollama 모델을 메모리에 유지하여 동일 접두부의 KV 컨텍스트 재사용
+        self.ollama_keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+        
+        # ✅ 결정적 분석 호출용 응답 캐시 (single-flight + TTL/LRU, 프로세스 전역 공유)
+        self.response_cache = get_response_cache()
+        self.cacheable_contexts = set(self.llm_config.get("cacheable_contexts", DEFAULT_CACHEABLE_CONTEXTS))
+        
+        # ✅ 제공자 라우터 (llm_provider를 지정하지 않은 호출의 OpenAI/Ollama 선택, 프로세스 전역 공유)
+        self.provider_router = get_provider_router(self.llm_config.get("router"))
+        
         logger.info(f"Initialized LLM Manager with provider: {self.llm_config.get('provider', 'openai')}, model: {self.llm_config.get('model', 'gpt-4')}")
         
         # Print a masked version of the API key for debugging
@@ -129,8 +156,13 @@ class LLMManager:
             
     def generate_response(self, system_prompt: str, user_prompt: str, 
                         context_type: str = "default",
-                        llm_provider: str = "openai", llm_model: str = None,
-                        max_tokens: int = None, temperature: float = 0.7) -> str:
+                        llm_provider: str = None, llm_model: str = None,
+                        max_tokens: int = None, temperature: float = 0.7,
+                        prompt_cache_key: str = None,
+                        request_timeout: float = None,
+                        use_response_cache: bool = None,
+                        cacheable_prefix: str = None,
+                        prompt_tokens: int = None) -> str:
         """
         LLM을 사용하여 응답을 생성합니다.
         
@@ -138,14 +170,23 @@ class LLMManager:
             system_prompt: 시스템 프롬프트
             user_prompt: 사용자 프롬프트
             context_type: 컨텍스트 타입 (자동 최적화용)
-            llm_provider: LLM 제공자 (기본값: "openai")
+            llm_provider: LLM 제공자 (None이면 라우터가 context_type/마감 시간/제공자 상태로 선택, 기본 "openai")
             llm_model: 사용할 모델 (None이면 컨텍스트별 최적 모델 자동 선택)
             max_tokens: 최대 토큰 수 (None이면 컨텍스트별 최적값 자동 선택)
             temperature: 온도 (기본값: 0.7)
+            prompt_cache_key: 같은 시스템 프롬프트(접두부)를 공유하는 호출 묶음 키.
+                주어지면 제공자 프롬프트 캐싱/keep_alive를 사용하고 접두부 통계를 기록
+            request_timeout: 요청 타임아웃(초). 턴 마감 시간이 있는 호출부가 남은 예산을 전달
+            use_response_cache: 응답 캐시 사용 여부 (None이면 context_type이 cacheable_contexts에 있을 때만)
+            cacheable_prefix: 여러 단계 템플릿이 공유하는 시스템 프롬프트 접두부 블록.
+                주어지면 이 블록만 캐시 가능 토큰으로 기록 (1024 토큰 미만이면 0)
+            prompt_tokens: 호출부가 ContextPacker로 이미 계산한 프롬프트 토큰 수 (None이면 다시 계산)
             
         Returns:
             생성된 응답 텍스트
         """
+        if prompt_cache_key and cacheable_prefix is not None:
+            self.shared_prefixes[prompt_cache_key] = cacheable_prefix
         # ✅ 컨텍스트별 최적 설정 자동 적용
         context_config = self.context_configs.get(context_type, self.context_configs["default"])
         
@@ -154,11 +195,115 @@ class LLMManager:
             llm_model = context_config["model"]
         if max_tokens is None:
             max_tokens = context_config["max_tokens"]
+        
+        # 프롬프트 토큰 수를 반영해 컨텍스트 윈도우를 넘지 않도록 max_tokens 조정
+        if prompt_tokens is None:
+            prompt_tokens = count_tokens(system_prompt, llm_model) + count_tokens(user_prompt, llm_model)
+        max_tokens = self.resolve_max_tokens(context_type, prompt_tokens, llm_model, max_tokens)
             
         # 디버깅 로그 (컨텍스트 최적화 확인용)
         if context_type != "default":
             logger.info(f"[LLM_CONTEXT] {context_type} -> Model: {llm_model}, Tokens: {max_tokens}")
         
+        with get_tracer().span("llm.generate", kind="llm", provider=llm_provider, model=llm_model,
+                               context_type=context_type, max_tokens=max_tokens,
+                               prompt_tokens=prompt_tokens, prompt_cache_key=prompt_cache_key) as span:
+            if use_response_cache is None:
+                use_response_cache = context_type in self.cacheable_contexts
+            
+            if use_response_cache:
+                # 같은 입력의 동시 요청은 하나로 합치고, 완료된 응답은 TTL 동안 재사용
+                cache_key = make_cache_key(llm_provider or "auto", llm_model, system_prompt, user_prompt,
+                                           max_tokens, temperature)
+                content, cache_source = self.response_cache.get_or_compute(
+                    cache_key,
+                    lambda: self._routed_completion(context_type, system_prompt, user_prompt, llm_provider,
+                                                    llm_model, max_tokens, temperature, prompt_cache_key,
+                                                    request_timeout, prompt_tokens)
+                )
+                span.set_attributes(response_cache=cache_source, cache_hit=cache_source != "miss")
+            else:
+                content = self._routed_completion(context_type, system_prompt, user_prompt, llm_provider,
+                                                  llm_model, max_tokens, temperature, prompt_cache_key,
+                                                  request_timeout, prompt_tokens)
+            span.set("empty_response", not content)
+            return content
+    
+    def _routed_completion(self, context_type: str, system_prompt: str, user_prompt: str,
+                           llm_provider: Optional[str], llm_model: str, max_tokens: int, temperature: float,
+                           prompt_cache_key: str = None, request_timeout: float = None,
+                           prompt_tokens: int = None) -> str:
+        """
+        제공자 라우팅과 헤징을 거쳐 API 호출
+        
+        llm_provider가 주어지면 그 제공자로만 보내고, 없으면 라우터가 고른 제공자로 보냅니다.
+        라우터가 헤징 시간을 정하면 그 시간 안에 주 요청이 끝나지 않거나 빈 응답일 때
+        다른 제공자에도 요청을 보내고 먼저 도착한 유효한 응답을 사용합니다.
+        라우팅/헤징으로 모델이 바뀌면 그 모델의 컨텍스트 윈도우에 맞춰 max_tokens를 다시 계산합니다.
+        """
+        if llm_provider is not None:
+            decision = RouteDecision(llm_provider, llm_model, "explicit")
+        else:
+            decision = self.provider_router.route(context_type, llm_model, request_timeout)
+        span = current_span()
+        span.set_attributes(provider=decision.provider, model=decision.model, route=decision.reason)
+        
+        def call(provider: str, model: str) -> str:
+            attempt_max_tokens = max_tokens
+            if model != llm_model:
+                # 스필/헤징 대상(로컬 모델 등)은 컨텍스트 윈도우가 더 작을 수 있음
+                attempt_prompt_tokens = count_tokens(system_prompt, model) + count_tokens(user_prompt, model)
+                attempt_max_tokens = self.resolve_max_tokens(context_type, attempt_prompt_tokens, model, max_tokens)
+            elif prompt_tokens is not None:
+                attempt_max_tokens = self.resolve_max_tokens(context_type, prompt_tokens, model, max_tokens)
+            return self._timed_completion(provider, system_prompt, user_prompt, model, attempt_max_tokens,
+                                          temperature, prompt_cache_key, request_timeout)
+        
+        if not decision.hedge_after:
+            return call(decision.provider, decision.model)
+        
+        executor = get_hedge_executor()
+        primary = executor.submit(wrap_context(call, decision.provider, decision.model))
+        try:
+            content = primary.result(timeout=decision.hedge_after)
+            if content:
+                return content
+        except FutureTimeoutError:
+            pass
+        
+        logger.info(f"[LLM_ROUTER] {context_type}: hedging {decision.provider} with {decision.hedge_provider}")
+        span.set("hedged", True)
+        hedge = executor.submit(wrap_context(call, decision.hedge_provider, decision.hedge_model))
+        owners = {primary: decision.provider, hedge: decision.hedge_provider}
+        pending = {hedge} if primary.done() else {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                content = future.result()
+                if content:
+                    self.provider_router.record_hedge(owners[future])
+                    span.set("hedge_winner", owners[future])
+                    return content
+        return ""
+    
+    def _timed_completion(self, llm_provider: str, system_prompt: str, user_prompt: str, llm_model: str,
+                          max_tokens: int, temperature: float, prompt_cache_key: str = None,
+                          request_timeout: float = None) -> str:
+        """API 호출 한 건의 지연/성공 여부를 라우터 상태에 기록"""
+        self.provider_router.begin(llm_provider)
+        start_time = time.time()
+        content = ""
+        try:
+            content = self._request_completion(system_prompt, user_prompt, llm_provider, llm_model,
+                                               max_tokens, temperature, prompt_cache_key, request_timeout)
+            return content
+        finally:
+            self.provider_router.end(llm_provider, time.time() - start_time, bool(content))
+    
+    def _request_completion(self, system_prompt: str, user_prompt: str, llm_provider: str,
+                            llm_model: str, max_tokens: int, temperature: float,
+                            prompt_cache_key: str = None, request_timeout: float = None) -> str:
+        """제공자 API 호출 (generate_response에서 모델/토큰 설정을 마친 뒤 호출, 실패 시 빈 문자열)"""
         try:
             # logger.info("[LLM_DEBUG] LLM 응답 생성 시작")
             # logger.info(f"[LLM_DEBUG] Provider: {llm_provider}, Model: {llm_model}")
@@ -184,6 +329,13 @@ class LLMManager:
                 # logger.info(f"[LLM_DEBUG] OpenAI 클라이언트 초기화 완료")
                 # logger.info(f"[LLM_DEBUG] API 요청 시작 - max_tokens: {max_tokens}, temperature: {temperature}")
                 
+                # 접두부 캐시 라우팅 키 (SDK 버전과 무관하도록 extra_body로 전달)
+                request_options = {}
+                if prompt_cache_key:
+                    request_options["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+                if request_timeout:
+                    request_options["timeout"] = request_timeout
+                
                 # API 요청
                 try:
                     response = client.chat.completions.create(
@@ -193,7 +345,8 @@ class LLMManager:
                             {"role": "user", "content": user_prompt}
                         ],
                         max_tokens=max_tokens,
-                        temperature=temperature
+                        temperature=temperature,
+                        **request_options
                     )
                     
                     # logger.info(f"[LLM_DEBUG] API 응답 받음")
@@ -209,6 +362,17 @@ class LLMManager:
                         logger.error("[LLM_DEBUG] 빈 응답을 받았습니다")
                         return ""
                     
+                    cached_tokens = self._get_openai_cached_tokens(response)
+                    usage = getattr(response, "usage", None)
+                    current_span().set_attributes(
+                        completion_tokens=getattr(usage, "completion_tokens", None),
+                        cached_tokens=cached_tokens
+                    )
+                    
+                    if prompt_cache_key:
+                        self._record_prompt_cache(prompt_cache_key, system_prompt, user_prompt, llm_model,
+                                                  cached_tokens)
+                    
                     # logger.info(f"[LLM_DEBUG] 응답 길이: {len(content)}")
                     # logger.info(f"[LLM_DEBUG] 응답 내용: {content[:100]}..." if len(content) > 100 else f"[LLM_DEBUG] 응답 내용: {content}")
                     
@@ -249,10 +413,14 @@ class LLMManager:
                         "stream": False
                     }
                     
+                    # 모델을 메모리에 유지하여 같은 접두부의 KV 컨텍스트를 재사용
+                    if prompt_cache_key:
+                        payload["keep_alive"] = self.ollama_keep_alive
+                    
                     response = requests.post(
                         f"{ollama_endpoint}/api/chat",
                         json=payload,
-                        timeout=120  # 2분 타임아웃
+                        timeout=request_timeout or 120  # 기본 2분 타임아웃
                     )
                     
                     if response.status_code != 200:
@@ -271,6 +439,11 @@ class LLMManager:
                         logger.error("[LLM_DEBUG] Ollama에서 빈 응답을 받았습니다")
                         return ""
                     
+                    current_span().set_attributes(completion_tokens=result.get("eval_count"))
+                    
+                    if prompt_cache_key:
+                        self._record_prompt_cache(prompt_cache_key, system_prompt, user_prompt, llm_model, None)
+                    
                     # logger.info(f"[LLM_DEBUG] Ollama 응답 길이: {len(content)}")
                     # logger.info(f"[LLM_DEBUG] Ollama 응답 내용: {content[:100]}..." if len(content) > 100 else f"[LLM_DEBUG] Ollama 응답 내용: {content}")
                     
@@ -291,6 +464,63 @@ class LLMManager:
             logger.error(f"[LLM_DEBUG] LLM 응답 생성 중 오류 발생: {str(e)}", exc_info=True)
             return ""
         
+    def resolve_max_tokens(self, context_type: str, prompt_tokens: int,
+                           llm_model: str = None, requested_max_tokens: int = None) -> int:
+        """
+        프롬프트 토큰 수를 고려한 안전한 max_tokens 계산
+        
+        Args:
+            context_type: 컨텍스트 타입 (context_configs 키)
+            prompt_tokens: 시스템 + 사용자 프롬프트 토큰 수 (ContextPacker의 total_tokens 등)
+            llm_model: 사용할 모델 (None이면 컨텍스트 설정의 모델)
+            requested_max_tokens: 요청한 max_tokens (None이면 컨텍스트 설정값)
+            
+        Returns:
+            컨텍스트 윈도우 안에 들어가는 max_tokens (최소 1)
+        """
+        context_config = self.context_configs.get(context_type, self.context_configs["default"])
+        model = llm_model or context_config["model"]
+        max_tokens = requested_max_tokens or context_config["max_tokens"]
+        
+        available = get_context_window(model) - prompt_tokens - PROMPT_TOKEN_SAFETY_MARGIN
+        if max_tokens > available:
+            logger.warning(f"[LLM_CONTEXT] {context_type} prompt uses {prompt_tokens} tokens, "
+                           f"max_tokens {max_tokens} -> {max(1, available)} ({model})")
+            return max(1, available)
+        return max_tokens
+    
+    def _get_openai_cached_tokens(self, response: Any) -> Optional[int]:
+        """OpenAI 응답의 usage에서 캐시 적중 토큰 수 추출"""
+        try:
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            cached_tokens = getattr(details, "cached_tokens", None) if details else None
+            return int(cached_tokens) if cached_tokens is not None else None
+        except Exception:
+            return None
+    
+    def _record_prompt_cache(self, prompt_cache_key: str, system_prompt: str, user_prompt: str,
+                             llm_model: str, cached_tokens: Optional[int]) -> None:
+        """접두부 캐시 통계 기록 (실패해도 응답 생성에는 영향 없음)"""
+        try:
+            self.last_prompt_cache_info = self.prompt_cache_tracker.record(
+                prompt_cache_key, system_prompt, user_prompt, llm_model, cached_tokens,
+                shared_prefix=self.shared_prefixes.get(prompt_cache_key)
+            )
+        except Exception as e:
+            logger.warning(f"[LLM_DEBUG] 프롬프트 캐시 통계 기록 실패: {str(e)}")
+    
+    def get_router_stats(self) -> Dict[str, Any]:
+        """제공자별 지연/오류 EWMA, 진행 중 요청 수, 라우팅 결정 통계 조회"""
+        return self.provider_router.get_stats()
+    
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        """응답 캐시 적중/미스/병합 통계 조회"""
+        return self.response_cache.get_stats()
+    
+    def get_prompt_cache_stats(self, prompt_cache_key: str = None) -> Dict[str, Any]:
+        """프롬프트 접두부 캐시 통계 조회"""
+        return self.prompt_cache_tracker.get_stats(prompt_cache_key)
+        
     def generate_philosophical_response(self, 
                                       npc_description: str, 
                                       topic: str,
@@ -582,18 +812,16 @@ Create a natural flowing dialogue that genuinely captures how YOU as this specif
             
             logger.info(f"🔍 Using RAG path: {rag_path} with collection: {collection_name}")
             
-            # Initialize ChromaDB client
-            chroma_client = chromadb.PersistentClient(path=rag_path)
-            embedding_function = embedding_functions.OpenAIEmbeddingFunction(
-                api_key=self.openai_api_key,
-                model_name="text-embedding-3-small"
+            # 풀에 캐시된 클라이언트/임베딩 함수/컬렉션 핸들 사용 (처음 한 번만 열림)
+            pool = get_chroma_pool()
+            embedding_key, embedding_function = pool.openai_embedding_function(
+                self.openai_api_key, "text-embedding-3-small"
             )
+            collection = pool.get_collection(rag_path, collection_name, embedding_function, embedding_key)
             
-            # Get collection
-            collection = chroma_client.get_collection(name=collection_name, embedding_function=embedding_function)
-            
-            # Log collection info
-            logger.info(f"📊 Collection count: {collection.count()}")
+            # Log collection info (count()도 DB 조회이므로 디버그 로그일 때만)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📊 Collection count: {collection.count()}")
             
             # Clean query - remove any special formatting
             clean_query = re.sub(r'\s+', ' ', query).strip()
@@ -649,6 +877,21 @@ Create a natural flowing dialogue that genuinely captures how YOU as this specif
             logger.error(f"❌ Error in RAG retrieval: {str(e)}")
             return "", {"status": "error", "error": str(e)}
 
+    def warm_rag_collections(self) -> Dict[str, str]:
+        """
+        철학자 RAG 컬렉션 핸들을 미리 열기 (서버 시작 시 호출)
+        
+        Returns:
+            {철학자: "ok" | "missing_path" | "error: ..."}
+        """
+        pool = get_chroma_pool()
+        embedding_key, embedding_function = pool.openai_embedding_function(
+            self.openai_api_key, "text-embedding-3-small"
+        )
+        results = pool.warm(self.rag_paths, self.rag_collections, embedding_function, embedding_key)
+        logger.info(f"Warmed philosopher RAG collections: {results}")
+        return results
+    
     def should_use_rag(self, npc_id: str, user_message: str, previous_dialogue: str = "", topic: str = "") -> bool:
         """
         Automatically determines if RAG should be used based on conversation context and NPC
@@ -712,17 +955,26 @@ Create a natural flowing dialogue that genuinely captures how YOU as this specif
         try:
             logger.info(f"🔄 한국어 텍스트 번역 시작: {korean_text[:50]}...")
             
-            response = self.client.chat.completions.create(
-                model="gpt-4o", # 모델 설정 - 번역에 최적화된 모델 사용
-                messages=[
-                    {"role": "system", "content": "You are a professional Korean to English translator. Your task is to accurately translate Korean text to English. Translate ONLY the text provided, without any additional explanation or context."},
-                    {"role": "user", "content": f"Translate this Korean text to English: {korean_text}"}
-                ],
-                temperature=0.1,
-                max_tokens=500
-            )
+            system_prompt = "You are a professional Korean to English translator. Your task is to accurately translate Korean text to English. Translate ONLY the text provided, without any additional explanation or context."
+            user_prompt = f"Translate this Korean text to English: {korean_text}"
             
-            english_text = response.choices[0].message.content.strip()
+            def request_translation() -> str:
+                response = self.client.chat.completions.create(
+                    model="gpt-4o", # 모델 설정 - 번역에 최적화된 모델 사용
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.1,
+                    max_tokens=500
+                )
+                return response.choices[0].message.content.strip()
+            
+            if "translation" in self.cacheable_contexts:
+                cache_key = make_cache_key("openai", "gpt-4o", system_prompt, user_prompt, 500, 0.1)
+                english_text, _ = self.response_cache.get_or_compute(cache_key, request_translation)
+            else:
+                english_text = request_translation()
             logger.info(f"✅ 번역 완료: {english_text[:50]}...")
             return english_text
             
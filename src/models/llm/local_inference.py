@@ -0,0 +1,598 @@
+"""
+Local Inference Service Module
+
+프로세스당 하나의 로컬 모델을 로드해 여러 호출부(LocalLLMManager, 실험 코드 등)가 공유하는
+추론 서비스입니다.
+
+- 요청은 내부 대기열에 쌓이고, 워커 스레드가 batch_window 동안 모인 요청을 최대
+  max_batch_size개씩 묶어 백엔드에 한 번에 넘깁니다.
+- 프롬프트는 공유 접두부(prefix: 시스템/페르소나 프롬프트)와 나머지(prompt)로 나뉘며,
+  접두부를 미리 계산한 상태(llama.cpp save_state / transformers past_key_values)를 접두부 해시로
+  LRU 캐시해서 같은 접두부의 다음 요청은 나머지 부분만 prefill합니다.
+- 생성 결과는 InferenceHandle로 받으며, 여러 소비자가 각자 stream()으로 같은 생성 결과를
+  처음부터 따라 읽을 수 있습니다. temperature 0의 동일 요청은 대기열에서 하나로 합쳐집니다.
+- 백엔드는 InferenceBackend를 상속해 교체할 수 있습니다 (llama.cpp, transformers,
+  CPU 테스트용 DeterministicBackend).
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GenerationParams:
+    """생성 매개변수"""
+    max_tokens: int = 512
+    temperature: float = 0.7
+    top_p: float = 0.9
+    top_k: int = 40
+    stop: Tuple[str, ...] = ()
+
+
+def prefix_hash(prefix: str) -> str:
+    """접두부 상태 캐시 키"""
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16]
+
+
+class InferenceHandle:
+    """
+    생성 결과 핸들
+
+    백엔드가 만든 텍스트 조각을 모아 두며, result()로 최종 텍스트를 기다리거나
+    stream()으로 조각을 순서대로 읽습니다 (소비자마다 처음부터 다시 읽음).
+    """
+
+    def __init__(self, prompt: str, prefix: str, params: GenerationParams):
+        self.prompt = prompt
+        self.prefix = prefix
+        self.params = params
+        self.prefix_key = prefix_hash(prefix)
+        self.prefix_state: Any = None
+        self.created_at = time.time()
+        self.consumers = 1  # 합쳐진 요청 수
+        self._chunks: List[str] = []
+        self._text = ""
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def emit(self, chunk: str) -> bool:
+        """
+        백엔드가 생성한 텍스트 조각 추가
+
+        Args:
+            chunk: 새로 생성된 텍스트
+
+        Returns:
+            생성을 계속해야 하면 True (정지 시퀀스를 만났거나 이미 끝났으면 False)
+        """
+        with self._condition:
+            if self._done:
+                return False
+            text = self._text + chunk
+            for stop in self.params.stop:
+                stop_index = text.find(stop)
+                if stop_index >= 0:
+                    chunk = text[len(self._text):stop_index] if stop_index > len(self._text) else ""
+                    if chunk:
+                        self._chunks.append(chunk)
+                    self._text = text[:stop_index]
+                    self._done = True
+                    self._condition.notify_all()
+                    return False
+            self._chunks.append(chunk)
+            self._text = text
+            self._condition.notify_all()
+            return True
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """생성 종료 (이미 끝났으면 무시)"""
+        with self._condition:
+            if self._done:
+                return
+            self._error = error
+            self._done = True
+            self._condition.notify_all()
+
+    def result(self, timeout: Optional[float] = None) -> str:
+        """
+        최종 텍스트 반환
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            생성된 텍스트 (정지 시퀀스 앞까지)
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._done, timeout=timeout):
+                raise TimeoutError(f"Local inference did not finish within {timeout}s")
+            if self._error is not None:
+                raise self._error
+            return self._text
+
+    def stream(self, timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        생성된 텍스트 조각을 순서대로 반환 (이미 만들어진 조각부터)
+
+        Args:
+            timeout: 다음 조각을 기다릴 최대 시간 (초)
+        """
+        index = 0
+        while True:
+            with self._condition:
+                if not self._condition.wait_for(lambda: index < len(self._chunks) or self._done, timeout=timeout):
+                    raise TimeoutError(f"No local inference output within {timeout}s")
+                chunks = self._chunks[index:]
+                finished = self._done
+                error = self._error
+            index += len(chunks)
+            for chunk in chunks:
+                yield chunk
+            if finished and index >= len(self._chunks):
+                if error is not None:
+                    raise error
+                return
+
+
+class InferenceBackend:
+    """
+    로컬 추론 백엔드 기본 클래스
+
+    build_prefix_state()로 접두부 상태를 만들 수 있으면 supports_prefix_state를 True로 두고,
+    generate_one() 또는 generate_batch()에서 handle.prefix_state를 사용합니다.
+    생성한 텍스트는 handle.emit()으로 넘기고, False가 돌아오면 생성을 멈춥니다.
+    """
+
+    name = "base"
+    supports_prefix_state = False
+
+    def build_prefix_state(self, prefix: str) -> Any:
+        """접두부를 미리 계산한 상태 (지원하지 않으면 None)"""
+        return None
+
+    def generate_batch(self, handles: List[InferenceHandle]) -> None:
+        """묶음 생성 (기본 구현: 순서대로 하나씩)"""
+        for handle in handles:
+            try:
+                self.generate_one(handle)
+                handle.finish()
+            except Exception as e:
+                logger.error(f"❌ Local inference failed ({self.name}): {str(e)}")
+                handle.finish(e)
+
+    def generate_one(self, handle: InferenceHandle) -> None:
+        raise NotImplementedError
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "prefix_state": self.supports_prefix_state}
+
+
+class LlamaCppBackend(InferenceBackend):
+    """llama.cpp 백엔드 (save_state/load_state로 접두부 KV 재사용)"""
+
+    name = "llama.cpp"
+    supports_prefix_state = True
+
+    def __init__(self, model: Any):
+        """
+        Args:
+            model: 로드된 llama_cpp.Llama 인스턴스
+        """
+        self.model = model
+
+    def build_prefix_state(self, prefix: str) -> Any:
+        self.model.reset()
+        self.model.eval(self.model.tokenize(prefix.encode("utf-8")))
+        return self.model.save_state()
+
+    def generate_one(self, handle: InferenceHandle) -> None:
+        if handle.prefix_state is not None:
+            # 저장된 상태를 불러오면 create_completion이 일치하는 접두부 토큰의 prefill을 건너뜀
+            self.model.load_state(handle.prefix_state)
+        params = handle.params
+        for chunk in self.model.create_completion(
+            prompt=handle.prefix + handle.prompt,
+            max_tokens=params.max_tokens,
+            temperature=params.temperature,
+            top_p=params.top_p,
+            top_k=params.top_k,
+            stop=list(params.stop),
+            stream=True
+        ):
+            text = chunk["choices"][0]["text"] if chunk.get("choices") else ""
+            if text and not handle.emit(text):
+                break
+
+
+class TransformersBackend(InferenceBackend):
+    """HuggingFace Transformers 백엔드 (접두부 past_key_values 재사용)"""
+
+    name = "transformers"
+    supports_prefix_state = True
+
+    def __init__(self, model: Any, tokenizer: Any, device: str = "cpu"):
+        """
+        Args:
+            model: 로드된 AutoModelForCausalLM
+            tokenizer: 모델의 토크나이저
+            device: 입력 텐서를 올릴 장치
+        """
+        self.model = model
+        self.tokenizer = tokenizer
+        self.device = device
+
+    def _encode(self, text: str) -> Any:
+        return self.tokenizer(text, return_tensors="pt").input_ids.to(self.device)
+
+    def build_prefix_state(self, prefix: str) -> Any:
+        import torch
+
+        input_ids = self._encode(prefix)
+        with torch.no_grad():
+            output = self.model(input_ids=input_ids, use_cache=True)
+        return {"input_ids": input_ids, "past_key_values": output.past_key_values}
+
+    def generate_one(self, handle: InferenceHandle) -> None:
+        from threading import Thread
+        from transformers import TextIteratorStreamer, StoppingCriteria, StoppingCriteriaList
+
+        class _StopWhenHandleDone(StoppingCriteria):
+            def __call__(self, input_ids, scores, **kwargs):
+                return handle.done
+
+        params = handle.params
+        input_ids = self._encode(handle.prefix + handle.prompt)
+        gen_kwargs: Dict[str, Any] = {
+            "input_ids": input_ids,
+            "max_new_tokens": params.max_tokens,
+            "do_sample": params.temperature > 0,
+            "stopping_criteria": StoppingCriteriaList([_StopWhenHandleDone()]),
+        }
+        if params.temperature > 0:
+            gen_kwargs.update(temperature=params.temperature, top_p=params.top_p, top_k=params.top_k)
+
+        state = handle.prefix_state
+        if state is not None:
+            prefix_ids = state["input_ids"]
+            prefix_len = prefix_ids.shape[1]
+            # 접두부 경계에서 토큰화가 달라지면 캐시를 쓰지 않음
+            if prefix_len < input_ids.shape[1] and bool((input_ids[:, :prefix_len] == prefix_ids).all()):
+                gen_kwargs["past_key_values"] = copy.deepcopy(state["past_key_values"])
+
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        gen_kwargs["streamer"] = streamer
+        thread = Thread(target=self.model.generate, kwargs=gen_kwargs, daemon=True)
+        thread.start()
+        for text in streamer:
+            if text:
+                handle.emit(text)
+        thread.join()
+
+
+class DeterministicBackend(InferenceBackend):
+    """
+    CPU 테스트/벤치마크용 결정적 백엔드
+
+    같은 (prefix, prompt)에는 항상 같은 단어열을 생성하며, 묶음 안의 요청들을 한 단계에
+    한 토큰씩 번갈아 생성합니다. prefill한 문자 수를 세어 접두부 재사용 효과를 확인할 수 있습니다.
+    """
+
+    name = "deterministic"
+    supports_prefix_state = True
+
+    _WORDS = ("reason", "virtue", "freedom", "duty", "evidence", "society", "justice", "truth",
+              "technology", "ethics", "argument", "principle", "consequence", "human", "nature", "power")
+
+    def __init__(self, step_seconds: float = 0.0, prefill_seconds_per_char: float = 0.0):
+        """
+        Args:
+            step_seconds: 디코딩 한 단계(묶음 전체에 한 토큰씩)의 지연
+            prefill_seconds_per_char: prefill 지연 (문자당)
+        """
+        self.step_seconds = step_seconds
+        self.prefill_seconds_per_char = prefill_seconds_per_char
+        self.prefilled_chars = 0
+        self.batch_sizes: List[int] = []
+        self._lock = threading.Lock()
+
+    def _prefill(self, text: str) -> None:
+        with self._lock:
+            self.prefilled_chars += len(text)
+        if self.prefill_seconds_per_char > 0:
+            time.sleep(len(text) * self.prefill_seconds_per_char)
+
+    def build_prefix_state(self, prefix: str) -> Any:
+        self._prefill(prefix)
+        return {"prefix": prefix}
+
+    def _tokens(self, handle: InferenceHandle) -> List[str]:
+        digest = hashlib.sha256((handle.prefix + handle.prompt).encode("utf-8")).digest()
+        count = handle.params.max_tokens
+        return [("" if i == 0 else " ") + self._WORDS[digest[i % len(digest)] % len(self._WORDS)]
+                for i in range(count)]
+
+    def generate_batch(self, handles: List[InferenceHandle]) -> None:
+        self.batch_sizes.append(len(handles))
+        active = []
+        for handle in handles:
+            state = handle.prefix_state
+            cached = state is not None and state.get("prefix") == handle.prefix
+            self._prefill(handle.prompt if cached else handle.prefix + handle.prompt)
+            active.append((handle, iter(self._tokens(handle))))
+
+        while active:
+            if self.step_seconds > 0:
+                time.sleep(self.step_seconds)
+            still_active = []
+            for handle, tokens in active:
+                token = next(tokens, None)
+                if token is None or not handle.emit(token):
+                    handle.finish()
+                else:
+                    still_active.append((handle, tokens))
+            active = still_active
+
+
+class LocalInferenceService:
+    """
+    공유 로컬 추론 서비스
+
+    submit()은 즉시 InferenceHandle을 돌려주고, 워커 스레드가 요청을 묶어 백엔드에서 실행합니다.
+    """
+
+    def __init__(self,
+                 backend: InferenceBackend,
+                 max_batch_size: int = 8,
+                 batch_window_ms: float = 5.0,
+                 prefix_cache_size: int = 16,
+                 model_info: Optional[Dict[str, Any]] = None):
+        """
+        LocalInferenceService 초기화
+
+        Args:
+            backend: 추론 백엔드
+            max_batch_size: 한 번에 백엔드에 넘길 최대 요청 수
+            batch_window_ms: 첫 요청 이후 묶음을 채우기 위해 기다리는 시간 (ms)
+            prefix_cache_size: 캐시할 접두부 상태 수 (LRU)
+            model_info: 호출부에 노출할 모델 정보 (model_type, model_path 등)
+        """
+        self.backend = backend
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window = max(0.0, batch_window_ms) / 1000.0
+        self.prefix_cache_size = prefix_cache_size
+        self.model_info = dict(model_info or {})
+
+        self._queue: "deque[InferenceHandle]" = deque()
+        self._pending: Dict[Tuple[str, str, GenerationParams], InferenceHandle] = {}
+        self._prefix_states: "OrderedDict[str, Any]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._closed = False
+        self.stats = {
+            "requests": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "batched_requests": 0,
+            "prefix_hits": 0,
+            "prefix_misses": 0,
+            "errors": 0
+        }
+
+        self._worker = threading.Thread(target=self._run, name="local-inference", daemon=True)
+        self._worker.start()
+
+    def submit(self,
+               prompt: str,
+               prefix: str = "",
+               max_tokens: int = 512,
+               temperature: float = 0.7,
+               top_p: float = 0.9,
+               top_k: int = 40,
+               stop_sequences: Optional[List[str]] = None) -> InferenceHandle:
+        """
+        생성 요청 등록
+
+        Args:
+            prompt: 접두부 뒤에 오는 프롬프트
+            prefix: 여러 요청이 공유하는 접두부 (시스템/페르소나 프롬프트)
+            max_tokens: 최대 생성 토큰 수
+            temperature: 샘플링 온도
+            top_p: nucleus 샘플링 값
+            top_k: top-k 샘플링 값
+            stop_sequences: 정지 시퀀스
+
+        Returns:
+            생성 결과 핸들
+        """
+        params = GenerationParams(max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+                                  top_k=top_k, stop=tuple(stop_sequences or ()))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("LocalInferenceService is shut down")
+            self.stats["requests"] += 1
+
+            # 결정적 요청은 아직 시작하지 않은 같은 요청에 합침 (여러 소비자가 같은 결과를 읽음)
+            key = (prefix, prompt, params)
+            if temperature <= 0:
+                existing = self._pending.get(key)
+                if existing is not None:
+                    existing.consumers += 1
+                    self.stats["coalesced"] += 1
+                    return existing
+
+            handle = InferenceHandle(prompt, prefix, params)
+            self._queue.append(handle)
+            if temperature <= 0:
+                self._pending[key] = handle
+            self._condition.notify_all()
+            return handle
+
+    def generate(self, prompt: str, prefix: str = "", timeout: Optional[float] = None, **kwargs) -> str:
+        """
+        생성 요청 후 최종 텍스트 반환
+
+        Args:
+            prompt: 접두부 뒤에 오는 프롬프트
+            prefix: 공유 접두부
+            timeout: 최대 대기 시간 (초)
+            **kwargs: submit()의 생성 매개변수
+
+        Returns:
+            생성된 텍스트
+        """
+        return self.submit(prompt, prefix=prefix, **kwargs).result(timeout=timeout)
+
+    def _next_batch(self) -> List[InferenceHandle]:
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue or self._closed)
+            if not self._queue:
+                return []
+            # 첫 요청 이후 잠깐 기다려 동시에 들어오는 요청을 같은 묶음에 모음
+            deadline = time.monotonic() + self.batch_window
+            while len(self._queue) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = [self._queue.popleft() for _ in range(min(self.max_batch_size, len(self._queue)))]
+            for handle in batch:
+                self._pending.pop((handle.prefix, handle.prompt, handle.params), None)
+            # 같은 접두부끼리 붙여 백엔드가 상태 전환을 덜 하도록 정렬
+            batch.sort(key=lambda handle: handle.prefix_key)
+            self.stats["batches"] += 1
+            self.stats["batched_requests"] += len(batch)
+            return batch
+
+    def _resolve_prefix_state(self, handle: InferenceHandle) -> None:
+        if not handle.prefix or not self.backend.supports_prefix_state:
+            return
+        state = self._prefix_states.get(handle.prefix_key)
+        if state is not None:
+            self._prefix_states.move_to_end(handle.prefix_key)
+            self.stats["prefix_hits"] += 1
+        else:
+            self.stats["prefix_misses"] += 1
+            try:
+                state = self.backend.build_prefix_state(handle.prefix)
+            except Exception as e:
+                logger.warning(f"⚠️ Prefix state build failed, using full prefill: {str(e)}")
+                state = None
+            if state is not None:
+                self._prefix_states[handle.prefix_key] = state
+                while len(self._prefix_states) > self.prefix_cache_size:
+                    self._prefix_states.popitem(last=False)
+        handle.prefix_state = state
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            try:
+                for handle in batch:
+                    self._resolve_prefix_state(handle)
+                self.backend.generate_batch(batch)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"❌ Local inference batch failed: {str(e)}")
+                for handle in batch:
+                    handle.finish(e)
+            finally:
+                for handle in batch:
+                    handle.finish()
+                    handle.prefix_state = None
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """대기 중인 요청을 처리한 뒤 워커 종료"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                **self.stats,
+                **self.backend.describe(),
+                "queued": len(self._queue),
+                "cached_prefixes": len(self._prefix_states)
+            }
+
+
+def backend_from_local_llm(llm: Any) -> InferenceBackend:
+    """
+    로드된 LocalLLM에 맞는 백엔드 생성
+
+    Args:
+        llm: src.utils.local_llm.LocalLLM 인스턴스
+
+    Returns:
+        llama.cpp 또는 transformers 백엔드
+    """
+    if llm.model_type == "llama.cpp":
+        return LlamaCppBackend(llm.model)
+    return TransformersBackend(llm.model, llm.tokenizer, llm.device)
+
+
+_services: Dict[Tuple[str, str, str, bool], LocalInferenceService] = {}
+_services_lock = threading.Lock()
+
+
+def get_local_inference_service(model_path: str,
+                                model_type: str = "auto",
+                                model_config: Optional[Dict[str, Any]] = None,
+                                device: str = "auto",
+                                quantize: bool = True,
+                                **service_kwargs) -> LocalInferenceService:
+    """
+    모델별 프로세스 공유 추론 서비스 (처음 요청할 때 모델을 로드)
+
+    Args:
+        model_path: 모델 파일 또는 디렉토리 경로
+        model_type: "llama.cpp", "transformers", 또는 "auto"
+        model_config: 모델 로드 설정
+        device: 실행 장치
+        quantize: 양자화 여부
+        **service_kwargs: LocalInferenceService 설정 (max_batch_size 등)
+
+    Returns:
+        LocalInferenceService 인스턴스
+    """
+    key = (model_path, model_type, device, quantize)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            from src.utils.local_llm import LocalLLM
+
+            llm = LocalLLM(model_path=model_path, model_type=model_type, model_config=model_config,
+                           device=device, quantize=quantize)
+            service = LocalInferenceService(
+                backend_from_local_llm(llm),
+                model_info={"model_type": llm.model_type, "model_path": llm.model_path, "device": llm.device},
+                **service_kwargs
+            )
+            _services[key] = service
+            logger.info(f"🧠 Local inference service started for {model_path} ({llm.model_type})")
+        return service
+
+
+def shutdown_local_inference_services() -> None:
+    """공유 추론 서비스 전체 종료"""
+    with _services_lock:
+        services = list(_services.values())
+        _services.clear()
+    for service in services:
+        service.shutdown()
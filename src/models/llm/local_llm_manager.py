@@ -12,7 +12,7 @@ import logging
 import time
 from typing import Dict, List, Any, Tuple, Optional
 
-from src.utils.local_llm import LocalLLM
+from src.models.llm.local_inference import LocalInferenceService, get_local_inference_service
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,8 @@ class LocalLLMManager:
                 system_prompt_template_path: Optional[str] = None,
                 user_prompt_template_path: Optional[str] = None,
                 dialogue_system_template_path: Optional[str] = None,
-                dialogue_user_template_path: Optional[str] = None):
+                dialogue_user_template_path: Optional[str] = None,
+                inference_service: Optional[LocalInferenceService] = None):
         """
         Initialize the LocalLLMManager.
         
@@ -48,11 +49,13 @@ class LocalLLMManager:
             user_prompt_template_path: Path to custom user prompt template.
             dialogue_system_template_path: Path to custom dialogue system prompt template.
             dialogue_user_template_path: Path to custom dialogue user prompt template.
+            inference_service: Shared inference service to use instead of the process-wide one for model_path.
         """
         self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
         
-        # Load the model
-        self.llm = LocalLLM(
+        # Share one loaded model per process; the system templates are sent as a
+        # cacheable prefix so only the per-call part is prefilled on each request
+        self.service = inference_service or get_local_inference_service(
             model_path=model_path,
             model_type=model_type,
             model_config=model_config,
@@ -278,7 +281,7 @@ IMPORTANT:
                 user_context_str += f"Excerpt: {ctx['excerpt']}\n\n"
         
         # Build the prompt for local LLM
-        full_prompt = self.system_prompt_template + "\n\n" + self.user_prompt_template.format(
+        user_prompt = self.user_prompt_template.format(
             npc_description=npc_description,
             topic=topic,
             context=context,
@@ -290,8 +293,9 @@ IMPORTANT:
         # Generate the response
         try:
             start_time = time.time()
-            response_text = self.llm.generate_text(
-                prompt=full_prompt,
+            response_text = self.service.generate(
+                prompt=user_prompt,
+                prefix=self.system_prompt_template + "\n\n",
                 max_tokens=512,  # Adjust based on model capabilities
                 temperature=0.7,
                 top_p=0.9,
@@ -307,8 +311,8 @@ IMPORTANT:
                 "timestamp": time.time(),
                 "user_context_used": bool(user_contexts),
                 "generation_time": generation_time,
-                "model_type": self.llm.model_type,
-                "model_path": self.llm.model_path
+                "model_type": self.service.model_info.get("model_type"),
+                "model_path": self.service.model_info.get("model_path")
             }
             
             logger.info(f"Generated philosophical response in {generation_time:.2f} seconds")
@@ -359,7 +363,7 @@ IMPORTANT:
                 user_context_str += f"Excerpt: {ctx['excerpt']}\n\n"
                 
         # Build the prompt for local LLM
-        full_prompt = self.dialogue_system_template + "\n\n" + self.dialogue_user_template.format(
+        user_prompt = self.dialogue_user_template.format(
             npc1_description=npc1_description,
             npc2_description=npc2_description,
             topic=topic,
@@ -371,8 +375,9 @@ IMPORTANT:
         # Generate the dialogue
         try:
             start_time = time.time()
-            dialogue_text = self.llm.generate_text(
-                prompt=full_prompt,
+            dialogue_text = self.service.generate(
+                prompt=user_prompt,
+                prefix=self.dialogue_system_template + "\n\n",
                 max_tokens=1024,  # Longer for dialogue
                 temperature=0.7,
                 top_p=0.9,
@@ -389,8 +394,8 @@ IMPORTANT:
                 "exchanges": processed_dialogue,
                 "topic": topic,
                 "generation_time": generation_time,
-                "model_type": self.llm.model_type,
-                "model_path": self.llm.model_path
+                "model_type": self.service.model_info.get("model_type"),
+                "model_path": self.service.model_info.get("model_path")
             }
             
             logger.info(f"Generated dialogue exchange in {generation_time:.2f} seconds")
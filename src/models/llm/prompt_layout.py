@@ -0,0 +1,198 @@
+"""
+Prompt Layout Module
+
+프롬프트를 '안정적인 접두부(stable prefix)'와 '가변 접미부(volatile suffix)'로 구성하는 레이어입니다.
+
+- 접두부: 철학자 페르소나, 방 단위 상수(주제, 입장, 컨텍스트 요약), 고정 지시문
+  → 시스템 프롬프트로 보내며 같은 방/화자의 모든 턴에서 동일하게 유지됩니다.
+- 접미부: 최근 발언, 공격/방어 대상, 전략, RAG 결과, 감정 등 턴마다 바뀌는 내용
+  → 사용자 프롬프트로 보냅니다.
+
+접두부가 동일하면 OpenAI 프롬프트 캐싱(1024 토큰 이상, 128 토큰 단위)이나
+Ollama keep_alive로 유지된 KV 컨텍스트를 재사용할 수 있습니다.
+add_shared()로 추가한 공유 블록은 여러 단계 템플릿이 공통으로 쓰는 접두부이며,
+공유 블록이 주어지면 PromptCacheTracker는 그 블록만 캐시 가능 토큰으로 계산합니다
+(1024 토큰 미만이면 0).
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from .token_counter import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# OpenAI 프롬프트 캐싱 규칙: 1024 토큰 이상부터, 이후 128 토큰 단위로 캐시
+OPENAI_CACHE_MIN_TOKENS = 1024
+OPENAI_CACHE_INCREMENT = 128
+
+
+def cache_eligible_tokens(prefix_tokens: int) -> int:
+    """
+    접두부 토큰 수 중 제공자 캐시 대상이 될 수 있는 토큰 수
+
+    Args:
+        prefix_tokens: 접두부 토큰 수
+
+    Returns:
+        캐시 가능 토큰 수 (최소 길이 미만이면 0)
+    """
+    if prefix_tokens < OPENAI_CACHE_MIN_TOKENS:
+        return 0
+    extra = prefix_tokens - OPENAI_CACHE_MIN_TOKENS
+    return OPENAI_CACHE_MIN_TOKENS + (extra // OPENAI_CACHE_INCREMENT) * OPENAI_CACHE_INCREMENT
+
+
+def prefix_hash(system_prompt: str) -> str:
+    """접두부(시스템 프롬프트) 해시"""
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
+
+class PromptLayout:
+    """
+    stable prefix + volatile suffix 순서로 프롬프트를 조립하는 빌더
+    """
+
+    def __init__(self, cache_key: Optional[str] = None):
+        """
+        PromptLayout 초기화
+
+        Args:
+            cache_key: 같은 접두부를 공유하는 호출 묶음 식별자 (예: 방 + 화자)
+        """
+        self.cache_key = cache_key
+        self.stable_sections: List[str] = []
+        self.volatile_sections: List[str] = []
+        self.shared_count = 0
+
+    def add_shared(self, text: str) -> 'PromptLayout':
+        """단계 템플릿과 무관하게 항상 맨 앞에 오는 공유 블록 추가 (add_stable보다 먼저 호출)"""
+        if text and text.strip():
+            self.stable_sections.insert(self.shared_count, text.strip())
+            self.shared_count += 1
+        return self
+
+    def add_stable(self, text: str) -> 'PromptLayout':
+        """턴마다 바뀌지 않는 내용 추가 (페르소나, 방 상수, 고정 지시문)"""
+        if text and text.strip():
+            self.stable_sections.append(text.strip())
+        return self
+
+    def add_volatile(self, text: str) -> 'PromptLayout':
+        """턴마다 바뀌는 내용 추가 (최근 발언, 대상, 전략, 근거, 감정)"""
+        if text and text.strip():
+            self.volatile_sections.append(text.strip())
+        return self
+
+    @property
+    def system_prompt(self) -> str:
+        return "\n\n".join(self.stable_sections) + "\n"
+
+    @property
+    def shared_prefix(self) -> str:
+        """시스템 프롬프트의 정확한 문자열 접두부인 공유 블록 (없으면 빈 문자열)"""
+        if not self.shared_count:
+            return ""
+        return "\n\n".join(self.stable_sections[:self.shared_count])
+
+    @property
+    def user_prompt(self) -> str:
+        return "\n\n".join(self.volatile_sections) + "\n"
+
+    @property
+    def prefix_hash(self) -> str:
+        return prefix_hash(self.system_prompt)
+
+    def build(self) -> Tuple[str, str]:
+        """(system_prompt, user_prompt) 반환"""
+        return self.system_prompt, self.user_prompt
+
+
+class PromptCacheTracker:
+    """
+    cache_key별 접두부 해시와 캐시 가능 토큰 수를 기록하는 추적기
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self,
+               cache_key: str,
+               system_prompt: str,
+               user_prompt: str,
+               model: str,
+               cached_tokens: Optional[int] = None,
+               shared_prefix: Optional[str] = None) -> Dict[str, Any]:
+        """
+        호출 한 건의 접두부 정보 기록
+
+        Args:
+            cache_key: 접두부 공유 식별자
+            system_prompt: 접두부 (시스템 프롬프트)
+            user_prompt: 접미부 (사용자 프롬프트)
+            model: 사용 모델
+            cached_tokens: 제공자가 보고한 실제 캐시 적중 토큰 수 (알 수 없으면 None)
+            shared_prefix: 다른 단계와 공유하는 접두부 블록 (주어지면 이 블록만 캐시 가능 토큰으로 계산)
+
+        Returns:
+            이번 호출의 캐시 정보
+        """
+        current_hash = prefix_hash(system_prompt)
+        prefix_tokens = count_tokens(system_prompt, model)
+        suffix_tokens = count_tokens(user_prompt, model)
+        if shared_prefix is None:
+            shared_tokens = prefix_tokens
+        elif system_prompt.startswith(shared_prefix):
+            shared_tokens = count_tokens(shared_prefix, model)
+        else:
+            shared_tokens = 0
+        eligible = cache_eligible_tokens(shared_tokens)
+
+        with self._lock:
+            entry = self._entries.setdefault(cache_key, {
+                "calls": 0,
+                "prefix_reuses": 0,
+                "prefix_changes": 0,
+                "prefix_tokens_total": 0,
+                "suffix_tokens_total": 0,
+                "cache_eligible_tokens_total": 0,
+                "provider_cached_tokens_total": 0,
+                "last_prefix_hash": None
+            })
+
+            prefix_reused = entry["last_prefix_hash"] == current_hash
+            if prefix_reused:
+                entry["prefix_reuses"] += 1
+            elif entry["last_prefix_hash"] is not None:
+                entry["prefix_changes"] += 1
+
+            entry["calls"] += 1
+            entry["prefix_tokens_total"] += prefix_tokens
+            entry["suffix_tokens_total"] += suffix_tokens
+            entry["cache_eligible_tokens_total"] += eligible
+            entry["provider_cached_tokens_total"] += cached_tokens or 0
+            entry["last_prefix_hash"] = current_hash
+
+        info = {
+            "cache_key": cache_key,
+            "prefix_hash": current_hash,
+            "prefix_tokens": prefix_tokens,
+            "suffix_tokens": suffix_tokens,
+            "shared_prefix_tokens": shared_tokens,
+            "cache_eligible_tokens": eligible,
+            "prefix_reused": prefix_reused,
+            "provider_cached_tokens": cached_tokens
+        }
+        logger.info(f"[PROMPT_CACHE] {cache_key} prefix={current_hash} tokens={prefix_tokens}+{suffix_tokens} "
+                    f"eligible={eligible} reused={prefix_reused} cached={cached_tokens}")
+        return info
+
+    def get_stats(self, cache_key: Optional[str] = None) -> Dict[str, Any]:
+        """cache_key별 (또는 전체) 통계 반환"""
+        with self._lock:
+            if cache_key is not None:
+                return dict(self._entries.get(cache_key, {}))
+            return {key: dict(entry) for key, entry in self._entries.items()}
@@ -0,0 +1,237 @@
+"""
+LLM Provider Router Module
+
+호출마다 context_type, 호출부의 남은 마감 시간, 제공자별 지연/오류 EWMA와 대기열 깊이를 보고
+OpenAI와 로컬 Ollama 중 어느 쪽으로 보낼지 결정하는 라우터입니다.
+
+- 기본 제공자는 OpenAI이며, 로컬 모델이 비활성화되어 있으면 항상 OpenAI로 보냅니다.
+- 가벼운 컨텍스트(키워드 추출, RAG 쿼리 생성, 감정 추론 등)는 OpenAI가 과부하일 때
+  (진행 중 요청 수, 지연 EWMA, 오류 EWMA 기준) 또는 남은 마감 시간 안에 응답이 어려울 때
+  로컬 모델로 넘깁니다(spill).
+- 두 제공자가 모두 정상이면 가벼운 컨텍스트에 헤징 지연 시간을 붙여, 주 요청이 그 시간 안에
+  끝나지 않으면 다른 제공자에도 같은 요청을 보내고 먼저 도착한 응답을 사용합니다.
+"""
+
+import os
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_PROVIDER = "openai"
+LOCAL_PROVIDER = "ollama"
+
+DEFAULT_LOCAL_MODEL = "llama3.2-optimized"
+DEFAULT_SPILLABLE_CONTEXTS = frozenset({
+    "keyword_extraction",
+    "rag_query_generation",
+    "emotion_inference",
+})
+
+
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def get_hedge_executor() -> ThreadPoolExecutor:
+    """헤징 요청용 공유 스레드 풀 (처음 사용할 때 생성)"""
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-hedge")
+        return _hedge_executor
+
+
+@dataclass
+class ProviderStats:
+    """제공자별 지연/오류 EWMA와 진행 중 요청 수"""
+    ewma_latency: Optional[float] = None  # 초 (관측 전에는 None)
+    ewma_error: float = 0.0
+    inflight: int = 0
+    calls: int = 0
+    errors: int = 0
+
+    def record(self, latency: float, ok: bool, alpha: float) -> None:
+        """요청 한 건의 결과 반영"""
+        self.calls += 1
+        if not ok:
+            self.errors += 1
+        self.ewma_error = alpha * (0.0 if ok else 1.0) + (1 - alpha) * self.ewma_error
+        if ok:
+            if self.ewma_latency is None:
+                self.ewma_latency = latency
+            else:
+                self.ewma_latency = alpha * latency + (1 - alpha) * self.ewma_latency
+
+
+@dataclass
+class RouteDecision:
+    """라우팅 결과"""
+    provider: str
+    model: str
+    reason: str
+    hedge_provider: Optional[str] = None
+    hedge_model: Optional[str] = None
+    hedge_after: Optional[float] = None  # 초 (None이면 헤징하지 않음)
+
+
+@dataclass
+class RouterConfig:
+    """라우터 설정 (config.yaml의 llm.router 섹션)"""
+    local_enabled: bool = False
+    local_model: str = DEFAULT_LOCAL_MODEL
+    local_models: Dict[str, str] = field(default_factory=dict)  # context_type별 로컬 모델
+    spillable_contexts: Iterable[str] = DEFAULT_SPILLABLE_CONTEXTS
+    spill_queue_depth: int = 8          # OpenAI 진행 중 요청이 이 이상이면 spill
+    spill_latency_seconds: float = 8.0  # OpenAI 지연 EWMA가 이 이상이면 spill
+    error_threshold: float = 0.5        # 오류 EWMA가 이 이상이면 비정상으로 간주
+    hedge_enabled: bool = True
+    hedge_multiplier: float = 1.5       # 주 제공자 지연 EWMA의 배수만큼 기다린 뒤 헤징
+    min_hedge_seconds: float = 0.5
+    ewma_alpha: float = 0.3
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'RouterConfig':
+        data = dict(data or {})
+        env_flag = os.getenv("LLM_ROUTER_LOCAL")
+        if env_flag is not None:
+            data["local_enabled"] = env_flag.lower() in ("1", "true", "yes", "on")
+        if os.getenv("OLLAMA_MODEL") and "local_model" not in data:
+            data["local_model"] = os.getenv("OLLAMA_MODEL")
+        known = {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+        config = cls(**known)
+        config.spillable_contexts = frozenset(config.spillable_contexts)
+        return config
+
+
+class ProviderRouter:
+    """
+    context_type / 마감 시간 / 제공자 상태 기반 라우터
+    """
+
+    def __init__(self, config: Optional[RouterConfig] = None):
+        """
+        ProviderRouter 초기화
+
+        Args:
+            config: 라우터 설정 (None이면 기본값, 로컬 모델 비활성화)
+        """
+        self.config = config or RouterConfig()
+        self._stats: Dict[str, ProviderStats] = {
+            PRIMARY_PROVIDER: ProviderStats(),
+            LOCAL_PROVIDER: ProviderStats()
+        }
+        self._decisions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 라우팅
+    # ------------------------------------------------------------------
+
+    def local_model_for(self, context_type: str) -> str:
+        """context_type에 사용할 로컬 모델"""
+        return self.config.local_models.get(context_type, self.config.local_model)
+
+    def route(self, context_type: str, primary_model: str, deadline_seconds: Optional[float] = None) -> RouteDecision:
+        """
+        호출 하나의 제공자/모델 결정
+
+        Args:
+            context_type: 컨텍스트 타입
+            primary_model: OpenAI로 보낼 때 사용할 모델
+            deadline_seconds: 호출부의 남은 시간 (없으면 None)
+
+        Returns:
+            RouteDecision
+        """
+        decision = self._decide(context_type, primary_model, deadline_seconds)
+        with self._lock:
+            self._decisions[decision.reason] = self._decisions.get(decision.reason, 0) + 1
+        return decision
+
+    def _decide(self, context_type: str, primary_model: str, deadline_seconds: Optional[float]) -> RouteDecision:
+        config = self.config
+        if not config.local_enabled or context_type not in config.spillable_contexts:
+            return RouteDecision(PRIMARY_PROVIDER, primary_model, "primary")
+
+        local_model = self.local_model_for(context_type)
+        with self._lock:
+            primary = ProviderStats(**asdict(self._stats[PRIMARY_PROVIDER]))
+            local = ProviderStats(**asdict(self._stats[LOCAL_PROVIDER]))
+
+        local_healthy = local.ewma_error < config.error_threshold
+        if not local_healthy:
+            return RouteDecision(PRIMARY_PROVIDER, primary_model, "local_unhealthy")
+
+        if primary.ewma_error >= config.error_threshold:
+            return RouteDecision(LOCAL_PROVIDER, local_model, "spill_errors")
+        if primary.inflight >= config.spill_queue_depth:
+            return RouteDecision(LOCAL_PROVIDER, local_model, "spill_queue")
+        if primary.ewma_latency is not None and primary.ewma_latency >= config.spill_latency_seconds:
+            return RouteDecision(LOCAL_PROVIDER, local_model, "spill_latency")
+        if (deadline_seconds is not None and primary.ewma_latency is not None
+                and primary.ewma_latency > deadline_seconds
+                and (local.ewma_latency is None or local.ewma_latency < primary.ewma_latency)):
+            return RouteDecision(LOCAL_PROVIDER, local_model, "spill_deadline")
+
+        decision = RouteDecision(PRIMARY_PROVIDER, primary_model, "primary")
+        if config.hedge_enabled and primary.ewma_latency is not None:
+            hedge_after = max(config.min_hedge_seconds, primary.ewma_latency * config.hedge_multiplier)
+            if deadline_seconds is None or hedge_after < deadline_seconds:
+                decision.hedge_provider = LOCAL_PROVIDER
+                decision.hedge_model = local_model
+                decision.hedge_after = hedge_after
+        return decision
+
+    # ------------------------------------------------------------------
+    # 상태 기록
+    # ------------------------------------------------------------------
+
+    def begin(self, provider: str) -> None:
+        """요청 시작 (진행 중 요청 수 증가)"""
+        with self._lock:
+            self._stats.setdefault(provider, ProviderStats()).inflight += 1
+
+    def end(self, provider: str, latency: float, ok: bool) -> None:
+        """요청 종료 (진행 중 요청 수 감소, EWMA 갱신)"""
+        with self._lock:
+            stats = self._stats.setdefault(provider, ProviderStats())
+            stats.inflight = max(0, stats.inflight - 1)
+            stats.record(latency, ok, self.config.ewma_alpha)
+
+    def record_hedge(self, winner: str) -> None:
+        """헤징 결과 기록"""
+        with self._lock:
+            key = f"hedge_won_by_{winner}"
+            self._decisions[key] = self._decisions.get(key, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """제공자별 상태와 라우팅 결정 횟수"""
+        with self._lock:
+            return {
+                "local_enabled": self.config.local_enabled,
+                "providers": {name: asdict(stats) for name, stats in self._stats.items()},
+                "decisions": dict(self._decisions)
+            }
+
+
+_router: Optional[ProviderRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_provider_router(config: Optional[Dict[str, Any]] = None) -> ProviderRouter:
+    """
+    프로세스 전역 라우터 (제공자 상태는 모든 방의 LLMManager가 공유)
+
+    Args:
+        config: 처음 생성할 때 사용할 llm.router 설정
+    """
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = ProviderRouter(RouterConfig.from_dict(config))
+    return _router
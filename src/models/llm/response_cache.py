@@ -0,0 +1,203 @@
+"""
+LLM Response Cache Module
+
+입력에 대해 사실상 결정적인 LLM 분석 호출(논지 추출, 취약점 점수, RAG 쿼리 생성,
+키워드 추출, 번역, 입장 진술문 생성 등)을 위한 응답 캐시입니다.
+
+- single-flight: 같은 키의 요청이 진행 중이면 새 API 호출 없이 그 결과를 기다립니다.
+  (여러 상대 에이전트가 같은 발언을 동시에 분석하는 경우)
+- 완료된 응답은 모델, 프롬프트 해시, 생성 파라미터로 만든 키로 TTL/LRU 캐시에 저장됩니다.
+- 실패(빈 응답)나 예외는 캐시하지 않으며, 대기 중이던 요청도 같은 결과를 받습니다.
+- 어떤 context_type을 캐시할지는 LLMManager에서 opt-in으로 정합니다.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_ENTRIES = 1024
+
+# 기본으로 응답 캐시를 사용하는 context_type (입력이 같으면 결과를 재사용해도 되는 분석성 호출)
+DEFAULT_CACHEABLE_CONTEXTS = frozenset({
+    "argument_analysis",
+    "vulnerability_scoring",
+    "rag_query_generation",
+    "keyword_extraction",
+    "translation",
+    "stance_statements",
+})
+
+
+def make_cache_key(provider: str, model: str, system_prompt: str, user_prompt: str,
+                   max_tokens: Optional[int] = None, temperature: Optional[float] = None) -> str:
+    """
+    모델, 프롬프트 해시, 생성 파라미터로 캐시 키 생성
+
+    Returns:
+        sha256 hex 문자열
+    """
+    digest = hashlib.sha256()
+    for part in (provider, model, str(max_tokens), repr(temperature), system_prompt, user_prompt):
+        digest.update(str(part or "").encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class _Flight:
+    """진행 중인 요청 하나 (리더가 결과를 채우면 대기자들이 깨어남)"""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class LLMResponseCache:
+    """
+    single-flight 중복 제거 + TTL/LRU 응답 캐시
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        LLMResponseCache 초기화
+
+        Args:
+            ttl_seconds: 응답 유지 시간 (초)
+            max_entries: 최대 저장 응답 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            clock: 시간 함수 (테스트용)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "errors": 0
+        }
+
+    def get(self, key: str) -> Optional[Any]:
+        """만료되지 않은 캐시 값 조회 (통계 미반영)"""
+        with self._lock:
+            return self._lookup(key)
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats["expirations"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        self.stats["stores"] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       should_cache: Callable[[Any], bool] = bool) -> Tuple[Any, str]:
+        """
+        캐시 조회 → 진행 중인 같은 요청 대기 → 직접 계산 순으로 값 반환
+
+        Args:
+            key: 캐시 키 (make_cache_key)
+            compute: 캐시에 없을 때 호출할 함수 (실제 LLM 호출)
+            should_cache: 결과를 저장할지 판단하는 함수 (기본: 빈 응답은 저장하지 않음)
+
+        Returns:
+            (값, 출처) - 출처는 "hit", "coalesced", "miss" 중 하나
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                self.stats["hits"] += 1
+                return value, "hit"
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, "coalesced"
+
+        try:
+            value = compute()
+            flight.value = value
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self.stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                if flight.error is None and should_cache(flight.value):
+                    self._store(key, flight.value)
+                self._inflight.pop(key, None)
+            flight.event.set()
+
+        return value, "miss"
+
+    def invalidate(self, key: str) -> None:
+        """캐시 항목 하나 제거"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 캐시 항목 제거 (진행 중인 요청은 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중/미스/병합 통계"""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+            return {
+                **self.stats,
+                "size": len(self._entries),
+                "inflight": len(self._inflight),
+                "hit_rate": round((self.stats["hits"] + self.stats["coalesced"]) / lookups, 4) if lookups else 0.0
+            }
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> LLMResponseCache:
+    """프로세스 전역 응답 캐시 (방마다 생성되는 LLMManager들이 공유)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = LLMResponseCache()
+    return _shared_cache
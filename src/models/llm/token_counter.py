@@ -0,0 +1,129 @@
+"""
+Token Counter Module
+
+대상 모델의 토크나이저(tiktoken)를 프로세스당 한 번만 로드하여 캐시하고,
+토큰 수를 계산하는 유틸리티입니다. tiktoken을 사용할 수 없거나 인코딩 파일을
+받을 수 없는 환경에서는 문자 기반 근사치로 대체합니다.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# tiktoken이 모델을 모르는 경우 사용할 기본 인코딩
+DEFAULT_ENCODING = "cl100k_base"
+GPT4O_ENCODING = "o200k_base"
+
+
+@lru_cache(maxsize=32)
+def get_encoding(model: str = "gpt-4o") -> Optional[Any]:
+    """
+    모델에 맞는 tiktoken 인코딩 반환 (모델별로 캐시)
+
+    Args:
+        model: 모델 이름
+
+    Returns:
+        tiktoken Encoding 객체 (사용 불가 시 None, 실패 결과도 캐시됨)
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken not installed, using approximate token counts")
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding_name = GPT4O_ENCODING if model.startswith(("gpt-4o", "gpt-4.1", "o1", "o3", "o4")) else DEFAULT_ENCODING
+        try:
+            return tiktoken.get_encoding(encoding_name)
+        except Exception as e:
+            logger.warning(f"Failed to load tiktoken encoding {encoding_name}: {str(e)}")
+            return None
+    except Exception as e:
+        logger.warning(f"Failed to load tiktoken encoding for {model}: {str(e)}")
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 토큰 수 근사 (영문 약 4자/토큰, 한글 등 비ASCII 문자 약 1자/토큰)
+
+    Args:
+        text: 대상 텍스트
+
+    Returns:
+        근사 토큰 수
+    """
+    if not text:
+        return 0
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    ascii_chars = len(text) - non_ascii
+    return int(ascii_chars / 4 + non_ascii) + 1
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """
+    대상 모델 기준 토큰 수 계산
+
+    Args:
+        text: 대상 텍스트
+        model: 모델 이름
+
+    Returns:
+        토큰 수
+    """
+    if not text:
+        return 0
+
+    encoding = get_encoding(model)
+    if encoding is None:
+        return estimate_tokens(text)
+
+    try:
+        return len(encoding.encode(text, disallowed_special=()))
+    except Exception as e:
+        logger.warning(f"Token counting failed, using estimate: {str(e)}")
+        return estimate_tokens(text)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4o", keep: str = "head") -> str:
+    """
+    텍스트를 토큰 수 기준으로 자르기
+
+    Args:
+        text: 대상 텍스트
+        max_tokens: 남길 최대 토큰 수
+        model: 모델 이름
+        keep: "head"면 앞부분, "tail"이면 뒷부분 유지
+
+    Returns:
+        max_tokens 이하로 잘린 텍스트
+    """
+    if not text or max_tokens <= 0:
+        return ""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    encoding = get_encoding(model)
+    if encoding is not None:
+        try:
+            tokens = encoding.encode(text, disallowed_special=())
+            kept = tokens[:max_tokens] if keep == "head" else tokens[-max_tokens:]
+            return encoding.decode(kept)
+        except Exception as e:
+            logger.warning(f"Token truncation failed, using estimate: {str(e)}")
+
+    # 토크나이저가 없으면 근사치가 max_tokens 이하가 될 때까지 이분 탐색
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        candidate = text[:mid] if keep == "head" else text[-mid:]
+        if estimate_tokens(candidate) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] if keep == "head" else text[len(text) - low:]
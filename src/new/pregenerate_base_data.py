@@ -5,10 +5,17 @@ debate_topics.json의 모든 주제에 대해
 콘텍스트 요약, 찬반 입장, 모더레이터 메시지를 사전 생성하여
 JSON 파일로 저장합니다.
 
+주제 하나가 끝날 때마다 결과를 체크포인트 JSONL에 바로 기록하므로, 중간에 중단되어도
+다음 실행은 이미 끝난 주제(topic_id + 입력 fingerprint 기준)를 건너뛰고 이어서 진행합니다.
+마지막에 체크포인트를 런타임 캐시가 읽는 JSON 형식으로 압축(compact)합니다.
+
 사용법:
     python pregenerate_base_data.py
     python pregenerate_base_data.py --category dilemma_challenge
     python pregenerate_base_data.py --output custom_output.json
+    python pregenerate_base_data.py --batch          # OpenAI Batch API (저렴한 오프라인 생성)
+    python pregenerate_base_data.py --compact-only   # 체크포인트만 다시 압축
+    python pregenerate_base_data.py --force          # 체크포인트 무시하고 전부 재생성
 """
 
 import asyncio
@@ -17,7 +24,7 @@ import time
 import logging
 import argparse
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import hashlib
 import os
@@ -28,6 +35,9 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
 from src.new.services.openai_service import OpenAIDebateService
+from src.new.services.pregeneration_store import (
+    PregenerationCheckpointStore, topic_fingerprint, is_successful_record, write_json_atomic
+)
 from src.new.models.debate_models import FastDebateRequest, ModeratorStyle, ContextType
 
 # 로깅 설정
@@ -40,10 +50,27 @@ logger = logging.getLogger(__name__)
 class DebateDataPregenrator:
     """토론 데이터 사전 생성기"""
     
-    def __init__(self, output_file: str = "pregenerated_debates.json"):
-        self.openai_service = OpenAIDebateService(use_fine_tuned=False)
+    BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+    
+    def __init__(self, output_file: str = "pregenerated_debates.json",
+                 openai_service: Optional[OpenAIDebateService] = None,
+                 checkpoint_file: Optional[str] = None,
+                 topics_file: Optional[str] = None,
+                 concurrency: int = 3):
+        """
+        Args:
+            output_file: 런타임 캐시용 JSON 경로
+            openai_service: 토론 패키지 생성 서비스 (None이면 새로 생성)
+            checkpoint_file: 체크포인트 JSONL 경로 (None이면 output_file 옆 .checkpoint.jsonl)
+            topics_file: 주제 카탈로그 경로 (None이면 agoramind/data/debate_topics.json)
+            concurrency: 실시간 모드 동시 생성 수
+        """
+        self.openai_service = openai_service or OpenAIDebateService(use_fine_tuned=False)
         self.output_file = output_file
-        self.debate_topics_file = project_root / "agoramind" / "data" / "debate_topics.json"
+        self.debate_topics_file = Path(topics_file) if topics_file else project_root / "agoramind" / "data" / "debate_topics.json"
+        self.checkpoint_file = checkpoint_file or str(Path(output_file).with_suffix(".checkpoint.jsonl"))
+        self.store = PregenerationCheckpointStore(self.checkpoint_file)
+        self.concurrency = max(1, concurrency)
         
     def load_debate_topics(self) -> Dict[str, Any]:
         """debate_topics.json 파일 로드"""
@@ -76,6 +103,92 @@ class DebateDataPregenrator:
         else:
             return ContextType.EMPTY
     
+    def collect_topics(self, target_category: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """카탈로그에서 생성할 (카테고리, 주제) 목록 수집"""
+        
+        topics_data = self.load_debate_topics()
+        categories = topics_data.get("categories", {})
+        
+        if target_category and target_category not in categories:
+            raise ValueError(f"Category '{target_category}' not found. Available: {list(categories.keys())}")
+        
+        topics = []
+        for category_name, category_data in categories.items():
+            if target_category and category_name != target_category:
+                continue
+            for topic in category_data.get("topics", []):
+                topics.append((category_name, topic))
+        return topics
+    
+    def _original_data(self, topic_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "context": topic_data.get("context", {}),
+            "pro_philosophers": topic_data.get("pro_philosophers", []),
+            "con_philosophers": topic_data.get("con_philosophers", []),
+            "moderator_style": str(topic_data.get("moderator_style", "0"))
+        }
+    
+    def _fingerprint(self, topic_data: Dict[str, Any]) -> str:
+        model = getattr(self.openai_service, "base_model", "")
+        if getattr(self.openai_service, "use_fine_tuned", False):
+            model = getattr(self.openai_service, "fine_tuned_model", model)
+        return topic_fingerprint(self._original_data(topic_data), model)
+    
+    def build_request(self, category: str, topic_data: Dict[str, Any]) -> FastDebateRequest:
+        """주제 하나의 FastDebateRequest 생성"""
+        original = self._original_data(topic_data)
+        context = original["context"]
+        return FastDebateRequest(
+            room_id=f"pregenerated_{self.generate_topic_id(category, topic_data['title'])}",
+            title=topic_data["title"],
+            context=context.get("content", ""),
+            context_type=self.detect_context_type(context),
+            pro_npcs=original["pro_philosophers"],
+            con_npcs=original["con_philosophers"],
+            user_ids=[],
+            user_side="neutral",
+            moderator_style=ModeratorStyle(original["moderator_style"])
+        )
+    
+    def build_result(self, category: str, topic_data: Dict[str, Any],
+                     debate_package, generation_time: float) -> Dict[str, Any]:
+        """생성된 패키지를 결과 레코드로 변환 (폴백 패키지는 에러 레코드)"""
+        title = topic_data["title"]
+        topic_id = self.generate_topic_id(category, title)
+        
+        if debate_package.system_version.endswith("_fallback"):
+            return self.build_error(category, topic_data, "fallback package returned")
+        
+        return {
+            "topic_id": topic_id,
+            "category": category,
+            "title": title,
+            "original_data": self._original_data(topic_data),
+            "generated_data": {
+                "stance_statements": {
+                    "pro": debate_package.stance_statements.pro,
+                    "con": debate_package.stance_statements.con
+                },
+                "context_summary": debate_package.context_summary.model_dump() if debate_package.context_summary else None,
+                "opening_message": debate_package.opening_message,
+                "generation_time": generation_time,
+                "system_version": debate_package.system_version
+            },
+            "cache_key": f"topic:{title}:base",
+            "fingerprint": self._fingerprint(topic_data),
+            "generated_at": datetime.utcnow().isoformat()
+        }
+    
+    def build_error(self, category: str, topic_data: Dict[str, Any], error: str) -> Dict[str, Any]:
+        return {
+            "topic_id": self.generate_topic_id(category, topic_data["title"]),
+            "category": category,
+            "title": topic_data["title"],
+            "error": error,
+            "fingerprint": self._fingerprint(topic_data),
+            "generated_at": datetime.utcnow().isoformat()
+        }
+    
     async def generate_single_topic(self, 
                                   category: str, 
                                   topic_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -83,31 +196,16 @@ class DebateDataPregenrator:
         
         title = topic_data["title"]
         context = topic_data.get("context", {})
-        pro_philosophers = topic_data.get("pro_philosophers", [])
-        con_philosophers = topic_data.get("con_philosophers", [])
-        moderator_style = str(topic_data.get("moderator_style", "0"))
-        
-        topic_id = self.generate_topic_id(category, title)
         
         logger.info(f"🔄 Generating data for: {title}")
         logger.info(f"   Category: {category}")
         logger.info(f"   Context: {context.get('type', 'none')} - {len(context.get('content', ''))}")
-        logger.info(f"   PRO: {pro_philosophers}")
-        logger.info(f"   CON: {con_philosophers}")
+        logger.info(f"   PRO: {topic_data.get('pro_philosophers', [])}")
+        logger.info(f"   CON: {topic_data.get('con_philosophers', [])}")
         
         try:
             # FastDebateRequest 생성
-            request = FastDebateRequest(
-                room_id=f"pregenerated_{topic_id}",
-                title=title,
-                context=context.get("content", ""),
-                context_type=self.detect_context_type(context),
-                pro_npcs=pro_philosophers,
-                con_npcs=con_philosophers,
-                user_ids=[],
-                user_side="neutral",
-                moderator_style=ModeratorStyle(moderator_style)
-            )
+            request = self.build_request(category, topic_data)
             
             # 토론 패키지 생성
             start_time = time.time()
@@ -115,29 +213,10 @@ class DebateDataPregenrator:
             generation_time = time.time() - start_time
             
             # 결과 구성
-            result = {
-                "topic_id": topic_id,
-                "category": category,
-                "title": title,
-                "original_data": {
-                    "context": context,
-                    "pro_philosophers": pro_philosophers,
-                    "con_philosophers": con_philosophers,
-                    "moderator_style": moderator_style
-                },
-                "generated_data": {
-                    "stance_statements": {
-                        "pro": debate_package.stance_statements.pro,
-                        "con": debate_package.stance_statements.con
-                    },
-                    "context_summary": debate_package.context_summary.model_dump() if debate_package.context_summary else None,
-                    "opening_message": debate_package.opening_message,
-                    "generation_time": generation_time,
-                    "system_version": debate_package.system_version
-                },
-                "cache_key": f"topic:{title}:base",
-                "generated_at": datetime.utcnow().isoformat()
-            }
+            result = self.build_result(category, topic_data, debate_package, generation_time)
+            if "error" in result:
+                logger.warning(f"⚠️ Fallback package for '{title}', will retry on next run")
+                return result
             
             logger.info(f"✅ Generated successfully in {generation_time:.2f}s")
             logger.info(f"   Stance PRO: {result['generated_data']['stance_statements']['pro'][:50]}...")
@@ -148,109 +227,189 @@ class DebateDataPregenrator:
             
         except Exception as e:
             logger.error(f"❌ Failed to generate data for '{title}': {str(e)}")
-            return {
-                "topic_id": topic_id,
-                "category": category,
-                "title": title,
-                "error": str(e),
-                "generated_at": datetime.utcnow().isoformat()
-            }
+            return self.build_error(category, topic_data, str(e))
     
-    async def generate_all_topics(self, 
-                                target_category: Optional[str] = None) -> Dict[str, Any]:
-        """모든 주제 또는 특정 카테고리 주제들 생성"""
-        
-        # 토론 주제 로드
-        topics_data = self.load_debate_topics()
-        categories = topics_data.get("categories", {})
+    def _pending_topics(self, topics: List[Tuple[str, Dict[str, Any]]],
+                        force: bool) -> List[Tuple[str, Dict[str, Any]]]:
+        """체크포인트에서 이미 끝난 주제를 제외한 목록"""
+        if force:
+            self.store.reset()
+            return topics
         
-        if target_category and target_category not in categories:
-            raise ValueError(f"Category '{target_category}' not found. Available: {list(categories.keys())}")
+        fingerprints = {
+            self.generate_topic_id(category, topic["title"]): self._fingerprint(topic)
+            for category, topic in topics
+        }
+        done = self.store.completed(fingerprints)
+        if done:
+            logger.info(f"♻️ Resuming from checkpoint: {len(done)} topics already generated")
+        return [
+            (category, topic) for category, topic in topics
+            if self.generate_topic_id(category, topic["title"]) not in done
+        ]
+    
+    def compact(self, target_category: Optional[str] = None,
+                run_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        체크포인트를 런타임 캐시 형식으로 변환
         
-        # 생성할 주제들 수집
-        topics_to_generate = []
+        카탈로그에서 빠진 주제는 제외하고, 다른 카테고리의 기존 결과는 유지합니다.
+        """
+        catalog_ids = [
+            self.generate_topic_id(category, topic["title"])
+            for category, topic in self.collect_topics()
+        ]
+        metadata = {"target_category": target_category}
+        metadata.update(run_metadata or {})
+        return self.store.build_lookup(catalog_ids, metadata)
+    
+    async def generate_all_topics(self, 
+                                target_category: Optional[str] = None,
+                                force: bool = False) -> Dict[str, Any]:
+        """모든 주제 또는 특정 카테고리 주제들 생성 (완료되는 대로 체크포인트에 기록)"""
         
-        if target_category:
-            # 특정 카테고리만
-            category_data = categories[target_category]
-            for topic in category_data.get("topics", []):
-                topics_to_generate.append((target_category, topic))
-        else:
-            # 모든 카테고리
-            for category_name, category_data in categories.items():
-                for topic in category_data.get("topics", []):
-                    topics_to_generate.append((category_name, topic))
+        topics_to_generate = self.collect_topics(target_category)
+        pending = self._pending_topics(topics_to_generate, force)
         
-        logger.info(f"🚀 Starting pregeneration for {len(topics_to_generate)} topics")
+        logger.info(f"🚀 Starting pregeneration for {len(pending)}/{len(topics_to_generate)} topics")
         if target_category:
             logger.info(f"   Target category: {target_category}")
-        else:
-            logger.info(f"   Categories: {list(categories.keys())}")
         
         # 병렬 생성 (제한된 동시 실행)
-        semaphore = asyncio.Semaphore(3)  # 최대 3개 동시 실행
+        semaphore = asyncio.Semaphore(self.concurrency)
         
-        async def generate_with_semaphore(category: str, topic_data: Dict[str, Any]):
+        async def generate_and_checkpoint(category: str, topic_data: Dict[str, Any]):
             async with semaphore:
-                return await self.generate_single_topic(category, topic_data)
+                result = await self.generate_single_topic(category, topic_data)
+            self.store.append(result)
+            return result
         
         # 모든 작업 실행
         start_time = time.time()
         results = await asyncio.gather(*[
-            generate_with_semaphore(category, topic_data)
-            for category, topic_data in topics_to_generate
+            generate_and_checkpoint(category, topic_data)
+            for category, topic_data in pending
         ], return_exceptions=True)
         
         total_time = time.time() - start_time
         
-        # 결과 정리
-        successful_results = []
-        failed_results = []
-        
-        for result in results:
-            if isinstance(result, Exception):
-                failed_results.append({"error": str(result)})
-            elif "error" in result:
-                failed_results.append(result)
-            else:
-                successful_results.append(result)
+        generated = sum(1 for result in results if isinstance(result, dict) and is_successful_record(result))
         
         # 최종 데이터 구성
-        output_data = {
-            "metadata": {
-                "generated_at": datetime.utcnow().isoformat(),
-                "total_topics": len(topics_to_generate),
-                "successful": len(successful_results),
-                "failed": len(failed_results),
-                "total_generation_time": total_time,
-                "average_time_per_topic": total_time / len(topics_to_generate) if topics_to_generate else 0,
-                "target_category": target_category,
-                "system_version": "v2_fast_pregenerated"
-            },
-            "topics": {
-                result["topic_id"]: result for result in successful_results
-            },
-            "failed_topics": failed_results
-        }
+        output_data = self.compact(target_category, {
+            "mode": "realtime",
+            "resumed": len(topics_to_generate) - len(pending),
+            "generated_this_run": generated,
+            "total_generation_time": total_time,
+            "average_time_per_topic": total_time / len(pending) if pending else 0
+        })
         
         logger.info(f"🎯 Pregeneration completed!")
         logger.info(f"   Total time: {total_time:.2f}s")
-        logger.info(f"   Average per topic: {total_time/len(topics_to_generate):.2f}s")
-        logger.info(f"   Successful: {len(successful_results)}")
-        logger.info(f"   Failed: {len(failed_results)}")
+        logger.info(f"   Generated this run: {generated}/{len(pending)}")
+        logger.info(f"   Successful: {output_data['metadata']['successful']}")
+        logger.info(f"   Failed: {output_data['metadata']['failed']}")
         
         return output_data
     
+    async def generate_with_batch_api(self,
+                                    target_category: Optional[str] = None,
+                                    force: bool = False,
+                                    poll_interval: float = 30.0) -> Dict[str, Any]:
+        """
+        OpenAI Batch API로 대기 중인 주제를 한 번에 생성 (실시간 호출보다 저렴, 최대 24시간)
+        
+        제출한 배치 ID는 체크포인트 옆 상태 파일에 기록되어, 중단 후 다시 실행하면
+        새로 제출하지 않고 같은 배치를 계속 기다립니다.
+        """
+        
+        topics_to_generate = self.collect_topics(target_category)
+        pending = self._pending_topics(topics_to_generate, force)
+        by_id = {self.generate_topic_id(category, topic["title"]): (category, topic) for category, topic in pending}
+        
+        start_time = time.time()
+        client = self.openai_service.client
+        state = self.store.load_batch_state()
+        
+        if state and set(state.get("topic_ids", [])) - set(by_id):
+            logger.info("Discarding stale batch state (topics changed since submission)")
+            state = None
+        
+        if by_id and not state:
+            lines = [
+                json.dumps({
+                    "custom_id": topic_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self.openai_service.build_chat_completion_params(self.build_request(category, topic))
+                }, ensure_ascii=False)
+                for topic_id, (category, topic) in by_id.items()
+            ]
+            input_file = await client.files.create(
+                file=("pregeneration_batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = await client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            state = {"batch_id": batch.id, "topic_ids": list(by_id), "submitted_at": datetime.utcnow().isoformat()}
+            self.store.save_batch_state(state)
+            logger.info(f"📤 Submitted batch {batch.id} with {len(by_id)} topics")
+        
+        generated = 0
+        if state:
+            logger.info(f"⏳ Waiting for batch {state['batch_id']}")
+            batch = await client.batches.retrieve(state["batch_id"])
+            while batch.status not in self.BATCH_TERMINAL_STATUSES:
+                await asyncio.sleep(poll_interval)
+                batch = await client.batches.retrieve(state["batch_id"])
+            
+            records = []
+            answered = set()
+            if batch.output_file_id:
+                content = await client.files.content(batch.output_file_id)
+                for line in content.text.splitlines():
+                    if not line.strip():
+                        continue
+                    item = json.loads(line)
+                    topic_id = item.get("custom_id")
+                    if topic_id not in by_id:
+                        continue
+                    category, topic = by_id[topic_id]
+                    answered.add(topic_id)
+                    response = item.get("response") or {}
+                    if item.get("error") or response.get("status_code") != 200:
+                        records.append(self.build_error(category, topic, str(item.get("error") or response.get("body"))))
+                        continue
+                    package = self.openai_service.parse_chat_completion(response["body"], self.build_request(category, topic))
+                    records.append(self.build_result(category, topic, package, 0.0))
+            
+            for topic_id in state["topic_ids"]:
+                if topic_id in by_id and topic_id not in answered:
+                    category, topic = by_id[topic_id]
+                    records.append(self.build_error(category, topic, f"batch {batch.status}: no output"))
+            
+            self.store.append_many(records)
+            self.store.clear_batch_state()
+            generated = sum(1 for record in records if is_successful_record(record))
+            logger.info(f"📥 Batch {state['batch_id']} {batch.status}: {generated}/{len(records)} generated")
+        
+        return self.compact(target_category, {
+            "mode": "batch",
+            "resumed": len(topics_to_generate) - len(pending),
+            "generated_this_run": generated,
+            "total_generation_time": time.time() - start_time,
+            "average_time_per_topic": 0
+        })
+    
     def save_results(self, data: Dict[str, Any]) -> None:
         """결과를 JSON 파일로 저장"""
         output_path = Path(self.output_file)
         
-        # 디렉토리 생성
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # JSON 저장
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # JSON 저장 (임시 파일 + 교체)
+        write_json_atomic(output_path, data)
         
         logger.info(f"💾 Results saved to: {output_path.absolute()}")
         logger.info(f"   File size: {output_path.stat().st_size / 1024:.2f} KB")
@@ -268,43 +427,39 @@ class DebateDataPregenrator:
         
         return None
     
-    async def run(self, category: Optional[str] = None, force: bool = False) -> None:
-        """메인 실행 함수"""
-        
-        # 기존 결과 확인
-        if not force:
-            existing_results = self.load_existing_results()
-            if existing_results:
-                logger.info(f"📁 Found existing results file: {self.output_file}")
-                logger.info(f"   Generated topics: {len(existing_results.get('topics', {}))}")
-                logger.info(f"   Generated at: {existing_results.get('metadata', {}).get('generated_at', 'unknown')}")
-                
-                response = input("Do you want to overwrite? (y/N): ")
-                if response.lower() != 'y':
-                    logger.info("Pregeneration cancelled.")
-                    return
+    async def run(self, category: Optional[str] = None, force: bool = False,
+                  use_batch_api: bool = False, compact_only: bool = False) -> None:
+        """메인 실행 함수 (기본은 체크포인트에서 이어서 진행, force면 처음부터)"""
         
         try:
             # 데이터 생성
-            results = await self.generate_all_topics(category)
+            if compact_only:
+                results = self.compact(category)
+            elif use_batch_api:
+                results = await self.generate_with_batch_api(category, force)
+            else:
+                results = await self.generate_all_topics(category, force)
             
             # 결과 저장
             self.save_results(results)
             
             # 요약 출력
+            metadata = results['metadata']
             print("\n" + "="*60)
             print("🎉 PREGENERATION SUMMARY")
             print("="*60)
-            print(f"Total topics processed: {results['metadata']['total_topics']}")
-            print(f"Successful generations: {results['metadata']['successful']}")
-            print(f"Failed generations: {results['metadata']['failed']}")
-            print(f"Total time: {results['metadata']['total_generation_time']:.2f}s")
-            print(f"Average per topic: {results['metadata']['average_time_per_topic']:.2f}s")
+            print(f"Total topics: {metadata['total_topics']}")
+            print(f"Resumed from checkpoint: {metadata.get('resumed', 0)}")
+            print(f"Generated this run: {metadata.get('generated_this_run', 0)}")
+            print(f"Successful generations: {metadata['successful']}")
+            print(f"Failed generations: {metadata['failed']}")
+            print(f"Total time: {metadata.get('total_generation_time', 0):.2f}s")
             print(f"Output file: {Path(self.output_file).absolute()}")
+            print(f"Checkpoint file: {Path(self.checkpoint_file).absolute()}")
             print("="*60)
             
         except KeyboardInterrupt:
-            logger.info("Pregeneration interrupted by user")
+            logger.info("Pregeneration interrupted by user (progress kept in checkpoint)")
         except Exception as e:
             logger.error(f"Pregeneration failed: {str(e)}")
             raise
@@ -326,18 +481,45 @@ def main():
     parser.add_argument(
         "--force", 
         action="store_true",
-        help="Force overwrite existing results"
+        help="Ignore checkpoints and regenerate every topic"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Use the OpenAI Batch API (cheaper, completes within 24h)"
+    )
+    parser.add_argument(
+        "--compact-only",
+        action="store_true",
+        help="Only rewrite the output file from the checkpoint"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        help="Checkpoint JSONL path (default: <output>.checkpoint.jsonl)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=3,
+        help="Concurrent generations in realtime mode (default: 3)"
     )
     
     args = parser.parse_args()
     
     # 사전 생성기 실행
-    pregenrator = DebateDataPregenrator(output_file=args.output)
+    pregenrator = DebateDataPregenrator(
+        output_file=args.output,
+        checkpoint_file=args.checkpoint,
+        concurrency=args.concurrency
+    )
     
     # 비동기 실행
     asyncio.run(pregenrator.run(
         category=args.category,
-        force=args.force
+        force=args.force,
+        use_batch_api=args.batch,
+        compact_only=args.compact_only
     ))
 
 if __name__ == "__main__":
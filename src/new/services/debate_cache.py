@@ -0,0 +1,322 @@
+"""
+Async Debate Package Cache
+
+FastDebateOpeningService용 비동기 캐시 계층과 캐시 워밍 스케줄러
+
+- 모든 Redis 호출은 redis.asyncio로 이벤트 루프를 막지 않습니다.
+- 여러 키 조회/저장은 파이프라인(MGET / SETEX 묶음)으로 왕복 한 번에 처리합니다.
+- 조회할 때마다 조합별 요청 빈도를 기록하고(ZINCRBY), 워밍은 빈도가 높은 조합부터 진행합니다.
+  추적하는 조합 수는 max_tracked로 제한하며, 넘으면 빈도가 낮은 조합을 빈도/조합 키에서 함께 지웁니다.
+- 워밍은 제한된 동시성으로 생성하고, 실패(폴백 패키지 포함)는 지수 백오프로 재시도합니다.
+"""
+
+import os
+import json
+import time
+import random
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Iterable
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "debate_package:"
+FREQUENCY_KEY = "debate_package_stats:frequency"
+COMBINATIONS_KEY = "debate_package_stats:combinations"
+
+
+def create_async_redis_client(url: Optional[str] = None) -> Optional[Any]:
+    """
+    redis.asyncio 클라이언트 생성 (연결은 첫 명령 때 이루어짐)
+
+    Args:
+        url: Redis URL (None이면 REDIS_URL 환경 변수, 없으면 localhost)
+
+    Returns:
+        클라이언트 (redis 패키지가 없으면 None)
+    """
+    try:
+        import redis.asyncio as aioredis
+        return aioredis.from_url(url or os.getenv('REDIS_URL', 'redis://localhost:6379/0'), decode_responses=True)
+    except Exception as e:
+        logger.warning(f"Async Redis client unavailable, caching disabled: {e}")
+        return None
+
+
+class AsyncDebateCache:
+    """토론 패키지 비동기 캐시 (파이프라인 MGET/SETEX + 요청 빈도 추적)"""
+
+    def __init__(self, redis_client: Any, ttl_seconds: int = 24 * 60 * 60, max_tracked: int = 1000):
+        """
+        AsyncDebateCache 초기화
+
+        Args:
+            redis_client: redis.asyncio 호환 클라이언트 (decode_responses=True)
+            ttl_seconds: 캐시 TTL
+            max_tracked: 요청 빈도/조합을 기록할 최대 조합 수 (10% 넘게 초과하면 빈도가 낮은 조합부터 정리)
+        """
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.max_tracked = max_tracked
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0, "trimmed": 0}
+
+    async def get_and_record(self, key: str, combination: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        캐시 조회와 요청 빈도 기록을 한 번의 파이프라인으로 처리
+
+        Args:
+            key: 캐시 키
+            combination: 워밍에 다시 쓸 요청 조합 (title, context, pro_npcs, ...)
+
+        Returns:
+            캐시된 JSON 문자열 (없으면 None)
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.zincrby(FREQUENCY_KEY, 1, key)
+            if combination is not None:
+                pipe.hset(COMBINATIONS_KEY, key, json.dumps(combination, ensure_ascii=False))
+            pipe.zcard(FREQUENCY_KEY)
+            results = await pipe.execute()
+            value = results[0]
+            self.stats["hits" if value else "misses"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Cache retrieval failed: {e}")
+            return None
+
+        # 한 번에 조금씩 정리하지 않도록 max_tracked의 10%를 넘게 초과했을 때 한꺼번에 정리
+        if results[-1] > self.max_tracked + max(1, self.max_tracked // 10):
+            await self.trim_tracked(results[-1])
+        return value
+
+    async def trim_tracked(self, tracked: Optional[int] = None) -> int:
+        """
+        요청 빈도가 낮은 조합을 빈도 ZSET과 조합 해시에서 지워 max_tracked개로 줄임
+
+        Args:
+            tracked: 현재 추적 중인 조합 수 (None이면 ZCARD로 조회)
+
+        Returns:
+            지운 조합 수
+        """
+        try:
+            if tracked is None:
+                tracked = await self.redis.zcard(FREQUENCY_KEY)
+            excess = tracked - self.max_tracked
+            if excess <= 0:
+                return 0
+            dropped = await self.redis.zrange(FREQUENCY_KEY, 0, excess - 1)
+            if not dropped:
+                return 0
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.zrem(FREQUENCY_KEY, *dropped)
+            pipe.hdel(COMBINATIONS_KEY, *dropped)
+            await pipe.execute()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Failed to trim request frequency: {e}")
+            return 0
+        self.stats["trimmed"] += len(dropped)
+        return len(dropped)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """여러 키를 MGET 한 번으로 조회"""
+        if not keys:
+            return []
+        try:
+            return await self.redis.mget(keys)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Cache MGET failed: {e}")
+            return [None] * len(keys)
+
+    async def set_many(self, items: Dict[str, str], ttl_seconds: Optional[int] = None) -> bool:
+        """여러 키를 SETEX 파이프라인 한 번으로 저장"""
+        if not items:
+            return True
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, ttl_seconds or self.ttl_seconds, value)
+            await pipe.execute()
+            self.stats["writes"] += len(items)
+            return True
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Cache pipeline save failed: {e}")
+            return False
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> bool:
+        return await self.set_many({key: value}, ttl_seconds)
+
+    async def most_requested(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        요청 빈도가 높은 조합 목록
+
+        Returns:
+            [{"key", "count", "combination"}] (빈도 내림차순)
+        """
+        try:
+            ranked = await self.redis.zrevrange(FREQUENCY_KEY, 0, limit - 1, withscores=True)
+            if not ranked:
+                return []
+            keys = [key for key, _ in ranked]
+            combinations = await self.redis.hmget(COMBINATIONS_KEY, keys)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Failed to read request frequency: {e}")
+            return []
+        return [
+            {"key": key, "count": int(score), "combination": json.loads(combination)}
+            for (key, score), combination in zip(ranked, combinations)
+            if combination
+        ]
+
+    async def request_counts(self, keys: Iterable[str]) -> Dict[str, int]:
+        """키별 관측된 요청 횟수 (파이프라인 ZSCORE)"""
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.zscore(FREQUENCY_KEY, key)
+            scores = await pipe.execute()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Failed to read request counts: {e}")
+            return {}
+        return {key: int(score or 0) for key, score in zip(keys, scores)}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
+
+
+class CacheWarmer:
+    """
+    캐시 워밍 스케줄러 (빈도 우선순위 + 제한된 동시성 + 재시도/백오프 + 묶음 저장)
+    """
+
+    def __init__(self, cache: AsyncDebateCache,
+                 generate: Callable[[Any], Awaitable[Any]],
+                 key_for: Callable[[Any], str],
+                 serialize: Callable[[Any], str],
+                 is_valid: Callable[[Any], bool] = lambda result: result is not None,
+                 concurrency: int = 8,
+                 max_retries: int = 3,
+                 base_backoff_seconds: float = 1.0,
+                 max_backoff_seconds: float = 30.0,
+                 write_batch_size: int = 20,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        """
+        CacheWarmer 초기화
+
+        Args:
+            cache: 비동기 캐시
+            generate: 요청 하나의 결과를 생성하는 코루틴 함수
+            key_for: 요청의 캐시 키
+            serialize: 결과를 캐시 문자열로 변환
+            is_valid: 캐시에 저장할 만한 결과인지 (폴백 결과는 재시도)
+            concurrency: 동시에 진행할 생성 수
+            max_retries: 요청별 최대 재시도 횟수
+            base_backoff_seconds: 첫 재시도 대기 시간 (이후 두 배씩, 지터 포함)
+            max_backoff_seconds: 재시도 대기 상한
+            write_batch_size: 이만큼 모이면 SETEX 파이프라인으로 저장
+            sleep: 대기 함수 (테스트용)
+        """
+        self.cache = cache
+        self.generate = generate
+        self.key_for = key_for
+        self.serialize = serialize
+        self.is_valid = is_valid
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.write_batch_size = max(1, write_batch_size)
+        self._sleep = sleep
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff_seconds, self.base_backoff_seconds * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    async def warm(self, requests: List[Any]) -> Dict[str, Any]:
+        """
+        요청 목록 워밍
+
+        이미 캐시된 조합은 MGET 한 번으로 걸러내고, 나머지는 관측된 요청 빈도가 높은 순으로
+        제한된 동시성으로 생성합니다.
+
+        Args:
+            requests: 워밍할 요청 목록
+
+        Returns:
+            워밍 결과 요약
+        """
+        start = time.time()
+        unique: Dict[str, Any] = {}
+        for request in requests:
+            unique.setdefault(self.key_for(request), request)
+        keys = list(unique)
+
+        cached = await self.cache.get_many(keys)
+        pending = [key for key, value in zip(keys, cached) if not value]
+
+        counts = await self.cache.request_counts(pending)
+        order = {key: index for index, key in enumerate(keys)}
+        pending.sort(key=lambda key: (-counts.get(key, 0), order[key]))
+
+        report = {
+            "requested": len(requests),
+            "unique": len(keys),
+            "already_cached": len(keys) - len(pending),
+            "generated": 0,
+            "failed": 0,
+            "retries": 0,
+            "failed_keys": []
+        }
+        semaphore = asyncio.Semaphore(self.concurrency)
+        buffer: Dict[str, str] = {}
+        buffer_lock = asyncio.Lock()
+
+        async def flush() -> None:
+            async with buffer_lock:
+                items = dict(buffer)
+                buffer.clear()
+            await self.cache.set_many(items)
+
+        async def warm_one(key: str) -> None:
+            request = unique[key]
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    report["retries"] += 1
+                    await self._sleep(self._backoff(attempt - 1))
+                async with semaphore:
+                    try:
+                        result = await self.generate(request)
+                    except Exception as e:
+                        logger.warning(f"Cache warming attempt {attempt + 1} failed for {key}: {e}")
+                        continue
+                if not self.is_valid(result):
+                    logger.warning(f"Cache warming attempt {attempt + 1} returned fallback for {key}")
+                    continue
+                async with buffer_lock:
+                    buffer[key] = self.serialize(result)
+                    full = len(buffer) >= self.write_batch_size
+                if full:
+                    await flush()
+                report["generated"] += 1
+                return
+            report["failed"] += 1
+            report["failed_keys"].append(key)
+
+        await asyncio.gather(*(warm_one(key) for key in pending))
+        await flush()
+
+        report["elapsed_seconds"] = round(time.time() - start, 3)
+        logger.info(f"✅ Cache warming completed: {report['generated']} generated, "
+                    f"{report['already_cached']} already cached, {report['failed']} failed "
+                    f"in {report['elapsed_seconds']:.1f}s")
+        return report
@@ -9,7 +9,6 @@ import asyncio
 import time
 import logging
 from typing import Dict, Any, Optional
-import redis
 import json
 import hashlib
 
@@ -18,26 +17,37 @@ from ..models.debate_models import (
     ModeratorStyle, ContextType, PerformanceMetrics
 )
 from .openai_service import OpenAIDebateService
+from .debate_cache import AsyncDebateCache, CacheWarmer, create_async_redis_client
 
 logger = logging.getLogger(__name__)
 
 class FastDebateOpeningService:
     """🚀 초고속 토론 오프닝 생성 서비스"""
     
-    def __init__(self, use_cache: bool = True, use_fine_tuned: bool = False):
-        self.openai_service = OpenAIDebateService(use_fine_tuned=use_fine_tuned)
+    def __init__(self, use_cache: bool = True, use_fine_tuned: bool = False,
+                 redis_client: Any = None, openai_service: Optional[OpenAIDebateService] = None,
+                 warm_concurrency: int = 8):
+        """
+        Args:
+            use_cache: Redis 캐시 사용 여부
+            use_fine_tuned: 파인튜닝 모델 사용 여부
+            redis_client: redis.asyncio 호환 클라이언트 (None이면 REDIS_URL로 생성, 테스트용 주입)
+            openai_service: 토론 패키지 생성 서비스 (테스트용 주입)
+            warm_concurrency: 캐시 워밍 동시 생성 수
+        """
+        self.openai_service = openai_service or OpenAIDebateService(use_fine_tuned=use_fine_tuned)
         self.use_cache = use_cache
+        self.cache_ttl = 24 * 60 * 60  # 24시간
+        self.warm_concurrency = warm_concurrency
+        self.last_warm_report: Optional[Dict[str, Any]] = None
+        self._background_tasks = set()
         
-        # Redis 캐시 (선택적)
-        try:
-            if use_cache:
-                self.redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
-                self.cache_ttl = 24 * 60 * 60  # 24시간
-            else:
-                self.redis_client = None
-        except Exception as e:
-            logger.warning(f"Redis connection failed, caching disabled: {e}")
+        # Redis 캐시 (선택적, 비동기 클라이언트 - 이벤트 루프를 막지 않음)
+        if use_cache:
+            self.redis_client = redis_client or create_async_redis_client()
+        else:
             self.redis_client = None
+        self.cache = AsyncDebateCache(self.redis_client, self.cache_ttl) if self.redis_client else None
     
     async def create_fast_debate_room(self, 
                                     room_id: str,
@@ -89,8 +99,10 @@ class FastDebateOpeningService:
         api_time = time.time() - api_start
         
         # 3단계: 캐시에 저장 (백그라운드)
-        if self.redis_client:
-            asyncio.create_task(self._save_to_cache(request, debate_package))
+        if self.cache:
+            task = asyncio.create_task(self._save_to_cache(request, debate_package))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
         
         total_time = time.time() - total_start
         
@@ -113,14 +125,14 @@ class FastDebateOpeningService:
         )
     
     async def _get_from_cache(self, request: FastDebateRequest) -> Optional[DebatePackage]:
-        """캐시에서 토론 패키지 조회"""
+        """캐시에서 토론 패키지 조회 (요청 빈도도 같은 파이프라인으로 기록)"""
         
-        if not self.redis_client:
+        if not self.cache:
             return None
         
         try:
             cache_key = self._generate_cache_key(request)
-            cached_data = self.redis_client.get(cache_key)
+            cached_data = await self.cache.get_and_record(cache_key, self._warm_combination(request))
             
             if cached_data:
                 package_data = json.loads(cached_data)
@@ -132,25 +144,30 @@ class FastDebateOpeningService:
         return None
     
     async def _save_to_cache(self, request: FastDebateRequest, package: DebatePackage):
-        """캐시에 토론 패키지 저장 (백그라운드)"""
+        """캐시에 토론 패키지 저장 (백그라운드, 폴백 패키지는 저장하지 않음)"""
         
-        if not self.redis_client:
+        if not self.cache or not self._is_cacheable(package):
             return
         
-        try:
-            cache_key = self._generate_cache_key(request)
-            package_json = package.json()
-            
-            self.redis_client.setex(
-                cache_key, 
-                self.cache_ttl, 
-                package_json
-            )
-            
+        cache_key = self._generate_cache_key(request)
+        if await self.cache.set(cache_key, package.json()):
             logger.info(f"💾 Cached debate package: {cache_key}")
-            
-        except Exception as e:
-            logger.warning(f"Cache save failed: {e}")
+    
+    @staticmethod
+    def _is_cacheable(package: Optional[DebatePackage]) -> bool:
+        """API 실패 시 만들어진 폴백 패키지는 캐시하지 않음"""
+        return package is not None and not package.system_version.endswith("_fallback")
+    
+    @staticmethod
+    def _warm_combination(request: FastDebateRequest) -> Dict[str, Any]:
+        """캐시 워밍에 다시 사용할 요청 조합 (캐시 키에 들어가는 필드만)"""
+        return {
+            "title": request.title,
+            "context": request.context,
+            "pro_npcs": request.pro_npcs,
+            "con_npcs": request.con_npcs,
+            "moderator_style": request.moderator_style.value
+        }
     
     def _generate_cache_key(self, request: FastDebateRequest) -> str:
         """캐시 키 생성"""
@@ -215,26 +232,53 @@ class FastDebateOpeningService:
             }
         }
 
-    async def warm_popular_cache(self, popular_combinations: list):
-        """인기 조합들을 미리 캐시에 저장"""
+    async def warm_popular_cache(self, popular_combinations: Optional[list] = None, limit: int = 100,
+                                 concurrency: Optional[int] = None, max_retries: int = 3) -> Dict[str, Any]:
+        """
+        인기 조합들을 미리 캐시에 저장
         
-        logger.info(f"🔥 Warming cache for {len(popular_combinations)} popular combinations")
+        제한된 동시성으로 실제 병렬 생성하고, 실패/폴백은 지수 백오프로 재시도하며,
+        결과는 SETEX 파이프라인으로 묶어서 저장합니다.
+        
+        Args:
+            popular_combinations: 워밍할 조합 목록 (None이면 관측된 요청 빈도 상위 조합)
+            limit: popular_combinations가 없을 때 가져올 상위 조합 수
+            concurrency: 동시 생성 수 (None이면 warm_concurrency)
+            max_retries: 조합별 최대 재시도 횟수
+        
+        Returns:
+            워밍 결과 요약
+        """
+        if not self.cache:
+            logger.warning("Cache disabled - skipping cache warming")
+            return {"requested": 0, "generated": 0, "failed": 0, "cache_enabled": False}
         
-        tasks = []
-        for combo in popular_combinations:
-            request = FastDebateRequest(**combo)
-            task = self.openai_service.generate_complete_debate_package(request)
-            tasks.append((request, task))
+        if popular_combinations is None:
+            popular_combinations = [entry["combination"] for entry in await self.cache.most_requested(limit)]
         
-        # 병렬 처리
-        for request, task in tasks:
+        logger.info(f"🔥 Warming cache for {len(popular_combinations)} popular combinations")
+        
+        requests = []
+        for index, combo in enumerate(popular_combinations):
+            combo = dict(combo)
+            combo.setdefault("room_id", f"warm_{index}")
+            combo.setdefault("context_type", self._detect_context_type(combo.get("context", "")))
             try:
-                package = await task
-                await self._save_to_cache(request, package)
+                requests.append(FastDebateRequest(**combo))
             except Exception as e:
-                logger.error(f"Failed to warm cache for {request.title}: {e}")
+                logger.error(f"Invalid warm combination {combo.get('title')}: {e}")
         
-        logger.info("✅ Cache warming completed")
+        warmer = CacheWarmer(
+            cache=self.cache,
+            generate=self.openai_service.generate_complete_debate_package,
+            key_for=self._generate_cache_key,
+            serialize=lambda package: package.json(),
+            is_valid=self._is_cacheable,
+            concurrency=concurrency or self.warm_concurrency,
+            max_retries=max_retries
+        )
+        self.last_warm_report = await warmer.warm(requests)
+        return self.last_warm_report
 
     def get_performance_summary(self) -> Dict[str, Any]:
         """성능 요약 반환"""
@@ -243,11 +287,23 @@ class FastDebateOpeningService:
         return {
             "system_version": "v2_fast",
             "target_time": "3 seconds",
-            "cache_enabled": self.redis_client is not None,
+            "cache_enabled": self.cache is not None,
+            "cache_stats": self.cache.get_stats() if self.cache else {},
+            "last_warm_report": self.last_warm_report,
             "fine_tuned_model": self.openai_service.use_fine_tuned
         }
 
 
+_shared_service: Optional[FastDebateOpeningService] = None
+
+def get_fast_opening_service() -> FastDebateOpeningService:
+    """프로세스 공유 서비스 (Redis 연결 풀과 OpenAI 클라이언트를 요청마다 새로 만들지 않음)"""
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = FastDebateOpeningService(use_cache=True, use_fine_tuned=False)
+    return _shared_service
+
+
 # 기존 chat.py와의 통합을 위한 헬퍼 함수들
 async def create_fast_debate_compatible(room_id: str, 
                                       title: str,
@@ -259,7 +315,7 @@ async def create_fast_debate_compatible(room_id: str,
                                       moderator_style: str = "0") -> Dict[str, Any]:
     """🔥 기존 chat.py에서 직접 호출할 수 있는 함수"""
     
-    service = FastDebateOpeningService(use_cache=True, use_fine_tuned=False)
+    service = get_fast_opening_service()
     
     response = await service.create_fast_debate_room(
         room_id=room_id,
@@ -44,13 +44,9 @@ class OpenAIDebateService:
             "4": {"name": "Miss Hana", "personality": "bright, educational, cheerful"}
         }
     
-    async def generate_complete_debate_package(self, request: FastDebateRequest) -> DebatePackage:
-        """🚀 단일 API 호출로 완전한 토론 패키지 생성"""
-        
-        start_time = time.time()
-        
-        # Function Calling을 위한 도구 정의
-        tools = [
+    def _get_debate_package_tools(self) -> List[Dict[str, Any]]:
+        """Function Calling을 위한 도구 정의"""
+        return [
             {
                 "type": "function",
                 "function": {
@@ -84,6 +80,13 @@ class OpenAIDebateService:
                 }
             }
         ]
+    
+    def build_chat_completion_params(self, request: FastDebateRequest) -> Dict[str, Any]:
+        """
+        토론 패키지 생성용 chat.completions 요청 본문 구성
+        
+        실시간 호출과 Batch API 입력 파일(JSONL의 body)이 같은 본문을 사용합니다.
+        """
         
         # 모더레이터 스타일 정보 가져오기
         moderator_info = self.moderator_styles.get(request.moderator_style.value, self.moderator_styles["0"])
@@ -97,20 +100,27 @@ class OpenAIDebateService:
         # 사용자 프롬프트 구성
         user_prompt = self._build_user_prompt(request)
         
+        return {
+            "model": self.fine_tuned_model if self.use_fine_tuned else self.base_model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "tools": self._get_debate_package_tools(),
+            "tool_choice": {"type": "function", "function": {"name": "create_complete_debate_package"}},
+            "max_tokens": 4000,
+            "temperature": 0.7
+        }
+    
+    async def generate_complete_debate_package(self, request: FastDebateRequest) -> DebatePackage:
+        """🚀 단일 API 호출로 완전한 토론 패키지 생성"""
+        
+        start_time = time.time()
+        
         try:
             # 🔥 단일 API 호출로 모든 것 생성
-            model_to_use = self.fine_tuned_model if self.use_fine_tuned else self.base_model
-            
             response = await self.client.chat.completions.create(
-                model=model_to_use,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                tools=tools,
-                tool_choice={"type": "function", "function": {"name": "create_complete_debate_package"}},
-                max_tokens=4000,
-                temperature=0.7
+                **self.build_chat_completion_params(request)
             )
             
             api_time = time.time() - start_time
@@ -126,6 +136,22 @@ class OpenAIDebateService:
             # 폴백: 기본 패키지 반환
             return self._create_fallback_package(request, time.time() - start_time)
     
+    def parse_chat_completion(self, response_body: Dict[str, Any], request: FastDebateRequest) -> DebatePackage:
+        """
+        Batch API 출력 한 줄의 응답 본문(dict)을 토론 패키지로 변환
+        
+        Args:
+            response_body: chat.completion 응답 JSON
+            request: 원래 요청 (파싱 실패 시 폴백 패키지용)
+        """
+        try:
+            from openai.types.chat import ChatCompletion
+            response = ChatCompletion.model_validate(response_body)
+            return self._parse_function_call_response(response, 0.0)
+        except Exception as e:
+            logger.error(f"❌ Error parsing batch response: {str(e)}")
+            return self._create_fallback_package(request, 0.0)
+    
     def _get_base_system_prompt(self, moderator_info: Dict[str, str]) -> str:
         """기본 모델용 시스템 프롬프트"""
         return f"""You are {moderator_info['name']}, a debate moderator with a {moderator_info['personality']} style.
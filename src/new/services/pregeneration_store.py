@@ -0,0 +1,206 @@
+"""
+Pregeneration Checkpoint Store
+
+토론 기본 데이터 사전 생성 결과를 주제 하나가 끝날 때마다 append-only JSONL에 기록하고,
+다음 실행에서 topic_id + 입력 fingerprint 기준으로 이미 끝난 주제를 건너뛸 수 있게 합니다.
+
+- 한 줄 = 주제 하나의 결과 레코드 (같은 topic_id는 마지막 줄이 유효)
+- 중간에 죽어서 잘린 마지막 줄은 무시하고 이어서 진행
+- compact()로 런타임 캐시가 읽는 pregenerated_debates.json 형식
+  ({"metadata", "topics", "failed_topics"})을 원자적으로 다시 씁니다.
+- Batch API 모드의 진행 중인 배치 ID는 별도 상태 파일에 기록하여 재시작 시 다시 제출하지 않습니다.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def topic_fingerprint(original_data: Dict[str, Any], model: str = "") -> str:
+    """
+    주제 입력(컨텍스트, 철학자, 모더레이터 스타일)과 모델의 fingerprint
+
+    입력이 바뀐 주제는 같은 topic_id라도 다시 생성합니다.
+    """
+    content = json.dumps({"input": original_data, "model": model}, sort_keys=True, ensure_ascii=False)
+    return hashlib.md5(content.encode()).hexdigest()[:16]
+
+
+def is_successful_record(record: Dict[str, Any]) -> bool:
+    """에러 없이 생성되었고 폴백 패키지가 아닌 레코드인지"""
+    if "error" in record:
+        return False
+    version = record.get("generated_data", {}).get("system_version", "")
+    return not version.endswith("_fallback")
+
+
+class PregenerationCheckpointStore:
+    """사전 생성 결과 append-only JSONL 저장소"""
+
+    def __init__(self, path: str):
+        """
+        PregenerationCheckpointStore 초기화
+
+        Args:
+            path: 체크포인트 JSONL 파일 경로
+        """
+        self.path = Path(path)
+        self.batch_state_path = self.path.with_name(self.path.name + ".batch.json")
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        체크포인트 로드
+
+        Returns:
+            topic_id -> 마지막 레코드
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        if not self.path.exists():
+            return records
+
+        skipped = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    skipped += 1
+                    continue
+                if "topic_id" in record:
+                    records[record["topic_id"]] = record
+
+        if skipped:
+            logger.warning(f"Skipped {skipped} unreadable checkpoint line(s) in {self.path}")
+        return records
+
+    def completed(self, fingerprints: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        다시 생성하지 않아도 되는 레코드
+
+        Args:
+            fingerprints: topic_id -> 현재 입력 fingerprint
+
+        Returns:
+            topic_id -> 성공 레코드 (fingerprint가 현재 입력과 같은 것만)
+        """
+        return {
+            topic_id: record
+            for topic_id, record in self.load().items()
+            if topic_id in fingerprints
+            and is_successful_record(record)
+            and record.get("fingerprint") == fingerprints[topic_id]
+        }
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """레코드 한 줄 추가 (flush + fsync로 크래시에도 보존)"""
+        self.append_many([record])
+
+    def append_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        lines = [json.dumps(record, ensure_ascii=False) + "\n" for record in records]
+        if not lines:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._ends_mid_line():
+            # 크래시로 잘린 줄 뒤에 이어 붙지 않도록 줄을 끊음 (잘린 줄은 load에서 무시)
+            lines.insert(0, "\n")
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _ends_mid_line(self) -> bool:
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return False
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def reset(self) -> None:
+        """체크포인트와 배치 상태 삭제 (--force)"""
+        for path in (self.path, self.batch_state_path):
+            if path.exists():
+                path.unlink()
+
+    def build_lookup(self, topic_ids: Optional[Iterable[str]] = None,
+                     metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        런타임 캐시 조회 형식으로 변환
+
+        Args:
+            topic_ids: 포함할 주제 ID (None이면 전체, 카탈로그에서 빠진 주제 정리용)
+            metadata: 메타데이터에 덧붙일 값
+
+        Returns:
+            {"metadata", "topics", "failed_topics"}
+        """
+        records = self.load()
+        if topic_ids is not None:
+            wanted = set(topic_ids)
+            records = {topic_id: record for topic_id, record in records.items() if topic_id in wanted}
+
+        topics = {topic_id: record for topic_id, record in records.items() if is_successful_record(record)}
+        failed = [record for topic_id, record in records.items() if topic_id not in topics]
+
+        lookup_metadata = {
+            "generated_at": datetime.utcnow().isoformat(),
+            "total_topics": len(records),
+            "successful": len(topics),
+            "failed": len(failed),
+            "system_version": "v2_fast_pregenerated"
+        }
+        lookup_metadata.update(metadata or {})
+        return {"metadata": lookup_metadata, "topics": topics, "failed_topics": failed}
+
+    def compact(self, output_file: str, topic_ids: Optional[Iterable[str]] = None,
+                metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        조회 형식 JSON을 임시 파일에 쓰고 교체 (런타임이 반쯤 쓰인 파일을 읽지 않도록)
+
+        Returns:
+            기록한 데이터
+        """
+        data = self.build_lookup(topic_ids, metadata)
+        write_json_atomic(output_file, data)
+        return data
+
+    # ------------------------------------------------------------------
+    # Batch API 상태
+    # ------------------------------------------------------------------
+
+    def load_batch_state(self) -> Optional[Dict[str, Any]]:
+        if not self.batch_state_path.exists():
+            return None
+        try:
+            with open(self.batch_state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load batch state: {e}")
+            return None
+
+    def save_batch_state(self, state: Dict[str, Any]) -> None:
+        write_json_atomic(self.batch_state_path, state)
+
+    def clear_batch_state(self) -> None:
+        if self.batch_state_path.exists():
+            self.batch_state_path.unlink()
+
+
+def write_json_atomic(path, data: Dict[str, Any]) -> None:
+    """JSON을 같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 교체"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
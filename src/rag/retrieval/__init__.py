@@ -8,6 +8,15 @@ Contains components for retrieval-augmented generation including:
 - SourceLoader: Document loading and processing
 """
 
-from .rag_manager import RAGManager
+from .chroma_pool import ChromaHandlePool, get_chroma_pool
 
-__all__ = ["RAGManager"] 
\ No newline at end of file
+__all__ = ["RAGManager", "ChromaHandlePool", "get_chroma_pool"]
+
+
+def __getattr__(name):
+    # RAGManager는 sentence-transformers(torch)를 불러오므로 실제로 사용할 때 임포트
+    # (chroma_pool만 필요한 LLMManager가 무거운 임포트를 떠안지 않도록)
+    if name == "RAGManager":
+        from .rag_manager import RAGManager
+        return RAGManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Chroma Handle Pool Module
+
+프로세스 전역에서 ChromaDB PersistentClient, 임베딩 함수, 컬렉션 핸들을 공유하는 풀입니다.
+
+- PersistentClient는 경로(절대 경로 기준)당 한 번만 엽니다.
+- 임베딩 함수(OpenAI / SentenceTransformer)는 (종류, 모델, 키)별로 한 번만 만듭니다.
+- 컬렉션 핸들은 (경로, 컬렉션, 임베딩 함수 키)별로 캐시하므로
+  검색 한 번의 비용은 쿼리 자체만 남습니다.
+- 컬렉션을 삭제/재생성하는 쪽(ContextManager 등)은 invalidate()로 캐시를 비웁니다.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Callable, Hashable, Optional, Tuple
+
+import chromadb
+from chromadb.utils import embedding_functions
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_path(path: str) -> str:
+    return os.path.abspath(os.path.expanduser(path))
+
+
+class ChromaHandlePool:
+    """
+    PersistentClient / 임베딩 함수 / 컬렉션 핸들 공유 풀
+    """
+
+    def __init__(self, client_factory: Callable[[str], Any] = None):
+        """
+        ChromaHandlePool 초기화
+
+        Args:
+            client_factory: 경로를 받아 클라이언트를 만드는 함수 (기본: chromadb.PersistentClient, 테스트용)
+        """
+        self._client_factory = client_factory or (lambda path: chromadb.PersistentClient(path=path))
+        self._clients: Dict[str, Any] = {}
+        self._embedding_functions: Dict[Hashable, Any] = {}
+        self._collections: Dict[Tuple[str, str, Hashable], Any] = {}
+        self._lock = threading.RLock()
+        self.stats = {
+            "client_opens": 0,
+            "collection_hits": 0,
+            "collection_misses": 0,
+            "embedding_function_creates": 0
+        }
+
+    # ------------------------------------------------------------------
+    # 클라이언트 / 임베딩 함수
+    # ------------------------------------------------------------------
+
+    def get_client(self, path: str) -> Any:
+        """경로별 PersistentClient (처음 요청할 때 한 번만 생성)"""
+        key = _normalize_path(path)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._client_factory(key)
+                self._clients[key] = client
+                self.stats["client_opens"] += 1
+                logger.info(f"Opened Chroma client for {key}")
+            return client
+
+    def get_embedding_function(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """키별 임베딩 함수 (처음 요청할 때 factory로 한 번만 생성)"""
+        with self._lock:
+            function = self._embedding_functions.get(key)
+            if function is None:
+                function = factory()
+                self._embedding_functions[key] = function
+                self.stats["embedding_function_creates"] += 1
+            return function
+
+    def openai_embedding_function(self, api_key: Optional[str], model_name: str = "text-embedding-3-small") -> Tuple[Hashable, Any]:
+        """
+        공유 OpenAI 임베딩 함수
+
+        Returns:
+            (임베딩 함수 키, 임베딩 함수)
+        """
+        key_hash = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:12]
+        key = ("openai", model_name, key_hash)
+        function = self.get_embedding_function(key, lambda: embedding_functions.OpenAIEmbeddingFunction(
+            api_key=api_key,
+            model_name=model_name
+        ))
+        return key, function
+
+    def sentence_transformer_embedding_function(self, model_name: str) -> Tuple[Hashable, Any]:
+        """
+        공유 SentenceTransformer 임베딩 함수
+
+        Returns:
+            (임베딩 함수 키, 임베딩 함수)
+        """
+        key = ("sentence_transformer", model_name)
+        function = self.get_embedding_function(key, lambda: embedding_functions.SentenceTransformerEmbeddingFunction(
+            model_name=model_name
+        ))
+        return key, function
+
+    # ------------------------------------------------------------------
+    # 컬렉션
+    # ------------------------------------------------------------------
+
+    def get_collection(self, path: str, collection_name: str,
+                       embedding_function: Any = None, embedding_key: Hashable = None) -> Any:
+        """
+        캐시된 컬렉션 핸들 반환 (없으면 client.get_collection으로 열어서 캐시)
+
+        Args:
+            path: 벡터 DB 경로
+            collection_name: 컬렉션 이름
+            embedding_function: 컬렉션에 연결할 임베딩 함수
+            embedding_key: 임베딩 함수 키 (같은 컬렉션이라도 임베딩 함수가 다르면 별도 핸들)
+
+        Returns:
+            컬렉션 핸들 (컬렉션이 없으면 chromadb 예외 전파)
+        """
+        key = (_normalize_path(path), collection_name, embedding_key)
+        with self._lock:
+            collection = self._collections.get(key)
+            if collection is not None:
+                self.stats["collection_hits"] += 1
+                return collection
+
+        client = self.get_client(path)
+        if embedding_function is not None:
+            collection = client.get_collection(name=collection_name, embedding_function=embedding_function)
+        else:
+            collection = client.get_collection(name=collection_name)
+
+        with self._lock:
+            self.stats["collection_misses"] += 1
+            return self._collections.setdefault(key, collection)
+
+    def invalidate(self, path: str, collection_name: Optional[str] = None) -> None:
+        """경로(또는 특정 컬렉션)의 캐시된 컬렉션 핸들 제거 (삭제/재생성 후 호출)"""
+        normalized = _normalize_path(path)
+        with self._lock:
+            for key in list(self._collections):
+                if key[0] == normalized and (collection_name is None or key[1] == collection_name):
+                    del self._collections[key]
+
+    def warm(self, paths: Dict[str, str], collections: Dict[str, str],
+             embedding_function: Any = None, embedding_key: Hashable = None) -> Dict[str, str]:
+        """
+        여러 컬렉션 핸들을 미리 열기 (서버 시작 시 첫 검색 지연 제거)
+
+        Args:
+            paths: {이름: 벡터 DB 경로}
+            collections: {이름: 컬렉션 이름}
+            embedding_function: 컬렉션에 연결할 임베딩 함수
+            embedding_key: 임베딩 함수 키
+
+        Returns:
+            {이름: "ok" | "missing_path" | "error: ..."}
+        """
+        results = {}
+        for name, path in paths.items():
+            if not os.path.exists(path):
+                results[name] = "missing_path"
+                continue
+            try:
+                self.get_collection(path, collections.get(name, "langchain"), embedding_function, embedding_key)
+                results[name] = "ok"
+            except Exception as e:
+                results[name] = f"error: {str(e)}"
+                logger.warning(f"Failed to warm Chroma collection for {name}: {str(e)}")
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """열린 핸들 수와 적중 통계"""
+        with self._lock:
+            return {
+                **self.stats,
+                "open_clients": len(self._clients),
+                "open_collections": len(self._collections),
+                "embedding_functions": len(self._embedding_functions),
+                "client_paths": sorted(self._clients)
+            }
+
+
+_pool: Optional[ChromaHandlePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_chroma_pool() -> ChromaHandlePool:
+    """프로세스 전역 Chroma 핸들 풀"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ChromaHandlePool()
+    return _pool
@@ -27,6 +27,8 @@ import logging
 from pathlib import Path
 import hashlib
 
+from .chroma_pool import get_chroma_pool
+
 # NLTK 데이터 다운로드
 try:
     nltk.data.find('tokenizers/punkt')
@@ -74,16 +76,16 @@ class ContextManager:
         # 경로가 없으면 생성
         os.makedirs(db_path, exist_ok=True)
         
-        # ChromaDB 클라이언트 초기화
-        self.client = chromadb.PersistentClient(path=db_path)
-        
-        # 임베딩 함수 초기화
-        self.embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name=embedding_model
-        )
+        # ChromaDB 클라이언트 / 임베딩 함수 / 임베딩 모델은 프로세스 전역 풀에서 공유
+        self.pool = get_chroma_pool()
+        self.client = self.pool.get_client(db_path)
+        self.embedding_key, self.embedding_function = self.pool.sentence_transformer_embedding_function(embedding_model)
         
         # 임베딩 모델 로드 (직접 토큰 카운팅용)
-        self.embedding_model = SentenceTransformer(embedding_model)
+        self.embedding_model = self.pool.get_embedding_function(
+            ("sentence_transformer_model", embedding_model),
+            lambda: SentenceTransformer(embedding_model)
+        )
         
         # 토큰 스플리터 초기화
         self.token_splitter = SentenceTransformersTokenTextSplitter(
@@ -319,12 +321,13 @@ class ContextManager:
         # 컬렉션 이름 생성
         collection_name = f"{source_type}_{hashlib.md5(source_id.encode()).hexdigest()[:8]}"
         
-        # 기존 컬렉션이 있으면 삭제
+        # 기존 컬렉션이 있으면 삭제 (풀에 캐시된 이전 핸들도 제거)
         try:
             self.client.delete_collection(collection_name)
             logger.info(f"기존 컬렉션 삭제: {collection_name}")
         except:
             pass
+        self.pool.invalidate(self.db_path, collection_name)
         
         # 컬렉션 생성
         collection = self.client.create_collection(
@@ -462,9 +465,8 @@ class ContextManager:
             검색 결과 목록
         """
         try:
-            collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function
+            collection = self.pool.get_collection(
+                self.db_path, collection_name, self.embedding_function, self.embedding_key
             )
             
             results = collection.query(
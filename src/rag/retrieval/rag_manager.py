@@ -18,6 +18,8 @@ import numpy as np
 from sentence_transformers import SentenceTransformer, util
 import logging
 
+from .chroma_pool import get_chroma_pool
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -44,19 +46,26 @@ class RAGManager:
         self.db_path = db_path
         self.embedding_model_name = embedding_model
         
-        # ChromaDB 클라이언트 초기화
-        self.client = chromadb.PersistentClient(path=db_path)
-        
-        # 임베딩 함수 초기화
-        self.embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name=embedding_model
-        )
+        # ChromaDB 클라이언트 / 임베딩 함수 / 임베딩 모델은 프로세스 전역 풀에서 공유
+        # (같은 경로를 쓰는 여러 에이전트의 검색기가 각자 클라이언트를 열지 않도록)
+        self.pool = get_chroma_pool()
+        self.client = self.pool.get_client(db_path)
+        self.embedding_key, self.embedding_function = self.pool.sentence_transformer_embedding_function(embedding_model)
         
         # 임베딩 모델 로드 (직접 계산용)
-        self.embedding_model = SentenceTransformer(embedding_model)
+        self.embedding_model = self.pool.get_embedding_function(
+            ("sentence_transformer_model", embedding_model),
+            lambda: SentenceTransformer(embedding_model)
+        )
         
         logger.info(f"RAGManager 초기화 완료: DB 경로 {db_path}, 모델 {embedding_model}")
     
+    def _get_collection(self, collection_name: str):
+        """풀에 캐시된 컬렉션 핸들 조회 (처음 한 번만 client.get_collection 호출)"""
+        return self.pool.get_collection(
+            self.db_path, collection_name, self.embedding_function, self.embedding_key
+        )
+    
     def simple_top_k_search(
         self, 
         collection_name: str, 
@@ -78,10 +87,7 @@ class RAGManager:
             검색 결과 목록
         """
         try:
-            collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function
-            )
+            collection = self._get_collection(collection_name)
             
             results = collection.query(
                 query_texts=[query],
@@ -164,10 +170,7 @@ class RAGManager:
                 return base_results
             
             # 인접 청크 ID 수집
-            collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function
-            )
+            collection = self._get_collection(collection_name)
             
             all_chunks = set()
             neighbor_ids = set()
@@ -330,10 +333,7 @@ class RAGManager:
             base_results = self.simple_top_k_search(collection_name, query, k)
             
             # 의미적 윈도우 생성을 위한 청크 ID 수집
-            collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function
-            )
+            collection = self._get_collection(collection_name)
             
             all_chunks = set()
             window_ids = set()
@@ -427,10 +427,7 @@ class RAGManager:
             semantic_results = self.simple_top_k_search(collection_name, query, k*2)
             
             # 키워드 검색을 위한 준비
-            collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function
-            )
+            collection = self._get_collection(collection_name)
             
             # 쿼리에서 키워드 추출 (간단하게 공백 기준 분리)
             keywords = query.lower().split()
@@ -1,26 +1,246 @@
 import os
+import io
+import json
+import wave
+import math
+import shutil
+import hashlib
 import logging
-from gtts import gTTS
-from typing import Dict, List, Any
+import threading
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 import uuid
-import tempfile
-from io import BytesIO
-from pydub import AudioSegment
 import time
 
+# Conditionally import TTS / audio libraries (the offline backend needs neither)
+try:
+    from gtts import gTTS
+    GTTS_AVAILABLE = True
+except ImportError:
+    GTTS_AVAILABLE = False
+
+try:
+    from pydub import AudioSegment
+    PYDUB_AVAILABLE = True
+except ImportError:
+    PYDUB_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+SPEAKER_PAUSE_MS = 1000
+ANNOUNCEMENT_PAUSE_MS = 500
+
+
+@dataclass
+class PCMAudio:
+    """Decoded audio as raw PCM frames."""
+    frames: bytes
+    frame_rate: int
+    channels: int
+    sample_width: int
+
+    @property
+    def params(self) -> Tuple[int, int, int]:
+        return (self.frame_rate, self.channels, self.sample_width)
+
+    @property
+    def duration_ms(self) -> float:
+        bytes_per_second = self.frame_rate * self.channels * self.sample_width
+        return 1000.0 * len(self.frames) / bytes_per_second if bytes_per_second else 0.0
+
+    def silence(self, duration_ms: int) -> bytes:
+        """Silent frames with the same parameters."""
+        frame_count = int(self.frame_rate * duration_ms / 1000)
+        return b"\x00" * (frame_count * self.channels * self.sample_width)
+
+
+class TTSBackend:
+    """
+    Base class for text-to-speech backends.
+
+    A backend turns text into encoded audio bytes in its `format`.
+    """
+
+    name = "base"
+    format = "mp3"
+
+    def synthesize(self, text: str, voice_profile: Dict[str, Any]) -> bytes:
+        raise NotImplementedError
+
+
+class GTTSBackend(TTSBackend):
+    """Google Translate TTS backend (gTTS)."""
+
+    name = "gtts"
+    format = "mp3"
+
+    def synthesize(self, text: str, voice_profile: Dict[str, Any]) -> bytes:
+        if not GTTS_AVAILABLE:
+            raise ImportError("gTTS not installed. Install with 'pip install gTTS'")
+        buffer = io.BytesIO()
+        tts = gTTS(text=text, lang=voice_profile.get("lang", "en"), tld=voice_profile.get("tld", "com"), slow=False)
+        tts.write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class OfflineTTSBackend(TTSBackend):
+    """
+    Offline stand-in backend for tests and development.
+
+    Renders a deterministic tone per voice profile, with a duration proportional
+    to the text length, as 16-bit mono WAV.
+    """
+
+    name = "offline"
+    format = "wav"
+
+    def __init__(self, frame_rate: int = 8000, ms_per_char: float = 20.0, latency_seconds: float = 0.0):
+        """
+        Args:
+            frame_rate: Sample rate of the generated audio.
+            ms_per_char: Audio duration per character of text.
+            latency_seconds: Simulated synthesis latency per call.
+        """
+        self.frame_rate = frame_rate
+        self.ms_per_char = ms_per_char
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def synthesize(self, text: str, voice_profile: Dict[str, Any]) -> bytes:
+        with self._lock:
+            self.calls += 1
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+
+        voice_key = json.dumps(voice_profile, sort_keys=True).encode("utf-8")
+        frequency = 200 + int(hashlib.sha256(voice_key).hexdigest()[:4], 16) % 400
+        frame_count = int(self.frame_rate * len(text) * self.ms_per_char / 1000)
+        samples = bytearray()
+        for n in range(frame_count):
+            value = int(8000 * math.sin(2 * math.pi * frequency * n / self.frame_rate))
+            samples += value.to_bytes(2, "little", signed=True)
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(self.frame_rate)
+            wav_file.writeframes(bytes(samples))
+        return buffer.getvalue()
+
+
+class TTSCache:
+    """
+    Content-addressed cache of synthesized audio shared across dialogues.
+
+    Entries are keyed by (backend, voice profile, text) and stored as
+    `<cache_dir>/<key[:2]>/<key>.<format>`.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(backend: TTSBackend, text: str, voice_profile: Dict[str, Any]) -> str:
+        payload = json.dumps({"backend": backend.name, "voice": voice_profile, "text": text},
+                             sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str, fmt: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{fmt}")
+
+    def get_or_synthesize(self, backend: TTSBackend, text: str, voice_profile: Dict[str, Any]) -> Tuple[str, bool]:
+        """
+        Return the cached audio path, synthesizing it on a miss.
+
+        Args:
+            backend: TTS backend used on a miss
+            text: Text to synthesize
+            voice_profile: Voice configuration
+
+        Returns:
+            (path to the audio file, whether it was a cache hit)
+        """
+        path = self.path_for(self.make_key(backend, text, voice_profile), backend.format)
+        if os.path.exists(path):
+            return path, True
+
+        data = backend.synthesize(text, voice_profile)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary name first so concurrent readers never see a partial file
+        tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return path, False
+
+
+def _decode_audio(path: str, fmt: str) -> PCMAudio:
+    """Decode an audio file into PCM frames."""
+    if fmt == "wav":
+        with wave.open(path, "rb") as wav_file:
+            return PCMAudio(wav_file.readframes(wav_file.getnframes()), wav_file.getframerate(),
+                            wav_file.getnchannels(), wav_file.getsampwidth())
+    if not PYDUB_AVAILABLE:
+        raise ImportError("pydub not installed. Install with 'pip install pydub'")
+    segment = AudioSegment.from_file(path, format=fmt)
+    return PCMAudio(segment.raw_data, segment.frame_rate, segment.channels, segment.sample_width)
+
+
+def _convert_audio(audio: PCMAudio, params: Tuple[int, int, int]) -> PCMAudio:
+    """Convert PCM frames to the given (frame_rate, channels, sample_width)."""
+    if audio.params == params:
+        return audio
+    if not PYDUB_AVAILABLE:
+        raise ImportError("pydub is required to mix audio with different formats")
+    frame_rate, channels, sample_width = params
+    segment = AudioSegment(data=audio.frames, sample_width=audio.sample_width,
+                           frame_rate=audio.frame_rate, channels=audio.channels)
+    segment = segment.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(sample_width)
+    return PCMAudio(segment.raw_data, frame_rate, channels, sample_width)
+
+
+def _export_audio(frames: bytes, params: Tuple[int, int, int], path: str, fmt: str) -> None:
+    """Write PCM frames to an audio file in one pass."""
+    frame_rate, channels, sample_width = params
+    if fmt == "wav":
+        with wave.open(path, "wb") as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(sample_width)
+            wav_file.setframerate(frame_rate)
+            wav_file.writeframes(frames)
+        return
+    if not PYDUB_AVAILABLE:
+        raise ImportError("pydub not installed. Install with 'pip install pydub'")
+    AudioSegment(data=frames, sample_width=sample_width, frame_rate=frame_rate,
+                 channels=channels).export(path, format=fmt)
+
+
 class AudioGenerator:
     """
     Converts dialogue text into speech using text-to-speech APIs.
+
+    Exchanges and speaker announcements are synthesized concurrently through a
+    content-addressed cache shared across dialogues, then decoded and joined
+    into the combined file in a single pass.
     """
-    
-    def __init__(self, output_dir: str = None):
+
+    def __init__(self,
+                 output_dir: str = None,
+                 tts_backend: Optional[TTSBackend] = None,
+                 max_workers: int = 8,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the audio generator.
-        
+
         Args:
             output_dir: Directory to save generated audio files
+            tts_backend: Text-to-speech backend (defaults to gTTS)
+            max_workers: Maximum number of concurrent synthesis calls
+            cache_dir: Directory of the shared synthesis cache (defaults to <output_dir>/tts_cache)
         """
         if output_dir:
             self.output_dir = output_dir
@@ -28,10 +248,16 @@ class AudioGenerator:
             # Create a default directory
             base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
             self.output_dir = os.path.join(base_dir, 'generated_audio')
-            
+
         os.makedirs(self.output_dir, exist_ok=True)
         logger.info(f"Initializing AudioGenerator with output directory: {self.output_dir}")
-        
+
+        self.tts_backend = tts_backend or GTTSBackend()
+        self.max_workers = max_workers
+        self.cache = TTSCache(cache_dir or os.path.join(self.output_dir, "tts_cache"))
+        self.stats = {"synthesized": 0, "cache_hits": 0, "errors": 0}
+        self._stats_lock = threading.Lock()
+
         # Define voice profiles for different speakers
         # For gTTS, we'll use different languages/accents as a simple way to differentiate voices
         self.voice_profiles = {
@@ -43,173 +269,211 @@ class AudioGenerator:
             "nietzsche": {"lang": "en", "tld": "co.za"},  # South African English
             "user": {"lang": "en", "tld": "co.in"}  # Indian English
         }
-    
-    def generate_dialogue_audio(self, 
+        self.announcement_profile = self.voice_profiles["default"]
+
+    def generate_dialogue_audio(self,
                                dialogue_exchanges: List[Dict[str, str]],
                                topic: str) -> Dict[str, Any]:
         """
         Generate audio files for each exchange in the dialogue and combine them into a single file.
-        
+
         Args:
             dialogue_exchanges: List of dialogue exchanges (speaker and content)
             topic: Topic of the dialogue
-            
+
         Returns:
             Dictionary with paths to generated audio files
         """
         logger.info(f"Generating audio for dialogue with topic: {topic}")
-        
+
         # Create a unique identifier for this dialogue
         safe_topic = "".join(c if c.isalnum() else "_" for c in topic)
         dialogue_id = str(uuid.uuid4())[:8]
-        
+
         # Make a directory for this dialogue
         dialogue_dir = os.path.join(self.output_dir, f"{safe_topic}_{dialogue_id}")
         os.makedirs(dialogue_dir, exist_ok=True)
-        
-        # Generate individual audio segments
-        audio_segments = []
+
+        exchanges = [(i, exchange.get("speaker", "Unknown"), exchange.get("content", ""))
+                     for i, exchange in enumerate(dialogue_exchanges)]
+        exchanges = [(i, speaker, content) for i, speaker, content in exchanges if content]
+
+        # Every distinct (text, voice) pair is rendered and decoded once, concurrently
+        jobs: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+        for _, speaker, content in exchanges:
+            voice_profile = self._get_voice_profile(speaker)
+            jobs[self._job_key(content, voice_profile)] = (content, voice_profile)
+            announcement = self._announcement_text(speaker)
+            jobs[self._job_key(announcement, self.announcement_profile)] = (announcement, self.announcement_profile)
+
+        rendered: Dict[Tuple[str, str], Optional[Tuple[str, PCMAudio]]] = {}
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs)), thread_name_prefix="tts") as executor:
+                futures = {key: executor.submit(self._render, text, profile) for key, (text, profile) in jobs.items()}
+                for key, future in futures.items():
+                    rendered[key] = future.result()
+
+        # Assemble in one pass: collect frames, join once, export once
+        audio_segments: List[bytes] = []
         individual_files = []
-        
-        for i, exchange in enumerate(dialogue_exchanges):
-            speaker = exchange.get("speaker", "Unknown")
-            content = exchange.get("content", "")
-            
-            if not content:
+        params: Optional[Tuple[int, int, int]] = None
+        fmt = self.tts_backend.format
+
+        for i, speaker, content in exchanges:
+            speech = rendered.get(self._job_key(content, self._get_voice_profile(speaker)))
+            if not speech:
                 continue
-                
-            # Determine voice profile for this speaker
-            voice_profile = self._get_voice_profile(speaker)
-            
-            # Generate audio for this exchange
-            audio_path = self._generate_single_audio(
-                text=content,
-                speaker=speaker,
-                output_dir=dialogue_dir,
-                index=i,
-                voice_profile=voice_profile
-            )
-            
-            if audio_path:
-                # Load the audio segment
-                audio_segment = AudioSegment.from_mp3(audio_path)
-                
+            cached_path, speech_audio = speech
+
+            audio_path = self._copy_to_dialogue(cached_path, dialogue_dir, f"{i:02d}_{self._safe_name(speaker)}.{fmt}")
+            try:
+                if params is None:
+                    params = speech_audio.params
+                speech_audio = _convert_audio(speech_audio, params)
+
                 # Add a pause between speakers (1 second)
                 if audio_segments:
-                    pause = AudioSegment.silent(duration=1000)
-                    audio_segments.append(pause)
-                
+                    audio_segments.append(speech_audio.silence(SPEAKER_PAUSE_MS))
+
                 # Add speaker announcement
-                speaker_announcement = self._generate_speaker_announcement(speaker, dialogue_dir)
-                if speaker_announcement:
-                    audio_segments.append(AudioSegment.from_mp3(speaker_announcement))
+                announcement = rendered.get(self._job_key(self._announcement_text(speaker), self.announcement_profile))
+                if announcement:
+                    audio_segments.append(_convert_audio(announcement[1], params).frames)
                     # Add a short pause (500ms)
-                    audio_segments.append(AudioSegment.silent(duration=500))
-                
+                    audio_segments.append(speech_audio.silence(ANNOUNCEMENT_PAUSE_MS))
+
                 # Add the speech
-                audio_segments.append(audio_segment)
-                
-                individual_files.append({
-                    "speaker": speaker,
-                    "content": content,
-                    "audio_path": audio_path
-                })
-        
+                audio_segments.append(speech_audio.frames)
+            except Exception as e:
+                logger.error(f"Error assembling audio for {speaker}: {str(e)}")
+
+            individual_files.append({
+                "speaker": speaker,
+                "content": content,
+                "audio_path": audio_path
+            })
+
         # Combine all audio segments into one file
-        if audio_segments:
-            combined_audio = audio_segments[0]
-            for segment in audio_segments[1:]:
-                combined_audio += segment
-                
-            # Save the combined audio
-            combined_path = os.path.join(dialogue_dir, f"complete_dialogue.mp3")
-            combined_audio.export(combined_path, format="mp3")
-            logger.info(f"Generated combined audio file: {combined_path}")
+        combined_path = None
+        if audio_segments and params is not None:
+            combined_path = os.path.join(dialogue_dir, f"complete_dialogue.{fmt}")
+            try:
+                _export_audio(b"".join(audio_segments), params, combined_path, fmt)
+                logger.info(f"Generated combined audio file: {combined_path}")
+            except Exception as e:
+                logger.error(f"Error exporting combined audio: {str(e)}")
+                combined_path = None
         else:
-            combined_path = None
             logger.warning("No audio segments to combine")
-        
+
         result = {
             "topic": topic,
             "audio_files": individual_files,
             "combined_audio_path": combined_path,
             "dialogue_dir": dialogue_dir
         }
-        
+
         logger.info(f"Generated {len(individual_files)} individual audio files and 1 combined file")
         return result
-    
-    def _generate_speaker_announcement(self, speaker: str, output_dir: str) -> str:
-        """Generate a brief announcement of who is speaking"""
+
+    @staticmethod
+    def _safe_name(name: str) -> str:
+        return "".join(c if c.isalnum() else "_" for c in name)
+
+    @staticmethod
+    def _announcement_text(speaker: str) -> str:
+        return f"{speaker} says:"
+
+    @staticmethod
+    def _job_key(text: str, voice_profile: Dict[str, Any]) -> Tuple[str, str]:
+        return (text, json.dumps(voice_profile, sort_keys=True))
+
+    def _synthesize_cached(self, text: str, voice_profile: Dict[str, Any]) -> Optional[str]:
+        """Synthesize through the shared cache, returning the cached file path."""
         try:
-            # Create a filename for the announcement
-            safe_speaker = "".join(c if c.isalnum() else "_" for c in speaker)
-            filename = f"announce_{safe_speaker}.mp3"
-            output_path = os.path.join(output_dir, filename)
-            
-            # Check if this announcement already exists
-            if os.path.exists(output_path):
-                return output_path
-                
-            # Generate the announcement
-            announcement_text = f"{speaker} says:"
-            tts = gTTS(text=announcement_text, lang='en', slow=False)
-            tts.save(output_path)
-            
-            return output_path
+            path, hit = self.cache.get_or_synthesize(self.tts_backend, text, voice_profile)
+            with self._stats_lock:
+                self.stats["cache_hits" if hit else "synthesized"] += 1
+            return path
+        except Exception as e:
+            with self._stats_lock:
+                self.stats["errors"] += 1
+            logger.error(f"Error synthesizing audio: {str(e)}")
+            return None
+
+    def _render(self, text: str, voice_profile: Dict[str, Any]) -> Optional[Tuple[str, PCMAudio]]:
+        """Synthesize (or reuse) and decode one piece of audio."""
+        path = self._synthesize_cached(text, voice_profile)
+        if not path:
+            return None
+        try:
+            return path, _decode_audio(path, self.tts_backend.format)
         except Exception as e:
-            logger.error(f"Error generating speaker announcement: {str(e)}")
+            logger.error(f"Error decoding audio {path}: {str(e)}")
             return None
-    
-    def _generate_single_audio(self, 
-                              text: str, 
-                              speaker: str, 
-                              output_dir: str, 
+
+    @staticmethod
+    def _copy_to_dialogue(cached_path: str, output_dir: str, filename: str) -> str:
+        """Place a cached file in the dialogue directory (hard link when possible)."""
+        output_path = os.path.join(output_dir, filename)
+        try:
+            os.link(cached_path, output_path)
+        except OSError:
+            shutil.copyfile(cached_path, output_path)
+        return output_path
+
+    def _generate_speaker_announcement(self, speaker: str, output_dir: str) -> str:
+        """Generate a brief announcement of who is speaking"""
+        path = self._synthesize_cached(self._announcement_text(speaker), self.announcement_profile)
+        if not path:
+            return None
+        filename = f"announce_{self._safe_name(speaker)}.{self.tts_backend.format}"
+        output_path = os.path.join(output_dir, filename)
+        if os.path.exists(output_path):
+            return output_path
+        return self._copy_to_dialogue(path, output_dir, filename)
+
+    def _generate_single_audio(self,
+                              text: str,
+                              speaker: str,
+                              output_dir: str,
                               index: int,
                               voice_profile: Dict[str, Any]) -> str:
         """
         Generate audio for a single dialogue exchange.
-        
+
         Args:
             text: Text to convert to speech
             speaker: Name of the speaker
             output_dir: Directory to save the audio file
             index: Index of this exchange in the dialogue
             voice_profile: Voice configuration for this speaker
-            
+
         Returns:
             Path to the generated audio file
         """
-        try:
-            # Create a safe filename from the speaker name
-            safe_speaker = "".join(c if c.isalnum() else "_" for c in speaker)
-            filename = f"{index:02d}_{safe_speaker}.mp3"
-            output_path = os.path.join(output_dir, filename)
-            
-            # Use gTTS to convert text to speech with the specified voice profile
-            tts = gTTS(text=text, lang=voice_profile["lang"], tld=voice_profile["tld"], slow=False)
-            tts.save(output_path)
-            
-            logger.info(f"Generated audio file: {output_path}")
-            return output_path
-            
-        except Exception as e:
-            logger.error(f"Error generating audio for {speaker}: {str(e)}")
+        path = self._synthesize_cached(text, voice_profile)
+        if not path:
+            logger.error(f"Error generating audio for {speaker}")
             return None
-    
+        output_path = self._copy_to_dialogue(
+            path, output_dir, f"{index:02d}_{self._safe_name(speaker)}.{self.tts_backend.format}")
+        logger.info(f"Generated audio file: {output_path}")
+        return output_path
+
     def _get_voice_profile(self, speaker: str) -> Dict[str, Any]:
         """Get the appropriate voice profile for the speaker"""
         # Convert speaker name to lowercase and remove spaces
         key = speaker.lower().replace(" ", "_")
-        
+
         # Try to match with known profiles
         for profile_key in self.voice_profiles:
             if profile_key in key:
                 return self.voice_profiles[profile_key]
-        
+
         # If no match, use a deterministic approach to select a voice profile
-        # This ensures the same speaker always gets the same voice
+        # This ensures the same speaker always gets the same voice (stable across
+        # processes, so the shared synthesis cache keeps hitting)
         available_profiles = list(self.voice_profiles.values())
-        profile_index = hash(speaker) % len(available_profiles)
-        return available_profiles[profile_index] 
- 
\ No newline at end of file
+        profile_index = int(hashlib.md5(speaker.encode("utf-8")).hexdigest(), 16) % len(available_profiles)
+        return available_profiles[profile_index]
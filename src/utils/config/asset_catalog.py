@@ -0,0 +1,356 @@
+"""
+Asset Catalog Module
+
+철학자 / 전략 / 모더레이터 스타일 설정 파일을 프로세스 전역에서 한 번만 파싱하여
+불변(immutable) 스냅샷으로 제공하는 카탈로그입니다.
+
+- 파일은 처음 요청될 때 한 번 파싱되고, 검증을 거쳐 타입이 있는 객체로 변환됩니다.
+- 파일 mtime이 바뀌면 새 스냅샷을 만들어 참조를 한 번에 교체합니다 (atomic reload).
+- 재파싱에 실패하면 이전 스냅샷을 그대로 유지합니다.
+- mtime 확인은 check_interval 간격으로만 수행하므로 호출마다 디스크 I/O가 발생하지 않습니다.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, Mapping, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze(value: Any) -> Any:
+    """dict/list를 읽기 전용 구조(MappingProxyType/tuple)로 재귀 변환"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """_freeze로 만든 읽기 전용 구조를 수정 가능한 dict/list 복사본으로 변환"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# ============================================================================
+# TYPED ASSETS
+# ============================================================================
+
+@dataclass(frozen=True)
+class DebatePhilosopher:
+    """philosophers/debate_optimized.yaml의 철학자 항목"""
+    key: str
+    name: str
+    data: Mapping[str, Any]  # 원본 필드 전체 (읽기 전용)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """에이전트가 사용할 수정 가능한 딕셔너리 복사본 반환"""
+        return _thaw(self.data)
+
+
+@dataclass(frozen=True)
+class PhilosopherProfile:
+    """config/philosophers.yaml의 철학자 항목 (API 표시용)"""
+    key: str
+    name: str
+    korean_name: str = ""
+    period: str = ""
+    school: str = ""
+    description: str = ""
+    data: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+    def get(self, field_name: str, default: Any = None) -> Any:
+        """원본 필드 조회 (dict/list는 수정 가능한 복사본으로 반환)"""
+        return _thaw(self.data.get(field_name, default))
+
+
+@dataclass(frozen=True)
+class ModeratorStyle:
+    """src/agents/moderator/moderator_style.json의 스타일 항목"""
+    style_id: str
+    name: str
+    opening: str
+    transition: str
+
+
+@dataclass(frozen=True)
+class AssetSnapshot:
+    """하나의 파일을 파싱한 불변 스냅샷"""
+    path: str
+    mtime: Optional[float]
+    value: Any
+    loaded_at: float
+
+
+# ============================================================================
+# PARSERS (원본 데이터 -> 검증된 불변 객체)
+# ============================================================================
+
+def _parse_debate_philosophers(raw: Any) -> Mapping[str, DebatePhilosopher]:
+    if not isinstance(raw, dict):
+        raise ValueError("debate philosophers file must be a mapping")
+
+    philosophers = {}
+    for key, data in raw.items():
+        if not isinstance(data, dict):
+            logger.warning(f"Skipping invalid debate philosopher entry: {key}")
+            continue
+        philosophers[key] = DebatePhilosopher(
+            key=key,
+            name=str(data.get("name", key)),
+            data=_freeze(data)
+        )
+    return MappingProxyType(philosophers)
+
+
+def _parse_philosopher_profiles(raw: Any) -> Mapping[str, PhilosopherProfile]:
+    if not isinstance(raw, dict):
+        raise ValueError("philosophers config file must be a mapping")
+
+    profiles = {}
+    for key, data in raw.items():
+        if not isinstance(data, dict):
+            logger.warning(f"Skipping invalid philosopher profile entry: {key}")
+            continue
+        profiles[key] = PhilosopherProfile(
+            key=key,
+            name=str(data.get("name", "")),
+            korean_name=str(data.get("korean_name", "") or ""),
+            period=str(data.get("period", "") or ""),
+            school=str(data.get("school", "") or ""),
+            description=str(data.get("description", "") or ""),
+            data=_freeze(data)
+        )
+    return MappingProxyType(profiles)
+
+
+def _parse_strategy_styles(raw: Any) -> Mapping[str, Any]:
+    if not isinstance(raw, dict) or not isinstance(raw.get("strategy_styles"), dict):
+        raise ValueError("strategy styles file must contain a 'strategy_styles' mapping")
+    return _freeze(raw["strategy_styles"])
+
+
+def _parse_strategy_rag_weights(raw: Any) -> Mapping[str, Any]:
+    if not isinstance(raw, dict) or not isinstance(raw.get("strategy_rag_weights"), dict):
+        raise ValueError("strategy RAG weights file must contain a 'strategy_rag_weights' mapping")
+    return _freeze(raw["strategy_rag_weights"])
+
+
+def _parse_defense_map(raw: Any) -> Mapping[str, Any]:
+    # 공격 전략 -> RAG_YES/RAG_NO -> 감정 -> 방어 후보 전략 목록
+    if not isinstance(raw, dict):
+        raise ValueError("defense map file must contain a mapping of attack strategies")
+    return _freeze(raw)
+
+
+def _parse_moderator_styles(raw: Any) -> Mapping[str, ModeratorStyle]:
+    if not isinstance(raw, dict):
+        raise ValueError("moderator style file must be a mapping")
+
+    styles = {}
+    for style_id, data in raw.items():
+        if not isinstance(data, dict) or not all(isinstance(data.get(k), str) for k in ("name", "opening", "transition")):
+            logger.warning(f"Skipping invalid moderator style entry: {style_id}")
+            continue
+        styles[str(style_id)] = ModeratorStyle(
+            style_id=str(style_id),
+            name=data["name"],
+            opening=data["opening"],
+            transition=data["transition"]
+        )
+    return MappingProxyType(styles)
+
+
+# ============================================================================
+# CATALOG
+# ============================================================================
+
+class AssetCatalog:
+    """
+    설정 파일 카탈로그
+
+    각 자산은 (상대 경로, 파서, 기본값)으로 등록되며, 조회 시 캐시된 스냅샷을 반환합니다.
+    """
+
+    # 자산 이름 -> (프로젝트 루트 기준 상대 경로, 파서, 파일이 없거나 잘못됐을 때의 기본값)
+    ASSETS: Dict[str, Tuple[Tuple[str, ...], Callable[[Any], Any], Any]] = {
+        "debate_philosophers": (("philosophers", "debate_optimized.yaml"), _parse_debate_philosophers, MappingProxyType({})),
+        "strategy_styles": (("philosophers", "debate_strategies.json"), _parse_strategy_styles, MappingProxyType({})),
+        "strategy_rag_weights": (("philosophers", "strategy_rag_weights.yaml"), _parse_strategy_rag_weights, MappingProxyType({})),
+        "philosopher_profiles": (("config", "philosophers.yaml"), _parse_philosopher_profiles, MappingProxyType({})),
+        "moderator_styles": (("src", "agents", "moderator", "moderator_style.json"), _parse_moderator_styles, MappingProxyType({})),
+        "defense_map": (("philosophers", "defense_map.yaml"), _parse_defense_map, MappingProxyType({})),
+    }
+
+    def __init__(self, project_root: Optional[str] = None, check_interval: float = 2.0):
+        """
+        AssetCatalog 초기화
+
+        Args:
+            project_root: 프로젝트 루트 경로 (None이면 philosophers 폴더를 기준으로 탐색)
+            check_interval: mtime 변경 확인 최소 간격(초). 0이면 매 조회마다 확인
+        """
+        self.project_root = project_root or self._find_project_root()
+        self.check_interval = check_interval
+
+        self._snapshots: Dict[str, AssetSnapshot] = {}
+        self._last_checked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.reload_count = 0
+
+    @staticmethod
+    def _find_project_root() -> str:
+        """philosophers 폴더가 있는 상위 디렉토리 탐색 (프로세스당 한 번)"""
+        project_root = os.path.dirname(os.path.abspath(__file__))
+        while not os.path.exists(os.path.join(project_root, "philosophers")):
+            parent = os.path.dirname(project_root)
+            if parent == project_root:  # 루트에 도달
+                return os.getcwd()
+            project_root = parent
+        return project_root
+
+    def get_path(self, asset_name: str) -> str:
+        """자산 파일의 절대 경로 반환"""
+        relative_parts = self.ASSETS[asset_name][0]
+        return os.path.join(self.project_root, *relative_parts)
+
+    def get(self, asset_name: str) -> Any:
+        """
+        자산의 현재 불변 값 반환 (필요 시 mtime 확인 후 재로드)
+
+        Args:
+            asset_name: ASSETS에 등록된 자산 이름
+
+        Returns:
+            파싱/검증된 읽기 전용 값
+        """
+        now = time.monotonic()
+        snapshot = self._snapshots.get(asset_name)
+
+        if snapshot is not None and now - self._last_checked.get(asset_name, 0.0) < self.check_interval:
+            return snapshot.value
+
+        with self._lock:
+            snapshot = self._snapshots.get(asset_name)
+            self._last_checked[asset_name] = now
+
+            path = self.get_path(asset_name)
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                mtime = None
+
+            if snapshot is not None and snapshot.mtime == mtime:
+                return snapshot.value
+
+            snapshot = self._load(asset_name, path, mtime, previous=snapshot)
+            self._snapshots[asset_name] = snapshot
+            return snapshot.value
+
+    def _load(self, asset_name: str, path: str, mtime: Optional[float],
+              previous: Optional[AssetSnapshot]) -> AssetSnapshot:
+        """파일을 파싱하여 새 스냅샷 생성 (실패 시 이전 스냅샷 또는 기본값 유지)"""
+        _, parser, default = self.ASSETS[asset_name]
+
+        if mtime is None:
+            logger.warning(f"Asset file not found: {path}")
+            return AssetSnapshot(path=path, mtime=None, value=default, loaded_at=time.time())
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if path.endswith(".json"):
+                    raw = json.load(f)
+                else:
+                    raw = yaml.safe_load(f)
+            value = parser(raw)
+        except Exception as e:
+            logger.error(f"Error loading asset '{asset_name}' from {path}: {str(e)}")
+            if previous is not None:
+                # 잘못된 파일은 건너뛰되, 같은 mtime으로 다시 파싱하지 않도록 기록
+                return AssetSnapshot(path=path, mtime=mtime, value=previous.value, loaded_at=previous.loaded_at)
+            return AssetSnapshot(path=path, mtime=mtime, value=default, loaded_at=time.time())
+
+        self.reload_count += 1
+        logger.info(f"Loaded asset '{asset_name}' from {path}")
+        return AssetSnapshot(path=path, mtime=mtime, value=value, loaded_at=time.time())
+
+    def invalidate(self, asset_name: Optional[str] = None) -> None:
+        """다음 조회 시 mtime을 즉시 다시 확인하도록 표시"""
+        with self._lock:
+            if asset_name is None:
+                self._last_checked.clear()
+            else:
+                self._last_checked.pop(asset_name, None)
+
+    # ------------------------------------------------------------------------
+    # 편의 조회 메서드
+    # ------------------------------------------------------------------------
+
+    def get_debate_philosopher(self, philosopher_key: str) -> Optional[DebatePhilosopher]:
+        """토론용 철학자 데이터 조회"""
+        return self.get("debate_philosophers").get(philosopher_key)
+
+    def get_debate_philosophers(self) -> Mapping[str, DebatePhilosopher]:
+        """토론용 철학자 전체 조회"""
+        return self.get("debate_philosophers")
+
+    def get_philosopher_name(self, philosopher_key: str, default: Optional[str] = None) -> Optional[str]:
+        """철학자 키로 표시 이름 조회 (토론용 데이터 기준)"""
+        philosopher = self.get_debate_philosopher(philosopher_key)
+        return philosopher.name if philosopher else default
+
+    def get_strategy_styles(self) -> Dict[str, Any]:
+        """전략 스타일 (수정 가능한 복사본)"""
+        return _thaw(self.get("strategy_styles"))
+
+    def get_strategy_rag_weights(self) -> Dict[str, Any]:
+        """전략별 RAG 가중치 (수정 가능한 복사본)"""
+        return _thaw(self.get("strategy_rag_weights"))
+
+    def get_philosopher_profiles(self) -> Mapping[str, PhilosopherProfile]:
+        """API 표시용 철학자 프로필 전체 조회"""
+        return self.get("philosopher_profiles")
+
+    def get_moderator_style(self, style_id: str) -> Optional[ModeratorStyle]:
+        """모더레이터 스타일 조회"""
+        return self.get("moderator_styles").get(str(style_id))
+
+    def get_defense_map(self) -> Mapping[str, Any]:
+        """공격 전략별 방어 후보 맵 (읽기 전용)"""
+        return self.get("defense_map")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """로드된 자산 상태 조회"""
+        return {
+            "project_root": self.project_root,
+            "reload_count": self.reload_count,
+            "assets": {
+                name: {"path": snapshot.path, "mtime": snapshot.mtime, "loaded_at": snapshot.loaded_at}
+                for name, snapshot in self._snapshots.items()
+            }
+        }
+
+
+# 프로세스 전역 카탈로그
+_asset_catalog: Optional[AssetCatalog] = None
+_asset_catalog_lock = threading.Lock()
+
+
+def get_asset_catalog() -> AssetCatalog:
+    """프로세스 전역 AssetCatalog 인스턴스 반환"""
+    global _asset_catalog
+    if _asset_catalog is None:
+        with _asset_catalog_lock:
+            if _asset_catalog is None:
+                _asset_catalog = AssetCatalog()
+    return _asset_catalog
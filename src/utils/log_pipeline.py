@@ -0,0 +1,432 @@
+"""
+Structured Logging Pipeline
+
+토론 처리 경로에서 로깅 비용이 턴 지연에 섞이지 않도록 하는 로깅 레이어입니다.
+
+- 호출 스레드에서는 필터를 통과한 레코드의 메시지만 합쳐서(인자가 나중에 바뀌거나 예외 프레임이
+  붙잡히지 않도록) 큐에 넣고(put_nowait), JSON 직렬화/쓰기는 QueueListener 스레드에서 수행합니다.
+  큐가 가득 차면 호출부를 막지 않고 레코드를 버리고 개수만 셉니다.
+- 각 레코드에는 log_context()로 지정한 room_id/turn_id가 붙고, 지정이 없으면 현재 트레이싱 span의
+  값을 사용합니다 (ContextVar 기반이라 asyncio 태스크에 자동 전파, 스레드 풀은 tracing.wrap_context 사용).
+- 같은 방의 같은 호출 지점(로거 + 줄 번호)에서 나오는 INFO 이하 레코드는 토큰 버킷으로 제한하고,
+  로거별 샘플링 비율을 줄 수 있습니다. 억제된 개수는 다음으로 통과하는 레코드의 "suppressed" 필드에 기록됩니다.
+  WARNING 이상은 제한하지 않습니다.
+- 메시지 인자는 레벨/제한 필터를 통과한 레코드만 합쳐지므로 호출부에서는 f-string 대신
+  logger.debug("... %s", value) 형태를 쓰면 걸러질 때 포맷 비용이 들지 않습니다.
+
+환경 변수:
+    SAPIENS_LOG_LEVEL       루트 로그 레벨 (기본 INFO)
+    SAPIENS_LOG_FORMAT      "json" 또는 "text" (기본 json)
+    SAPIENS_LOG_QUEUE_SIZE  큐 최대 길이 (기본 10000)
+    SAPIENS_LOG_RATE        호출 지점/방별 초당 허용 레코드 수 (기본 20, 0이면 제한 없음)
+    SAPIENS_LOG_BURST       토큰 버킷 크기 (기본 50)
+    SAPIENS_LOG_SAMPLE      로거별 샘플링 비율, 예: "src.agents=0.1,api.routers.chat=0.5"
+"""
+
+import os
+import sys
+import copy
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+import contextvars
+import logging.handlers
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Iterator, Tuple, IO
+
+from .tracing import current_span
+
+logger = logging.getLogger(__name__)
+
+# prepare()에서 예외를 텍스트로 바꿀 때 쓰는 포맷터
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+LOG_LEVEL_ENV = "SAPIENS_LOG_LEVEL"
+LOG_FORMAT_ENV = "SAPIENS_LOG_FORMAT"
+LOG_QUEUE_SIZE_ENV = "SAPIENS_LOG_QUEUE_SIZE"
+LOG_RATE_ENV = "SAPIENS_LOG_RATE"
+LOG_BURST_ENV = "SAPIENS_LOG_BURST"
+LOG_SAMPLE_ENV = "SAPIENS_LOG_SAMPLE"
+
+LOG_FORMATS = ("json", "text")
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_RATE_PER_SECOND = 20.0
+DEFAULT_BURST = 50
+MAX_RATE_KEYS = 4096
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s [room=%(room_id)s turn=%(turn_id)s] %(message)s"
+
+# LogRecord 기본 속성 - 이외의 속성(extra=...)은 JSON의 fields로 내보냄
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message", "asctime", "room_id", "turn_id", "log_fields", "suppressed"
+}
+
+_log_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("sapiens_log_context", default={})
+
+
+@contextmanager
+def log_context(room_id: Optional[str] = None, turn_id: Optional[Any] = None, **fields: Any) -> Iterator[Dict[str, Any]]:
+    """
+    블록 안에서 기록되는 모든 레코드에 room_id/turn_id/추가 필드를 붙임 (바깥 컨텍스트와 병합)
+
+    Args:
+        room_id: 토론방 ID
+        turn_id: 턴 식별자 (턴 번호 등)
+        **fields: 레코드에 함께 기록할 필드
+    """
+    token = bind_log_context(room_id=room_id, turn_id=turn_id, **fields)
+    try:
+        yield _log_context.get()
+    finally:
+        _log_context.reset(token)
+
+
+def bind_log_context(room_id: Optional[str] = None, turn_id: Optional[Any] = None, **fields: Any) -> contextvars.Token:
+    """
+    현재 컨텍스트에 로그 필드를 바인딩하고 reset용 토큰 반환
+
+    요청마다 별도 컨텍스트에서 실행되는 async 엔드포인트처럼 블록으로 감싸기 어려운 곳에서 사용합니다.
+    """
+    context = dict(_log_context.get())
+    if room_id is not None:
+        context["room_id"] = room_id
+    if turn_id is not None:
+        context["turn_id"] = turn_id
+    context.update({key: value for key, value in fields.items() if value is not None})
+    return _log_context.set(context)
+
+
+def reset_log_context(token: contextvars.Token) -> None:
+    """bind_log_context() 이전 상태로 복원"""
+    _log_context.reset(token)
+
+
+def get_log_context() -> Dict[str, Any]:
+    """현재 바인딩된 로그 컨텍스트"""
+    return dict(_log_context.get())
+
+
+class ContextFilter(logging.Filter):
+    """레코드에 room_id/turn_id/컨텍스트 필드를 붙이는 필터 (호출 스레드에서 실행되어야 함)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if hasattr(record, "log_fields"):
+            return True
+        # 우선순위: extra=로 직접 준 값 → log_context() → 현재 트레이싱 span
+        context = _log_context.get()
+        room_id = getattr(record, "room_id", None) or context.get("room_id")
+        turn_id = getattr(record, "turn_id", None) or context.get("turn_id")
+        if room_id is None or turn_id is None:
+            span = current_span()
+            room_id = room_id or span.room_id
+            turn_id = turn_id or getattr(span, "turn_id", None)
+        record.room_id = room_id
+        record.turn_id = turn_id
+        # 컨텍스트 딕셔너리는 바인딩 때마다 새로 만들어지므로 복사 없이 참조만 넘김 (room_id/turn_id는 포맷 시 제외)
+        record.log_fields = context
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    방/호출 지점별 토큰 버킷 제한과 로거별 샘플링
+
+    Args:
+        rate_per_second: 호출 지점(방, 로거, 줄 번호)별 초당 허용 레코드 수 (0 이하면 제한 없음)
+        burst: 토큰 버킷 크기
+        sample_rates: 로거 이름 접두사 → 통과 비율 (0~1). 가장 긴 접두사가 적용됨
+        max_level: 이 레벨 이하만 제한 (기본 INFO, WARNING 이상은 항상 통과)
+    """
+
+    def __init__(self, rate_per_second: float = DEFAULT_RATE_PER_SECOND, burst: int = DEFAULT_BURST,
+                 sample_rates: Optional[Dict[str, float]] = None, max_level: int = logging.INFO):
+        super().__init__()
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.sample_rates = dict(sample_rates or {})
+        self.max_level = max_level
+        self._buckets: Dict[Tuple[Any, str, int], list] = {}
+        self._sample_cache: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.suppressed_total = 0
+
+    def _sample_rate(self, name: str) -> float:
+        rate = self._sample_cache.get(name)
+        if rate is None:
+            rate = 1.0
+            matched = -1
+            for prefix, value in self.sample_rates.items():
+                if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > matched:
+                    rate, matched = value, len(prefix)
+            self._sample_cache[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+
+        sample_rate = self._sample_rate(record.name)
+        if sample_rate >= 1.0 and self.rate_per_second <= 0:
+            return True
+
+        key = (getattr(record, "room_id", None), record.name, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            # [tokens, 마지막 갱신 시각, 억제 수, 샘플링 카운터]
+            state = self._buckets.get(key)
+            if state is None:
+                if len(self._buckets) >= MAX_RATE_KEYS:
+                    # 종료된 방의 키가 쌓이지 않도록 한도에 도달하면 전부 비우고 새로 시작
+                    self._buckets.clear()
+                state = [float(self.burst), now, 0, 0]
+                self._buckets[key] = state
+
+            allowed = True
+            if sample_rate < 1.0:
+                # 결정적 샘플링: 호출 지점별로 1/rate 번째 레코드마다 통과
+                every = max(1, round(1.0 / sample_rate)) if sample_rate > 0 else 0
+                allowed = every > 0 and state[3] % every == 0
+                state[3] += 1
+
+            if allowed and self.rate_per_second > 0:
+                state[0] = min(float(self.burst), state[0] + (now - state[1]) * self.rate_per_second)
+                state[1] = now
+                if state[0] >= 1.0:
+                    state[0] -= 1.0
+                else:
+                    allowed = False
+
+            if not allowed:
+                state[2] += 1
+                self.suppressed_total += 1
+                return False
+
+            if state[2]:
+                record.suppressed = state[2]
+                state[2] = 0
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드를 한 줄 JSON으로 직렬화"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "room_id": getattr(record, "room_id", None),
+            "turn_id": getattr(record, "turn_id", None),
+        }
+
+        fields = {key: value for key, value in (getattr(record, "log_fields", None) or {}).items()
+                  if key not in ("room_id", "turn_id")}
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                fields[key] = value
+        if fields:
+            entry["fields"] = fields
+
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    호출 스레드를 막지 않는 QueueHandler
+
+    필터(레벨/제한/샘플링)를 통과한 레코드만 prepare()에서 메시지와 예외 텍스트를 합친 사본으로 만들고,
+    출력 직렬화만 리스너 스레드로 넘깁니다. 큐가 가득 차면 레코드를 버리고 dropped만 증가시킵니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.enqueued = 0
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # 큐가 스레드 안전하므로 핸들러 락 없이 필터 후 바로 enqueue
+        passed = self.filter(record)
+        if passed:
+            self.enqueue(self.prepare(record))
+        return passed
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        큐에 넣을 레코드 사본 생성 (호출 스레드)
+
+        인자(실시간으로 바뀌는 dict/상태 객체)는 지금 값으로 메시지에 합치고, 예외는 텍스트로 바꿔
+        traceback과 프레임을 붙잡지 않도록 exc_info를 비웁니다.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+
+class LoggingPipeline:
+    """
+    큐 기반 로깅 파이프라인 (호출 스레드: 컨텍스트/제한 필터 + enqueue, 리스너 스레드: 포맷 + 쓰기)
+
+    Args:
+        level: 루트 로그 레벨
+        fmt: "json" 또는 "text"
+        stream: 출력 스트림 (기본 sys.stderr)
+        queue_size: 큐 최대 길이
+        rate_per_second: 호출 지점/방별 초당 허용 레코드 수
+        burst: 토큰 버킷 크기
+        sample_rates: 로거별 샘플링 비율
+        target: 실제로 쓰는 핸들러 (지정하면 stream/fmt 대신 사용)
+    """
+
+    def __init__(self, level: int = logging.INFO, fmt: str = "json", stream: Optional[IO[str]] = None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+                 burst: int = DEFAULT_BURST, sample_rates: Optional[Dict[str, float]] = None,
+                 target: Optional[logging.Handler] = None):
+        if fmt not in LOG_FORMATS:
+            raise ValueError(f"지원하지 않는 로그 형식: {fmt} (가능: {', '.join(LOG_FORMATS)})")
+
+        self.level = level
+        self.fmt = fmt
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+
+        if target is None:
+            target = logging.StreamHandler(stream if stream is not None else sys.stderr)
+            target.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+        self.target = target
+
+        self.rate_filter = RateLimitFilter(rate_per_second=rate_per_second, burst=burst, sample_rates=sample_rates)
+        self.handler = NonBlockingQueueHandler(self.queue)
+        self.handler.addFilter(ContextFilter())
+        self.handler.addFilter(self.rate_filter)
+        self.listener = logging.handlers.QueueListener(self.queue, self.target, respect_handler_level=True)
+        self._started = False
+
+    def start(self) -> 'LoggingPipeline':
+        if not self._started:
+            self.listener.start()
+            self._started = True
+        return self
+
+    def stop(self) -> None:
+        """남은 레코드를 모두 쓴 뒤 리스너 스레드 종료"""
+        if self._started:
+            self.listener.stop()
+            self._started = False
+            self.target.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "level": logging.getLevelName(self.level),
+            "format": self.fmt,
+            "enqueued": self.handler.enqueued,
+            "dropped": self.handler.dropped,
+            "suppressed": self.rate_filter.suppressed_total,
+            "queue_depth": self.queue.qsize(),
+            "queue_capacity": self.queue.maxsize
+        }
+
+
+_pipeline: Optional[LoggingPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def _parse_sample_rates(spec: Optional[str]) -> Dict[str, float]:
+    """"a.b=0.1,c=0.5" 형식의 샘플링 설정 파싱 (잘못된 항목은 무시)"""
+    rates: Dict[str, float] = {}
+    for item in (spec or "").split(","):
+        name, _, value = item.partition("=")
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(value)))
+        except ValueError:
+            continue
+    rates.pop("", None)
+    return rates
+
+
+def configure_logging(level: Optional[Any] = None, fmt: Optional[str] = None, stream: Optional[IO[str]] = None,
+                      queue_size: Optional[int] = None, rate_per_second: Optional[float] = None,
+                      burst: Optional[int] = None, sample_rates: Optional[Dict[str, float]] = None,
+                      target: Optional[logging.Handler] = None) -> LoggingPipeline:
+    """
+    루트 로거에 큐 기반 파이프라인 설치 (다시 호출하면 기존 파이프라인을 정리하고 교체)
+
+    인자를 주지 않은 항목은 SAPIENS_LOG_* 환경 변수, 그 다음 기본값을 사용합니다.
+
+    Returns:
+        설치된 LoggingPipeline
+    """
+    global _pipeline
+
+    level = level if level is not None else os.getenv(LOG_LEVEL_ENV, "INFO")
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+
+    pipeline = LoggingPipeline(
+        level=level,
+        fmt=fmt or os.getenv(LOG_FORMAT_ENV, "json").lower(),
+        stream=stream,
+        queue_size=queue_size if queue_size is not None else int(os.getenv(LOG_QUEUE_SIZE_ENV, DEFAULT_QUEUE_SIZE)),
+        rate_per_second=rate_per_second if rate_per_second is not None else float(os.getenv(LOG_RATE_ENV, DEFAULT_RATE_PER_SECOND)),
+        burst=burst if burst is not None else int(os.getenv(LOG_BURST_ENV, DEFAULT_BURST)),
+        sample_rates=sample_rates if sample_rates is not None else _parse_sample_rates(os.getenv(LOG_SAMPLE_ENV)),
+        target=target
+    )
+
+    root = logging.getLogger()
+    with _pipeline_lock:
+        previous = _pipeline
+        if previous is not None:
+            root.removeHandler(previous.handler)
+            previous.stop()
+        root.addHandler(pipeline.handler)
+        root.setLevel(level)
+        _pipeline = pipeline.start()
+
+    logger.debug("로깅 파이프라인 설치: %s", pipeline.get_stats())
+    return pipeline
+
+
+def get_logging_pipeline() -> Optional[LoggingPipeline]:
+    """설치된 파이프라인 (configure_logging 호출 전이면 None)"""
+    return _pipeline
+
+
+def shutdown_logging() -> None:
+    """파이프라인을 루트 로거에서 제거하고 남은 레코드를 flush"""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is not None:
+            logging.getLogger().removeHandler(_pipeline.handler)
+            _pipeline.stop()
+            _pipeline = None
+
+
+atexit.register(shutdown_logging)
@@ -9,7 +9,10 @@ import os
 import re
 import logging
 import tempfile
-from typing import Dict, List, Any, Optional, Union, Tuple
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterator
 import requests
 from bs4 import BeautifulSoup
 
@@ -36,6 +39,230 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 페이지 병렬 추출 설정
+PAGES_PER_TASK = 16        # 워커 프로세스 작업 하나가 처리하는 페이지 수
+PARALLEL_MIN_PAGES = 32    # 이보다 적은 페이지는 프로세스를 띄우지 않고 현재 프로세스에서 추출
+# 서버 프로세스는 이벤트 루프/스레드 풀을 돌리고 있으므로 fork 대신 깨끗한 프로세스에서 워커를 시작
+WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# ---------------------------------------------------------------------------
+# 전처리 패턴 (모듈 로드 시 한 번만 컴파일)
+# ---------------------------------------------------------------------------
+
+_PARAGRAPH_RUN = re.compile(r'\n{2,}')
+_NEWLINE_RUN = re.compile(r'\n{3,}')
+_HYPHEN_SPACE_SPLIT = re.compile(r'(\w+)-\s+(\w+)')
+_HYPHEN_NEWLINE_SPLIT = re.compile(r'(\w+)-\n(\w+)')
+
+# 1~4단계: 제거만 하는 패턴 (이메일/URL, DOI, 페이지 번호, 학술지 정보, 기관 정보, 학위 정보, 주소)
+# 앞 패턴을 지운 결과에 뒤 패턴이 맞는 경우가 있어 하나의 대안 패턴으로 합치지 않고 순서대로 적용
+_REMOVAL_PATTERNS = [re.compile(pattern) for pattern in (
+    r'\S+@\S+\.\S+',
+    r'(?i:emails?\s*:\s*\S+@\S+\.\S+)',
+    r'https?://\S+|www\.\S+',
+    r'(?i:doi\s*:\s*[\d\.]+\/[\w\.]+)',
+    r'Page\s+\d+\s+of\s+\d+',
+    r'-\s*\d+\s*-',
+    r'\b\d+\s*[-–]\s*\d+\b',  # 페이지 범위
+    r'(?im:©\s*\w+\s*\w+\s*\w+\s*\d{4})',  # © COPYRIGHT INFO
+    r'(?im:article reuse guidelines\s*:.*$)',
+    r'(?im:journals?\.\s*sagepub\.com.*$)',
+    r'(?im:the linacre quarterly.*$)',
+    r'(?im:\d{4}\s*by\s*\w+\s*\w+\s*association)',
+    r'(?i:\(\s*university\s+of\s+[\w\s,]+\))',
+    r'(?i:\(\s*[\w\s]+\s+university[\w\s,]*\))',
+    r'(?is:corresponding\s+author\s*:.*?\.)',
+    r'\b[A-Za-z]{2,5}\s*\(\s*[\w\s,]+\s*\)',  # PhD (Harvard University)
+    r'\b[A-Za-z]{2,5}\s+hons\.',  # BSc hons.
+    r'\d+\s*[–-]\s*\d+\s*[\w\s]+,\s*\w+,\s*\w+\s*\d{4,5},\s*\w+',  # 주소
+)]
+
+_MULTI_SPACE = re.compile(r' {2,}')
+_MULTI_WHITESPACE = re.compile(r'\s{2,}')
+_GLUED_WORD = re.compile(r'([a-zA-Z]{15,})')
+_CAMEL_BOUNDARY = re.compile(r'([a-z])([A-Z])')
+
+# 학술 논문에서 자주 사용되는 복합어 패턴
+_COMPOUND_PATTERNS = [re.compile(pattern) for pattern in (
+    r'(trans|post|pre|non|anti|pro|inter|intra|multi|over|under|sub|super|re|co|de)\s*-\s*([\w]+)',
+    r'(human|self|world|mind|body|life|time|space|based|centered|like|related)\s*-\s*([\w]+)',
+    r'([\w]+)\s*-\s*(based|like|specific|oriented|centered|driven|related|free)'
+)]
+
+# 특수 유니코드 문자 정규화 (한 번의 translate로 처리)
+_SPECIAL_CHARS = str.maketrans({
+    'ﬁ': 'fi', 'ﬂ': 'fl', 'ﬀ': 'ff', 'ﬃ': 'ffi', 'ﬄ': 'ffl',
+    '‘': "'", '’': "'", '“': '"', '”': '"', '–': '-', '—': '-',
+    '…': '...', '′': "'", '″': '"', '„': '"', '‟': '"', '−': '-',
+    '·': '.', '•': '-', '´': "'", '`': "'",
+})
+
+_SENTENCE_BOUNDARY = re.compile(r'([.!?])\s+([A-Z])')
+_REFERENCES_SECTION = re.compile(
+    r'(?:References|Bibliography|참고문헌|REFERENCES|Works Cited)\s*\n+.*$', re.IGNORECASE | re.DOTALL)
+_FOOTNOTE_MARKS = re.compile(r'\[\d+\]|\(\d+\)')
+_NUMBERED_PAREN = re.compile(r'\b\d+\s*\)')  # 숫자) 형태
+_NUMBERED_DOT = re.compile(r'\b\d+\s*\.')  # 숫자. 형태 (번호 목록)
+_CITATION_PAGES = re.compile(r'\(\s*([\w\s]+\s+\d{4})\s*,\s*\d+(?:\s*[-–]\s*\d+)?\s*\)')
+_CITATION_CF = re.compile(r'\(\s*(?:cf|see|e\.g\.|i\.e\.|viz)\.\s+([\w\s]+\s+\d{4})\s*\)')
+_CITATION_PAIR = re.compile(r'\(([\w\s]+\s+\d{4})\)\s*\(([\w\s]+\s+\d{4})\)')
+_KEYWORDS_BREAK = re.compile(r'([.!?])\s+Keywords\b', re.IGNORECASE)
+_ACRONYM_DOTS = re.compile(r'(\b[a-z])\s+\.\s+([a-z])\s+\.')
+_KEYWORDS_SECTION = re.compile(r'keywords\s*:.*?\n\n', re.IGNORECASE | re.DOTALL)
+
+_SPACE_PREFIXES = ('trans', 'inter', 'intra', 'super', 'hyper', 'under', 'over', 'anti', 'auto', 'bio', 'geo', 'neo')
+_SPACE_SUFFIXES = ('tion', 'sion', 'ment', 'ness', 'ship', 'able', 'ible', 'ance', 'ence', 'ism', 'ist', 'ity', 'ing', 'ology')
+
+
+def _insert_spaces(text: str) -> str:
+    """긴 단어 문자열에 공백 삽입 시도 (대소문자 경계, 자주 쓰는 접두사/접미사)"""
+    # 대문자로 시작하는 패턴 찾기
+    result = _CAMEL_BOUNDARY.sub(r'\1 \2', text)
+
+    # 여전히 너무 긴 단어가 있다면 휴리스틱 적용
+    final_result = []
+    for word in result.split():
+        if len(word) > 15:  # 여전히 긴 단어
+            for prefix in _SPACE_PREFIXES:
+                if word.startswith(prefix) and len(word) > len(prefix) + 3:
+                    word = prefix + ' ' + word[len(prefix):]
+                    break
+            for suffix in _SPACE_SUFFIXES:
+                if word.endswith(suffix) and len(word) > len(suffix) + 3:
+                    word = word[:-len(suffix)] + ' ' + suffix
+                    break
+        final_result.append(word)
+
+    return ' '.join(final_result)
+
+
+def normalize_text(text: str) -> Tuple[str, bool]:
+    """
+    추출된 텍스트 정규화 (미리 컴파일한 패턴을 순서대로 한 번씩 적용)
+
+    Args:
+        text: 추출된 원본 텍스트 (문서 전체 또는 연속된 페이지 묶음)
+
+    Returns:
+        (정규화된 텍스트, 참고문헌 섹션을 만나 뒷부분을 잘라냈는지 여부)
+    """
+    if not text:
+        return "", False
+
+    # 0. 줄바꿈 정리 (문장 중간의 줄바꿈은 공백으로 변환, 문단 구분은 유지)
+    text = _PARAGRAPH_RUN.sub(' __PARAGRAPH_BREAK__ ', text)
+    # PDF에서 단어가 줄바꿈으로 하이픈으로 분리된 경우 처리 (예: exam- ple → example)
+    text = _HYPHEN_SPACE_SPLIT.sub(r'\1\2', text)
+    text = text.replace('\n', ' ').replace('__PARAGRAPH_BREAK__', '\n\n')
+
+    # 1~4. 이메일/URL, 학술 논문 특수 패턴, 학위/주소 정보 제거
+    for pattern in _REMOVAL_PATTERNS:
+        text = pattern.sub('', text)
+
+    # 5. 헤더/푸터로 의심되는 반복 줄 제거 (3번 이상 반복되는 줄)
+    lines = text.split('\n')
+    line_counts = Counter(lines)
+    filtered_lines = []
+    for line in lines:
+        line = line.strip()
+        if line and not (len(line) > 5 and line_counts[line] > 2):
+            filtered_lines.append(line)
+
+    # 6. 연속된 공백 정리
+    text = _MULTI_SPACE.sub(' ', '\n'.join(filtered_lines))
+
+    # 7. 단어 사이에 공백이 없는 경우 처리 (뭉개진 단어 탐지 및 수정)
+    text = _GLUED_WORD.sub(lambda m: _insert_spaces(m.group(1)), text)
+
+    # 8. 하이픈으로 분리된 단어 결합
+    text = _HYPHEN_NEWLINE_SPLIT.sub(r'\1\2', text)
+    text = _HYPHEN_SPACE_SPLIT.sub(r'\1\2', text)
+    for pattern in _COMPOUND_PATTERNS:
+        text = pattern.sub(r'\1\2', text)
+
+    # 9. 특수 유니코드 문자 정규화
+    text = text.translate(_SPECIAL_CHARS)
+
+    # 10. 문단 경계 복원 (빈 줄로 구분)
+    text = _SENTENCE_BOUNDARY.sub(r'\1\n\n\2', text)
+
+    # 11. 참고문헌 섹션 제거 (이후 내용 전체)
+    text, references_removed = _REFERENCES_SECTION.subn('', text)
+
+    # 12. 각주 및 미주 번호 정리
+    text = _FOOTNOTE_MARKS.sub('', text)
+    text = _NUMBERED_PAREN.sub('', text)
+    text = _NUMBERED_DOT.sub('', text)
+
+    # 13. 인용 정보 정리 (핵심 인용은 유지, 부가 정보만 제거)
+    text = _CITATION_PAGES.sub(r'(\1)', text)  # (Author 2020, 10-15) -> (Author 2020)
+    text = _CITATION_CF.sub(r'(\1)', text)  # (cf. Smith 2020) -> (Smith 2020)
+    text = _CITATION_PAIR.sub(r'(\1, \2)', text)  # (Smith 2020)(Jones 2021) -> (Smith 2020, Jones 2021)
+
+    # 14. 키워드 섹션에 대한 특별 처리 (Keywords를 별도 문단으로)
+    text = _KEYWORDS_BREAK.sub(r'\1\n\nKeywords', text)
+
+    # 15. 공백 라인 정리
+    text = _NEWLINE_RUN.sub('\n\n', text)
+
+    # 16. 의미없는 짧은 줄 제거 (의미있는 길이이거나 문장 끝인 경우만 유지)
+    meaningful_lines = [line.strip() for line in text.split('\n')
+                        if len(line.strip()) > 5 or (line.strip() and line.strip()[-1] in '.!?')]
+
+    # 17. 학술 용어 두문자어 정리 (예: i . e. -> i.e.)
+    text = _ACRONYM_DOTS.sub(r'\1.\2.', '\n'.join(meaningful_lines))
+
+    # 18. 키워드 섹션 제거
+    text = _KEYWORDS_SECTION.sub('', text)
+
+    # 19. 한 번 더 연속된 공백 정리
+    text = _MULTI_WHITESPACE.sub(' ', text)
+
+    # 20. 최종 문장 정리 (문단 구분은 빈 줄로 유지)
+    text = '\n\n'.join(paragraph.replace('\n', ' ') for paragraph in text.split('\n\n'))
+
+    return text.strip(), references_removed > 0
+
+
+# ---------------------------------------------------------------------------
+# 워커 프로세스에서 실행되는 페이지 추출 함수 (pickle 가능하도록 모듈 수준에 정의)
+# ---------------------------------------------------------------------------
+
+def _count_pages(pdf_path: str, method: str) -> int:
+    if method == "pymupdf":
+        with fitz.open(pdf_path) as doc:
+            return doc.page_count
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_page_range(pdf_path: str, method: str, start: int, end: int) -> List[str]:
+    """
+    [start, end) 페이지의 텍스트 추출
+
+    Returns:
+        페이지별 텍스트 (각 페이지 뒤에 문단 구분 포함, 이어 붙이면 문서 텍스트)
+    """
+    pages = []
+    if method == "pymupdf":
+        with fitz.open(pdf_path) as doc:
+            for page_number in range(start, end):
+                # 블록 단위로 텍스트 추출 (레이아웃 보존, 이미지 블록은 건너뜀)
+                blocks = doc[page_number].get_text("blocks")
+                pages.append("".join(block[4] + "\n\n" for block in blocks
+                                     if block[6] == 0 and block[4].strip()))
+    else:
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_number in range(start, end):
+                pages.append((pdf.pages[page_number].extract_text() or "") + "\n\n")
+    return pages
+
+
+def _extract_and_normalize(pdf_path: str, method: str, start: int, end: int) -> Tuple[str, bool]:
+    """[start, end) 페이지를 추출해서 정규화 (스트리밍 수집용)"""
+    return normalize_text(_NEWLINE_RUN.sub('\n\n', "".join(_extract_page_range(pdf_path, method, start, end))))
+
+
 class PDFProcessor:
     """
     PDF 처리 클래스
@@ -47,7 +274,9 @@ class PDFProcessor:
                  use_grobid: bool = False, 
                  grobid_url: str = "http://localhost:8070",
                  extraction_method: str = "pymupdf",
-                 temp_dir: Optional[str] = None):
+                 temp_dir: Optional[str] = None,
+                 max_workers: Optional[int] = None,
+                 pages_per_task: int = PAGES_PER_TASK):
         """
         PDF 프로세서 초기화
         
@@ -56,11 +285,15 @@ class PDFProcessor:
             grobid_url: Grobid 서버 URL
             extraction_method: 텍스트 추출 방법 ('pymupdf', 'pdfplumber')
             temp_dir: 임시 파일 디렉토리
+            max_workers: 페이지 추출 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 추출)
+            pages_per_task: 워커 작업 하나가 처리하는 페이지 수
         """
         self.use_grobid = use_grobid
         self.grobid_url = grobid_url
         self.temp_dir = temp_dir
         self.extraction_method = extraction_method
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.pages_per_task = max(1, pages_per_task)
         
         # 추출 방법 가용성 검사
         if extraction_method == "pymupdf" and not PYMUPDF_AVAILABLE:
@@ -309,285 +542,165 @@ class PDFProcessor:
     def _extract_text_basic(self, pdf_path: str) -> str:
         """
         기본 방식으로 PDF에서 텍스트 추출
-        
+
         Args:
             pdf_path: PDF 파일 경로
-            
+
         Returns:
             추출된 텍스트
         """
         logger.info(f"기본 방식으로 텍스트 추출 시작: {pdf_path} (방식: {self.extraction_method})")
-        
-        # PyMuPDF 방식 사용
+        try:
+            text = "".join(self.iter_pages(pdf_path))
+        except Exception as e:
+            logger.error(f"PDF 텍스트 추출 실패: {str(e)}")
+            return ""
+
+        # 여러 줄바꿈 정리
+        return _NEWLINE_RUN.sub('\n\n', text)
+
+    def _resolve_method(self, pdf_path: str) -> Tuple[str, int]:
+        """사용할 추출 방식과 페이지 수 (PyMuPDF 실패 시 pdfplumber로 전환)"""
         if self.extraction_method == "pymupdf" and PYMUPDF_AVAILABLE:
             try:
-                text = ""
-                with fitz.open(pdf_path) as doc:
-                    for page in doc:
-                        # 블록 단위로 텍스트 추출 (레이아웃 보존)
-                        blocks = page.get_text("blocks")
-                        for block in blocks:
-                            # 이미지 블록은 건너뜀 (인덱스 6이 0이 아닌 경우)
-                            if block[6] == 0:  # 텍스트 블록
-                                block_text = block[4]
-                                if block_text.strip():
-                                    text += block_text + "\n\n"
-                
-                # 여러 줄바꿈 정리
-                text = re.sub(r'\n{3,}', '\n\n', text)
-                return text
-                
+                return "pymupdf", _count_pages(pdf_path, "pymupdf")
             except Exception as e:
                 logger.error(f"PyMuPDF 텍스트 추출 실패: {str(e)}")
-                if PDFPLUMBER_AVAILABLE:
-                    logger.info("pdfplumber로 전환합니다.")
-                else:
-                    return ""
-        
-        # PDFPlumber 방식 사용
+                if not PDFPLUMBER_AVAILABLE:
+                    raise
+                logger.info("pdfplumber로 전환합니다.")
         if PDFPLUMBER_AVAILABLE:
-            try:
-                text = ""
-                with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text() or ""
-                        text += page_text + "\n\n"
-                
-                # 여러 줄바꿈 정리
-                text = re.sub(r'\n{3,}', '\n\n', text)
-                return text
-                
-            except Exception as e:
-                logger.error(f"PDFPlumber 텍스트 추출 실패: {str(e)}")
-                return ""
-        
-        logger.error("적합한 PDF 텍스트 추출 방법이 없습니다.")
-        return ""
-    
+            return "pdfplumber", _count_pages(pdf_path, "pdfplumber")
+        raise RuntimeError("적합한 PDF 텍스트 추출 방법이 없습니다.")
+
+    def _run_page_tasks(self, task, pdf_path: str) -> Iterator[Any]:
+        """
+        페이지 범위별 작업을 워커 프로세스에서 실행하고 결과를 페이지 순서대로 반환
+
+        Args:
+            task: (pdf_path, method, start, end)를 받는 모듈 수준 함수
+            pdf_path: PDF 파일 경로
+        """
+        method, page_count = self._resolve_method(pdf_path)
+        ranges = [(start, min(start + self.pages_per_task, page_count))
+                  for start in range(0, page_count, self.pages_per_task)]
+
+        if self.max_workers <= 1 or page_count < PARALLEL_MIN_PAGES:
+            for start, end in ranges:
+                yield task(pdf_path, method, start, end)
+            return
+
+        logger.info(f"📄 {page_count}페이지를 {len(ranges)}개 작업으로 병렬 추출 (워커 {self.max_workers}개)")
+        executor = ProcessPoolExecutor(max_workers=min(self.max_workers, len(ranges)),
+                                       mp_context=multiprocessing.get_context(WORKER_START_METHOD))
+        try:
+            futures = [executor.submit(task, pdf_path, method, start, end) for start, end in ranges]
+            for future in futures:
+                yield future.result()
+        finally:
+            # 소비자가 중간에 멈추면 남은 작업은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_pages(self, pdf_path: str) -> Iterator[str]:
+        """
+        페이지별 원본 텍스트를 순서대로 반환 (큰 문서는 워커 프로세스에서 병렬 추출)
+
+        Args:
+            pdf_path: PDF 파일 경로
+
+        Returns:
+            페이지 텍스트 이터레이터 (각 페이지 뒤에 문단 구분 포함)
+        """
+        for pages in self._run_page_tasks(_extract_page_range, pdf_path):
+            yield from pages
+
+    def iter_processed_text(self, pdf_path: str) -> Iterator[str]:
+        """
+        전처리된 텍스트를 페이지 묶음(pages_per_task) 단위로 순서대로 반환
+
+        추출과 정규화를 워커 프로세스에서 함께 수행하므로, 호출부는 앞쪽 묶음을 청크화/임베딩하는
+        동안 뒤쪽 페이지가 처리됩니다. 헤더/푸터 반복 줄은 묶음 안에서 판별하며, 참고문헌 섹션을
+        만나면 이후 묶음은 반환하지 않습니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+
+        Returns:
+            전처리된 텍스트 이터레이터
+        """
+        if not os.path.exists(pdf_path):
+            logger.error(f"PDF 파일을 찾을 수 없음: {pdf_path}")
+            return
+
+        for text, references_removed in self._run_page_tasks(_extract_and_normalize, pdf_path):
+            if text:
+                yield text
+            if references_removed:
+                logger.info("참고문헌 섹션 이후 페이지는 건너뜁니다.")
+                return
+
     def _preprocess_text(self, text: str) -> str:
         """
         추출된 텍스트 전처리
-        
+
         Args:
             text: 추출된 원본 텍스트
-            
+
         Returns:
             전처리된 텍스트
         """
-        if not text:
-            return ""
-        
-        # 0. 줄바꿈 정리 (문장 중간의 줄바꿈은 공백으로 변환, 문단 구분은 유지)
-        # 먼저, 여러 개의 연속된 줄바꿈을 임시 표시자로 변환 (문단 구분으로 유지하기 위함)
-        text = re.sub(r'\n{2,}', ' __PARAGRAPH_BREAK__ ', text)
-        
-        # PDF에서 단어가 줄바꿈으로 하이픈으로 분리된 경우 처리 (예: exam- ple → example)
-        # 특히 "- " 패턴 (하이픈 뒤에 공백)이 있는 경우를 처리
-        text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', text)
-        
-        # 줄바꿈을 공백으로 변환 (문장 중간의 줄바꿈)
-        text = re.sub(r'\n', ' ', text)
-        
-        # 임시 표시자를 두 개의 줄바꿈으로 다시 변환 (문단 구분 복원)
-        text = re.sub(r'__PARAGRAPH_BREAK__', '\n\n', text)
-        
-        # 1. 이메일 주소와 웹사이트 제거
-        text = re.sub(r'\S+@\S+\.\S+', '', text)
-        text = re.sub(r'emails?\s*:\s*\S+@\S+\.\S+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'https?://\S+|www\.\S+', '', text)
-        
-        # 2. 학술 논문 특수 패턴 제거
-        # DOI 제거
-        text = re.sub(r'doi\s*:\s*[\d\.]+\/[\w\.]+', '', text, flags=re.IGNORECASE)
-        
-        # 2-1. 페이지 번호 패턴 제거 
-        text = re.sub(r'Page\s+\d+\s+of\s+\d+', '', text)
-        text = re.sub(r'-\s*\d+\s*-', '', text)
-        text = re.sub(r'\b\d+\s*[-–]\s*\d+\b', '', text)  # 페이지 범위
-        
-        # 2-2. 학술지 정보 제거
-        journal_patterns = [
-            r'©\s*\w+\s*\w+\s*\w+\s*\d{4}',  # © COPYRIGHT INFO
-            r'article reuse guidelines\s*:.*$',
-            r'journals?\.\s*sagepub\.com.*$',
-            r'the linacre quarterly.*$',
-            r'\d{4}\s*by\s*\w+\s*\w+\s*association',
-        ]
-        for pattern in journal_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
-        
-        # 2-3. 저자 정보 및 기관 정보 정리
-        # 괄호 안의 기관 정보
-        text = re.sub(r'\(\s*university\s+of\s+[\w\s,]+\)', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\(\s*[\w\s]+\s+university[\w\s,]*\)', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'corresponding\s+author\s*:.*?\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-        
-        # 3. 학위 정보 제거
-        degree_patterns = [
-            r'\b[A-Za-z]{2,5}\s*\(\s*[\w\s,]+\s*\)',  # PhD (Harvard University)
-            r'\b[A-Za-z]{2,5}\s+hons\.',  # BSc hons.
-        ]
-        for pattern in degree_patterns:
-            text = re.sub(pattern, '', text)
-        
-        # 4. 주소 정보 제거
-        address_pattern = r'\d+\s*[–-]\s*\d+\s*[\w\s]+,\s*\w+,\s*\w+\s*\d{4,5},\s*\w+'
-        text = re.sub(address_pattern, '', text)
-        
-        # 5. 헤더/푸터로 의심되는 반복 패턴 제거
-        lines = text.split('\n')
-        filtered_lines = []
-        header_footer_candidates = set()
-        
-        # 반복되는 줄 식별
-        for line in lines:
-            line = line.strip()
-            if line and len(line) > 5:  # 짧은 줄 무시
-                if lines.count(line) > 2:  # 3번 이상 반복되면 헤더/푸터로 간주
-                    header_footer_candidates.add(line)
-        
-        # 헤더/푸터가 아닌 줄만 유지
-        for line in lines:
-            line = line.strip()
-            if line and line not in header_footer_candidates:
-                filtered_lines.append(line)
-        
-        # 6. 연속된 공백 정리
-        text = '\n'.join(filtered_lines)
-        text = re.sub(r' {2,}', ' ', text)
-        
-        # 7. 단어 사이에 공백이 없는 경우 처리 (뭉개진 단어 탐지 및 수정)
-        text = re.sub(r'([a-zA-Z]{15,})', lambda m: self._insert_spaces(m.group(1)), text)
-        
-        # 8. 하이픈으로 분리된 단어 결합
-        # 8.1 줄바꿈과 함께 하이픈으로 분리된 단어 결합
-        text = re.sub(r'(\w+)-\n(\w+)', r'\1\2', text)
-        
-        # 8.2 하이픈과 공백으로 분리된 단어 결합 (예: trans- humanist → transhumanist)
-        text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', text)
-        
-        # 8.3 하이픈으로 분리된 단어 중 명확한 패턴 결합 (문장 중간에 있는 하이픈으로 분리된 단어)
-        # 학술 논문에서 자주 사용되는 복합어 패턴
-        compound_patterns = [
-            r'(trans|post|pre|non|anti|pro|inter|intra|multi|over|under|sub|super|re|co|de)\s*-\s*([\w]+)',
-            r'(human|self|world|mind|body|life|time|space|based|centered|like|related)\s*-\s*([\w]+)',
-            r'([\w]+)\s*-\s*(based|like|specific|oriented|centered|driven|related|free)'
-        ]
-        
-        for pattern in compound_patterns:
-            text = re.sub(pattern, r'\1\2', text)
-        
-        # 9. 특수 유니코드 문자 정규화
-        special_chars = {
-            'ﬁ': 'fi', 'ﬂ': 'fl', 'ﬀ': 'ff', 'ﬃ': 'ffi', 'ﬄ': 'ffl',
-            ''': "'", ''': "'", '"': '"', '"': '"', '–': '-', '—': '-',
-            '…': '...', '′': "'", '″': '"', '„': '"', '‟': '"', '−': '-',
-            '·': '.', '•': '-', '´': "'", '`': "'", '′': "'", '″': '"',
-        }
-        for char, replacement in special_chars.items():
-            text = text.replace(char, replacement)
-        
-        # 10. 문단 경계 복원 (빈 줄로 구분)
-        text = re.sub(r'([.!?])\s+([A-Z])', r'\1\n\n\2', text)
-        
-        # 11. 참고문헌 섹션 제거
-        references_patterns = [
-            r'References\s*\n+.*$',
-            r'Bibliography\s*\n+.*$',
-            r'참고문헌\s*\n+.*$',
-            r'REFERENCES\s*\n+.*$',
-            r'Works Cited\s*\n+.*$',
-        ]
-        for pattern in references_patterns:
-            if re.search(pattern, text, re.IGNORECASE | re.DOTALL):
-                text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-        
-        # 12. 각주 및 미주 번호 정리
-        text = re.sub(r'\[\d+\]|\(\d+\)', '', text)
-        text = re.sub(r'\b\d+\s*\)', '', text)  # 숫자) 형태 제거
-        text = re.sub(r'\b\d+\s*\.', '', text)  # 숫자. 형태 제거 (번호 목록)
-        
-        # 13. 인용 정보 정리 (핵심 인용은 유지, 부가 정보만 제거)
-        # 페이지 번호, 출판사 정보 등 부가 정보는 제거하되 기본 저자-연도 인용은 유지
-        text = re.sub(r'\(\s*([\w\s]+\s+\d{4})\s*,\s*\d+(?:\s*[-–]\s*\d+)?\s*\)', r'(\1)', text)  # (Author 2020, 10-15) -> (Author 2020)
-        text = re.sub(r'\(\s*(?:cf|see|e\.g\.|i\.e\.|viz)\.\s+([\w\s]+\s+\d{4})\s*\)', r'(\1)', text)  # (cf. Smith 2020) -> (Smith 2020)
-        
-        # 인용 중복 정리 (같은 문장에 여러 개 인용이 있는 경우)
-        text = re.sub(r'\(([\w\s]+\s+\d{4})\)\s*\(([\w\s]+\s+\d{4})\)', r'(\1, \2)', text)  # (Smith 2020)(Jones 2021) -> (Smith 2020, Jones 2021)
-        
-        # 14. 키워드 섹션에 대한 특별 처리 (Keywords를 별도 문단으로)
-        text = re.sub(r'([.!?])\s+Keywords\b', r'\1\n\nKeywords', text, flags=re.IGNORECASE)
-        
-        # 15. 공백 라인 정리
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        # 16. 의미없는 짧은 줄 제거
-        lines = text.split('\n')
-        meaningful_lines = []
-        for line in lines:
-            line = line.strip()
-            if len(line) > 5 or (line and line[-1] in '.!?'):  # 의미있는 길이이거나 문장 끝인 경우
-                meaningful_lines.append(line)
-        
-        # 17. 학술 용어 두문자어 정리 (예: i . e. -> i.e.)
-        text = '\n'.join(meaningful_lines)
-        text = re.sub(r'(\b[a-z])\s+\.\s+([a-z])\s+\.', r'\1.\2.', text)
-        
-        # 18. 키워드 섹션 제거
-        text = re.sub(r'keywords\s*:.*?\n\n', '', text, flags=re.IGNORECASE | re.DOTALL)
-        
-        # 19. 한 번 더 연속된 공백 정리
-        text = re.sub(r'\s{2,}', ' ', text)
-        
-        # 20. 최종 문장 정리 (줄바꿈이 포함된 문장을 일관되게 처리)
-        sentences = []
-        for paragraph in text.split('\n\n'):
-            # 각 문단 내의 문장 결합
-            clean_paragraph = re.sub(r'\n', ' ', paragraph)
-            # 문단별로 구분하여 추가
-            sentences.append(clean_paragraph)
-        
-        # 문단 구분은 빈 줄로 유지
-        text = '\n\n'.join(sentences)
-        
-        return text.strip()
-    
+        return normalize_text(text)[0]
+
     def _insert_spaces(self, text: str) -> str:
         """
         긴 단어 문자열에 공백 삽입 시도
-        
+
         Args:
             text: 공백 없는 긴 문자열
-            
+
         Returns:
             공백이 삽입된 문자열
         """
-        # 대문자로 시작하는 패턴 찾기
-        result = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
-        
-        # 여전히 너무 긴 단어가 있다면 휴리스틱 적용
-        words = result.split()
-        final_result = []
-        
-        for word in words:
-            if len(word) > 15:  # 여전히 긴 단어
-                # 자주 사용되는 접두사 분리
-                prefixes = ['trans', 'inter', 'intra', 'super', 'hyper', 'under', 'over', 'anti', 'auto', 'bio', 'geo', 'neo']
-                for prefix in prefixes:
-                    if word.startswith(prefix) and len(word) > len(prefix) + 3:
-                        word = prefix + ' ' + word[len(prefix):]
-                        break
-                
-                # 자주 사용되는 접미사 분리
-                suffixes = ['tion', 'sion', 'ment', 'ness', 'ship', 'able', 'ible', 'ance', 'ence', 'ism', 'ist', 'ity', 'ing', 'ology']
-                for suffix in suffixes:
-                    if word.endswith(suffix) and len(word) > len(suffix) + 3:
-                        word = word[:-len(suffix)] + ' ' + suffix
-                        break
-            
-            final_result.append(word)
-        
-        return ' '.join(final_result)
+        return _insert_spaces(text)
+
+
+def benchmark_pdf(pdf_path: str, extraction_method: str = "pymupdf", max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    로컬 PDF로 추출/전처리 시간 측정 (순차 추출 vs 페이지 병렬 스트리밍)
+
+    Args:
+        pdf_path: PDF 파일 경로
+        extraction_method: 텍스트 추출 방법 ('pymupdf', 'pdfplumber')
+        max_workers: 병렬 추출 워커 프로세스 수
+
+    Returns:
+        측정 결과 (초 단위)
+    """
+    import time
+
+    sequential = PDFProcessor(extraction_method=extraction_method, max_workers=1)
+    start = time.perf_counter()
+    sequential_text = sequential.process_pdf(pdf_path)
+    sequential_seconds = time.perf_counter() - start
+
+    parallel = PDFProcessor(extraction_method=extraction_method, max_workers=max_workers)
+    start = time.perf_counter()
+    first_chunk_seconds = None
+    streamed_chars = 0
+    for text in parallel.iter_processed_text(pdf_path):
+        if first_chunk_seconds is None:
+            first_chunk_seconds = time.perf_counter() - start
+        streamed_chars += len(text)
+    streaming_seconds = time.perf_counter() - start
+
+    return {
+        "sequential_seconds": round(sequential_seconds, 3),
+        "sequential_chars": len(sequential_text),
+        "streaming_seconds": round(streaming_seconds, 3),
+        "streaming_first_chunk_seconds": round(first_chunk_seconds or 0.0, 3),
+        "streaming_chars": streamed_chars,
+        "workers": parallel.max_workers
+    }
 
 
 def process_pdf(pdf_path: str, use_grobid: bool = False, grobid_url: str = "http://localhost:8070", extraction_method: str = "pymupdf") -> str:
@@ -616,9 +729,17 @@ if __name__ == "__main__":
     parser.add_argument("--grobid", "-g", action="store_true", help="Grobid 사용")
     parser.add_argument("--grobid-url", default="http://localhost:8070", help="Grobid 서버 URL")
     parser.add_argument("--method", "-m", choices=["pymupdf", "pdfplumber"], default="pymupdf", help="텍스트 추출 방법")
+    parser.add_argument("--benchmark", "-b", action="store_true", help="순차 추출과 병렬 스트리밍 추출 시간 비교")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="병렬 추출 워커 프로세스 수")
     
     args = parser.parse_args()
     
+    if args.benchmark:
+        import json
+        print(json.dumps(benchmark_pdf(args.pdf_path, extraction_method=args.method, max_workers=args.workers),
+                         indent=2, ensure_ascii=False))
+        raise SystemExit(0)
+    
     # PDF 처리
     processed_text = process_pdf(
         args.pdf_path, 
@@ -0,0 +1,475 @@
+"""
+Span Tracing Module
+
+토론 처리 경로(방 → 턴 → 에이전트 단계 → RAG 검색 / LLM 호출 / 감정 추론 / 전략 선택)를
+중첩된 span으로 기록하는 경량 트레이싱 레이어입니다.
+
+- 현재 span은 ContextVar로 전파되므로 asyncio 태스크에는 자동으로 이어지고,
+  스레드 풀에 넘기는 작업은 wrap_context()로 감싸면 부모 span이 유지됩니다.
+- 완료된 span은 방별 링 버퍼에 보관되어 get_room_waterfall()로 최근 N턴의 워터폴을 조회할 수 있고,
+  export_path가 설정되면 JSON lines 또는 OTLP(OpenTelemetry) JSON 형식으로 파일에 기록됩니다.
+- 비활성화 상태(기본값, SAPIENS_TRACE 미설정)에서는 span()이 미리 만든 no-op 컨텍스트를 반환하므로
+  호출 비용이 함수 호출 한 번 수준입니다.
+"""
+
+import os
+import json
+import time
+import uuid
+import hashlib
+import logging
+import functools
+import threading
+import contextvars
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Deque
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENV_FLAG = "SAPIENS_TRACE"
+TRACE_FILE_ENV = "SAPIENS_TRACE_FILE"
+TRACE_FORMAT_ENV = "SAPIENS_TRACE_FORMAT"
+
+EXPORT_FORMATS = ("jsonl", "otlp")
+DEFAULT_MAX_SPANS_PER_ROOM = 2000
+DEFAULT_MAX_ROOMS = 200
+
+# span 종류: OTLP SpanKind로 변환할 때는 모두 INTERNAL(1)로 내보내고 원래 종류는 속성에 남김
+SPAN_KINDS = ("room", "turn", "agent", "rag", "llm", "emotion", "strategy", "internal")
+
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar("sapiens_current_span", default=None)
+
+
+def _room_trace_id(room_id: Optional[str]) -> str:
+    """방 ID로부터 결정적인 32자리 trace ID 생성 (같은 방의 턴들이 한 trace로 묶임)"""
+    if not room_id:
+        return uuid.uuid4().hex
+    return hashlib.md5(str(room_id).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class Span:
+    """하나의 작업 구간"""
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    room_id: Optional[str] = None
+    turn_id: Optional[str] = None
+    start_ns: int = 0
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+    def set(self, key: str, value: Any) -> None:
+        """속성 하나 기록"""
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        """속성 여러 개 기록 (None 값은 무시)"""
+        for key, value in attributes.items():
+            if value is not None:
+                self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """예외 기록"""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON lines 내보내기 / API 응답용 딕셔너리"""
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "room_id": self.room_id,
+            "turn_id": self.turn_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error
+        }
+
+    def to_otel(self) -> Dict[str, Any]:
+        """OTLP/JSON span 표현"""
+        attributes = [{"key": "sapiens.kind", "value": {"stringValue": self.kind}}]
+        if self.room_id:
+            attributes.append({"key": "sapiens.room_id", "value": {"stringValue": str(self.room_id)}})
+        for key, value in self.attributes.items():
+            attributes.append({"key": key, "value": _otel_value(value)})
+
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": attributes,
+            "status": {"code": 2, "message": self.error or ""} if self.status == "error" else {"code": 1}
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otel_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class _NoopSpan:
+    """트레이싱 비활성화 시 반환되는 span (모든 기록을 무시)"""
+    name = ""
+    kind = "internal"
+    span_id = None
+    room_id = None
+    attributes: Dict[str, Any] = {}
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+    def __bool__(self) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _NoopSpanContext:
+    def __enter__(self) -> _NoopSpan:
+        return NOOP_SPAN
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_CONTEXT = _NoopSpanContext()
+
+
+class _SpanContext:
+    """span 시작/종료와 ContextVar 설정/복원을 담당하는 컨텍스트 매니저"""
+
+    __slots__ = ("_tracer", "_span", "_token")
+
+    def __init__(self, tracer: 'Tracer', span: Span):
+        self._tracer = tracer
+        self._span = span
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc is not None:
+            self._span.record_error(exc)
+        self._span.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        self._tracer._finish(self._span)
+        return False
+
+
+class Tracer:
+    """
+    span 생성, 방별 보관, 파일 내보내기를 담당하는 트레이서
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, export_path: Optional[str] = None,
+                 export_format: Optional[str] = None,
+                 max_spans_per_room: int = DEFAULT_MAX_SPANS_PER_ROOM,
+                 max_rooms: int = DEFAULT_MAX_ROOMS):
+        """
+        Tracer 초기화
+
+        Args:
+            enabled: 활성화 여부 (None이면 SAPIENS_TRACE 환경 변수)
+            export_path: span을 기록할 파일 경로 (None이면 SAPIENS_TRACE_FILE, 없으면 메모리에만 보관)
+            export_format: "jsonl" 또는 "otlp" (None이면 SAPIENS_TRACE_FORMAT, 기본 jsonl)
+            max_spans_per_room: 방별로 보관할 최대 span 수
+            max_rooms: span을 보관할 최대 방 수 (가장 오래 기록되지 않은 방부터 제거)
+        """
+        self.max_spans_per_room = max_spans_per_room
+        self.max_rooms = max_rooms
+        self._rooms: 'OrderedDict[str, Deque[Span]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._export_file = None
+        self.enabled = False
+        self.export_path = None
+        self.export_format = "jsonl"
+
+        if enabled is None:
+            enabled = os.environ.get(TRACE_ENV_FLAG, "").lower() in ("1", "true", "yes", "on")
+        self.configure(
+            enabled=enabled,
+            export_path=export_path if export_path is not None else os.environ.get(TRACE_FILE_ENV),
+            export_format=export_format or os.environ.get(TRACE_FORMAT_ENV, "jsonl")
+        )
+
+    def configure(self, enabled: Optional[bool] = None, export_path: Optional[str] = None,
+                  export_format: Optional[str] = None) -> None:
+        """
+        런타임 설정 변경
+
+        Args:
+            enabled: 활성화 여부 (None이면 유지)
+            export_path: 내보내기 파일 경로 (None이면 유지, ""이면 파일 내보내기 해제)
+            export_format: "jsonl" 또는 "otlp" (None이면 유지)
+        """
+        if export_format is not None:
+            if export_format not in EXPORT_FORMATS:
+                raise ValueError(f"Unsupported trace export format: {export_format}")
+            self.export_format = export_format
+        if export_path is not None:
+            with self._export_lock:
+                self._close_export_file()
+                self.export_path = export_path or None
+        if enabled is not None:
+            self.enabled = bool(enabled)
+
+    # ------------------------------------------------------------------
+    # span 생성
+    # ------------------------------------------------------------------
+
+    def span(self, name: str, kind: str = "internal", room_id: Optional[str] = None, **attributes: Any):
+        """
+        현재 span의 자식 span을 여는 컨텍스트 매니저
+
+        Args:
+            name: span 이름 (예: "llm.generate")
+            kind: span 종류 (SPAN_KINDS)
+            room_id: 방 ID (없으면 부모 span에서 상속)
+            **attributes: 초기 속성
+
+        Returns:
+            with 문에서 Span (비활성화 시 NOOP_SPAN)을 돌려주는 컨텍스트 매니저
+        """
+        if not self.enabled:
+            return _NOOP_CONTEXT
+
+        parent = _current_span.get()
+        if room_id is None and parent is not None:
+            room_id = parent.room_id
+        span_id = uuid.uuid4().hex[:16]
+
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=parent.trace_id if parent is not None else _room_trace_id(room_id),
+            span_id=span_id,
+            parent_id=parent.span_id if parent is not None else None,
+            room_id=room_id,
+            turn_id=span_id if kind == "turn" else (parent.turn_id if parent is not None else None),
+            start_ns=time.time_ns(),
+            attributes={k: v for k, v in attributes.items() if v is not None}
+        )
+        return _SpanContext(self, span)
+
+    def _finish(self, span: Span) -> None:
+        if span.room_id:
+            with self._lock:
+                spans = self._rooms.get(span.room_id)
+                if spans is None:
+                    spans = deque(maxlen=self.max_spans_per_room)
+                    self._rooms[span.room_id] = spans
+                    while len(self._rooms) > self.max_rooms:
+                        self._rooms.popitem(last=False)
+                else:
+                    self._rooms.move_to_end(span.room_id)
+                spans.append(span)
+        if self.export_path:
+            self._export(span)
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+
+    def _export(self, span: Span) -> None:
+        if self.export_format == "otlp":
+            record = {
+                "resourceSpans": [{
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "sapiens-engine"}}]},
+                    "scopeSpans": [{"scope": {"name": "sapiens.tracing"}, "spans": [span.to_otel()]}]
+                }]
+            }
+        else:
+            record = span.to_dict()
+
+        try:
+            line = json.dumps(record, ensure_ascii=False, default=str)
+            with self._export_lock:
+                if self._export_file is None and self.export_path:
+                    directory = os.path.dirname(self.export_path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    self._export_file = open(self.export_path, "a", encoding="utf-8")
+                if self._export_file is not None:
+                    self._export_file.write(line + "\n")
+                    self._export_file.flush()
+        except Exception as e:
+            logger.error(f"Failed to export trace span {span.name}: {str(e)}")
+
+    def _close_export_file(self) -> None:
+        if self._export_file is not None:
+            try:
+                self._export_file.close()
+            except Exception:
+                pass
+            self._export_file = None
+
+    def close(self) -> None:
+        """내보내기 파일 닫기"""
+        with self._export_lock:
+            self._close_export_file()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get_room_spans(self, room_id: str) -> List[Span]:
+        """방에 보관된 완료 span 목록 (완료 순서)"""
+        with self._lock:
+            return list(self._rooms.get(room_id, ()))
+
+    def get_room_waterfall(self, room_id: str, last_n_turns: int = 5) -> Dict[str, Any]:
+        """
+        방의 최근 N턴 워터폴
+
+        Args:
+            room_id: 방 ID
+            last_n_turns: 조회할 최근 턴 수
+
+        Returns:
+            턴별로 시작 시점 기준 오프셋(ms)과 깊이를 붙인 span 목록
+        """
+        spans = self.get_room_spans(room_id)
+        turn_spans = [span for span in spans if span.kind == "turn"]
+        if last_n_turns > 0:
+            turn_spans = turn_spans[-last_n_turns:]
+        else:
+            turn_spans = []
+
+        by_turn: Dict[str, List[Span]] = {}
+        for span in spans:
+            if span.turn_id and span.kind != "turn":
+                by_turn.setdefault(span.turn_id, []).append(span)
+
+        turns = []
+        for turn in turn_spans:
+            depths = {turn.span_id: 0}
+            children = sorted(by_turn.get(turn.span_id, []), key=lambda s: s.start_ns)
+            entries = []
+            for child in children:
+                depth = depths.get(child.parent_id, 0) + 1
+                depths[child.span_id] = depth
+                entries.append({
+                    "name": child.name,
+                    "kind": child.kind,
+                    "span_id": child.span_id,
+                    "parent_id": child.parent_id,
+                    "depth": depth,
+                    "offset_ms": round((child.start_ns - turn.start_ns) / 1_000_000, 3),
+                    "duration_ms": round(child.duration_ms, 3),
+                    "attributes": child.attributes,
+                    "status": child.status,
+                    "error": child.error
+                })
+            turns.append({
+                "turn_id": turn.span_id,
+                "name": turn.name,
+                "start_ns": turn.start_ns,
+                "duration_ms": round(turn.duration_ms, 3),
+                "attributes": turn.attributes,
+                "status": turn.status,
+                "error": turn.error,
+                "spans": entries
+            })
+
+        return {
+            "room_id": room_id,
+            "enabled": self.enabled,
+            "turn_count": len(turns),
+            "turns": turns
+        }
+
+    def clear(self, room_id: Optional[str] = None) -> None:
+        """방(또는 전체)의 보관 span 삭제"""
+        with self._lock:
+            if room_id is None:
+                self._rooms.clear()
+            else:
+                self._rooms.pop(room_id, None)
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """프로세스 전역 Tracer 반환"""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer()
+    return _tracer
+
+
+def current_span():
+    """현재 span (없거나 비활성화 상태면 NOOP_SPAN)"""
+    span = _current_span.get()
+    return span if span is not None else NOOP_SPAN
+
+
+def traced(name: Optional[str] = None, kind: str = "internal") -> Callable:
+    """
+    함수 호출 전체를 span으로 감싸는 데코레이터
+
+    Args:
+        name: span 이름 (없으면 함수의 qualname)
+        kind: span 종류
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(span_name, kind=kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def wrap_context(func: Callable, *args: Any, **kwargs: Any) -> Callable[[], Any]:
+    """
+    현재 컨텍스트(현재 span 포함)를 캡처해 다른 스레드에서 실행할 callable 생성
+
+    ThreadPoolExecutor.submit / loop.run_in_executor는 ContextVar를 복사하지 않으므로
+    작업을 넘기기 전에 이 함수로 감쌉니다.
+    """
+    context = contextvars.copy_context()
+    return functools.partial(context.run, func, *args, **kwargs)
@@ -0,0 +1,107 @@
+"""
+Unit tests for defender preparation overlapped with the attacker's turn.
+"""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+
+from src.agents.participant.debate_participant_agent import DebateParticipantAgent
+
+
+ATTACK_STRATEGY = {
+    "strategy_type": "Clipping",
+    "rag_decision": {"use_rag": True},
+    "target_argument": {"claim": "AI will replace creative work"},
+    "attack_plan": {"target_point": "AI will replace creative work", "key_phrase": "Cut it short"},
+    "vulnerability_score": 0.8
+}
+
+
+def _decision(strategy, attack_info):
+    return {"use_rag": True, "results": [{"content": f"{strategy} evidence", "source": "test"}],
+            "results_count": 1, "query": attack_info["attack_text"]}
+
+
+class TestDefensePrefetch:
+    """공격 계획 알림 → 방어 사전 준비 → 최종 공격과 대조"""
+
+    @pytest.fixture
+    def attacker(self):
+        agent = DebateParticipantAgent("nietzsche", "nietzsche", {"role": "con"})
+        agent.attack_strategies = {"socrates": [ATTACK_STRATEGY]}
+        return agent
+
+    @pytest.fixture
+    def defender(self, attacker):
+        agent = DebateParticipantAgent("socrates", "socrates", {"role": "pro"})
+        agent._current_dialogue_state = {"agents": {"nietzsche": attacker}}
+        agent.strategy_rag_manager = Mock()
+        agent.strategy_rag_manager.determine_defense_rag_usage.side_effect = _decision
+        agent.defense_strategy_manager = Mock()
+        agent.defense_strategy_manager.get_prefetch_candidates.return_value = ["Refute", "Clarify"]
+        agent.defense_strategy_manager.select_defense_strategy.return_value = "Clarify"
+        agent.defense_strategy_manager.generate_defense_response.return_value = "Let me clarify."
+        return agent
+
+    def _attack_message(self, text="Your claim collapses under its own weight."):
+        return [{"speaker_id": "nietzsche", "role": "con", "text": text}]
+
+    def test_prefetch_resolves_candidates_from_attack_plan(self, defender):
+        """공격 문장 없이 공격 계획만으로 후보 전략별 RAG 근거 준비"""
+        prefetch = defender.prefetch_defense("nietzsche", ATTACK_STRATEGY)
+
+        assert prefetch["candidates"] == ["Refute", "Clarify"]
+        assert set(prefetch["decisions"]) == {"Refute", "Clarify"}
+        assert prefetch["attack_info"]["attack_strategy"] == "Clipping"
+        assert "AI will replace creative work" in prefetch["attack_info"]["attack_text"]
+
+    def test_prefetch_runs_candidates_on_calling_thread(self, defender):
+        """후보별 스레드를 새로 띄우지 않고 호출한 워커 스레드에서 순서대로 준비"""
+        threads = []
+        defender.strategy_rag_manager.determine_defense_rag_usage.side_effect = (
+            lambda strategy, attack_info: threads.append((strategy, threading.get_ident()))
+            or _decision(strategy, attack_info))
+
+        defender.prefetch_defense("nietzsche", ATTACK_STRATEGY)
+
+        assert threads == [("Refute", threading.get_ident()), ("Clarify", threading.get_ident())]
+
+    def test_defense_turn_uses_prefetched_evidence(self, defender):
+        """계획과 최종 공격이 일치하면 방어 턴에서는 RAG 검색 없이 생성만 수행"""
+        defender.prefetch_defense("nietzsche", ATTACK_STRATEGY)
+        defender.strategy_rag_manager.determine_defense_rag_usage.reset_mock()
+
+        response = defender._generate_defense_response("AI", self._attack_message(), {}, {})
+
+        assert response == "Let me clarify."
+        defender.strategy_rag_manager.determine_defense_rag_usage.assert_not_called()
+        decision = defender.defense_strategy_manager.generate_defense_response.call_args.args[4]
+        assert decision["results"][0]["content"] == "Clarify evidence"
+        # 준비 결과는 한 번만 사용
+        assert defender._defense_prefetch == {}
+
+    def test_mismatched_attack_resolves_live(self, defender, attacker):
+        """최종 공격의 전략이 계획과 다르면 준비 결과를 버리고 기존 경로로 처리"""
+        defender.prefetch_defense("nietzsche", ATTACK_STRATEGY)
+        attacker.attack_strategies = {"socrates": [{**ATTACK_STRATEGY, "strategy_type": "FramingShift"}]}
+        defender.strategy_rag_manager.determine_defense_rag_usage.reset_mock()
+
+        defender._generate_defense_response("AI", self._attack_message(), {}, {})
+
+        defender.strategy_rag_manager.determine_defense_rag_usage.assert_called_once()
+
+    def test_attack_selection_notifies_listener(self, attacker):
+        """공격 전략을 고르는 즉시(생성 호출 전에) 리스너에 알림"""
+        events = []
+        attacker.llm_manager = Mock()
+        attacker.llm_manager.generate_response.side_effect = lambda **kwargs: events.append("generate") or "Attack!"
+        attacker.attack_plan_listener = lambda attacker_id, target_id, strategy: events.append(
+            ("plan", attacker_id, target_id, strategy["strategy_type"]))
+
+        attacker._generate_attack_response("AI", self._attack_message() + [
+            {"speaker_id": "socrates", "role": "pro", "text": "Creativity is uniquely human."}
+        ], {}, {})
+
+        assert events == [("plan", "nietzsche", "socrates", "Clipping"), "generate"]
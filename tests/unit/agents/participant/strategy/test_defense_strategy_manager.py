@@ -11,6 +11,15 @@ from typing import Dict, List, Any
 from src.agents.participant.strategy.defense_strategy_manager import DefenseStrategyManager
 
 
+def _patch_defense_map(defense_map):
+    """자산 카탈로그의 defense_map 스냅샷 대체"""
+    catalog = Mock()
+    catalog.get_defense_map.return_value = defense_map
+    catalog.get_path.return_value = "philosophers/defense_map.yaml"
+    return patch('src.agents.participant.strategy.defense_strategy_manager.get_asset_catalog',
+                 return_value=catalog)
+
+
 class TestDefenseStrategyManager:
     """DefenseStrategyManager 테스트 클래스"""
     
@@ -107,16 +116,8 @@ class TestDefenseStrategyManager:
         assert defense_manager.defense_history == []
         assert defense_manager.last_defense_strategy is None
     
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('yaml.safe_load')
-    @patch('os.path.exists')
-    def test_select_defense_strategy_success(self, mock_exists, mock_yaml_load, mock_file, 
-                                           defense_manager, mock_defense_map):
+    def test_select_defense_strategy_success(self, defense_manager, mock_defense_map):
         """방어 전략 선택 성공 테스트"""
-        # Mock 설정
-        mock_exists.return_value = True
-        mock_yaml_load.return_value = mock_defense_map
-        
         attack_info = {
             "attack_strategy": "Clipping",
             "rag_used": True,
@@ -126,22 +127,21 @@ class TestDefenseStrategyManager:
             "emotion_type": "neutral"
         }
         
-        strategy = defense_manager.select_defense_strategy(attack_info, emotion_enhancement)
+        with _patch_defense_map(mock_defense_map):
+            strategy = defense_manager.select_defense_strategy(attack_info, emotion_enhancement)
         
         assert strategy in ["Counter", "Strengthen"]  # mock_defense_map에서 예상되는 값
         assert isinstance(strategy, str)
     
-    @patch('os.path.exists')
-    def test_select_defense_strategy_no_map_file(self, mock_exists, defense_manager):
+    def test_select_defense_strategy_no_map_file(self, defense_manager):
         """defense_map.yaml 파일이 없는 경우 테스트"""
-        mock_exists.return_value = False
-        
         attack_info = {
             "attack_strategy": "Unknown",
             "rag_used": False
         }
         
-        strategy = defense_manager.select_defense_strategy(attack_info)
+        with _patch_defense_map({}):
+            strategy = defense_manager.select_defense_strategy(attack_info)
         
         assert strategy in ["Clarify", "Accept"]  # 기본값
     
@@ -226,6 +226,23 @@ class TestDefenseStrategyManager:
         assert isinstance(response, str)
         assert len(response) > 0
     
+    def test_generate_defense_response_packs_context(self, defense_manager):
+        """방어 프롬프트도 섹션 예산으로 패킹하고 최종 토큰 수를 max_tokens 계산에 전달"""
+        recent_messages = [{"speaker_id": "opponent_socrates", "text": "mob rule " * 2000}]
+        emotion = {"emotion_description": "angry " * 1000, "recommended_tone": "Stay firm."}
+        
+        defense_manager.generate_defense_response(
+            "Is democracy the best form of government?", recent_messages, {"pro": "Democracy is good"},
+            "Clarify", {"use_rag": False}, emotion, role="pro"
+        )
+        
+        kwargs = defense_manager.llm_manager.generate_response.call_args.kwargs
+        assert kwargs["prompt_tokens"] < 2500
+        assert kwargs["cacheable_prefix"] and kwargs["system_prompt"].startswith(kwargs["cacheable_prefix"])
+        assert kwargs["prompt_cache_key"].endswith(":defense")
+        assert "Your Clarify defense:" in kwargs["user_prompt"]
+        assert kwargs["user_prompt"].count("angry") < 1000
+    
     def test_generate_defense_response_llm_error(self, defense_manager):
         """LLM 오류 시 fallback 테스트"""
         # LLM이 예외를 발생시키도록 설정
@@ -246,9 +263,7 @@ class TestDefenseStrategyManager:
     
     def test_get_defense_candidates_from_map_success(self, defense_manager, mock_defense_map):
         """defense_map에서 후보 가져오기 성공 테스트"""
-        with patch('os.path.exists', return_value=True), \
-             patch('builtins.open', mock_open()), \
-             patch('yaml.safe_load', return_value=mock_defense_map):
+        with _patch_defense_map(mock_defense_map):
             
             attack_info = {
                 "attack_strategy": "Clipping",
@@ -266,9 +281,7 @@ class TestDefenseStrategyManager:
     
     def test_get_defense_candidates_from_map_missing_keys(self, defense_manager, mock_defense_map):
         """defense_map에서 키가 없는 경우 테스트"""
-        with patch('os.path.exists', return_value=True), \
-             patch('builtins.open', mock_open()), \
-             patch('yaml.safe_load', return_value=mock_defense_map):
+        with _patch_defense_map(mock_defense_map):
             
             attack_info = {
                 "attack_strategy": "NonexistentStrategy",
@@ -284,6 +297,28 @@ class TestDefenseStrategyManager:
             
             assert candidates == ["Clarify", "Accept"]  # 기본값
     
+    def test_defense_map_is_not_reopened_per_call(self, defense_manager, mock_defense_map):
+        """방어 전략을 선택할 때마다 defense_map.yaml을 다시 열지 않음"""
+        attack_info = {"attack_strategy": "Clipping", "rag_used": False}
+        
+        with _patch_defense_map(mock_defense_map), patch('builtins.open') as opened:
+            for _ in range(5):
+                defense_manager.select_defense_strategy(attack_info)
+        
+        opened.assert_not_called()
+    
+    def test_get_prefetch_candidates_ordered_by_weight(self, defense_manager, mock_defense_map):
+        """공격 계획만으로 모든 감정의 후보를 모아 가중치 순으로 반환"""
+        attack_info = {"attack_strategy": "Clipping", "rag_used": True}
+        
+        with _patch_defense_map(mock_defense_map):
+            candidates = defense_manager.get_prefetch_candidates(attack_info, limit=3)
+            unknown = defense_manager.get_prefetch_candidates({"attack_strategy": "Unknown"})
+        
+        # Clipping/RAG_YES 후보: Counter, Strengthen, Reframe, Clarify, Accept
+        assert candidates == ["Counter", "Clarify", "Strengthen"]
+        assert unknown == ["Clarify", "Accept"]
+    
     def test_get_philosopher_name(self, defense_manager):
         """철학자 이름 추출 테스트"""
         test_cases = [
@@ -433,9 +468,7 @@ class TestDefenseStrategyManager:
     def test_defense_strategy_selection_scenarios(self, defense_manager, mock_defense_map,
                                                 attack_strategy, rag_used, emotion, expected_in):
         """다양한 시나리오에서 방어 전략 선택 테스트"""
-        with patch('os.path.exists', return_value=True), \
-             patch('builtins.open', mock_open()), \
-             patch('yaml.safe_load', return_value=mock_defense_map):
+        with _patch_defense_map(mock_defense_map):
             
             attack_info = {
                 "attack_strategy": attack_strategy,
@@ -225,6 +225,23 @@ class TestFollowupStrategyManager:
         assert isinstance(response, str)
         assert len(response) > 0
     
+    def test_generate_followup_response_packs_context(self, followup_manager):
+        """팔로우업 프롬프트도 섹션 예산으로 패킹하고 최종 토큰 수를 max_tokens 계산에 전달"""
+        recent_messages = [
+            {"speaker_id": "aristotle", "text": "merit " * 2000},
+            {"speaker_id": "opponent_plato", "text": "harmony " * 2000}
+        ]
+        
+        followup_manager.generate_followup_response(
+            "What is the nature of justice?", recent_messages, {"pro": "Justice is merit"},
+            "Deepen", {"use_rag": False}, role="pro"
+        )
+        
+        kwargs = followup_manager.llm_manager.generate_response.call_args.kwargs
+        assert kwargs["prompt_tokens"] < 2500
+        assert kwargs["prompt_cache_key"].endswith(":followup")
+        assert "harmony" in kwargs["user_prompt"] and "Your Deepen followup:" in kwargs["user_prompt"]
+    
     def test_generate_followup_response_llm_error(self, followup_manager):
         """LLM 오류 시 fallback 테스트"""
         # LLM이 예외를 발생시키도록 설정
@@ -0,0 +1,338 @@
+"""
+Unit tests for the tiered debate emotion inference.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from src.agents.utility.debate_emotion_inference import (
+    DebateEmotionClassifier,
+    DebateEmotionManager,
+    EmotionIntensity,
+    get_shared_emotion_manager,
+    infer_debate_emotion
+)
+from src.agents.utility.turn_deadline import TurnDeadline
+
+
+class TestDebateEmotionClassifier:
+    """DebateEmotionClassifier 테스트 클래스"""
+    
+    @pytest.fixture
+    def classifier(self):
+        return DebateEmotionClassifier()
+    
+    def test_no_cues_returns_analytical(self, classifier):
+        """단서가 없으면 분석적 감정과 중간 신뢰도"""
+        state, confidence = classifier.classify([{"text": "The sky is blue today."}])
+        
+        assert state.primary_emotion == "analytical"
+        assert confidence == 0.5
+    
+    def test_dominant_cues_give_high_confidence(self, classifier):
+        """한 감정의 단서가 우세하면 높은 신뢰도"""
+        messages = [{"text": "This is nonsense. An absurd, ridiculous and naive claim!!"}]
+        state, confidence = classifier.classify(messages)
+        
+        assert state.primary_emotion == "frustrated"
+        assert state.intensity == EmotionIntensity.VERY_STRONG
+        assert confidence >= 0.9
+    
+    def test_mixed_cues_give_low_confidence(self, classifier):
+        """단서가 섞여 있으면 낮은 신뢰도"""
+        messages = [{"text": "There is a flaw here, but I agree with part of it."}]
+        state, confidence = classifier.classify(messages)
+        
+        assert confidence < 0.5
+        assert state.secondary_emotion is not None
+    
+    def test_korean_cues(self, classifier):
+        """한국어 단서 인식"""
+        messages = [{"text": "그 주장은 모순이며 논리적 오류와 비약이 있습니다."}]
+        state, _ = classifier.classify(messages)
+        
+        assert state.primary_emotion == "critical"
+
+
+class TestDebateEmotionManager:
+    """DebateEmotionManager 계층형 추론 테스트 클래스"""
+    
+    @pytest.fixture
+    def mock_llm_manager(self):
+        mock_llm = Mock()
+        mock_llm.generate_response.return_value = (
+            '{"primary_emotion": "skeptical", "intensity": "STRONG", '
+            '"reasoning": "test", "recommended_tone": "Be sharp."}'
+        )
+        return mock_llm
+    
+    @pytest.fixture
+    def manager(self, mock_llm_manager):
+        return DebateEmotionManager(mock_llm_manager)
+    
+    def _infer(self, manager, text, speaker_id="kant"):
+        return manager.infer_emotion(
+            speaker_id=speaker_id,
+            speaker_role="pro",
+            opponent_messages=[{"speaker_id": "nietzsche", "text": text}],
+            debate_topic="AI regulation",
+            debate_stage="interactive_argument"
+        )
+    
+    def test_confident_classifier_skips_llm(self, manager, mock_llm_manager):
+        """분류기 신뢰도가 충분하면 LLM 호출 없음"""
+        state = self._infer(manager, "Nonsense! Absurd and ridiculous!")
+        
+        assert state.primary_emotion == "frustrated"
+        mock_llm_manager.generate_response.assert_not_called()
+        assert manager.get_memo_stats()["classifier_hits"] == 1
+    
+    def test_low_confidence_defers_llm_to_precompute(self, manager, mock_llm_manager):
+        """분류기 신뢰도가 낮으면 분류기 결과를 바로 반환하고 LLM 추론은 사전 계산이 메모를 채움"""
+        text = "There is a flaw here, but I agree with part of it."
+        first = self._infer(manager, text)
+        
+        assert first.primary_emotion in ("critical", "impressed")
+        assert manager.get_memo_stats()["deferred_to_precompute"] == 1
+        
+        pending = manager.precompute_emotion(
+            speaker_id="kant", speaker_role="pro",
+            opponent_messages=[{"speaker_id": "nietzsche", "text": text}],
+            debate_topic="AI regulation", debate_stage="interactive_argument"
+        )
+        if pending is not None:
+            pending.result(timeout=5)
+        second = self._infer(manager, text)
+        
+        assert second.primary_emotion == "skeptical"
+        assert second.intensity == EmotionIntensity.STRONG
+        mock_llm_manager.generate_response.assert_called_once()
+        manager.shutdown()
+    
+    def test_running_precompute_is_not_awaited(self, mock_llm_manager):
+        """진행 중인 사전 계산은 기다리지 않고 분류기 결과 반환"""
+        release = threading.Event()
+        
+        def slow_llm(*args, **kwargs):
+            release.wait(timeout=5)
+            return '{"primary_emotion": "skeptical", "intensity": "STRONG", "reasoning": "", "recommended_tone": ""}'
+        
+        mock_llm_manager.generate_response.side_effect = slow_llm
+        manager = DebateEmotionManager(mock_llm_manager)
+        messages = [{"speaker_id": "nietzsche", "text": "There is a flaw here, but I agree with part of it."}]
+        future = manager.precompute_emotion(
+            speaker_id="kant", speaker_role="pro", opponent_messages=messages,
+            debate_topic="AI regulation", debate_stage="interactive_argument"
+        )
+        
+        try:
+            started = time.monotonic()
+            state = self._infer(manager, messages[0]["text"])
+            
+            assert time.monotonic() - started < 1.0
+            assert state.primary_emotion in ("critical", "impressed")
+            assert not future.done()
+        finally:
+            release.set()
+            future.result(timeout=5)
+            manager.shutdown()
+    
+    def test_running_precompute_waits_within_turn_budget(self, mock_llm_manager):
+        """턴 마감이 있으면 진행 중인 사전 계산을 보강 예산 안에서 기다리고, 넘기면 분류기 결과와 생략 기록"""
+        release = threading.Event()
+        
+        def slow_llm(*args, **kwargs):
+            release.wait(timeout=5)
+            return '{"primary_emotion": "skeptical", "intensity": "STRONG", "reasoning": "", "recommended_tone": ""}'
+        
+        mock_llm_manager.generate_response.side_effect = slow_llm
+        manager = DebateEmotionManager(mock_llm_manager)
+        messages = [{"speaker_id": "nietzsche", "text": "There is a flaw here, but I agree with part of it."}]
+        future = manager.precompute_emotion(
+            speaker_id="kant", speaker_role="pro", opponent_messages=messages,
+            debate_topic="AI regulation", debate_stage="interactive_argument"
+        )
+        deadline = TurnDeadline(budget_seconds=1.2, generation_reserve=1.0)
+        
+        try:
+            started = time.monotonic()
+            state = manager.infer_emotion(
+                speaker_id="kant", speaker_role="pro", opponent_messages=messages,
+                debate_topic="AI regulation", debate_stage="interactive_argument",
+                turn_deadline=deadline
+            )
+            
+            assert 0.1 < time.monotonic() - started < 1.0
+            assert state.primary_emotion in ("critical", "impressed")
+            assert manager.get_memo_stats()["precompute_timeouts"] == 1
+            assert deadline.to_metadata()["dropped"][0]["enrichment"] == "emotion_precompute"
+        finally:
+            release.set()
+            future.result(timeout=5)
+            manager.shutdown()
+    
+    def test_precompute_wait_capped_by_emotion_llm_cost(self, mock_llm_manager):
+        """남은 예산이 넉넉해도 사전 계산은 emotion_llm 비용만큼만 기다림"""
+        release = threading.Event()
+        mock_llm_manager.generate_response.side_effect = lambda *a, **k: release.wait(timeout=5) and "{}"
+        manager = DebateEmotionManager(mock_llm_manager)
+        messages = [{"speaker_id": "nietzsche", "text": "There is a flaw here, but I agree with part of it."}]
+        future = manager.precompute_emotion(
+            speaker_id="kant", speaker_role="pro", opponent_messages=messages,
+            debate_topic="AI regulation", debate_stage="interactive_argument"
+        )
+        deadline = TurnDeadline(budget_seconds=30.0, generation_reserve=1.0, enrichment_costs={"emotion_llm": 0.3})
+        
+        try:
+            started = time.monotonic()
+            manager.infer_emotion(
+                speaker_id="kant", speaker_role="pro", opponent_messages=messages,
+                debate_topic="AI regulation", debate_stage="interactive_argument",
+                turn_deadline=deadline
+            )
+            
+            assert time.monotonic() - started < 1.5
+            assert manager.get_memo_stats()["precompute_timeouts"] == 1
+        finally:
+            release.set()
+            future.result(timeout=5)
+            manager.shutdown()
+    
+    def test_finished_precompute_within_budget_is_used(self, mock_llm_manager):
+        """예산 안에 끝난 사전 계산 결과를 사용"""
+        mock_llm_manager.generate_response.side_effect = lambda *a, **k: (
+            time.sleep(0.1) or
+            '{"primary_emotion": "skeptical", "intensity": "STRONG", "reasoning": "", "recommended_tone": ""}'
+        )
+        manager = DebateEmotionManager(mock_llm_manager)
+        messages = [{"speaker_id": "nietzsche", "text": "There is a flaw here, but I agree with part of it."}]
+        manager.precompute_emotion(
+            speaker_id="kant", speaker_role="pro", opponent_messages=messages,
+            debate_topic="AI regulation", debate_stage="interactive_argument"
+        )
+        
+        try:
+            state = manager.infer_emotion(
+                speaker_id="kant", speaker_role="pro", opponent_messages=messages,
+                debate_topic="AI regulation", debate_stage="interactive_argument",
+                turn_deadline=TurnDeadline(budget_seconds=10.0, generation_reserve=1.0)
+            )
+            
+            assert state.primary_emotion == "skeptical"
+        finally:
+            manager.shutdown()
+    
+    def test_budget_fallback_uses_classifier_without_memo(self, manager, mock_llm_manager):
+        """턴 예산 부족 시 LLM 없이 분류기 결과를 쓰고 메모하지 않음"""
+        messages = [{"speaker_id": "nietzsche", "text": "There is a flaw here, but I agree with part of it."}]
+        state = manager.infer_emotion(
+            speaker_id="kant", speaker_role="pro", opponent_messages=messages,
+            debate_topic="AI regulation", debate_stage="interactive_argument",
+            allow_llm=False
+        )
+        
+        assert state.primary_emotion in ("critical", "impressed")
+        mock_llm_manager.generate_response.assert_not_called()
+        stats = manager.get_memo_stats()
+        assert stats["budget_fallbacks"] == 1
+        assert stats["memo_size"] == 0
+    
+    def test_memo_hit_for_same_opponent_messages(self, manager, mock_llm_manager):
+        """같은 화자와 같은 상대 발언이면 메모 결과 재사용"""
+        text = "Nonsense! Absurd and ridiculous!"
+        first = self._infer(manager, text)
+        second = self._infer(manager, text)
+        
+        assert first is second
+        mock_llm_manager.generate_response.assert_not_called()
+        assert manager.get_memo_stats()["memo_hits"] == 1
+    
+    def test_memo_key_changes_with_messages_and_speaker(self):
+        """메모 키는 화자와 상대 발언 내용에 따라 달라짐"""
+        messages = [{"speaker_id": "a", "text": "hello"}]
+        key = DebateEmotionManager.make_memo_key("kant", "pro", "interactive_argument", messages)
+        
+        assert key == DebateEmotionManager.make_memo_key("kant", "pro", "interactive_argument", list(messages))
+        assert key != DebateEmotionManager.make_memo_key("hegel", "pro", "interactive_argument", messages)
+        assert key != DebateEmotionManager.make_memo_key("kant", "pro", "interactive_argument", [{"speaker_id": "a", "text": "bye"}])
+    
+    def test_memo_is_bounded(self, mock_llm_manager):
+        """메모 크기 제한"""
+        manager = DebateEmotionManager(mock_llm_manager, memo_size=2)
+        for i in range(4):
+            self._infer(manager, f"Nonsense number {i}, absurd!", speaker_id=f"speaker_{i}")
+        
+        assert manager.get_memo_stats()["memo_size"] == 2
+    
+    def test_precompute_populates_memo(self, manager, mock_llm_manager):
+        """백그라운드 사전 계산 결과가 이후 추론에서 재사용됨"""
+        messages = [{"speaker_id": "nietzsche", "text": "There is a flaw here, but I agree with part of it."}]
+        future = manager.precompute_emotion(
+            speaker_id="kant",
+            speaker_role="pro",
+            opponent_messages=messages,
+            debate_topic="AI regulation",
+            debate_stage="interactive_argument"
+        )
+        precomputed = future.result(timeout=5)
+        
+        state = manager.infer_emotion(
+            speaker_id="kant",
+            speaker_role="pro",
+            opponent_messages=messages,
+            debate_topic="AI regulation",
+            debate_stage="interactive_argument"
+        )
+        
+        assert state is precomputed
+        assert mock_llm_manager.generate_response.call_count == 1
+        assert manager.precompute_emotion(
+            speaker_id="kant",
+            speaker_role="pro",
+            opponent_messages=messages,
+            debate_topic="AI regulation",
+            debate_stage="interactive_argument"
+        ) is None
+        manager.shutdown()
+    
+    def test_infer_debate_emotion_reuses_manager(self, manager, mock_llm_manager):
+        """래퍼 함수에 관리자를 넘기면 메모 공유"""
+        kwargs = dict(
+            llm_manager=mock_llm_manager,
+            speaker_id="kant",
+            speaker_role="pro",
+            opponent_messages=[{"text": "Nonsense! Absurd and ridiculous!"}],
+            debate_topic="AI regulation",
+            debate_stage="interactive_argument",
+            emotion_manager=manager
+        )
+        first = infer_debate_emotion(**kwargs)
+        second = infer_debate_emotion(**kwargs)
+        
+        assert first["emotion_state"] == second["emotion_state"]
+        assert "prompt_enhancement" in first
+        assert manager.get_memo_stats()["memo_hits"] == 1
+    
+    def test_infer_debate_emotion_without_manager_uses_shared_manager(self, mock_llm_manager):
+        """관리자 없이 호출해도 호출마다 관리자/실행기를 새로 만들지 않고 모듈 공유 관리자 사용"""
+        kwargs = dict(
+            llm_manager=mock_llm_manager,
+            speaker_id="kant",
+            speaker_role="pro",
+            opponent_messages=[{"text": "Nonsense! Absurd and ridiculous!"}],
+            debate_topic="AI regulation",
+            debate_stage="interactive_argument"
+        )
+        infer_debate_emotion(**kwargs)
+        infer_debate_emotion(**kwargs)
+        shared = get_shared_emotion_manager(mock_llm_manager)
+        
+        try:
+            assert shared.get_memo_stats()["memo_hits"] == 1
+            assert get_shared_emotion_manager(Mock()) is not shared
+            assert shared._executor is None
+        finally:
+            get_shared_emotion_manager(mock_llm_manager).shutdown()
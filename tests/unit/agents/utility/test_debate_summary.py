@@ -0,0 +1,107 @@
+"""
+Unit tests for the rolling debate summarizer.
+"""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+
+from src.agents.utility.debate_summary import RollingDebateSummarizer
+from src.dialogue.parallel.task_graph import RoomTaskGraph, SharedTaskPool
+
+
+def _message(role, text, speaker_id=None):
+    return {"role": role, "speaker_id": speaker_id or f"{role}_1", "stage": "pro_argument", "text": text}
+
+
+class TestRollingDebateSummarizer:
+    """RollingDebateSummarizer 테스트 클래스"""
+
+    @pytest.fixture
+    def pool(self):
+        pool = SharedTaskPool(max_workers=2)
+        yield pool
+        pool.shutdown()
+
+    @pytest.fixture
+    def mock_llm_manager(self):
+        mock_llm = Mock()
+
+        def fold(system_prompt, user_prompt, **kwargs):
+            # 새 발언을 현재 요약 뒤에 붙인 결과를 돌려주는 가짜 LLM
+            current = user_prompt.split("SUMMARY:\n", 1)[1].split("\n\nNEW STATEMENT", 1)[0]
+            statement = user_prompt.split("):\n", 1)[1].split("\n\nReturn only", 1)[0]
+            return statement if current == "(empty)" else f"{current} | {statement}"
+
+        mock_llm.generate_response.side_effect = fold
+        return mock_llm
+
+    @pytest.fixture
+    def summarizer(self, mock_llm_manager, pool):
+        return RollingDebateSummarizer(mock_llm_manager, RoomTaskGraph("room1", pool), topic="AI")
+
+    def test_folds_messages_per_side_in_order(self, summarizer):
+        """각 측 발언이 순서대로 해당 측 요약에만 반영"""
+        for i in range(3):
+            summarizer.observe(_message("pro", f"pro point {i}"))
+            summarizer.observe(_message("con", f"con point {i}"))
+        summarizer.observe({"role": "moderator", "text": "next"})
+
+        digests = summarizer.get_digests(timeout=5)
+
+        assert digests["complete"] is True
+        assert digests["pro"] == "pro point 0 | pro point 1 | pro point 2"
+        assert digests["con"] == "con point 0 | con point 1 | con point 2"
+        assert digests["folded"] == {"pro": 3, "con": 3}
+
+    def test_fold_input_does_not_grow_with_history(self, summarizer, mock_llm_manager):
+        """접기 한 번의 입력은 현재 요약 + 새 발언 하나"""
+        for i in range(4):
+            summarizer.observe(_message("pro", f"statement {i} " + "x" * 200))
+        summarizer.get_digests(timeout=5)
+
+        prompts = [call.kwargs["user_prompt"] for call in mock_llm_manager.generate_response.call_args_list]
+        assert len(prompts) == 4
+        assert all(prompt.count("NEW STATEMENT") == 1 for prompt in prompts)
+        assert "statement 0" not in prompts[-1].split("NEW STATEMENT", 1)[1]
+
+    def test_llm_failure_appends_excerpt(self, pool):
+        """LLM 실패 시 발췌를 덧붙이고 다음 접기를 막지 않음"""
+        llm = Mock()
+        llm.generate_response.side_effect = RuntimeError("rate limited")
+        summarizer = RollingDebateSummarizer(llm, RoomTaskGraph("room1", pool), excerpt_chars=10)
+
+        summarizer.observe(_message("con", "first statement is long"))
+        summarizer.observe(_message("con", "second statement"))
+        digests = summarizer.get_digests(timeout=5)
+
+        assert digests["con"] == "- first stat\n- second sta"
+        assert summarizer.stats["llm_failures"] == 2
+
+    def test_timeout_uses_excerpts_for_unfolded_messages(self, pool):
+        """시간 안에 접지 못한 발언은 발췌로 포함"""
+        gate = threading.Event()
+        llm = Mock()
+        llm.generate_response.side_effect = lambda **kwargs: gate.wait(5) and "folded"
+        summarizer = RollingDebateSummarizer(llm, RoomTaskGraph("room1", pool))
+
+        summarizer.observe(_message("pro", "slow statement"))
+        digests = summarizer.get_digests(timeout=0.05)
+        gate.set()
+
+        assert digests["complete"] is False
+        assert digests["pro"] == "- slow statement"
+        assert summarizer.stats["wait_timeouts"] == 1
+
+    def test_snapshot_restore_refolds_pending(self, summarizer, mock_llm_manager, pool):
+        """스냅샷 복원 시 접은 요약은 유지하고 남은 발언만 다시 접음"""
+        summarizer.observe(_message("pro", "kept"))
+        summarizer.get_digests(timeout=5)
+        data = summarizer.to_dict()
+        data["pro"]["pending"] = [{"speaker_id": "pro_1", "stage": "interactive_argument", "text": "late"}]
+
+        restored = RollingDebateSummarizer(mock_llm_manager, RoomTaskGraph("room2", pool))
+        restored.restore(data)
+
+        assert restored.get_digests(timeout=5)["pro"] == "kept | late"
@@ -0,0 +1,181 @@
+"""
+Unit tests for the fact checker verification pipeline.
+"""
+
+import sys
+import threading
+import time
+import types
+
+import pytest
+from unittest.mock import Mock, patch
+
+try:
+    from src.agents.utility.fact_checker import FactCheckerAgent
+except ImportError:
+    # 웹 리트리버 모듈이 sentence_transformers를 import함 - 테스트는 Mock 리트리버를 쓰므로 그 모듈만 대체
+    _web_retriever = types.ModuleType("src.rag.retrieval.web_retriever")
+    _web_retriever.WebSearchRetriever = object
+    with patch.dict(sys.modules, {"src.rag.retrieval.web_retriever": _web_retriever}):
+        from src.agents.utility.fact_checker import FactCheckerAgent
+
+
+CLAIMS = [
+    "The Eiffel Tower was completed in 1889 for the World Fair.",
+    "Socrates was sentenced to death in Athens in 399 BC.",
+]
+
+
+def _batch_response(count, result="TRUE"):
+    return "\n".join(
+        f"[{n}]\n검증결과: {result}\n신뢰도: 0.9\n설명: matches evidence\n수정사항: 없음"
+        for n in range(1, count + 1)
+    )
+
+
+class TestFactCheckerAgent:
+    """FactCheckerAgent 검증 파이프라인 테스트 클래스"""
+
+    @pytest.fixture
+    def agent(self):
+        return FactCheckerAgent("fact_checker", "Fact Checker",
+                                {"parameters": {"max_workers": 2, "verification_budget_seconds": 5}})
+
+    @pytest.fixture
+    def web_retriever(self):
+        retriever = Mock()
+        retriever.retrieve_and_extract.return_value = [
+            {"text": "web evidence", "metadata": {"url": "http://example.com", "title": "Example"}, "score": 0.7}
+        ]
+        return retriever
+
+    def test_local_evidence_skips_web_search(self, agent, web_retriever):
+        """로컬 증거가 충분하면 웹 검색을 하지 않음"""
+        vector_store = Mock()
+        vector_store.search.return_value = [
+            {"id": "1", "text": "tower completed 1889", "metadata": {"title": "Room doc"}, "score": 0.9},
+            {"id": "2", "text": "world fair 1889", "metadata": {}, "score": 0.8},
+        ]
+        agent.set_local_evidence(vector_store=vector_store)
+        agent.set_web_retriever(web_retriever)
+
+        evidence = agent._gather_evidence(CLAIMS[0])
+
+        assert [e["source"] for e in evidence] == ["vector_store", "vector_store"]
+        web_retriever.retrieve_and_extract.assert_not_called()
+        assert agent.stats["local_only"] == 1
+
+    def test_weak_local_evidence_falls_back_to_web(self, agent, web_retriever):
+        """로컬 증거가 부족하면 웹 검색 결과를 덧붙임"""
+        philosopher_searcher = Mock()
+        philosopher_searcher.search.return_value = [
+            {"content": "loosely related passage", "title": "Apology", "relevance": 0.3}
+        ]
+        agent.set_local_evidence(philosopher_searcher=philosopher_searcher)
+        agent.set_web_retriever(web_retriever)
+
+        evidence = agent._gather_evidence(CLAIMS[1])
+
+        assert [e["source"] for e in evidence] == ["philosopher", "web"]
+        web_retriever.retrieve_and_extract.assert_called_once()
+
+    def test_claims_verified_in_one_llm_batch(self, agent, web_retriever):
+        """여러 주장을 한 번의 LLM 호출로 검증하고 주장별로 파싱"""
+        agent.set_web_retriever(web_retriever)
+        agent.llm_manager = Mock()
+        agent.llm_manager.generate_response.return_value = _batch_response(2)
+
+        results = agent._verify_claims(CLAIMS)
+
+        assert agent.llm_manager.generate_response.call_count == 1
+        assert [r["claim"] for r in results] == CLAIMS
+        assert all(r["result"] == "true" and r["confidence"] == 0.9 for r in results)
+
+    def test_repeated_claims_reuse_cached_result(self, agent, web_retriever):
+        """다음 턴의 같은/거의 같은 주장은 다시 검증하지 않음"""
+        agent.set_web_retriever(web_retriever)
+
+        first = agent.process({"message": CLAIMS[0], "force_check": True})
+        second = agent.process({"message": "The Eiffel Tower was completed in 1889 for the World Fair!",
+                                "force_check": True})
+
+        assert first["result"] == "completed"
+        assert web_retriever.retrieve_and_extract.call_count == 1
+        assert second["verification_results"][0]["cached"] is True
+        assert agent.stats["cache_hits"] == 1
+        assert len(agent.state["verification_history"]) == 1
+
+    def test_evidence_gathered_concurrently_within_budget(self, agent):
+        """주장별 증거 수집은 동시에 실행되고, 예산을 넘긴 주장은 timeout 처리"""
+        release = threading.Event()
+        vector_store = Mock()
+
+        def search(query, limit=3):
+            if "Socrates" in query:
+                release.wait(5)
+            else:
+                time.sleep(0.1)
+            return [{"text": query, "metadata": {}, "score": 0.9}] * 2
+
+        vector_store.search.side_effect = search
+        agent.set_local_evidence(vector_store=vector_store)
+        agent.verification_budget_seconds = 0.5
+
+        start = time.monotonic()
+        results = agent._verify_claims(CLAIMS)
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert elapsed < 2
+        assert results[0]["result"] == "likely_true"
+        assert results[1]["result"] == "timeout"
+        assert agent.stats["budget_timeouts"] == 1
+        # timeout 결과는 캐시하지 않음
+        assert agent._find_cached(CLAIMS[1]) is None
+
+    def test_only_definitive_verdicts_cached_permanently(self, agent, web_retriever):
+        """TRUE/FALSE/PARTLY_TRUE는 계속 캐시, 판단 불가 결과는 TTL 뒤 다시 검증"""
+        agent.set_web_retriever(web_retriever)
+        agent.llm_manager = Mock()
+        agent.llm_manager.generate_response.return_value = "[1]\n검증결과: FALSE\n신뢰도: 0.8\n[2]\n(파싱 불가)"
+        agent.negative_cache_ttl_seconds = 0.2
+
+        first = agent._verify_claims(CLAIMS)
+        time.sleep(0.3)
+
+        assert [r["result"] for r in first] == ["false", "inconclusive"]
+        assert agent._find_cached(CLAIMS[0])["result"] == "false"
+        assert agent._find_cached(CLAIMS[1]) is None
+        assert agent.stats["cache_expired"] == 1
+
+    def test_transient_failures_not_cached(self, agent):
+        """증거 수집/배치 검증 실패 결과는 캐시하지 않음"""
+        def gather(claim):
+            if "Socrates" in claim:
+                raise RuntimeError("index offline")
+            return [{"source": "web", "text": claim, "score": 0.7}]
+
+        agent._gather_evidence = gather
+        agent.llm_manager = Mock()
+        agent.llm_manager.generate_response.side_effect = RuntimeError("rate limited")
+
+        results = agent._verify_claims(CLAIMS)
+
+        assert results[0]["fallback"] == "batch_error"
+        assert results[1]["result"] == "evidence_error"
+        assert agent._find_cached(CLAIMS[0]) is None and agent._find_cached(CLAIMS[1]) is None
+
+    def test_claims_differing_in_a_number_are_not_reused(self, agent, web_retriever):
+        """토큰이 거의 같아도 숫자가 다르면 캐시된 판정을 재사용하지 않음"""
+        agent.set_web_retriever(web_retriever)
+        agent.llm_manager = Mock()
+        agent.llm_manager.generate_response.return_value = _batch_response(1)
+        claim = "The United States has a population of about 331 million people according to the census."
+
+        agent._verify_claims([claim])
+        results = agent._verify_claims([claim.replace("331", "900")])
+
+        assert results[0].get("cached") is None
+        assert agent.llm_manager.generate_response.call_count == 2
+        assert agent._find_cached(claim)["result"] == "true"
+        assert agent._find_cached(claim.replace("United States", "Canada")) is None
@@ -0,0 +1,83 @@
+"""
+Unit tests for the per-turn deadline.
+"""
+
+import time
+
+import pytest
+
+from src.agents.utility.turn_deadline import TurnDeadline, MIN_GENERATION_TIMEOUT_SECONDS
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTurnDeadline:
+    """TurnDeadline 테스트 클래스"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def test_allows_until_reserve_is_reached(self, clock):
+        """응답 생성 예비 시간을 제외한 예산 안에서만 보강 허용"""
+        deadline = TurnDeadline(budget_seconds=10.0, generation_reserve=4.0,
+                                enrichment_costs={"strategy_rag": 3.0}, clock=clock)
+
+        assert deadline.allows("strategy_rag")
+        clock.now += 4.0
+        assert not deadline.allows("strategy_rag")
+        assert deadline.generation_timeout() == 6.0
+
+    def test_budget_skip_returns_fallback_and_records_drop(self, clock):
+        """예산이 부족하면 함수를 호출하지 않고 fallback 반환"""
+        deadline = TurnDeadline(budget_seconds=5.0, generation_reserve=4.0, clock=clock)
+        called = []
+
+        result = deadline.call_with_budget("strategy_rag", lambda: called.append(1),
+                                           fallback={"cached": True}, fallback_name="cached")
+
+        assert result == {"cached": True}
+        assert called == []
+        metadata = deadline.to_metadata()
+        assert metadata["dropped"][0]["enrichment"] == "strategy_rag"
+        assert metadata["dropped"][0]["reason"] == "budget"
+        assert metadata["dropped"][0]["fallback"] == "cached"
+
+    def test_slow_enrichment_times_out(self):
+        """남은 예산을 넘기는 보강 단계는 기다리지 않고 fallback 반환"""
+        deadline = TurnDeadline(budget_seconds=0.3, generation_reserve=0.0,
+                                enrichment_costs={"rag": 0.0})
+
+        started = time.monotonic()
+        result = deadline.call_with_budget("rag", time.sleep, 1.0, fallback="fallback")
+
+        assert result == "fallback"
+        assert time.monotonic() - started < 0.8
+        assert deadline.dropped[0]["reason"] == "timeout"
+
+    def test_successful_enrichment_is_recorded(self, clock):
+        """예산 안에서 끝난 보강 단계는 used에 기록"""
+        deadline = TurnDeadline(budget_seconds=20.0, clock=clock)
+
+        assert deadline.call_with_budget("rag", lambda x: x * 2, 21) == 42
+        assert deadline.to_metadata()["used"] == ["rag"]
+        assert deadline.to_metadata()["dropped"] == []
+
+    def test_from_value_and_minimum_generation_timeout(self, clock):
+        """예산 값 변환과 마감 이후 최소 생성 타임아웃"""
+        deadline = TurnDeadline(budget_seconds=1.0, clock=clock)
+        assert TurnDeadline.from_value(deadline) is deadline
+        assert TurnDeadline.from_value(None) is None
+        assert TurnDeadline.from_value(12).budget_seconds == 12.0
+
+        clock.now += 5.0
+        assert deadline.expired()
+        assert deadline.generation_timeout() == MIN_GENERATION_TIMEOUT_SECONDS
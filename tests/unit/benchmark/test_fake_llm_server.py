@@ -0,0 +1,108 @@
+"""
+Unit tests for the fake LLM server and benchmark metrics.
+"""
+
+import json
+import urllib.request
+
+import pytest
+
+from src.benchmark.fake_llm_server import FakeLLMServer, LatencyProfile
+from src.benchmark.metrics import LatencyRecorder, compare_reports, percentile, summarize
+
+
+def _post(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"),
+                                     headers={"Content-Type": "application/json"}, method="POST")
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+class TestFakeLLMServer:
+    """FakeLLMServer 테스트 클래스"""
+
+    @pytest.fixture
+    def server(self):
+        profile = LatencyProfile(distribution="fixed", base_ms=1.0, tokens_per_second=0, completion_tokens=8)
+        with FakeLLMServer(profile=profile) as server:
+            yield server
+
+    def test_openai_chat_completion_is_deterministic(self, server):
+        """OpenAI 형식 응답과 같은 프롬프트에 같은 응답"""
+        payload = {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hello Kant"}], "max_tokens": 50}
+
+        first = _post(f"{server.openai_base_url}/chat/completions", payload)
+        second = _post(f"{server.openai_base_url}/chat/completions", payload)
+
+        assert first["choices"][0]["message"]["content"] == second["choices"][0]["message"]["content"]
+        assert first["usage"]["completion_tokens"] == 8
+        assert server.request_count() == 2
+
+    def test_ollama_chat_and_json_prompt(self, server):
+        """Ollama 형식 응답과 JSON 요청 프롬프트 처리"""
+        payload = {"model": "llama3", "messages": [{"role": "user", "content": "Respond in JSON format"}],
+                   "options": {"num_predict": 20}}
+
+        result = _post(f"{server.base_url}/api/chat", payload)
+
+        assert json.loads(result["message"]["content"])["primary_emotion"] == "analytical"
+        assert server.get_stats()["by_endpoint"]["ollama_chat"] == 1
+
+    def test_responses_api_with_web_search(self, server):
+        """Responses API(웹 검색 입론 생성) 요청에 결정적 본문과 url_citation 반환"""
+        openai = pytest.importorskip("openai")
+        client = openai.OpenAI(api_key="sk-benchmark", base_url=server.openai_base_url)
+
+        first = client.responses.create(model="gpt-4o", tools=[{"type": "web_search_preview"}], input="Argue for Kant")
+        second = client.responses.create(model="gpt-4o", tools=[{"type": "web_search_preview"}], input="Argue for Kant")
+
+        assert first.output_text and first.output_text == second.output_text
+        annotation = first.output[0].content[0].annotations[0]
+        assert annotation.type == "url_citation" and annotation.url.startswith("https://")
+        assert server.get_stats()["by_endpoint"]["openai_responses"] == 2
+        assert server.request_count() == 2
+
+    def test_delay_distributions(self):
+        """지연 분포와 생성 속도 반영"""
+        fixed = FakeLLMServer(LatencyProfile(distribution="fixed", base_ms=200, tokens_per_second=100))
+        uniform = FakeLLMServer(LatencyProfile(distribution="uniform", base_ms=200, jitter_ms=50, tokens_per_second=0))
+        try:
+            assert fixed.sample_delay(100) == pytest.approx(1.2)
+            for _ in range(20):
+                assert 0.15 <= uniform.sample_delay(10) <= 0.25
+        finally:
+            fixed.stop()
+            uniform.stop()
+
+
+class TestBenchmarkMetrics:
+    """벤치마크 지표 테스트 클래스"""
+
+    def test_percentile_and_summary(self):
+        """선형 보간 백분위수와 요약"""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile([], 95) == 0.0
+        summary = summarize(values)
+        assert summary["count"] == 100
+        assert summary["p99"] == pytest.approx(99.01)
+
+    def test_recorder_report_and_comparison(self):
+        """턴/단계별 리포트와 이전 결과 대비 변화율"""
+        recorder = LatencyRecorder()
+        recorder.record_turn("opening", 1.0, llm_calls=2)
+        recorder.record_turn("interactive_argument", 3.0, llm_calls=4)
+        recorder.record("room_create", 0.5)
+
+        report = recorder.report()
+
+        assert report["turns"]["count"] == 2
+        assert report["stages"]["interactive_argument"]["llm_calls_per_turn"] == 4
+        assert report["llm_calls_per_turn"]["mean"] == 3.0
+        assert report["other"]["room_create"]["count"] == 1
+
+        baseline = {"turns": {"p95": report["turns"]["p95"] * 2}, "stages": {"opening": {"p95": 2.0}}}
+        comparison = compare_reports(report, baseline)
+        assert comparison["turn"]["change_pct"] == -50.0
+        assert comparison["stage:opening"]["change_pct"] == -50.0
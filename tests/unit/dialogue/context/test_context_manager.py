@@ -14,6 +14,7 @@ project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.dialogue.context.debate_context_manager import DebateContextManager
+from src.models.llm.token_counter import count_tokens
 
 
 class MockLLMManager:
@@ -306,9 +307,23 @@ class TestTextProcessing(unittest.TestCase):
         
         estimated_tokens = self.context_manager._estimate_tokens(text)
         
-        # 대략적인 토큰 수 (1 토큰 ≈ 4자)
-        expected_tokens = len(text) // 4
+        # 요약 모델 토크나이저 기준 토큰 수 (토크나이저가 없으면 근사치)
+        expected_tokens = count_tokens(text, self.context_manager.token_model)
         self.assertEqual(estimated_tokens, expected_tokens)
+        self.assertGreater(estimated_tokens, 0)
+    
+    def test_truncate_context_by_tokens(self):
+        """토큰 예산 기반 컨텍스트 자르기 테스트 - 도입부/결론 유지, 중간부터 제거"""
+        self.context_manager.max_processable_tokens = 200
+        paragraphs = [f"Paragraph {i} " + "word " * 40 for i in range(12)]
+        context = "\n\n".join(paragraphs)
+        
+        truncated = self.context_manager._truncate_context_intelligently(context)
+        
+        self.assertLessEqual(self.context_manager._estimate_tokens(truncated), 200)
+        self.assertIn("Paragraph 0 ", truncated)
+        self.assertIn("Paragraph 11 ", truncated)
+        self.assertNotIn("Paragraph 6 ", truncated)
 
 
 class TestBackwardCompatibility(unittest.TestCase):
@@ -0,0 +1,244 @@
+"""
+Unit tests for the per-room event bus.
+"""
+
+import asyncio
+import gc
+import threading
+import time
+
+import pytest
+
+from src.dialogue.events.event_bus import (
+    RoomEventBus,
+    get_event_bus,
+    close_event_bus,
+    active_event_bus_count,
+)
+from src.dialogue.events.initialization_events import (
+    InitializationEventStream,
+    InitializationEventType,
+)
+
+
+class TestRoomEventBus:
+    """RoomEventBus 테스트 클래스"""
+
+    def test_slow_subscriber_does_not_block_publish(self):
+        """느린 구독자가 있어도 publish는 바로 반환되고 오래된 이벤트부터 버림"""
+        bus = RoomEventBus("room")
+        release = threading.Event()
+        busy = threading.Event()
+        received = []
+
+        def slow(payload):
+            busy.set()
+            release.wait(5)
+            received.append(payload)
+
+        subscription = bus.subscribe(slow, max_queue=5, overflow="drop_oldest")
+        bus.publish("turn", 0)
+        busy.wait(5)
+
+        started = time.perf_counter()
+        for i in range(1, 50):
+            bus.publish("turn", i)
+        elapsed = time.perf_counter() - started
+
+        release.set()
+        assert bus.flush(5)
+        assert elapsed < 0.5
+        assert received[0] == 0  # 첫 이벤트는 이미 전달 중이었음
+        assert received[1:] == [45, 46, 47, 48, 49]
+        assert subscription.get_stats()["dropped"] == 44
+
+    def test_drop_newest_and_disconnect_policies(self):
+        """drop_newest는 새 이벤트를, disconnect는 구독 자체를 버림"""
+        bus = RoomEventBus("room")
+        release = threading.Event()
+        busy = threading.Barrier(3)
+        newest, disconnected = [], []
+
+        def consumer(target):
+            def callback(payload):
+                if payload == 0:
+                    busy.wait(5)
+                release.wait(5)
+                target.append(payload)
+            return callback
+
+        keep = bus.subscribe(consumer(newest), max_queue=2, overflow="drop_newest")
+        drop = bus.subscribe(consumer(disconnected), max_queue=2, overflow="disconnect")
+        bus.publish("turn", 0)
+        busy.wait(5)
+
+        for i in range(1, 6):
+            bus.publish("turn", i)
+        release.set()
+        bus.flush(5)
+
+        assert newest == [0, 1, 2]
+        assert disconnected == [0]
+        assert drop.get_stats()["closed"] is True
+        assert keep.get_stats()["closed"] is False
+
+    def test_keep_policy_never_drops(self):
+        """keep 정책은 큐 제한을 넘어도 이벤트를 버리지 않고 초과 횟수만 기록"""
+        bus = RoomEventBus("room")
+        release = threading.Event()
+        busy = threading.Event()
+        received = []
+
+        def slow(payload):
+            busy.set()
+            release.wait(5)
+            received.append(payload)
+
+        subscription = bus.subscribe(slow, max_queue=2, overflow="keep")
+        bus.publish("turn", 0)
+        busy.wait(5)
+        for i in range(1, 6):
+            bus.publish("turn", i)
+        release.set()
+        assert bus.flush(5)
+
+        stats = subscription.get_stats()
+        assert received == [0, 1, 2, 3, 4, 5]
+        assert stats["dropped"] == 0 and stats["over_capacity"] == 3
+        assert stats["closed"] is False
+
+    def test_keep_policy_drops_oldest_at_hard_limit(self, caplog):
+        """keep 정책도 keep_limit까지 밀리면 오래된 이벤트부터 버리고 오류 로그를 남김"""
+        bus = RoomEventBus("room")
+        release = threading.Event()
+        busy = threading.Event()
+        received = []
+
+        def slow(payload):
+            busy.set()
+            release.wait(5)
+            received.append(payload)
+
+        subscription = bus.subscribe(slow, max_queue=2, overflow="keep", keep_limit=4)
+        bus.publish("turn", 0)
+        busy.wait(5)
+        with caplog.at_level("ERROR", logger="src.dialogue.events.event_bus"):
+            for i in range(1, 8):
+                bus.publish("turn", i)
+        release.set()
+        assert bus.flush(5)
+
+        stats = subscription.get_stats()
+        assert received == [0, 4, 5, 6, 7]
+        assert stats["dropped"] == 3 and stats["over_capacity"] == 2
+        assert len([record for record in caplog.records if "dropped" in record.getMessage()]) == 1
+
+    def test_rooms_deliver_on_separate_pools(self):
+        """느린 방의 동기 구독자가 다른 방의 전달을 막지 않음"""
+        release = threading.Event()
+        slow_rooms = [RoomEventBus(f"slow-{i}") for i in range(6)]
+        for room in slow_rooms:
+            room.subscribe(lambda payload: release.wait(5))
+            room.publish("turn", 0)
+
+        fast = RoomEventBus("fast")
+        delivered = threading.Event()
+        fast.subscribe(lambda payload: delivered.set())
+        fast.publish("turn", 0)
+
+        try:
+            assert delivered.wait(1)
+            assert fast.get_delivery_executor() is not slow_rooms[0].get_delivery_executor()
+        finally:
+            release.set()
+            for room in slow_rooms + [fast]:
+                room.flush(5)
+                room.close()
+
+    def test_topics_history_and_errors(self):
+        """토픽 필터, 고정 크기 히스토리, 구독자 예외 격리"""
+        bus = RoomEventBus("room", history_size=3)
+        turns = []
+        bus.subscribe(turns.append, topics=["turn"])
+        failing = bus.subscribe(lambda p: 1 / 0)
+
+        for i in range(5):
+            bus.publish("turn" if i % 2 == 0 else "initialization", i)
+        bus.flush(5)
+
+        assert turns == [0, 2, 4]
+        assert [event.payload for event in bus.get_history()] == [2, 3, 4]
+        assert failing.get_stats()["errors"] == 5
+
+    def test_async_subscriber_runs_on_its_loop(self):
+        """코루틴 구독자는 등록한 이벤트 루프에서 순서대로 실행"""
+        bus = RoomEventBus("room")
+
+        async def scenario():
+            received = []
+            loop_thread = threading.get_ident()
+            threads = set()
+
+            async def consumer(payload):
+                threads.add(threading.get_ident())
+                await asyncio.sleep(0)
+                received.append(payload)
+
+            bus.subscribe(consumer)
+            await asyncio.get_running_loop().run_in_executor(None, lambda: [bus.publish("turn", i) for i in range(3)])
+            for _ in range(100):
+                if len(received) == 3:
+                    break
+                await asyncio.sleep(0.01)
+            return received, threads == {loop_thread}
+
+        received, same_thread = asyncio.run(scenario())
+
+        assert received == [0, 1, 2]
+        assert same_thread
+
+
+class TestEventRegistry:
+    """이벤트 버스 레지스트리 테스트 클래스"""
+
+    def test_buses_released_with_owner(self):
+        """버스를 가진 객체가 사라지면 레지스트리에서도 사라짐"""
+        before = active_event_bus_count()
+        bus = get_event_bus("registry-room")
+        assert get_event_bus("registry-room") is bus
+        assert active_event_bus_count() == before + 1
+
+        del bus
+        gc.collect()
+        assert active_event_bus_count() == before
+
+    def test_stale_close_keeps_new_bus(self):
+        """이전 인스턴스의 정리가 같은 방의 새 버스를 닫지 않음"""
+        old = get_event_bus("reused-room")
+        close_event_bus("reused-room", old)
+        new = get_event_bus("reused-room")
+
+        close_event_bus("reused-room", old)
+
+        assert old is not new
+        assert get_event_bus("reused-room") is new
+        assert not new.closed
+        close_event_bus("reused-room", new)
+
+    def test_initialization_stream_listeners_are_async(self):
+        """초기화 이벤트 리스너도 버스를 통해 전달되고 히스토리는 제한됨"""
+        stream = InitializationEventStream("init-room", bus=RoomEventBus("init-room"), history_size=2)
+        received = []
+        stream.add_listener(lambda event: received.append(event.event_type))
+
+        stream.emit_event(InitializationEventType.STARTED, {"total_tasks": 2})
+        stream.emit_event(InitializationEventType.TASK_COMPLETED, {})
+        stream.emit_event(InitializationEventType.TASK_COMPLETED, {})
+        stream.bus.flush(5)
+
+        assert received == [InitializationEventType.STARTED,
+                            InitializationEventType.TASK_COMPLETED,
+                            InitializationEventType.TASK_COMPLETED]
+        assert len(stream.get_event_history()) == 2
+        assert stream.get_progress_summary()["progress_percentage"] == pytest.approx(100.0)
+        assert len(stream.listeners) == 1
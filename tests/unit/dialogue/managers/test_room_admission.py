@@ -0,0 +1,141 @@
+"""
+Unit tests for room admission control and snapshot spilling.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.dialogue.managers.room_admission import (
+    AdmissionConfig,
+    RoomAdmissionController,
+    RoomResourceUsage,
+    RoomSnapshotStore,
+    MB,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _usage(room_id, mb, inflight=0):
+    return RoomResourceUsage(room_id=room_id, base_bytes=int(mb * MB), inflight_tasks=inflight)
+
+
+class TestRoomAdmissionController:
+    """RoomAdmissionController 테스트 클래스"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def controller(self, clock):
+        config = AdmissionConfig(max_rooms=3, memory_budget_gb=1.0, room_base_mb=100,
+                                 max_queue=1, queue_timeout_seconds=0.2,
+                                 idle_spill_seconds=600, pressure_idle_seconds=60)
+        return RoomAdmissionController(config, clock=clock)
+
+    def test_reservations_count_against_capacity(self, controller):
+        """생성 중인 방의 예약도 용량에 포함되어 방 생성이 몰려도 한도를 넘지 않음"""
+        decisions = [controller.try_admit(f"room-{i}") for i in range(4)]
+
+        assert [d.admitted for d in decisions] == [True, True, True, False]
+        assert decisions[3].reason == "max_rooms"
+        assert decisions[3].retry_after > 0
+        assert controller.get_metrics()["reserved_rooms"] == 3
+
+    def test_memory_budget_uses_accounted_usage(self, controller):
+        """계정된 방 사용량 합계가 예산을 넘으면 거절"""
+        controller.try_admit("big")
+        controller.commit("big", _usage("big", 950))
+
+        decision = controller.try_admit("next")
+
+        assert not decision.admitted
+        assert decision.reason == "memory_budget"
+
+    def test_rss_probe_blocks_admission(self, clock):
+        """프로세스 RSS가 상한을 넘으면 거절"""
+        controller = RoomAdmissionController(AdmissionConfig(max_rss_gb=2.0), rss_probe=lambda: 2.5, clock=clock)
+
+        assert controller.try_admit("room").reason == "rss"
+
+    def test_queued_request_admitted_after_release(self, controller):
+        """대기열에서 기다리던 요청은 방이 해제되면 입장"""
+        for i in range(3):
+            controller.try_admit(f"room-{i}")
+
+        async def scenario():
+            waiting = asyncio.create_task(controller.admit("queued", timeout=2.0))
+            await asyncio.sleep(0.01)
+            overflow = await controller.admit("overflow")
+            controller.release("room-0")
+            return overflow, await waiting
+
+        overflow, queued = asyncio.run(scenario())
+
+        assert (overflow.status, overflow.reason) == ("rejected", "queue_full")
+        assert queued.admitted
+        metrics = controller.get_metrics()
+        assert metrics["admitted_after_wait"] == 1
+        assert metrics["rejections_by_reason"] == {"queue_full": 1}
+
+    def test_queue_timeout_rejects_with_retry_after(self, controller, clock):
+        """대기 시간이 지나면 가장 빨리 스필 가능한 방 기준 retry_after로 거절"""
+        for i in range(3):
+            controller.try_admit(f"room-{i}")
+            controller.commit(f"room-{i}", _usage(f"room-{i}", 10))
+        clock.now = 45
+
+        decision = asyncio.run(controller.admit("late"))
+
+        assert decision.reason == "queue_timeout_max_rooms"
+        assert decision.retry_after == 15
+
+    def test_spill_candidates_skip_busy_rooms(self, controller, clock):
+        """유휴 방만 스필 대상이며 압박 상태에서는 짧게 쉰 방도 오래 쉰 순으로 선택"""
+        for room_id in ("old", "busy", "recent"):
+            controller.try_admit(room_id)
+            controller.commit(room_id, _usage(room_id, 10))
+        controller.begin_task("busy")
+        clock.now = 100
+        controller.touch("recent")
+        clock.now = 130
+
+        assert controller.select_spill_candidates() == ["old"]
+        assert controller.select_spill_candidates(live_rooms={"recent"}) == []
+
+        controller.release("old", spilled=True)
+        assert controller.get_metrics()["spilled"] == 1
+
+
+class TestRoomSnapshotStore:
+    """RoomSnapshotStore 테스트 클래스"""
+
+    def test_file_round_trip(self, tmp_path):
+        """로컬 파일 스냅샷 저장/조회/삭제"""
+        store = RoomSnapshotStore(directory=str(tmp_path))
+        snapshot = {"room_id": "room/1", "state": {"turn_count": 3}}
+
+        assert store.save("room/1", snapshot)
+        assert store.exists("room/1")
+        assert store.load("room/1") == snapshot
+
+        store.delete("room/1")
+        assert store.load("room/1") is None
+
+    def test_redis_backend(self):
+        """Redis 클라이언트가 있으면 TTL과 함께 Redis에 저장"""
+        redis_client = MagicMock()
+        store = RoomSnapshotStore(redis_client=redis_client, ttl_seconds=60)
+
+        store.save("room", {"room_id": "room"})
+
+        redis_client.set.assert_called_once_with("room_snapshot:room", '{"room_id": "room"}', ex=60)
@@ -0,0 +1,307 @@
+"""
+Unit tests for RoomOwnershipRegistry and RoomAffinityMiddleware.
+"""
+
+import socket
+import threading
+import time
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import APIRouter, FastAPI
+
+from src.benchmark.fake_redis import InMemorySyncRedis
+from src.dialogue.managers.room_ownership import (
+    FORWARDED_BY_HEADER,
+    OWNER_HEADER,
+    RoomAffinityMiddleware,
+    RoomOwnershipRegistry,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def redis_client(clock):
+    return InMemorySyncRedis(clock=clock)
+
+
+def _registry(redis_client, clock, worker_id, lease_seconds=30.0):
+    return RoomOwnershipRegistry(redis_client, worker_id, f"http://{worker_id}", lease_seconds, clock=clock)
+
+
+class TestRoomOwnershipRegistry:
+    """방 소유권 리스 확보/갱신/이어받기"""
+
+    def test_first_claim_wins_and_others_see_owner(self, redis_client, clock):
+        a = _registry(redis_client, clock, "a")
+        b = _registry(redis_client, clock, "b")
+
+        lease_a = a.claim("room1")
+        lease_b = b.claim("room1")
+
+        assert lease_a.worker_id == "a" and lease_a.epoch == 1
+        assert lease_b.worker_id == "a"
+        assert lease_b.worker_url == "http://a"
+        assert b.owned_rooms() == []
+        assert a.is_owner("room1") and not b.is_owner("room1")
+
+    def test_expired_lease_is_taken_over_with_new_epoch(self, redis_client, clock):
+        a = _registry(redis_client, clock, "a")
+        b = _registry(redis_client, clock, "b")
+        a.claim("room1")
+
+        clock.now += 31
+        lease = b.claim("room1")
+
+        assert lease.worker_id == "b" and lease.epoch == 2
+        assert b.metrics["reclaimed"] == 1
+        # 되살아난 a는 갱신 시 소유권을 잃었음을 알게 됨
+        assert a.renew_owned() == ["room1"]
+        assert a.owned_rooms() == []
+        assert a.claim("room1").worker_id == "b"
+
+    def test_renewal_keeps_lease_alive(self, redis_client, clock):
+        a = _registry(redis_client, clock, "a")
+        b = _registry(redis_client, clock, "b")
+        a.claim("room1")
+
+        for _ in range(5):
+            clock.now += 20
+            assert a.renew_owned() == []
+
+        assert b.claim("room1").worker_id == "a"
+
+    def test_claim_uses_local_lease_until_half_expired(self, redis_client, clock):
+        a = _registry(redis_client, clock, "a")
+        a.claim("room1")
+        round_trips = redis_client.stats["round_trips"]
+
+        a.claim("room1")
+        assert redis_client.stats["round_trips"] == round_trips
+        assert a.metrics["cached"] == 1
+
+        clock.now += 20
+        a.claim("room1")
+        assert redis_client.stats["round_trips"] > round_trips
+        assert a.metrics["renewed"] == 1
+
+    def test_release_only_deletes_own_lease(self, redis_client, clock):
+        a = _registry(redis_client, clock, "a")
+        b = _registry(redis_client, clock, "b")
+        a.claim("room1")
+
+        assert b.release("room1") is False
+        assert a.is_owner("room1")
+        assert a.release("room1") is True
+        assert b.claim("room1").worker_id == "b"
+
+    def test_concurrent_claims_elect_single_owner(self, redis_client, clock):
+        registries = [_registry(redis_client, clock, f"w{i}") for i in range(8)]
+        results = []
+        threads = [threading.Thread(target=lambda r=r: results.append(r.claim("room1"))) for r in registries]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        owners = {lease.worker_id for lease in results}
+        assert len(owners) == 1
+        assert sum(1 for r in registries if r.owned_rooms()) == 1
+
+    def test_worker_url_must_be_unique(self, redis_client, clock):
+        """URL이 없거나 살아 있는 다른 워커가 같은 URL을 등록했으면 레지스트리 비활성"""
+        assert not RoomOwnershipRegistry(redis_client, "no-url", None, clock=clock).enabled
+
+        first = RoomOwnershipRegistry(redis_client, "a", "http://shared", 30.0, clock=clock)
+        duplicate = RoomOwnershipRegistry(redis_client, "b", "http://shared", 30.0, clock=clock)
+        assert first.register_worker()
+
+        def sleep(seconds):
+            clock.now += seconds
+            first.renew_owned()  # 살아 있는 워커는 계속 갱신
+
+        assert not duplicate.register_worker(sleep=sleep)
+        assert not duplicate.enabled and first.enabled
+
+    def test_restarted_worker_waits_for_previous_registration(self, redis_client, clock):
+        """재시작 전 인스턴스의 URL 등록은 만료를 기다린 뒤 넘겨받음"""
+        crashed = RoomOwnershipRegistry(redis_client, "a-1", "http://a", 30.0, clock=clock)
+        restarted = RoomOwnershipRegistry(redis_client, "a-2", "http://a", 30.0, clock=clock)
+        assert crashed.register_worker()
+
+        def sleep(seconds):
+            clock.now += seconds
+
+        assert restarted.register_worker(sleep=sleep)
+        assert restarted.enabled
+
+    def test_previous_instance_lease_is_taken_over(self, redis_client, clock):
+        """같은 URL의 이전 인스턴스 리스는 만료 전에도 새 epoch로 이어받음"""
+        crashed = RoomOwnershipRegistry(redis_client, "a-1", "http://a", 30.0, clock=clock)
+        restarted = RoomOwnershipRegistry(redis_client, "a-2", "http://a", 30.0, clock=clock)
+        other = _registry(redis_client, clock, "b")
+        stale = crashed.claim("room1")
+
+        lease = restarted.take_over("room1", restarted.claim("room1"))
+
+        assert lease.worker_id == "a-2" and lease.epoch == stale.epoch + 1
+        assert restarted.owned_rooms() == ["room1"]
+        assert other.claim("room1").worker_id == "a-2"
+        # 그 사이 리스가 바뀌었으면 이어받지 않음
+        assert crashed.take_over("room1", stale).worker_id == "a-2"
+
+    def test_disabled_registry_owns_everything_locally(self):
+        registry = RoomOwnershipRegistry(None, "solo")
+        assert not registry.enabled
+        assert registry.claim("room1").worker_id == "solo"
+        assert registry.is_owner("room1")
+        assert registry.renew_owned() == []
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Worker:
+    """프로세스 내 uvicorn 워커 하나 (방 상태는 로컬 dict)"""
+
+    def __init__(self, worker_id, redis_client, lease_seconds, port=None):
+        self.port = port or _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.registry = RoomOwnershipRegistry(redis_client, worker_id, self.url, lease_seconds)
+        self.rooms = {}
+
+        router = APIRouter(prefix="/chat")
+
+        @router.post("/create-debate-room")
+        async def create(request: dict):
+            self.rooms[request["room_id"]] = 0
+            return {"worker_id": worker_id}
+
+        @router.post("/debate/{room_id}/next-message")
+        async def next_message(room_id: str):
+            # 이어받은 워커는 (실제로는 스냅샷에서) 방을 복원
+            self.rooms[room_id] = self.rooms.get(room_id, 0) + 1
+            return {"worker_id": worker_id, "turns": self.rooms[room_id]}
+
+        app = FastAPI()
+        app.include_router(router, prefix="/api")
+        app.add_middleware(RoomAffinityMiddleware, registry=self.registry, forward_timeout=5.0)
+
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="error"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        deadline = time.time() + 10
+        while not self.server.started:
+            assert time.time() < deadline, "worker did not start"
+            time.sleep(0.01)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+@pytest.fixture
+def workers():
+    redis_client = InMemorySyncRedis()
+    pool = [Worker(f"w{i}", redis_client, lease_seconds=0.6) for i in range(3)]
+    for worker in pool:
+        worker.start()
+    yield pool
+    for worker in pool:
+        if worker.thread.is_alive():
+            worker.stop()
+
+
+class TestRoomAffinityRouting:
+    """여러 uvicorn 워커 사이의 방 친화 라우팅"""
+
+    def test_requests_reach_owner_from_any_worker(self, workers):
+        with httpx.Client(timeout=5) as client:
+            created = client.post(f"{workers[1].url}/api/chat/create-debate-room", json={"room_id": "room1"})
+            assert created.json()["worker_id"] == "w1"
+
+            responses = [client.post(f"{worker.url}/api/chat/debate/room1/next-message") for worker in workers]
+
+        assert [r.json()["worker_id"] for r in responses] == ["w1", "w1", "w1"]
+        assert [r.json()["turns"] for r in responses] == [1, 2, 3]
+        assert responses[0].headers[OWNER_HEADER] == "w1"
+        assert "room1" not in workers[0].rooms and "room1" not in workers[2].rooms
+
+    def test_create_is_forwarded_with_body(self, workers):
+        with httpx.Client(timeout=5) as client:
+            client.post(f"{workers[0].url}/api/chat/debate/room2/next-message")
+            created = client.post(f"{workers[2].url}/api/chat/create-debate-room", json={"room_id": "room2"})
+
+        assert created.json()["worker_id"] == "w0"
+        assert workers[0].rooms == {"room2": 0}
+
+    def test_forwarded_request_is_not_forwarded_again(self, workers):
+        with httpx.Client(timeout=5) as client:
+            client.post(f"{workers[0].url}/api/chat/debate/room3/next-message")
+            response = client.post(f"{workers[1].url}/api/chat/debate/room3/next-message",
+                                   headers={FORWARDED_BY_HEADER: "w2"})
+
+        assert response.status_code == 503
+        assert response.json()["detail"]["reason"] == "room_moved"
+        assert workers[1].registry.owned_rooms() == []
+
+    def test_takeover_after_owner_stops(self, workers):
+        with httpx.Client(timeout=5) as client:
+            client.post(f"{workers[0].url}/api/chat/create-debate-room", json={"room_id": "room4"})
+            workers[0].stop()
+
+            response = client.post(f"{workers[1].url}/api/chat/debate/room4/next-message")
+            assert response.status_code == 503
+            assert response.json()["detail"]["reason"] == "owner_unreachable"
+            assert int(response.headers["retry-after"]) >= 1
+
+            time.sleep(0.7)
+            response = client.post(f"{workers[1].url}/api/chat/debate/room4/next-message")
+            assert response.json()["worker_id"] == "w1"
+
+            # 이어받은 뒤에는 다른 워커도 새 소유자로 전달
+            response = client.post(f"{workers[2].url}/api/chat/debate/room4/next-message")
+            assert response.json() == {"worker_id": "w1", "turns": 2}
+
+    def test_restarted_worker_takes_over_its_own_url(self):
+        """같은 URL로 재시작한 워커는 이전 인스턴스의 리스를 misrouted 대신 바로 이어받음"""
+        redis_client = InMemorySyncRedis()
+        original, other = Worker("w0", redis_client, 30.0), Worker("w1", redis_client, 30.0)
+        original.start()
+        other.start()
+        try:
+            with httpx.Client(timeout=5) as client:
+                client.post(f"{original.url}/api/chat/create-debate-room", json={"room_id": "room5"})
+                original.stop()
+
+                restarted = Worker("w0-restarted", redis_client, 30.0, port=original.port)
+                restarted.start()
+                try:
+                    response = client.post(f"{restarted.url}/api/chat/debate/room5/next-message")
+                    forwarded = client.post(f"{other.url}/api/chat/debate/room5/next-message")
+                finally:
+                    restarted.stop()
+        finally:
+            other.stop()
+
+        assert response.status_code == 200 and response.json()["worker_id"] == "w0-restarted"
+        assert forwarded.json() == {"worker_id": "w0-restarted", "turns": 2}
+        assert restarted.registry.get_metrics()["taken_over"] == 1
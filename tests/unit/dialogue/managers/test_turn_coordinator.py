@@ -0,0 +1,152 @@
+"""
+Unit tests for TurnCoordinator.
+"""
+
+import asyncio
+
+import pytest
+
+from src.dialogue.managers.turn_coordinator import TurnCoordinator
+
+
+class FakeRoom:
+    """발언 순서만 흉내 내는 토론방"""
+
+    def __init__(self, order):
+        self.order = list(order)
+        self.history = []
+        self.generate_calls = 0
+
+    def next_speaker(self):
+        speaker = self.order[0] if self.order else None
+        return {"speaker_id": speaker, "role": "pro", "stage": "opening"}
+
+    async def generate(self, ticket, delay=0.02):
+        self.generate_calls += 1
+        await asyncio.sleep(delay)
+        self.history.append((ticket.turn_id, self.order.pop(0)))
+        return {"status": "success"}
+
+    def process_message(self, user_id):
+        if not self.order or self.order[0] != user_id:
+            return {"status": "error", "reason": "not_your_turn"}
+        self.history.append(self.order.pop(0))
+        return {"status": "success", "role": "con"}
+
+
+def _is_user(speaker_id):
+    return speaker_id.startswith("user")
+
+
+class TestTurnCoordinator:
+    """턴 직렬화/중복 제거 테스트 클래스"""
+
+    @pytest.fixture
+    def coordinator(self):
+        return TurnCoordinator()
+
+    def test_concurrent_requests_generate_turn_once(self, coordinator):
+        """같은 방에 동시에 들어온 요청은 생성 한 번에 같은 turn_id를 받음"""
+        room = FakeRoom(["moderator", "kant"])
+
+        async def scenario():
+            decisions = await asyncio.gather(*[
+                coordinator.request_ai_turn("r1", room.next_speaker, _is_user, room.generate)
+                for _ in range(5)
+            ])
+            await decisions[0].ticket.task
+            return decisions
+
+        decisions = asyncio.run(scenario())
+
+        assert [d.status for d in decisions].count("started") == 1
+        assert [d.status for d in decisions].count("duplicate") == 4
+        assert {d.ticket.turn_id for d in decisions} == {1}
+        assert room.generate_calls == 1
+        assert room.history == [(1, "moderator")]
+        assert coordinator.next_turn_id("r1") == 2
+
+    def test_stale_expected_turn_is_rejected(self, coordinator):
+        """이미 끝난 턴을 기대한 재시도는 stale로 거절되고 완료된 결과를 함께 돌려줌"""
+        room = FakeRoom(["moderator", "kant"])
+
+        async def scenario():
+            first = await coordinator.request_ai_turn("r1", room.next_speaker, _is_user, room.generate,
+                                                      expected_turn_id=1)
+            await first.ticket.task
+            retry = await coordinator.request_ai_turn("r1", room.next_speaker, _is_user, room.generate,
+                                                      expected_turn_id=1)
+            second = await coordinator.request_ai_turn("r1", room.next_speaker, _is_user, room.generate,
+                                                       expected_turn_id=2)
+            await second.ticket.task
+            return retry, second
+
+        retry, second = asyncio.run(scenario())
+
+        assert retry.status == "stale"
+        assert retry.ticket.status == "completed"
+        assert retry.next_turn_id == 2
+        assert second.status == "started" and second.ticket.turn_id == 2
+        assert room.history == [(1, "moderator"), (2, "kant")]
+
+    def test_user_turn_is_serialized_and_idempotent(self, coordinator):
+        """사용자 메시지는 client_message_id 재시도 시 한 번만 반영되고 AI 생성 중에는 busy"""
+        room = FakeRoom(["moderator", "user1", "kant"])
+        applied = []
+
+        def apply():
+            applied.append(1)
+            return room.process_message("user1")
+
+        async def scenario():
+            ai = await coordinator.request_ai_turn("r1", room.next_speaker, _is_user, room.generate)
+            busy = await coordinator.submit_user_turn("r1", "user1", apply, client_message_id="m1")
+            await ai.ticket.task
+            user_turn = await coordinator.request_ai_turn("r1", room.next_speaker, _is_user, room.generate)
+            first = await coordinator.submit_user_turn("r1", "user1", apply,
+                                                       expected_turn_id=user_turn.next_turn_id,
+                                                       client_message_id="m1")
+            retry = await coordinator.submit_user_turn("r1", "user1", apply, client_message_id="m1")
+            return busy, user_turn, first, retry
+
+        busy, user_turn, first, retry = asyncio.run(scenario())
+
+        assert busy.status == "busy"
+        assert user_turn.status == "user_turn" and user_turn.next_turn_id == 2
+        assert first.status == "processed" and first.ticket.turn_id == 2
+        assert retry.status == "duplicate" and retry.ticket.turn_id == 2
+        assert len(applied) == 1
+        assert room.history == [(1, "moderator"), "user1"]
+        assert coordinator.next_turn_id("r1") == 3
+
+    def test_rejected_user_message_does_not_consume_turn_id(self, coordinator):
+        """차례가 아니어서 반영되지 않은 메시지는 turn_id를 소비하지 않음"""
+        room = FakeRoom(["kant"])
+
+        decision = asyncio.run(coordinator.submit_user_turn(
+            "r1", "user1", lambda: room.process_message("user1"), client_message_id="m1"))
+
+        assert decision.status == "rejected"
+        assert decision.reason == "not_your_turn"
+        assert coordinator.next_turn_id("r1") == 1
+        assert coordinator.get_room_status("r1")["recent"] == []
+
+    def test_failed_turn_releases_room(self, coordinator):
+        """생성이 실패해도 진행 중 표시가 풀려 다음 요청이 새 턴을 시작함"""
+        room = FakeRoom(["moderator"])
+
+        async def failing(ticket):
+            raise RuntimeError("LLM down")
+
+        async def scenario():
+            failed = await coordinator.request_ai_turn("r1", room.next_speaker, _is_user, failing)
+            await failed.ticket.task
+            retry = await coordinator.request_ai_turn("r1", room.next_speaker, _is_user, room.generate)
+            await retry.ticket.task
+            return failed, retry
+
+        failed, retry = asyncio.run(scenario())
+
+        assert failed.ticket.status == "failed"
+        assert retry.status == "started" and retry.ticket.turn_id == 2
+        assert coordinator.get_metrics()["failed"] == 1
@@ -0,0 +1,154 @@
+"""
+Unit tests for UserManager session expiry and indexes.
+"""
+
+import time
+import threading
+
+import pytest
+
+from src.dialogue.managers.user_manager import UserManager
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestUserSessionExpiry:
+    """만료 힙 기반 세션 정리 테스트 클래스"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def manager(self, clock):
+        manager = UserManager(session_timeout=100, clock=clock)
+        yield manager
+        manager.shutdown()
+
+    def test_only_due_sessions_expire(self, manager, clock):
+        """마감이 지난 세션만 정리되고 활동이 갱신된 세션은 연장됨"""
+        manager.create_user_session("u1", "User1", session_id="s1")
+        clock.advance(50)
+        manager.create_user_session("u2", "User2", session_id="s2")
+        manager.create_user_session("u3", "User3", session_id="s3")
+
+        clock.advance(40)
+        manager.update_user_activity("u1")
+        clock.advance(20)  # s1 마지막 활동 후 20초, s2/s3 60초
+
+        assert manager.cleanup_expired_sessions() == 0
+        clock.advance(50)  # s2/s3 110초, s1 70초
+        assert manager.cleanup_expired_sessions() == 2
+
+        assert manager.get_user_session("s1") is not None
+        assert manager.get_user_session_by_user_id("u2") is None
+        assert manager.get_online_users() == ["u1"]
+
+    def test_activity_updates_do_not_grow_heap(self, manager, clock):
+        """활동 갱신은 힙에 항목을 추가하지 않음"""
+        manager.create_user_session("u1", "User1")
+        for _ in range(1000):
+            clock.advance(1)
+            manager.update_user_activity("u1")
+
+        assert manager.get_system_stats()["pending_expiry_entries"] == 1
+        assert manager.next_expiry() == 1100.0
+
+    def test_ended_session_entries_are_compacted(self, manager, clock):
+        """종료된 세션의 힙 항목은 쌓이지 않고 정리됨"""
+        for i in range(500):
+            session = manager.create_user_session(f"u{i}", f"User{i}")
+            manager.end_user_session(session.session_id)
+
+        assert manager.get_system_stats()["pending_expiry_entries"] <= 65
+
+    def test_recreated_session_id_is_not_expired_by_old_entry(self, manager, clock):
+        """같은 세션 ID로 다시 만든 세션은 이전 힙 항목으로 만료되지 않음"""
+        manager.create_user_session("u1", "User1", session_id="s1")
+        clock.advance(90)
+        manager.create_user_session("u1", "User1", session_id="s1")
+        clock.advance(20)
+
+        assert manager.cleanup_expired_sessions() == 0
+        assert manager.get_user_session("s1") is not None
+
+    def test_session_end_leaves_every_joined_dialogue(self, manager, clock):
+        """세션 종료/만료 시 참여한 모든 대화에서 제거됨"""
+        manager.create_user_session("u1", "User1", session_id="s1")
+        manager.create_user_session("u2", "User2", session_id="s2")
+        manager.add_user_to_dialogue("u1", "room_a")
+        manager.add_user_to_dialogue("u1", "room_b")
+        manager.add_user_to_dialogue("u2", "room_b")
+
+        clock.advance(150)
+        manager.update_user_activity("u2")
+        manager.cleanup_expired_sessions()
+
+        assert manager.get_dialogue_participants("room_a") == set()
+        assert manager.get_dialogue_participants("room_b") == {"u2"}
+        assert "u1" not in manager.user_dialogues
+        assert manager.get_system_stats()["total_dialogues"] == 1
+
+
+class TestUserManagerConcurrency:
+    """백그라운드 정리 스레드 및 동시 접근 테스트 클래스"""
+
+    def test_background_worker_reclaims_idle_sessions(self):
+        """백그라운드 스레드가 호출 없이도 유휴 세션을 바로 정리"""
+        manager = UserManager(session_timeout=0.05, cleanup_interval=10)
+        manager.start_expiry_worker()
+        try:
+            manager.create_user_session("u1", "User1", session_id="s1")
+            deadline = time.time() + 2
+            while manager.get_user_session("s1") is not None and time.time() < deadline:
+                time.sleep(0.01)
+
+            assert manager.get_user_session("s1") is None
+            assert manager.get_system_stats()["expiry_worker_running"] is True
+        finally:
+            manager.shutdown()
+        assert manager.get_system_stats()["expiry_worker_running"] is False
+
+    def test_concurrent_access_keeps_indexes_consistent(self):
+        """여러 스레드가 동시에 세션/대화를 조작해도 인덱스가 일관됨"""
+        manager = UserManager(session_timeout=0.01, cleanup_interval=0.005)
+        manager.start_expiry_worker()
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(200):
+                    user_id = f"user_{n}_{i % 10}"
+                    manager.create_user_session(user_id, user_id)
+                    manager.add_user_to_dialogue(user_id, f"room_{i % 3}")
+                    manager.update_user_activity(user_id)
+                    manager.get_online_users()
+                    if i % 4 == 0:
+                        manager.remove_user_from_dialogue(user_id, f"room_{i % 3}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        try:
+            assert errors == []
+            with manager._lock:
+                for user_id, session_id in manager.user_to_session.items():
+                    assert manager.user_sessions[session_id].user_id == user_id
+                for user_id, dialogues in manager.user_dialogues.items():
+                    for dialogue_id in dialogues:
+                        assert user_id in manager.dialogue_participants[dialogue_id]
+        finally:
+            manager.shutdown()
@@ -0,0 +1,210 @@
+"""
+Unit tests for RoomTaskGraph and SharedTaskPool.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.dialogue.parallel.task_graph import (
+    PRIORITY_NORMAL,
+    PRIORITY_SPECULATIVE,
+    PRIORITY_URGENT,
+    TASK_CANCELLED,
+    TASK_DONE,
+    TASK_FAILED,
+    RoomTaskGraph,
+    SharedTaskPool,
+)
+
+
+@pytest.fixture
+def pool():
+    pool = SharedTaskPool(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def _recorder(order, name, result=None):
+    def run():
+        order.append(name)
+        return result if result is not None else name
+    return run
+
+
+def _block(graph, gate, key="gate"):
+    """워커 하나를 gate가 열릴 때까지 붙잡아 두는 작업"""
+    started = threading.Event()
+
+    def run():
+        started.set()
+        gate.wait(5)
+
+    graph.submit(key, run, priority=PRIORITY_URGENT)
+    assert started.wait(5)
+
+
+class TestRoomTaskGraph:
+    """의존성 순서, 우선순위, 취소, 대기"""
+
+    def test_dependencies_run_in_order(self, pool):
+        graph = RoomTaskGraph("room1", pool)
+        order = []
+        graph.submit("c", _recorder(order, "c"), deps=["b"])
+        graph.submit("b", _recorder(order, "b"), deps=["a"])
+        graph.submit("a", _recorder(order, "a"))
+
+        assert graph.wait(timeout=5)
+        assert order == ["a", "b", "c"]
+        assert graph.result("c") == "c"
+        assert graph.status("a") == TASK_DONE
+
+    def test_failed_dependency_fails_dependents(self, pool):
+        graph = RoomTaskGraph("room1", pool)
+        ran = []
+
+        def boom():
+            raise ValueError("analysis failed")
+
+        graph.submit("analysis", boom)
+        strategy = graph.submit("strategy", _recorder(ran, "strategy"), deps=["analysis"])
+
+        assert graph.wait(timeout=5)
+        assert graph.status("analysis") == TASK_FAILED
+        assert strategy.status == TASK_FAILED
+        assert "dependency analysis failed" in str(strategy.error)
+        assert ran == []
+        with pytest.raises(RuntimeError):
+            strategy.future.result()
+
+    def test_urgent_work_jumps_ahead_of_speculative(self, pool):
+        graph = RoomTaskGraph("room1", pool)
+        gate = threading.Event()
+        order = []
+        _block(graph, gate)
+
+        graph.submit("spec1", _recorder(order, "spec1"), priority=PRIORITY_SPECULATIVE)
+        graph.submit("spec2", _recorder(order, "spec2"), priority=PRIORITY_SPECULATIVE)
+        graph.submit("next_speaker", _recorder(order, "next_speaker"), priority=PRIORITY_URGENT)
+        gate.set()
+
+        assert graph.wait(timeout=5)
+        assert order == ["next_speaker", "spec1", "spec2"]
+
+    def test_prioritize_raises_dependencies_too(self, pool):
+        graph = RoomTaskGraph("room1", pool)
+        gate = threading.Event()
+        order = []
+        _block(graph, gate)
+
+        graph.submit("other", _recorder(order, "other"), priority=PRIORITY_NORMAL)
+        graph.submit("analysis", _recorder(order, "analysis"), priority=PRIORITY_SPECULATIVE, tags=["analyzer:a"])
+        graph.submit("strategy", _recorder(order, "strategy"), deps=["analysis"],
+                     priority=PRIORITY_SPECULATIVE, tags=["analyzer:a"])
+
+        assert graph.prioritize(keys=["strategy"]) == 2
+        gate.set()
+
+        assert graph.wait(timeout=5)
+        assert order == ["analysis", "strategy", "other"]
+
+    def test_duplicate_submission_reuses_node(self, pool):
+        graph = RoomTaskGraph("room1", pool)
+        calls = []
+        first = graph.submit("argument:a", _recorder(calls, "a"), priority=PRIORITY_SPECULATIVE)
+        second = graph.submit("argument:a", _recorder(calls, "a"), priority=PRIORITY_URGENT)
+
+        assert first is second
+        assert graph.wait(timeout=5)
+        assert calls == ["a"]
+        assert graph.stats["deduplicated"] == 1
+
+    def test_cancel_all_skips_queued_work_and_rejects_new_work(self, pool):
+        graph = RoomTaskGraph("room1", pool)
+        gate = threading.Event()
+        ran = []
+        _block(graph, gate)
+        queued = graph.submit("analysis", _recorder(ran, "analysis"))
+
+        cancelled = graph.cancel_all()
+        gate.set()
+
+        assert cancelled == 2  # 실행 중인 gate 작업 포함
+        assert queued.status == TASK_CANCELLED
+        assert queued.future.cancelled()
+        assert graph.wait(timeout=5)
+        late = graph.submit("late", _recorder(ran, "late"))
+        assert late.status == TASK_CANCELLED
+        time.sleep(0.05)
+        assert ran == []
+
+    def test_wait_async_does_not_block_event_loop(self, pool):
+        graph = RoomTaskGraph("room1", pool)
+        gate = threading.Event()
+        graph.submit("slow", lambda: gate.wait(5) and "ready", tags=["analyzer:a"])
+
+        async def scenario():
+            ticks = 0
+            waiter = asyncio.create_task(graph.wait_async(tag="analyzer:a", timeout=5))
+            while not waiter.done():
+                ticks += 1
+                if ticks == 3:
+                    gate.set()
+                await asyncio.sleep(0.01)
+            return await waiter, ticks
+
+        finished, ticks = asyncio.run(scenario())
+        assert finished is True
+        assert ticks >= 3
+        assert graph.result("slow") == "ready"
+
+    def test_wait_async_times_out(self, pool):
+        graph = RoomTaskGraph("room1", pool)
+        gate = threading.Event()
+        graph.submit("slow", lambda: gate.wait(5))
+
+        assert asyncio.run(graph.wait_async(["slow"], timeout=0.05)) is False
+        gate.set()
+        assert graph.wait(["slow"], timeout=5)
+
+    def test_finished_nodes_are_pruned(self, pool):
+        graph = RoomTaskGraph("room1", pool, history_size=2)
+        for i in range(6):
+            graph.submit(f"task{i}", lambda: None)
+        assert graph.wait(timeout=5)
+        time.sleep(0.05)
+
+        assert graph.get_stats()["nodes"] <= 2
+        assert graph.stats["completed"] == 6
+
+
+class TestSharedTaskPool:
+    """방 간 공유 풀의 동시성 상한"""
+
+    def test_pool_bounds_concurrency_across_rooms(self):
+        pool = SharedTaskPool(max_workers=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+        graphs = [RoomTaskGraph(f"room{i}", pool) for i in range(3)]
+        for graph in graphs:
+            for j in range(4):
+                graph.submit(f"task{j}", work)
+
+        try:
+            assert all(graph.wait(timeout=5) for graph in graphs)
+            assert max(peak) <= 2
+            assert sum(graph.stats["completed"] for graph in graphs) == 12
+        finally:
+            pool.shutdown()
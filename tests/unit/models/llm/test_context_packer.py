@@ -0,0 +1,89 @@
+"""
+ContextPacker 단위 테스트
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.models.llm.context_packer import ContextPacker, get_context_window
+from src.models.llm.token_counter import count_tokens, truncate_to_tokens
+
+
+@pytest.fixture(autouse=True)
+def approximate_tokens():
+    """네트워크 없이 동작하도록 근사 토큰 계산 사용"""
+    with patch("src.models.llm.token_counter.get_encoding", return_value=None):
+        yield
+
+
+class TestContextPacker:
+    """섹션별 토큰 예산 패킹 테스트"""
+
+    def test_within_budget_keeps_everything_in_order(self):
+        """예산 안이면 모든 항목을 추가 순서대로 유지"""
+        packer = ContextPacker(section_budgets={"recent_turns": 500})
+        packer.add("recent_turns", "first turn", priority=0.2)
+        packer.add("recent_turns", "second turn", priority=0.9)
+        packer.add("persona", "You are Kant.")
+
+        packed = packer.pack()
+
+        assert packed.get("recent_turns") == "first turn\nsecond turn"
+        assert packed.text.startswith("You are Kant.")
+        assert packed.cut == []
+        assert packed.total_tokens == count_tokens(packed.text)
+
+    def test_section_budget_drops_lowest_priority_first(self):
+        """섹션 예산 초과 시 낮은 우선순위 항목부터 제거하고 보고"""
+        packer = ContextPacker(section_budgets={"recent_turns": 30})
+        packer.add("recent_turns", "old " * 40, priority=0.1, compressible=False, label="old")
+        packer.add("recent_turns", "new turn", priority=0.9, label="new")
+
+        packed = packer.pack()
+
+        assert packed.get("recent_turns") == "new turn"
+        assert packed.cut[0]["label"] == "old"
+        assert packed.cut[0]["action"] == "dropped"
+
+    def test_section_budget_compresses_when_possible(self):
+        """압축 가능한 항목은 남은 예산만큼 잘라서 유지"""
+        packer = ContextPacker(section_budgets={"evidence": 50})
+        packer.add("evidence", "evidence " * 100, label="rag")
+
+        packed = packer.pack()
+
+        assert packed.section_tokens["evidence"] <= 50
+        assert packed.cut[0]["action"] == "compressed"
+        assert packed.cut[0]["tokens_after"] < packed.cut[0]["tokens_before"]
+
+    def test_total_budget_cuts_lowest_value_sections(self):
+        """전체 예산 초과 시 우선순위가 낮은 감정/근거부터 축소"""
+        packer = ContextPacker(total_budget=60)
+        packer.add("persona", "persona " * 30, priority=1.0, label="persona")
+        packer.add("emotion", "angry " * 30, priority=0.1, compressible=False, label="emotion")
+
+        packed = packer.pack()
+
+        assert packed.get("persona")
+        assert packed.get("emotion") == ""
+        assert [entry["label"] for entry in packed.cut] == ["emotion"]
+
+
+class TestTokenHelpers:
+    """토큰 보조 함수 테스트"""
+
+    def test_truncate_to_tokens_head_and_tail(self):
+        """앞/뒤 유지 방향에 따라 토큰 예산 이하로 자르기"""
+        text = "alpha beta gamma delta " * 20
+
+        head = truncate_to_tokens(text, 10, keep="head")
+        tail = truncate_to_tokens(text, 10, keep="tail")
+
+        assert count_tokens(head) <= 10 and text.startswith(head)
+        assert count_tokens(tail) <= 10 and text.endswith(tail)
+
+    def test_context_window_prefix_match(self):
+        """모델 이름 접두사로 컨텍스트 윈도우 결정"""
+        assert get_context_window("gpt-4o-mini") == 128000
+        assert get_context_window("gpt-4") == 8192
+        assert get_context_window("unknown-model") == 8192
@@ -0,0 +1,101 @@
+"""
+Unit tests for the shared local inference service.
+"""
+
+import threading
+
+import pytest
+
+from src.models.llm.local_inference import DeterministicBackend, InferenceBackend, LocalInferenceService
+
+
+SYSTEM_PREFIX = "You are a philosopher in a debate. " * 20
+
+
+class TestLocalInferenceService:
+    """LocalInferenceService 테스트 클래스"""
+
+    @pytest.fixture
+    def backend(self):
+        return DeterministicBackend(step_seconds=0.001)
+
+    @pytest.fixture
+    def service(self, backend):
+        service = LocalInferenceService(backend, max_batch_size=4, batch_window_ms=50)
+        yield service
+        service.shutdown()
+
+    def test_concurrent_requests_are_batched(self, service, backend):
+        """동시에 들어온 요청은 한 묶음으로 백엔드에 전달"""
+        handles = [service.submit(f"question {i}", prefix=SYSTEM_PREFIX, max_tokens=5) for i in range(4)]
+        texts = [handle.result(timeout=5) for handle in handles]
+
+        assert backend.batch_sizes == [4]
+        assert all(len(text.split()) == 5 for text in texts)
+        assert len(set(texts)) == 4
+
+    def test_shared_prefix_is_prefilled_once(self, service, backend):
+        """같은 접두부는 한 번만 prefill하고 이후 요청은 나머지 부분만 계산"""
+        service.generate("first question", prefix=SYSTEM_PREFIX, max_tokens=3, timeout=5)
+        service.generate("second question", prefix=SYSTEM_PREFIX, max_tokens=3, timeout=5)
+
+        assert backend.prefilled_chars == len(SYSTEM_PREFIX) + len("first question") + len("second question")
+        stats = service.get_stats()
+        assert stats["prefix_misses"] == 1
+        assert stats["prefix_hits"] == 1
+
+    def test_output_is_independent_of_prefix_cache(self, backend):
+        """접두부 상태 재사용 여부와 무관하게 같은 출력"""
+        cached = LocalInferenceService(backend, batch_window_ms=0)
+        uncached = LocalInferenceService(backend, batch_window_ms=0, prefix_cache_size=0)
+        try:
+            for _ in range(2):
+                assert cached.generate("q", prefix=SYSTEM_PREFIX, max_tokens=6, timeout=5) == \
+                    uncached.generate("q", prefix=SYSTEM_PREFIX, max_tokens=6, timeout=5)
+        finally:
+            cached.shutdown()
+            uncached.shutdown()
+
+    def test_stream_to_multiple_consumers(self, service):
+        """같은 결정적 요청은 하나로 합쳐지고 소비자마다 전체 스트림을 받음"""
+        first = service.submit("same", prefix=SYSTEM_PREFIX, max_tokens=8, temperature=0)
+        second = service.submit("same", prefix=SYSTEM_PREFIX, max_tokens=8, temperature=0)
+
+        assert first is second
+        streams = [[], []]
+        readers = [threading.Thread(target=lambda out=out: out.extend(first.stream(timeout=5))) for out in streams]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join(5)
+
+        assert "".join(streams[0]) == "".join(streams[1]) == first.result(timeout=5)
+        assert service.get_stats()["coalesced"] == 1
+
+    def test_stop_sequence_truncates_and_stops_generation(self, service):
+        """정지 시퀀스를 만나면 그 앞까지만 반환"""
+        full = service.generate("stop test", max_tokens=6, temperature=0, timeout=5)
+        stop_word = full.split()[3]
+
+        truncated = service.generate("stop test", max_tokens=6, temperature=0, timeout=5,
+                                     stop_sequences=[" " + stop_word])
+
+        assert truncated == full[:full.index(" " + stop_word)]
+
+    def test_backend_error_fails_handles(self):
+        """백엔드 오류는 해당 요청의 result()에서 발생하고 서비스는 계속 동작"""
+        class FailingBackend(InferenceBackend):
+            name = "failing"
+
+            def generate_one(self, handle):
+                if "bad" in handle.prompt:
+                    raise RuntimeError("model crashed")
+                handle.emit("ok")
+
+        service = LocalInferenceService(FailingBackend(), batch_window_ms=0)
+        try:
+            with pytest.raises(RuntimeError):
+                service.generate("bad prompt", timeout=5)
+            assert service.generate("good prompt", timeout=5) == "ok"
+        finally:
+            service.shutdown()
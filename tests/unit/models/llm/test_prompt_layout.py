@@ -0,0 +1,126 @@
+"""
+Unit tests for prompt prefix layout and prompt cache tracking.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.models.llm.prompt_layout import (
+    PromptLayout,
+    PromptCacheTracker,
+    cache_eligible_tokens
+)
+from src.models.llm.token_counter import estimate_tokens, count_tokens
+from src.agents.participant.prompt_prefix import build_debate_prompt_layout
+
+
+class TestPromptLayout:
+    """PromptLayout 테스트 클래스"""
+    
+    def test_stable_and_volatile_split(self):
+        """안정 접두부는 시스템, 가변 접미부는 사용자 프롬프트로"""
+        layout = PromptLayout(cache_key="room:kant")
+        layout.add_stable("You are Kant.").add_volatile("Recent: hello").add_stable("Topic: AI")
+        
+        system_prompt, user_prompt = layout.build()
+        
+        assert "You are Kant." in system_prompt and "Topic: AI" in system_prompt
+        assert "Recent: hello" not in system_prompt
+        assert "Recent: hello" in user_prompt
+    
+    def test_prefix_hash_ignores_volatile(self):
+        """가변 내용이 달라도 접두부 해시는 동일"""
+        first = PromptLayout().add_stable("persona").add_volatile("turn 1")
+        second = PromptLayout().add_stable("persona").add_volatile("turn 2")
+        
+        assert first.prefix_hash == second.prefix_hash
+        assert first.prefix_hash != PromptLayout().add_stable("other").prefix_hash
+    
+    def test_cache_eligible_tokens(self):
+        """OpenAI 캐시 규칙 (1024 토큰 이상, 128 단위)"""
+        assert cache_eligible_tokens(1000) == 0
+        assert cache_eligible_tokens(1024) == 1024
+        assert cache_eligible_tokens(1200) == 1152
+    
+    def test_debate_prefix_shared_across_actions(self):
+        """같은 화자의 공격/방어/팔로우업은 동일한 공유 블록으로 시작하고 단계별 캐시 키를 사용"""
+        kwargs = dict(
+            agent_id="kant", philosopher_name="Kant", philosopher_essence="Duty",
+            philosopher_debate_style="Systematic", philosopher_personality="Strict",
+            topic="AI regulation", stance_statements={"pro": "Regulate", "con": "Do not"}, role="pro",
+            strategy_styles={"Clipping": {"description": "Cut the premise"}},
+            context_summary={"summary": "AI policy", "key_points": ["risk", "innovation"]}
+        )
+        attack = build_debate_prompt_layout(stage="attack", **kwargs).add_stable("attack rules").add_volatile("target: hegel")
+        defense = build_debate_prompt_layout(stage="defense", **kwargs).add_stable("defense rules").add_volatile("attack text")
+        
+        shared = attack.shared_prefix
+        assert shared == defense.shared_prefix
+        assert attack.system_prompt.startswith(shared)
+        assert defense.system_prompt.startswith(shared)
+        assert "attack rules" not in shared
+        assert "YOUR POSITION: Regulate" in shared
+        assert "- Clipping: Cut the premise" in shared and "- Refute:" in shared and "- Reattack:" in shared
+        assert "- innovation" in shared
+        assert attack.cache_key != defense.cache_key
+        assert attack.cache_key.endswith(":attack") and defense.cache_key.endswith(":defense")
+
+
+class TestPromptCacheTracker:
+    """PromptCacheTracker 테스트 클래스"""
+    
+    def test_records_prefix_reuse(self):
+        """같은 접두부가 반복되면 재사용으로 기록"""
+        tracker = PromptCacheTracker()
+        
+        first = tracker.record("room:kant", "persona " * 50, "turn 1", "gpt-4o")
+        second = tracker.record("room:kant", "persona " * 50, "turn 2", "gpt-4o", cached_tokens=0)
+        tracker.record("room:kant", "changed persona", "turn 3", "gpt-4o", cached_tokens=128)
+        
+        stats = tracker.get_stats("room:kant")
+        assert first["prefix_reused"] is False
+        assert second["prefix_reused"] is True
+        assert stats["calls"] == 3
+        assert stats["prefix_reuses"] == 1
+        assert stats["prefix_changes"] == 1
+        assert stats["provider_cached_tokens_total"] == 128
+    
+    def test_short_shared_prefix_not_eligible(self):
+        """공유 블록이 1024 토큰 미만이면 시스템 프롬프트가 길어도 캐시 가능 토큰은 0"""
+        tracker = PromptCacheTracker()
+        shared = "persona " * 100
+        system_prompt = shared + "\n\n" + "stage rules " * 600
+        
+        info = tracker.record("room:kant:attack", system_prompt, "turn", "gpt-4o", shared_prefix=shared)
+        
+        assert info["prefix_tokens"] >= 1024
+        assert info["shared_prefix_tokens"] < 1024
+        assert info["cache_eligible_tokens"] == 0
+    
+    def test_long_shared_prefix_eligible(self):
+        """공유 블록이 1024 토큰 이상이면 공유 블록 기준으로 캐시 가능 토큰 계산"""
+        tracker = PromptCacheTracker()
+        shared = "persona " * 1500
+        
+        info = tracker.record("room:kant:defense", shared + "\n\ndefense rules", "turn", "gpt-4o",
+                              shared_prefix=shared)
+        mismatched = tracker.record("room:kant:defense", "other " + shared, "turn", "gpt-4o", shared_prefix=shared)
+        
+        assert info["cache_eligible_tokens"] == cache_eligible_tokens(info["shared_prefix_tokens"])
+        assert info["cache_eligible_tokens"] >= 1024
+        assert mismatched["cache_eligible_tokens"] == 0
+
+
+class TestTokenCounter:
+    """토큰 계산 테스트 클래스"""
+    
+    def test_estimate_tokens(self):
+        """근사치: 영문 약 4자/토큰, 한글 약 1자/토큰"""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("a" * 40) == 11
+        assert estimate_tokens("안녕하세요") == 6
+    
+    def test_count_tokens_falls_back_without_encoding(self):
+        """인코딩을 불러올 수 없으면 근사치 사용"""
+        with patch("src.models.llm.token_counter.get_encoding", return_value=None):
+            assert count_tokens("hello world", "gpt-4o") == estimate_tokens("hello world")
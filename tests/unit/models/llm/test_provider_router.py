@@ -0,0 +1,168 @@
+"""
+Unit tests for the latency-aware LLM provider router.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.agents.utility.debate_emotion_inference import DebateEmotionManager
+from src.agents.utility.turn_deadline import TurnDeadline
+from src.benchmark.fake_llm_server import FakeLLMServer, LatencyProfile
+from src.models.llm.llm_manager import LLMManager
+from src.models.llm.provider_router import ProviderRouter, RouteDecision, RouterConfig
+
+
+def _prime(router, provider, latency, count=5, ok=True):
+    for _ in range(count):
+        router.begin(provider)
+        router.end(provider, latency, ok)
+
+
+class TestProviderRouter:
+    """ProviderRouter 테스트 클래스"""
+
+    def test_local_disabled_always_primary(self):
+        """로컬 모델이 꺼져 있으면 항상 OpenAI"""
+        router = ProviderRouter(RouterConfig(local_enabled=False))
+        _prime(router, "openai", 30.0)
+
+        decision = router.route("keyword_extraction", "gpt-4o")
+
+        assert (decision.provider, decision.model, decision.hedge_after) == ("openai", "gpt-4o", None)
+
+    def test_only_spillable_contexts_spill_under_load(self):
+        """큐가 깊어지면 가벼운 컨텍스트만 로컬 모델로 이동"""
+        router = ProviderRouter(RouterConfig(local_enabled=True, spill_queue_depth=2,
+                                             local_models={"emotion_inference": "llama3-emotion"}))
+        router.begin("openai")
+        router.begin("openai")
+
+        assert router.route("opening_argument", "gpt-4o").provider == "openai"
+        spilled = router.route("emotion_inference", "gpt-4o")
+        assert (spilled.provider, spilled.model, spilled.reason) == ("ollama", "llama3-emotion", "spill_queue")
+
+    def test_latency_error_and_deadline_spill(self):
+        """지연/오류 EWMA와 남은 마감 시간에 따른 spill, 로컬이 비정상이면 유지"""
+        config = RouterConfig(local_enabled=True, spill_latency_seconds=5.0)
+        slow = ProviderRouter(config)
+        _prime(slow, "openai", 6.0)
+        assert slow.route("keyword_extraction", "gpt-4o").reason == "spill_latency"
+
+        failing = ProviderRouter(config)
+        _prime(failing, "openai", 1.0, ok=False)
+        assert failing.route("keyword_extraction", "gpt-4o").reason == "spill_errors"
+
+        tight = ProviderRouter(config)
+        _prime(tight, "openai", 3.0)
+        _prime(tight, "ollama", 0.5)
+        assert tight.route("keyword_extraction", "gpt-4o", deadline_seconds=2.0).reason == "spill_deadline"
+
+        _prime(tight, "ollama", 0.5, count=10, ok=False)
+        assert tight.route("keyword_extraction", "gpt-4o", deadline_seconds=2.0).provider == "openai"
+
+    def test_hedge_delay_from_primary_latency(self):
+        """정상 상태에서는 지연 EWMA 기반 헤징 시간 부여"""
+        router = ProviderRouter(RouterConfig(local_enabled=True, hedge_multiplier=2.0, min_hedge_seconds=0.1))
+        _prime(router, "openai", 1.0)
+
+        decision = router.route("rag_query_generation", "gpt-4o")
+
+        assert decision.provider == "openai"
+        assert decision.hedge_provider == "ollama"
+        assert decision.hedge_after == pytest.approx(2.0)
+        assert router.route("rag_query_generation", "gpt-4o", deadline_seconds=1.5).hedge_after is None
+
+
+class TestLLMManagerRouting:
+    """가짜 OpenAI/Ollama 서버를 상대로 한 LLMManager 라우팅 테스트 클래스"""
+
+    @pytest.fixture
+    def servers(self, monkeypatch):
+        slow = FakeLLMServer(LatencyProfile(distribution="fixed", base_ms=800, tokens_per_second=0, completion_tokens=5))
+        fast = FakeLLMServer(LatencyProfile(distribution="fixed", base_ms=5, tokens_per_second=0, completion_tokens=5))
+        with slow, fast:
+            monkeypatch.setenv("OPENAI_API_KEY", "sk-test-fake-key")
+            monkeypatch.setenv("OPENAI_BASE_URL", slow.openai_base_url)
+            monkeypatch.setenv("OLLAMA_ENDPOINT", fast.base_url)
+            yield slow, fast
+
+    @pytest.fixture
+    def llm_manager(self):
+        with patch.object(LLMManager, "_setup_clients"):
+            manager = LLMManager({"provider": "openai"})
+        manager.provider_router = ProviderRouter(RouterConfig(local_enabled=True, hedge_multiplier=1.0,
+                                                              min_hedge_seconds=0.05))
+        return manager
+
+    def test_slow_primary_is_hedged_to_local(self, servers, llm_manager):
+        """느린 OpenAI 요청은 헤징되어 로컬 응답이 먼저 사용됨"""
+        slow, fast = servers
+        _prime(llm_manager.provider_router, "openai", 0.1)
+
+        content = llm_manager.generate_response("sys", "Describe virtue", context_type="keyword_extraction",
+                                                use_response_cache=False)
+
+        assert content
+        assert fast.get_stats()["by_endpoint"].get("ollama_chat") == 1
+        assert llm_manager.get_router_stats()["decisions"]["hedge_won_by_ollama"] == 1
+
+    def test_max_tokens_resolved_for_routed_model(self, llm_manager):
+        """스필/헤징 대상 모델의 컨텍스트 윈도우에 맞춰 시도마다 max_tokens를 다시 계산"""
+        llm_manager.provider_router = Mock()
+        llm_manager.provider_router.route.return_value = RouteDecision(
+            "openai", "gpt-4o", "hedge", hedge_provider="ollama", hedge_model="llama3", hedge_after=0.01
+        )
+        attempts = {}
+
+        def timed(provider, system_prompt, user_prompt, model, max_tokens, *args):
+            attempts[model] = max_tokens
+            return "" if provider == "openai" else "ok"
+
+        with patch.object(llm_manager, "_timed_completion", side_effect=timed):
+            content = llm_manager.generate_response("sys", "Describe virtue " * 500, context_type="keyword_extraction",
+                                                    llm_model="gpt-4o", max_tokens=16000, use_response_cache=False)
+
+        assert content == "ok"
+        assert attempts["gpt-4o"] == 16000
+        assert attempts["llama3"] < 8192 - 1000
+
+    def test_explicit_provider_is_not_routed(self, servers, llm_manager):
+        """llm_provider를 지정하면 라우터를 거치지 않음"""
+        slow, fast = servers
+        _prime(llm_manager.provider_router, "openai", 30.0)
+
+        content = llm_manager.generate_response("sys", "Describe duty", context_type="keyword_extraction",
+                                                llm_provider="ollama", llm_model="llama3",
+                                                use_response_cache=False)
+
+        assert content
+        assert fast.request_count() == 1
+        assert slow.request_count() == 0
+
+    def test_emotion_precompute_spills_on_turn_deadline(self, servers, llm_manager):
+        """턴 마감에서 넘겨받은 남은 예산보다 OpenAI 지연이 길면 감정 추론은 로컬 모델로 spill"""
+        slow, fast = servers
+        _prime(llm_manager.provider_router, "openai", 5.0)
+        _prime(llm_manager.provider_router, "ollama", 0.01)
+        manager = DebateEmotionManager(llm_manager)
+        messages = [{"speaker_id": "nietzsche", "text": "There is a flaw here, but I agree with part of it."}]
+        deadline = TurnDeadline(budget_seconds=12.0, generation_reserve=8.0)
+
+        try:
+            manager.infer_emotion(
+                speaker_id="kant", speaker_role="pro", opponent_messages=messages,
+                debate_topic="AI regulation", debate_stage="interactive_argument",
+                turn_deadline=deadline
+            )
+            waited_until = time.monotonic() + 5
+            while manager.get_memo_stats()["memo_size"] == 0 and time.monotonic() < waited_until:
+                time.sleep(0.02)
+        finally:
+            manager.shutdown()
+
+        assert manager.get_memo_stats()["precompute_scheduled"] == 1
+        assert llm_manager.get_router_stats()["decisions"]["spill_deadline"] == 1
+        assert fast.get_stats()["by_endpoint"].get("ollama_chat") == 1
+        assert slow.request_count() == 0
@@ -0,0 +1,138 @@
+"""
+Unit tests for the LLM response cache.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.models.llm.llm_manager import LLMManager
+from src.models.llm.response_cache import LLMResponseCache, make_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLLMResponseCache:
+    """LLMResponseCache 테스트 클래스"""
+
+    def test_hit_miss_and_ttl(self):
+        """저장 후 적중, TTL이 지나면 다시 계산"""
+        clock = FakeClock()
+        cache = LLMResponseCache(ttl_seconds=10, clock=clock)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return f"answer-{len(calls)}"
+
+        assert cache.get_or_compute("k", compute) == ("answer-1", "miss")
+        assert cache.get_or_compute("k", compute) == ("answer-1", "hit")
+
+        clock.now = 11
+        assert cache.get_or_compute("k", compute) == ("answer-2", "miss")
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["expirations"] == 1
+
+    def test_lru_bound_and_empty_results_not_cached(self):
+        """크기 제한 초과 시 LRU 제거, 빈 응답은 저장하지 않음"""
+        cache = LLMResponseCache(max_entries=2)
+        cache.get_or_compute("a", lambda: "A")
+        cache.get_or_compute("b", lambda: "B")
+        cache.get_or_compute("a", lambda: "A2")  # a를 최근 사용으로 갱신
+        cache.get_or_compute("c", lambda: "C")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get_stats()["evictions"] == 1
+
+        cache.get_or_compute("empty", lambda: "")
+        assert cache.get("empty") is None
+
+    def test_single_flight_coalesces_concurrent_requests(self):
+        """동시에 들어온 같은 요청은 한 번만 계산"""
+        cache = LLMResponseCache()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "shared"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(cache.get_or_compute, "same", compute)
+            started.wait(5)
+            followers = [executor.submit(cache.get_or_compute, "same", compute) for _ in range(3)]
+            while cache.get_stats()["coalesced"] < 3:
+                time.sleep(0.001)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert len(calls) == 1
+        assert results[0] == ("shared", "miss")
+        assert all(result == ("shared", "coalesced") for result in results[1:])
+
+    def test_error_propagates_to_waiters_and_is_not_cached(self):
+        """리더의 예외는 대기자에게도 전달되고 캐시되지 않음"""
+        cache = LLMResponseCache()
+
+        def failing():
+            raise RuntimeError("api down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("k", failing)
+
+        assert cache.get_or_compute("k", lambda: "ok") == ("ok", "miss")
+        assert cache.get_stats()["errors"] == 1
+
+    def test_cache_key_depends_on_parameters(self):
+        """모델/파라미터/프롬프트가 다르면 다른 키"""
+        base = make_cache_key("openai", "gpt-4o", "sys", "user", 500, 0.1)
+
+        assert base == make_cache_key("openai", "gpt-4o", "sys", "user", 500, 0.1)
+        assert base != make_cache_key("openai", "gpt-4o", "sys", "user", 500, 0.7)
+        assert base != make_cache_key("openai", "gpt-4o-mini", "sys", "user", 500, 0.1)
+        assert base != make_cache_key("openai", "gpt-4o", "sys", "user2", 500, 0.1)
+
+
+class TestLLMManagerResponseCache:
+    """LLMManager 응답 캐시 opt-in 테스트 클래스"""
+
+    @pytest.fixture
+    def llm_manager(self):
+        with patch.object(LLMManager, "_setup_clients"):
+            manager = LLMManager({"provider": "openai"})
+        manager.response_cache = LLMResponseCache()
+        return manager
+
+    def test_only_cacheable_contexts_are_cached(self, llm_manager):
+        """cacheable_contexts에 있는 context_type만 캐시"""
+        with patch.object(llm_manager, "_request_completion", return_value="analysis") as request:
+            for _ in range(3):
+                llm_manager.generate_response("sys", "user", context_type="argument_analysis")
+            assert request.call_count == 1
+
+            for _ in range(2):
+                llm_manager.generate_response("sys", "user", context_type="interactive_response")
+            assert request.call_count == 3
+
+            llm_manager.generate_response("sys", "user", context_type="interactive_response",
+                                          use_response_cache=True)
+            llm_manager.generate_response("sys", "user", context_type="interactive_response",
+                                          use_response_cache=True)
+            assert request.call_count == 4
+
+        assert llm_manager.get_response_cache_stats()["hits"] == 3
@@ -0,0 +1,3 @@
+"""
+Unit tests for new high-performance debate modules.
+"""
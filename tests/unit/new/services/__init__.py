@@ -0,0 +1,3 @@
+"""
+Unit tests for new debate service modules.
+"""
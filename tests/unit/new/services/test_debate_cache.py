@@ -0,0 +1,187 @@
+"""
+Unit tests for the async debate package cache and cache warmer.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.benchmark.fake_redis import InMemoryRedis
+from src.new.models.debate_models import DebatePackage, FastDebateRequest, StanceStatements
+from src.new.services.debate_cache import AsyncDebateCache, CacheWarmer
+from src.new.services.fast_opening_service import FastDebateOpeningService
+
+
+def _package(title, version="v2_fast"):
+    return DebatePackage(
+        stance_statements=StanceStatements(pro=f"pro {title}", con=f"con {title}"),
+        opening_message=f"Welcome to {title}",
+        system_version=version
+    )
+
+
+class FakeOpenAIService:
+    """지연/실패를 흉내 내는 토론 패키지 생성기"""
+
+    def __init__(self, delay=0.0, failures=None, fallbacks=None):
+        self.use_fine_tuned = False
+        self.delay = delay
+        self.failures = dict(failures or {})
+        self.fallbacks = dict(fallbacks or {})
+        self.calls = []
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def generate_complete_debate_package(self, request):
+        self.calls.append(request.title)
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures.get(request.title):
+                self.failures[request.title] -= 1
+                raise RuntimeError("rate limited")
+            if self.fallbacks.get(request.title):
+                self.fallbacks[request.title] -= 1
+                return _package(request.title, version="v2_fast_fallback")
+            return _package(request.title)
+        finally:
+            self.inflight -= 1
+
+
+def _combo(i):
+    return {"title": f"Topic {i}", "pro_npcs": ["kant"], "con_npcs": ["nietzsche"]}
+
+
+async def _drain(service):
+    """백그라운드 캐시 저장 완료 대기"""
+    await asyncio.gather(*list(service._background_tasks))
+
+
+class TestFastOpeningCacheWarming:
+    """FastDebateOpeningService 캐시 워밍 테스트 클래스"""
+
+    @pytest.fixture
+    def redis(self):
+        return InMemoryRedis()
+
+    def test_warming_is_concurrent_and_bounded(self, redis):
+        """생성은 동시성 상한까지 병렬로 진행되고 저장은 파이프라인으로 묶임"""
+        generator = FakeOpenAIService(delay=0.05)
+        service = FastDebateOpeningService(redis_client=redis, openai_service=generator, warm_concurrency=8)
+
+        started = time.perf_counter()
+        report = asyncio.run(service.warm_popular_cache([_combo(i) for i in range(40)]))
+        elapsed = time.perf_counter() - started
+
+        assert report["generated"] == 40
+        assert generator.max_inflight == 8
+        assert elapsed < 1.0  # 직렬이면 2초
+        # MGET 1회 + ZSCORE 파이프라인 1회 + SETEX 파이프라인 2회(20개씩)
+        assert redis.stats["round_trips"] == 4
+
+    def test_cached_combinations_are_skipped(self, redis):
+        """이미 캐시된 조합은 MGET으로 걸러내고 다시 생성하지 않음"""
+        generator = FakeOpenAIService()
+        service = FastDebateOpeningService(redis_client=redis, openai_service=generator)
+        asyncio.run(service.warm_popular_cache([_combo(0), _combo(1)]))
+
+        report = asyncio.run(service.warm_popular_cache([_combo(0), _combo(1), _combo(2)]))
+
+        assert report["already_cached"] == 2
+        assert generator.calls == ["Topic 0", "Topic 1", "Topic 2"]
+
+    def test_observed_frequency_sets_priority(self, redis):
+        """관측된 요청 빈도가 높은 조합부터 워밍하고, 목록이 없으면 상위 조합을 사용"""
+        generator = FakeOpenAIService()
+        service = FastDebateOpeningService(redis_client=redis, openai_service=generator, warm_concurrency=1)
+
+        async def scenario():
+            for i, hits in ((1, 1), (2, 3), (3, 2)):
+                for _ in range(hits):
+                    await service.create_fast_debate_room(room_id=f"r{i}", **_combo(i))
+            await _drain(service)
+            await redis.delete(*[key for key in list(redis._strings)])
+            generator.calls.clear()
+            return await service.warm_popular_cache()
+
+        report = asyncio.run(scenario())
+
+        assert report["generated"] == 3
+        assert generator.calls == ["Topic 2", "Topic 3", "Topic 1"]
+
+    def test_fallback_packages_are_not_cached(self, redis):
+        """API 실패로 만든 폴백 패키지는 요청 경로에서도 캐시하지 않음"""
+        generator = FakeOpenAIService(fallbacks={"Topic 0": 1})
+        service = FastDebateOpeningService(redis_client=redis, openai_service=generator)
+
+        async def scenario():
+            first = await service.create_fast_debate_room(room_id="r", **_combo(0))
+            await _drain(service)
+            second = await service.create_fast_debate_room(room_id="r", **_combo(0))
+            await _drain(service)
+            third = await service.create_fast_debate_room(room_id="r", **_combo(0))
+            return first, second, third
+
+        first, second, third = asyncio.run(scenario())
+
+        assert first.cache_hit is False and second.cache_hit is False
+        assert third.cache_hit is True
+
+    def test_tracked_combinations_are_capped(self, redis):
+        """추적 조합이 상한을 넘으면 빈도가 낮은 조합을 빈도/조합 키에서 함께 정리"""
+        cache = AsyncDebateCache(redis, max_tracked=10)
+
+        async def scenario():
+            for _ in range(3):
+                await cache.get_and_record("hot", {"title": "hot"})
+            for i in range(30):
+                await cache.get_and_record(f"cold:{i}", {"title": f"cold {i}"})
+
+        asyncio.run(scenario())
+
+        frequency = redis._zsets["debate_package_stats:frequency"]
+        combinations = redis._hashes["debate_package_stats:combinations"]
+        assert len(frequency) <= 11
+        assert set(frequency) == set(combinations)
+        assert "hot" in frequency
+        assert cache.stats["trimmed"] == 31 - len(frequency)
+
+
+
+class TestCacheWarmer:
+    """CacheWarmer 재시도/백오프 테스트 클래스"""
+
+    def test_retries_errors_and_fallbacks_with_backoff(self):
+        """예외와 폴백 결과는 백오프 후 재시도하고, 재시도 한도를 넘으면 실패로 보고"""
+        redis = InMemoryRedis()
+        generator = FakeOpenAIService(failures={"Topic 0": 1, "Topic 1": 9}, fallbacks={"Topic 0": 1})
+        delays = []
+
+        async def record_sleep(seconds):
+            delays.append(seconds)
+
+        service = FastDebateOpeningService(redis_client=redis, openai_service=generator)
+        warmer = CacheWarmer(
+            cache=AsyncDebateCache(redis),
+            generate=generator.generate_complete_debate_package,
+            key_for=service._generate_cache_key,
+            serialize=lambda package: package.json(),
+            is_valid=service._is_cacheable,
+            max_retries=3,
+            base_backoff_seconds=1.0,
+            sleep=record_sleep
+        )
+        requests = [_request(i) for i in range(3)]
+
+        report = asyncio.run(warmer.warm(requests))
+
+        assert report["generated"] == 2
+        assert report["failed"] == 1
+        assert report["retries"] == 2 + 3
+        assert max(delays) <= 4.0 and min(delays) >= 0.5
+
+
+def _request(i):
+    return FastDebateRequest(room_id=f"warm_{i}", **_combo(i))
@@ -0,0 +1,197 @@
+"""
+Unit tests for resumable debate data pregeneration.
+"""
+
+import json
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.new.models.debate_models import DebatePackage, StanceStatements
+from src.new.pregenerate_base_data import DebateDataPregenrator
+from src.new.services.openai_service import OpenAIDebateService
+
+
+class Crash(BaseException):
+    """프로세스 강제 종료 흉내"""
+
+
+def _catalog(titles_by_category):
+    return {"categories": {
+        category: {"topics": [
+            {"title": title, "context": {"type": "", "content": ""},
+             "pro_philosophers": ["kant"], "con_philosophers": ["nietzsche"], "moderator_style": "0"}
+            for title in titles
+        ]}
+        for category, titles in titles_by_category.items()
+    }}
+
+
+def _package(title, version="v2_fast"):
+    return DebatePackage(
+        stance_statements=StanceStatements(pro=f"pro {title}", con=f"con {title}"),
+        opening_message=f"Welcome to {title}",
+        system_version=version
+    )
+
+
+def _completion(title):
+    arguments = {
+        "stance_statements": {"pro": f"pro {title}", "con": f"con {title}"},
+        "opening_message": f"Welcome to {title}"
+    }
+    return {
+        "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "gpt-4o",
+        "choices": [{
+            "index": 0, "finish_reason": "tool_calls",
+            "message": {"role": "assistant", "content": None, "tool_calls": [{
+                "id": "call_1", "type": "function",
+                "function": {"name": "create_complete_debate_package", "arguments": json.dumps(arguments)}
+            }]}
+        }]
+    }
+
+
+class FakeBatchClient:
+    """OpenAI files/batches API 흉내"""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.submitted = []
+        self.input_lines = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve)
+
+    async def _create_file(self, file, purpose):
+        self.input_lines = [json.loads(line) for line in file[1].decode().splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    async def _create_batch(self, input_file_id, endpoint, completion_window):
+        self.submitted.append(input_file_id)
+        return SimpleNamespace(id="batch-1")
+
+    async def _retrieve(self, batch_id):
+        status = self.statuses.pop(0)
+        if status == "crash":
+            raise Crash()
+        return SimpleNamespace(id=batch_id, status=status,
+                               output_file_id="file-out" if status == "completed" else None)
+
+    async def _content(self, file_id):
+        lines = [
+            json.dumps({"custom_id": item["custom_id"],
+                        "response": {"status_code": 200, "body": _completion(item["body"]["messages"][1]["content"][:20])}})
+            for item in self.input_lines
+        ]
+        return SimpleNamespace(text="\n".join(lines))
+
+
+class TestResumablePregeneration:
+    """체크포인트 기반 사전 생성 테스트 클래스"""
+
+    @pytest.fixture
+    def topics_file(self, tmp_path):
+        path = tmp_path / "debate_topics.json"
+        path.write_text(json.dumps(_catalog({"ethics": ["A", "B", "C", "D"]})), encoding="utf-8")
+        return path
+
+    @pytest.fixture
+    def service(self):
+        service = OpenAIDebateService(api_key="test-key")
+        service.calls = []
+        service.fallback_on = set()
+        service.hang_on = set()
+
+        async def generate(request):
+            service.calls.append(request.title)
+            if request.title in service.hang_on:
+                await asyncio.Event().wait()
+            if request.title in service.fallback_on:
+                return _package(request.title, version="v2_fast_fallback")
+            return _package(request.title)
+
+        service.generate_complete_debate_package = generate
+        return service
+
+    def _generator(self, tmp_path, topics_file, service):
+        return DebateDataPregenrator(
+            output_file=str(tmp_path / "pregenerated_debates.json"),
+            openai_service=service,
+            topics_file=str(topics_file),
+            concurrency=1
+        )
+
+    def test_crash_resumes_from_checkpoint(self, tmp_path, topics_file, service):
+        """중간에 죽어도 끝난 주제는 체크포인트에 남고, 다음 실행은 나머지만 생성"""
+        generator = self._generator(tmp_path, topics_file, service)
+        service.hang_on = {"C"}
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(generator.generate_all_topics(), timeout=0.5))
+        assert sorted(generator.store.load()) == sorted(
+            generator.generate_topic_id("ethics", title) for title in ("A", "B"))
+
+        # 잘린 마지막 줄도 무시하고 진행
+        with open(generator.checkpoint_file, "a", encoding="utf-8") as f:
+            f.write('{"topic_id": "trunc')
+
+        service.hang_on = set()
+        service.calls.clear()
+        data = asyncio.run(generator.generate_all_topics())
+
+        assert service.calls == ["C", "D"]
+        assert data["metadata"]["resumed"] == 2
+        assert data["metadata"]["successful"] == 4
+        assert {topic["title"] for topic in data["topics"].values()} == {"A", "B", "C", "D"}
+
+    def test_fallback_and_changed_topics_are_regenerated(self, tmp_path, topics_file, service):
+        """폴백 결과는 실패로 기록되어 재시도되고, 입력이 바뀐 주제만 다시 생성"""
+        generator = self._generator(tmp_path, topics_file, service)
+        service.fallback_on = {"B"}
+        data = asyncio.run(generator.generate_all_topics())
+        assert data["metadata"]["failed"] == 1
+        assert [record["title"] for record in data["failed_topics"]] == ["B"]
+
+        catalog = _catalog({"ethics": ["A", "B", "C", "D"]})
+        catalog["categories"]["ethics"]["topics"][0]["pro_philosophers"] = ["hegel"]
+        topics_file.write_text(json.dumps(catalog), encoding="utf-8")
+
+        service.fallback_on = set()
+        service.calls.clear()
+        data = asyncio.run(generator.generate_all_topics())
+
+        assert sorted(service.calls) == ["A", "B"]
+        assert data["metadata"]["failed"] == 0
+
+    def test_compaction_drops_removed_topics_and_writes_lookup_file(self, tmp_path, topics_file, service):
+        """카탈로그에서 빠진 주제는 압축 결과에서 제외되고 런타임 조회 형식으로 저장"""
+        generator = self._generator(tmp_path, topics_file, service)
+        asyncio.run(generator.generate_all_topics())
+
+        topics_file.write_text(json.dumps(_catalog({"ethics": ["A", "B"]})), encoding="utf-8")
+        asyncio.run(generator.run(compact_only=True))
+
+        with open(generator.output_file, encoding="utf-8") as f:
+            saved = json.load(f)
+        assert {topic["title"] for topic in saved["topics"].values()} == {"A", "B"}
+        topic = next(iter(saved["topics"].values()))
+        assert topic["original_data"]["context"] == {"type": "", "content": ""}
+        assert topic["generated_data"]["stance_statements"]["pro"].startswith("pro ")
+
+    def test_batch_mode_does_not_resubmit_after_restart(self, tmp_path, topics_file, service):
+        """Batch API 모드는 배치 ID를 기록해 재시작 후 같은 배치를 계속 기다림"""
+        generator = self._generator(tmp_path, topics_file, service)
+        client = FakeBatchClient(["in_progress", "crash"])
+        service.client = client
+        with pytest.raises(Crash):
+            asyncio.run(generator.generate_with_batch_api(poll_interval=0))
+        assert generator.store.load_batch_state()["batch_id"] == "batch-1"
+        assert client.input_lines[0]["body"]["model"] == service.base_model
+
+        client.statuses = ["completed"]
+        data = asyncio.run(generator.generate_with_batch_api(poll_interval=0))
+
+        assert client.submitted == ["file-in"]
+        assert data["metadata"]["successful"] == 4
+        assert generator.store.load_batch_state() is None
+        assert service.calls == []
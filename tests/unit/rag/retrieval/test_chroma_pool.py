@@ -0,0 +1,84 @@
+"""
+Unit tests for the Chroma handle pool.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.rag.retrieval.chroma_pool import ChromaHandlePool
+
+
+class TestChromaHandlePool:
+    """ChromaHandlePool 테스트 클래스"""
+
+    @pytest.fixture
+    def clients(self):
+        return {}
+
+    @pytest.fixture
+    def pool(self, clients):
+        def factory(path):
+            client = MagicMock(name=f"client:{path}")
+            client.get_collection.side_effect = lambda name, **kwargs: MagicMock(name=f"collection:{name}")
+            clients[path] = client
+            return client
+        return ChromaHandlePool(client_factory=factory)
+
+    def test_client_opened_once_per_path(self, pool, clients, tmp_path):
+        """같은 경로(상대/절대 무관)는 클라이언트를 한 번만 염"""
+        db_path = tmp_path / "vectordb"
+
+        first = pool.get_client(str(db_path))
+        second = pool.get_client(str(tmp_path / "." / "vectordb"))
+
+        assert first is second
+        assert len(clients) == 1
+        assert pool.get_stats()["open_clients"] == 1
+
+    def test_collection_handles_are_cached(self, pool, clients, tmp_path):
+        """컬렉션 핸들은 (경로, 이름, 임베딩 키)별로 한 번만 열림"""
+        embedding = object()
+
+        first = pool.get_collection(str(tmp_path), "langchain", embedding, "ef-a")
+        second = pool.get_collection(str(tmp_path), "langchain", embedding, "ef-a")
+        other_embedding = pool.get_collection(str(tmp_path), "langchain", embedding, "ef-b")
+
+        assert first is second
+        assert other_embedding is not first
+        client = clients[str(tmp_path)]
+        assert client.get_collection.call_count == 2
+        stats = pool.get_stats()
+        assert stats["collection_hits"] == 1
+        assert stats["collection_misses"] == 2
+
+    def test_invalidate_reopens_collection(self, pool, clients, tmp_path):
+        """삭제/재생성 후 invalidate하면 새 핸들을 염"""
+        first = pool.get_collection(str(tmp_path), "pdf_1234")
+        pool.invalidate(str(tmp_path), "pdf_1234")
+        second = pool.get_collection(str(tmp_path), "pdf_1234")
+
+        assert first is not second
+
+    def test_embedding_functions_shared(self, pool):
+        """임베딩 함수는 키별로 한 번만 생성"""
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = pool.get_embedding_function(("openai", "text-embedding-3-small"), factory)
+        second = pool.get_embedding_function(("openai", "text-embedding-3-small"), factory)
+
+        assert first is second
+        assert factory.call_count == 1
+
+    def test_warm_reports_missing_paths(self, pool, tmp_path):
+        """warm은 존재하는 경로의 컬렉션만 열고 결과를 보고"""
+        existing = tmp_path / "kant"
+        existing.mkdir()
+
+        results = pool.warm(
+            {"kant": str(existing), "hegel": str(tmp_path / "hegel")},
+            {"kant": "langchain", "hegel": "langchain"}
+        )
+
+        assert results == {"kant": "ok", "hegel": "missing_path"}
+        assert pool.get_stats()["open_collections"] == 1
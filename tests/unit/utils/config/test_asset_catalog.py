@@ -0,0 +1,125 @@
+"""
+Unit tests for AssetCatalog.
+"""
+
+import os
+import json
+import pytest
+from unittest.mock import patch
+
+from src.utils.config.asset_catalog import AssetCatalog, DebatePhilosopher, ModeratorStyle
+
+
+class TestAssetCatalog:
+    """AssetCatalog 테스트 클래스"""
+    
+    @pytest.fixture
+    def project_root(self, tmp_path):
+        """임시 프로젝트 구조"""
+        (tmp_path / "philosophers").mkdir()
+        (tmp_path / "config").mkdir()
+        (tmp_path / "src" / "agents" / "moderator").mkdir(parents=True)
+        
+        (tmp_path / "philosophers" / "debate_optimized.yaml").write_text(
+            "socrates:\n  name: Socrates\n  strategy_weights:\n    Clipping: 0.35\nbroken: 3\n",
+            encoding="utf-8"
+        )
+        (tmp_path / "philosophers" / "debate_strategies.json").write_text(
+            json.dumps({"strategy_styles": {"Clipping": {"style_prompt": "Cut it"}}}),
+            encoding="utf-8"
+        )
+        (tmp_path / "src" / "agents" / "moderator" / "moderator_style.json").write_text(
+            json.dumps({
+                "0": {"name": "Jamie", "opening": "Hello", "transition": "Next"},
+                "1": {"name": "Incomplete"}
+            }),
+            encoding="utf-8"
+        )
+        return str(tmp_path)
+    
+    @pytest.fixture
+    def catalog(self, project_root):
+        return AssetCatalog(project_root=project_root, check_interval=0)
+    
+    def test_typed_philosopher(self, catalog):
+        """철학자 데이터가 타입 객체로 검증됨"""
+        philosopher = catalog.get_debate_philosopher("socrates")
+        
+        assert isinstance(philosopher, DebatePhilosopher)
+        assert philosopher.name == "Socrates"
+        assert catalog.get_debate_philosopher("broken") is None
+        assert catalog.get_philosopher_name("unknown", "unknown") == "unknown"
+    
+    def test_snapshot_is_immutable_and_copies_are_mutable(self, catalog):
+        """스냅샷은 읽기 전용, 복사본은 수정 가능"""
+        philosopher = catalog.get_debate_philosopher("socrates")
+        
+        with pytest.raises(TypeError):
+            philosopher.data["name"] = "Plato"
+        
+        data = philosopher.to_dict()
+        data["strategy_weights"]["Clipping"] = 1.0
+        assert catalog.get_debate_philosopher("socrates").data["strategy_weights"]["Clipping"] == 0.35
+    
+    def test_parsed_once(self, catalog):
+        """mtime이 같으면 다시 파싱하지 않음"""
+        with patch("src.utils.config.asset_catalog.yaml.safe_load", wraps=__import__("yaml").safe_load) as safe_load:
+            for _ in range(5):
+                catalog.get_debate_philosopher("socrates")
+        
+        assert safe_load.call_count == 1
+    
+    def test_reload_on_mtime_change(self, catalog, project_root):
+        """파일 mtime이 바뀌면 새 스냅샷으로 교체"""
+        assert catalog.get_moderator_style("0").name == "Jamie"
+        
+        style_path = os.path.join(project_root, "src", "agents", "moderator", "moderator_style.json")
+        with open(style_path, "w", encoding="utf-8") as f:
+            json.dump({"0": {"name": "Alex", "opening": "Hi", "transition": "Then"}}, f)
+        stat = os.stat(style_path)
+        os.utime(style_path, (stat.st_atime, stat.st_mtime + 10))
+        
+        style = catalog.get_moderator_style("0")
+        assert isinstance(style, ModeratorStyle)
+        assert style.name == "Alex"
+    
+    def test_invalid_reload_keeps_previous_snapshot(self, catalog, project_root):
+        """잘못된 파일로 바뀌면 이전 스냅샷 유지"""
+        assert "Clipping" in catalog.get_strategy_styles()
+        
+        json_path = os.path.join(project_root, "philosophers", "debate_strategies.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        stat = os.stat(json_path)
+        os.utime(json_path, (stat.st_atime, stat.st_mtime + 10))
+        
+        assert "Clipping" in catalog.get_strategy_styles()
+    
+    def test_invalid_moderator_style_skipped(self, catalog):
+        """필수 필드가 없는 모더레이터 스타일은 제외"""
+        assert catalog.get_moderator_style("1") is None
+    
+    def test_defense_map_snapshot(self, catalog, project_root):
+        """defense_map은 한 번 파싱한 읽기 전용 스냅샷으로 조회"""
+        with open(os.path.join(project_root, "philosophers", "defense_map.yaml"), "w", encoding="utf-8") as f:
+            f.write("Clipping:\n  RAG_NO:\n    neutral: [Clarify, Accept]\n")
+        
+        defense_map = catalog.get_defense_map()
+        
+        assert defense_map["Clipping"]["RAG_NO"]["neutral"] == ("Clarify", "Accept")
+        assert catalog.get_defense_map() is defense_map
+    
+    def test_missing_file_returns_empty(self, catalog):
+        """파일이 없으면 빈 값"""
+        assert catalog.get_strategy_rag_weights() == {}
+        assert len(catalog.get_philosopher_profiles()) == 0
+    
+    def test_check_interval_skips_stat(self, project_root):
+        """check_interval 동안은 mtime을 확인하지 않음"""
+        catalog = AssetCatalog(project_root=project_root, check_interval=60)
+        catalog.get_debate_philosophers()
+        
+        with patch("src.utils.config.asset_catalog.os.path.getmtime") as getmtime:
+            catalog.get_debate_philosophers()
+        
+        getmtime.assert_not_called()
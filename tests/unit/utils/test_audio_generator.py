@@ -0,0 +1,90 @@
+"""
+Unit tests for the dialogue audio rendering pipeline.
+"""
+
+import os
+import time
+import wave
+
+import pytest
+
+from src.utils.audio_generator import AudioGenerator, OfflineTTSBackend
+
+
+def _exchanges(count):
+    speakers = ["Socrates", "Nietzsche"]
+    return [{"speaker": speakers[i % 2], "content": f"Statement number {i} about virtue."} for i in range(count)]
+
+
+def _duration_ms(path):
+    with wave.open(path, "rb") as wav_file:
+        return 1000.0 * wav_file.getnframes() / wav_file.getframerate()
+
+
+class TestAudioGenerator:
+    """AudioGenerator 테스트 클래스"""
+
+    @pytest.fixture
+    def backend(self):
+        return OfflineTTSBackend(ms_per_char=5.0)
+
+    @pytest.fixture
+    def generator(self, tmp_path, backend):
+        return AudioGenerator(output_dir=str(tmp_path / "audio"), tts_backend=backend, max_workers=8)
+
+    def test_combined_audio_contains_all_segments(self, generator):
+        """개별 파일과 안내/쉼을 포함한 전체 파일을 한 번에 생성"""
+        exchanges = _exchanges(3)
+        result = generator.generate_dialogue_audio(exchanges, "AI ethics")
+
+        assert len(result["audio_files"]) == 3
+        assert all(os.path.exists(f["audio_path"]) for f in result["audio_files"])
+
+        speech = sum(_duration_ms(f["audio_path"]) for f in result["audio_files"])
+        announcements = sum(len(f"{e['speaker']} says:") * 5.0 for e in exchanges)
+        pauses = 2 * 1000 + 3 * 500
+        assert _duration_ms(result["combined_audio_path"]) == pytest.approx(speech + announcements + pauses, abs=5)
+
+    def test_cache_is_shared_across_dialogues(self, generator, backend):
+        """같은 (텍스트, 음성)은 다른 대화에서도 다시 합성하지 않음"""
+        generator.generate_dialogue_audio(_exchanges(4), "first")
+        calls_after_first = backend.calls
+
+        # 4개 발언 + 화자 2명의 안내
+        assert calls_after_first == 6
+
+        second = generator.generate_dialogue_audio(_exchanges(4), "second")
+
+        assert backend.calls == calls_after_first
+        assert generator.stats["cache_hits"] == 6
+        assert len(second["audio_files"]) == 4
+
+    def test_synthesis_runs_concurrently(self, tmp_path):
+        """발언 합성은 병렬로 실행되어 전체 시간이 가장 긴 합성 시간 수준"""
+        backend = OfflineTTSBackend(ms_per_char=1.0, latency_seconds=0.2)
+        generator = AudioGenerator(output_dir=str(tmp_path / "audio"), tts_backend=backend, max_workers=32)
+
+        start = time.monotonic()
+        result = generator.generate_dialogue_audio(_exchanges(30), "long debate")
+        elapsed = time.monotonic() - start
+
+        assert len(result["audio_files"]) == 30
+        assert backend.calls == 32
+        assert elapsed < 2.0
+
+    def test_failed_synthesis_skips_exchange(self, generator, backend):
+        """합성 실패한 발언만 빠지고 나머지는 정상 생성"""
+        original = backend.synthesize
+
+        def flaky(text, voice_profile):
+            if "number 1 " in text:
+                raise RuntimeError("tts unavailable")
+            return original(text, voice_profile)
+
+        backend.synthesize = flaky
+        result = generator.generate_dialogue_audio(_exchanges(3), "flaky")
+
+        assert [f["content"] for f in result["audio_files"]] == [
+            "Statement number 0 about virtue.", "Statement number 2 about virtue."]
+        assert result["combined_audio_path"] is not None
+        assert generator.stats["errors"] == 1
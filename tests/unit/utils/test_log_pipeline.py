@@ -0,0 +1,200 @@
+"""
+Unit tests for the queue-backed structured logging pipeline.
+"""
+
+import io
+import json
+import logging
+import queue
+import sys
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.utils import log_pipeline
+from src.utils.log_pipeline import (
+    LoggingPipeline, NonBlockingQueueHandler, RateLimitFilter,
+    configure_logging, get_logging_pipeline, log_context, shutdown_logging
+)
+
+
+def _record(name="test.logger", level=logging.INFO, lineno=10, room_id="room-1"):
+    record = logging.LogRecord(name, level, __file__, lineno, "message %s", ("x",), None)
+    record.room_id = room_id
+    return record
+
+
+class _CountingArg:
+    """str() 호출 횟수를 세는 로그 인자"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "formatted"
+
+
+class TestLoggingPipeline:
+    """LoggingPipeline 테스트 클래스"""
+
+    @pytest.fixture
+    def stream(self):
+        return io.StringIO()
+
+    @pytest.fixture
+    def pipeline_logger(self, stream):
+        pipeline = LoggingPipeline(level=logging.DEBUG, fmt="json", stream=stream, rate_per_second=0)
+        log = logging.getLogger("tests.log_pipeline")
+        log.propagate = False
+        log.setLevel(logging.DEBUG)
+        log.addHandler(pipeline.handler)
+        pipeline.start()
+        yield pipeline, log
+        pipeline.stop()
+        log.removeHandler(pipeline.handler)
+
+    def _entries(self, pipeline, stream):
+        pipeline.stop()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    def test_json_records_carry_log_context(self, pipeline_logger, stream):
+        """log_context()의 room_id/turn_id/필드가 JSON 레코드에 포함되고 블록 밖에서는 해제됨"""
+        pipeline, log = pipeline_logger
+        with log_context(room_id="room-1"):
+            with log_context(turn_id=3, speaker="kant"):
+                log.info("turn %s done", 3)
+        log.info("outside")
+
+        inside, outside = self._entries(pipeline, stream)
+        assert inside["msg"] == "turn 3 done"
+        assert inside["room_id"] == "room-1" and inside["turn_id"] == 3
+        assert inside["fields"] == {"speaker": "kant"}
+        assert outside["room_id"] is None and "fields" not in outside
+
+    def test_falls_back_to_current_span(self, pipeline_logger, stream):
+        """로그 컨텍스트가 없으면 현재 트레이싱 span의 room_id/turn_id 사용"""
+        pipeline, log = pipeline_logger
+        with patch.object(log_pipeline, "current_span", return_value=Mock(room_id="span-room", turn_id="span-turn")):
+            log.warning("from span")
+
+        entry = self._entries(pipeline, stream)[0]
+        assert entry["room_id"] == "span-room" and entry["turn_id"] == "span-turn"
+        assert entry["level"] == "WARNING"
+
+    def test_args_formatted_once_after_filtering(self, stream):
+        """레벨에서 걸러진 레코드는 포맷하지 않고, 통과한 레코드는 enqueue 시점 값으로 한 번만 포맷"""
+        pipeline = LoggingPipeline(level=logging.INFO, fmt="json", stream=stream, rate_per_second=0)
+        log = logging.getLogger("tests.log_pipeline.lazy")
+        log.propagate = False
+        log.setLevel(logging.INFO)
+        log.addHandler(pipeline.handler)
+        filtered, queued = _CountingArg(), _CountingArg()
+        state = {"turn": 1}
+        try:
+            log.debug("debug %s", filtered)
+            log.info("info %s", queued)
+            log.info("state %s", state)
+            state["turn"] = 2  # 리스너가 나중에 포맷해도 바뀐 값이 보이지 않아야 함
+            assert filtered.calls == 0 and queued.calls == 1
+
+            pipeline.start()
+            entries = self._entries(pipeline, stream)
+        finally:
+            log.removeHandler(pipeline.handler)
+
+        assert [entry["msg"] for entry in entries] == ["info formatted", "state {'turn': 1}"]
+        assert filtered.calls == 0 and queued.calls == 1
+
+    def test_exception_rendered_before_enqueue(self):
+        """예외는 텍스트로 바꾸고 traceback(프레임)은 큐에 넣지 않음"""
+        handler = NonBlockingQueueHandler(queue.Queue())
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("test.logger", logging.ERROR, __file__, 1, "failed %s", ("x",),
+                                       sys.exc_info())
+        handler.handle(record)
+
+        queued = handler.queue.get_nowait()
+        assert queued.msg == "failed x" and queued.args is None
+        assert queued.exc_info is None and "ValueError: boom" in queued.exc_text
+        assert record.exc_info is not None  # 원본 레코드는 그대로
+
+    def test_full_queue_drops_without_blocking(self):
+        """큐가 가득 차면 호출부를 막지 않고 레코드를 버린 뒤 개수를 기록"""
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+
+        for _ in range(5):
+            handler.handle(_record())
+
+        assert handler.queue.qsize() == 2
+        assert handler.enqueued == 2 and handler.dropped == 3
+
+
+class TestRateLimitFilter:
+    """RateLimitFilter 테스트 클래스"""
+
+    def test_token_bucket_per_room_and_call_site(self):
+        """같은 방/호출 지점은 버킷 크기만큼만 통과, 다른 방과 WARNING 이상은 영향 없음"""
+        rate_filter = RateLimitFilter(rate_per_second=1.0, burst=2)
+
+        with patch.object(log_pipeline.time, "monotonic", return_value=100.0):
+            results = [rate_filter.filter(_record()) for _ in range(4)]
+            other_room = rate_filter.filter(_record(room_id="room-2"))
+            warning = rate_filter.filter(_record(level=logging.WARNING))
+
+        assert results == [True, True, False, False]
+        assert other_room is True and warning is True
+        assert rate_filter.suppressed_total == 2
+
+    def test_suppressed_count_attached_after_refill(self):
+        """토큰이 다시 채워지면 다음 레코드에 억제된 개수를 기록"""
+        rate_filter = RateLimitFilter(rate_per_second=1.0, burst=1)
+
+        with patch.object(log_pipeline.time, "monotonic", return_value=100.0):
+            rate_filter.filter(_record())
+            rate_filter.filter(_record())
+            rate_filter.filter(_record())
+        with patch.object(log_pipeline.time, "monotonic", return_value=101.5):
+            record = _record()
+            assert rate_filter.filter(record) is True
+
+        assert record.suppressed == 2
+
+    def test_sampling_by_logger_prefix(self):
+        """가장 긴 접두사의 샘플링 비율을 적용 (0.25 → 4개 중 1개)"""
+        rate_filter = RateLimitFilter(rate_per_second=0, sample_rates={"src": 1.0, "src.agents": 0.25})
+
+        sampled = [rate_filter.filter(_record(name="src.agents.participant")) for _ in range(8)]
+        unsampled = [rate_filter.filter(_record(name="src.dialogue")) for _ in range(3)]
+
+        assert sampled == [True, False, False, False, True, False, False, False]
+        assert all(unsampled)
+
+
+class TestConfigureLogging:
+    """configure_logging 테스트 클래스"""
+
+    @pytest.fixture(autouse=True)
+    def restore_root(self):
+        root = logging.getLogger()
+        level = root.level
+        yield
+        shutdown_logging()
+        root.setLevel(level)
+
+    def test_installs_once_and_reads_environment(self, monkeypatch):
+        """환경 변수로 설정하고, 다시 호출하면 루트의 기존 파이프라인을 교체"""
+        monkeypatch.setenv("SAPIENS_LOG_LEVEL", "warning")
+        monkeypatch.setenv("SAPIENS_LOG_SAMPLE", "src.agents=0.1,invalid")
+        root = logging.getLogger()
+
+        first = configure_logging(stream=io.StringIO())
+        second = configure_logging(stream=io.StringIO(), fmt="text")
+
+        assert root.level == logging.WARNING
+        assert first.handler not in root.handlers and second.handler in root.handlers
+        assert get_logging_pipeline() is second
+        assert second.rate_filter.sample_rates == {"src.agents": 0.1}
+        assert second.get_stats()["format"] == "text"
@@ -0,0 +1,101 @@
+"""
+Unit tests for page-parallel PDF extraction and text normalization.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.utils import pdf_processor
+from src.utils.pdf_processor import PDFProcessor, normalize_text
+
+
+def _page_text(number):
+    return f"Journal of Ethics Header\n\nPage body number {number} discusses moral status at length.\n\n"
+
+
+def _fake_extract(pdf_path, method, start, end):
+    return [_page_text(number) for number in range(start, end)]
+
+
+class TestPDFProcessor:
+    """PDFProcessor 테스트 클래스"""
+
+    @pytest.fixture
+    def pdf_path(self, tmp_path):
+        path = tmp_path / "book.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        return str(path)
+
+    @pytest.fixture
+    def processor(self):
+        processor = PDFProcessor(max_workers=1, pages_per_task=4)
+        with patch.object(PDFProcessor, "_resolve_method", return_value=("pymupdf", 10)), \
+                patch.object(pdf_processor, "_extract_page_range", side_effect=_fake_extract) as extract:
+            processor.extract_mock = extract
+            yield processor
+
+    def test_iter_pages_preserves_page_order(self, processor, pdf_path):
+        """페이지 범위 작업으로 나눠도 페이지 순서대로 반환"""
+        pages = list(processor.iter_pages(pdf_path))
+
+        assert pages == [_page_text(number) for number in range(10)]
+        assert [call.args[2:] for call in processor.extract_mock.call_args_list] == [(0, 4), (4, 8), (8, 10)]
+
+    def test_extract_text_matches_sequential_concatenation(self, processor, pdf_path):
+        """추출 결과는 페이지 텍스트를 이어 붙인 것과 같음"""
+        assert processor._extract_text_basic(pdf_path) == "".join(_page_text(number) for number in range(10))
+
+    def test_streaming_yields_normalized_groups(self, processor, pdf_path):
+        """전처리된 텍스트를 페이지 묶음 단위로 순서대로 반환"""
+        groups = list(processor.iter_processed_text(pdf_path))
+
+        assert len(groups) == 3
+        assert "Page body number 0" in groups[0] and "Page body number 9" in groups[2]
+        assert groups[0] == normalize_text("".join(_page_text(number) for number in range(4)))[0]
+
+    def test_streaming_stops_after_references(self, processor, pdf_path):
+        """참고문헌 섹션을 만나면 이후 묶음은 반환하지 않음"""
+        def extract_with_references(pdf_path, method, start, end):
+            pages = _fake_extract(pdf_path, method, start, end)
+            if start == 4:
+                pages[-1] += "References\n\nSmith, J. A book about virtue.\n\n"
+            return pages
+
+        processor.extract_mock.side_effect = extract_with_references
+        groups = list(processor.iter_processed_text(pdf_path))
+
+        assert len(groups) == 2
+        assert "Smith" not in groups[1]
+
+    def test_workers_do_not_fork_the_server_process(self, pdf_path):
+        """병렬 추출 워커는 fork가 아닌 forkserver/spawn으로 시작"""
+        processor = PDFProcessor(max_workers=2, pages_per_task=16)
+        with patch.object(PDFProcessor, "_resolve_method", return_value=("pymupdf", 64)), \
+                patch.object(pdf_processor, "ProcessPoolExecutor") as executor_cls:
+            executor_cls.return_value.submit.return_value.result.return_value = []
+            list(processor.iter_pages(pdf_path))
+
+        context = executor_cls.call_args.kwargs["mp_context"]
+        assert context.get_start_method() in ("forkserver", "spawn")
+
+
+class TestNormalizeText:
+    """normalize_text 테스트 클래스"""
+
+    def test_removes_contact_and_joins_hyphenation(self):
+        """이메일/URL 제거, 줄바꿈 하이픈 결합, 특수 문자 정규화"""
+        text, references_removed = normalize_text(
+            "Contact author@example.com or https://example.org for the exam- ple.\n\n“Quoted” ﬁnding — here.")
+
+        assert "example.com" not in text and "https://" not in text
+        assert "example." in text
+        assert '"Quoted" finding - here.' in text
+        assert references_removed is False
+
+    def test_references_section_cut(self):
+        """참고문헌 섹션 이후 내용은 제거하고 잘라냈음을 알림"""
+        text, references_removed = normalize_text(
+            "Virtue is knowledge, said Socrates.\n\nReferences\n\nPlato. Apology. Athens.")
+
+        assert text == "Virtue is knowledge, said Socrates."
+        assert references_removed is True
@@ -0,0 +1,107 @@
+"""
+Unit tests for the span tracing module.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.tracing import NOOP_SPAN, Tracer, current_span, wrap_context
+import src.utils.tracing as tracing
+
+
+class TestTracer:
+    """Tracer 테스트 클래스"""
+
+    @pytest.fixture
+    def tracer(self, monkeypatch):
+        tracer = Tracer(enabled=True, export_path="")
+        monkeypatch.setattr(tracing, "_tracer", tracer)
+        return tracer
+
+    def test_disabled_tracer_returns_noop(self):
+        """비활성화 상태에서는 no-op span만 반환하고 아무것도 보관하지 않음"""
+        tracer = Tracer(enabled=False, export_path="")
+
+        with tracer.span("debate.turn", kind="turn", room_id="room-1") as span:
+            span.set("speaker_id", "kant")
+            assert span is NOOP_SPAN
+            assert current_span() is NOOP_SPAN
+
+        assert tracer.get_room_spans("room-1") == []
+
+    def test_nested_spans_and_waterfall(self, tracer):
+        """방 → 턴 → 에이전트 → LLM 중첩 구조와 최근 N턴 워터폴"""
+        for turn in range(3):
+            with tracer.span("debate.turn", kind="turn", room_id="room-1", turn_number=turn + 1):
+                with tracer.span("agent.process", kind="agent", action="generate_response"):
+                    with tracer.span("llm.generate", kind="llm", provider="openai") as llm_span:
+                        llm_span.set_attributes(completion_tokens=42, cached_tokens=None)
+
+        waterfall = tracer.get_room_waterfall("room-1", last_n_turns=2)
+
+        assert waterfall["turn_count"] == 2
+        last_turn = waterfall["turns"][-1]
+        assert last_turn["attributes"]["turn_number"] == 3
+        assert [(s["name"], s["depth"]) for s in last_turn["spans"]] == [("agent.process", 1), ("llm.generate", 2)]
+        assert last_turn["spans"][1]["attributes"] == {"provider": "openai", "completion_tokens": 42}
+        # 같은 방의 턴은 하나의 trace로 묶임
+        trace_ids = {span.trace_id for span in tracer.get_room_spans("room-1")}
+        assert len(trace_ids) == 1
+
+    def test_error_is_recorded(self, tracer):
+        """예외가 발생하면 span 상태를 error로 기록하고 예외는 그대로 전파"""
+        with pytest.raises(ValueError):
+            with tracer.span("debate.turn", kind="turn", room_id="room-err"):
+                raise ValueError("boom")
+
+        span = tracer.get_room_spans("room-err")[0]
+        assert span.status == "error"
+        assert "boom" in span.error
+
+    def test_context_propagates_to_threads_and_tasks(self, tracer):
+        """wrap_context로 스레드에, asyncio 태스크에는 자동으로 부모 span이 전파됨"""
+        def thread_work():
+            with tracer.span("rag.vector_search", kind="rag"):
+                pass
+
+        async def task_work():
+            with tracer.span("emotion.infer", kind="emotion"):
+                await asyncio.sleep(0)
+
+        with tracer.span("debate.turn", kind="turn", room_id="room-ctx") as turn:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(wrap_context(thread_work)).result()
+
+            async def run_task():
+                await asyncio.create_task(task_work())
+            asyncio.run(run_task())
+
+        children = {span.name: span for span in tracer.get_room_spans("room-ctx") if span.kind != "turn"}
+        assert children["rag.vector_search"].parent_id == turn.span_id
+        assert children["emotion.infer"].parent_id == turn.span_id
+        assert children["rag.vector_search"].room_id == "room-ctx"
+
+    @pytest.mark.parametrize("export_format", ["jsonl", "otlp"])
+    def test_export_formats(self, tmp_path, export_format):
+        """JSON lines / OTLP 형식 파일 내보내기"""
+        path = tmp_path / "trace.jsonl"
+        tracer = Tracer(enabled=True, export_path=str(path), export_format=export_format)
+
+        with tracer.span("debate.turn", kind="turn", room_id="room-x"):
+            with tracer.span("llm.generate", kind="llm", prompt_tokens=10):
+                pass
+        tracer.close()
+
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert len(records) == 2
+        if export_format == "jsonl":
+            assert records[0]["name"] == "llm.generate"
+            assert records[0]["attributes"]["prompt_tokens"] == 10
+        else:
+            span = records[0]["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+            assert span["name"] == "llm.generate"
+            assert span["parentSpanId"] == records[1]["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["spanId"]
+            assert {"key": "prompt_tokens", "value": {"intValue": "10"}} in span["attributes"]